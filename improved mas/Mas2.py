@@ -10,6 +10,31 @@ import datetime
 import re
 import random
 import math
+import queue
+
+# Shared helpers from the Parcel Tools backend, when it ships alongside this app
+_BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parcel-tools-app', 'backend')
+if os.path.isdir(_BACKEND_DIR) and _BACKEND_DIR not in sys.path:
+    sys.path.append(_BACKEND_DIR)
+
+try:
+    from file_watcher import FileWatcher as _FileWatcher
+    _HAS_FILE_WATCHER = True
+except ImportError:
+    _HAS_FILE_WATCHER = False
+
+try:
+    from points_parser import parse_points_file as _parse_points_file
+    _HAS_POINTS_PARSER = True
+except ImportError:
+    _HAS_POINTS_PARSER = False
+
+try:
+    from points_cache import PointsFileCache as _PointsFileCache
+    # In-memory only: remembers the parsed prefix of the last few watched files for tail reads
+    _POINTS_TAIL_CACHE = _PointsFileCache(None, keep='last', max_entries=4)
+except ImportError:
+    _POINTS_TAIL_CACHE = None
 
 # Per-widget key handling that avoids repeats and cross-screen interference
 
@@ -42,6 +67,12 @@ def pick_points_file(parent=None):
 
 def read_points_any(path):
     """Read points from .pnt/.txt/.csv files. Returns dict: id -> (x, y)."""
+    if _HAS_POINTS_PARSER:
+        # Shared streaming parser; later duplicates win, as with the loop below
+        pts = _parse_points_file(path, keep='last').to_tuple_map()
+        if not pts:
+            raise ValueError('No points parsed from file')
+        return pts
     pts = {}
     with open(path, 'r', encoding='utf-8', errors='ignore') as f:
         for raw in f:
@@ -62,6 +93,16 @@ def read_points_any(path):
         raise ValueError('No points parsed from file')
     return pts
 
+
+def read_points_incremental(path):
+    """Like read_points_any, but a file that only grew has just its new lines parsed."""
+    if _POINTS_TAIL_CACHE is None:
+        return read_points_any(path)
+    pts = _POINTS_TAIL_CACHE.load(path)[0].to_tuple_map()
+    if not pts:
+        raise ValueError('No points parsed from file')
+    return pts
+
 # Animated background icons for surveying/parcel measurement theme
 
 def add_background_icons(parent):
@@ -2166,34 +2207,6 @@ class ParcelAreaApp:
         except Exception:
             pass
 
-    def _recompute_all_saved_parcels(self, autosave=True):
-        """Recompute area for every saved parcel using current coordinates.
-        Updates the saved list and optionally autosaves the project.
-        """
-        try:
-            if not self.parcels or not self.points_by_id:
-                return
-            changed = False
-            for p in self.parcels:
-                ids_seq = p.get('ids') or []
-                curves = p.get('curves') or []
-                area_now = compute_parcel_area_from_points(ids_seq, self.points_by_id, curves)
-                if area_now is not None:
-                    old_area = p.get('area', 0)
-                    if abs(old_area - area_now) > 1e-9:
-                        p['area'] = area_now
-                        changed = True
-            if changed:
-                self._refresh_saved_parcels_list()
-                if self.project_path and autosave:
-                    try:
-                        save_project(self.project_path, self._collect_state())
-                    except Exception:
-                        pass
-                print(f"Updated {len(self.parcels)} saved parcels with new coordinates")
-        except Exception as e:
-            print(f"Error in _recompute_all_saved_parcels: {e}")
-
     def _schedule_resize(self, event):
         try:
             if self._resize_job is not None:
@@ -2287,6 +2300,7 @@ class ParcelAreaApp:
                 return
             
             # Reload points
+            old_points = self.points_by_id
             self.points_by_id = read_points_any(pts_path)
             self.file_label_var.set(f"📁 Loaded {len(self.points_by_id)} points: {os.path.basename(pts_path)} (refreshed)")
             
@@ -2297,8 +2311,8 @@ class ParcelAreaApp:
             except Exception:
                 pass
             
-            # Recompute all saved parcels with updated coordinates
-            self._recompute_all_saved_parcels(autosave=True)
+            # Recompute saved parcels that use a changed coordinate
+            self._recompute_all_saved_parcels(autosave=True, changed_ids=changed_point_ids(old_points, self.points_by_id))
             
             # Refresh current area if polygon is closed
             self._refresh_area_if_closed(show_message=False)
@@ -2309,13 +2323,26 @@ class ParcelAreaApp:
             messagebox.showerror("Refresh Error", f"Failed to refresh points file:\n{exc}")
             self.set_status("Failed to refresh file")
 
-    def _recompute_all_saved_parcels(self, autosave=True):
-        """Recompute area for every saved parcel using current coordinates."""
+    def _recompute_all_saved_parcels(self, autosave=True, changed_ids=None):
+        """Recompute area for saved parcels using current coordinates.
+        With changed_ids, only parcels that reference one of those point IDs
+        (as a vertex or curve end) are re-evaluated.
+        """
         try:
             if not self.parcels or not self.points_by_id:
                 return
+            if changed_ids is None:
+                targets = self.parcels
+            else:
+                if not changed_ids:
+                    return
+                index = self._point_parcel_index()
+                positions = set()
+                for pid in changed_ids:
+                    positions.update(index.get(pid, ()))
+                targets = [self.parcels[i] for i in sorted(positions)]
             changed = False
-            for p in self.parcels:
+            for p in targets:
                 ids_seq = p.get('ids') or []
                 curves = p.get('curves') or []
                 area_now = compute_parcel_area_from_points(ids_seq, self.points_by_id, curves)
@@ -2331,26 +2358,50 @@ class ParcelAreaApp:
                         save_project(self.project_path, self._collect_state())
                     except Exception:
                         pass
-                print(f"Updated areas for {len(self.parcels)} saved parcels")
+                print(f"Updated areas for {len(targets)} of {len(self.parcels)} saved parcels")
         except Exception as e:
             print(f"Error recomputing parcels: {e}")
 
+    def _point_parcel_index(self):
+        """Point ID -> parcel positions, rebuilt only when the saved parcels change."""
+        signature = [(id(p), id(p.get('ids')), id(p.get('curves'))) for p in self.parcels]
+        cached = getattr(self, '_parcel_index_cache', None)
+        if cached is None or cached[0] != signature:
+            cached = (signature, build_point_parcel_index(self.parcels))
+            self._parcel_index_cache = cached
+        return cached[1]
+
     def _start_points_watcher(self, path):
-        """Start watching the points file for changes."""
+        """Start watching the points file for changes (push-based when available, else polling)."""
+        self._stop_points_watcher()
         try:
             self._points_watch = {
                 'path': path,
                 'mtime': os.path.getmtime(path) if os.path.exists(path) else None,
                 'job': None,
+                'handle': None,
             }
+            if _HAS_FILE_WATCHER:
+                try:
+                    watcher = getattr(self, '_file_watcher', None)
+                    if watcher is None:
+                        watcher = self._file_watcher = _FileWatcher()
+                    # Callback runs on the watcher thread, which must not touch Tk:
+                    # it only queues the event and the Tk loop drains the queue
+                    events = self._points_watch['events'] = queue.Queue()
+                    self._points_watch['handle'] = watcher.add(path, events.put)
+                    self._drain_points_events()
+                    return
+                except Exception as e:
+                    print(f"File watcher unavailable, polling instead: {e}")
             self._schedule_points_watch()
         except Exception:
             self._points_watch = None
 
     def _schedule_points_watch(self):
-        """Schedule the next file check."""
+        """Schedule the next file check (polling mode only)."""
         try:
-            if not getattr(self, '_points_watch', None):
+            if not getattr(self, '_points_watch', None) or self._points_watch.get('handle') is not None:
                 return
             if self._points_watch.get('job') is not None:
                 self.master.after_cancel(self._points_watch['job'])
@@ -2358,6 +2409,27 @@ class ParcelAreaApp:
         except Exception:
             pass
 
+    def _drain_points_events(self):
+        """Tk-side poll of the watcher's event queue (push mode only); reloads once per burst."""
+        watch = getattr(self, '_points_watch', None)
+        if not watch or watch.get('events') is None:
+            return
+        changed = False
+        try:
+            while True:
+                watch['events'].get_nowait()
+                changed = True
+        except queue.Empty:
+            pass
+        if changed:
+            self._check_points_file()
+        if getattr(self, '_points_watch', None) is not watch:
+            return  # stopped or restarted while reloading
+        try:
+            watch['job'] = self.master.after(200, self._drain_points_events)
+        except Exception:
+            pass
+
     def _check_points_file(self):
         """Check if the points file has been modified and reload if so."""
         try:
@@ -2365,18 +2437,18 @@ class ParcelAreaApp:
                 return
             path = self._points_watch.get('path')
             if not path or not os.path.exists(path):
-                self._schedule_points_watch()
                 return
             
             mtime = os.path.getmtime(path)
             last = self._points_watch.get('mtime')
             if last is None:
                 self._points_watch['mtime'] = mtime
-            elif mtime > last:
+            elif mtime > last or self._points_watch.get('handle') is not None:
                 self._points_watch['mtime'] = mtime
                 # File changed - reload and update everything
                 try:
-                    self.points_by_id = read_points_any(path)
+                    old_points = self.points_by_id
+                    self.points_by_id = read_points_incremental(path)
                     self.file_label_var.set(f"📁 Loaded {len(self.points_by_id)} points: {os.path.basename(path)} (auto-updated)")
                     
                     # Update file badge
@@ -2386,8 +2458,8 @@ class ParcelAreaApp:
                     except Exception:
                         pass
                     
-                    # Recompute all saved parcels and refresh the display
-                    self._recompute_all_saved_parcels(autosave=True)
+                    # Recompute only parcels that use a changed point and refresh the display
+                    self._recompute_all_saved_parcels(autosave=True, changed_ids=changed_point_ids(old_points, self.points_by_id))
                     
                     # Also refresh current area if polygon is closed
                     self._refresh_area_if_closed(show_message=False)
@@ -2401,8 +2473,11 @@ class ParcelAreaApp:
     def _stop_points_watcher(self):
         """Stop the points file watcher."""
         try:
-            if getattr(self, '_points_watch', None) and self._points_watch.get('job') is not None:
-                self.master.after_cancel(self._points_watch['job'])
+            watch = getattr(self, '_points_watch', None)
+            if watch and watch.get('job') is not None:
+                self.master.after_cancel(watch['job'])
+            if watch and watch.get('handle') is not None:
+                self._file_watcher.remove(watch['handle'])
         except Exception:
             pass
         self._points_watch = None
@@ -3398,6 +3473,32 @@ def compute_parcel_area_from_points(parcel_ids, points_by_id, curves=None):
         return None
 
 
+def build_point_parcel_index(parcels):
+    """Reverse index: point ID -> set of parcel positions that use it (vertex or curve end)."""
+    index = {}
+    for pos, p in enumerate(parcels):
+        refs = set(p.get('ids') or [])
+        for spec in p.get('curves') or []:
+            try:
+                refs.add(spec.get('from'))
+                refs.add(spec.get('to'))
+            except Exception:
+                continue
+        for pid in refs:
+            index.setdefault(pid, set()).add(pos)
+    return index
+
+
+def changed_point_ids(old_points, new_points):
+    """IDs added, removed or moved between two id -> (x, y) maps."""
+    old_points = old_points or {}
+    changed = {pid for pid in old_points if pid not in new_points}
+    for pid, xy in new_points.items():
+        if old_points.get(pid) != xy:
+            changed.add(pid)
+    return changed
+
+
 def export_parcel_pdf(pdf_path, parcel_ids, points_by_id, area_value, parcel_number):
     from reportlab.lib.pagesizes import A4
     from reportlab.platypus import SimpleDocTemplate, Spacer, Preformatted
@@ -3,7 +3,7 @@ Flask Backend API for Parcel Tools Desktop App
 Provides endpoints for area calculations, point management, and data operations
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, send_file
 from flask_cors import CORS
 import json
 import os
@@ -12,16 +12,17 @@ from datetime import datetime
 import re
 import builtins
 import sys
-import zipfile
 import threading
+import atexit
 import io
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
 
 # Global thread pool for handling simultaneous pressure and file compression tasks
 MAX_CONCURRENT_WORKERS = min(32, (os.cpu_count() or 4) * 2 + 4)
 compression_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_WORKERS, thread_name_prefix="CompressWorker")
-_file_io_lock = threading.RLock()
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -29,6 +30,26 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from license_manager import LicenseManager
 from firebase_service import FirebaseService
 from firebase_config import is_firebase_available
+from geometry_kernel import polygon_metrics, pack_point_ring, compute_id_parcels
+from parcel_index import ParcelIndexRegistry
+from points_sync import PointsVersionStore
+from file_watcher import FileWatcher, EventHub
+from points_parser import parse_points_text
+from points_cache import PointsFileCache
+from project_index import ProjectMetadataIndex
+from filename_index import FilenameIndex
+from save_queue import SaveQueue
+from cad_cache import CadParseCache
+from dwg_converter import DwgConverter
+from cad_stream import JsonArrayWriter, open_modelspace_stream, spooled_file, iter_file
+import cad_wire
+from cad_blocks import BlockTemplate, affine_2d, BLOCK_LAYER, BYLAYER, BYBLOCK, POINT_MARKER
+from cad_tiles import CadTilePyramid, TilePyramidRegistry
+from cad_parcels import ParcelDetector, is_parcel_layer
+from cad_polygonize import polygonize_entities, DEFAULT_SNAP_TOLERANCE
+from pdf_report import render_report, ReportFragmentCache
+from parallel_zip import ZipStitcher, compress_member, map_in_order
+from archive_jobs import ArchiveJobManager
 
 # Some environments (like packaged Windows apps) don't have a writable console.
 # Printing in those cases raises "OSError: [Errno 22] Invalid argument" and can
@@ -139,6 +160,18 @@ POINTS_DIR = os.path.join(DATA_DIR, 'points')
 AI_CONFIG_FILE = os.path.join(DATA_DIR, 'ai_config.json')
 RECENT_FILES_FILE = os.path.join(DATA_DIR, 'recent_files.json')
 
+# Per-project point -> parcel dependency indexes (incremental recompute on points reload)
+parcel_indexes = ParcelIndexRegistry()
+
+# Last points snapshot served per file (diff-based /api/reload-points-file)
+points_versions = PointsVersionStore()
+
+# Push-based watching of points / project files, fanned out over /api/watch/stream
+file_watcher = FileWatcher()
+watch_events = EventHub()
+watched_files = {}  # normalized path -> {'handle', 'refs', 'kind'}
+watched_files_lock = threading.Lock()
+
 # Initialize License Manager
 license_manager = LicenseManager(DATA_DIR)
 
@@ -165,6 +198,46 @@ except Exception as e:
     os.makedirs(POINTS_DIR, exist_ok=True)
     print(f'[Backend] Using fallback temp directory: {DATA_DIR}')
 
+# Memory-mapped binary sidecars of parsed points files (re-parse only on change)
+points_cache = PointsFileCache(os.path.join(DATA_DIR, 'points_cache'))
+
+# SQLite index of project summaries for /api/projects (keyed by path, size, mtime)
+project_index = ProjectMetadataIndex(os.path.join(DATA_DIR, 'project_index.sqlite3'))
+
+# Background filename -> paths index used to recover moved / corrupted paths
+# (roots in lookup priority order; rescans only re-list directories that changed)
+filename_index = FilenameIndex(os.path.join(DATA_DIR, 'filename_index.json'), [
+    os.path.join(os.path.expanduser('~'), 'OneDrive', 'share', 'dwg'),
+    os.path.join(os.path.expanduser('~'), 'OneDrive'),
+    os.path.join(os.path.expanduser('~'), 'Documents'),
+    os.path.join(os.path.expanduser('~'), 'Desktop'),
+    os.path.join(os.path.expanduser('~'), 'Downloads'),
+    DATA_DIR,
+])
+
+# Write-behind queue for project saves (coalesces autosave bursts, atomic replace)
+save_queue = SaveQueue()
+atexit.register(save_queue.close)
+
+# Content-addressed cache of parsed DXF / DWG drawings (zlib JSON on disk + memory LRU)
+cad_cache = CadParseCache(os.path.join(DATA_DIR, 'cad_cache'))
+
+# DWG -> DXF conversions cached by DWG content hash; PARCEL_TOOLS_DWG_WORKER=1 keeps one
+# converter session warm and batches queued conversions
+dwg_converter = DwgConverter(os.path.join(DATA_DIR, 'dwg_cache'),
+                             warm=os.environ.get('PARCEL_TOOLS_DWG_WORKER') == '1')
+
+# Level-of-detail tile pyramids (+ grid index for hit tests) of recently viewed drawings
+cad_tiles = TilePyramidRegistry()
+
+# Rendered PDF report segments, so re-exporting a block only redraws the parcels that changed
+pdf_fragments = ReportFragmentCache()
+
+# Background zip builds (compress-files, project export-archive): job IDs, progress, cancel,
+# one writer per output path
+archive_jobs = ArchiveJobManager(max_running=MAX_CONCURRENT_WORKERS)
+atexit.register(archive_jobs.shutdown)
+
 
 def load_projects():
     """Load projects from JSON file"""
@@ -806,64 +879,27 @@ def calculate_area():
         if len(points) > 3 and abs(points[0]['x'] - points[-1]['x']) < 1e-6 and abs(points[0]['y'] - points[-1]['y']) < 1e-6:
             points = points[:-1]
 
-        # Shoelace formula for polygon area
-        base_area = 0.0
+        # Shoelace area, perimeter, centroid and curve segments in one kernel pass
+        xs, ys, offsets, packed_curves = pack_point_ring(points, curves)
+        metrics = polygon_metrics(xs, ys, offsets, packed_curves)
         n = len(points)
-        for i in range(n):
-            j = (i + 1) % n
-            base_area += points[i]['x'] * points[j]['y']
-            base_area -= points[j]['x'] * points[i]['y']
-        
-        base_area = abs(base_area) / 2.0
-        
-        # Calculate perimeter
-        perimeter = 0.0
-        for i in range(n):
-            j = (i + 1) % n
-            dx = points[j]['x'] - points[i]['x']
-            dy = points[j]['y'] - points[i]['y']
-            perimeter += math.sqrt(dx * dx + dy * dy)
-        
-        # Calculate centroid
-        cx = sum(p['x'] for p in points) / n
-        cy = sum(p['y'] for p in points) / n
+        base_area = float(metrics['base_area'][0])
+        perimeter = float(metrics['perimeter'][0])
+        cx = float(metrics['cx'][0])
+        cy = float(metrics['cy'][0])
 
-        
-        # Apply curve adjustments
         curve_adjustments = []
-        total_curve_adjustment = 0
-        
-        if curves:
-            for curve in curves:
-                M = curve.get('M', 0)
-                sign = curve.get('sign', 1)
-                from_idx = curve.get('fromIndex', 0)
-                to_idx = curve.get('toIndex', 1)
-                
-                if M > 0 and from_idx < len(points) and to_idx < len(points):
-                    # Calculate chord length
-                    from_pt = points[from_idx]
-                    to_pt = points[to_idx]
-                    dx = to_pt['x'] - from_pt['x']
-                    dy = to_pt['y'] - from_pt['y']
-                    C = math.sqrt(dx * dx + dy * dy)
-                    
-                    if C > 0:
-                        # Calculate radius and segment area
-                        R = (C * C) / (8.0 * M) + (M / 2.0)
-                        theta = 2.0 * math.asin(min(1.0, C / (2.0 * R)))
-                        seg_area = 0.5 * R * R * (theta - math.sin(theta))
-                        
-                        adjustment = seg_area * sign
-                        total_curve_adjustment += adjustment
-                        
-                        curve_adjustments.append({
-                            'C': C,
-                            'R': R,
-                            'F': M,
-                            'segmentArea': seg_area,
-                            'adjustment': adjustment
-                        })
+        for k in range(len(packed_curves['m'])):
+            if not metrics['curve_active'][k]:
+                continue
+            curve_adjustments.append({
+                'C': float(metrics['curve_chord'][k]),
+                'R': float(metrics['curve_radius'][k]),
+                'F': float(packed_curves['m'][k]),
+                'segmentArea': float(metrics['curve_segment_area'][k]),
+                'adjustment': float(metrics['curve_adjustment_each'][k])
+            })
+        total_curve_adjustment = float(metrics['curve_adjustment'][0])
         
         final_area = base_area + total_curve_adjustment
         
@@ -983,94 +1019,12 @@ def calculate_area_error():
 
 def parse_points_content(text_data):
     """Parse raw points file content into a list of points dicts"""
-    points = []
-    for line in text_data.strip().split('\n'):
-        line = line.strip()
-        if not line or line.startswith('#') or line.startswith('//'):
-            continue
-        
-        # Replace semicolons with commas
-        line = line.replace(';', ',')
-        
-        # Split by comma or whitespace
-        parts = [p.strip() for p in (line.split(',') if ',' in line else line.split()) if p.strip()]
-        
-        if len(parts) >= 3:
-            try:
-                point_id = parts[0]
-                x = float(parts[1])
-                y = float(parts[2])
-                points.append({'id': point_id, 'x': x, 'y': y})
-            except ValueError:
-                continue
-    return points
+    return parse_points_text(text_data).to_list()
 
 
 def calculate_single_parcel_metrics(parcel, points_map):
     """Calculate area and perimeter for a single parcel using a points map"""
-    point_ids = parcel.get('ids', [])
-    curves = parcel.get('curves', [])
-    
-    # Prepare points for this parcel
-    parcel_points = []
-    for pid in point_ids:
-        pid_str = str(pid)
-        if pid_str in points_map:
-            parcel_points.append(points_map[pid_str])
-        else:
-            # Point not found, use default or skip
-            parcel_points.append({'x': 0, 'y': 0})
-    
-    area = 0.0
-    perimeter = 0.0
-    
-    if len(parcel_points) >= 3:
-        # If the last point is duplicate of the first point, slice it off to avoid duplicate calculation
-        pts = parcel_points
-        if len(pts) > 3 and pts[0]['x'] == pts[-1]['x'] and pts[0]['y'] == pts[-1]['y']:
-            pts = pts[:-1]
-        
-        n = len(pts)
-        sum1 = 0.0
-        sum2 = 0.0
-        for i in range(n):
-            j = (i + 1) % n
-            sum1 += pts[i]['x'] * pts[j]['y']
-            sum2 += pts[j]['x'] * pts[i]['y']
-        area = 0.5 * abs(sum1 - sum2)
-        
-        # Perimeter
-        for i in range(n):
-            j = (i + 1) % n
-            dx = pts[j]['x'] - pts[i]['x']
-            dy = pts[j]['y'] - pts[i]['y']
-            perimeter += math.sqrt(dx*dx + dy*dy)
-    
-    # Apply curves
-    for curve in curves:
-        try:
-            m = float(curve.get('M', 0))
-            sign = 1 if curve.get('sign', 1) == 1 else -1
-            from_id = str(curve.get('from'))
-            to_id = str(curve.get('to'))
-            
-            if from_id in points_map and to_id in points_map:
-                p1 = points_map[from_id]
-                p2 = points_map[to_id]
-                
-                dx = p2['x'] - p1['x']
-                dy = p2['y'] - p1['y']
-                chord = math.sqrt(dx*dx + dy*dy)
-                
-                if m > 0 and chord > 0:
-                    R = (chord**2)/(8*m) + (m/2)
-                    theta = 2 * math.asin(min(1.0, chord/(2*R)))
-                    segment_area = 0.5 * R**2 * (theta - math.sin(theta))
-                    area += sign * segment_area
-        except Exception:
-            pass # Ignore curve errors in batch
-            
-    return area, perimeter
+    return compute_id_parcels([parcel], points_map)[0]
 
 
 @app.route('/api/calculate-batch-areas', methods=['POST'])
@@ -1079,8 +1033,11 @@ def calculate_batch_areas():
     Calculate area for multiple parcels in one request.
     Expected JSON: {
         "parcels": [{ "id": "uuid", "ids": ["1", "2", "3", "1"], "curves": [...] }],
-        "points": { "1": {"x": 0, "y": 0}, ... }
+        "points": { "1": {"x": 0, "y": 0}, ... },
+        "projectPath": "...", "pointsFilePath": "...", "parcelsVersion": "..." (optional)
     }
+    With projectPath the dependency index is rebuilt from these parcels, so later points
+    reloads recompute incrementally against exactly the parcel set the frontend holds.
     """
     try:
         data = request.get_json()
@@ -1089,13 +1046,16 @@ def calculate_batch_areas():
         
         results = []
         
-        for parcel in parcels:
-            area, perimeter = calculate_single_parcel_metrics(parcel, points_map)
+        for parcel, (area, perimeter) in zip(parcels, compute_id_parcels(parcels, points_map)):
             results.append({
                 'id': parcel.get('id'),
                 'area': area,
                 'perimeter': perimeter
             })
+        
+        if data.get('projectPath'):
+            parcel_indexes.register(data['projectPath'], parcels, points_map, data.get('pointsFilePath'),
+                                    data.get('parcelsVersion'))
             
         return jsonify({'results': results})
 
@@ -1103,6 +1063,43 @@ def calculate_batch_areas():
         return jsonify({'error': str(e)}), 500
 
 
+def _after_project_written(filepath, project_data, metadata):
+    """Runs on the save queue's writer thread once a project snapshot is on disk."""
+    # The project listing's metadata, so it never has to re-read this file
+    try:
+        project_index.record(filepath, project_data)
+        filename_index.note(filepath)
+    except Exception as index_error:
+        print(f'[Save WARNING] Failed to update project index: {index_error}')
+    
+    # Recent files only change when this project isn't already the latest entry
+    try:
+        recent_projects = load_recent_files().get('projects', [])
+        head = recent_projects[0] if recent_projects else {}
+        if head.get('path') != filepath or head.get('metadata') != metadata:
+            add_to_recent_files('projects', filepath, os.path.basename(filepath), metadata)
+    except Exception as recent_error:
+        print(f'[Save WARNING] Failed to update recent files: {recent_error}')
+
+
+def _save_error_response(filepath, write_error):
+    """Turn a failed project write into the save endpoint's 400 response."""
+    print(f'[Save ERROR] ==== FILE WRITE FAILED ({type(write_error).__name__}) ====')
+    print(f'[Save ERROR] Error: {write_error}')
+    if isinstance(write_error, UnicodeError):
+        return jsonify({'error': f'Unicode encoding error in path or filename: {str(write_error)}'}), 400
+    error_msg = str(write_error)
+    if isinstance(write_error, OSError) and ('Errno 22' in error_msg or 'Invalid argument' in error_msg):
+        detailed_error = f'Invalid file path. Windows path rules violated. Path: {filepath}'
+        # Give more specific hint
+        if len(filepath) > 200:
+            detailed_error += ' (Path is very long - try a shorter location)'
+        if any(ord(c) > 127 for c in filepath):
+            detailed_error += ' (Path contains non-English characters - try an English path)'
+        return jsonify({'error': detailed_error}), 400
+    return jsonify({'error': f'Cannot write file: {error_msg}'}), 400
+
+
 @app.route('/api/project/save', methods=['POST'])
 def save_project_file():
     """Save complete project state to file - REQUIRES user-selected filePath"""
@@ -1192,130 +1189,45 @@ def save_project_file():
             print(f'[Save ERROR] Path too long ({len(filepath)} characters): {filepath}')
             return jsonify({'error': f'File path is too long ({len(filepath)} characters). Please choose a shorter path or filename.'}), 400
         
-        # Ensure directory exists (for the user-selected path)
+        # Ensure the directory exists and is writable (probed once per directory)
         file_dir = os.path.dirname(filepath)
-        print(f'[Save] Final directory to check/create: {repr(file_dir)}')
-        
         if file_dir:
-            print(f'[Save] Checking if directory exists: {os.path.exists(file_dir)}')
-            print(f'[Save] Checking if directory is dir: {os.path.isdir(file_dir) if os.path.exists(file_dir) else "N/A"}')
-            
-            try:
-                if not os.path.exists(file_dir):
-                    print(f'[Save] Creating directory: {file_dir}')
-                    os.makedirs(file_dir, exist_ok=True)
-                    print(f'[Save] Directory created successfully')
-                else:
-                    print(f'[Save] Directory already exists')
-            except OSError as dir_error:
-                print(f'[Save ERROR] Failed to create directory: {dir_error}')
-                print(f'[Save ERROR] Error type: {type(dir_error).__name__}')
-                print(f'[Save ERROR] Error errno: {getattr(dir_error, "errno", "N/A")}')
-                return jsonify({'error': f'Cannot create directory: {str(dir_error)}'}), 400
-        
-        # Validate we can write to this location
-        if file_dir and not os.path.exists(file_dir):
-            print(f'[Save ERROR] Directory does not exist after creation attempt: {file_dir}')
-            return jsonify({'error': 'Directory path is invalid or cannot be created'}), 400
-        
-        # Check if we have write permission
-        if file_dir:
-            try:
-                # Try to access the directory
-                test_path = os.path.join(file_dir, '.parcel_tools_test')
-                print(f'[Save] Testing write permission with test file: {test_path}')
-                with open(test_path, 'w') as test_file:
-                    test_file.write('test')
-                os.remove(test_path)
-                print(f'[Save] Write permission test passed')
-            except Exception as perm_error:
-                print(f'[Save ERROR] No write permission: {perm_error}')
-                return jsonify({'error': f'No write permission in directory: {file_dir}'}), 400
-        
-        # Final validation before write
-        print(f'[Save] ==== FINAL PRE-WRITE VALIDATION ====')
-        print(f'[Save] Final filepath: {repr(filepath)}')
-        print(f'[Save] File exists check: {os.path.exists(filepath)}')
-        print(f'[Save] Directory exists check: {os.path.exists(file_dir)}')
-        print(f'[Save] Is absolute path: {os.path.isabs(filepath)}')
-        print(f'[Save] Data size: {len(str(project_data))} chars')
-        
-        # Check for any non-ASCII characters in path that might cause issues
+            dir_error = save_queue.check_directory(file_dir)
+            if dir_error:
+                print(f'[Save ERROR] {dir_error}')
+                return jsonify({'error': dir_error}), 400
+        
+        # Refresh the dependency index now so later points reloads can recompute incrementally
         try:
-            filepath_ascii = filepath.encode('ascii')
-            print(f'[Save] Path is pure ASCII')
-        except UnicodeEncodeError:
-            print(f'[Save] WARNING: Path contains non-ASCII characters')
-            # Try to normalize the path
-            try:
-                import unicodedata
-                filepath_normalized = unicodedata.normalize('NFKD', filepath)
-                print(f'[Save] Normalized path: {repr(filepath_normalized)}')
-            except:
-                print(f'[Save] Could not normalize path')
+            parcel_indexes.register(filepath, project_data.get('savedParcels', []),
+                                    project_data.get('loadedPoints', {}), project_data.get('pointsFilePath'),
+                                    data.get('parcelsVersion'))
+        except Exception as index_error:
+            print(f'[Save WARNING] Failed to index parcels: {index_error}')
+        
+        # Queue the snapshot; bursts of saves to this path are merged into one atomic write
+        metadata = {
+            'projectName': project_name,
+            'parcelCount': len(project_data.get('savedParcels', [])),
+            'pointsCount': len(project_data.get('loadedPoints', {}))
+        }
+        sequence = save_queue.submit(
+            filepath, project_data,
+            on_written=lambda path: _after_project_written(path, project_data, metadata))
         
-        # Try to write the file
-        print(f'[Save] ==== ATTEMPTING FILE WRITE ====')
+        if data.get('deferred'):
+            # Autosave: acknowledge now, the writer thread persists it shortly
+            return jsonify({
+                'success': True,
+                'queued': True,
+                'sequence': sequence,
+                'filePath': filepath,
+                'fileName': os.path.basename(filepath)
+            }), 202
         
-        try:
-            # Use a more explicit open mode
-            with open(filepath, 'w', encoding='utf-8', newline='') as f:
-                json.dump(project_data, f, indent=2, ensure_ascii=False)
-            print(f'[Save] SUCCESS: File written successfully!')
-            
-            # Verify file was created
-            if os.path.exists(filepath):
-                file_size = os.path.getsize(filepath)
-                print(f'[Save] SUCCESS: File verified - Size: {file_size} bytes')
-            else:
-                print(f'[Save ERROR] File was written but cannot be found!')
-                return jsonify({'error': 'File written but verification failed'}), 500
-                
-        except OSError as write_error:
-            print(f'[Save ERROR] ==== FILE WRITE FAILED (OSError) ====')
-            print(f'[Save ERROR] Error: {write_error}')
-            print(f'[Save ERROR] Error type: {type(write_error).__name__}')
-            print(f'[Save ERROR] Error errno: {getattr(write_error, "errno", "N/A")}')
-            print(f'[Save ERROR] Error strerror: {getattr(write_error, "strerror", "N/A")}')
-            print(f'[Save ERROR] Error filename: {getattr(write_error, "filename", "N/A")}')
-            print(f'[Save ERROR] Error args: {write_error.args}')
-            
-            error_msg = str(write_error)
-            if 'Errno 22' in error_msg or 'Invalid argument' in error_msg:
-                detailed_error = f'Invalid file path. Windows path rules violated. Path: {filepath}'
-                print(f'[Save ERROR] {detailed_error}')
-                # Give more specific hint
-                if len(filepath) > 200:
-                    detailed_error += ' (Path is very long - try a shorter location)'
-                if any(ord(c) > 127 for c in filepath):
-                    detailed_error += ' (Path contains non-English characters - try an English path)'
-                return jsonify({'error': detailed_error}), 400
-            return jsonify({'error': f'Cannot write file: {error_msg}'}), 400
-        except UnicodeError as write_error:
-            print(f'[Save ERROR] ==== UNICODE ERROR ====')
-            print(f'[Save ERROR] Error: {write_error}')
-            return jsonify({'error': f'Unicode encoding error in path or filename: {str(write_error)}'}), 400
-        except Exception as write_error:
-            print(f'[Save ERROR] ==== UNEXPECTED WRITE ERROR ====')
-            print(f'[Save ERROR] Error: {write_error}')
-            print(f'[Save ERROR] Error type: {type(write_error).__name__}')
-            import traceback
-            traceback.print_exc()
-            return jsonify({'error': f'Unexpected error writing file: {str(write_error)}'}), 400
-        
-        # Add to recent files (don't let this fail the save operation)
-        try:
-            metadata = {
-                'projectName': project_name,
-                'parcelCount': len(project_data.get('savedParcels', [])),
-                'pointsCount': len(project_data.get('loadedPoints', {}))
-            }
-            print(f'[Save] Adding to recent files: {filepath}')
-            add_to_recent_files('projects', filepath, os.path.basename(filepath), metadata)
-            print(f'[Save] Recent files updated successfully')
-        except Exception as recent_error:
-            print(f'[Save WARNING] Failed to update recent files: {recent_error}')
-            # Don't fail the save operation just because recent files failed
+        write_error = save_queue.flush(filepath)
+        if write_error is not None:
+            return _save_error_response(filepath, write_error)
         
         print(f'[Save] ========== SAVE COMPLETE ==========')
         
@@ -1335,6 +1247,23 @@ def save_project_file():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/project/flush', methods=['POST'])
+def flush_project_saves():
+    """Block until queued saves (for one filePath, or all) are written to disk"""
+    try:
+        data = request.get_json(silent=True) or {}
+        file_path = data.get('filePath')  # as returned by /api/project/save
+        write_error = save_queue.flush(file_path or None)
+        if write_error is not None:
+            if file_path:
+                return _save_error_response(file_path, write_error)
+            return jsonify({'error': f'Cannot write file: {write_error}'}), 500
+        return jsonify({'success': True, 'pending': save_queue.pending()})
+    except Exception as e:
+        print(f'[Flush ERROR] {e}')
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/project/load', methods=['POST'])
 def load_project_file():
     """Load project from file content or file path with robust fallback"""
@@ -1349,27 +1278,18 @@ def load_project_file():
         loaded_file_path = None
         project_data = None
         
+        # Don't read a file that still has an autosave waiting in the queue
+        if file_path and save_queue.pending(file_path):
+            save_queue.flush(file_path)
+        
         # Auto-recover path if missing or corrupted
         target_name = file_name or (os.path.basename(file_path) if file_path else '')
         if file_path and not os.path.exists(file_path) and target_name:
-            print(f'[Load Project] Path does not exist on disk: {file_path}. Searching for {target_name}...')
-            search_roots = [
-                os.path.join(os.path.expanduser('~'), 'OneDrive', 'share', 'dwg'),
-                os.path.join(os.path.expanduser('~'), 'OneDrive'),
-                os.path.join(os.path.expanduser('~'), 'Documents'),
-                os.path.join(os.path.expanduser('~'), 'Desktop'),
-                os.path.join(os.path.expanduser('~'), 'Downloads'),
-                DATA_DIR
-            ]
-            for root_dir in search_roots:
-                if os.path.exists(root_dir):
-                    for root, dirs, files in os.walk(root_dir):
-                        if target_name in files:
-                            file_path = os.path.join(root, target_name)
-                            print(f'[Load Project] Recovered real file path: {file_path}')
-                            break
-                    if os.path.exists(file_path):
-                        break
+            print(f'[Load Project] Path does not exist on disk: {file_path}. Looking up {target_name} in filename index...')
+            recovered = filename_index.find(target_name, timeout=2.0)
+            if recovered:
+                file_path = recovered
+                print(f'[Load Project] Recovered real file path: {file_path}')
 
         # 1. Try loading from file path if it exists on server/local disk
         if file_path and os.path.exists(file_path):
@@ -1400,34 +1320,23 @@ def load_project_file():
                     except Exception:
                         project_data = None
                         
-        # 2b. If still not loaded, scan search roots for target_name
+        # 2b. If still not loaded, try every indexed file with target_name
         if not project_data and target_name:
-            search_roots = [
-                os.path.join(os.path.expanduser('~'), 'OneDrive', 'share', 'dwg'),
-                os.path.join(os.path.expanduser('~'), 'OneDrive'),
-                os.path.join(os.path.expanduser('~'), 'Documents'),
-                os.path.join(os.path.expanduser('~'), 'Desktop'),
-                os.path.join(os.path.expanduser('~'), 'Downloads')
-            ]
-            for root_dir in search_roots:
-                if os.path.exists(root_dir):
-                    for root, dirs, files in os.walk(root_dir):
-                        if target_name in files:
-                            found = os.path.join(root, target_name)
-                            for enc in ['utf-8', 'utf-8-sig', 'cp1256', 'cp1252', 'latin1']:
-                                try:
-                                    with open(found, 'r', encoding=enc) as f:
-                                        project_data = json.loads(f.read().strip().lstrip('\ufeff'))
-                                    loaded_file_path = found
-                                    print(f'[Load Project] Successfully recovered and loaded from: {found}')
-                                    break
-                                except Exception:
-                                    pass
-                            if project_data:
-                                break
-                    if project_data:
+            for found in filename_index.lookup(target_name):
+                if loaded_file_path and os.path.normcase(found) == os.path.normcase(loaded_file_path):
+                    continue
+                for enc in ['utf-8', 'utf-8-sig', 'cp1256', 'cp1252', 'latin1']:
+                    try:
+                        with open(found, 'r', encoding=enc) as f:
+                            project_data = json.loads(f.read().strip().lstrip('\ufeff'))
+                        loaded_file_path = found
+                        print(f'[Load Project] Successfully recovered and loaded from: {found}')
                         break
-                    
+                    except Exception:
+                        pass
+                if project_data:
+                    break
+
         # 3. Fall back to parsing file_content sent from client
         if not project_data and file_content:
             print(f'[Load Project] Parsing JSON from transmitted file_content (length: {len(file_content)})')
@@ -1480,6 +1389,7 @@ def load_project_file():
             p_ids = [str(x) for x in (p.get('ids') or p.get('enteredIds') or p.get('entered_ids') or [])]
             p_curves = p.get('curves') or []
             normalized_parcels.append({
+                'id': p.get('id'),
                 'parcelNumber': p_num,
                 'parcel_number': p_num,
                 'ids': p_ids,
@@ -1537,36 +1447,36 @@ def load_project_file():
         if actual_points_file:
             print(f'[Load Project] Found associated points file: {actual_points_file}')
             try:
-                pnt_content = None
-                for enc in ['utf-8', 'utf-8-sig', 'cp1256', 'cp1252', 'latin1']:
-                    try:
-                        with open(actual_points_file, 'r', encoding=enc) as pf:
-                            pnt_content = pf.read()
-                        break
-                    except Exception:
-                        continue
-                
-                if pnt_content:
-                    imported_points = parse_points_content(pnt_content)
-                    if imported_points:
-                        points_map = {str(p['id']): {'x': p['x'], 'y': p['y']} for p in imported_points}
-                        project_data['loadedPoints'] = points_map
-                        project_data['pointsFilePath'] = actual_points_file
-                        project_data['pointsFileName'] = os.path.basename(actual_points_file)
-                        print(f'[Load Project] Synchronized {len(points_map)} points from {actual_points_file}.')
+                # Served from the binary sidecar unless the points file changed since last parse
+                points_table, _ = points_cache.load(actual_points_file)
+                if len(points_table):
+                    points_map = points_table.to_map()
+                    project_data['loadedPoints'] = points_map
+                    project_data['pointsFilePath'] = actual_points_file
+                    project_data['pointsFileName'] = os.path.basename(actual_points_file)
+                    print(f'[Load Project] Synchronized {len(points_map)} points from {actual_points_file}.')
             except Exception as sync_err:
                 print(f'[Load Project WARNING] Failed to sync points file: {sync_err}')
 
         # Re-calculate metrics with available points
         if project_data.get('loadedPoints'):
             pts_map = project_data['loadedPoints']
-            for parcel in project_data.get('savedParcels', []):
-                area, perimeter = calculate_single_parcel_metrics(parcel, pts_map)
+            saved = project_data.get('savedParcels', [])
+            for parcel, (area, perimeter) in zip(saved, compute_id_parcels(saved, pts_map)):
                 if area is not None:
                     parcel['area'] = area
                 if perimeter is not None:
                     parcel['perimeter'] = perimeter
         
+        if loaded_file_path:
+            parcel_indexes.register(loaded_file_path, project_data.get('savedParcels', []),
+                                    project_data.get('loadedPoints', {}), project_data.get('pointsFilePath'))
+            try:
+                project_index.record(loaded_file_path, project_data)
+                filename_index.note(loaded_file_path)
+            except Exception as index_error:
+                print(f'[Load Project WARNING] Failed to update project index: {index_error}')
+
         # Add to recent files if we have a valid path
         if loaded_file_path:
             try:
@@ -1609,31 +1519,20 @@ def list_project_files():
         scan_full = request.args.get('scan') == 'full'  # Optional: scan common directories
         print(f'[List Projects] Scan full: {scan_full}')
         
+        # Candidate paths in listing order; summaries come from the metadata index
+        candidates = []
+        fallback_names = {}
+        
         # First, get projects from DATA_DIR
         if os.path.exists(DATA_DIR):
             for filename in os.listdir(DATA_DIR):
                 if filename.endswith('.prcl'):
                     filepath = os.path.join(DATA_DIR, filename)
-                    try:
-                        if os.path.exists(filepath):
-                            with open(filepath, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            
-                            projects.append({
-                                'fileName': filename,
-                                'filePath': filepath,
-                                'projectName': data.get('projectName', filename.replace('.prcl', '')),
-                                'savedParcels': len(data.get('savedParcels', [])),
-                                'pointsFile': data.get('pointsFileName', 'N/A'),
-                                'lastModified': os.path.getmtime(filepath)
-                            })
-                            project_paths_seen.add(filepath)
-                    except Exception:
-                        continue
+                    candidates.append(filepath)
+                    fallback_names[filepath] = filename.replace('.prcl', '')
         
-        # Scan common user directories for .prcl files
+        # Projects found in common user directories (indexed by a background scan)
         if scan_full:
-            print('[List Projects] Scanning common directories for .prcl files...')
             common_dirs = []
             
             # Add common Windows directories
@@ -1647,73 +1546,28 @@ def list_project_files():
                     user_home
                 ]
             
-            for directory in common_dirs:
-                if not os.path.exists(directory):
-                    continue
-                
-                try:
-                    # Search recursively but limit depth to 3 levels
-                    for root, dirs, files in os.walk(directory):
-                        # Calculate depth
-                        depth = root[len(directory):].count(os.sep)
-                        if depth > 2:
-                            dirs[:] = []  # Don't recurse deeper
-                            continue
-                        
-                        for filename in files:
-                            if filename.endswith('.prcl'):
-                                filepath = os.path.join(root, filename)
-                                
-                                if filepath in project_paths_seen:
-                                    continue
-                                
-                                try:
-                                    with open(filepath, 'r', encoding='utf-8') as f:
-                                        data = json.load(f)
-                                    
-                                    projects.append({
-                                        'fileName': filename,
-                                        'filePath': filepath,
-                                        'projectName': data.get('projectName', filename.replace('.prcl', '')),
-                                        'savedParcels': len(data.get('savedParcels', [])),
-                                        'pointsFile': data.get('pointsFileName', 'N/A'),
-                                        'lastModified': os.path.getmtime(filepath)
-                                    })
-                                    project_paths_seen.add(filepath)
-                                except Exception:
-                                    continue
-                except Exception as e:
-                    print(f'[List Projects] Error scanning {directory}: {e}')
-                    continue
+            if project_index.last_scan() is None:
+                print('[List Projects] First scan of common directories for .prcl files...')
+                project_index.rescan(common_dirs)
+            else:
+                project_index.rescan_async(common_dirs)
+            for filepath in project_index.scanned_paths():
+                candidates.append(filepath)
+                fallback_names.setdefault(filepath, os.path.basename(filepath).replace('.prcl', ''))
         
         # Also include projects from recent files (includes custom paths from Save As)
         # Repair paths if corrupt/moved before pruning
         recent = load_recent_files()
         
-        # Common directories to search when a path is broken/corrupted
-        _search_roots = [
-            os.path.join(os.path.expanduser('~'), 'OneDrive', 'share', 'dwg'),
-            os.path.join(os.path.expanduser('~'), 'OneDrive'),
-            os.path.join(os.path.expanduser('~'), 'Documents'),
-            os.path.join(os.path.expanduser('~'), 'Desktop'),
-            os.path.join(os.path.expanduser('~'), 'Downloads'),
-            DATA_DIR,
-        ]
-
         def _recover_path(entry_path, entry_name):
-            """Try to find a file by name when its stored path no longer exists."""
+            """Look a file up by name in the filename index when its stored path no longer exists."""
             target = entry_name or (os.path.basename(entry_path) if entry_path else '')
             if not target:
                 return None
-            for root_dir in _search_roots:
-                if not os.path.exists(root_dir):
-                    continue
-                for root, dirs, files in os.walk(root_dir):
-                    if target in files:
-                        found = os.path.join(root, target)
-                        print(f'[List Projects] Recovered missing path: {entry_path} → {found}')
-                        return found
-            return None
+            found = filename_index.find(target)
+            if found:
+                print(f'[List Projects] Recovered missing path: {entry_path} → {found}')
+            return found
 
         cleaned_projects = []
         cleaned_points = []
@@ -1732,6 +1586,8 @@ def list_project_files():
                     file_entry['path'] = recovered
                     cleaned_projects.append(file_entry)
                     needs_cleanup = True  # Path was repaired, save it
+                elif not filename_index.ready:
+                    cleaned_projects.append(file_entry)  # Index still building — decide next time
                 else:
                     needs_cleanup = True  # File truly gone — drop it
         
@@ -1747,6 +1603,8 @@ def list_project_files():
                     file_entry['path'] = recovered
                     cleaned_points.append(file_entry)
                     needs_cleanup = True
+                elif not filename_index.ready:
+                    cleaned_points.append(file_entry)
                 else:
                     needs_cleanup = True
         
@@ -1759,41 +1617,28 @@ def list_project_files():
         # Now process cleaned projects list
         for file_entry in cleaned_projects:
             filepath = file_entry.get('path', '')
-            
-            # Double-check file still exists (race condition protection)
-            if not filepath or not os.path.exists(filepath):
-                continue
-            
-            if filepath not in project_paths_seen:
-                try:
-                    # Check if it's already in DATA_DIR (skip to avoid duplicates)
-                    if not filepath.startswith(DATA_DIR):
-                        pdata = None
-                        for enc in ['utf-8', 'utf-8-sig', 'cp1256', 'cp1252', 'latin1']:
-                            try:
-                                with open(filepath, 'r', encoding=enc) as f:
-                                    pdata = json.load(f)
-                                break
-                            except Exception:
-                                pass
-                        if pdata is None:
-                            continue
-                        
-                        # Get last modified time
-                        last_modified = os.path.getmtime(filepath)
-                        
-                        projects.append({
-                            'fileName': os.path.basename(filepath),
-                            'filePath': filepath,
-                            'projectName': pdata.get('projectName', file_entry.get('name', '').replace('.prcl', '')),
-                            'savedParcels': len(pdata.get('savedParcels', [])),
-                            'pointsFile': pdata.get('pointsFileName', 'N/A'),
-                            'lastModified': last_modified
-                        })
-                        project_paths_seen.add(filepath)
-                except Exception:
-                    # If file can't be read, skip it
-                    continue
+            if filepath:
+                candidates.append(filepath)
+                fallback_names.setdefault(filepath, file_entry.get('name', '').replace('.prcl', ''))
+        
+        # Summaries from the index; only new or changed .prcl files are parsed
+        unique_paths = []
+        for filepath in candidates:
+            key = os.path.normcase(os.path.abspath(filepath))
+            if key not in project_paths_seen:
+                project_paths_seen.add(key)
+                unique_paths.append(filepath)
+        
+        for entry in project_index.describe_many(unique_paths):
+            filepath = entry['path']
+            projects.append({
+                'fileName': os.path.basename(filepath),
+                'filePath': filepath,
+                'projectName': entry['projectName'] or fallback_names.get(filepath, ''),
+                'savedParcels': entry['parcelCount'],
+                'pointsFile': entry['pointsFile'] or 'N/A',
+                'lastModified': entry['lastModified']
+            })
         
         # Sort by last modified
         projects.sort(key=lambda x: x['lastModified'], reverse=True)
@@ -1830,9 +1675,22 @@ def check_file_modified():
         return jsonify({'error': str(e)}), 500
 
 
+def read_points_file(file_path):
+    """
+    Read a points file (id,x,y per line) with automatic deduplication.
+    Returns (points, version_token).
+    """
+    table, token = points_cache.load(file_path)
+    return table.to_list(), token
+
+
 @app.route('/api/reload-points-file', methods=['POST'])
 def reload_points_file():
-    """Reload points from file"""
+    """
+    Reload points from file.
+    Expected JSON: { "filePath": "...", "versionToken": "..." (optional), "projectPath": "..." (optional) }
+    With the token from the previous reply, only added / removed / moved points are returned.
+    """
     try:
         data = request.get_json()
         file_path = data.get('filePath', '')
@@ -1840,40 +1698,141 @@ def reload_points_file():
         if not os.path.exists(file_path):
             return jsonify({'error': 'File not found'}), 404
         
-        # Read points with automatic deduplication
-        points = []
-        seen_point_ids = set()
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#') or line.startswith('//'):
-                    continue
-                
-                line = line.replace(';', ',')
-                parts = [p.strip() for p in (line.split(',') if ',' in line else line.split()) if p.strip()]
-                
-                if len(parts) >= 3:
-                    try:
-                        point_id = parts[0].strip()
-                        if not point_id or point_id in seen_point_ids:
-                            continue
-                        x = float(parts[1])
-                        y = float(parts[2])
-                        seen_point_ids.add(point_id)
-                        points.append({'id': point_id, 'x': x, 'y': y})
-                    except ValueError:
-                        continue
+        points, token = read_points_file(file_path)
         
         # Add to recent files
         metadata = {'pointsCount': len(points)}
         add_to_recent_files('points', file_path, os.path.basename(file_path), metadata)
         
-        return jsonify({'points': points, 'count': len(points)})
+        response = points_versions.sync(file_path, points, token, data.get('versionToken'))
+        response['count'] = len(points)
+
+        # Incremental recompute: only parcels that use an added/removed/moved point
+        project_path = data.get('projectPath')
+        if project_path:
+            applied = parcel_indexes.apply_points(project_path, {p['id']: p for p in points})
+            if applied is not None:
+                diff, changed, parcels_version = applied
+                response['diff'] = diff
+                response['changedParcels'] = changed
+                response['parcelsVersion'] = parcels_version
+        
+        return jsonify(response)
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def _on_watched_file_changed(path):
+    """Watcher-thread callback: turn a file change into an event for every stream."""
+    key = os.path.normcase(os.path.abspath(path))
+    with watched_files_lock:
+        entry = watched_files.get(key)
+    if entry is None:
+        return
+    if not os.path.exists(path):
+        watch_events.publish({'type': 'deleted', 'kind': entry['kind'], 'key': key})
+        return
+    if entry['kind'] != 'points':
+        watch_events.publish({'type': 'project', 'key': key, 'modified': os.path.getmtime(path)})
+        return
+
+    points, token = read_points_file(path)
+    advanced = points_versions.advance(path, points, token)
+    if advanced is None:
+        return
+    base_token, event = advanced
+    event.update({'type': 'points', 'key': key, 'baseToken': base_token, 'count': len(points)})
+
+    # Same incremental recompute the reload endpoint does, for every project on this file
+    projects = []
+    if not event['full']:
+        points_map = {p['id']: p for p in points}
+        for project_path in parcel_indexes.for_points_file(path):
+            applied = parcel_indexes.apply_points(project_path, points_map)
+            if applied is not None:
+                projects.append({'projectPath': project_path, 'changedParcels': applied[1],
+                                 'parcelsVersion': applied[2]})
+    event['projects'] = projects
+    print(f'[Watch] {os.path.basename(path)} changed ({len(points)} points)')
+    watch_events.publish(event)
+
+
+def _acquire_watch(path, kind):
+    key = os.path.normcase(os.path.abspath(path))
+    with watched_files_lock:
+        entry = watched_files.get(key)
+        if entry is None:
+            entry = {'handle': file_watcher.add(path, _on_watched_file_changed), 'refs': 0, 'kind': kind}
+            watched_files[key] = entry
+        entry['refs'] += 1
+    if kind == 'points' and os.path.exists(path) and points_versions.current_token(path) is None:
+        # Seed the version store so the first change can already be sent as a delta
+        points, token = read_points_file(path)
+        points_versions.advance(path, points, token)
+    return key
+
+
+def _release_watch(key):
+    with watched_files_lock:
+        entry = watched_files.get(key)
+        if entry is None:
+            return
+        entry['refs'] -= 1
+        if entry['refs'] <= 0:
+            del watched_files[key]
+            file_watcher.remove(entry['handle'])
+
+
+@app.route('/api/watch/stream', methods=['GET'])
+def watch_stream():
+    """
+    Server-Sent Events stream of file changes.
+    Query: ?points=<path>&project=<path> (each repeatable); files stay watched while the stream is open.
+    Points events carry the delta against 'baseToken' plus changed parcels per registered project.
+    """
+    try:
+        watches = [(p, 'points') for p in request.args.getlist('points') if p] + \
+                  [(p, 'project') for p in request.args.getlist('project') if p]
+        missing = [p for p, _ in watches if not os.path.exists(p)]
+        if missing:
+            return jsonify({'error': 'File not found', 'paths': missing}), 404
+
+        subscriber = watch_events.subscribe()
+        keys = [_acquire_watch(p, kind) for p, kind in watches]
+        paths_by_key = dict(zip(keys, (p for p, _ in watches)))
+        tokens = {k: points_versions.current_token(p) for k, p in paths_by_key.items()}
+
+        def generate():
+            try:
+                hello = {'type': 'hello', 'backend': file_watcher.backend,
+                         'tokens': {paths_by_key[k]: t for k, t in tokens.items()}}
+                yield f'data: {json.dumps(hello)}\n\n'
+                while True:
+                    try:
+                        event = subscriber.get(timeout=15)
+                    except queue.Empty:
+                        yield ': keepalive\n\n'
+                        continue
+                    key = event.get('key')
+                    if key is not None and key not in paths_by_key:
+                        continue
+                    payload = dict(event)
+                    if key is not None:
+                        payload['path'] = paths_by_key[payload.pop('key')]
+                    yield f'data: {json.dumps(payload)}\n\n'
+            finally:
+                watch_events.unsubscribe(subscriber)
+                for key in keys:
+                    _release_watch(key)
+
+        return Response(generate(), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/import-points', methods=['POST'])
 def import_points():
     """
@@ -1886,31 +1845,7 @@ def import_points():
         if not isinstance(text_data, str):
             text_data = str(text_data)
         
-        points = []
-        seen_point_ids = set()
-        for line in text_data.strip().split('\n'):
-            line = line.strip()
-            if not line or line.startswith('#') or line.startswith('//'):
-                continue
-            
-            # Replace semicolons and tabs with commas
-            line = line.replace(';', ',').replace('\t', ',')
-            
-            # Split by comma or whitespace
-            parts = [p.strip() for p in (line.split(',') if ',' in line else line.split()) if p.strip()]
-            
-            if len(parts) >= 3:
-                try:
-                    point_id = parts[0].strip()
-                    if not point_id or point_id in seen_point_ids:
-                        continue
-                    x = float(parts[1])
-                    y = float(parts[2])
-                    if not (math.isnan(x) or math.isnan(y) or math.isinf(x) or math.isinf(y)):
-                        seen_point_ids.add(point_id)
-                        points.append({'id': point_id, 'x': x, 'y': y})
-                except (ValueError, TypeError):
-                    continue
+        points = parse_points_text(text_data).to_list()
         
         if not points:
             return jsonify({'error': 'No valid coordinate points found in input text'}), 400
@@ -2041,17 +1976,96 @@ def _process_file_for_archive(file_entry):
         }
 
 
+def _compress_file_for_archive(task):
+    """Worker task: resolve one file entry and raw-deflate it into a CompressedMember."""
+    file_entry, compression_level, job = task
+    res = _process_file_for_archive(file_entry)
+    if res.get('error'):
+        return res
+    on_chunk = job.add_bytes_in if job is not None else None  # progress; raises once the job is cancelled
+    try:
+        if res['type'] == 'disk':
+            member = compress_member(res['archive_name'], source_path=res['source_path'],
+                                     level=compression_level, on_chunk=on_chunk)
+        else:
+            member = compress_member(res['archive_name'], data=res.pop('data'),
+                                     level=compression_level, on_chunk=on_chunk)
+    except OSError as e:
+        return {'archive_name': res['archive_name'], 'error': f"Read error for {res['archive_name']}: {e}"}
+    res['member'] = member
+    res['size'] = member.size
+    return res
+
+
+ARCHIVE_WINDOW = MAX_CONCURRENT_WORKERS * 2  # members compressed ahead of the zip writer
+
+
+def _write_archive(output_path, files, compression_level, comment='', job=None):
+    """
+    Compress file entries on the worker pool and stitch them, in input order, into a zip at
+    output_path (written to a .part file and swapped in). Returns (files written, errors,
+    original bytes); no archive is left behind when nothing could be read or the job
+    (an ArchiveJob receiving progress) is cancelled.
+    """
+    tasks = [(f, compression_level, job) for f in files]
+    errors = job.errors if job is not None else []
+    count, total_bytes = 0, 0
+    partial = output_path + '.part'
+    try:
+        with open(partial, 'wb') as fp:
+            zip_out = ZipStitcher(fp)
+            for res in map_in_order(compression_executor, _compress_file_for_archive, tasks, ARCHIVE_WINDOW):
+                if job is not None:
+                    job.check()
+                if res.get('error'):
+                    errors.append(res['error'])
+                    continue
+                zip_out.add(res['member'])
+                count += 1
+                total_bytes += res['size']
+                if job is not None:
+                    job.file_done(zip_out.offset)
+            zip_out.close(comment.encode('utf-8') if comment else b'')
+        if count:
+            os.replace(partial, output_path)
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+    return count, errors, total_bytes
+
+
+def _archive_job_response(job, failure, data, output_path):
+    """
+    202 { jobId } at once, so no request thread waits on the archive. With "wait": true
+    (scripts and tests) the request blocks and answers like the old synchronous endpoints.
+    """
+    if not data.get('wait'):
+        return jsonify({'jobId': job.id, 'status': job.status, 'outputPath': output_path}), 202
+    job.wait()
+    snap = job.snapshot()
+    if snap['status'] == 'done':
+        return jsonify(snap['result'])
+    if snap['status'] == 'cancelled':
+        return jsonify({'error': 'Archive job was cancelled', 'jobId': job.id}), 409
+    if not snap['filesDone'] and snap['errors']:
+        return jsonify({'error': snap['error'], 'details': snap['errors']}), 400
+    return jsonify({'error': f"{failure}: {snap['error']}"}), 500
+
+
 @app.route('/api/compress-files', methods=['POST'])
 def compress_files_endpoint():
     """
     Concurrent multi-file compression endpoint.
-    Compresses numerous files simultaneously with chunked streaming and memory bounds.
+    Every member is raw-deflated on its own worker thread and the results are stitched
+    into the zip in request order, so large batches use all cores.
     Body: {
         "files": [ { "sourcePath": "...", "archiveName": "..." }, ... ],
         "outputPath": "C:\\path\\output.zip", // Optional (if omitted, creates temp zip)
         "compressionLevel": 6, // 1 to 9
-        "comment": "Parcel Tools Archive"
+        "comment": "Parcel Tools Archive",
+        "wait": true // Optional: block until the archive is built and return its result
     }
+    Answers 202 { jobId, status, outputPath }; poll /api/compress/status?jobId= for progress and the result.
     """
     start_time = time.time()
     try:
@@ -2068,70 +2082,42 @@ def compress_files_endpoint():
         # If no outputPath provided, generate a managed temporary archive path
         if not output_path:
             import tempfile
+            import uuid
             temp_dir = os.path.join(tempfile.gettempdir(), 'parcel_tools_archives')
             os.makedirs(temp_dir, exist_ok=True)
-            output_path = os.path.join(temp_dir, f"archive_{int(time.time() * 1000)}.zip")
+            output_path = os.path.join(temp_dir, f"archive_{int(time.time() * 1000)}_{uuid.uuid4().hex[:8]}.zip")
 
         output_dir = os.path.dirname(output_path)
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
 
-        # 1. Parallelize file inspection and resolution across thread pool
-        futures = [compression_executor.submit(_process_file_for_archive, f) for f in files]
-        prepared_files = []
-        errors = []
-        total_original_bytes = 0
-
-        for future in as_completed(futures):
-            res = future.result()
-            if res.get('error'):
-                errors.append(res['error'])
-            else:
-                prepared_files.append(res)
-                total_original_bytes += res.get('size', 0)
-
-        if not prepared_files:
-            return jsonify({'error': 'No valid files could be read for compression', 'details': errors}), 400
-
-        # 2. Stream files into Zip archive using chunked buffers (thread-safe write lock)
-        CHUNK_SIZE = 64 * 1024  # 64 KB streaming buffer
-        with _file_io_lock:
-            with zipfile.ZipFile(output_path, mode='w', compression=zipfile.ZIP_DEFLATED, compresslevel=compression_level) as zip_out:
-                if comment:
-                    zip_out.comment = comment.encode('utf-8')
-
-                for p_file in prepared_files:
-                    arch_name = p_file['archive_name']
-                    if p_file['type'] == 'disk':
-                        # Stream from disk in chunks to avoid loading whole large file into RAM
-                        with open(p_file['source_path'], 'rb') as f_in:
-                            with zip_out.open(arch_name, mode='w') as f_out:
-                                while True:
-                                    chunk = f_in.read(CHUNK_SIZE)
-                                    if not chunk:
-                                        break
-                                    f_out.write(chunk)
-                    elif p_file['type'] == 'memory':
-                        zip_out.writestr(arch_name, p_file['data'])
-
-        compressed_size = os.path.getsize(output_path)
-        elapsed_ms = int((time.time() - start_time) * 1000)
-        saved_bytes = max(0, total_original_bytes - compressed_size)
-        ratio_pct = ((saved_bytes / total_original_bytes) * 100) if total_original_bytes > 0 else 0
+        def build(job):
+            # Members compress in parallel and are stitched into the zip; only jobs writing
+            # this same output path wait for each other
+            files_count, errors, total_original_bytes = _write_archive(output_path, files, compression_level,
+                                                                       comment, job)
+            if not files_count:
+                raise ValueError('No valid files could be read for compression')
+
+            compressed_size = os.path.getsize(output_path)
+            saved_bytes = max(0, total_original_bytes - compressed_size)
+            ratio_pct = ((saved_bytes / total_original_bytes) * 100) if total_original_bytes > 0 else 0
+            return {
+                'success': True,
+                'outputPath': output_path,
+                'fileName': os.path.basename(output_path),
+                'filesCount': files_count,
+                'skippedCount': len(errors),
+                'errors': list(errors),
+                'originalSizeBytes': total_original_bytes,
+                'compressedSizeBytes': compressed_size,
+                'savedBytes': saved_bytes,
+                'compressionRatioPercent': round(ratio_pct, 2),
+                'durationMs': int((time.time() - start_time) * 1000)
+            }
 
-        return jsonify({
-            'success': True,
-            'outputPath': output_path,
-            'fileName': os.path.basename(output_path),
-            'filesCount': len(prepared_files),
-            'skippedCount': len(errors),
-            'errors': errors,
-            'originalSizeBytes': total_original_bytes,
-            'compressedSizeBytes': compressed_size,
-            'savedBytes': saved_bytes,
-            'compressionRatioPercent': round(ratio_pct, 2),
-            'durationMs': elapsed_ms
-        })
+        job = archive_jobs.submit('compress-files', output_path, len(files), build)
+        return _archive_job_response(job, 'Compression failed', data, output_path)
 
     except Exception as e:
         import traceback
@@ -2144,6 +2130,7 @@ def export_project_archive():
     """
     High-speed comprehensive project archive exporter.
     Packages project JSON, active .pnt coordinates file, CAD drawing, and manifest into a single compressed .zip.
+    Answers 202 { jobId } at once like /api/compress-files ("wait": true blocks for the result).
     """
     start_time = time.time()
     try:
@@ -2210,29 +2197,24 @@ def export_project_archive():
             'content': json.dumps(manifest, indent=2)
         })
 
-        # Execute chunked streaming compression
-        with _file_io_lock:
-            with zipfile.ZipFile(output_filepath, mode='w', compression=zipfile.ZIP_DEFLATED, compresslevel=6) as zip_out:
-                zip_out.comment = f"Parcel Tools Project Archive: {project_name}".encode('utf-8')
-                for item in files_to_compress:
-                    arch_name = item['archiveName']
-                    if 'sourcePath' in item and os.path.isfile(item['sourcePath']):
-                        zip_out.write(item['sourcePath'], arch_name)
-                    elif 'content' in item:
-                        zip_out.writestr(arch_name, item['content'].encode('utf-8'))
-
-        compressed_size = os.path.getsize(output_filepath)
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        def build(job):
+            # Compress the members in parallel and stitch them into the archive
+            files_count, _, _ = _write_archive(output_filepath, files_to_compress, 6,
+                                               f"Parcel Tools Project Archive: {project_name}", job)
+            if not files_count:
+                raise ValueError('No project files could be read for the archive')
+            return {
+                'success': True,
+                'outputPath': output_filepath,
+                'fileName': os.path.basename(output_filepath),
+                'filesCount': files_count,
+                'compressedSizeBytes': os.path.getsize(output_filepath),
+                'durationMs': int((time.time() - start_time) * 1000),
+                'manifest': manifest
+            }
 
-        return jsonify({
-            'success': True,
-            'outputPath': output_filepath,
-            'fileName': os.path.basename(output_filepath),
-            'filesCount': len(files_to_compress),
-            'compressedSizeBytes': compressed_size,
-            'durationMs': elapsed_ms,
-            'manifest': manifest
-        })
+        job = archive_jobs.submit('export-archive', output_filepath, len(files_to_compress), build)
+        return _archive_job_response(job, 'Project archive export failed', data, output_filepath)
 
     except Exception as e:
         import traceback
@@ -2245,455 +2227,95 @@ def get_compression_status():
     """
     Concurrency & compression health check endpoint.
     Reports active worker threads, CPU concurrency level, and thread pool state.
+    ?jobId=... returns that archive job instead: { jobId, status, filesTotal, filesDone,
+    bytesIn, bytesOut, errors, error, result, elapsedMs }
     """
+    job_id = request.args.get('jobId')
+    if job_id:
+        job = archive_jobs.get(job_id)
+        if job is None:
+            return jsonify({'error': f'Unknown archive job: {job_id}'}), 404
+        return jsonify(job.snapshot())
     return jsonify({
         'status': 'healthy',
         'maxWorkers': MAX_CONCURRENT_WORKERS,
         'cpuCount': os.cpu_count() or 4,
         'threadsActive': threading.active_count(),
-        'compressionEngine': 'zipfile_deflate_chunked'
+        'compressionEngine': 'parallel_raw_deflate',
+        'activeJobs': archive_jobs.jobs(active_only=True)
     })
 
 
-
+@app.route('/api/compress/cancel', methods=['POST'])
+def cancel_compression_job():
+    """
+    Cancel a queued or running archive job. Body: { "jobId": "..." }
+    The partial archive is removed; an already finished job keeps its result.
+    """
+    data = request.get_json() or {}
+    job_id = data.get('jobId')
+    if not job_id:
+        return jsonify({'error': 'jobId is required'}), 400
+    job = archive_jobs.cancel(job_id)
+    if job is None:
+        return jsonify({'error': f'Unknown archive job: {job_id}'}), 404
+    return jsonify({'jobId': job.id, 'status': job.status, 'cancelRequested': job.cancelled})
 
 
 @app.route('/api/export-pdf', methods=['POST'])
 def export_pdf():
     """
     Export parcels to PDF - PROFESSIONAL SURVEYING FORMAT
-    Expected JSON: { "parcels": [...], "points": {...} }
+    Expected JSON: { "parcels": [...], "points": {...}, "outputPath": "C:\\out\\report.pdf", "format": "raw" }
+    outputPath: write the PDF there and return { filePath, fileName, pages, size }
+    format "raw": stream the PDF back as application/pdf
+    neither: legacy { pdfData (base64), fileName } JSON
+    Large reports are rendered in page-aligned chunks across worker processes, and unchanged
+    chunks of a previous export are reused from pdf_fragments (pdf_report.py)
     """
     try:
-        from reportlab.lib.pagesizes import A4
-        from reportlab.pdfgen import canvas
-        import io
         import base64
-        
-        data = request.get_json()
-        parcels = data.get('parcels', [])
-        points_by_id = data.get('points', {})
-        file_heading = data.get('fileHeading', {})
-        error_results = data.get('errorResults', None)  # Current/Unsaved calculation
-        saved_error_calculations = data.get('savedErrorCalculations', []) # List of saved calculations
-        is_buggy = data.get('isBuggy', False)
-        
-        # Create PDF in memory
-        buffer = io.BytesIO()
-        c = canvas.Canvas(buffer, pagesize=A4)
-        width, height = A4
-        
-        def draw_bg_watermark(canvas_obj):
-            if is_buggy:
-                canvas_obj.saveState()
-                canvas_obj.setFillColorRGB(0.95, 0.8, 0.8)
-                canvas_obj.setFont("Helvetica-Bold", 36)
-                canvas_obj.translate(width / 2, height / 2)
-                canvas_obj.rotate(45)
-                canvas_obj.drawCentredString(0, 0, "DEMO VERSION - UNSAVED BUILD")
-                canvas_obj.restoreState()
-
-        # Draw watermark on first page
-        draw_bg_watermark(c)
-        
-        # Track if heading was added (only once) and page count
-        heading_added = False
-        page_count = 1
-        
-        def draw_page_number(canvas_obj, p_count):
-            canvas_obj.saveState()
-            canvas_obj.setFont("Courier-Bold", 10)
-            page_text = f"Page {p_count}"
-            canvas_obj.drawRightString(width - 40, 50, page_text)
-            canvas_obj.restoreState()
-        
-        # Build robust normalized lookup dictionary for all points
-        normalized_points = {}
-        for k, v in points_by_id.items():
-            if isinstance(v, dict):
-                x_val = float(v.get('x', v.get('X', 0.0)))
-                y_val = float(v.get('y', v.get('Y', 0.0)))
-            elif isinstance(v, (list, tuple)):
-                x_val = float(v[0])
-                y_val = float(v[1])
-            else:
-                x_val = float(getattr(v, 'x', 0.0))
-                y_val = float(getattr(v, 'y', 0.0))
-            k_str = str(k).strip()
-            normalized_points[k_str] = {'x': x_val, 'y': y_val}
+        import tempfile
+
+        data = request.get_json() or {}
+        output_path = data.get('outputPath')
+        if output_path:
+            if not isinstance(output_path, str) or not os.path.isabs(output_path):
+                return jsonify({'error': 'outputPath must be an absolute file path'}), 400
+            if not os.path.isdir(os.path.dirname(output_path)):
+                return jsonify({'error': f'Folder not found: {os.path.dirname(output_path)}'}), 400
+            # Render next to the target and swap it in, so a failed export never leaves half a PDF
+            partial = output_path + '.part'
             try:
-                normalized_points[int(k_str)] = {'x': x_val, 'y': y_val}
-            except (ValueError, TypeError):
-                pass
-        
-        def get_point(pid):
-            if pid in normalized_points:
-                return normalized_points[pid]
-            pid_str = str(pid).strip()
-            if pid_str in normalized_points:
-                return normalized_points[pid_str]
+                pages = render_report(data, partial, cache=pdf_fragments)
+                os.replace(partial, output_path)
+            finally:
+                if os.path.exists(partial):
+                    os.remove(partial)
+            print(f"[PDF Export] Wrote {pages} pages to {output_path}")
+            return jsonify({'filePath': output_path, 'fileName': os.path.basename(output_path),
+                            'pages': pages, 'size': os.path.getsize(output_path)})
+
+        if data.get('format') == 'raw':
+            spool = tempfile.TemporaryFile()
             try:
-                return normalized_points.get(int(pid_str))
-            except (ValueError, TypeError):
-                return None
+                render_report(data, spool, cache=pdf_fragments)
+                size = spool.tell()
+                spool.seek(0)
+            except Exception:
+                spool.close()
+                raise
 
-        def deg_to_dms_val(deg):
-            deg = (deg + 360.0) % 360.0
-            d = int(deg)
-            rem_min = (deg - d) * 60.0
-            m = int(rem_min)
-            s = round((rem_min - m) * 60.0)
-            if s >= 60:
-                s -= 60
-                m += 1
-            if m >= 60:
-                m -= 60
-                d = (d + 1) % 360
-            return d + (m / 100.0) + (s / 10000.0)
-
-        for parcel_idx, parcel in enumerate(parcels):
-            # Only add new page if we run out of space, not for each parcel
-            if parcel_idx == 0:
-                y_position = height - 40
-            else:
-                # Check if we need a new page (add spacing between parcels)
-                if y_position < 100:
-                    draw_page_number(c, page_count)
-                    
-                    c.showPage()
-                    draw_bg_watermark(c)
-                    page_count += 1
-                    y_position = height - 40
-                else:
-                    y_position -= 30  # Space between parcels
-            
-            # Add file heading on first page only if it exists and has content
-            if not heading_added and file_heading:
-                # Check if heading has any actual content
-                has_content = any([
-                    file_heading.get('block'),
-                    file_heading.get('quarter'),
-                    file_heading.get('parcels'),
-                    file_heading.get('place'),
-                    file_heading.get('additionalInfo')
-                ])
-                
-                if has_content:
-                    c.setFont("Courier-Bold", 11)
-                    c.drawString(40, y_position, "=" * 60)
-                    y_position -= 15
-                    
-                    if file_heading.get('block'):
-                        c.drawString(40, y_position, f"BLOCK: {file_heading['block']}")
-                        y_position -= 12
-                    if file_heading.get('quarter'):
-                        c.drawString(40, y_position, f"QUARTER: {file_heading['quarter']}")
-                        y_position -= 12
-                    if file_heading.get('parcels'):
-                        c.drawString(40, y_position, f"PARCELS: {file_heading['parcels']}")
-                        y_position -= 12
-                    if file_heading.get('place'):
-                        c.drawString(40, y_position, f"PLACE: {file_heading['place']}")
-                        y_position -= 12
-                    if file_heading.get('additionalInfo'):
-                        y_position -= 5
-                        c.setFont("Courier", 9)
-                        c.drawString(40, y_position, file_heading['additionalInfo'])
-                        y_position -= 12
-                    
-                    c.setFont("Courier-Bold", 11)
-                    c.drawString(40, y_position, "=" * 60)
-                    y_position -= 25
-                    
-                    heading_added = True
-            
-            parcel_num = parcel.get('number', 'N/A')
-            ids = parcel.get('ids', [])
-            area = parcel.get('area', 0)
-            curves = parcel.get('curves', [])
-            
-            # Get unique IDs (remove closing duplicate)
-            ids_unique = ids[:-1] if len(ids) >= 2 and ids[-1] == ids[0] else ids[:]
-            
-            # PARCEL NUMBER
-            c.setFont("Courier", 12)
-            c.drawString(40, y_position, f"PARCEL  NUMBER    {parcel_num}")
-            y_position -= 30
-            
-            # ANGLES IN DEGREES
-            c.setFont("Courier", 10)
-            c.drawString(40, y_position, "ANGLES   IN   DEGREES")
-            y_position -= 15
-            c.drawString(40, y_position, "=" * 60)
-            y_position -= 25
-            
-            # Table header
-            c.setFont("Courier", 9)
-            header = f"{'FROM':<4}  {'TO':<4}  {'DISTANCE':>8}  {'AZIMUTH':>8}    {'POINT':<5}  {'Y':>10}  {'X':>10}"
-            c.drawString(40, y_position, header)
-            y_position -= 12
-            
-            sep = f"{'====':<4}  {'====':<4}  {'========':>8}  {'========':>8}    {'=====':<5}  {'==========':>10}  {'==========':>10}"
-            c.drawString(40, y_position, sep)
-            y_position -= 12
-            
-            # Calculate and draw each leg
-            for i in range(len(ids_unique)):
-                from_id = ids_unique[i]
-                to_id = ids_unique[(i + 1) % len(ids_unique)]
-                
-                from_pt = get_point(from_id)
-                to_pt = get_point(to_id)
-                
-                if from_pt is not None and to_pt is not None:
-                    # Calculate distance
-                    dy_plot = to_pt['x'] - from_pt['x']
-                    dx_plot = to_pt['y'] - from_pt['y']
-                    distance = math.sqrt(dy_plot * dy_plot + dx_plot * dx_plot)
-                    
-                    # Calculate azimuth in DD.MMSS format (Degrees, Minutes, Seconds)
-                    ang_deg = math.degrees(math.atan2(dy_plot, dx_plot))
-                    azimuth = deg_to_dms_val(ang_deg)
-                    
-                    # Format line: FROM, TO, DISTANCE, AZIMUTH, POINT (from_id), Y (from_pt.x), X (from_pt.y)
-                    line = (
-                        f"{str(from_id):<4}  {str(to_id):<4}  "
-                        f"{distance:>8.2f}  {azimuth:>8.4f}    "
-                        f"{str(from_id):<5}  {from_pt['x']:>10.2f}  {from_pt['y']:>10.2f}"
-                    )
-                    c.drawString(40, y_position, line)
-                    y_position -= 12
-                    
-                    if y_position < 100:
-                        draw_page_number(c, page_count)
-                        
-                        c.showPage()
-                        draw_bg_watermark(c)
-                        page_count += 1
-                        y_position = height - 40
-                        
-                        # Redraw table header on new page
-                        c.setFont("Courier", 9)
-                        c.drawString(40, y_position, header)
-                        y_position -= 12
-                        c.drawString(40, y_position, sep)
-                        y_position -= 12
-            
-            y_position -= 10
-            
-            # Curve calculations if any
-            if curves:
-                for curve in curves:
-                    from_id = curve.get('from')
-                    to_id = curve.get('to')
-                    M = float(curve.get('M', 0) or 0)
-                    sign = curve.get('sign', 1)
-                    
-                    from_pt = get_point(from_id)
-                    to_pt = get_point(to_id)
-                    
-                    if from_pt is not None and to_pt is not None:
-                        
-                        # Calculate chord length
-                        dx = to_pt['x'] - from_pt['x']
-                        dy = to_pt['y'] - from_pt['y']
-                        C = math.sqrt(dx * dx + dy * dy)
-                        
-                        # Calculate radius and segment area
-                        R = (C * C) / (8.0 * M) + (M / 2.0) if M > 0 else 0
-                        theta = 2.0 * math.asin(min(1.0, C / (2.0 * R))) if R > 0 else 0
-                        seg_area = 0.5 * R * R * (theta - math.sin(theta)) if R > 0 else 0
-                        
-                        # F value (sagitta factor)
-                        # F value (sagitta factor)
-                        F = M
-                        
-                        sign_symbol = "(+)" if sign == 1 else "(-)"
-                        
-                        curve_line = f"FROM PARCEL  {from_id} --> {to_id} = {C:.2f}   R = {R:.2f}   F = {F:.3f}   {sign_symbol}   PARCEL AREA= {seg_area:.2f}"
-                        c.drawString(40, y_position, curve_line)
-                        y_position -= 12
-                        
-                        # Check for page break inside curves loop
-                        if y_position < 100:
-                            draw_page_number(c, page_count)
-                            
-                            c.showPage()
-                            draw_bg_watermark(c)
-                            page_count += 1
-                            y_position = height - 40
-                            
-                            # Redraw curves header
-                            c.setFont("Courier-Bold", 10)
-                            c.drawString(40, y_position, "CURVES (continued):")
-                            y_position -= 15
-                            c.setFont("Courier", 9)
-                
-                y_position -= 10
-            
-            # Final AREA
-            c.setFont("Courier", 11)
-            c.drawString(40, y_position, f"AREA = {area:.3f}")
-            y_position -= 30
-        
-        
-        # Combine all error calculations to print
-        # Prefer saved calculations, but include current if provided and list is empty, 
-        # or just append current if it's not saved?
-        # Let's simple combine them.
-        all_calculations = []
-        if saved_error_calculations:
-            all_calculations.extend(saved_error_calculations)
-        
-        # Check if current error_results should be added (if not already in saved by ID logic? 
-        # Current result usually doesn't have ID unless saved... logic is loose)
-        # For now, if we have saved calculations, we assume the user manages what they want via "Save".
-        # If saved list is empty, we fall back to showing the current one (legacy behavior).
-        if not all_calculations and error_results:
-            all_calculations.append(error_results)
-            
-        # If we have any calculations to show
-        if all_calculations:
-            
-            # Start on a new page if we are near the bottom
-            if y_position < 100:
-                draw_page_number(c, page_count)
-                c.showPage()
-                draw_bg_watermark(c)
-                page_count += 1
-                y_position = height - 40
-            else:
-                 y_position -= 20
-            
-            # Main Header for Error Section
-            c.setFont("Courier-Bold", 14)
-            c.drawString(40, y_position, "ERROR CALCULATIONS REPORT")
-            y_position -= 25
-            
-            for index, calc in enumerate(all_calculations):
-                # Check for space for header
-                if y_position < 150:
-                    draw_page_number(c, page_count)
-                    c.showPage()
-                    draw_bg_watermark(c)
-                    page_count += 1
-                    y_position = height - 40
-                
-                # Calculation Header
-                name = calc.get('name', f'Calculation #{index + 1}')
-                timestamp = calc.get('timestamp', '')
-                if timestamp:
-                    try:
-                        # Simple format cleanup if it's ISO
-                        date_part = timestamp.split('T')[0]
-                        time_part = timestamp.split('T')[1][:8]
-                        timestamp = f"{date_part} {time_part}"
-                    except:
-                        pass
-                
-                c.setFont("Courier-Bold", 12)
-                c.drawString(40, y_position, "=" * 60)
-                y_position -= 15
-                c.drawString(40, y_position, f"{name}  {timestamp}")
-                y_position -= 15
-                c.drawString(40, y_position, "=" * 60)
-                y_position -= 25
-                
-                # Overall Summary
-                c.setFont("Courier-Bold", 10)
-                c.drawString(40, y_position, "SUMMARY:")
-                y_position -= 20
-                
-                c.setFont("Courier", 9)
-                c.drawString(40, y_position, f"Total Registered Area:    {calc['totalRegisteredArea']:.4f} m²")
-                y_position -= 15
-                c.drawString(40, y_position, f"Total Calculated Area:    {calc['totalCalculatedArea']:.4f} m²")
-                y_position -= 15
-                c.drawString(40, y_position, f"Absolute Difference:      {calc['absoluteDifference']:.4f} m²")
-                y_position -= 15
-                c.drawString(40, y_position, f"Permissible Error:        {calc['permissibleError']:.4f} m²")
-                y_position -= 20
-                
-                # Formula
-                c.setFont("Courier", 8)
-                formula_text = f"Formula: Permissible Error = 0.8 * sqrt({calc['totalRegisteredArea']:.2f}) + 0.002 * {calc['totalRegisteredArea']:.2f}"
-                c.drawString(40, y_position, formula_text)
-                y_position -= 20
-                
-                # Status
-                c.setFont("Courier-Bold", 10)
-                if calc['exceedsLimit']:
-                    c.drawString(40, y_position, "WARNING: ERROR EXCEEDS PERMISSIBLE LIMITS - Using original areas")
-                else:
-                    c.drawString(40, y_position, "OK: WITHIN PERMISSIBLE LIMITS - Areas adjusted proportionally")
-                y_position -= 30
-                
-                # Parcel Results Table Header
-                c.setFont("Courier-Bold", 10)
-                c.drawString(40, y_position, "PARCEL BREAKDOWN:")
-                y_position -= 20
-                
-                # Table header
-                c.setFont("Courier", 8)
-                header_line = f"{'Parcel #':<12} {'Original (m²)':>15} {'Adjusted (m²)':>15} {'Rounded (m²)':>15} {'Points':>8}"
-                c.drawString(40, y_position, header_line)
-                y_position -= 12
-                
-                sep_line = f"{'-'*12:<12} {'-'*15:>15} {'-'*15:>15} {'-'*15:>15} {'-'*8:>8}"
-                c.drawString(40, y_position, sep_line)
-                y_position -= 15
-                
-                # Parcel rows
-                c.setFont("Courier", 8)
-                for parcel_result in calc['parcelResults']:
-                    if y_position < 60:
-                        draw_page_number(c, page_count)
-                        
-                        c.showPage()
-                        draw_bg_watermark(c)
-                        page_count += 1
-                        y_position = height - 40
-                        c.setFont("Courier", 8)
-                    
-                    parcel_num = str(parcel_result['parcelNumber'])
-                    original = parcel_result['calculatedArea']
-                    adjusted = parcel_result['adjustedArea']
-                    rounded = parcel_result['roundedArea']
-                    points = parcel_result['pointCount']
-                    
-                    row_line = f"{parcel_num:<12} {original:>15.4f} {adjusted:>15.4f} {rounded:>15} {points:>8}"
-                    c.drawString(40, y_position, row_line)
-                    y_position -= 12
-                
-                # Total row
-                if y_position < 60:
-                    draw_page_number(c, page_count)
-                    
-                    c.showPage()
-                    draw_bg_watermark(c)
-                    page_count += 1
-                    y_position = height - 40
-                
-                y_position -= 5
-                c.setFont("Courier-Bold", 8)
-                total_original = sum(p['calculatedArea'] for p in calc['parcelResults'])
-                total_adjusted = sum(p['adjustedArea'] for p in calc['parcelResults'])
-                total_rounded = sum(p['roundedArea'] for p in calc['parcelResults'])
-                total_points = sum(p['pointCount'] for p in calc['parcelResults'])
-                
-                total_line = f"{'TOTAL:':<12} {total_original:>15.4f} {total_adjusted:>15.4f} {total_rounded:>15} {total_points:>8}"
-                c.drawString(40, y_position, total_line)
-                y_position -= 40 # Space between calculations
-        
-        # Add final page number
-        draw_page_number(c, page_count)
-        
-        c.save()
-        
-        # Convert to base64 to send to frontend
-        buffer.seek(0)
-        pdf_data = base64.b64encode(buffer.read()).decode('utf-8')
-        
+            # send_file quotes the name and adds filename*=UTF-8'' for Arabic names; control
+            # characters would break the header, so they are dropped first
+            file_name = re.sub(r'[\x00-\x1f\x7f]', '', str(data.get('fileName') or '')) or 'parcels_export.pdf'
+            response = send_file(spool, mimetype='application/pdf', as_attachment=True, download_name=file_name)
+            response.content_length = size
+            return response
+
+        buffer = io.BytesIO()
+        render_report(data, buffer, cache=pdf_fragments)
+        pdf_data = base64.b64encode(buffer.getvalue()).decode('utf-8')
         return jsonify({'pdfData': pdf_data, 'fileName': 'parcels_export.pdf'})
     
     except ImportError:
@@ -3189,155 +2811,58 @@ def generate_license_key():
 # DXF / DWG FILE IMPORT
 # ============================================================================
 
-def _convert_dwg_to_dxf(dwg_path: str) -> str:
+def _converted_dxf(dwg_path: str):
     """
-    Convert a DWG file to DXF.
+    Convert a DWG file to DXF; use as `with _converted_dxf(path) as dxf_path:`.
     Strategy:
       1. AutoCAD Core Console (accoreconsole.exe) - Headless, completely silent background converter.
-      2. ODA File Converter (free CLI tool)
+      2. ODA File Converter (free CLI tool; $PARCEL_TOOLS_ODA_CONVERTER overrides its location)
       3. AutoCAD COM automation (falls back to visible/running AutoCAD instance if Core Console fails)
       4. Raise helpful RuntimeError if neither available
-    Returns the absolute path to the generated DXF file.
+    Converted DXFs are cached by DWG content hash, so re-imports skip the converter.
+    Yields the absolute path to the generated DXF file, which stays in the cache until the block exits.
     """
-    import tempfile, shutil, subprocess, glob
-
-    def log_debug(msg):
-        print(f"[dwg-convert] {msg}")
-
-    log_debug(f"=== Starting _convert_dwg_to_dxf ===")
-    log_debug(f"Input path: {dwg_path}")
-
-    out_dir = tempfile.mkdtemp(prefix="parcel_tools_dwg_")
-    log_debug(f"Temp output directory: {out_dir}")
-    
-    # Create a separate temporary input directory with an ASCII path
-    # and copy the input DWG to "input.dwg" to bypass Unicode file path bugs in AutoCAD COM and ODA.
-    temp_in_dir = os.path.join(out_dir, "input_files")
-    os.makedirs(temp_in_dir, exist_ok=True)
-    temp_dwg_path = os.path.join(temp_in_dir, "input.dwg")
-    
-    try:
-        shutil.copy2(dwg_path, temp_dwg_path)
-        use_temp_paths = True
-        log_debug(f"Copied DWG successfully to: {temp_dwg_path}")
-    except Exception as e:
-        use_temp_paths = False
-        log_debug(f"Failed to copy DWG to temp paths: {e}")
+    return dwg_converter.converted(dwg_path)
 
-    dxf_out = os.path.join(out_dir, "input.dxf" if use_temp_paths else os.path.splitext(os.path.basename(dwg_path))[0] + ".dxf")
-    active_dwg_path = temp_dwg_path if use_temp_paths else dwg_path
-
-    # ── Method 1: AutoCAD Core Console (completely silent command-line converter) ──
-    if sys.platform == "win32":
-        try:
-            accore_candidates = glob.glob(r"C:\Program Files\Autodesk\AutoCAD *\accoreconsole.exe")
-            log_debug(f"AutoCAD accoreconsole candidates: {accore_candidates}")
-            accore_exe = next((p for p in accore_candidates if os.path.isfile(p)), None)
-            log_debug(f"Selected accore_exe: {accore_exe}")
-            
-            if accore_exe:
-                script_path = os.path.join(out_dir, "export.scr")
-                with open(script_path, "w", encoding="utf-8") as scr:
-                    # _DXFOUT -> output path -> 16 (decimal accuracy) -> _QUIT -> N (do not save changes)
-                    scr.write(f'_DXFOUT\n"{os.path.abspath(dxf_out)}"\n16\n_QUIT\nN\n')
-                
-                # Run accoreconsole silently
-                log_debug(f"Running accoreconsole command: {[accore_exe, '/i', os.path.abspath(active_dwg_path), '/s', script_path]}")
-                proc_res = subprocess.run(
-                    [accore_exe, "/i", os.path.abspath(active_dwg_path), "/s", script_path],
-                    check=True, capture_output=True, timeout=40
-                )
-                log_debug(f"accoreconsole stdout: {proc_res.stdout.decode(errors='replace')}")
-                if os.path.isfile(dxf_out):
-                    log_debug(f"Conversion successful via accoreconsole: {dxf_out}")
-                    return dxf_out
-                else:
-                    log_debug(f"dxf_out file was not generated: {dxf_out}")
-        except Exception as e:
-            log_debug(f"AutoCAD Core Console conversion failed with exception: {e}")
-
-    # ── Method 2: ODA File Converter ──────────────────────────────────────────
-    oda_candidates = [
-        r"C:\Program Files\ODA\ODAFileConverter\ODAFileConverter.exe",
-        r"C:\Program Files (x86)\ODA\ODAFileConverter\ODAFileConverter.exe",
-        shutil.which("ODAFileConverter"),
-    ]
-    oda_exe = next((p for p in oda_candidates if p and os.path.isfile(p)), None)
-
-    if oda_exe:
-        try:
-            in_dir = temp_in_dir if use_temp_paths else os.path.dirname(dwg_path)
-            fname = "input.dwg" if use_temp_paths else os.path.basename(dwg_path)
-            subprocess.run(
-                [oda_exe, in_dir, out_dir, "ACAD2018", "DXF", "0", "1", fname],
-                check=True, capture_output=True, timeout=60
-            )
-            if os.path.isfile(dxf_out):
-                print(f"[parse-cad] DWG→DXF via ODA: {dxf_out}")
-                return dxf_out
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"ODA conversion failed: {e.stderr.decode(errors='replace')}")
-
-    acad_error = None
-    # ── Method 3: AutoCAD COM (fallback if Core Console/ODA not available) ──
-    if sys.platform == "win32":
-        try:
-            import win32com.client
-            import pythoncom
-            pythoncom.CoInitialize()
-            try:
-                acad = win32com.client.GetActiveObject("AutoCAD.Application")
-            except Exception:
-                acad = win32com.client.Dispatch("AutoCAD.Application")
-                acad.Visible = False
 
-            # Open Read-Only to avoid locking issues if the user already has the file open
-            doc = acad.Documents.Open(os.path.abspath(active_dwg_path), True)
-            
-            # Suppress all dialogs and warnings (EXPERT=5 suppresses the custom objects version conflict dialog)
-            try:
-                doc.SetVariable("FILEDIA", 0)
-                doc.SetVariable("CMDDIA", 0)
-                doc.SetVariable("EXPERT", 5)
-                doc.SetVariable("PROXYGRAPHICS", 1)
-                doc.SetVariable("PROXYNOTICE", 0)
-            except Exception:
-                pass
+# Bump whenever _parse_dxf_file's output changes so cached parses are not reused
+CAD_PARSER_VERSION = 3
 
-            # Try saving as DXF using newer to older formats
-            # 65 = AC2018 DXF, 61 = AC2013 DXF, 49 = AC2010 DXF, 37 = AC2007 DXF, 13 = AC2000 DXF
-            saved = False
-            for fmt_code in [65, 61, 49, 37, 13]:
-                try:
-                    doc.SaveAs(os.path.abspath(dxf_out), fmt_code)
-                    saved = True
-                    break
-                except Exception:
-                    continue
-            
-            doc.Close(False)
+# Curve flattening: max distance (sagitta) between a curve and its chords, in drawing units
+DEFAULT_CHORD_TOLERANCE = 0.01
+MIN_CHORD_TOLERANCE = 0.0001  # output coordinates are rounded to 4 decimals
+MAX_ARC_SEGMENTS = 2048
+# INSERTs scaled up more than this are exploded directly: template vertices are rounded
+# in block units, so a large scale would magnify the rounding
+MAX_TEMPLATE_SCALE = 10.0
 
-            if saved and os.path.isfile(dxf_out):
-                print(f"[parse-cad] DWG→DXF via AutoCAD COM: {dxf_out}")
-                return dxf_out
-            else:
-                raise RuntimeError("AutoCAD rejected the save formats or the file was locked.")
-        except Exception as e:
-            acad_error = str(e)
-            print(f"[parse-cad] AutoCAD COM unavailable: {e}")
-
-    # ── No converter available ────────────────────────────────────────────────
-    error_msg = "Could not convert DWG file. "
-    if acad_error:
-        error_msg += f"\nAutoCAD Error: {acad_error}"
-    error_msg += "\n\nPlease either:\n• Keep AutoCAD OPEN on your computer while importing\n• OR Download the free ODA File Converter."
-    
-    raise RuntimeError(error_msg)
 
+def _arc_segment_count(radius, sweep, tolerance):
+    """
+    Chords needed to flatten an arc of `radius` spanning `sweep` radians so that no chord
+    is farther than `tolerance` from the arc (and at least one chord per 45 degrees).
+    """
+    sweep = abs(sweep)
+    minimum = max(1, math.ceil(sweep / (math.pi / 4) - 1e-9))
+    if radius <= tolerance:
+        return minimum
+    step = 2.0 * math.acos(1.0 - tolerance / radius)
+    return int(min(MAX_ARC_SEGMENTS, max(minimum, math.ceil(sweep / step))))
 
 
-def _parse_dxf_file(dxf_path: str) -> dict:
-    """Parse a DXF file and return entities + raw points."""
+def _parse_dxf_file(dxf_path: str, streaming: bool = False, tolerance: float = DEFAULT_CHORD_TOLERANCE,
+                    layers=None, types=None):
+    """
+    Parse a DXF file and return entities + raw points.
+    streaming=True is the low-memory mode for huge drawings: modelspace entities are
+    read one at a time (only layers and block definitions are loaded up front) and
+    the result is returned already serialized, as a spooled temp file of JSON (at offset 0).
+    tolerance is the chord tolerance for arcs, circles, ellipses and splines (drawing
+    units); the exact arc parameters are kept alongside the points in 'segments'.
+    layers / types: optional allow-lists of layer names and DXF entity types (case-insensitive).
+    Both apply to every entity, block and dimension contents included (blocks are only
+    expanded when INSERT is allowed); layer-0 block contents are judged by the INSERT's layer.
+    """
     try:
         # pyrefly: ignore [missing-import]
         import ezdxf
@@ -3345,14 +2870,35 @@ def _parse_dxf_file(dxf_path: str) -> dict:
         import sys
         raise RuntimeError(f"ezdxf library not installed or import failed. sys.path: {sys.path}, Error: {str(e)}")
 
-    try:
-        doc = ezdxf.readfile(dxf_path)
-    except Exception as e:
-        raise RuntimeError(f"Could not read DXF file: {e}")
+    model_stream = None
+    if streaming:
+        try:
+            doc, model_stream = open_modelspace_stream(dxf_path)
+        except Exception as e:
+            print(f"[parse-cad] Streaming read unavailable ({e}), loading whole document")
+    if model_stream is None:
+        try:
+            doc = ezdxf.readfile(dxf_path)
+        except Exception as e:
+            raise RuntimeError(f"Could not read DXF file: {e}")
 
-    entities = []
-    raw_points = []
+    entities = JsonArrayWriter() if streaming else []
+    raw_points = JsonArrayWriter() if streaming else []
     point_counter = [1]
+    tolerance = max(MIN_CHORD_TOLERANCE, float(tolerance))
+    layer_filter = {str(l).upper() for l in layers} if layers is not None else None
+    type_filter = {str(t).upper() for t in types} if types is not None else None
+    block_templates = {}       # (block name, chord tolerance, parcel layer?, allowed layer?) -> BlockTemplate / False
+    template_parcel = [False]  # while building a template: is the INSERT's layer a parcel layer?
+    template_allowed = [True]  # ... and is it an allowed layer?
+    template_depth = [0]
+
+    def layer_allowed(layer_name):
+        if layer_filter is None:
+            return True
+        if layer_name == BLOCK_LAYER:
+            return template_allowed[0]
+        return str(layer_name).upper() in layer_filter
 
     def add_raw_point(x, y, z=0):
         try:
@@ -3370,6 +2916,12 @@ def _parse_dxf_file(dxf_path: str) -> dict:
     def get_ent_color(entity, doc, override_layer=None):
         try:
             aci = entity.dxf.color
+            if template_depth[0]:
+                # Inside a block definition: ByBlock follows the INSERT, ByLayer on layer 0 its layer
+                if aci == 0:
+                    return BYBLOCK
+                if aci == 256 and (override_layer or getattr(entity.dxf, 'layer', '0')) == BLOCK_LAYER:
+                    return BYLAYER
             # aci 256 is 'ByLayer', aci 0 is 'ByBlock'
             if aci == 256 or aci == 0:
                 try:
@@ -3395,15 +2947,13 @@ def _parse_dxf_file(dxf_path: str) -> dict:
                 all_doc_layers.add(str(l.dxf.name).strip().upper())
     except Exception:
         pass
-    has_gis_layer = any(l == 'GIS' or 'GIS' in l for l in all_doc_layers)
+    # is_parcel_layer only needs to know whether any layer is a GIS layer; check that once
+    gis_layers = ('GIS',) if any('GIS' in l for l in all_doc_layers) else ()
 
     def is_parcel_boundary_layer(layer_name: str) -> bool:
-        if not layer_name:
-            return False
-        lu = str(layer_name).strip().upper()
-        if has_gis_layer:
-            return (lu == 'GIS' or 'GIS' in lu)
-        return any(k in lu for k in ['PARCEL', 'PLOT', 'TABU', 'QUSAI', 'QASIMA', 'BOUNDARY OF PARTITION'])
+        if layer_name == BLOCK_LAYER:
+            return template_parcel[0]
+        return is_parcel_layer(layer_name, gis_layers)
 
     def append_poly_or_explode(poly_type, closed, pts, segments_list, layer_name, color, filled=False):
         if not pts or len(pts) < 2:
@@ -3443,18 +2993,94 @@ def _parse_dxf_file(dxf_path: str) -> dict:
 
     # Only read from Layouts. Block instances (INSERT) in layouts will be exploded.
     # We do NOT read doc.blocks directly because that gives unscaled/unplaced definitions at origin!
+    # In streaming mode the modelspace is consumed straight from the file instead.
     all_entities = []
-    try:
-        for layout in doc.layouts:
-            all_entities.extend(list(layout))
-    except Exception as e:
-        print(f"[parse-cad] Warning reading layouts: {e}")
+    if model_stream is not None:
+        all_entities = model_stream
+    else:
+        try:
+            for layout in doc.layouts:
+                all_entities.extend(list(layout))
+        except Exception as e:
+            print(f"[parse-cad] Warning reading layouts: {e}")
+
+    layer_colors = {BLOCK_LAYER: BYLAYER}
+
+    def layer_color(layer_name):
+        """Colour of a ByLayer entity on layer_name (as get_ent_color resolves it)."""
+        if layer_name not in layer_colors:
+            color = None
+            try:
+                if layer_name in doc.layers:
+                    aci = doc.layers.get(layer_name).color
+                    if aci and 0 < aci < 256:
+                        r, g, b = ezdxf.colors.aci2rgb(aci)
+                        color = f"#{r:02x}{g:02x}{b:02x}"
+            except Exception:
+                pass
+            layer_colors[layer_name] = color
+        return layer_colors[layer_name]
+
+    def build_template(block_name, local_tolerance, parcel, allowed):
+        """Parse a block definition once, in block coordinates, into a BlockTemplate (False if unusable)."""
+        nonlocal entities, raw_points, tolerance
+        block = doc.blocks.get(block_name)
+        if block is None:
+            return False
+        saved = (entities, raw_points, tolerance, template_parcel[0], template_allowed[0], point_counter[0])
+        entities, raw_points, tolerance = [], [], local_tolerance
+        template_parcel[0], template_allowed[0] = parcel, allowed
+        template_depth[0] += 1
+        try:
+            for block_entity in block:
+                try:
+                    block_entity = block_entity.copy()  # process_entity re-layers layer-0 entities
+                except Exception:
+                    pass
+                process_entity(block_entity, parent_layer=BLOCK_LAYER)
+            return BlockTemplate(entities, [(p["x"], p["y"]) for p in raw_points])
+        except Exception as e:
+            print(f"[parse-cad] Block template for {block_name} failed: {e}")
+            return False
+        finally:
+            template_depth[0] -= 1
+            entities, raw_points, tolerance, template_parcel[0], template_allowed[0], point_counter[0] = saved
+
+    def expand_from_template(insert, ins_layer):
+        """Add an INSERT's geometry from its block template. False means explode it the slow way."""
+        try:
+            placements = list(insert.multi_insert()) if insert.mcount > 1 else [insert]
+            affines = [affine_2d(ins.matrix44()) for ins in placements]
+        except Exception:
+            return False
+        scale = max(max(math.hypot(*a[0]), math.hypot(*a[1])) for a, _ in affines)
+        if not 0 < scale <= MAX_TEMPLATE_SCALE:
+            return False
+        # Flatten in block units finely enough for this INSERT's scale (power-of-two steps
+        # so differently scaled INSERTs of a block share a handful of templates)
+        local = max(MIN_CHORD_TOLERANCE, tolerance / 2.0 ** math.ceil(math.log2(scale) - 1e-9))
+        key = (insert.dxf.name, local, is_parcel_boundary_layer(ins_layer), layer_allowed(ins_layer))
+        template = block_templates.get(key)
+        if template is None:
+            template = block_templates[key] = build_template(insert.dxf.name, local, key[2], key[3])
+        if template is False:
+            return False
+        block_color = get_ent_color(insert, doc, override_layer=ins_layer)
+        for affine in affines:
+            ents, raw = template.instantiate(affine, ins_layer, block_color, layer_color)
+            for ent in ents:
+                entities.append(ent)
+            for x, y in raw:
+                add_raw_point(x, y)
+        return True
 
     def process_entity(entity, parent_layer=None):
         try:
             etype = entity.dxftype()
         except:
             return
+        if type_filter is not None and etype not in type_filter:
+            return
 
         try:
             ent_layer = getattr(entity.dxf, 'layer', '0')
@@ -3462,14 +3088,18 @@ def _parse_dxf_file(dxf_path: str) -> dict:
                 entity.dxf.layer = parent_layer
         except Exception:
             pass
+        # INSERTs are expanded whatever their layer: their contents can sit on allowed layers
+        if layer_filter is not None and etype != "INSERT" and not layer_allowed(getattr(entity.dxf, 'layer', '0')):
+            return
 
         if etype == "INSERT":
             try:
                 ins_layer = getattr(entity.dxf, 'layer', '0')
                 if parent_layer and (not ins_layer or ins_layer == '0' or ins_layer.lower() == 'defpoints'):
                     ins_layer = parent_layer
-                for virt_ent in entity.virtual_entities():
-                    process_entity(virt_ent, parent_layer=ins_layer)
+                if not expand_from_template(entity, ins_layer):
+                    for virt_ent in entity.virtual_entities():
+                        process_entity(virt_ent, parent_layer=ins_layer)
                 if hasattr(entity, 'attribs'):
                     for attrib in entity.attribs:
                         process_entity(attrib, parent_layer=ins_layer)
@@ -3537,7 +3167,7 @@ def _parse_dxf_file(dxf_path: str) -> dict:
                                 if a_end <= a_start: a_end += 2 * math.pi
                             else:
                                 if a_end >= a_start: a_end -= 2 * math.pi
-                            steps = max(24, int(abs(theta) / math.radians(2)))
+                            steps = _arc_segment_count(r, theta, tolerance)
                             for si in range(1, steps):
                                 t = si / steps
                                 a = a_start + t * (a_end - a_start)
@@ -3583,7 +3213,7 @@ def _parse_dxf_file(dxf_path: str) -> dict:
                                 if a_end <= a_start: a_end += 2 * math.pi
                             else:
                                 if a_end >= a_start: a_end -= 2 * math.pi
-                            steps2 = max(24, int(abs(theta) / math.radians(2)))
+                            steps2 = _arc_segment_count(r2, theta, tolerance)
                             for si2 in range(1, steps2):
                                 t2 = si2 / steps2
                                 a2 = a_start + t2 * (a_end - a_start)
@@ -3625,7 +3255,7 @@ def _parse_dxf_file(dxf_path: str) -> dict:
                     end_angle += 2 * math.pi
                     
                 points = []
-                steps = 16
+                steps = _arc_segment_count(radius, end_angle - start_angle, tolerance)
                 for i in range(steps + 1):
                     angle = start_angle + (end_angle - start_angle) * (i / steps)
                     px = center.x + radius * math.cos(angle)
@@ -3636,6 +3266,9 @@ def _parse_dxf_file(dxf_path: str) -> dict:
                     "type": "ARC",
                     "closed": False,
                     "points": points,
+                    "segments": [{"type": "arc", "cx": round(float(center.x), 6), "cy": round(float(center.y), 6),
+                                  "r": round(float(radius), 6), "startAngle": round(start_angle, 8),
+                                  "endAngle": round(end_angle, 8), "ccw": True}],
                     "layer": entity.dxf.layer,
                     "color": get_ent_color(entity, doc)
                 })
@@ -3647,7 +3280,7 @@ def _parse_dxf_file(dxf_path: str) -> dict:
                 center = entity.dxf.center
                 radius = entity.dxf.radius
                 points = []
-                steps = 32
+                steps = _arc_segment_count(radius, 2 * math.pi, tolerance)
                 for i in range(steps):
                     angle = 2 * math.pi * (i / steps)
                     px = center.x + radius * math.cos(angle)
@@ -3659,6 +3292,9 @@ def _parse_dxf_file(dxf_path: str) -> dict:
                     "type": "CIRCLE",
                     "closed": True,
                     "points": points,
+                    "segments": [{"type": "arc", "cx": round(float(center.x), 6), "cy": round(float(center.y), 6),
+                                  "r": round(float(radius), 6), "startAngle": 0.0,
+                                  "endAngle": round(2 * math.pi, 8), "ccw": True}],
                     "layer": entity.dxf.layer,
                     "color": get_ent_color(entity, doc)
                 })
@@ -3670,7 +3306,7 @@ def _parse_dxf_file(dxf_path: str) -> dict:
                 from ezdxf import path as ezdxf_path
                 sp = ezdxf_path.make_path(entity)
                 pts = []
-                for vertex in sp.flattening(0.1):
+                for vertex in sp.flattening(tolerance):
                     pts.append({"x": round(float(vertex.x), 4), "y": round(float(vertex.y), 4)})
                 if len(pts) >= 2:
                     append_poly_or_explode("LWPOLYLINE", bool(entity.closed), pts, None, entity.dxf.layer, get_ent_color(entity, doc))
@@ -3682,8 +3318,8 @@ def _parse_dxf_file(dxf_path: str) -> dict:
                 loc = entity.dxf.location
                 add_raw_point(loc.x, loc.y)
                 # Also add as a small drawable circle so it's visible on canvas
-                steps = 8
                 radius = 0.05 # Small point indicator
+                steps = _arc_segment_count(radius, 2 * math.pi, tolerance)
                 pts = []
                 for i in range(steps):
                     angle = 2 * math.pi * (i / steps)
@@ -3691,13 +3327,16 @@ def _parse_dxf_file(dxf_path: str) -> dict:
                     py = loc.y + radius * math.sin(angle)
                     pts.append({"x": round(float(px), 4), "y": round(float(py), 4)})
                 pts.append(pts[0])
-                entities.append({
+                marker = {
                     "type": "CIRCLE",
                     "closed": True,
                     "points": pts,
                     "layer": entity.dxf.layer,
                     "color": get_ent_color(entity, doc)
-                })
+                }
+                if template_depth[0]:
+                    marker[POINT_MARKER] = (float(loc.x), float(loc.y))  # INSERTs move it, never scale it
+                entities.append(marker)
             except Exception:
                 pass
 
@@ -3818,26 +3457,11 @@ def _parse_dxf_file(dxf_path: str) -> dict:
 
         elif etype == "ELLIPSE":
             try:
-                cx = float(entity.dxf.center.x)
-                cy = float(entity.dxf.center.y)
-                # major axis vector
-                mx = float(entity.dxf.major_axis.x)
-                my = float(entity.dxf.major_axis.y)
-                major = math.hypot(mx, my)
-                ratio = float(entity.dxf.ratio)  # minor/major
-                minor = major * ratio
-                rotation = math.atan2(my, mx)
                 start_param = float(entity.dxf.get('start_param', 0))
                 end_param = float(entity.dxf.get('end_param', math.pi * 2))
-                steps = max(36, int(abs(end_param - start_param) * 18))
-                pts = []
-                for i in range(steps + 1):
-                    t = start_param + (end_param - start_param) * i / steps
-                    lx = math.cos(t) * major
-                    ly = math.sin(t) * minor
-                    rx = lx * math.cos(rotation) - ly * math.sin(rotation)
-                    ry = lx * math.sin(rotation) + ly * math.cos(rotation)
-                    pts.append({"x": round(cx + rx, 4), "y": round(cy + ry, 4)})
+                # Adaptive flattening: subdivides until every chord is within tolerance
+                pts = [{"x": round(float(v.x), 4), "y": round(float(v.y), 4)}
+                       for v in entity.flattening(tolerance)]
                 closed = abs(end_param - start_param) >= math.pi * 2 - 0.01
                 if len(pts) >= 2:
                     append_poly_or_explode("LWPOLYLINE", closed, pts, None, entity.dxf.layer, get_ent_color(entity, doc))
@@ -3911,14 +3535,297 @@ def _parse_dxf_file(dxf_path: str) -> dict:
         except Exception:
             pass
 
+    if streaming:
+        out = spooled_file()
+        out.write(b'{"entities":')
+        entities.write_to(out)
+        out.write(b',"raw_points":')
+        raw_points.write_to(out)
+        out.write(b',"layers":' + json.dumps(layers_data, ensure_ascii=False).encode('utf-8') + b'}')
+        out.seek(0)
+        return out
     return {"entities": entities, "raw_points": raw_points, "layers": layers_data}
 
 
+def _scan_dxf_layers(dxf_path: str, streaming: bool = False):
+    """
+    layersOnly mode: the layer table plus, per layer, how many drawing entities sit on it
+    (in total and by DXF type) and their extents [minx, miny, maxx, maxy] - without
+    exploding blocks or tessellating anything. INSERTs count once on their own layer;
+    extents come from defining points (circles/arcs as their full circle, ezdxf's fast
+    bounding box for anything else) and each block definition is measured only once.
+    """
+    import ezdxf
+    from ezdxf import bbox
+
+    model_stream = None
+    if streaming:
+        try:
+            doc, model_stream = open_modelspace_stream(dxf_path)
+        except Exception as e:
+            print(f"[parse-cad] Streaming read unavailable ({e}), loading whole document")
+    if model_stream is None:
+        try:
+            doc = ezdxf.readfile(dxf_path)
+        except Exception as e:
+            raise RuntimeError(f"Could not read DXF file: {e}")
+        model_stream = (entity for layout in doc.layouts for entity in layout)
+
+    block_boxes = {}
+
+    def block_box(name):
+        if name not in block_boxes:
+            block_boxes[name] = None  # guards against self-referencing blocks
+            box = None
+            try:
+                block = doc.blocks.get(name)
+                if block is not None:
+                    xs, ys = [], []
+                    for child in block:
+                        if child.dxftype() in ("ATTDEF",):
+                            continue
+                        for v in entity_points(child, child.dxftype()):
+                            xs.append(float(v[0]))
+                            ys.append(float(v[1]))
+                    if xs:
+                        box = [(min(xs), min(ys)), (max(xs), min(ys)), (max(xs), max(ys)), (min(xs), max(ys))]
+            except Exception:
+                pass
+            block_boxes[name] = box
+        return block_boxes[name]
+
+    def entity_points(entity, etype):
+        dxf = entity.dxf
+        if etype == "INSERT":
+            corners = block_box(dxf.name)
+            if corners is None:
+                return []
+            placements = entity.multi_insert() if entity.mcount > 1 else [entity]
+            return [v for ins in placements for v in ins.matrix44().transform_vertices(corners)]
+        if etype == "DIMENSION" and dxf.hasattr('geometry'):
+            return block_box(dxf.geometry) or []  # rendered dimension blocks are already in WCS
+        if etype == "LINE":
+            return [dxf.start, dxf.end]
+        if dxf.extrusion == (0, 0, 1):  # cheap cases; anything else goes through ezdxf.bbox
+            if etype == "LWPOLYLINE" and not any(entity.get_points('b')):
+                return list(entity.get_points('xy'))
+            if etype in ("TEXT", "ATTRIB"):
+                return [dxf.insert]
+            if etype == "POINT":
+                return [dxf.location]
+            if etype in ("CIRCLE", "ARC"):
+                c, r = dxf.center, dxf.radius
+                return [(c.x - r, c.y - r), (c.x + r, c.y + r)]
+        ext = bbox.extents([entity], fast=True)
+        return [ext.extmin, ext.extmax] if ext.has_data else []
+
+    stats = {}
+    total = 0
+    for entity in model_stream:
+        try:
+            etype = entity.dxftype()
+            layer_name = str(getattr(entity.dxf, 'layer', '0'))
+        except Exception:
+            continue
+        entry = stats.setdefault(layer_name.upper(), {"name": layer_name, "entityCount": 0, "types": {}, "extents": None})
+        entry["entityCount"] += 1
+        entry["types"][etype] = entry["types"].get(etype, 0) + 1
+        total += 1
+        try:
+            pts = entity_points(entity, etype)
+        except Exception:
+            pts = []
+        for v in pts:
+            x, y = float(v[0]), float(v[1])
+            if not (math.isfinite(x) and math.isfinite(y)):
+                continue
+            ext = entry["extents"]
+            if ext is None:
+                entry["extents"] = [x, y, x, y]
+            else:
+                ext[0], ext[1], ext[2], ext[3] = min(ext[0], x), min(ext[1], y), max(ext[2], x), max(ext[3], y)
+
+    layers_data = []
+    for layer in doc.layers:
+        try:
+            entry = stats.pop(str(layer.dxf.name).upper(), None) or {"entityCount": 0, "types": {}, "extents": None}
+            layers_data.append({
+                "name": layer.dxf.name,
+                "color": layer.color,
+                "is_off": layer.is_off(),
+                "is_frozen": layer.is_frozen(),
+                "visible": not layer.is_off() and not layer.is_frozen(),
+                "entityCount": entry["entityCount"],
+                "types": entry["types"],
+                "extents": [round(v, 4) for v in entry["extents"]] if entry["extents"] else None,
+            })
+        except Exception:
+            pass
+    # Entities on layers missing from the layer table
+    for entry in stats.values():
+        layers_data.append(dict(entry, color=7, is_off=False, is_frozen=False, visible=True,
+                                extents=[round(v, 4) for v in entry["extents"]] if entry["extents"] else None))
+
+    boxes = [l["extents"] for l in layers_data if l["extents"]]
+    extents = [min(b[0] for b in boxes), min(b[1] for b in boxes),
+               max(b[2] for b in boxes), max(b[3] for b in boxes)] if boxes else None
+    return {"layers": layers_data, "entityCount": total, "extents": extents, "layersOnly": True}
+
+class CadConversionError(RuntimeError):
+    """DWG could not be converted to DXF (no working converter)."""
+
+
+def _cad_parse_options(data):
+    """
+    Parse options from a parse-cad style request body (only non-defaults, so they key the cache).
+    Raises ValueError for an unusable chordTolerance, snapTolerance or allow-list.
+    """
+    def names(key):
+        values = data.get(key)
+        if values is None:
+            return None
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            raise ValueError(f"{key} must be a list of names")
+        # DXF layer names and entity types are case-insensitive
+        return sorted({v.strip().upper() for v in values})
+
+    options = {}
+    if data.get('streaming'):
+        options['streaming'] = True
+    if data.get('layersOnly'):
+        options['layersOnly'] = True
+    for key in ('layers', 'types'):
+        values = names(key)
+        if values is not None:
+            options[key] = values
+    if data.get('polygonize'):
+        snap = float(data.get('snapTolerance', DEFAULT_SNAP_TOLERANCE))
+        if not math.isfinite(snap) or snap <= 0:
+            raise ValueError("snapTolerance must be a positive number (drawing units)")
+        options['polygonize'] = {'tolerance': snap, 'layers': names('polygonizeLayers')}
+    if data.get('chordTolerance') is not None:
+        tolerance = float(data['chordTolerance'])
+        if not math.isfinite(tolerance) or tolerance <= 0:
+            raise ValueError("chordTolerance must be a positive number (drawing units)")
+        if tolerance != DEFAULT_CHORD_TOLERANCE:
+            options['tolerance'] = max(MIN_CHORD_TOLERANCE, tolerance)
+    return options
+
+
+def _parse_cad_source(file_path, options):
+    """
+    Uncached parse of a .dxf / .dwg for _parsed_cad_json / _parsed_cad_chunks: a JSON-able
+    result, or for a streaming parse without polygonize a spooled JSON file (see _parse_dxf_file).
+    """
+    with ExitStack() as stack:
+        if os.path.splitext(file_path)[1].lower() == ".dwg":
+            try:
+                dxf_path = stack.enter_context(_converted_dxf(file_path))
+            except RuntimeError as e:
+                raise CadConversionError(str(e)) from e
+        else:
+            dxf_path = file_path
+        if options.get('layersOnly'):
+            return _scan_dxf_layers(dxf_path, streaming=bool(options.get('streaming')))
+        result = _parse_dxf_file(dxf_path, streaming=bool(options.get('streaming')),
+                                 tolerance=options.get('tolerance', DEFAULT_CHORD_TOLERANCE),
+                                 layers=options.get('layers'), types=options.get('types'))
+    if options.get('polygonize'):
+        if not isinstance(result, dict):
+            with result:
+                result = json.load(result)
+        result = _polygonize_result(result, **options['polygonize'])
+    return result
+
+
+def _parsed_cad_json(file_path, options=None):
+    """
+    Parse result for a .dxf / .dwg as JSON bytes, through the content-addressed cache.
+    options: {'streaming': True} for the low-memory parse, {'tolerance': t} for a non-default
+    chord tolerance, 'layers' / 'types' allow-lists, {'layersOnly': True} for the layer
+    summary only, {'polygonize': {...}} to add the faces of the loose line work as closed
+    parcels (see _parse_dxf_file, _scan_dxf_layers, _polygonize_result and _cad_parse_options).
+    """
+    options = options or {}
+    cache_key = cad_cache.key(file_path, CAD_PARSER_VERSION, options or None)
+    body = cad_cache.get(cache_key)
+    if body is not None:
+        print(f"[parse-cad] Cache hit for {os.path.basename(file_path)}")
+        return body
+
+    result = _parse_cad_source(file_path, options)
+    if not isinstance(result, (dict, list)):
+        with result:
+            result = result.read()
+    return cad_cache.put(cache_key, result)
+
+
+def _parsed_cad_chunks(file_path, options=None):
+    """
+    _parsed_cad_json as an iterator of JSON byte chunks, for the parse-cad response. Streaming
+    parses go from their spooled output to the disk cache and the response without ever being
+    held whole in memory. Parsing (and any error) happens before this returns.
+    """
+    options = options or {}
+    if not options.get('streaming'):
+        return iter([_parsed_cad_json(file_path, options)])
+    cache_key = cad_cache.key(file_path, CAD_PARSER_VERSION, options)
+    chunks = cad_cache.iter_chunks(cache_key)
+    if chunks is not None:
+        print(f"[parse-cad] Cache hit for {os.path.basename(file_path)}")
+        return chunks
+
+    result = _parse_cad_source(file_path, options)
+    if isinstance(result, (dict, list)):
+        return iter([cad_cache.put(cache_key, result)])
+    cad_cache.put_file(cache_key, result)
+    return iter_file(result)
+
+
+def _polygonize_result(result, tolerance=DEFAULT_SNAP_TOLERANCE, layers=None):
+    """
+    Append closed LWPOLYLINEs ('polygonized': True) for the faces formed by the open LINE /
+    polyline work on `layers` (default: the parcel layers), see cad_polygonize.
+    """
+    if layers:
+        wanted = set(layers)
+        layer_ok = lambda name: str(name or '').strip().upper() in wanted
+    else:
+        layer_names = [l.get('name', '') for l in result.get('layers') or []]
+        layer_ok = lambda name: is_parcel_layer(name, layer_names)
+    started = time.time()
+    faces = polygonize_entities(result['entities'], layer_ok, tolerance)
+    result['entities'].extend(faces)
+    print(f"[parse-cad] Polygonized {len(faces)} faces ({time.time() - started:.2f}s)")
+    return result
+
+
+def _parsed_cad_wire(file_path, options=None):
+    """Columnar wire-format body (see cad_wire) for a drawing, cached like the JSON."""
+    options = options or {}
+    cache_key = cad_cache.key(file_path, CAD_PARSER_VERSION, dict(options, format='columnar'))
+    body = cad_cache.get(cache_key)
+    if body is None:
+        result = json.loads(_parsed_cad_json(file_path, options))
+        body = cad_cache.put(cache_key, cad_wire.encode_result(result))
+    return body
+
+
 @app.route('/api/parse-cad', methods=['POST'])
 def parse_cad():
     """
     Parse a DXF or DWG file and return drawable entities.
-    Body: { "filePath": "C:\\path\\to\\file.dxf" }
+    Body: { "filePath": "C:\\path\\to\\file.dxf", "streaming": false, "chordTolerance": 0.01,
+            "layers": ["GIS", "NUM"], "types": ["LWPOLYLINE", "TEXT"], "layersOnly": false, "format": "json" }
+    streaming: low-memory mode for huge drawings (modelspace only, read entity by entity)
+    chordTolerance: max chord-to-curve distance when flattening arcs, circles, ellipses and splines
+    layers / types: only parse entities on these layers / of these DXF types (INSERT must be
+        listed for block contents to be included)
+    layersOnly: skip the geometry, return the layer table with per-layer entity counts and extents
+    polygonize: also return the faces of the loose line work as closed polylines flagged
+        'polygonized' (snapTolerance: endpoint snap distance, default 0.001;
+        polygonizeLayers: layers to use, default the parcel layers)
+    format: "json" (default) or "columnar" - binary typed-array buffer, see cad_wire.py
     """
     try:
         data = request.get_json()
@@ -3931,26 +3838,36 @@ def parse_cad():
             return jsonify({"error": f"File not found: {file_path}"}), 404
 
         ext = os.path.splitext(file_path)[1].lower()
-
-        if ext == ".dwg":
-            try:
-                dxf_path = _convert_dwg_to_dxf(file_path)
-            except RuntimeError as e:
-                import traceback
-                print(f"[parse-cad ERROR] DWG conversion failed: {e}")
-                traceback.print_exc()
-                return jsonify({"error": str(e), "oda_required": True}), 422
-        elif ext == ".dxf":
-            dxf_path = file_path
-        else:
+        if ext not in (".dxf", ".dwg"):
             return jsonify({"error": "Only .dxf and .dwg files are supported"}), 400
 
-        result = _parse_dxf_file(dxf_path)
-        result["fileName"] = os.path.basename(file_path)
-        result["fileType"] = ext.lstrip(".")
-
-        return jsonify(result)
-
+        try:
+            options = _cad_parse_options(data)
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": str(e)}), 400
+        meta = {"fileName": os.path.basename(file_path), "fileType": ext.lstrip(".")}
+
+        if data.get('format') == 'columnar' and not options.get('layersOnly'):
+            return Response(cad_wire.frame(_parsed_cad_wire(file_path, options), meta),
+                            mimetype=cad_wire.MIME_TYPE)
+
+        # Unchanged drawings (same bytes, same parser) come straight from the cache;
+        # splice the per-request fields onto the cached JSON object instead of re-serializing it
+        chunks = _parsed_cad_chunks(file_path, options)
+        header = json.dumps(meta, ensure_ascii=False)[:-1].encode('utf-8') + b','
+
+        def body():
+            first = True
+            for chunk in chunks:
+                yield header + chunk[1:] if first else chunk
+                first = False
+        return Response(body(), mimetype='application/json')
+
+    except CadConversionError as e:
+        import traceback
+        print(f"[parse-cad ERROR] DWG conversion failed: {e}")
+        traceback.print_exc()
+        return jsonify({"error": str(e), "oda_required": True}), 422
     except RuntimeError as e:
         import traceback
         print(f"[parse-cad ERROR] RuntimeError: {e}")
@@ -3961,12 +3878,158 @@ def parse_cad():
         return jsonify({"error": f"Unexpected error: {e}"}), 500
 
 
-if __name__ == '__main__':
+
+def _cad_tile_pyramid(drawing_id):
+    """Pyramid for a drawing ID from /api/cad/tiles/build, rebuilt from the parse cache if evicted."""
+    pyramid = cad_tiles.get(drawing_id)
+    if pyramid is None:
+        source = cad_tiles.source(drawing_id)
+        if source is None or not os.path.isfile(source[0]):
+            return None
+        file_path, options = source
+        pyramid = cad_tiles.put(drawing_id, CadTilePyramid(json.loads(_parsed_cad_json(file_path, options))), source)
+    return pyramid
+
+
+@app.route('/api/cad/tiles/build', methods=['POST'])
+def build_cad_tiles():
+    """
+    Build (or reuse) the level-of-detail tile pyramid for a drawing.
+    Body: { "filePath": "C:\\path\\to\\file.dxf", "streaming": false, "chordTolerance": 0.01 }
+    Returns { drawingId, bounds, origin, side, maxZoom, tileSize, entityCount } for /api/cad/tiles.
+    """
+    try:
+        data = request.get_json() or {}
+        file_path = (data.get('filePath') or '').strip()
+        if not file_path:
+            return jsonify({"error": "filePath is required"}), 400
+        if not os.path.isfile(file_path):
+            return jsonify({"error": f"File not found: {file_path}"}), 404
+        if os.path.splitext(file_path)[1].lower() not in (".dxf", ".dwg"):
+            return jsonify({"error": "Only .dxf and .dwg files are supported"}), 400
+
+        try:
+            options = _cad_parse_options(data)
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": str(e)}), 400
+        options.pop('layersOnly', None)
+        drawing_id = cad_cache.key(file_path, CAD_PARSER_VERSION, dict(options, format='tiles'))
+        pyramid = cad_tiles.get(drawing_id)
+        if pyramid is None:
+            started = time.time()
+            pyramid = cad_tiles.put(drawing_id, CadTilePyramid(json.loads(_parsed_cad_json(file_path, options))),
+                                    (file_path, options))
+            print(f"[CAD Tiles] Built pyramid for {os.path.basename(file_path)}: "
+                  f"{len(pyramid.entities)} entities, max zoom {pyramid.max_zoom} ({time.time() - started:.2f}s)")
+        return jsonify(dict(pyramid.info(), drawingId=drawing_id))
+
+    except CadConversionError as e:
+        return jsonify({"error": str(e), "oda_required": True}), 422
+    except Exception as e:
+        print(f"[CAD Tiles ERROR] {e}")
+        return jsonify({"error": f"Unexpected error: {e}"}), 500
+
+
+@app.route('/api/cad/tiles', methods=['GET'])
+def get_cad_tile():
+    """
+    One tile of a built pyramid: /api/cad/tiles?id=<drawingId>&z=&x=&y=
+    Entities carry their index in the parse-cad response as 'i' and simplified
+    geometry as flat 'coords' [x0, y0, x1, y1, ...]; an entity appears in every tile it touches.
+    """
+    try:
+        pyramid = _cad_tile_pyramid(request.args.get('id', ''))
+        if pyramid is None:
+            return jsonify({"error": "Unknown drawing, build its tiles first"}), 404
+        try:
+            z, x, y = (int(request.args[k]) for k in ('z', 'x', 'y'))
+        except (KeyError, ValueError):
+            return jsonify({"error": "z, x and y must be integers"}), 400
+        try:
+            tile = pyramid.tile(z, x, y)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        return jsonify(tile)
+    except Exception as e:
+        print(f"[CAD Tiles ERROR] {e}")
+        return jsonify({"error": f"Unexpected error: {e}"}), 500
+
+
+@app.route('/api/cad/hit', methods=['GET'])
+def hit_test_cad():
+    """
+    Nearest-entity query: /api/cad/hit?id=<drawingId>&x=&y=&radius=[&limit=]
+    (world units). Returns { hits: [{ i, distance, inside }] }, nearest first.
+    """
+    try:
+        pyramid = _cad_tile_pyramid(request.args.get('id', ''))
+        if pyramid is None:
+            return jsonify({"error": "Unknown drawing, build its tiles first"}), 404
+        try:
+            x, y, radius = (float(request.args[k]) for k in ('x', 'y', 'radius'))
+            limit = int(request.args.get('limit', 8))
+        except (KeyError, ValueError):
+            return jsonify({"error": "x, y and radius must be numbers"}), 400
+        return jsonify({"hits": pyramid.nearest(x, y, max(radius, 0.0), limit)})
+    except Exception as e:
+        print(f"[CAD Tiles ERROR] {e}")
+        return jsonify({"error": f"Unexpected error: {e}"}), 500
+
+
+@app.route('/api/cad/parcels', methods=['POST'])
+def detect_cad_parcels():
+    """
+    Detect every parcel on a drawing's parcel layers and match its corners to point-number labels.
+    Body: { "filePath": "C:\\path\\to\\file.dxf", "pointIds": ["101", "102"], "entityIndex": 12,
+            "streaming": false, "chordTolerance": 0.01 }
+    pointIds: IDs already in the points file; their corners come back as 'matched'
+    entityIndex: only detect the parcel of this entity (the "Create Parcel" dialog)
+    Returns { parcels: [{ entityIndex, layer, number, area, perimeter, points: [...] }], count }
+    """
+    try:
+        data = request.get_json() or {}
+        file_path = (data.get('filePath') or '').strip()
+        if not file_path:
+            return jsonify({"error": "filePath is required"}), 400
+        if not os.path.isfile(file_path):
+            return jsonify({"error": f"File not found: {file_path}"}), 404
+        if os.path.splitext(file_path)[1].lower() not in (".dxf", ".dwg"):
+            return jsonify({"error": "Only .dxf and .dwg files are supported"}), 400
+        point_ids = data.get('pointIds') or []
+        if not isinstance(point_ids, list):
+            return jsonify({"error": "pointIds must be a list"}), 400
+        entity_index = data.get('entityIndex')
+        if entity_index is not None and (not isinstance(entity_index, int) or isinstance(entity_index, bool)):
+            return jsonify({"error": "entityIndex must be an integer"}), 400
+
+        try:
+            options = _cad_parse_options(data)
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": str(e)}), 400
+        options.pop('layersOnly', None)
+        started = time.time()
+        parcels = ParcelDetector(json.loads(_parsed_cad_json(file_path, options))).detect(
+            [str(p) for p in point_ids], None if entity_index is None else [entity_index])
+        print(f"[CAD Parcels] {len(parcels)} parcels in {os.path.basename(file_path)} ({time.time() - started:.2f}s)")
+        return jsonify({"parcels": parcels, "count": len(parcels)})
+
+    except CadConversionError as e:
+        return jsonify({"error": str(e), "oda_required": True}), 422
+    except Exception as e:
+        print(f"[CAD Parcels ERROR] {e}")
+        return jsonify({"error": f"Unexpected error: {e}"}), 500
+
+def main():
+    """Run the API server (started through server.py, see there)."""
     print("==> Starting Parcel Tools Backend API...")
     print("==> API running on http://127.0.0.1:5000")
     print(f"==> Concurrent worker pool initialized ({MAX_CONCURRENT_WORKERS} workers)")
     print("==> Ready to accept simultaneous connections from Electron app")
+    filename_index.start()
     app.run(host='127.0.0.1', port=5000, debug=False, use_reloader=False, threaded=True)
 
 
-
+if __name__ == '__main__':
+    import multiprocessing
+    multiprocessing.freeze_support()  # PDF report workers re-launch this executable when frozen
+    main()
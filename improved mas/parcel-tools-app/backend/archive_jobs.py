@@ -0,0 +1,199 @@
+"""
+Archive Jobs for Parcel Tools
+Zip archives are built as background jobs: the request gets a job ID back at once,
+the archive is written on a runner thread, and its progress (files done, bytes read
+and written) can be polled or the job cancelled. Jobs writing the same output path
+are chained and run one after another (the next one is handed to the runner when the
+previous one finishes, so they never hold a runner thread while they wait); jobs for
+different outputs run side by side.
+"""
+
+import os
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+FINISHED_STATES = ('done', 'failed', 'cancelled')
+
+
+class JobCancelled(Exception):
+    """Raised inside a job's work (from its progress callbacks) once the job is cancelled."""
+
+
+class ArchiveJob:
+    """
+    One archive build. status: queued -> waiting (for its output path) -> running ->
+    done | failed | cancelled. Counters are updated from worker threads.
+    """
+
+    def __init__(self, kind, output_path, files_total):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.output_path = output_path
+        self.files_total = files_total
+        self.files_done = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.errors = []
+        self.status = 'queued'
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def check(self):
+        """Raise JobCancelled if the job was cancelled; work calls this between steps."""
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def add_bytes_in(self, count):
+        self.check()
+        with self._lock:
+            self.bytes_in += count
+
+    def file_done(self, bytes_out):
+        with self._lock:
+            self.files_done += 1
+            self.bytes_out = bytes_out
+
+    def cancel(self):
+        """Request cancellation; False if the job had already finished."""
+        if self._done.is_set():
+            return False
+        self._cancel.set()
+        return True
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def snapshot(self):
+        with self._lock:
+            end = self.finished or time.time()
+            return {
+                'jobId': self.id,
+                'kind': self.kind,
+                'status': self.status,
+                'outputPath': self.output_path,
+                'filesTotal': self.files_total,
+                'filesDone': self.files_done,
+                'bytesIn': self.bytes_in,
+                'bytesOut': self.bytes_out,
+                'errors': list(self.errors),
+                'error': self.error,
+                'result': self.result,
+                'elapsedMs': int((end - (self.started or end)) * 1000),
+            }
+
+
+class ArchiveJobManager:
+    """
+    Runs archive jobs on its own runner threads (so they never wait on the compression
+    pool they feed), one job per output path at a time: later jobs for a busy path wait
+    in that path's chain, not on a runner thread. Keeps the last keep_finished finished
+    jobs for status queries.
+    """
+
+    def __init__(self, max_running=8, keep_finished=100):
+        self.keep_finished = keep_finished
+        self._runner = ThreadPoolExecutor(max_workers=max_running, thread_name_prefix='ArchiveJob')
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()
+        self._chains = {}  # normalized output path -> deque of (job, work) waiting behind the running one
+
+    def submit(self, kind, output_path, files_total, work):
+        """Queue work(job) -> result dict for output_path and return the ArchiveJob."""
+        job = ArchiveJob(kind, output_path, files_total)
+        key = os.path.normcase(os.path.abspath(output_path))
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+            chain = self._chains.get(key)
+            if chain is not None:
+                job.status = 'waiting'
+                chain.append((job, work))
+                return job
+            self._chains[key] = deque()
+        self._runner.submit(self._run, key, job, work)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self, active_only=False):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [j.snapshot() for j in jobs if not (active_only and j.status in FINISHED_STATES)]
+
+    def cancel(self, job_id):
+        """Cancel a job; returns the job (None if unknown)."""
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+        return job
+
+    def shutdown(self):
+        with self._lock:
+            jobs = list(self._jobs.values())
+            waiting = [job for chain in self._chains.values() for job, _ in chain]
+            for chain in self._chains.values():
+                chain.clear()
+        for job in jobs:
+            job.cancel()
+        for job in waiting:
+            job.status = 'cancelled'
+            job.finished = time.time()
+            job._done.set()
+        self._runner.shutdown(wait=False, cancel_futures=True)
+
+    def _prune(self):
+        finished = [k for k, j in self._jobs.items() if j.status in FINISHED_STATES]
+        for key in finished[:max(0, len(finished) - self.keep_finished)]:
+            del self._jobs[key]
+
+    def _next(self, key):
+        """Hand the next job chained on `key` to the runner, or drop the chain if there is none."""
+        with self._lock:
+            chain = self._chains.get(key)
+            if not chain:
+                self._chains.pop(key, None)
+                return
+            job, work = chain.popleft()
+        self._runner.submit(self._run, key, job, work)
+
+    def _run(self, key, job, work):
+        try:
+            if job.cancelled:
+                raise JobCancelled()
+            job.status = 'running'
+            job.started = time.time()
+            result = work(job)
+            with job._lock:
+                job.result = result
+                job.status = 'done'
+        except JobCancelled:
+            job.status = 'cancelled'
+        except Exception as e:
+            traceback.print_exc()
+            job.error = str(e)
+            job.status = 'failed'
+        finally:
+            job.finished = time.time()
+            print(f'[Archive] Job {job.id[:8]} {job.kind} {job.status}: {job.files_done}/{job.files_total} files')
+            try:
+                self._next(key)
+            except RuntimeError:
+                pass  # runner shut down
+            # Signalled last: whoever waits on the job sees its chain already advanced or dropped
+            job._done.set()
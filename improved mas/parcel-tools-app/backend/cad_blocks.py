@@ -0,0 +1,115 @@
+"""
+Block Templates for Parcel Tools
+A block definition is parsed once, in block coordinates, into a template; every INSERT
+of it is then one vectorized affine transform of the template's vertices instead of a
+fresh virtual_entities() explosion. Template entities keep placeholders for whatever
+depends on the INSERT: BLOCK_LAYER for entities drawn on layer 0 (they take the
+INSERT's layer), BYLAYER for a colour that follows that layer and BYBLOCK for a colour
+that comes from the INSERT itself. POINT marker glyphs (tagged with POINT_MARKER) are
+moved to the transformed point but keep their size.
+"""
+
+import math
+
+import numpy as np
+
+BLOCK_LAYER = '__BLOCK_LAYER_0__'
+BYLAYER = '\x00bylayer'
+BYBLOCK = '\x00byblock'
+POINT_MARKER = '\x00marker'
+
+
+def affine_2d(matrix):
+    """(A, t) with row vectors [x, y] @ A + t equal to an ezdxf Matrix44 in the XY plane."""
+    ux, uy, origin = matrix.get_row(0), matrix.get_row(1), matrix.get_row(3)
+    return np.array([[ux[0], ux[1]], [uy[0], uy[1]]], dtype=np.float64), np.array([origin[0], origin[1]])
+
+
+def _similarity(a):
+    """(scale, rotation radians, mirrored) if A keeps circles circular, else None."""
+    (a00, a01), (a10, a11) = a.tolist()
+    sx, sy = math.hypot(a00, a01), math.hypot(a10, a11)
+    if sx == 0 or abs(sx - sy) > 1e-9 * max(sx, sy) or abs(a00 * a10 + a01 * a11) > 1e-9 * sx * sy:
+        return None
+    return sx, math.atan2(a01, a00), a00 * a11 - a01 * a10 < 0
+
+
+class BlockTemplate:
+    """Parse output of one block definition: entity dicts plus their vertices as one array."""
+
+    def __init__(self, entities, raw_points):
+        self.entities = entities
+        counts = [len(e.get('points') or ()) for e in entities]
+        self.offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        self.coords = np.array([[p['x'], p['y']] for e in entities for p in e.get('points') or ()],
+                               dtype=np.float64).reshape(-1, 2)
+        self.raw_points = np.array(raw_points, dtype=np.float64).reshape(-1, 2)
+
+    def instantiate(self, affine, layer, block_color, layer_color):
+        """
+        Entities (new dicts) and raw point (x, y) pairs for one INSERT.
+        affine: (A, t) block -> world; layer / block_color: the INSERT's layer and resolved
+        colour; layer_color(name): colour an entity with a BYLAYER colour gets on layer `name`.
+        """
+        a, t = affine
+        rows, offset = a.tolist(), t.tolist()
+        xy = np.round(self.coords @ a + t, 4).tolist()
+        raw = np.round(self.raw_points @ a + t, 4).tolist() if len(self.raw_points) else []
+        similar = _similarity(a)
+        if similar:
+            scale, angle, mirrored = similar
+        else:
+            scale, angle, mirrored = math.sqrt(abs(float(np.linalg.det(a)))), math.atan2(a[0, 1], a[0, 0]), False
+
+        out = []
+        for k, ent in enumerate(self.entities):
+            ent = dict(ent)
+            if ent.get('layer') == BLOCK_LAYER:
+                ent['layer'] = layer
+            color = ent.get('color')
+            if color == BYBLOCK:
+                ent['color'] = block_color
+            elif color == BYLAYER:
+                ent['color'] = layer_color(ent['layer'])
+
+            if POINT_MARKER in ent:
+                (px, py), local = ent.pop(POINT_MARKER), self.coords[self.offsets[k]:self.offsets[k + 1]]
+                moved = np.round(local - (px, py) + (np.array([px, py]) @ a + t), 4).tolist()
+                ent['points'] = [{'x': x, 'y': y} for x, y in moved]
+            elif 'points' in ent:
+                pts = [{'x': x, 'y': y} for x, y in xy[self.offsets[k]:self.offsets[k + 1]]]
+                ent['points'] = pts
+                if pts and 'x1' in ent:
+                    ent.update(x1=pts[0]['x'], y1=pts[0]['y'], x2=pts[-1]['x'], y2=pts[-1]['y'])
+                if pts and 'x' in ent and 'y' in ent:
+                    ent.update(x=pts[0]['x'], y=pts[0]['y'])
+            if ent.get('type') == 'TEXT_LABEL':
+                if 'rotation' in ent:
+                    ent['rotation'] = round((ent['rotation'] + math.degrees(angle)) % 360.0, 2)
+                if 'height' in ent:
+                    ent['height'] = round(ent['height'] * scale, 4)
+            if ent.get('segments'):
+                if similar:
+                    ent['segments'] = [self._segment(s, rows, offset, scale, angle, mirrored) for s in ent['segments']]
+                else:
+                    del ent['segments']  # exact arcs turn elliptical; the points still follow them
+            out.append(ent)
+        return out, raw
+
+    @staticmethod
+    def _segment(seg, a, t, scale, angle, mirrored):
+        (a00, a01), (a10, a11) = a
+        seg = dict(seg)
+        if seg.get('type') == 'arc':
+            cx, cy = seg['cx'], seg['cy']
+            start, end = seg['startAngle'], seg['endAngle']
+            if mirrored:
+                start, end, seg['ccw'] = angle - start, angle - end, not seg['ccw']
+            else:
+                start, end = start + angle, end + angle
+            seg.update(cx=round(cx * a00 + cy * a10 + t[0], 6), cy=round(cx * a01 + cy * a11 + t[1], 6),
+                       r=round(seg['r'] * scale, 6), startAngle=round(start, 8), endAngle=round(end, 8))
+        elif 'x' in seg and 'y' in seg:
+            x, y = seg['x'], seg['y']
+            seg.update(x=round(x * a00 + y * a10 + t[0], 4), y=round(x * a01 + y * a11 + t[1], 4))
+        return seg
@@ -0,0 +1,229 @@
+"""
+CAD Parse Cache for Parcel Tools
+Content-addressed cache of /api/parse-cad results: the serialized JSON of a parsed
+drawing is stored zlib-compressed on disk, keyed by the drawing's content hash,
+the parser version and the parse options, with an in-memory LRU in front.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import zlib
+from collections import OrderedDict
+
+_HASH_BLOCK = 4 * 1024 * 1024
+_STREAM_CHUNK = 1024 * 1024
+
+
+def file_digest(path):
+    """blake2b hex digest of a file's bytes, read in blocks."""
+    hasher = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(_HASH_BLOCK)
+            if not block:
+                break
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+class CadParseCache:
+    """
+    Parsed-drawing cache. Values are UTF-8 JSON bytes of the parse result.
+    memory_bytes bounds the in-memory LRU, disk_bytes the on-disk store
+    (least recently used entries are evicted first); cache_dir=None is memory-only.
+    """
+
+    def __init__(self, cache_dir, memory_bytes=256 * 1024 * 1024, disk_bytes=1024 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        self._digests = {}
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+    def digest(self, path):
+        """Content hash of a drawing, memoized on (path, size, mtime) so unchanged files aren't re-read."""
+        st = os.stat(path)
+        stamp = (os.path.normcase(os.path.abspath(path)), st.st_size, st.st_mtime_ns)
+        with self._lock:
+            cached = self._digests.get(stamp)
+        if cached is None:
+            cached = file_digest(path)
+            with self._lock:
+                if len(self._digests) > 4096:
+                    self._digests.clear()
+                self._digests[stamp] = cached
+        return cached
+
+    def key(self, path, version, options=None):
+        """Cache key for a drawing parsed by parser `version` with `options` (any JSON-able value)."""
+        extra = json.dumps(options, sort_keys=True, separators=(',', ':')) if options else ''
+        return hashlib.blake2b(f'{self.digest(path)}|{version}|{extra}'.encode('utf-8'),
+                               digest_size=16).hexdigest()
+
+    def get(self, key):
+        """JSON bytes for `key`, or None."""
+        with self._lock:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                return blob
+        if self.cache_dir is not None:
+            entry = self._entry_path(key)
+            try:
+                with open(entry, 'rb') as f:
+                    blob = zlib.decompress(f.read())
+                os.utime(entry)  # LRU order on disk follows mtime
+            except (OSError, zlib.error):
+                blob = None
+            if blob is not None:
+                self._remember(key, blob)
+                with self._lock:
+                    self.stats['disk_hits'] += 1
+                return blob
+        with self._lock:
+            self.stats['misses'] += 1
+        return None
+
+    def iter_chunks(self, key):
+        """
+        Like get(), but a disk entry is decompressed chunk by chunk as the iterator is consumed
+        (and not copied into the memory LRU), for results too large to hold whole. None on a miss.
+        """
+        with self._lock:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                return iter([blob])
+        if self.cache_dir is not None:
+            entry = self._entry_path(key)
+            try:
+                f = open(entry, 'rb')
+                os.utime(entry)
+            except OSError:
+                f = None
+            if f is not None:
+                with self._lock:
+                    self.stats['disk_hits'] += 1
+                return self._decompress(f)
+        with self._lock:
+            self.stats['misses'] += 1
+        return None
+
+    @staticmethod
+    def _decompress(f):
+        with f:
+            inflater = zlib.decompressobj()
+            while True:
+                block = f.read(_STREAM_CHUNK)
+                if not block:
+                    break
+                data = inflater.decompress(block)
+                if data:
+                    yield data
+            data = inflater.flush()
+            if data:
+                yield data
+
+    def get_result(self, key):
+        blob = self.get(key)
+        return json.loads(blob) if blob is not None else None
+
+    def put(self, key, blob):
+        """Store JSON bytes (or a JSON-able result) under `key`; returns the JSON bytes."""
+        if not isinstance(blob, (bytes, bytearray)):
+            blob = json.dumps(blob, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self._remember(key, blob)
+        if self.cache_dir is not None:
+            self._write_entry(key, (blob,))
+        return blob
+
+    def put_file(self, key, fileobj):
+        """
+        Store the JSON in a binary file object (read from its start) without loading it whole:
+        it is compressed to the disk store chunk by chunk. Memory-only caches keep it if it fits.
+        """
+        if self.cache_dir is None:
+            if fileobj.seek(0, os.SEEK_END) <= self.memory_bytes:
+                fileobj.seek(0)
+                self._remember(key, fileobj.read())
+            return
+        fileobj.seek(0)
+        self._write_entry(key, iter(lambda: fileobj.read(_STREAM_CHUNK), b''))
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            self._digests.clear()
+        if self.cache_dir is not None and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.cadz'):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError:
+                        pass
+
+    # -- internals ---------------------------------------------------------
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key + '.cadz')
+
+    def _remember(self, key, blob):
+        if len(blob) > self.memory_bytes:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_size -= len(old)
+            self._memory[key] = blob
+            self._memory_size += len(blob)
+            while self._memory_size > self.memory_bytes and self._memory:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted)
+
+    def _write_entry(self, key, chunks):
+        entry = self._entry_path(key)
+        tmp = f'{entry}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            deflater = zlib.compressobj(6)
+            with open(tmp, 'wb') as f:
+                for chunk in chunks:
+                    f.write(deflater.compress(chunk))
+                f.write(deflater.flush())
+            os.replace(tmp, entry)
+        except OSError as e:
+            print(f'[CAD Cache WARNING] Could not write cache entry: {e}')
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        self._evict_disk()
+
+    def _evict_disk(self):
+        try:
+            entries = []
+            with os.scandir(self.cache_dir) as it:
+                for e in it:
+                    if e.name.endswith('.cadz'):
+                        st = e.stat()
+                        entries.append((st.st_mtime_ns, st.st_size, e.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
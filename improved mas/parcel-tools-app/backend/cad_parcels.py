@@ -0,0 +1,231 @@
+"""
+CAD Parcel Detection for Parcel Tools
+Finds every closed boundary polygon on the parcel layers of a parsed drawing and
+matches its corners to point-number labels in one pass, so a whole sheet can be
+batch-imported. Labels go into a KD-tree once; each parcel's corners then take a
+radius query instead of being compared against every label on the sheet. Scoring
+and the greedy one-label-per-corner assignment are the same as the single-parcel
+"Create Parcel" dialog in DxfImport.jsx.
+"""
+
+import math
+import re
+
+import numpy as np
+
+PARCEL_LAYER_KEYWORDS = ('PARCEL', 'PLOT', 'TABU', 'QUSAI', 'QASIMA', 'BOUNDARY OF PARTITION')
+MERGE_THRESHOLD = 1e-3     # consecutive corners closer than this are one corner
+MAX_LABEL_LENGTH = 15
+_LEAF_SIZE = 16
+
+_NUMERIC = re.compile(r'^\s*\d+(\.\d+)?\s*$')
+_POINT_LAYER = re.compile(r'corner|number|mark|point|node|boundary|original|pt|num|no|id', re.I)
+_NOISE_LAYER = re.compile(r'dimension|dim|table|title|description|desc|road|elevation', re.I)
+_DESC_LAYER = re.compile(r'description|desc', re.I)
+_PARCEL_PREFIX = re.compile(r'^Parcel\s+|^#\s*|^No\.\s*', re.I)
+
+
+def is_parcel_layer(layer_name, layer_names=()):
+    """Same rule as the parser and the UI: GIS layers if the drawing has any, else parcel keywords."""
+    if not layer_name:
+        return False
+    name = str(layer_name).strip().upper()
+    if any('GIS' in str(n).strip().upper() for n in layer_names):
+        return 'GIS' in name
+    return any(k in name for k in PARCEL_LAYER_KEYWORDS)
+
+
+class PointKDTree:
+    """
+    Static 2-D KD-tree over an (n, 2) array: one permutation array plus a node list (no scipy needed).
+    Nodes split at the median of their wider axis down to leaves of _LEAF_SIZE points.
+    """
+
+    def __init__(self, xy):
+        self.xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        n = len(self.xy)
+        self.order = np.arange(n)
+        # node -> [start, end, bbox min, bbox max, left, right] over self.order; leaves have left == -1
+        self.nodes = []
+        if n:
+            self._build()
+
+    def _build(self):
+        stack = [(0, len(self.xy), None)]
+        while stack:
+            start, end, parent = stack.pop()
+            node = len(self.nodes)
+            if parent is not None:
+                parent_node, side = parent
+                self.nodes[parent_node][4 + side] = node
+            ids = self.order[start:end]
+            pts = self.xy[ids]
+            lo, hi = pts.min(axis=0), pts.max(axis=0)
+            self.nodes.append([start, end, lo, hi, -1, -1])
+            if end - start <= _LEAF_SIZE:
+                continue
+            axis = int(np.argmax(hi - lo))
+            mid = (end - start) // 2
+            part = np.argpartition(pts[:, axis], mid)
+            self.order[start:end] = ids[part]
+            stack.append((start + mid, end, (node, 1)))
+            stack.append((start, start + mid, (node, 0)))
+
+    def query_radius(self, x, y, radius):
+        """Indices (into xy) of points within `radius` of (x, y), and their distances."""
+        found = []
+        stack = [0] if self.nodes else []
+        r2 = radius * radius
+        while stack:
+            start, end, lo, hi, left, right = self.nodes[stack.pop()]
+            dx = max(lo[0] - x, 0.0, x - hi[0])
+            dy = max(lo[1] - y, 0.0, y - hi[1])
+            if dx * dx + dy * dy > r2:
+                continue
+            if left == -1:
+                found.append(self.order[start:end])
+            else:
+                stack.append(right)
+                stack.append(left)
+        if not found:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        ids = np.concatenate(found)
+        d = np.hypot(self.xy[ids, 0] - x, self.xy[ids, 1] - y)
+        keep = d < radius
+        return ids[keep], d[keep]
+
+
+def _unique_corners(points):
+    corners = []
+    for p in points:
+        x, y = float(p['x']), float(p['y'])
+        if not corners or math.hypot(x - corners[-1][0], y - corners[-1][1]) > MERGE_THRESHOLD:
+            corners.append((x, y))
+    if len(corners) > 1 and math.hypot(corners[0][0] - corners[-1][0], corners[0][1] - corners[-1][1]) <= MERGE_THRESHOLD:
+        corners.pop()
+    return np.array(corners, dtype=np.float64).reshape(-1, 2)
+
+
+def _inside(px, py, ring):
+    """Even-odd point-in-polygon for arrays of points against one ring."""
+    x0, y0 = ring[:, 0], ring[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+    px, py = px[:, None], py[:, None]
+    crosses = (y0 > py) != (y1 > py)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        at = (x1 - x0) * (py - y0) / (y1 - y0) + x0
+    return ((crosses & (px < at)).sum(axis=1) % 2) == 1
+
+
+class ParcelDetector:
+    """Parcel detection over one parse result ({'entities': [...], 'layers': [...]})."""
+
+    def __init__(self, result):
+        self.entities = result.get('entities') or []
+        layer_names = [l.get('name', '') for l in result.get('layers') or []]
+        self.boundaries = [i for i, e in enumerate(self.entities)
+                           if e.get('closed') and not e.get('filled') and e.get('type') != 'CIRCLE'
+                           and len(e.get('points') or ()) >= 3
+                           and (e.get('polygonized') or is_parcel_layer(e.get('layer'), layer_names))]
+
+        labels = [e for e in self.entities if e.get('type') == 'TEXT_LABEL' and e.get('text')
+                  and 'x' in e and 'y' in e]
+        self.labels = labels
+        self.label_xy = np.array([[e['x'], e['y']] for e in labels], dtype=np.float64).reshape(-1, 2)
+        # Score = distance + weight * threshold; the weight only depends on the label
+        self.candidate = np.array([0 < len(e['text'].strip()) <= MAX_LABEL_LENGTH for e in labels], dtype=bool)
+        self.weight = np.array([(-3 if _POINT_LAYER.search(e.get('layer') or '') else 0)
+                                + (-1 if _NUMERIC.match(e['text']) else 0)
+                                + (3 if _NOISE_LAYER.search(e.get('layer') or '') else 0)
+                                for e in labels], dtype=np.float64)
+        self.tree = PointKDTree(self.label_xy)
+
+    def detect(self, known_ids=(), indices=None):
+        """
+        All parcels: [{entityIndex, layer, number, area, perimeter, points: [{x, y, label, dist,
+        pointId, status}]}]. status is 'matched' (pointId in known_ids), 'missing' (a label not
+        in known_ids) or 'generated' (no label; a CAD_n ID shared by parcels meeting at that corner).
+        indices: only these entity indices (those that are not parcel boundaries are skipped).
+        """
+        known = set(known_ids)
+        generated = {}
+        taken = set(known)
+        parcels = []
+        boundaries = self.boundaries
+        if indices is not None:
+            wanted = set(indices)
+            boundaries = [i for i in boundaries if i in wanted]
+        for index in boundaries:
+            ent = self.entities[index]
+            corners = _unique_corners(ent['points'])
+            if len(corners) < 3:
+                continue
+            matches = self._match_corners(corners)
+            points = []
+            for (x, y), match in zip(corners.tolist(), matches):
+                if match:
+                    label, dist = match
+                    status = 'matched' if label in known else 'missing'
+                    points.append({'x': x, 'y': y, 'label': label, 'dist': round(dist, 4),
+                                   'pointId': label, 'status': status})
+                    continue
+                key = (round(x, 3), round(y, 3))
+                if key not in generated:
+                    counter = len(generated) + 1
+                    while f'CAD_{counter}' in taken:
+                        counter += 1
+                    generated[key] = f'CAD_{counter}'
+                    taken.add(generated[key])
+                points.append({'x': x, 'y': y, 'label': None, 'dist': None,
+                               'pointId': generated[key], 'status': 'generated'})
+
+            closed = np.vstack([corners, corners[:1]])
+            area = abs(float(np.dot(closed[:-1, 0], closed[1:, 1]) - np.dot(closed[1:, 0], closed[:-1, 1]))) / 2
+            perimeter = float(np.hypot(*np.diff(closed, axis=0).T).sum())
+            parcels.append({'entityIndex': index, 'layer': ent.get('layer'), 'number': self._parcel_number(corners),
+                            'area': round(area, 4), 'perimeter': round(perimeter, 4), 'points': points})
+        return parcels
+
+    def _match_corners(self, corners):
+        """Greedy lowest-score-first assignment, at most one label per corner and corner per label."""
+        diag = math.hypot(*(corners.max(axis=0) - corners.min(axis=0)))
+        threshold = max(15.0, min(500.0, diag * 0.25))
+        vertex, label, dist = [], [], []
+        for v, (x, y) in enumerate(corners.tolist()):
+            ids, d = self.tree.query_radius(x, y, threshold)
+            keep = self.candidate[ids]
+            ids, d = ids[keep], d[keep]
+            order = np.argsort(ids, kind='stable')  # same tie order as the UI's vertex-then-label scan
+            vertex.append(np.full(len(ids), v))
+            label.append(ids[order])
+            dist.append(d[order])
+        assigned = [None] * len(corners)
+        if not vertex:
+            return assigned
+        vertex, label, dist = np.concatenate(vertex), np.concatenate(label), np.concatenate(dist)
+        score = dist + self.weight[label] * threshold
+        used_labels = set()
+        for k in np.argsort(score, kind='stable').tolist():
+            v, l = int(vertex[k]), int(label[k])
+            if assigned[v] is None and l not in used_labels:
+                assigned[v] = (self.labels[l]['text'].strip(), float(dist[k]))
+                used_labels.add(l)
+        return assigned
+
+    def _parcel_number(self, corners):
+        """Parcel number from the labels inside it: numeric description labels first, nearest the centroid."""
+        lo, hi = corners.min(axis=0), corners.max(axis=0)
+        centre = (lo + hi) / 2
+        ids, _ = self.tree.query_radius(centre[0], centre[1], math.hypot(*(hi - lo)) / 2 + 1e-9)
+        if not len(ids):
+            return None
+        ids = ids[_inside(self.label_xy[ids, 0], self.label_xy[ids, 1], corners)]
+        inside = [self.labels[i] for i in sorted(ids.tolist())]
+        desc = [e for e in inside if _DESC_LAYER.search(e.get('layer') or '')]
+        pool = ([e for e in desc if _NUMERIC.match(e['text'])] or desc
+                or [e for e in inside if _NUMERIC.match(e['text'])] or inside)
+        if not pool:
+            return None
+        cx, cy = corners.mean(axis=0)
+        best = min(pool, key=lambda e: math.hypot(e['x'] - cx, e['y'] - cy))
+        return _PARCEL_PREFIX.sub('', best['text'].strip()) or None
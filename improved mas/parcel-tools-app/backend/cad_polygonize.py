@@ -0,0 +1,287 @@
+"""
+Planar Polygonization for Parcel Tools
+Turns loose line work (exploded polylines, drawings that only ever had LINEs for parcel
+edges) into closed candidate parcels. Segment endpoints are snapped together through a
+spatial hash with cells of the snap tolerance, segments are split where another segment
+ends on them (T-junctions) or crosses them, and the minimal faces of the resulting planar
+graph are traced with a next-half-edge permutation. Dangling edges are pruned first so
+overshoots and stray lines don't leak into the faces. Every step is a sort, a hash join
+or a linear sweep over numpy arrays, so the cost grows near-linearly with the segment count.
+"""
+
+import math
+
+import numpy as np
+
+DEFAULT_SNAP_TOLERANCE = 0.001
+_SKIP_TYPES = {'TEXT_LABEL', 'CIRCLE'}
+
+
+def collect_segments(entities, layer_ok):
+    """
+    (segments (n, 4) [x1, y1, x2, y2], source entity index per segment) for the open line
+    work of the entities whose layer passes `layer_ok`. Closed rings are already parcels.
+    """
+    segments, sources = [], []
+    for i, ent in enumerate(entities):
+        pts = ent.get('points')
+        if (not pts or len(pts) < 2 or ent.get('closed') or ent.get('filled')
+                or ent.get('type') in _SKIP_TYPES or not layer_ok(ent.get('layer'))):
+            continue
+        xy = [(p['x'], p['y']) for p in pts]
+        for (x1, y1), (x2, y2) in zip(xy, xy[1:]):
+            segments.append((x1, y1, x2, y2))
+            sources.append(i)
+    return np.array(segments, dtype=np.float64).reshape(-1, 4), np.array(sources, dtype=np.int64)
+
+
+def _hash_codes(cx, cy):
+    """One int64 per (column, row) grid cell, offset so both stay non-negative."""
+    cx, cy = cx - cx.min() + 1, cy - cy.min() + 1
+    return cx * (int(cy.max()) + 2) + cy, int(cy.max()) + 2
+
+
+def snap_points(xy, tolerance):
+    """
+    (node index per point, node coordinates): points in the same tolerance-sized hash cell
+    are one node, and neighbouring cells merge when their centres are within tolerance.
+    """
+    if not len(xy):
+        return np.empty(0, dtype=np.int64), np.empty((0, 2))
+    cells = np.floor(xy / tolerance).astype(np.int64)
+    codes, width = _hash_codes(cells[:, 0], cells[:, 1])
+    unique, inverse = np.unique(codes, return_inverse=True)
+    counts = np.bincount(inverse)
+    centres = np.stack([np.bincount(inverse, xy[:, 0]), np.bincount(inverse, xy[:, 1])], axis=1) / counts[:, None]
+
+    parent = np.arange(len(unique))
+    for step in (width - 1, width, width + 1, 1):  # forward neighbours; the other four are symmetric
+        pos = np.searchsorted(unique, unique + step)
+        found = pos < len(unique)
+        found[found] = unique[pos[found]] == unique[found] + step
+        i, j = np.flatnonzero(found), pos[found]
+        close = np.hypot(*(centres[i] - centres[j]).T) <= tolerance
+        for a, b in zip(i[close].tolist(), j[close].tolist()):
+            ra, rb = _root(parent, a), _root(parent, b)
+            if ra != rb:
+                parent[max(ra, rb)] = min(ra, rb)
+    while True:  # parents always point to a smaller index, so jumping settles on the roots
+        jumped = parent[parent]
+        if (jumped == parent).all():
+            break
+        parent = jumped
+    _, node_of_cell = np.unique(parent, return_inverse=True)
+    node_of = node_of_cell[inverse]
+    counts = np.bincount(node_of)
+    nodes = np.stack([np.bincount(node_of, xy[:, 0]), np.bincount(node_of, xy[:, 1])], axis=1) / counts[:, None]
+    return node_of, nodes
+
+
+def _root(parent, k):
+    while parent[k] != k:
+        parent[k] = parent[parent[k]]
+        k = parent[k]
+    return k
+
+
+def _cover_cells(segments, cell, origin, pad):
+    """
+    (segment index, column, row) for every grid cell each segment's padded bounding box
+    covers, plus each segment's lowest (column, row).
+    """
+    lo = np.floor((np.minimum(segments[:, :2], segments[:, 2:]) - pad - origin) / cell).astype(np.int64)
+    hi = np.floor((np.maximum(segments[:, :2], segments[:, 2:]) + pad - origin) / cell).astype(np.int64)
+    nx, ny = hi[:, 0] - lo[:, 0] + 1, hi[:, 1] - lo[:, 1] + 1
+    per = nx * ny
+    seg = np.repeat(np.arange(len(segments)), per)
+    local = np.arange(per.sum()) - np.repeat(np.cumsum(per) - per, per)
+    return seg, lo[seg, 0] + local % nx[seg], lo[seg, 1] + local // nx[seg], lo
+
+
+def _expand_groups(starts, counts):
+    """Flat positions starts[k] .. starts[k] + counts[k] - 1 for every k, and the k of each."""
+    owner = np.repeat(np.arange(len(starts)), counts)
+    return np.repeat(starts, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts), owner
+
+
+def _split_points(segments, a, b, nodes, tolerance):
+    """
+    (segment, parameter t, node) for every interior point where a segment has to be split:
+    nodes lying on it within tolerance, and proper crossings with other segments (which
+    become new nodes, appended to `nodes`). Returns the splits and the extended node array.
+    """
+    lengths = np.hypot(segments[:, 2] - segments[:, 0], segments[:, 3] - segments[:, 1])
+    positive = lengths[lengths > 0]
+    if not len(positive):
+        return np.empty((0, 3)), nodes
+    cell = max(2 * float(np.median(positive)), tolerance * 4)
+    origin = nodes.min(axis=0)
+    seg, cx, cy, lo = _cover_cells(segments, cell, origin, tolerance)
+    node_cells = np.floor((nodes - origin) / cell).astype(np.int64)
+    codes, _ = _hash_codes(np.concatenate([cx, node_cells[:, 0]]), np.concatenate([cy, node_cells[:, 1]]))
+    seg_codes, node_codes = codes[:len(seg)], codes[len(seg):]
+
+    # Nodes on segments (T-junctions)
+    node_order = np.argsort(node_codes, kind='stable')
+    sorted_codes = node_codes[node_order]
+    first = np.searchsorted(sorted_codes, seg_codes)
+    counts = np.searchsorted(sorted_codes, seg_codes, side='right') - first
+    flat, owner = _expand_groups(first, counts)
+    s, v = seg[owner], node_order[flat]
+    keep = (v != a[s]) & (v != b[s])
+    s, v = s[keep], v[keep]
+    p0, d = segments[s, :2], segments[s, 2:] - segments[s, :2]
+    length2 = (d ** 2).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = ((nodes[v] - p0) * d).sum(axis=1) / length2
+    dist = np.hypot(*(p0 + d * t[:, None] - nodes[v]).T)
+    on = (length2 > 0) & (dist <= tolerance) & (t * lengths[s] > tolerance) & ((1 - t) * lengths[s] > tolerance)
+    splits = [np.stack([s[on], t[on], v[on]], axis=1)]
+
+    # Proper crossings: segment pairs sharing a grid cell, each pair tested only in the
+    # cell holding the low corner of the overlap of their boxes
+    order = np.argsort(seg_codes, kind='stable')
+    cell_codes, seg_sorted, cx, cy = seg_codes[order], seg[order], cx[order], cy[order]
+    bounds = np.flatnonzero(np.diff(cell_codes)) + 1
+    group_start = np.concatenate([[0], bounds])
+    group_end = np.concatenate([bounds, [len(cell_codes)]])
+    end_of = np.repeat(group_end, group_end - group_start)
+    later = end_of - np.arange(len(cell_codes)) - 1
+    partner, owner = _expand_groups(np.arange(len(cell_codes)) + 1, later)
+    i, j = seg_sorted[owner], seg_sorted[partner]
+    home = ((np.maximum(lo[i, 0], lo[j, 0]) == cx[owner]) & (np.maximum(lo[i, 1], lo[j, 1]) == cy[owner]))
+    i, j = i[home], j[home]
+    shared = (a[i] == a[j]) | (a[i] == b[j]) | (b[i] == a[j]) | (b[i] == b[j])
+    i, j = i[~shared & (i != j)], j[~shared & (i != j)]
+    p, r = segments[i, :2], segments[i, 2:] - segments[i, :2]
+    q, w = segments[j, :2], segments[j, 2:] - segments[j, :2]
+    denom = r[:, 0] * w[:, 1] - r[:, 1] * w[:, 0]
+    qp = q - p
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (qp[:, 0] * w[:, 1] - qp[:, 1] * w[:, 0]) / denom
+        u = (qp[:, 0] * r[:, 1] - qp[:, 1] * r[:, 0]) / denom
+    cross = ((np.abs(denom) > 1e-12) & (t * lengths[i] > tolerance) & ((1 - t) * lengths[i] > tolerance)
+             & (u * lengths[j] > tolerance) & ((1 - u) * lengths[j] > tolerance))
+    i, j, t, u = i[cross], j[cross], t[cross], u[cross]
+    if len(i):
+        new_of, new_nodes = snap_points(p[cross] + r[cross] * t[:, None], tolerance)
+        ids = new_of + len(nodes)
+        nodes = np.vstack([nodes, new_nodes])
+        splits.append(np.stack([i, t, ids], axis=1))
+        splits.append(np.stack([j, u, ids], axis=1))
+    return np.concatenate(splits), nodes
+
+
+def _prune_dangles(edges, node_count):
+    """Drop edges hanging off degree-1 nodes, repeatedly, so only cycles remain."""
+    if not len(edges):
+        return np.zeros(0, dtype=bool)
+    ends = edges.ravel()
+    degree = np.bincount(ends, minlength=node_count)
+    order = np.argsort(ends, kind='stable')
+    starts = np.searchsorted(ends[order], np.arange(node_count + 1))
+    alive = np.ones(len(edges), dtype=bool)
+    stack = np.flatnonzero(degree == 1).tolist()
+    while stack:
+        node = stack.pop()
+        for half in order[starts[node]:starts[node + 1]].tolist():
+            k = half // 2
+            if alive[k]:
+                alive[k] = False
+                other = edges[k, 1 - half % 2]
+                degree[node] -= 1
+                degree[other] -= 1
+                if degree[other] == 1:
+                    stack.append(int(other))
+    return alive
+
+
+def polygonize(segments, tolerance=DEFAULT_SNAP_TOLERANCE, min_area=None):
+    """
+    Minimal faces of the planar graph formed by `segments` ((n, 4) [x1, y1, x2, y2]).
+    Returns [{'coords': (k, 2) counter-clockwise ring, 'area': float, 'segment': index of
+    an input segment on its boundary}], faces smaller than min_area (default tolerance^2) dropped.
+    """
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    index = np.flatnonzero(np.isfinite(segments).all(axis=1))
+    segments = segments[index]
+    if not len(segments):
+        return []
+    min_area = tolerance * tolerance if min_area is None else min_area
+
+    node_of, nodes = snap_points(segments.reshape(-1, 2), tolerance)
+    a, b = node_of[0::2], node_of[1::2]
+    splits, nodes = _split_points(segments, a, b, nodes, tolerance)
+    n = len(segments)
+    seg_ids = np.concatenate([np.arange(n), np.arange(n), splits[:, 0].astype(np.int64)])
+    params = np.concatenate([np.zeros(n), np.ones(n), splits[:, 1]])
+    vertex = np.concatenate([a, b, splits[:, 2].astype(np.int64)])
+    order = np.lexsort((params, seg_ids))
+    seg_ids, vertex = seg_ids[order], vertex[order]
+    same = seg_ids[1:] == seg_ids[:-1]
+    u, v, src = vertex[:-1][same], vertex[1:][same], seg_ids[:-1][same]
+    keep = u != v
+    u, v, src = u[keep], v[keep], src[keep]
+    key = np.minimum(u, v) * len(nodes) + np.maximum(u, v)
+    _, first = np.unique(key, return_index=True)  # overlapping duplicates become one edge
+    edges = np.stack([u[first], v[first]], axis=1)
+    src = src[first]
+
+    alive = _prune_dangles(edges, len(nodes))
+    edges, src = edges[alive], src[alive]
+    if not len(edges):
+        return []
+
+    # Half-edge 2k runs u -> v, 2k + 1 runs v -> u; around each node they're sorted by angle
+    origin, dest = edges.ravel(), edges[:, ::-1].ravel()
+    vec = nodes[dest] - nodes[origin]
+    angle = np.arctan2(vec[:, 1], vec[:, 0])
+    around = np.lexsort((angle, origin))
+    rank = np.empty_like(around)
+    rank[around] = np.arange(len(around))
+    group_first = np.searchsorted(origin[around], origin)
+    group_last = np.searchsorted(origin[around], origin, side='right') - 1
+    # next(e): at e's head, the outgoing half-edge just clockwise of e's twin -> faces on the left
+    twin = np.arange(len(origin)) ^ 1
+    prev = rank[twin] - 1
+    prev = np.where(prev < group_first[twin], group_last[twin], prev)
+    nxt = around[prev]
+
+    # Face label = smallest half-edge in its cycle (pointer doubling)
+    label, jump = np.arange(len(nxt)), nxt.copy()
+    for _ in range(max(1, math.ceil(math.log2(len(nxt)))) + 1):
+        label = np.minimum(label, label[jump])
+        jump = jump[jump]
+    cross = nodes[origin, 0] * nodes[dest, 1] - nodes[dest, 0] * nodes[origin, 1]
+    area = np.bincount(label, cross, minlength=len(nxt)) / 2
+
+    faces = []
+    for start in np.flatnonzero(area > min_area).tolist():
+        ring, e = [], start
+        while True:
+            ring.append(origin[e])
+            e = nxt[e]
+            if e == start:
+                break
+        faces.append({'coords': nodes[ring], 'area': float(area[start]), 'segment': int(index[src[start // 2]])})
+    return faces
+
+
+def polygonize_entities(entities, layer_ok, tolerance=DEFAULT_SNAP_TOLERANCE):
+    """
+    Closed LWPOLYLINE entities (flagged 'polygonized') for the faces formed by the open line
+    work on layers passing `layer_ok`; each takes the layer of a boundary segment.
+    """
+    segments, sources = collect_segments(entities, layer_ok)
+    out = []
+    for face in polygonize(segments, tolerance):
+        source = entities[sources[face['segment']]]
+        out.append({
+            "type": "LWPOLYLINE",
+            "closed": True,
+            "points": [{"x": x, "y": y} for x, y in np.round(face['coords'], 4).tolist()],
+            "layer": source.get('layer'),
+            "color": source.get('color'),
+            "polygonized": True,
+        })
+    return out
@@ -0,0 +1,93 @@
+"""
+Streaming DXF Reader for Parcel Tools
+Low-memory alternative to ezdxf.readfile for huge drawings: modelspace entities are
+read one at a time with ezdxf's iterdxf add-on, while only a skeleton document
+(header, layer / style tables and block definitions - no modelspace) is loaded to
+resolve layers, colours and INSERT / DIMENSION blocks. Parsed entities are
+serialized straight to JSON in spooled temp files, so neither the Python objects
+nor the serialized output of a large drawing are held in memory.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+SPOOL_MEMORY = 8 * 1024 * 1024  # serialized output beyond this spills to a temp file
+COPY_CHUNK = 1024 * 1024
+
+
+def spooled_file():
+    return tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY)
+
+
+def iter_file(fileobj, chunk=COPY_CHUNK):
+    """Yield a binary file's contents from the start in chunks, closing it at the end."""
+    try:
+        fileobj.seek(0)
+        while True:
+            block = fileobj.read(chunk)
+            if not block:
+                return
+            yield block
+    finally:
+        fileobj.close()
+
+
+class JsonArrayWriter:
+    """List-like sink that serializes each appended item to compact JSON immediately, into a spooled file."""
+
+    def __init__(self):
+        self._file = spooled_file()
+        self._count = 0
+
+    def append(self, item):
+        self._file.write(b',' if self._count else b'[')
+        self._file.write(json.dumps(item, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        self._count += 1
+
+    def __len__(self):
+        return self._count
+
+    def write_to(self, out):
+        """Copy the JSON array into the binary file object `out` and release the spool."""
+        if not self._count:
+            out.write(b'[]')
+        else:
+            self._file.seek(0)
+            shutil.copyfileobj(self._file, out, COPY_CHUNK)
+            out.write(b']')
+        self._file.close()
+
+
+def open_modelspace_stream(dxf_path):
+    """
+    Returns (skeleton_doc, entity_iterator). Entities come from the file one by one with
+    .doc pointing at the skeleton, so virtual_entities() and layer lookups still work.
+    Raises for drawings iterdxf can't read (e.g. binary DXF); callers fall back to readfile.
+    """
+    import ezdxf
+    from ezdxf.addons import iterdxf
+
+    source = iterdxf.opendxf(dxf_path)
+    work = tempfile.mkdtemp(prefix='parcel_tools_dxf_')
+    try:
+        skeleton_path = os.path.join(work, 'skeleton.dxf')
+        writer = source.export(skeleton_path)  # everything before the first modelspace entity
+        writer.close()
+        doc = ezdxf.readfile(skeleton_path)
+    except Exception:
+        source.close()
+        raise
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    def entities():
+        try:
+            for entity in source.modelspace():
+                entity.doc = doc
+                yield entity
+        finally:
+            source.close()
+
+    return doc, entities()
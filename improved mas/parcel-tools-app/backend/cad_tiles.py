@@ -0,0 +1,284 @@
+"""
+CAD Tile Pyramid for Parcel Tools
+Serves a parsed drawing viewport by viewport instead of all at once: the drawing's
+square bounds are split into a quadtree of 256 px tiles (2^z per side at zoom z,
+x from the west, y from the north). A tile carries only the entities whose bounds
+touch it, Douglas-Peucker simplified to half a pixel at that zoom, with sub-pixel
+entities and unreadably small text dropped. Entities are found through a uniform
+grid index over their bounding boxes, which also answers nearest-entity hit tests.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+TILE_SIZE = 256
+MAX_ZOOM = 18
+MIN_TEXT_PIXELS = 1.5      # text labels shorter than this on screen are left out
+_GRID_MAX_DIM = 512
+_SKIP_KEYS = {'points', 'segments'}
+
+
+def simplify(coords, epsilon, closed=False):
+    """
+    Douglas-Peucker simplification of an (n, 2) array; keeps both ends (and, for closed
+    rings, the vertex farthest from the start so the ring can't collapse to a line).
+    """
+    n = len(coords)
+    if n <= 2 or epsilon <= 0:
+        return coords
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    if closed and n > 3:
+        far = int(np.argmax(np.hypot(coords[:, 0] - coords[0, 0], coords[:, 1] - coords[0, 1])))
+        if 0 < far < n - 1:
+            keep[far] = True
+            stack = [(0, far), (far, n - 1)]
+
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        ax, ay = coords[start]
+        bx, by = coords[end]
+        seg = coords[start + 1:end]
+        dx, dy = bx - ax, by - ay
+        length = math.hypot(dx, dy)
+        if length == 0:
+            dist = np.hypot(seg[:, 0] - ax, seg[:, 1] - ay)
+        else:
+            dist = np.abs(dy * (seg[:, 0] - ax) - dx * (seg[:, 1] - ay)) / length
+        k = int(np.argmax(dist))
+        if dist[k] > epsilon:
+            mid = start + 1 + k
+            keep[mid] = True
+            stack.append((start, mid))
+            stack.append((mid, end))
+    return coords[keep]
+
+
+def _point_segment_distance(x, y, pts, closed):
+    if len(pts) == 1:
+        return float(math.hypot(pts[0, 0] - x, pts[0, 1] - y))
+    a = pts[:-1]
+    b = pts[1:]
+    if closed and len(pts) > 2:
+        a = np.vstack([a, pts[-1:]])
+        b = np.vstack([b, pts[:1]])
+    d = b - a
+    len_sq = (d * d).sum(axis=1)
+    t = np.where(len_sq > 0, ((x - a[:, 0]) * d[:, 0] + (y - a[:, 1]) * d[:, 1]) / np.where(len_sq > 0, len_sq, 1), 0)
+    t = np.clip(t, 0, 1)
+    return float(np.hypot(a[:, 0] + t * d[:, 0] - x, a[:, 1] + t * d[:, 1] - y).min())
+
+
+def _point_in_ring(x, y, pts):
+    xi, yi = pts[:, 0], pts[:, 1]
+    xj, yj = np.roll(xi, 1), np.roll(yi, 1)
+    crosses = (yi > y) != (yj > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        at = (xj - xi) * (y - yi) / (yj - yi) + xi
+    return bool(np.count_nonzero(crosses & (x < at)) % 2)
+
+
+class GridIndex:
+    """
+    Uniform grid over entity bounding boxes (rows of [minx, miny, maxx, maxy]).
+    Boxes no larger than a cell are bucketed by their centre; larger ones are kept
+    in a short separate list, so every query is a few array slices plus one filter.
+    """
+
+    def __init__(self, bboxes, origin, side):
+        self.bboxes = bboxes
+        valid = np.flatnonzero(np.isfinite(bboxes).all(axis=1))
+        self.dim = int(min(_GRID_MAX_DIM, max(1, math.ceil(math.sqrt(max(len(valid), 1))))))
+        self.cell = side / self.dim
+        self.origin = origin
+        extent = np.maximum(bboxes[valid, 2] - bboxes[valid, 0], bboxes[valid, 3] - bboxes[valid, 1])
+        small = extent <= self.cell
+        self.big = valid[~small]
+        ids = valid[small]
+        cols = self._cells((bboxes[ids, 0] + bboxes[ids, 2]) / 2, origin[0])
+        rows = self._cells((bboxes[ids, 1] + bboxes[ids, 3]) / 2, origin[1])
+        cell_ids = rows * self.dim + cols
+        order = np.argsort(cell_ids, kind='stable')
+        self.ids = ids[order]
+        self.starts = np.searchsorted(cell_ids[order], np.arange(self.dim * self.dim + 1))
+
+    def _cells(self, values, start):
+        return np.clip(np.floor((values - start) / self.cell), 0, self.dim - 1).astype(np.int64)
+
+    def query(self, minx, miny, maxx, maxy):
+        """Sorted indices of entities whose bounding box intersects the rectangle."""
+        half = self.cell / 2
+        c0, c1 = self._cells(np.array([minx - half, maxx + half]), self.origin[0])
+        r0, r1 = self._cells(np.array([miny - half, maxy + half]), self.origin[1])
+        parts = [self.big]
+        for row in range(int(r0), int(r1) + 1):
+            base = row * self.dim
+            parts.append(self.ids[self.starts[base + c0]:self.starts[base + c1 + 1]])
+        found = np.concatenate(parts)
+        b = self.bboxes[found]
+        hit = (b[:, 0] <= maxx) & (b[:, 2] >= minx) & (b[:, 1] <= maxy) & (b[:, 3] >= miny)
+        return np.sort(found[hit])
+
+
+class CadTilePyramid:
+    """
+    Tile pyramid for one parse result ({'entities': [...], ...}). Entity indices in
+    tiles and hit results are positions in result['entities'], so they line up with
+    the full /api/parse-cad response. Built tiles are kept in a small LRU.
+    """
+
+    def __init__(self, result, tile_size=TILE_SIZE, max_zoom=None, tile_cache=512):
+        self.entities = result.get('entities') or []
+        self.tile_size = tile_size
+        self.tile_cache = tile_cache
+        self._tiles = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'built': 0, 'hits': 0}
+
+        counts = np.zeros(len(self.entities) + 1, dtype=np.int64)
+        flat = []
+        for i, ent in enumerate(self.entities):
+            for p in ent.get('points') or ():
+                if isinstance(p, dict) and isinstance(p.get('x'), (int, float)) and isinstance(p.get('y'), (int, float)):
+                    flat.append(p['x'])
+                    flat.append(p['y'])
+                    counts[i + 1] += 1
+        self.offsets = np.cumsum(counts)
+        self.coords = np.array(flat, dtype=np.float64).reshape(-1, 2)
+
+        bboxes = np.full((len(self.entities), 4), np.nan)
+        present = np.flatnonzero(counts[1:])
+        if len(present):
+            starts = self.offsets[present]
+            bboxes[present, 0] = np.minimum.reduceat(self.coords[:, 0], starts)
+            bboxes[present, 1] = np.minimum.reduceat(self.coords[:, 1], starts)
+            bboxes[present, 2] = np.maximum.reduceat(self.coords[:, 0], starts)
+            bboxes[present, 3] = np.maximum.reduceat(self.coords[:, 1], starts)
+            minx, miny = self.coords.min(axis=0)
+            maxx, maxy = self.coords.max(axis=0)
+        else:
+            minx = miny = maxx = maxy = 0.0
+        self.bounds = [float(minx), float(miny), float(maxx), float(maxy)]
+        self.side = float(max(maxx - minx, maxy - miny)) or 1.0
+        self.bboxes = bboxes
+        self.index = GridIndex(bboxes, (float(minx), float(miny)), self.side)
+
+        if max_zoom is None:
+            # Deep enough that a typical entity spans a good part of a tile; deeper
+            # zooms would only repeat the full-detail geometry, the client over-zooms
+            extent = np.maximum(bboxes[present, 2] - bboxes[present, 0], bboxes[present, 3] - bboxes[present, 1])
+            typical = float(np.median(extent[extent > 0])) if np.any(extent > 0) else self.side
+            max_zoom = math.ceil(math.log2(self.side / typical)) + 1 if typical < self.side else 0
+        self.max_zoom = int(min(MAX_ZOOM, max(0, max_zoom)))
+
+    def info(self):
+        return {'bounds': self.bounds, 'maxZoom': self.max_zoom, 'tileSize': self.tile_size,
+                'origin': [self.bounds[0], self.bounds[1] + self.side], 'side': self.side,
+                'entityCount': len(self.entities)}
+
+    def tile_bounds(self, z, x, y):
+        """World [minx, miny, maxx, maxy] of tile (z, x, y); y counts down from the top edge."""
+        size = self.side / (1 << z)
+        left = self.bounds[0] + x * size
+        top = self.bounds[1] + self.side - y * size
+        return [left, top - size, left + size, top]
+
+    def tile(self, z, x, y):
+        """Entities visible in tile (z, x, y) at that zoom's detail (see module docstring)."""
+        if not (0 <= z <= self.max_zoom and 0 <= x < (1 << z) and 0 <= y < (1 << z)):
+            raise ValueError(f'Tile {z}/{x}/{y} is outside the pyramid (max zoom {self.max_zoom})')
+        key = (z, x, y)
+        with self._lock:
+            cached = self._tiles.get(key)
+            if cached is not None:
+                self._tiles.move_to_end(key)
+                self.stats['hits'] += 1
+                return cached
+
+        box = self.tile_bounds(z, x, y)
+        pixel = (box[2] - box[0]) / self.tile_size
+        full_detail = z == self.max_zoom
+        ids = self.index.query(*box)
+        b = self.bboxes[ids]
+        if not full_detail:
+            # Anything smaller than a pixel is invisible at this zoom
+            ids = ids[np.maximum(b[:, 2] - b[:, 0], b[:, 3] - b[:, 1]) >= pixel]
+
+        items = []
+        for i in ids.tolist():
+            ent = self.entities[i]
+            if not full_detail and ent.get('type') == 'TEXT_LABEL' and \
+                    isinstance(ent.get('height'), (int, float)) and ent['height'] / pixel < MIN_TEXT_PIXELS:
+                continue
+            pts = self.coords[self.offsets[i]:self.offsets[i + 1]]
+            if not full_detail:
+                pts = simplify(pts, pixel / 2, bool(ent.get('closed')))
+            item = {k: v for k, v in ent.items() if k not in _SKIP_KEYS}
+            item['i'] = i
+            item['coords'] = pts.ravel().tolist()
+            items.append(item)
+
+        payload = {'z': z, 'x': x, 'y': y, 'bounds': box, 'fullDetail': full_detail, 'entities': items}
+        with self._lock:
+            self._tiles[key] = payload
+            self.stats['built'] += 1
+            while len(self._tiles) > self.tile_cache:
+                self._tiles.popitem(last=False)
+        return payload
+
+    def nearest(self, x, y, radius, limit=8):
+        """
+        Entities within radius of (x, y), nearest first: [{'i', 'distance', 'inside'}].
+        distance is to the full-detail outline; closed rings that contain the point are
+        included with inside=True even when their outline is farther than radius.
+        """
+        hits = []
+        for i in self.index.query(x - radius, y - radius, x + radius, y + radius).tolist():
+            pts = self.coords[self.offsets[i]:self.offsets[i + 1]]
+            ent = self.entities[i]
+            closed = bool(ent.get('closed'))
+            distance = _point_segment_distance(x, y, pts, closed)
+            inside = closed and len(pts) >= 3 and _point_in_ring(x, y, pts)
+            if distance <= radius or inside:
+                hits.append({'i': i, 'distance': distance, 'inside': inside})
+        hits.sort(key=lambda h: (h['distance'], h['i']))
+        return hits[:limit]
+
+
+class TilePyramidRegistry:
+    """
+    Thread-safe LRU of built pyramids keyed by drawing ID (the parse-cache key), plus the
+    source each ID was built from so an evicted pyramid can be rebuilt on demand.
+    """
+
+    def __init__(self, limit=4):
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._pyramids = OrderedDict()
+        self._sources = {}
+
+    def put(self, drawing_id, pyramid, source):
+        with self._lock:
+            self._pyramids[drawing_id] = pyramid
+            self._pyramids.move_to_end(drawing_id)
+            self._sources[drawing_id] = source
+            while len(self._pyramids) > self.limit:
+                self._pyramids.popitem(last=False)
+        return pyramid
+
+    def get(self, drawing_id):
+        with self._lock:
+            pyramid = self._pyramids.get(drawing_id)
+            if pyramid is not None:
+                self._pyramids.move_to_end(drawing_id)
+            return pyramid
+
+    def source(self, drawing_id):
+        with self._lock:
+            return self._sources.get(drawing_id)
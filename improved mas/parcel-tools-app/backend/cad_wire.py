@@ -0,0 +1,267 @@
+"""
+Columnar CAD Wire Format for Parcel Tools
+Binary alternative to the /api/parse-cad JSON: entities are grouped by type into
+typed arrays (Float64 X/Y coordinates, Uint32 vertex offsets, Uint16 layer / colour
+IDs into dictionary tables, Uint8 flags) that the renderer wraps without copying.
+Anything that doesn't fit a column travels in a small JSON manifest, so decoding
+gives back exactly the entities that were encoded.
+
+Layout (little-endian, every section 8-byte aligned):
+    frame:  b'PCW1' | u32 meta length | meta JSON | pad | body
+    body:   u32 manifest length | u32 0 | manifest JSON | pad | data sections
+Sections are described in the manifest as [byte offset into data, element count, dtype].
+The body depends only on the drawing, so it can be cached and re-framed per request.
+"""
+
+import json
+import math
+import struct
+
+import numpy as np
+
+MAGIC = b'PCW1'
+VERSION = 1
+MIME_TYPE = 'application/vnd.parceltools.cad'
+
+_DTYPES = {'f64': '<f8', 'u32': '<u4', 'u16': '<u2', 'u8': 'u1'}
+
+# flags bits
+_CLOSED = 1          # closed: true
+_FILLED = 2          # filled: true
+_LINE_ENDS = 4       # x1/y1/x2/y2 repeat the first / last point
+_ANCHOR = 8          # x/y repeat the first point (text labels)
+_HAS_CLOSED = 16     # entity has a 'closed' key at all
+_RAW_POINTS = 32     # points didn't fit the coordinate column, they're in extras
+
+_COLUMNAR_KEYS = {'type', 'points', 'layer', 'color', 'closed', 'filled'}
+
+
+def _pad(n):
+    return (-n) % 8
+
+
+class _Sections:
+    def __init__(self):
+        self.parts = []
+        self.size = 0
+
+    def add(self, values, dtype):
+        arr = np.ascontiguousarray(values, dtype=_DTYPES[dtype])
+        offset = self.size
+        blob = arr.tobytes()
+        self.parts.append(blob)
+        self.parts.append(b'\0' * _pad(len(blob)))
+        self.size += len(blob) + _pad(len(blob))
+        return [offset, int(arr.size), dtype]
+
+
+def _simple_points(points):
+    if not isinstance(points, list):
+        return False
+    for p in points:
+        if type(p) is not dict or len(p) != 2:
+            return False
+        x, y = p.get('x'), p.get('y')
+        if type(x) not in (int, float) or type(y) not in (int, float):
+            return False
+    return True
+
+
+def _is_number(v):
+    return type(v) in (int, float) and math.isfinite(v)
+
+
+class _Dictionary:
+    def __init__(self):
+        self.values = []
+        self.ids = {}
+
+    def id(self, value):
+        key = (type(value).__name__, value)
+        found = self.ids.get(key)
+        if found is None:
+            found = self.ids[key] = len(self.values)
+            self.values.append(value)
+        return found
+
+
+def encode_result(result):
+    """Encode a parse result ({'entities', 'raw_points', 'layers'}) into a cacheable body."""
+    entities = result.get('entities') or []
+    sections = _Sections()
+    layers = _Dictionary()
+    colors = _Dictionary()
+    colors.id(None)  # colour ID 0 = no colour
+
+    by_type = {}
+    for i, ent in enumerate(entities):
+        by_type.setdefault(ent.get('type'), []).append(i)
+
+    groups = []
+    for etype, indices in by_type.items():
+        group_ents = [entities[i] for i in indices]
+        n = len(group_ents)
+        offsets = np.zeros(n + 1, dtype=np.uint64)
+        coords = []
+        flags = np.zeros(n, dtype=np.uint8)
+        layer_ids = np.zeros(n, dtype=np.uint32)
+        color_ids = np.zeros(n, dtype=np.uint32)
+        extras = {}
+        attr_keys = {}
+
+        for j, ent in enumerate(group_ents):
+            f = 0
+            extra = {}
+            points = ent.get('points')
+            if points is not None and _simple_points(points):
+                coords.extend(v for p in points for v in (p['x'], p['y']))
+                count = len(points)
+            else:
+                if 'points' in ent:
+                    extra['points'] = points
+                    f |= _RAW_POINTS
+                count = 0
+            offsets[j + 1] = offsets[j] + count
+
+            if 'closed' in ent:
+                f |= _HAS_CLOSED
+                if ent['closed'] is True:
+                    f |= _CLOSED
+                elif ent['closed'] is not False:
+                    extra['closed'] = ent['closed']
+            if 'filled' in ent:
+                if ent['filled'] is True:
+                    f |= _FILLED
+                else:
+                    extra['filled'] = ent['filled']
+            layer_ids[j] = layers.id(ent.get('layer'))
+            color_ids[j] = colors.id(ent.get('color'))
+
+            first = points[0] if count else None
+            last = points[-1] if count else None
+            if count >= 2 and all(k in ent for k in ('x1', 'y1', 'x2', 'y2')) and \
+                    (ent['x1'], ent['y1'], ent['x2'], ent['y2']) == (first['x'], first['y'], last['x'], last['y']):
+                f |= _LINE_ENDS
+            if count and 'x' in ent and 'y' in ent and (ent['x'], ent['y']) == (first['x'], first['y']):
+                f |= _ANCHOR
+
+            for key, value in ent.items():
+                if key in _COLUMNAR_KEYS:
+                    continue
+                if f & _LINE_ENDS and key in ('x1', 'y1', 'x2', 'y2'):
+                    continue
+                if f & _ANCHOR and key in ('x', 'y'):
+                    continue
+                attr_keys.setdefault(key, []).append((j, value))
+            flags[j] = f
+            if extra:
+                extras[j] = extra
+
+        # Per-key attribute columns: strings (null = missing) or finite numbers present on every entity
+        attributes = {}
+        for key, values in attr_keys.items():
+            if all(type(v) is str for _, v in values):
+                column = [None] * n
+                for j, v in values:
+                    column[j] = v
+                attributes[key] = {'strings': column}
+            elif len(values) == n and all(_is_number(v) for _, v in values):
+                attributes[key] = {'numbers': sections.add([v for _, v in values], 'f64')}
+            else:
+                for j, v in values:
+                    extras.setdefault(j, {})[key] = v
+
+        groups.append({
+            'type': etype,
+            'count': n,
+            'index': sections.add(indices, 'u32'),
+            'offsets': sections.add(offsets, 'u32'),
+            'coords': sections.add(coords, 'f64'),
+            'layer': sections.add(layer_ids, 'u16' if len(layers.values) < 65536 else 'u32'),
+            'color': sections.add(color_ids, 'u16' if len(colors.values) < 65536 else 'u32'),
+            'flags': sections.add(flags, 'u8'),
+            'attributes': attributes,
+            'extras': {str(j): v for j, v in extras.items()},
+        })
+
+    raw_points = result.get('raw_points') or []
+    manifest = {
+        'version': VERSION,
+        'entityCount': len(entities),
+        'dict': {'layer': layers.values, 'color': colors.values},
+        'groups': groups,
+        'rawPoints': {
+            'ids': [p.get('id') for p in raw_points],
+            'coords': sections.add([v for p in raw_points for v in (p.get('x'), p.get('y'))], 'f64'),
+        },
+        'layers': result.get('layers') or [],
+    }
+    manifest_blob = json.dumps(manifest, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    head = struct.pack('<II', len(manifest_blob), 0) + manifest_blob
+    return b''.join([head, b'\0' * _pad(len(head))] + sections.parts)
+
+
+def frame(body, meta):
+    """Prefix a cached body with per-request metadata (fileName, fileType, ...)."""
+    meta_blob = json.dumps(meta, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    head = MAGIC + struct.pack('<I', len(meta_blob)) + meta_blob
+    return b''.join([head, b'\0' * _pad(len(head)), body])
+
+
+def decode(buf):
+    """Inverse of frame(encode_result(...)): returns the JSON-shaped result plus meta fields."""
+    view = memoryview(buf)
+    if bytes(view[:4]) != MAGIC:
+        raise ValueError('Not a CAD wire buffer')
+    meta_len = struct.unpack_from('<I', view, 4)[0]
+    meta = json.loads(bytes(view[8:8 + meta_len]))
+    body = 8 + meta_len
+    body += _pad(body)
+    manifest_len = struct.unpack_from('<I', view, body)[0]
+    manifest = json.loads(bytes(view[body + 8:body + 8 + manifest_len]))
+    data = body + 8 + manifest_len
+    data += _pad(data - body)
+
+    def section(desc):
+        offset, count, dtype = desc
+        return np.frombuffer(view, dtype=_DTYPES[dtype], count=count, offset=data + offset)
+
+    layer_names = manifest['dict']['layer']
+    color_names = manifest['dict']['color']
+    entities = [None] * manifest['entityCount']
+    for group in manifest['groups']:
+        index, offsets, coords = section(group['index']), section(group['offsets']), section(group['coords'])
+        layer_ids, color_ids, flags = section(group['layer']), section(group['color']), section(group['flags'])
+        columns = {k: (a['strings'] if 'strings' in a else section(a['numbers']).tolist())
+                   for k, a in group['attributes'].items()}
+        extras = group['extras']
+        for j in range(group['count']):
+            f = int(flags[j])
+            ent = {'type': group['type']}
+            extra = extras.get(str(j), {})
+            if f & _RAW_POINTS:
+                ent['points'] = extra['points']
+            elif 'points' not in extra:
+                xy = coords[int(offsets[j]) * 2:int(offsets[j + 1]) * 2].tolist()
+                ent['points'] = [{'x': xy[k], 'y': xy[k + 1]} for k in range(0, len(xy), 2)]
+            if f & _HAS_CLOSED:
+                ent['closed'] = bool(f & _CLOSED)
+            if f & _FILLED:
+                ent['filled'] = True
+            ent['layer'] = layer_names[int(layer_ids[j])]
+            ent['color'] = color_names[int(color_ids[j])]
+            pts = ent.get('points')
+            if f & _LINE_ENDS:
+                ent.update(x1=pts[0]['x'], y1=pts[0]['y'], x2=pts[-1]['x'], y2=pts[-1]['y'])
+            if f & _ANCHOR:
+                ent.update(x=pts[0]['x'], y=pts[0]['y'])
+            for key, column in columns.items():
+                if column[j] is not None:
+                    ent[key] = column[j]
+            ent.update((k, v) for k, v in extra.items() if k != 'points')
+            entities[int(index[j])] = ent
+
+    raw = manifest['rawPoints']
+    raw_xy = section(raw['coords']).tolist()
+    raw_points = [{'id': pid, 'x': raw_xy[2 * k], 'y': raw_xy[2 * k + 1]} for k, pid in enumerate(raw['ids'])]
+    return dict(meta, entities=entities, raw_points=raw_points, layers=manifest['layers'])
@@ -0,0 +1,416 @@
+"""
+DWG -> DXF Conversion for Parcel Tools
+Converts DWG drawings with AutoCAD Core Console, ODA File Converter or AutoCAD COM,
+and keeps each converted DXF in a cache directory named after the DWG's content
+hash (size-bounded, least recently used evicted first; DXFs being parsed or used in
+the last keep_recent seconds are never evicted). With warm=True a single
+worker thread keeps one COM session open and batches queued conversions into one
+ODA File Converter run.
+"""
+
+import glob
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+from cad_cache import file_digest
+
+ODA_ENV_VAR = 'PARCEL_TOOLS_ODA_CONVERTER'
+_DXF_NAME = 'input.dxf'
+_STALE_WORKDIR_SECONDS = 3600
+
+
+def log_debug(msg):
+    print(f"[dwg-convert] {msg}")
+
+
+def find_oda_converter():
+    """ODA File Converter executable: $PARCEL_TOOLS_ODA_CONVERTER, the default install dirs, then PATH."""
+    candidates = [
+        os.environ.get(ODA_ENV_VAR),
+        r"C:\Program Files\ODA\ODAFileConverter\ODAFileConverter.exe",
+        r"C:\Program Files (x86)\ODA\ODAFileConverter\ODAFileConverter.exe",
+        shutil.which("ODAFileConverter"),
+    ]
+    return next((p for p in candidates if p and os.path.isfile(p)), None)
+
+
+def find_accoreconsole():
+    if sys.platform != "win32":
+        return None
+    accore_candidates = glob.glob(r"C:\Program Files\Autodesk\AutoCAD *\accoreconsole.exe")
+    log_debug(f"AutoCAD accoreconsole candidates: {accore_candidates}")
+    return next((p for p in accore_candidates if os.path.isfile(p)), None)
+
+
+class _Job:
+    __slots__ = ('digest', 'dwg_path', 'future')
+
+    def __init__(self, digest, dwg_path):
+        self.digest = digest
+        self.dwg_path = dwg_path
+        self.future = Future()
+
+
+class _ComSession:
+    """AutoCAD COM connection, opened on first use and reused by the thread that owns it."""
+
+    def __init__(self):
+        self.acad = None
+
+    def convert(self, dwg_path, dxf_out):
+        # pyrefly: ignore [missing-import]
+        import win32com.client
+        # pyrefly: ignore [missing-import]
+        import pythoncom
+        if self.acad is None:
+            pythoncom.CoInitialize()
+            try:
+                self.acad = win32com.client.GetActiveObject("AutoCAD.Application")
+            except Exception:
+                self.acad = win32com.client.Dispatch("AutoCAD.Application")
+                self.acad.Visible = False
+
+        # Open Read-Only to avoid locking issues if the user already has the file open
+        try:
+            doc = self.acad.Documents.Open(os.path.abspath(dwg_path), True)
+        except Exception:
+            self.acad = None  # session died (AutoCAD closed) - reconnect next time
+            raise
+
+        # Suppress all dialogs and warnings (EXPERT=5 suppresses the custom objects version conflict dialog)
+        try:
+            doc.SetVariable("FILEDIA", 0)
+            doc.SetVariable("CMDDIA", 0)
+            doc.SetVariable("EXPERT", 5)
+            doc.SetVariable("PROXYGRAPHICS", 1)
+            doc.SetVariable("PROXYNOTICE", 0)
+        except Exception:
+            pass
+
+        # Try saving as DXF using newer to older formats
+        # 65 = AC2018 DXF, 61 = AC2013 DXF, 49 = AC2010 DXF, 37 = AC2007 DXF, 13 = AC2000 DXF
+        saved = False
+        for fmt_code in [65, 61, 49, 37, 13]:
+            try:
+                doc.SaveAs(os.path.abspath(dxf_out), fmt_code)
+                saved = True
+                break
+            except Exception:
+                continue
+
+        doc.Close(False)
+
+        if not (saved and os.path.isfile(dxf_out)):
+            raise RuntimeError("AutoCAD rejected the save formats or the file was locked.")
+
+
+class DwgConverter:
+    """
+    Cached DWG -> DXF converter. convert() returns the path of a DXF inside
+    cache_dir/<content hash>/, converting only when that hash hasn't been seen;
+    converted() does the same and keeps the DXF from being evicted while in use.
+    oda_path overrides ODA File Converter discovery (see find_oda_converter).
+    """
+
+    def __init__(self, cache_dir, max_bytes=2 * 1024 * 1024 * 1024, oda_path=None, warm=False,
+                 batch_window=0.25, timeout=60, keep_recent=300):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.keep_recent = keep_recent
+        self.oda_path = oda_path
+        self.warm = warm
+        self.batch_window = batch_window
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._leases = {}  # digest -> readers of its cached DXF
+        self._queue = queue.Queue()
+        self._worker = None
+        self.stats = {'hits': 0, 'converted': 0, 'oda_runs': 0}
+
+    def cached_dxf(self, digest):
+        return os.path.join(self.cache_dir, digest, _DXF_NAME)
+
+    def convert(self, dwg_path):
+        """Return the absolute path of a DXF for dwg_path. Raises RuntimeError if no converter works."""
+        return self._convert(dwg_path, file_digest(dwg_path))
+
+    @contextmanager
+    def converted(self, dwg_path):
+        """convert() for the duration of a with-block: the DXF is not evicted until it exits."""
+        digest = file_digest(dwg_path)
+        with self._lock:
+            self._leases[digest] = self._leases.get(digest, 0) + 1
+        try:
+            yield self._convert(dwg_path, digest)
+        finally:
+            with self._lock:
+                self._leases[digest] -= 1
+                if not self._leases[digest]:
+                    del self._leases[digest]
+
+    def _convert(self, dwg_path, digest):
+        log_debug(f"=== Starting conversion: {dwg_path} ===")
+        dxf_out = self.cached_dxf(digest)
+        if os.path.isfile(dxf_out):
+            self._touch(dxf_out)
+            with self._lock:
+                self.stats['hits'] += 1
+            log_debug(f"Cache hit: {dxf_out}")
+            return dxf_out
+
+        # Concurrent requests for the same drawing share one conversion
+        with self._lock:
+            job = self._inflight.get(digest)
+            owner = job is None
+            if owner:
+                job = self._inflight[digest] = _Job(digest, dwg_path)
+        if owner:
+            if self.warm:
+                self._ensure_worker()
+                self._queue.put(job)
+            else:
+                self._run_batch([job], _ComSession())
+        return job.future.result()
+
+    def close(self):
+        if self._worker is not None:
+            self._queue.put(None)
+
+    # -- conversion --------------------------------------------------------
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._worker_loop, name='DwgConverter', daemon=True)
+                self._worker.start()
+
+    def _worker_loop(self):
+        session = _ComSession()  # stays open across conversions
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            batch = [job]
+            deadline = time.monotonic() + self.batch_window
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    more = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if more is None:
+                    self._queue.put(None)
+                    break
+                batch.append(more)
+            self._run_batch(batch, session)
+
+    def _run_batch(self, jobs, session):
+        pending = list(jobs)
+        errors = {}
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._sweep_workdirs()
+
+            # Method 1: AutoCAD Core Console (completely silent command-line converter)
+            accore_exe = find_accoreconsole()
+            log_debug(f"Selected accore_exe: {accore_exe}")
+            if accore_exe:
+                pending = [job for job in pending if not self._try_accore(accore_exe, job)]
+
+            # Method 2: ODA File Converter, one run for the whole batch
+            oda_exe = self.oda_path or find_oda_converter()
+            if pending and oda_exe:
+                pending = self._try_oda(oda_exe, pending, errors)
+
+            # Method 3: AutoCAD COM (fallback if Core Console/ODA not available)
+            if pending and sys.platform == "win32":
+                pending = [job for job in pending if not self._try_com(session, job, errors)]
+        except Exception as e:
+            for job in pending:
+                errors.setdefault(job.digest, str(e))
+
+        for job in jobs:
+            with self._lock:
+                self._inflight.pop(job.digest, None)
+            if job in pending:
+                job.future.set_exception(RuntimeError(self._failure_message(errors.get(job.digest))))
+            else:
+                with self._lock:
+                    self.stats['converted'] += 1
+                job.future.set_result(self.cached_dxf(job.digest))
+        if len(pending) < len(jobs):
+            self._evict()
+
+    def _workdir(self, label):
+        work = os.path.join(self.cache_dir, f'{label}.partial-{os.getpid()}-{threading.get_ident()}')
+        shutil.rmtree(work, ignore_errors=True)
+        os.makedirs(work)
+        return work
+
+    def _stage_input(self, job, work):
+        # Copy to an ASCII path as "input.dwg" to bypass Unicode file path bugs in AutoCAD COM and ODA
+        temp_in_dir = os.path.join(work, "input_files")
+        os.makedirs(temp_in_dir, exist_ok=True)
+        temp_dwg_path = os.path.join(temp_in_dir, "input.dwg")
+        shutil.copy2(job.dwg_path, temp_dwg_path)
+        return temp_dwg_path
+
+    def _publish(self, job, produced_dxf):
+        """Move a finished DXF into cache_dir/<digest>/ (first writer wins)."""
+        final_dir = os.path.join(self.cache_dir, job.digest)
+        staging = self._workdir(job.digest + '-out')
+        os.replace(produced_dxf, os.path.join(staging, _DXF_NAME))
+        try:
+            os.replace(staging, final_dir)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            if not os.path.isfile(self.cached_dxf(job.digest)):
+                raise
+
+    def _try_accore(self, accore_exe, job):
+        work = self._workdir(job.digest)
+        try:
+            temp_dwg_path = self._stage_input(job, work)
+            dxf_out = os.path.join(work, _DXF_NAME)
+            script_path = os.path.join(work, "export.scr")
+            with open(script_path, "w", encoding="utf-8") as scr:
+                # _DXFOUT -> output path -> 16 (decimal accuracy) -> _QUIT -> N (do not save changes)
+                scr.write(f'_DXFOUT\n"{os.path.abspath(dxf_out)}"\n16\n_QUIT\nN\n')
+            proc_res = subprocess.run(
+                [accore_exe, "/i", os.path.abspath(temp_dwg_path), "/s", script_path],
+                check=True, capture_output=True, timeout=40
+            )
+            log_debug(f"accoreconsole stdout: {proc_res.stdout.decode(errors='replace')}")
+            if os.path.isfile(dxf_out):
+                self._publish(job, dxf_out)
+                log_debug(f"Conversion successful via accoreconsole: {job.dwg_path}")
+                return True
+            log_debug(f"dxf_out file was not generated: {dxf_out}")
+        except Exception as e:
+            log_debug(f"AutoCAD Core Console conversion failed with exception: {e}")
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+        return False
+
+    def _try_oda(self, oda_exe, jobs, errors):
+        work = self._workdir('oda-batch')
+        in_dir = os.path.join(work, 'in')
+        out_dir = os.path.join(work, 'out')
+        os.makedirs(in_dir)
+        os.makedirs(out_dir)
+        try:
+            for job in jobs:
+                shutil.copy2(job.dwg_path, os.path.join(in_dir, job.digest + '.dwg'))
+            with self._lock:
+                self.stats['oda_runs'] += 1
+            try:
+                subprocess.run(
+                    [oda_exe, in_dir, out_dir, "ACAD2018", "DXF", "0", "1", "*.dwg"],
+                    check=True, capture_output=True, timeout=self.timeout * len(jobs)
+                )
+            except subprocess.CalledProcessError as e:
+                message = f"ODA conversion failed: {(e.stderr or b'').decode(errors='replace')}"
+                for job in jobs:
+                    errors[job.digest] = message
+                return list(jobs)
+            except subprocess.TimeoutExpired as e:
+                # Leave the whole batch to the AutoCAD COM fallback
+                message = f"ODA conversion failed: timed out after {e.timeout:.0f}s"
+                for job in jobs:
+                    errors[job.digest] = message
+                return list(jobs)
+
+            remaining = []
+            for job in jobs:
+                produced = os.path.join(out_dir, job.digest + '.dxf')
+                if os.path.isfile(produced):
+                    self._publish(job, produced)
+                    print(f"[parse-cad] DWG→DXF via ODA: {job.dwg_path}")
+                else:
+                    remaining.append(job)
+            return remaining
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+    def _try_com(self, session, job, errors):
+        work = self._workdir(job.digest)
+        try:
+            temp_dwg_path = self._stage_input(job, work)
+            dxf_out = os.path.join(work, _DXF_NAME)
+            session.convert(temp_dwg_path, dxf_out)
+            self._publish(job, dxf_out)
+            print(f"[parse-cad] DWG→DXF via AutoCAD COM: {job.dwg_path}")
+            return True
+        except Exception as e:
+            errors[job.digest] = f"AutoCAD Error: {e}"
+            print(f"[parse-cad] AutoCAD COM unavailable: {e}")
+            return False
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+    @staticmethod
+    def _failure_message(detail):
+        if detail and detail.startswith('ODA conversion failed'):
+            return detail
+        error_msg = "Could not convert DWG file. "
+        if detail:
+            error_msg += f"\n{detail}"
+        error_msg += "\n\nPlease either:\n• Keep AutoCAD OPEN on your computer while importing\n• OR Download the free ODA File Converter."
+        return error_msg
+
+    # -- cache housekeeping ------------------------------------------------
+
+    @staticmethod
+    def _touch(path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _sweep_workdirs(self):
+        """Remove work directories left behind by a crashed conversion."""
+        cutoff = time.time() - _STALE_WORKDIR_SECONDS
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for e in it:
+                    if '.partial-' in e.name and e.stat().st_mtime < cutoff:
+                        shutil.rmtree(e.path, ignore_errors=True)
+        except OSError:
+            pass
+
+    def _evict(self):
+        with self._lock:
+            leased = set(self._leases) | set(self._inflight)
+        recent = time.time() - self.keep_recent
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for e in it:
+                    if not e.is_dir() or '.partial-' in e.name:
+                        continue
+                    try:
+                        st = os.stat(os.path.join(e.path, _DXF_NAME))
+                    except OSError:
+                        shutil.rmtree(e.path, ignore_errors=True)  # incomplete entry
+                        continue
+                    entries.append((st.st_mtime, st.st_size, e.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_bytes or mtime >= recent:
+                break
+            if os.path.basename(path) in leased:
+                continue  # handed out by convert() and still being read
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
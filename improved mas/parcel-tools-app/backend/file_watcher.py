@@ -0,0 +1,297 @@
+"""
+File Watcher Service for Parcel Tools
+Push-based change notification for points / project files: one inotify watch per
+directory on Linux, otherwise a single shared stat thread for every watched file
+"""
+
+import os
+import sys
+import queue
+import select
+import struct
+import threading
+import time
+import ctypes
+import ctypes.util
+
+# inotify event masks (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_IGNORED = 0x00008000
+_IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_DIR_MASK = (_IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM |
+             _IN_MOVED_TO | _IN_CREATE | _IN_DELETE)
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+def _load_inotify():
+    """Return libc with inotify bound, or None where inotify is unavailable."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+def _norm(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _signature(path):
+    """(size, mtime_ns) of path, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+        return (st.st_size, st.st_mtime_ns)
+    except OSError:
+        return None
+
+
+class FileWatcher:
+    """
+    Watches individual files and runs their callbacks (on the watcher thread)
+    whenever the file's size / mtime signature changes.
+    Bursts of writes are coalesced for `settle` seconds before callbacks fire.
+    """
+
+    def __init__(self, poll_interval=1.0, settle=0.15, use_inotify=True):
+        self.poll_interval = poll_interval
+        self.settle = settle
+        self._lock = threading.Lock()
+        self._files = {}      # norm path -> {'path', 'sig', 'callbacks': {handle: fn}}
+        self._handles = {}    # handle -> norm path
+        self._next_handle = 1
+        self._thread = None
+        self._stop = threading.Event()
+
+        self._libc = _load_inotify() if use_inotify else None
+        self._fd = None
+        self._wake_r = self._wake_w = None
+        self._dir_wd = {}     # norm dir -> wd
+        self._wd_dir = {}     # wd -> norm dir
+        self._dir_refs = {}   # norm dir -> number of watched files in it
+        self._pending = {}    # norm path -> deadline (inotify settle window)
+        if self._libc is not None:
+            fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            if fd < 0:
+                self._libc = None
+            else:
+                self._fd = fd
+                self._wake_r, self._wake_w = os.pipe()
+
+    @property
+    def backend(self):
+        return 'inotify' if self._fd is not None else 'stat'
+
+    def add(self, path, callback):
+        """Watch path; callback(path) runs after each change. Returns a handle for remove()."""
+        key = _norm(path)
+        with self._lock:
+            handle = self._next_handle
+            self._next_handle += 1
+            entry = self._files.get(key)
+            if entry is None:
+                entry = {'path': os.path.abspath(path), 'sig': _signature(path), 'callbacks': {}}
+                self._files[key] = entry
+                if self._fd is not None:
+                    self._add_dir_watch(os.path.dirname(key))
+            entry['callbacks'][handle] = callback
+            self._handles[handle] = key
+            self._ensure_thread()
+        return handle
+
+    def remove(self, handle):
+        """Drop one registration; the OS watch goes away with the last file in its directory."""
+        with self._lock:
+            key = self._handles.pop(handle, None)
+            entry = self._files.get(key) if key else None
+            if entry is None:
+                return
+            entry['callbacks'].pop(handle, None)
+            if not entry['callbacks']:
+                del self._files[key]
+                self._pending.pop(key, None)
+                if self._fd is not None:
+                    self._release_dir_watch(os.path.dirname(key))
+
+    def watched_paths(self):
+        with self._lock:
+            return [entry['path'] for entry in self._files.values()]
+
+    def close(self):
+        self._stop.set()
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b'x')
+            except OSError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._fd = self._wake_r = self._wake_w = None
+
+    # -- internals ---------------------------------------------------------
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            target = self._run_inotify if self._fd is not None else self._run_stat
+            self._thread = threading.Thread(target=target, name='FileWatcher', daemon=True)
+            self._thread.start()
+
+    def _add_dir_watch(self, directory):
+        refs = self._dir_refs.get(directory, 0)
+        self._dir_refs[directory] = refs + 1
+        if refs:
+            return
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _DIR_MASK)
+        if wd >= 0:
+            self._dir_wd[directory] = wd
+            self._wd_dir[wd] = directory
+
+    def _release_dir_watch(self, directory):
+        refs = self._dir_refs.get(directory, 0) - 1
+        if refs > 0:
+            self._dir_refs[directory] = refs
+            return
+        self._dir_refs.pop(directory, None)
+        wd = self._dir_wd.pop(directory, None)
+        if wd is not None:
+            self._wd_dir.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _fire(self, keys):
+        """Run callbacks for keys whose signature actually changed."""
+        due = []
+        with self._lock:
+            for key in keys:
+                entry = self._files.get(key)
+                if entry is None:
+                    continue
+                sig = _signature(entry['path'])
+                if sig == entry['sig']:
+                    continue
+                entry['sig'] = sig
+                due.append((entry['path'], list(entry['callbacks'].values())))
+        for path, callbacks in due:
+            for callback in callbacks:
+                try:
+                    callback(path)
+                except Exception as e:
+                    print(f'[Watcher] Callback error for {path}: {e}')
+
+    def _run_stat(self):
+        while not self._stop.wait(self.poll_interval):
+            with self._lock:
+                keys = list(self._files.keys())
+            self._fire(keys)
+
+    def _run_inotify(self):
+        while not self._stop.is_set():
+            with self._lock:
+                deadline = min(self._pending.values()) if self._pending else None
+                # Directories that failed to watch (e.g. created later) are stat-checked
+                unwatched = [k for k in self._files if os.path.dirname(k) not in self._dir_wd]
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.monotonic())
+            if unwatched:
+                timeout = self.poll_interval if timeout is None else min(timeout, self.poll_interval)
+            try:
+                readable, _, _ = select.select([self._fd, self._wake_r], [], [], timeout)
+            except (OSError, ValueError):
+                return
+            if self._wake_r in readable:
+                return
+            if self._fd in readable:
+                self._drain_inotify()
+
+            now = time.monotonic()
+            with self._lock:
+                due = [k for k, t in self._pending.items() if t <= now]
+                for k in due:
+                    del self._pending[k]
+            self._fire(due + unwatched)
+
+    def _drain_inotify(self):
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        except OSError:
+            return
+        deadline = time.monotonic() + self.settle
+        offset = 0
+        with self._lock:
+            while offset + _EVENT_HEADER.size <= len(buf):
+                wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(buf, offset)
+                name = buf[offset + _EVENT_HEADER.size: offset + _EVENT_HEADER.size + name_len].rstrip(b'\0')
+                offset += _EVENT_HEADER.size + name_len
+                if mask & _IN_Q_OVERFLOW:
+                    for key in self._files:
+                        self._pending[key] = deadline
+                    continue
+                directory = self._wd_dir.get(wd)
+                if directory is None:
+                    continue
+                if mask & _IN_IGNORED:
+                    # Directory itself was removed; fall back to stat checks for its files
+                    self._wd_dir.pop(wd, None)
+                    self._dir_wd.pop(directory, None)
+                    continue
+                key = _norm(os.path.join(directory, os.fsdecode(name)))
+                if key in self._files:
+                    self._pending[key] = deadline
+
+
+class EventHub:
+    """Fan-out of change events to every subscriber queue (one per SSE stream)."""
+
+    def __init__(self, max_pending=256):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._max_pending = max_pending
+
+    def subscribe(self):
+        q = queue.Queue(maxsize=self._max_pending)
+        with self._lock:
+            self._subscribers.add(q)
+        return q
+
+    def unsubscribe(self, q):
+        with self._lock:
+            self._subscribers.discard(q)
+
+    def publish(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for q in subscribers:
+            try:
+                q.put_nowait(event)
+            except queue.Full:
+                # Slow consumer: drop its backlog and tell it to resync from scratch
+                try:
+                    while True:
+                        q.get_nowait()
+                except queue.Empty:
+                    pass
+                q.put_nowait({'type': 'resync'})
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
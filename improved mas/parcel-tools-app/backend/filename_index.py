@@ -0,0 +1,215 @@
+"""
+Filename Index for Parcel Tools
+Background-built, persisted map of file name -> paths for project, points and CAD
+files under the usual user folders, so a moved or corrupted path is recovered with
+a dictionary lookup instead of an os.walk inside the request.
+Rescans are incremental: a directory is only listed again when its mtime changed.
+"""
+
+import json
+import os
+import threading
+import time
+
+INDEXED_EXTENSIONS = ('.prcl', '.pnt', '.txt', '.csv', '.dxf', '.dwg')
+_FORMAT = 1
+
+
+def _name_key(name):
+    return os.path.normcase(name)
+
+
+class FilenameIndex:
+    """
+    Name -> [paths] index over `roots` (listed in lookup priority order).
+    The directory tree is kept as {dir: (mtime_ns, [indexed files], [subdirs])} and
+    written to `store_path` after every scan, so a restart is ready immediately.
+    """
+
+    def __init__(self, store_path, roots, extensions=INDEXED_EXTENSIONS, rescan_interval=300.0,
+                 min_rescan_gap=30.0):
+        self.store_path = store_path
+        self.roots = [os.path.abspath(r) for r in roots]
+        self.extensions = tuple(e.lower() for e in extensions)
+        self.rescan_interval = rescan_interval
+        self.min_rescan_gap = min_rescan_gap
+        self._lock = threading.Lock()
+        self._scan_lock = threading.Lock()
+        self._dirs = {}
+        self._names = {}
+        self._ready = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+        self._last_scan = 0.0
+        self.stats = {'scans': 0, 'listed': 0}
+        self._load()
+
+    @property
+    def ready(self):
+        return self._ready.is_set()
+
+    # -- lookups -----------------------------------------------------------
+
+    def lookup(self, name):
+        """All indexed paths that still exist for a file name, highest-priority root first."""
+        if not name:
+            return []
+        self.start()
+        with self._lock:
+            paths = list(self._names.get(_name_key(os.path.basename(name)), ()))
+        found = [p for p in paths if os.path.isfile(p)]
+        if len(found) < len(paths) or not found:
+            # Stale or missing entry: let the background thread catch up
+            self.request_rescan()
+        found.sort(key=self._priority)
+        return found
+
+    def find(self, name, timeout=0.0):
+        """Best existing path for a file name, or None. Waits up to `timeout` for the first build."""
+        if timeout and not self.ready:
+            self.start()
+            self._ready.wait(timeout)
+        found = self.lookup(name)
+        return found[0] if found else None
+
+    def note(self, path):
+        """Record a path the app just saved or opened, ahead of the next rescan."""
+        if not path or not path.lower().endswith(self.extensions):
+            return
+        path = os.path.abspath(path)
+        with self._lock:
+            paths = self._names.setdefault(_name_key(os.path.basename(path)), [])
+            if path not in paths:
+                paths.append(path)
+
+    def _priority(self, path):
+        key = os.path.normcase(path)
+        for rank, root in enumerate(self.roots):
+            if key.startswith(os.path.normcase(os.path.join(root, ''))):
+                return rank
+        return len(self.roots)
+
+    # -- scanning ----------------------------------------------------------
+
+    def rescan(self):
+        """Walk the roots, re-listing only directories whose mtime changed. Returns the file count."""
+        with self._scan_lock:
+            with self._lock:
+                old = self._dirs
+            new = {}
+            for root in self._top_roots():
+                self._walk(root, old, new)
+
+            names = {}
+            for directory, (_, files, _) in new.items():
+                for f in files:
+                    names.setdefault(_name_key(f), []).append(os.path.join(directory, f))
+            with self._lock:
+                self._dirs = new
+                self._names = names
+            self._last_scan = time.time()
+            self.stats['scans'] += 1
+            self._ready.set()
+            self._save()
+            return sum(len(v) for v in names.values())
+
+    def _top_roots(self):
+        """Roots with nested duplicates removed (e.g. OneDrive/share/dwg inside OneDrive)."""
+        tops = []
+        for root in sorted(set(self.roots), key=len):
+            if not any(os.path.normcase(root).startswith(os.path.normcase(os.path.join(t, ''))) for t in tops):
+                tops.append(root)
+        return tops
+
+    def _walk(self, root, old, new):
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            entry = old.get(directory)
+            if entry is None or entry[0] != mtime_ns:
+                entry = self._list(directory, mtime_ns)
+                if entry is None:
+                    continue
+            new[directory] = entry
+            stack.extend(os.path.join(directory, d) for d in entry[2])
+
+    def _list(self, directory, mtime_ns):
+        files, subdirs = [], []
+        try:
+            with os.scandir(directory) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            subdirs.append(e.name)
+                        elif e.name.lower().endswith(self.extensions):
+                            files.append(e.name)
+                    except OSError:
+                        continue
+        except OSError as e:
+            print(f'[Filename Index] Cannot list {directory}: {e}')
+            return None
+        self.stats['listed'] += 1
+        return (mtime_ns, files, subdirs)
+
+    # -- background thread -------------------------------------------------
+
+    def start(self):
+        """Start the background build / periodic rescan thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='FilenameIndex', daemon=True)
+            self._thread.start()
+
+    def request_rescan(self):
+        """Ask for an early rescan (rate-limited to one per min_rescan_gap seconds)."""
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            try:
+                self.rescan()
+            except Exception as e:
+                print(f'[Filename Index] Rescan failed: {e}')
+                self._ready.set()
+            self._wake.wait(self.rescan_interval)
+            self._wake.clear()
+            gap = self._last_scan + self.min_rescan_gap - time.time()
+            if gap > 0:
+                time.sleep(gap)
+
+    # -- persistence -------------------------------------------------------
+
+    def _load(self):
+        try:
+            with open(self.store_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') != _FORMAT:
+                return
+            dirs = {d: (int(e[0]), list(e[1]), list(e[2])) for d, e in data.get('dirs', {}).items()}
+        except (OSError, ValueError, TypeError, IndexError, AttributeError):
+            return
+        names = {}
+        for directory, (_, files, _) in dirs.items():
+            for f in files:
+                names.setdefault(_name_key(f), []).append(os.path.join(directory, f))
+        self._dirs = dirs
+        self._names = names
+        self._ready.set()
+
+    def _save(self):
+        with self._lock:
+            payload = {'format': _FORMAT, 'savedAt': time.time(),
+                       'dirs': {d: [e[0], e[1], e[2]] for d, e in self._dirs.items()}}
+        tmp = f'{self.store_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.store_path) or '.', exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp, self.store_path)
+        except OSError as e:
+            print(f'[Filename Index WARNING] Could not persist index: {e}')
@@ -0,0 +1,193 @@
+"""
+Vectorized Geometry Kernel for Parcel Tools
+Computes shoelace area, perimeter, centroid and curve-segment corrections for
+many parcels in one NumPy pass over columnar input (flat coordinates + ring offsets)
+"""
+
+import numpy as np
+
+
+def _empty_curves():
+    return {
+        'ring': np.zeros(0, dtype=np.int64),
+        'x1': np.zeros(0), 'y1': np.zeros(0),
+        'x2': np.zeros(0), 'y2': np.zeros(0),
+        'm': np.zeros(0),
+        'sign': np.zeros(0),
+    }
+
+
+def polygon_metrics(xs, ys, offsets, curves=None):
+    """
+    Evaluate every ring in one pass.
+    - xs, ys: flat float64 vertex coordinates of all rings, ring after ring
+    - offsets: int array of length n_rings + 1; ring k owns xs[offsets[k]:offsets[k+1]]
+    - curves: optional columnar dict {ring, x1, y1, x2, y2, m, sign} describing
+      circular segments to add (sign > 0) or remove (sign < 0) on a chord
+    Rings with fewer than 3 vertices get zero base area and perimeter.
+    Returns a dict of per-ring arrays plus per-curve chord/radius/segment arrays.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    n_rings = len(offsets) - 1
+    counts = np.diff(offsets)
+
+    base_area = np.zeros(n_rings)
+    perimeter = np.zeros(n_rings)
+    cx = np.zeros(n_rings)
+    cy = np.zeros(n_rings)
+
+    if len(xs):
+        ring_of = np.repeat(np.arange(n_rings), counts)
+        nxt = np.arange(len(xs)) + 1
+        non_empty = counts > 0
+        nxt[offsets[1:][non_empty] - 1] = offsets[:-1][non_empty]
+
+        x_next = xs[nxt]
+        y_next = ys[nxt]
+        sum1 = np.bincount(ring_of, weights=xs * y_next, minlength=n_rings)
+        sum2 = np.bincount(ring_of, weights=x_next * ys, minlength=n_rings)
+        legs = np.bincount(ring_of, weights=np.hypot(x_next - xs, y_next - ys), minlength=n_rings)
+
+        valid = counts >= 3
+        base_area = np.where(valid, 0.5 * np.abs(sum1 - sum2), 0.0)
+        perimeter = np.where(valid, legs, 0.0)
+
+        safe_counts = np.maximum(counts, 1)
+        cx = np.bincount(ring_of, weights=xs, minlength=n_rings) / safe_counts
+        cy = np.bincount(ring_of, weights=ys, minlength=n_rings) / safe_counts
+
+    if curves is None:
+        curves = _empty_curves()
+    c_ring = np.asarray(curves['ring'], dtype=np.int64)
+    chord = np.hypot(np.asarray(curves['x2'], dtype=np.float64) - curves['x1'],
+                     np.asarray(curves['y2'], dtype=np.float64) - curves['y1'])
+    m = np.asarray(curves['m'], dtype=np.float64)
+    sign = np.asarray(curves['sign'], dtype=np.float64)
+
+    # Only curves with a positive sagitta on a non-degenerate chord contribute
+    active = (m > 0) & (chord > 0)
+    safe_m = np.where(active, m, 1.0)
+    radius = np.where(active, chord * chord / (8.0 * safe_m) + safe_m / 2.0, 0.0)
+    safe_r = np.where(active, radius, 1.0)
+    theta = 2.0 * np.arcsin(np.minimum(1.0, chord / (2.0 * safe_r)))
+    segment_area = np.where(active, 0.5 * safe_r * safe_r * (theta - np.sin(theta)), 0.0)
+    adjustment = segment_area * sign
+
+    curve_adjustment = np.bincount(c_ring, weights=adjustment, minlength=n_rings) if len(c_ring) else np.zeros(n_rings)
+
+    return {
+        'base_area': base_area,
+        'curve_adjustment': curve_adjustment,
+        'area': base_area + curve_adjustment,
+        'perimeter': perimeter,
+        'cx': cx,
+        'cy': cy,
+        'count': counts,
+        'curve_active': active,
+        'curve_chord': chord,
+        'curve_radius': radius,
+        'curve_segment_area': segment_area,
+        'curve_adjustment_each': adjustment,
+    }
+
+
+def _coord(point):
+    """Read (x, y) from a points-map value ({'x','y'} dict or (x, y) pair)."""
+    if isinstance(point, dict):
+        return float(point.get('x', 0)), float(point.get('y', 0))
+    return float(point[0]), float(point[1])
+
+
+def pack_id_parcels(parcels, points_map):
+    """
+    Build columnar kernel input for parcels that reference point IDs.
+    Mirrors the per-parcel lookup rules of the batch endpoint: unknown IDs count
+    as (0, 0), an exactly repeated closing vertex is dropped, and curves are
+    resolved by their 'from'/'to' point IDs.
+    """
+    xs, ys, offsets = [], [], [0]
+    c_ring, c_x1, c_y1, c_x2, c_y2, c_m, c_sign = [], [], [], [], [], [], []
+    coord_cache = {}
+
+    def lookup(pid):
+        pid_str = str(pid)
+        if pid_str not in coord_cache:
+            coord_cache[pid_str] = _coord(points_map[pid_str]) if pid_str in points_map else None
+        return coord_cache[pid_str]
+
+    for ring_idx, parcel in enumerate(parcels):
+        ring = [lookup(pid) or (0.0, 0.0) for pid in (parcel.get('ids') or [])]
+        if len(ring) > 3 and ring[0] == ring[-1]:
+            ring = ring[:-1]
+        for x, y in ring:
+            xs.append(x)
+            ys.append(y)
+        offsets.append(len(xs))
+
+        for curve in parcel.get('curves') or []:
+            try:
+                m = float(curve.get('M', 0))
+                sign = 1 if curve.get('sign', 1) == 1 else -1
+                p1 = lookup(curve.get('from'))
+                p2 = lookup(curve.get('to'))
+            except Exception:
+                continue  # Ignore malformed curves in batch
+            if p1 is None or p2 is None:
+                continue
+            c_ring.append(ring_idx)
+            c_x1.append(p1[0]); c_y1.append(p1[1])
+            c_x2.append(p2[0]); c_y2.append(p2[1])
+            c_m.append(m)
+            c_sign.append(sign)
+
+    curves = {
+        'ring': np.array(c_ring, dtype=np.int64),
+        'x1': np.array(c_x1, dtype=np.float64), 'y1': np.array(c_y1, dtype=np.float64),
+        'x2': np.array(c_x2, dtype=np.float64), 'y2': np.array(c_y2, dtype=np.float64),
+        'm': np.array(c_m, dtype=np.float64),
+        'sign': np.array(c_sign, dtype=np.float64),
+    }
+    return np.array(xs, dtype=np.float64), np.array(ys, dtype=np.float64), np.array(offsets, dtype=np.int64), curves
+
+
+def compute_id_parcels(parcels, points_map):
+    """Return a list of (area, perimeter) tuples, one per parcel, in input order."""
+    if not parcels:
+        return []
+    xs, ys, offsets, curves = pack_id_parcels(parcels, points_map)
+    metrics = polygon_metrics(xs, ys, offsets, curves)
+    return list(zip(metrics['area'].tolist(), metrics['perimeter'].tolist()))
+
+
+def pack_point_ring(points, curves):
+    """
+    Build columnar kernel input for a single ring given as coordinate dicts
+    (the /api/calculate-area payload). Curves reference vertex indices.
+    Curves that cannot apply (non-positive M, out-of-range index) are dropped.
+    """
+    xs = np.array([p['x'] for p in points], dtype=np.float64)
+    ys = np.array([p['y'] for p in points], dtype=np.float64)
+    n = len(points)
+
+    c_x1, c_y1, c_x2, c_y2, c_m, c_sign = [], [], [], [], [], []
+    for curve in curves or []:
+        m = float(curve.get('M', 0))
+        from_idx = curve.get('fromIndex', 0)
+        to_idx = curve.get('toIndex', 1)
+        if m > 0 and from_idx < n and to_idx < n:
+            c_x1.append(xs[from_idx]); c_y1.append(ys[from_idx])
+            c_x2.append(xs[to_idx]); c_y2.append(ys[to_idx])
+            c_m.append(m)
+            c_sign.append(float(curve.get('sign', 1)))
+
+    packed_curves = {
+        'ring': np.zeros(len(c_m), dtype=np.int64),
+        'x1': np.array(c_x1, dtype=np.float64), 'y1': np.array(c_y1, dtype=np.float64),
+        'x2': np.array(c_x2, dtype=np.float64), 'y2': np.array(c_y2, dtype=np.float64),
+        'm': np.array(c_m, dtype=np.float64),
+        'sign': np.array(c_sign, dtype=np.float64),
+    }
+    return xs, ys, np.array([0, n], dtype=np.int64), packed_curves
+
@@ -0,0 +1,188 @@
+"""
+Parallel Zip Writer for Parcel Tools
+Archive members are raw-deflated independently into spooled buffers, together with
+their CRC-32 and sizes, so they can be compressed on a thread pool (zlib and file
+reads release the GIL). The writer then stitches local headers, compressed data and
+the central directory into a standard zip, switching to zip64 records when sizes,
+offsets or the entry count need them.
+"""
+
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from collections import deque
+
+READ_CHUNK = 64 * 1024
+SPOOL_MEMORY = 4 * 1024 * 1024     # compressed members larger than this spill to a temp file
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP_FILECOUNT_LIMIT = 0xFFFF
+
+_ZIP_DEFLATED = 8
+_UTF8_FLAG = 0x800
+_CREATE_SYSTEM = 0 if sys.platform == 'win32' else 3
+
+
+class CompressedMember:
+    """One raw-deflated archive member, ready to be stitched into a zip."""
+
+    def __init__(self, name, date_time, external_attr):
+        self.name = name
+        self.date_time = date_time
+        self.external_attr = external_attr
+        self.crc = 0
+        self.size = 0
+        self.compressed_size = 0
+        self.data = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY)
+
+    def close(self):
+        self.data.close()
+
+
+def compress_member(name, source_path=None, data=None, level=6, on_chunk=None):
+    """
+    Raw-deflate a file on disk (streamed in READ_CHUNK blocks) or an in-memory bytes value
+    into a CompressedMember. on_chunk(bytes_read) runs after every block and may raise to abort.
+    """
+    if source_path is not None:
+        st = os.stat(source_path)
+        member = CompressedMember(name, time.localtime(st.st_mtime)[:6], (st.st_mode & 0xFFFF) << 16)
+    else:
+        member = CompressedMember(name, time.localtime(time.time())[:6], 0o600 << 16)
+    try:
+        deflater = zlib.compressobj(level, zlib.DEFLATED, -15)
+        crc, size, out = 0, 0, member.data
+
+        def feed(block):
+            nonlocal crc, size
+            crc = zlib.crc32(block, crc)
+            size += len(block)
+            out.write(deflater.compress(block))
+            if on_chunk:
+                on_chunk(len(block))
+
+        if source_path is not None:
+            with open(source_path, 'rb') as f:
+                while True:
+                    block = f.read(READ_CHUNK)
+                    if not block:
+                        break
+                    feed(block)
+        else:
+            view = memoryview(data)
+            for start in range(0, len(view), READ_CHUNK):
+                feed(view[start:start + READ_CHUNK])
+        out.write(deflater.flush())
+        member.crc, member.size, member.compressed_size = crc, size, out.tell()
+        out.seek(0)
+        return member
+    except Exception:
+        member.close()
+        raise
+
+
+def _dos_date_time(date_time):
+    year, month, day, hour, minute, second = date_time
+    if year < 1980:
+        year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+    elif year > 2107:
+        year, month, day, hour, minute, second = 2107, 12, 31, 23, 59, 59
+    return (year - 1980) << 9 | month << 5 | day, hour << 11 | minute << 5 | second // 2
+
+
+class ZipStitcher:
+    """Writes CompressedMembers one after another into a binary file object and closes the zip."""
+
+    def __init__(self, fileobj):
+        self.fp = fileobj
+        self.offset = 0
+        self.entries = []
+
+    def _write(self, data):
+        self.fp.write(data)
+        self.offset += len(data)
+
+    def add(self, member):
+        """Append one member (local header + deflated data); the member's buffer is closed afterwards."""
+        try:
+            name = member.name.encode('utf-8')
+            flags = 0 if member.name.isascii() else _UTF8_FLAG
+            date, dos_time = _dos_date_time(member.date_time)
+            header_offset = self.offset
+            extra = b''
+            size, csize = member.size, member.compressed_size
+            if size >= ZIP64_LIMIT or csize >= ZIP64_LIMIT:
+                extra = struct.pack('<HHQQ', 1, 16, size, csize)
+                size = csize = 0xFFFFFFFF
+            version = 45 if extra else 20
+            self._write(struct.pack('<IHHHHHIIIHH', 0x04034b50, version, flags, _ZIP_DEFLATED, dos_time, date,
+                                    member.crc, csize, size, len(name), len(extra)) + name + extra)
+            while True:
+                block = member.data.read(READ_CHUNK)
+                if not block:
+                    break
+                self._write(block)
+            self.entries.append((name, flags, dos_time, date, member.crc, member.size,
+                                 member.compressed_size, member.external_attr, header_offset))
+        finally:
+            member.close()
+
+    def close(self, comment=b''):
+        """Write the central directory (and zip64 end records if needed); returns the archive size."""
+        comment = comment[:0xFFFF]
+        cd_offset = self.offset
+        for name, flags, dos_time, date, crc, size, csize, external_attr, header_offset in self.entries:
+            fields = []
+            if size >= ZIP64_LIMIT:
+                fields.append(size)
+                size = 0xFFFFFFFF
+            if csize >= ZIP64_LIMIT:
+                fields.append(csize)
+                csize = 0xFFFFFFFF
+            if header_offset >= ZIP64_LIMIT:
+                fields.append(header_offset)
+                header_offset = 0xFFFFFFFF
+            extra = struct.pack('<HH', 1, 8 * len(fields)) + struct.pack(f'<{len(fields)}Q', *fields) if fields else b''
+            version = 45 if extra else 20
+            self._write(struct.pack('<IHHHHHHIIIHHHHHII', 0x02014b50, version | _CREATE_SYSTEM << 8, version,
+                                    flags, _ZIP_DEFLATED, dos_time, date, crc, csize, size, len(name), len(extra),
+                                    0, 0, 0, external_attr, header_offset) + name + extra)
+        cd_size = self.offset - cd_offset
+        count = len(self.entries)
+        if count >= ZIP_FILECOUNT_LIMIT or cd_offset >= ZIP64_LIMIT or cd_size >= ZIP64_LIMIT:
+            zip64_offset = self.offset
+            self._write(struct.pack('<IQHHIIQQQQ', 0x06064b50, 44, 45, 45, 0, 0, count, count, cd_size, cd_offset))
+            self._write(struct.pack('<IIQI', 0x07064b50, 0, zip64_offset, 1))
+            count, cd_size, cd_offset = min(count, 0xFFFF), min(cd_size, 0xFFFFFFFF), min(cd_offset, 0xFFFFFFFF)
+        self._write(struct.pack('<IHHHHIIH', 0x06054b50, 0, 0, count, count, cd_size, cd_offset, len(comment)) + comment)
+        return self.offset
+
+
+def _close_result(future):
+    if not future.cancelled() and future.exception() is None:
+        close = getattr(future.result(), 'close', None)
+        if close is not None:
+            close()
+
+
+def map_in_order(executor, fn, items, window):
+    """
+    executor.map() that keeps at most `window` tasks in flight and yields results in input
+    order, so finished members wait in memory for the writer only a bounded number at a time.
+    If the consumer stops early, waiting tasks are cancelled and the results of tasks already
+    running (e.g. CompressedMember spools) are closed once they finish.
+    """
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            if not future.cancel():
+                future.add_done_callback(_close_result)
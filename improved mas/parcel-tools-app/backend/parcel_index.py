@@ -0,0 +1,140 @@
+"""
+Point -> Parcel Dependency Index for Parcel Tools
+Keeps, per loaded project, a reverse index from point ID to the parcels whose
+vertices or curves use it, so a points-file reload only recomputes what moved
+"""
+
+import os
+import threading
+
+from geometry_kernel import compute_id_parcels
+
+
+def _xy(value):
+    """Normalize a points-map value to an (x, y) float tuple (None if unreadable)."""
+    try:
+        if isinstance(value, dict):
+            return float(value.get('x', 0)), float(value.get('y', 0))
+        return float(value[0]), float(value[1])
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def diff_point_maps(old_points, new_points):
+    """
+    Compare two points maps (id -> {'x','y'} or (x, y)).
+    Returns {'added': [...], 'removed': [...], 'moved': [...]} lists of point IDs.
+    """
+    old_keys = old_points.keys()
+    new_keys = new_points.keys()
+    added = [pid for pid in new_keys if pid not in old_points]
+    removed = [pid for pid in old_keys if pid not in new_points]
+    moved = [pid for pid in new_keys
+             if pid in old_points and _xy(old_points[pid]) != _xy(new_points[pid])]
+    return {'added': added, 'removed': removed, 'moved': moved}
+
+
+def _parcel_key(parcel, position):
+    key = parcel.get('id')
+    return key if key is not None else position
+
+
+class ParcelDependencyIndex:
+    """
+    Reverse index for one project: point ID -> keys of parcels that use it.
+    Parcels are copied in, so recomputed areas never touch the caller's dicts (e.g. a
+    project snapshot still waiting in the save queue).
+    version is the caller's token for the parcel set it was built from (None if unknown),
+    echoed with every recompute so the caller can tell whether the index still matches its parcels.
+    """
+
+    def __init__(self, parcels, points_map, points_file_path=None, version=None):
+        self.points_file_path = points_file_path
+        self.version = version
+        self.project_path = None
+        self.parcels = {}
+        self.point_to_parcels = {}
+        self.points = {str(k): v for k, v in (points_map or {}).items()}
+
+        for position, parcel in enumerate(parcels or []):
+            if not isinstance(parcel, dict):
+                continue
+            key = _parcel_key(parcel, position)
+            self.parcels[key] = parcel = dict(parcel)
+            refs = {str(pid) for pid in (parcel.get('ids') or [])}
+            for curve in parcel.get('curves') or []:
+                if isinstance(curve, dict):
+                    refs.add(str(curve.get('from')))
+                    refs.add(str(curve.get('to')))
+            for pid in refs:
+                self.point_to_parcels.setdefault(pid, set()).add(key)
+
+    def affected_parcels(self, point_ids):
+        """Keys of every parcel that references at least one of point_ids."""
+        keys = set()
+        for pid in point_ids:
+            keys.update(self.point_to_parcels.get(str(pid), ()))
+        return keys
+
+    def apply_points(self, new_points_map):
+        """
+        Swap in a new points map, recomputing only parcels touched by the diff.
+        Returns (diff, changed) where changed is a list of {id, area, perimeter}.
+        """
+        new_points = {str(k): v for k, v in new_points_map.items()}
+        diff = diff_point_maps(self.points, new_points)
+        touched = diff['added'] + diff['removed'] + diff['moved']
+        keys = list(self.affected_parcels(touched))
+        self.points = new_points
+
+        parcels = [self.parcels[k] for k in keys]
+        changed = []
+        for key, parcel, (area, perimeter) in zip(keys, parcels, compute_id_parcels(parcels, new_points)):
+            parcel['area'] = area
+            parcel['perimeter'] = perimeter
+            changed.append({'id': key, 'area': area, 'perimeter': perimeter})
+        return diff, changed
+
+
+def _norm(path):
+    return os.path.normcase(os.path.abspath(path)) if path else ''
+
+
+class ParcelIndexRegistry:
+    """Thread-safe map of project file path -> ParcelDependencyIndex."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes = {}
+
+    def register(self, project_path, parcels, points_map, points_file_path=None, version=None):
+        if not project_path:
+            return None
+        index = ParcelDependencyIndex(parcels, points_map, points_file_path, version)
+        index.project_path = project_path
+        with self._lock:
+            self._indexes[_norm(project_path)] = index
+        return index
+
+    def get(self, project_path):
+        with self._lock:
+            return self._indexes.get(_norm(project_path))
+
+    def apply_points(self, project_path, new_points_map):
+        """
+        Diff + incremental recompute under the registry lock.
+        Returns (diff, changed, parcels_version), or None if unregistered.
+        """
+        with self._lock:
+            index = self._indexes.get(_norm(project_path))
+            if index is None:
+                return None
+            diff, changed = index.apply_points(new_points_map)
+            return diff, changed, index.version
+
+    def for_points_file(self, points_file_path):
+        """Project paths (as registered) whose index was built from points_file_path."""
+        target = _norm(points_file_path)
+        with self._lock:
+            return [index.project_path for index in self._indexes.values()
+                    if index.points_file_path and _norm(index.points_file_path) == target]
@@ -0,0 +1,700 @@
+"""
+PDF Surveying Report for Parcel Tools
+Draws the export-pdf report (parcel legs, curves, areas and the error calculation
+section) with ReportLab. Large reports are split at parcels that start on a fresh
+page: a layout-only pass over the same drawing code finds those parcels and their
+page numbers, worker processes render the chunks to files, and pypdf merges them into
+one document (resource objects that come out the same in several chunks are written
+once). When a report is exported again, it is cut into at most CACHE_SEGMENTS
+page-aligned segments that are kept as files: a segment whose parcels, point
+coordinates and page numbers are unchanged is reused instead of being drawn again.
+Without pypdf every report is drawn in one process.
+"""
+
+import atexit
+import hashlib
+import io
+import json
+import math
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    from pypdf import PdfWriter
+except ImportError:  # without pypdf every report is drawn in one process
+    PdfWriter = None
+
+PARALLEL_MIN_PARCELS = 300     # below this a single process is faster than starting chunks
+CHUNKS_PER_WORKER = 2          # a little over one chunk per core evens out uneven parcels
+MAX_WORKERS = max(1, min(os.cpu_count() or 1, 16))
+CACHE_SEGMENTS = 32            # most segments a re-exported report is cut into
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _normalize_points(points_by_id):
+    """Point lookup keyed by the stripped string ID and, where it parses, the int ID."""
+    normalized = {}
+    for k, v in points_by_id.items():
+        if isinstance(v, dict):
+            x_val = float(v.get('x', v.get('X', 0.0)))
+            y_val = float(v.get('y', v.get('Y', 0.0)))
+        elif isinstance(v, (list, tuple)):
+            x_val = float(v[0])
+            y_val = float(v[1])
+        else:
+            x_val = float(getattr(v, 'x', 0.0))
+            y_val = float(getattr(v, 'y', 0.0))
+        k_str = str(k).strip()
+        normalized[k_str] = {'x': x_val, 'y': y_val}
+        try:
+            normalized[int(k_str)] = {'x': x_val, 'y': y_val}
+        except (ValueError, TypeError):
+            pass
+    return normalized
+
+
+def _deg_to_dms_val(deg):
+    deg = (deg + 360.0) % 360.0
+    d = int(deg)
+    rem_min = (deg - d) * 60.0
+    m = int(rem_min)
+    s = round((rem_min - m) * 60.0)
+    if s >= 60:
+        s -= 60
+        m += 1
+    if m >= 60:
+        m -= 60
+        d = (d + 1) % 360
+    return d + (m / 100.0) + (s / 10000.0)
+
+
+class _Report:
+    """
+    Report drawing state. With canvas=None nothing is drawn and only the page and
+    y-position bookkeeping runs, which is how the layout pass finds chunk boundaries.
+    """
+
+    def __init__(self, data, canvas=None, page=1, heading_added=False):
+        from reportlab.lib.pagesizes import A4
+
+        self.c = canvas
+        self.width, self.height = A4
+        self.top = self.height - 40
+        self.file_heading = data.get('fileHeading', {})
+        self.is_buggy = data.get('isBuggy', False)
+        self.normalized_points = _normalize_points(data.get('points', {}))
+        self.page = page
+        self.y = self.top
+        self.heading_added = heading_added
+        # Draw watermark on first page
+        self._watermark()
+
+    def _watermark(self):
+        if self.is_buggy and self.c is not None:
+            c = self.c
+            c.saveState()
+            c.setFillColorRGB(0.95, 0.8, 0.8)
+            c.setFont("Helvetica-Bold", 36)
+            c.translate(self.width / 2, self.height / 2)
+            c.rotate(45)
+            c.drawCentredString(0, 0, "DEMO VERSION - UNSAVED BUILD")
+            c.restoreState()
+
+    def _page_number(self):
+        if self.c is not None:
+            self.c.saveState()
+            self.c.setFont("Courier-Bold", 10)
+            self.c.drawRightString(self.width - 40, 50, f"Page {self.page}")
+            self.c.restoreState()
+
+    def _font(self, name, size):
+        if self.c is not None:
+            self.c.setFont(name, size)
+
+    def _text(self, text, step):
+        if self.c is not None:
+            self.c.drawString(40, self.y, text)
+        self.y -= step
+
+    def break_page(self):
+        self._page_number()
+        if self.c is not None:
+            self.c.showPage()
+        self._watermark()
+        self.page += 1
+        self.y = self.top
+
+    def get_point(self, pid):
+        if pid in self.normalized_points:
+            return self.normalized_points[pid]
+        pid_str = str(pid).strip()
+        if pid_str in self.normalized_points:
+            return self.normalized_points[pid_str]
+        try:
+            return self.normalized_points.get(int(pid_str))
+        except (ValueError, TypeError):
+            return None
+
+    def parcel(self, parcel, first):
+        """One parcel block; `first` means it starts at the top of the current page."""
+        # Only add new page if we run out of space, not for each parcel
+        if first:
+            self.y = self.top
+        elif self.y < 100:
+            self.break_page()
+        else:
+            self.y -= 30  # Space between parcels
+
+        # Add file heading on first page only if it exists and has content
+        file_heading = self.file_heading
+        if not self.heading_added and file_heading:
+            has_content = any([
+                file_heading.get('block'),
+                file_heading.get('quarter'),
+                file_heading.get('parcels'),
+                file_heading.get('place'),
+                file_heading.get('additionalInfo')
+            ])
+            if has_content:
+                self._font("Courier-Bold", 11)
+                self._text("=" * 60, 15)
+                if file_heading.get('block'):
+                    self._text(f"BLOCK: {file_heading['block']}", 12)
+                if file_heading.get('quarter'):
+                    self._text(f"QUARTER: {file_heading['quarter']}", 12)
+                if file_heading.get('parcels'):
+                    self._text(f"PARCELS: {file_heading['parcels']}", 12)
+                if file_heading.get('place'):
+                    self._text(f"PLACE: {file_heading['place']}", 12)
+                if file_heading.get('additionalInfo'):
+                    self.y -= 5
+                    self._font("Courier", 9)
+                    self._text(file_heading['additionalInfo'], 12)
+                self._font("Courier-Bold", 11)
+                self._text("=" * 60, 25)
+                self.heading_added = True
+
+        parcel_num = parcel.get('number', 'N/A')
+        ids = parcel.get('ids', [])
+        area = parcel.get('area', 0)
+        curves = parcel.get('curves', [])
+
+        # Get unique IDs (remove closing duplicate)
+        ids_unique = ids[:-1] if len(ids) >= 2 and ids[-1] == ids[0] else ids[:]
+
+        self._font("Courier", 12)
+        self._text(f"PARCEL  NUMBER    {parcel_num}", 30)
+
+        self._font("Courier", 10)
+        self._text("ANGLES   IN   DEGREES", 15)
+        self._text("=" * 60, 25)
+
+        # Table header
+        self._font("Courier", 9)
+        header = f"{'FROM':<4}  {'TO':<4}  {'DISTANCE':>8}  {'AZIMUTH':>8}    {'POINT':<5}  {'Y':>10}  {'X':>10}"
+        self._text(header, 12)
+        sep = f"{'====':<4}  {'====':<4}  {'========':>8}  {'========':>8}    {'=====':<5}  {'==========':>10}  {'==========':>10}"
+        self._text(sep, 12)
+
+        # Calculate and draw each leg
+        for i in range(len(ids_unique)):
+            from_id = ids_unique[i]
+            to_id = ids_unique[(i + 1) % len(ids_unique)]
+            from_pt = self.get_point(from_id)
+            to_pt = self.get_point(to_id)
+            if from_pt is None or to_pt is None:
+                continue
+            if self.c is not None:
+                dy_plot = to_pt['x'] - from_pt['x']
+                dx_plot = to_pt['y'] - from_pt['y']
+                distance = math.sqrt(dy_plot * dy_plot + dx_plot * dx_plot)
+                # Azimuth in DD.MMSS format (Degrees, Minutes, Seconds)
+                azimuth = _deg_to_dms_val(math.degrees(math.atan2(dy_plot, dx_plot)))
+                # FROM, TO, DISTANCE, AZIMUTH, POINT (from_id), Y (from_pt.x), X (from_pt.y)
+                line = (
+                    f"{str(from_id):<4}  {str(to_id):<4}  "
+                    f"{distance:>8.2f}  {azimuth:>8.4f}    "
+                    f"{str(from_id):<5}  {from_pt['x']:>10.2f}  {from_pt['y']:>10.2f}"
+                )
+                self.c.drawString(40, self.y, line)
+            self.y -= 12
+
+            if self.y < 100:
+                self.break_page()
+                # Redraw table header on new page
+                self._font("Courier", 9)
+                self._text(header, 12)
+                self._text(sep, 12)
+
+        self.y -= 10
+
+        # Curve calculations if any
+        if curves:
+            for curve in curves:
+                from_id = curve.get('from')
+                to_id = curve.get('to')
+                M = float(curve.get('M', 0) or 0)
+                sign = curve.get('sign', 1)
+                from_pt = self.get_point(from_id)
+                to_pt = self.get_point(to_id)
+                if from_pt is None or to_pt is None:
+                    continue
+
+                # Chord length, radius and segment area
+                dx = to_pt['x'] - from_pt['x']
+                dy = to_pt['y'] - from_pt['y']
+                C = math.sqrt(dx * dx + dy * dy)
+                R = (C * C) / (8.0 * M) + (M / 2.0) if M > 0 else 0
+                theta = 2.0 * math.asin(min(1.0, C / (2.0 * R))) if R > 0 else 0
+                seg_area = 0.5 * R * R * (theta - math.sin(theta)) if R > 0 else 0
+                # F value (sagitta factor)
+                F = M
+                sign_symbol = "(+)" if sign == 1 else "(-)"
+
+                curve_line = f"FROM PARCEL  {from_id} --> {to_id} = {C:.2f}   R = {R:.2f}   F = {F:.3f}   {sign_symbol}   PARCEL AREA= {seg_area:.2f}"
+                self._text(curve_line, 12)
+
+                # Check for page break inside curves loop
+                if self.y < 100:
+                    self.break_page()
+                    # Redraw curves header
+                    self._font("Courier-Bold", 10)
+                    self._text("CURVES (continued):", 15)
+                    self._font("Courier", 9)
+
+            self.y -= 10
+
+        # Final AREA
+        self._font("Courier", 11)
+        self._text(f"AREA = {area:.3f}", 30)
+
+    def error_section(self, data):
+        """The error calculations report after the last parcel."""
+        error_results = data.get('errorResults', None)  # Current/Unsaved calculation
+        saved_error_calculations = data.get('savedErrorCalculations', [])  # List of saved calculations
+
+        # Saved calculations are what the user chose to keep; without any, show the current one
+        all_calculations = list(saved_error_calculations or [])
+        if not all_calculations and error_results:
+            all_calculations.append(error_results)
+        if not all_calculations:
+            return
+
+        # Start on a new page if we are near the bottom
+        if self.y < 100:
+            self.break_page()
+        else:
+            self.y -= 20
+
+        # Main Header for Error Section
+        self._font("Courier-Bold", 14)
+        self._text("ERROR CALCULATIONS REPORT", 25)
+
+        for index, calc in enumerate(all_calculations):
+            # Check for space for header
+            if self.y < 150:
+                self.break_page()
+
+            # Calculation Header
+            name = calc.get('name', f'Calculation #{index + 1}')
+            timestamp = calc.get('timestamp', '')
+            if timestamp:
+                try:
+                    # Simple format cleanup if it's ISO
+                    date_part = timestamp.split('T')[0]
+                    time_part = timestamp.split('T')[1][:8]
+                    timestamp = f"{date_part} {time_part}"
+                except:
+                    pass
+
+            self._font("Courier-Bold", 12)
+            self._text("=" * 60, 15)
+            self._text(f"{name}  {timestamp}", 15)
+            self._text("=" * 60, 25)
+
+            # Overall Summary
+            self._font("Courier-Bold", 10)
+            self._text("SUMMARY:", 20)
+
+            self._font("Courier", 9)
+            self._text(f"Total Registered Area:    {calc['totalRegisteredArea']:.4f} m²", 15)
+            self._text(f"Total Calculated Area:    {calc['totalCalculatedArea']:.4f} m²", 15)
+            self._text(f"Absolute Difference:      {calc['absoluteDifference']:.4f} m²", 15)
+            self._text(f"Permissible Error:        {calc['permissibleError']:.4f} m²", 20)
+
+            # Formula
+            self._font("Courier", 8)
+            self._text(f"Formula: Permissible Error = 0.8 * sqrt({calc['totalRegisteredArea']:.2f}) + 0.002 * {calc['totalRegisteredArea']:.2f}", 20)
+
+            # Status
+            self._font("Courier-Bold", 10)
+            if calc['exceedsLimit']:
+                self._text("WARNING: ERROR EXCEEDS PERMISSIBLE LIMITS - Using original areas", 30)
+            else:
+                self._text("OK: WITHIN PERMISSIBLE LIMITS - Areas adjusted proportionally", 30)
+
+            # Parcel Results Table Header
+            self._font("Courier-Bold", 10)
+            self._text("PARCEL BREAKDOWN:", 20)
+
+            # Table header
+            self._font("Courier", 8)
+            self._text(f"{'Parcel #':<12} {'Original (m²)':>15} {'Adjusted (m²)':>15} {'Rounded (m²)':>15} {'Points':>8}", 12)
+            self._text(f"{'-'*12:<12} {'-'*15:>15} {'-'*15:>15} {'-'*15:>15} {'-'*8:>8}", 15)
+
+            # Parcel rows
+            self._font("Courier", 8)
+            for parcel_result in calc['parcelResults']:
+                if self.y < 60:
+                    self.break_page()
+                    self._font("Courier", 8)
+                parcel_num = str(parcel_result['parcelNumber'])
+                original = parcel_result['calculatedArea']
+                adjusted = parcel_result['adjustedArea']
+                rounded = parcel_result['roundedArea']
+                points = parcel_result['pointCount']
+                self._text(f"{parcel_num:<12} {original:>15.4f} {adjusted:>15.4f} {rounded:>15} {points:>8}", 12)
+
+            # Total row
+            if self.y < 60:
+                self.break_page()
+
+            self.y -= 5
+            self._font("Courier-Bold", 8)
+            total_original = sum(p['calculatedArea'] for p in calc['parcelResults'])
+            total_adjusted = sum(p['adjustedArea'] for p in calc['parcelResults'])
+            total_rounded = sum(p['roundedArea'] for p in calc['parcelResults'])
+            total_points = sum(p['pointCount'] for p in calc['parcelResults'])
+            self._text(f"{'TOTAL:':<12} {total_original:>15.4f} {total_adjusted:>15.4f} {total_rounded:>15} {total_points:>8}", 40)  # Space between calculations
+
+    def finish(self):
+        """Number the last page and write the document; returns the last page number."""
+        self._page_number()
+        if self.c is not None:
+            self.c.save()
+        return self.page
+
+
+def _render(data, output, page=1, heading_added=False):
+    """Draw the report onto `output` with pages numbered from `page`; returns its page count."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
+    report = _Report(data, canvas.Canvas(output, pagesize=A4), page=page, heading_added=heading_added)
+    for i, parcel in enumerate(data.get('parcels', [])):
+        report.parcel(parcel, first=(i == 0))
+    report.error_section(data)
+    return report.finish() - page + 1
+
+
+def layout(parcels, data):
+    """
+    Layout-only pass: for each parcel, the page it starts on and whether it starts at the
+    top of a fresh page (a valid place to split the report). Returns (starts, total_pages).
+    """
+    report = _Report(data)
+    starts = []
+    for i, parcel in enumerate(parcels):
+        fresh = i > 0 and report.y < 100
+        # A parcel that finds the page full breaks to the next one before drawing anything
+        starts.append((report.page + fresh, fresh))
+        report.parcel(parcel, first=(i == 0))
+    report.error_section(data)
+    return starts, report.page
+
+
+def _chunk_starts(starts, chunks):
+    """Up to `chunks` balanced split points (parcel indexes), chosen among fresh-page parcels."""
+    candidates = [(page, i) for i, (page, fresh) in enumerate(starts) if fresh and i > 0]
+    if not candidates or chunks < 2:
+        return [0]
+    total = starts[-1][0]
+    splits, k = [0], 0
+    for n in range(1, chunks):
+        target = 1 + total * n / chunks
+        while k + 1 < len(candidates) and abs(candidates[k + 1][0] - target) <= abs(candidates[k][0] - target):
+            k += 1
+        if candidates[k][1] > splits[-1]:
+            splits.append(candidates[k][1])
+    return splits
+
+
+def _segment_starts(starts, segments):
+    """
+    Cut points for the re-export cache: the first fresh-page parcel in each run of
+    len/segments parcels. Edits only move the cuts near them, so other segments keep their keys.
+    """
+    step = max(1, -(-len(starts) // segments))
+    splits = [0]
+    for i, (_, fresh) in enumerate(starts):
+        if fresh and i // step > splits[-1] // step:
+            splits.append(i)
+    return splits
+
+
+def _referenced_ids(parcel):
+    curves = parcel.get('curves', []) or []
+    return list(parcel.get('ids', [])) + [c.get('from') for c in curves] + [c.get('to') for c in curves]
+
+
+def _chunk_points(parcels, lookup):
+    points = {}
+    for parcel in parcels:
+        for pid in _referenced_ids(parcel):
+            pt = lookup(pid)
+            if pt is not None:
+                points[str(pid).strip()] = pt
+    return points
+
+
+def fragment_key(data, parcels, page, heading_added, last, lookup):
+    """
+    Cache key of a rendered segment: every parcel's number, IDs, area, curves and the
+    coordinates its IDs resolve to, plus what else lands on those pages (the file heading
+    on the first segment, the error section on the last, the page numbering and watermark).
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(json.dumps([page, heading_added, bool(data.get('isBuggy', False))]).encode('utf-8'))
+    if not heading_added:
+        hasher.update(json.dumps(data.get('fileHeading', {}), sort_keys=True, default=str).encode('utf-8'))
+    for parcel in parcels:
+        hasher.update(json.dumps([parcel.get('number', 'N/A'), parcel.get('ids', []), parcel.get('area', 0),
+                                  parcel.get('curves', []), [lookup(pid) for pid in _referenced_ids(parcel)]],
+                                 sort_keys=True, default=str).encode('utf-8'))
+    if last:
+        hasher.update(json.dumps([data.get('errorResults'), data.get('savedErrorCalculations', [])],
+                                 sort_keys=True, default=str).encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def report_key(parcels):
+    """Which report this is, for ReportFragmentCache.seen: its parcel numbers in order."""
+    numbers = [str(parcel.get('number', 'N/A')) for parcel in parcels]
+    return hashlib.blake2b(json.dumps(numbers).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ReportFragmentCache:
+    """
+    Rendered report segments (PDF files of a run of parcels that starts on a fresh page),
+    keyed by fragment_key, in `directory` (default: a temporary folder). max_bytes bounds
+    the files kept, least recently used first; segments leased by a running export stay.
+    """
+
+    def __init__(self, directory=None, max_bytes=256 * 1024 * 1024, max_reports=64):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_reports = max_reports
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> file size
+        self._size = 0
+        self._leases = {}
+        self._reports = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def _dir(self):
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix='parcel_pdf_fragments_')
+            atexit.register(shutil.rmtree, self.directory, True)
+        os.makedirs(self.directory, exist_ok=True)
+        return self.directory
+
+    def _path(self, key):
+        return os.path.join(self._dir(), key + '.pdf')
+
+    def seen(self, report):
+        """Record an export of `report` (report_key); True if it was exported before."""
+        with self._lock:
+            known = report in self._reports
+            self._reports[report] = True
+            self._reports.move_to_end(report)
+            while len(self._reports) > self.max_reports:
+                self._reports.popitem(last=False)
+            return known
+
+    @contextmanager
+    def lease(self, keys):
+        """Keep the segments under `keys` from being evicted until the export has merged them."""
+        with self._lock:
+            for key in keys:
+                self._leases[key] = self._leases.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                for key in keys:
+                    self._leases[key] -= 1
+                    if not self._leases[key]:
+                        del self._leases[key]
+
+    def get(self, key):
+        """Path of the cached segment, or None (also when its file has gone missing)."""
+        with self._lock:
+            if key in self._entries and not os.path.isfile(self._path(key)):
+                self._size -= self._entries.pop(key)
+            if key not in self._entries:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return self._path(key)
+
+    def put(self, key, source):
+        """Move the rendered segment file `source` into the cache; returns its new path (None if too big)."""
+        size = os.path.getsize(source)
+        if size > self.max_bytes:
+            return None
+        with self._lock:
+            path = self._path(key)
+            shutil.move(source, path)
+            self._size += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            for old in list(self._entries):
+                if self._size <= self.max_bytes:
+                    break
+                if old in self._leases:
+                    continue
+                self._size -= self._entries.pop(old)
+                try:
+                    os.remove(self._path(old))
+                except OSError:
+                    pass
+            return path
+
+    def clear(self):
+        with self._lock:
+            for key in self._entries:
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._size = 0
+            self._reports.clear()
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn everywhere: the server forks from request threads otherwise
+            _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+            atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        return _pool
+
+
+def _reset_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _render_segments(jobs):
+    """Render (data, page, heading_added, path) jobs, each to its file. Also the worker entry point."""
+    for data, page, heading_added, path in jobs:
+        _render(data, path, page, heading_added)
+
+
+def _render_parallel(jobs, batches):
+    """Spread jobs over the worker pool in up to `batches` contiguous batches; False if the pool failed."""
+    size = -(-len(jobs) // batches)
+    try:
+        pool = _get_pool()
+        futures = [pool.submit(_render_segments, jobs[k:k + size]) for k in range(0, len(jobs), size)]
+        for f in futures:
+            f.result()
+        return True
+    except BrokenProcessPool:
+        print('[PDF Export] Worker pool failed, rendering in one process')
+        _reset_pool()
+        return False
+
+
+def render_report(data, output, workers=None, cache=None):
+    """
+    Draw the surveying report for an export-pdf request body onto `output` (a file path
+    or a binary file object) and return the page count. Reports of PARALLEL_MIN_PARCELS
+    parcels or more are rendered in chunks across worker processes and merged; `workers`
+    (default: one per core) sets how many chunks to aim for, 1 forces a single process.
+    With a ReportFragmentCache, a report exported before is cut into CACHE_SEGMENTS
+    segments instead, and only segments whose parcels (or page numbering) changed since
+    then are redrawn. Chunks and segments are rendered to files and merged from there;
+    without pypdf to merge them, every report is drawn in one process.
+    """
+    parcels = data.get('parcels', [])
+    workers = MAX_WORKERS if workers is None else workers
+    parallel = workers >= 2 and len(parcels) >= PARALLEL_MIN_PARCELS
+    if PdfWriter is None:
+        return _render(data, output)
+    segmented = cache is not None and cache.seen(report_key(parcels))
+    if not segmented and not parallel:
+        return _render(data, output)
+
+    starts, total_pages = layout(parcels, data)
+    if segmented:
+        splits = _segment_starts(starts, CACHE_SEGMENTS)
+    else:
+        splits = _chunk_starts(starts, workers * CHUNKS_PER_WORKER)
+        if len(splits) < 2:
+            return _render(data, output)
+
+    bounds = list(zip(splits, splits[1:] + [len(parcels)]))
+    lookup = _Report(data).get_point
+    jobs = []
+    for k, (start, end) in enumerate(bounds):
+        # each chunk carries only the coordinates its own parcels refer to
+        chunk = dict(data, parcels=parcels[start:end], points=_chunk_points(parcels[start:end], lookup))
+        if k < len(bounds) - 1:
+            # the error section belongs after the last parcel only
+            chunk.update(errorResults=None, savedErrorCalculations=[])
+        jobs.append((chunk, starts[start][0] if parcels else 1, start > 0))
+
+    keys = [None] * len(jobs)
+    if segmented:
+        for k, (chunk, page, heading_added) in enumerate(jobs):
+            keys[k] = fragment_key(chunk, chunk['parcels'], page, heading_added, k == len(jobs) - 1, lookup)
+
+    with tempfile.TemporaryDirectory(prefix='parcel_pdf_') as scratch, \
+            (cache.lease(keys) if segmented else nullcontext()):
+        paths = [cache.get(key) if segmented else None for key in keys]
+        todo = [k for k, path in enumerate(paths) if path is None]
+        targets = [jobs[k] + (os.path.join(scratch, f'{k}.pdf'),) for k in todo]
+        dirty = sum(bounds[k][1] - bounds[k][0] for k in todo)
+        if not (todo and workers >= 2 and dirty >= PARALLEL_MIN_PARCELS
+                and _render_parallel(targets, workers * CHUNKS_PER_WORKER)):
+            _render_segments(targets)
+        for k, job in zip(todo, targets):
+            paths[k] = (segmented and cache.put(keys[k], job[3])) or job[3]
+        print(f'[PDF Export] {len(parcels)} parcels in {len(bounds)} segments, '
+              f'{len(todo)} rendered, {len(bounds) - len(todo)} cached')
+        merged = merge_pdfs(paths, output)
+
+    if merged != total_pages:
+        raise RuntimeError(f'PDF chunk merge produced {merged} pages, expected {total_pages}')
+    return merged
+
+
+def merge_pdfs(sources, output):
+    """
+    Concatenate the pages of PDFs (file paths or bytes) into `output` (a path or binary
+    file object) with pypdf, keeping the first document's catalog and info. Fonts and
+    resource dictionaries that came out identical in several chunks are written once.
+    Returns the page count.
+    """
+    sources = [io.BytesIO(source) if isinstance(source, bytes) else source for source in sources]
+    writer = PdfWriter(clone_from=sources[0])
+    for source in sources[1:]:
+        writer.append(source)
+    writer.compress_identical_objects()
+    writer.write(output)
+    return len(writer.pages)
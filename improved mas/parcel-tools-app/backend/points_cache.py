@@ -0,0 +1,296 @@
+"""
+Points File Sidecar Cache for Parcel Tools
+Keeps a compact binary copy of each parsed points file (float64 X / Y columns plus
+an ID string table) and memory-maps it, so unchanged files are never re-parsed.
+Files that only grew (field loggers appending all day) have just their new tail parsed.
+"""
+
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from points_parser import PointsTable, parse_points_bytes
+
+_MAGIC = b'PTSC'
+_VERSION = 4  # 4: duplicate IDs default to last-wins
+# magic, version, source size, source mtime_ns, point count, parsed prefix length,
+# ID table length, block digest count, content token (hex), digest of the prefix's last partial block
+_HEADER = struct.Struct('<4sIQqQQQQ24s12s')
+_HEADER_SIZE = 128  # header is padded so the float block stays 8-byte aligned
+DIGEST_BLOCK = 256 * 1024  # the parsed prefix is digested per block, so a grown file can be checked block by block
+
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=12).digest()
+
+
+def _digests(view, prefix_len, blocks=()):
+    """
+    view holds the file from the block boundary after `blocks` (digests of earlier
+    DIGEST_BLOCKs) to EOF; prefix_len is the parsed prefix's end within view.
+    Returns (block digests of the whole prefix, digest of its last partial block, content token).
+    The token only depends on the file's bytes, however they were read.
+    """
+    blocks = list(blocks)
+    done = 0
+    while done + DIGEST_BLOCK <= prefix_len:
+        blocks.append(_digest(view[done:done + DIGEST_BLOCK]))
+        done += DIGEST_BLOCK
+    token = hashlib.blake2b(b''.join(blocks), digest_size=12)
+    token.update(view[done:])
+    return blocks, _digest(view[done:prefix_len]), token.hexdigest()
+
+
+def _empty_table():
+    return PointsTable([], np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64))
+
+
+class PointsFileCache:
+    """
+    Parse-once cache for points files, one sidecar per source path in cache_dir
+    (cache_dir=None keeps the entries in memory instead, e.g. for Mas2).
+    A sidecar is reused while the source's size and mtime match, or - after a
+    touch / copy - while its content token still matches. When the file grew and
+    every block parsed last time still hashes the same, only the appended tail is
+    parsed (hashing the prefix is far cheaper than parsing it again).
+    keep: which duplicate ID wins ('last' like Mas2 and the parser, or 'first').
+    max_entries bounds the in-memory mode to the most recently loaded files.
+    """
+
+    def __init__(self, cache_dir, keep='last', max_entries=16):
+        self.cache_dir = cache_dir
+        self.keep = keep
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self.stats = {'hits': 0, 'revalidated': 0, 'appended': 0, 'parsed': 0}
+
+    def sidecar_path(self, path):
+        key = hashlib.blake2b(os.path.normcase(os.path.abspath(path)).encode('utf-8'), digest_size=16).hexdigest()
+        if self.cache_dir is None:
+            return key
+        return os.path.join(self.cache_dir, key + '.pcache')
+
+    def load(self, path):
+        """Return (PointsTable, version_token) for a points file, parsing only what changed."""
+        st = os.stat(path)
+        sidecar = self.sidecar_path(path)
+        header = self._read_header(sidecar)
+
+        if header and header['size'] == st.st_size and header['mtime_ns'] == st.st_mtime_ns:
+            table = self._open_sidecar(sidecar, header, path)
+            if table is not None:
+                self._count('hits')
+                return table, header['token']
+
+        if header and header['size'] < st.st_size:
+            grown = self._load_appended(path, st, sidecar, header)
+            if grown is not None:
+                return grown
+
+        with open(path, 'rb') as f:
+            raw = f.read()
+        prefix_len = raw.rfind(b'\n') + 1
+        blocks, prefix_digest, token = _digests(memoryview(raw), prefix_len)
+
+        if header and header['token'] == token:
+            # Same bytes, new mtime (touched / copied back): just re-stamp the sidecar
+            header.update(size=len(raw), mtime_ns=st.st_mtime_ns)
+            table = self._open_sidecar(sidecar, header, path, raw)
+            if table is not None:
+                self._count('revalidated')
+                self._restamp(sidecar, header)
+                return table, token
+
+        self._count('parsed')
+        table = parse_points_bytes(raw[:prefix_len], keep=self.keep)
+        self._write_sidecar(sidecar, table, len(raw), st.st_mtime_ns, prefix_len, token, prefix_digest, blocks)
+        if prefix_len < len(raw):
+            table = merge_tail(table, parse_points_bytes(raw[prefix_len:], keep=self.keep), self.keep)
+        return table, token
+
+    def _load_appended(self, path, st, sidecar, header):
+        """
+        The file grew: if every block of the bytes parsed last time hashes the same, keep
+        the stored table and parse just the new complete lines after them.
+        Returns None (caller re-reads the whole file) when any of the prefix changed.
+        """
+        old_len, old_blocks = header['prefix_len'], header['blocks']
+        start = len(old_blocks) * DIGEST_BLOCK
+        with open(path, 'rb') as f:
+            for expected in old_blocks:
+                if _digest(f.read(DIGEST_BLOCK)) != expected:
+                    return None
+            raw = f.read()
+        view = memoryview(raw)
+        if _digest(view[:old_len - start]) != header['prefix_digest']:
+            return None
+        stored = self._open_sidecar(sidecar, dict(header, size=old_len), path)
+        if stored is None:
+            return None
+
+        self._count('appended')
+        size = start + len(raw)
+        prefix_len = start + raw.rfind(b'\n') + 1
+        blocks, prefix_digest, token = _digests(view, prefix_len - start, old_blocks)
+        # Copy out of the mapping first so the sidecar can be replaced (Windows locks mapped files)
+        stored = PointsTable(stored.ids, np.array(stored.x), np.array(stored.y))
+        table = merge_tail(stored, parse_points_bytes(raw[old_len - start:prefix_len - start], keep=self.keep),
+                           self.keep)
+        self._write_sidecar(sidecar, table, size, st.st_mtime_ns, prefix_len, token, prefix_digest, blocks)
+        if prefix_len < size:
+            table = merge_tail(table, parse_points_bytes(raw[prefix_len - start:], keep=self.keep), self.keep)
+        return table, token
+
+    def invalidate(self, path):
+        if self.cache_dir is None:
+            with self._lock:
+                self._memory.pop(self.sidecar_path(path), None)
+            return
+        try:
+            os.remove(self.sidecar_path(path))
+        except OSError:
+            pass
+
+    # -- sidecar I/O -------------------------------------------------------
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _read_header(self, sidecar):
+        if self.cache_dir is None:
+            with self._lock:
+                entry = self._memory.get(sidecar)
+                if entry:
+                    self._memory.move_to_end(sidecar)
+            return dict(entry[0]) if entry else None
+        try:
+            with open(sidecar, 'rb') as f:
+                blob = f.read(_HEADER.size)
+                if len(blob) < _HEADER.size:
+                    return None
+                magic, version, size, mtime_ns, count, prefix_len, ids_len, block_count, token, prefix_digest = \
+                    _HEADER.unpack(blob)
+                if magic != _MAGIC or version != _VERSION:
+                    return None
+                f.seek(_HEADER_SIZE + 16 * count + ids_len)
+                digests = f.read(12 * block_count)
+        except OSError:
+            return None
+        if len(digests) != 12 * block_count:
+            return None
+        return {'size': size, 'mtime_ns': mtime_ns, 'count': count, 'prefix_len': prefix_len,
+                'ids_len': ids_len, 'token': token.decode('ascii').rstrip('\0'), 'prefix_digest': prefix_digest,
+                'blocks': [digests[k:k + 12] for k in range(0, len(digests), 12)]}
+
+    def _open_sidecar(self, sidecar, header, path, raw=None):
+        """
+        Memory-map the coordinate block and re-attach any unterminated last line.
+        Returns None if the sidecar is truncated or corrupt.
+        """
+        n = header['count']
+        if self.cache_dir is None:
+            with self._lock:
+                entry = self._memory.get(sidecar)
+            if entry is None:
+                return None
+            table = entry[1]
+        elif n:
+            try:
+                block = np.memmap(sidecar, dtype='<f8', mode='r', offset=_HEADER_SIZE, shape=(2 * n,))
+                with open(sidecar, 'rb') as f:
+                    f.seek(_HEADER_SIZE + 16 * n)
+                    ids = f.read(header['ids_len']).decode('utf-8').split('\0')
+            except (OSError, ValueError):
+                return None
+            if len(ids) != n:
+                return None
+            table = PointsTable(ids, block[:n], block[n:])
+        else:
+            table = _empty_table()
+
+        if header['prefix_len'] < header['size']:
+            if raw is None:
+                with open(path, 'rb') as f:
+                    f.seek(header['prefix_len'])
+                    fragment = f.read()
+            else:
+                fragment = raw[header['prefix_len']:]
+            table = merge_tail(table, parse_points_bytes(fragment, keep=self.keep), self.keep)
+        return table
+
+    def _write_sidecar(self, sidecar, table, size, mtime_ns, prefix_len, token, prefix_digest, blocks):
+        if self.cache_dir is None:
+            header = {'size': size, 'mtime_ns': mtime_ns, 'count': len(table), 'prefix_len': prefix_len,
+                      'ids_len': 0, 'token': token, 'prefix_digest': prefix_digest, 'blocks': blocks}
+            with self._lock:
+                self._memory[sidecar] = (header, table)
+                self._memory.move_to_end(sidecar)
+                while len(self._memory) > self.max_entries:
+                    self._memory.popitem(last=False)
+            return
+        ids_blob = '\0'.join(table.ids).encode('utf-8')
+        header = _HEADER.pack(_MAGIC, _VERSION, size, mtime_ns, len(table), prefix_len,
+                              len(ids_blob), len(blocks), token.encode('ascii'), prefix_digest)
+        tmp = f'{sidecar}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp, 'wb') as f:
+                f.write(header.ljust(_HEADER_SIZE, b'\0'))
+                f.write(np.ascontiguousarray(table.x, dtype='<f8').tobytes())
+                f.write(np.ascontiguousarray(table.y, dtype='<f8').tobytes())
+                f.write(ids_blob)
+                f.write(b''.join(blocks))
+            os.replace(tmp, sidecar)
+        except OSError as e:
+            # e.g. the old sidecar is still mapped on Windows; next load just re-parses
+            print(f'[Points Cache WARNING] Could not write sidecar for {sidecar}: {e}')
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def _restamp(self, sidecar, header):
+        if self.cache_dir is None:
+            with self._lock:
+                entry = self._memory.get(sidecar)
+                if entry:
+                    self._memory[sidecar] = (dict(header), entry[1])
+            return
+        try:
+            with open(sidecar, 'r+b') as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, header['size'], header['mtime_ns'], header['count'],
+                                     header['prefix_len'], header['ids_len'], len(header['blocks']),
+                                     header['token'].encode('ascii'), header['prefix_digest']))
+        except OSError as e:
+            print(f'[Points Cache WARNING] Could not update sidecar {sidecar}: {e}')
+
+
+def merge_tail(table, tail, keep='last'):
+    """
+    Append the rows of `tail` to `table`. IDs already in `table` are ignored
+    (keep='first') or overwrite the earlier coordinates (keep='last').
+    """
+    if not len(tail):
+        return table
+    if not len(table):
+        return tail
+    position = {pid: i for i, pid in enumerate(table.ids)}
+    fresh = [i for i, pid in enumerate(tail.ids) if pid not in position]
+    x, y = table.x, table.y
+    if keep == 'last':
+        repeated = [(position[pid], i) for i, pid in enumerate(tail.ids) if pid in position]
+        if repeated:
+            x, y = np.array(x), np.array(y)
+            old_idx, new_idx = (np.array(v, dtype=np.int64) for v in zip(*repeated))
+            x[old_idx] = tail.x[new_idx]
+            y[old_idx] = tail.y[new_idx]
+    if not fresh:
+        return PointsTable(table.ids, x, y)
+    return PointsTable(table.ids + [tail.ids[i] for i in fresh],
+                       np.concatenate([x, tail.x[fresh]]), np.concatenate([y, tail.y[fresh]]))
@@ -0,0 +1,256 @@
+"""
+Points File Parser for Parcel Tools
+Single streaming parser behind every points entry point (file reload, text import,
+project-embedded points, Mas2). Emits typed columns instead of per-point dicts.
+
+Format: one point per line, `id x y [z] [code]`, separated by commas, semicolons,
+tabs or spaces. Blank lines and lines starting with '#' or '//' are skipped, as are
+rows whose X / Y aren't finite numbers. A repeated ID keeps the coordinates of its last
+row (keep='last', as Mas2 and a dict of every row do); keep='first' ignores re-shots.
+"""
+
+from itertools import chain
+
+import numpy as np
+
+CHUNK_SIZE = 4 * 1024 * 1024
+
+
+class PointsTable:
+    """Parsed points as columns: ids (list of str), x / y (float64), optional z / code."""
+
+    def __init__(self, ids, x, y, z=None, code=None):
+        self.ids = ids
+        self.x = x
+        self.y = y
+        self.z = z
+        self.code = code
+
+    def __len__(self):
+        return len(self.ids)
+
+    def to_list(self):
+        """[{'id', 'x', 'y'}, ...] as returned by the points endpoints."""
+        return [{'id': pid, 'x': x, 'y': y} for pid, x, y in zip(self.ids, self.x.tolist(), self.y.tolist())]
+
+    def to_map(self):
+        """{id: {'x', 'y'}} as used by the area calculations."""
+        return {pid: {'x': x, 'y': y} for pid, x, y in zip(self.ids, self.x.tolist(), self.y.tolist())}
+
+    def to_tuple_map(self):
+        """{id: (x, y)} as used by Mas2."""
+        return dict(zip(self.ids, zip(self.x.tolist(), self.y.tolist())))
+
+
+def _decode(raw, state):
+    """Decode a chunk as UTF-8, switching to cp1256 (Arabic Windows exports) once UTF-8 fails."""
+    if state.get('encoding') != 'cp1256':
+        try:
+            return raw.decode('utf-8')
+        except UnicodeDecodeError:
+            state['encoding'] = 'cp1256'
+    return raw.decode('cp1256', errors='ignore')
+
+
+def _to_floats(tokens):
+    """Bulk float conversion; None if any token isn't a number."""
+    try:
+        return np.fromiter(map(float, tokens), dtype=np.float64, count=len(tokens))
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_uniform(lines, with_extra):
+    """
+    Fast path for comma-separated chunks where every line has the same number of
+    fields and none is empty. Works on whole-chunk strings so no per-line lists are
+    built. Returns (ids, x, y, z, code) or None to use the generic path.
+    """
+    width = lines[0].count(',') + 1
+    if width < 3 or [line.count(',') for line in lines].count(width - 1) != len(lines):
+        return None
+    joined = ','.join(lines)
+    flat = joined.split(',')
+    if '' in flat:
+        return None
+    padded = ' ' in joined or '\t' in joined
+
+    ids = flat[0::width]
+    if padded:
+        ids = [pid.strip() for pid in ids]
+    x = _to_floats(flat[1::width])
+    y = _to_floats(flat[2::width])
+    if x is None or y is None:
+        return None
+    z = code = None
+    if with_extra and width >= 4:
+        z = _to_floats(flat[3::width])
+        if z is None:
+            code = flat[3::width]
+        elif width >= 5:
+            code = flat[4::width]
+        if padded and code is not None:
+            code = [c.strip() for c in code]
+    return ids, x, y, z, code
+
+
+def _parse_generic(lines, with_extra):
+    """Line-by-line path for mixed delimiters, empty fields and unparseable rows."""
+    ids, xs, ys, extra = [], [], [], []
+    width = 3
+    for line in lines:
+        parts = [p.strip() for p in (line.split(',') if ',' in line else line.split()) if p.strip()]
+        if len(parts) < 3:
+            continue
+        try:
+            x = float(parts[1])
+            y = float(parts[2])
+        except ValueError:
+            continue
+        ids.append(parts[0])
+        xs.append(x)
+        ys.append(y)
+        extra.append(parts[3:5])
+        width = max(width, len(parts))
+    x = np.array(xs, dtype=np.float64)
+    y = np.array(ys, dtype=np.float64)
+    z = code = None
+    if with_extra and width >= 4:
+        padded = [(r + ['', ''])[:2] for r in extra]
+        z = _to_floats([r[0] or 'nan' for r in padded])
+        if z is None:
+            code = [r[0] for r in padded]
+        elif width >= 5:
+            code = [r[1] for r in padded]
+    return ids, x, y, z, code
+
+
+def _parse_text(text, with_extra):
+    """Parse one decoded chunk of whole lines into columns."""
+    text = text.replace(';', ',')
+    lines = [line for line in map(str.strip, text.split('\n')) if line]
+    if '#' in text or '//' in text:
+        lines = [line for line in lines if not line.startswith(('#', '//'))]
+    if not lines:
+        return None
+
+    if ',' not in text:
+        # Whitespace-separated: turn each run of blanks into one comma
+        joined = '\n'.join(lines).replace('\t', ' ')
+        while '  ' in joined:
+            joined = joined.replace('  ', ' ')
+        lines = joined.replace(' ', ',').split('\n')
+    result = _parse_uniform(lines, with_extra)
+    if result is None:
+        result = _parse_generic(lines, with_extra)
+    return result
+
+
+def _finish(parts, keep, with_extra):
+    """Concatenate chunk results, drop non-finite rows and duplicate IDs."""
+    parts = [p for p in parts if p is not None and len(p[0])]
+    if not parts:
+        empty = np.empty(0, dtype=np.float64)
+        return PointsTable([], empty, empty.copy())
+
+    ids = list(chain.from_iterable(p[0] for p in parts))
+    x = np.concatenate([p[1] for p in parts])
+    y = np.concatenate([p[2] for p in parts])
+    z = code = None
+    if with_extra:
+        n_rows = [len(p[0]) for p in parts]
+        if any(p[3] is not None for p in parts):
+            z = np.concatenate([p[3] if p[3] is not None else np.full(n, np.nan) for p, n in zip(parts, n_rows)])
+        if any(p[4] is not None for p in parts):
+            code = list(chain.from_iterable(p[4] if p[4] is not None else [''] * n for p, n in zip(parts, n_rows)))
+
+    mask = np.isfinite(x) & np.isfinite(y)
+    if '' in ids:
+        mask &= np.array([pid != '' for pid in ids], dtype=bool)
+    keep_idx = None
+    if not mask.all():
+        keep_idx = np.flatnonzero(mask)
+
+    candidate_ids = ids if keep_idx is None else [ids[i] for i in keep_idx.tolist()]
+    value_idx = keep_idx
+    if len(set(candidate_ids)) != len(candidate_ids):
+        # A repeated ID stays where it first appeared; keep='last' takes the values of its
+        # last row, like building a dict from every row (Mas2, the area calculations)
+        positions = range(len(candidate_ids))
+        first_of = dict(zip(reversed(candidate_ids), reversed(positions)))
+        chosen = np.sort(np.fromiter(first_of.values(), dtype=np.int64, count=len(first_of)))
+        values = chosen
+        if keep == 'last':
+            last_of = dict(zip(candidate_ids, positions))
+            values = np.fromiter((last_of[candidate_ids[i]] for i in chosen.tolist()),
+                                 dtype=np.int64, count=len(chosen))
+        keep_idx, value_idx = (chosen, values) if keep_idx is None else (keep_idx[chosen], keep_idx[values])
+
+    if keep_idx is not None:
+        ids = [ids[i] for i in keep_idx.tolist()]
+        x, y = x[value_idx], y[value_idx]
+        z = z[value_idx] if z is not None else None
+        code = [code[i] for i in value_idx.tolist()] if code is not None else None
+    return PointsTable(ids, x, y, z, code)
+
+
+def iter_line_chunks(stream, chunk_size=CHUNK_SIZE):
+    """Yield byte chunks of whole lines from a binary stream."""
+    pending = b''
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        block = pending + block
+        cut = block.rfind(b'\n')
+        if cut < 0:
+            pending = block
+            continue
+        pending = block[cut + 1:]
+        yield block[:cut]
+    if pending:
+        yield pending
+
+
+def parse_points_chunks(chunks, keep='last', with_extra=False):
+    """Parse an iterable of byte / str chunks (each ending on a line boundary)."""
+    state = {}
+    parts = []
+    for i, chunk in enumerate(chunks):
+        if isinstance(chunk, bytes):
+            if i == 0 and chunk.startswith(b'\xef\xbb\xbf'):
+                chunk = chunk[3:]
+            chunk = _decode(chunk, state)
+        parts.append(_parse_text(chunk, with_extra))
+    return _finish(parts, keep, with_extra)
+
+
+def parse_points_bytes(raw, keep='last', with_extra=False):
+    """Parse an in-memory points file."""
+    return parse_points_chunks(_split_buffer(raw), keep, with_extra)
+
+
+def parse_points_text(text, keep='last', with_extra=False):
+    """Parse pasted / embedded points text."""
+    if not isinstance(text, str):
+        text = str(text)
+    return parse_points_chunks(_split_buffer(text.lstrip('\ufeff')), keep, with_extra)
+
+
+def parse_points_file(path, keep='last', with_extra=False, chunk_size=CHUNK_SIZE):
+    """Stream a points file from disk in line-aligned chunks."""
+    with open(path, 'rb') as f:
+        return parse_points_chunks(iter_line_chunks(f, chunk_size), keep, with_extra)
+
+
+def _split_buffer(buf, chunk_size=CHUNK_SIZE):
+    """Line-aligned slices of an in-memory buffer (bytes or str)."""
+    newline = b'\n' if isinstance(buf, bytes) else '\n'
+    start = 0
+    while start < len(buf):
+        end = start + chunk_size
+        if end < len(buf):
+            cut = buf.find(newline, end)
+            end = len(buf) if cut < 0 else cut + 1
+        yield buf[start:end]
+        start = end
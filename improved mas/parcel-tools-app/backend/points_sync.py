@@ -0,0 +1,86 @@
+"""
+Points File Version Tokens for Parcel Tools
+Remembers the last points snapshot served per file so reloads can ship only
+the added / removed / moved points instead of the whole coordinate list
+"""
+
+import hashlib
+import os
+import threading
+
+from parcel_index import diff_point_maps
+
+
+def content_token(raw_bytes):
+    """Version token for a points file: short digest of its exact bytes."""
+    return hashlib.blake2b(raw_bytes, digest_size=12).hexdigest()
+
+
+class PointsVersionStore:
+    """Thread-safe per-path snapshot store keyed by normalized file path."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshots = {}
+
+    @staticmethod
+    def _key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def current_token(self, path):
+        """Token of the snapshot currently held for path (None if never read)."""
+        with self._lock:
+            snapshot = self._snapshots.get(self._key(path))
+        return snapshot['token'] if snapshot else None
+
+    def sync(self, path, points, token, client_token=None):
+        """
+        Record the freshly parsed points (list of {id, x, y}) for path under token
+        and build the reply for a client that last saw client_token.
+        Returns a dict with 'versionToken' and 'full'; full replies carry 'points',
+        delta replies carry 'added', 'removed' (IDs) and 'moved'.
+        """
+        snapshot = {p['id']: (p['x'], p['y']) for p in points}
+        key = self._key(path)
+        with self._lock:
+            previous = self._snapshots.get(key)
+            self._snapshots[key] = {'token': token, 'points': snapshot}
+
+        if not client_token or previous is None or previous['token'] != client_token:
+            return {'versionToken': token, 'full': True, 'points': points}
+
+        if client_token == token:
+            return {'versionToken': token, 'full': False, 'added': [], 'removed': [], 'moved': []}
+
+        return _delta(previous['points'], snapshot, token)
+
+    def advance(self, path, points, token):
+        """
+        Record a new snapshot pushed by the file watcher.
+        Returns (base_token, delta) where delta is relative to the snapshot held
+        under base_token; base_token is None if nothing was held before.
+        Returns None when the content is unchanged.
+        """
+        snapshot = {p['id']: (p['x'], p['y']) for p in points}
+        key = self._key(path)
+        with self._lock:
+            previous = self._snapshots.get(key)
+            if previous is not None and previous['token'] == token:
+                return None
+            self._snapshots[key] = {'token': token, 'points': snapshot}
+
+        if previous is None:
+            return None, {'versionToken': token, 'full': True}
+        return previous['token'], _delta(previous['points'], snapshot, token)
+
+
+def _delta(old_snapshot, snapshot, token):
+    diff = diff_point_maps(old_snapshot, snapshot)
+    as_point = lambda pid: {'id': pid, 'x': snapshot[pid][0], 'y': snapshot[pid][1]}
+    return {
+        'versionToken': token,
+        'full': False,
+        'added': [as_point(pid) for pid in diff['added']],
+        'removed': diff['removed'],
+        'moved': [as_point(pid) for pid in diff['moved']],
+    }
@@ -0,0 +1,218 @@
+"""
+Project Metadata Index for Parcel Tools
+SQLite table of .prcl summaries (project name, parcel count, points file) keyed by
+path, size and mtime, so project listings never re-read unchanged files
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+_ENCODINGS = ['utf-8', 'utf-8-sig', 'cp1256', 'cp1252', 'latin1']
+_UNREADABLE = -1  # parcel_count marker: file couldn't be parsed at this size / mtime
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS projects (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    project_name TEXT,
+    parcel_count INTEGER NOT NULL,
+    points_file TEXT,
+    scanned INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+'''
+
+
+def _key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def summarize_project(data):
+    """The fields /api/projects shows, taken from parsed project JSON."""
+    parcels = data.get('savedParcels', [])
+    return {
+        'projectName': data.get('projectName'),
+        'parcelCount': len(parcels) if isinstance(parcels, list) else 0,
+        'pointsFile': data.get('pointsFileName'),
+    }
+
+
+def read_project_summary(path):
+    """Parse a .prcl with the usual encoding fallbacks. None if unreadable."""
+    for enc in _ENCODINGS:
+        try:
+            with open(path, 'r', encoding=enc) as f:
+                data = json.loads(f.read().strip().lstrip('\ufeff'))
+            if isinstance(data, dict):
+                return summarize_project(data)
+            return None
+        except Exception:
+            continue
+    return None
+
+
+class ProjectMetadataIndex:
+    """Persistent path -> project summary cache with an optional background rescan."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = None
+        self._scan_thread = None
+        self.stats = {'parsed': 0}
+
+    def _db(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+            try:
+                self._conn = self._connect()
+            except sqlite3.DatabaseError as e:
+                # Corrupt index: it's only a cache, start a fresh one
+                print(f'[Project Index WARNING] Rebuilding index ({e})')
+                try:
+                    os.replace(self.db_path, self.db_path + '.corrupt')
+                except OSError:
+                    pass
+                self._conn = self._connect()
+        return self._conn
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def describe_many(self, paths, scanned=False):
+        """
+        Summaries for existing .prcl paths, in input order (unreadable files skipped).
+        Only files whose size or mtime changed since they were indexed are parsed.
+        Each entry: {'path', 'projectName', 'parcelCount', 'pointsFile', 'lastModified'}.
+        """
+        stats = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stats.append((path, _key(path), st))
+
+        with self._lock:
+            db = self._db()
+            rows = {}
+            keys = [k for _, k, _ in stats]
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                cur = db.execute(
+                    'SELECT key, size, mtime_ns, project_name, parcel_count, points_file FROM projects '
+                    f'WHERE key IN ({",".join("?" * len(chunk))})', chunk)
+                rows.update((r[0], r[1:]) for r in cur)
+
+        results = []
+        updates = []
+        for path, key, st in stats:
+            row = rows.get(key)
+            if row and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+                summary = None if row[3] == _UNREADABLE else \
+                    {'projectName': row[2], 'parcelCount': row[3], 'pointsFile': row[4]}
+            else:
+                summary = read_project_summary(path)
+                self.stats['parsed'] += 1
+                updates.append((key, path, st, summary))
+            if summary is not None:
+                results.append(dict(summary, path=path, lastModified=st.st_mtime))
+
+        if updates or scanned:
+            with self._lock:
+                db = self._db()
+                for key, path, st, summary in updates:
+                    self._upsert(db, key, path, st, summary)
+                if scanned:
+                    db.executemany('UPDATE projects SET scanned = 1 WHERE key = ?', [(k,) for _, k, _ in stats])
+                db.commit()
+        return results
+
+    def record(self, path, project_data):
+        """Refresh one entry from project data already in memory (after save / load)."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        with self._lock:
+            db = self._db()
+            self._upsert(db, _key(path), path, st, summarize_project(project_data))
+            db.commit()
+
+    def forget(self, path):
+        with self._lock:
+            db = self._db()
+            db.execute('DELETE FROM projects WHERE key = ?', (_key(path),))
+            db.commit()
+
+    @staticmethod
+    def _upsert(db, key, path, st, summary):
+        if summary is None:
+            values = (None, _UNREADABLE, None)
+        else:
+            values = (summary['projectName'], summary['parcelCount'], summary['pointsFile'])
+        db.execute(
+            'INSERT INTO projects (key, path, size, mtime_ns, project_name, parcel_count, points_file) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT(key) DO UPDATE SET path = excluded.path, size = excluded.size, '
+            'mtime_ns = excluded.mtime_ns, project_name = excluded.project_name, '
+            'parcel_count = excluded.parcel_count, points_file = excluded.points_file',
+            (key, path, st.st_size, st.st_mtime_ns) + values)
+
+    # -- directory scans ---------------------------------------------------
+
+    def last_scan(self):
+        """Epoch seconds of the last completed directory scan (None if never)."""
+        with self._lock:
+            row = self._db().execute("SELECT value FROM meta WHERE name = 'last_scan'").fetchone()
+        return float(row[0]) if row else None
+
+    def scanned_paths(self):
+        with self._lock:
+            return [r[0] for r in self._db().execute('SELECT path FROM projects WHERE scanned = 1')]
+
+    def rescan(self, roots, max_depth=2):
+        """Walk roots (limited depth) for .prcl files, index them and drop scanned entries that vanished."""
+        found = []
+        for directory in roots:
+            if not os.path.isdir(directory):
+                continue
+            try:
+                for root, dirs, files in os.walk(directory):
+                    if root[len(directory):].count(os.sep) > max_depth:
+                        dirs[:] = []
+                        continue
+                    found.extend(os.path.join(root, f) for f in files if f.endswith('.prcl'))
+            except Exception as e:
+                print(f'[Project Index] Error scanning {directory}: {e}')
+        self.describe_many(found, scanned=True)
+
+        found_keys = {_key(p) for p in found}
+        with self._lock:
+            db = self._db()
+            stale = [(k,) for (k,) in db.execute('SELECT key FROM projects WHERE scanned = 1')
+                     if k not in found_keys]
+            db.executemany('UPDATE projects SET scanned = 0 WHERE key = ?', stale)
+            db.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('last_scan', ?)", (str(time.time()),))
+            db.commit()
+        return len(found)
+
+    def rescan_async(self, roots, max_depth=2):
+        """Start a background rescan unless one is already running."""
+        with self._lock:
+            if self._scan_thread is not None and self._scan_thread.is_alive():
+                return False
+            self._scan_thread = threading.Thread(target=self.rescan, args=(list(roots), max_depth),
+                                                 name='ProjectIndexScan', daemon=True)
+            self._scan_thread.start()
+        return True
@@ -0,0 +1,17307 @@
+# Generated from https://github.com/adobe-type-tools/agl-aglfn/blob/4036a9ca80a62f64f9de4f7321a9a045ad0ecfd6/glyphlist.txt
+#
+# Name:          Adobe Glyph List
+# Table version: 2.0
+# Date:          September 20, 2002
+# URL:           https://github.com/adobe-type-tools/agl-aglfn
+#
+# Copyright 2002-2019 Adobe (http://www.adobe.com/).
+#
+# Redistribution and use in source and binary forms, with or
+# without modification, are permitted provided that the
+# following conditions are met:
+#
+# Redistributions of source code must retain the above
+# copyright notice, this list of conditions and the following
+# disclaimer.
+#
+# Redistributions in binary form must reproduce the above
+# copyright notice, this list of conditions and the following
+# disclaimer in the documentation and/or other materials
+# provided with the distribution.
+#
+# Neither the name of Adobe nor the names of its contributors
+# may be used to endorse or promote products derived from this
+# software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND
+# CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT
+# NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+# HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+# -----------------------------------------------------------------------------
+#
+# Additional data has been derived from https://github.com/LettError/glyphNameFormatter/blob/3cd467e6ff9d7b3f6484d3460c5e79ab4713cbb1/Lib/glyphNameFormatter/names/glyphNamesToUnicode.txt
+#
+# Glyph Name Formatted Unicode List - GNFUL
+# GlyphNameFormatter version 0.8.1 - git commit: 511
+# Unicode version: Unicode 16.0.0
+# Source code: https://github.com/LettError/glyphNameFormatter/tree/380a129
+# Generated on 2025 08 08 17:00:14
+#
+# Copyright (c) 2016, LettError and Erik van Blokland, TypeMyType and Frederik Berlaen
+#
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+# this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation and/or
+# other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors may
+# be used to endorse or promote products derived from this software without specific
+# prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE
+# OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
+# OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+# -----------------------------------------------------------------------------
+#
+# GlyphNameFormatter uses data retrieved from https://www.unicode.org/Public/16.0.0/ucdxml/ucd.all.flat.zip
+#
+# UNICODE LICENSE V3
+#
+# COPYRIGHT AND PERMISSION NOTICE
+#
+# © 2023 Unicode®, Inc.
+# Copyright © 1991-2026 Unicode, Inc.
+#
+# NOTICE TO USER: Carefully read the following legal agreement. BY
+# DOWNLOADING, INSTALLING, COPYING OR OTHERWISE USING DATA FILES, AND/OR
+# SOFTWARE, YOU UNEQUIVOCALLY ACCEPT, AND AGREE TO BE BOUND BY, ALL OF THE
+# TERMS AND CONDITIONS OF THIS AGREEMENT. IF YOU DO NOT AGREE, DO NOT
+# DOWNLOAD, INSTALL, COPY, DISTRIBUTE OR USE THE DATA FILES OR SOFTWARE.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of data files and any associated documentation (the "Data Files") or
+# software and any associated documentation (the "Software") to deal in the
+# Data Files or Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, and/or sell
+# copies of the Data Files or Software, and to permit persons to whom the
+# Data Files or Software are furnished to do so, provided that either (a)
+# this copyright and permission notice appear with all copies of the Data
+# Files or Software, or (b) this copyright and permission notice appear in
+# associated Documentation.
+#
+# THE DATA FILES AND SOFTWARE ARE PROVIDED "AS IS", WITHOUT WARRANTY OF ANY
+# KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT OF
+# THIRD PARTY RIGHTS.
+#
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR HOLDERS INCLUDED IN THIS NOTICE
+# BE LIABLE FOR ANY CLAIM, OR ANY SPECIAL INDIRECT OR CONSEQUENTIAL DAMAGES,
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THE DATA
+# FILES OR SOFTWARE.
+#
+# Except as contained in this notice, the name of a copyright holder shall
+# not be used in advertising or otherwise to promote the sale, use or other
+# dealings in these Data Files or Software without prior written
+# authorization of the copyright holder.
+#
+
+adobe_glyphs = {
+    # glyphlist.txt
+    "/A": "\u0041",
+    "/AE": "\u00C6",
+    "/AEacute": "\u01FC",
+    "/AEmacron": "\u01E2",
+    "/AEsmall": "\uF7E6",
+    "/Aacute": "\u00C1",
+    "/Aacutesmall": "\uF7E1",
+    "/Abreve": "\u0102",
+    "/Abreveacute": "\u1EAE",
+    "/Abrevecyrillic": "\u04D0",
+    "/Abrevedotbelow": "\u1EB6",
+    "/Abrevegrave": "\u1EB0",
+    "/Abrevehookabove": "\u1EB2",
+    "/Abrevetilde": "\u1EB4",
+    "/Acaron": "\u01CD",
+    "/Acircle": "\u24B6",
+    "/Acircumflex": "\u00C2",
+    "/Acircumflexacute": "\u1EA4",
+    "/Acircumflexdotbelow": "\u1EAC",
+    "/Acircumflexgrave": "\u1EA6",
+    "/Acircumflexhookabove": "\u1EA8",
+    "/Acircumflexsmall": "\uF7E2",
+    "/Acircumflextilde": "\u1EAA",
+    "/Acute": "\uF6C9",
+    "/Acutesmall": "\uF7B4",
+    "/Acyrillic": "\u0410",
+    "/Adblgrave": "\u0200",
+    "/Adieresis": "\u00C4",
+    "/Adieresiscyrillic": "\u04D2",
+    "/Adieresismacron": "\u01DE",
+    "/Adieresissmall": "\uF7E4",
+    "/Adotbelow": "\u1EA0",
+    "/Adotmacron": "\u01E0",
+    "/Agrave": "\u00C0",
+    "/Agravesmall": "\uF7E0",
+    "/Ahookabove": "\u1EA2",
+    "/Aiecyrillic": "\u04D4",
+    "/Ainvertedbreve": "\u0202",
+    "/Alpha": "\u0391",
+    "/Alphatonos": "\u0386",
+    "/Amacron": "\u0100",
+    "/Amonospace": "\uFF21",
+    "/Aogonek": "\u0104",
+    "/Aring": "\u00C5",
+    "/Aringacute": "\u01FA",
+    "/Aringbelow": "\u1E00",
+    "/Aringsmall": "\uF7E5",
+    "/Asmall": "\uF761",
+    "/Atilde": "\u00C3",
+    "/Atildesmall": "\uF7E3",
+    "/Aybarmenian": "\u0531",
+    "/B": "\u0042",
+    "/Bcircle": "\u24B7",
+    "/Bdotaccent": "\u1E02",
+    "/Bdotbelow": "\u1E04",
+    "/Becyrillic": "\u0411",
+    "/Benarmenian": "\u0532",
+    "/Beta": "\u0392",
+    "/Bhook": "\u0181",
+    "/Blinebelow": "\u1E06",
+    "/Bmonospace": "\uFF22",
+    "/Brevesmall": "\uF6F4",
+    "/Bsmall": "\uF762",
+    "/Btopbar": "\u0182",
+    "/C": "\u0043",
+    "/Caarmenian": "\u053E",
+    "/Cacute": "\u0106",
+    "/Caron": "\uF6CA",
+    "/Caronsmall": "\uF6F5",
+    "/Ccaron": "\u010C",
+    "/Ccedilla": "\u00C7",
+    "/Ccedillaacute": "\u1E08",
+    "/Ccedillasmall": "\uF7E7",
+    "/Ccircle": "\u24B8",
+    "/Ccircumflex": "\u0108",
+    "/Cdot": "\u010A",
+    "/Cdotaccent": "\u010A",
+    "/Cedillasmall": "\uF7B8",
+    "/Chaarmenian": "\u0549",
+    "/Cheabkhasiancyrillic": "\u04BC",
+    "/Checyrillic": "\u0427",
+    "/Chedescenderabkhasiancyrillic": "\u04BE",
+    "/Chedescendercyrillic": "\u04B6",
+    "/Chedieresiscyrillic": "\u04F4",
+    "/Cheharmenian": "\u0543",
+    "/Chekhakassiancyrillic": "\u04CB",
+    "/Cheverticalstrokecyrillic": "\u04B8",
+    "/Chi": "\u03A7",
+    "/Chook": "\u0187",
+    "/Circumflexsmall": "\uF6F6",
+    "/Cmonospace": "\uFF23",
+    "/Coarmenian": "\u0551",
+    "/Csmall": "\uF763",
+    "/D": "\u0044",
+    "/DZ": "\u01F1",
+    "/DZcaron": "\u01C4",
+    "/Daarmenian": "\u0534",
+    "/Dafrican": "\u0189",
+    "/Dcaron": "\u010E",
+    "/Dcedilla": "\u1E10",
+    "/Dcircle": "\u24B9",
+    "/Dcircumflexbelow": "\u1E12",
+    "/Dcroat": "\u0110",
+    "/Ddotaccent": "\u1E0A",
+    "/Ddotbelow": "\u1E0C",
+    "/Decyrillic": "\u0414",
+    "/Deicoptic": "\u03EE",
+    "/Delta": "\u2206",
+    "/Deltagreek": "\u0394",
+    "/Dhook": "\u018A",
+    "/Dieresis": "\uF6CB",
+    "/DieresisAcute": "\uF6CC",
+    "/DieresisGrave": "\uF6CD",
+    "/Dieresissmall": "\uF7A8",
+    "/Digammagreek": "\u03DC",
+    "/Djecyrillic": "\u0402",
+    "/Dlinebelow": "\u1E0E",
+    "/Dmonospace": "\uFF24",
+    "/Dotaccentsmall": "\uF6F7",
+    "/Dslash": "\u0110",
+    "/Dsmall": "\uF764",
+    "/Dtopbar": "\u018B",
+    "/Dz": "\u01F2",
+    "/Dzcaron": "\u01C5",
+    "/Dzeabkhasiancyrillic": "\u04E0",
+    "/Dzecyrillic": "\u0405",
+    "/Dzhecyrillic": "\u040F",
+    "/E": "\u0045",
+    "/Eacute": "\u00C9",
+    "/Eacutesmall": "\uF7E9",
+    "/Ebreve": "\u0114",
+    "/Ecaron": "\u011A",
+    "/Ecedillabreve": "\u1E1C",
+    "/Echarmenian": "\u0535",
+    "/Ecircle": "\u24BA",
+    "/Ecircumflex": "\u00CA",
+    "/Ecircumflexacute": "\u1EBE",
+    "/Ecircumflexbelow": "\u1E18",
+    "/Ecircumflexdotbelow": "\u1EC6",
+    "/Ecircumflexgrave": "\u1EC0",
+    "/Ecircumflexhookabove": "\u1EC2",
+    "/Ecircumflexsmall": "\uF7EA",
+    "/Ecircumflextilde": "\u1EC4",
+    "/Ecyrillic": "\u0404",
+    "/Edblgrave": "\u0204",
+    "/Edieresis": "\u00CB",
+    "/Edieresissmall": "\uF7EB",
+    "/Edot": "\u0116",
+    "/Edotaccent": "\u0116",
+    "/Edotbelow": "\u1EB8",
+    "/Efcyrillic": "\u0424",
+    "/Egrave": "\u00C8",
+    "/Egravesmall": "\uF7E8",
+    "/Eharmenian": "\u0537",
+    "/Ehookabove": "\u1EBA",
+    "/Eightroman": "\u2167",
+    "/Einvertedbreve": "\u0206",
+    "/Eiotifiedcyrillic": "\u0464",
+    "/Elcyrillic": "\u041B",
+    "/Elevenroman": "\u216A",
+    "/Emacron": "\u0112",
+    "/Emacronacute": "\u1E16",
+    "/Emacrongrave": "\u1E14",
+    "/Emcyrillic": "\u041C",
+    "/Emonospace": "\uFF25",
+    "/Encyrillic": "\u041D",
+    "/Endescendercyrillic": "\u04A2",
+    "/Eng": "\u014A",
+    "/Enghecyrillic": "\u04A4",
+    "/Enhookcyrillic": "\u04C7",
+    "/Eogonek": "\u0118",
+    "/Eopen": "\u0190",
+    "/Epsilon": "\u0395",
+    "/Epsilontonos": "\u0388",
+    "/Ercyrillic": "\u0420",
+    "/Ereversed": "\u018E",
+    "/Ereversedcyrillic": "\u042D",
+    "/Escyrillic": "\u0421",
+    "/Esdescendercyrillic": "\u04AA",
+    "/Esh": "\u01A9",
+    "/Esmall": "\uF765",
+    "/Eta": "\u0397",
+    "/Etarmenian": "\u0538",
+    "/Etatonos": "\u0389",
+    "/Eth": "\u00D0",
+    "/Ethsmall": "\uF7F0",
+    "/Etilde": "\u1EBC",
+    "/Etildebelow": "\u1E1A",
+    "/Euro": "\u20AC",
+    "/Ezh": "\u01B7",
+    "/Ezhcaron": "\u01EE",
+    "/Ezhreversed": "\u01B8",
+    "/F": "\u0046",
+    "/Fcircle": "\u24BB",
+    "/Fdotaccent": "\u1E1E",
+    "/Feharmenian": "\u0556",
+    "/Feicoptic": "\u03E4",
+    "/Fhook": "\u0191",
+    "/Fitacyrillic": "\u0472",
+    "/Fiveroman": "\u2164",
+    "/Fmonospace": "\uFF26",
+    "/Fourroman": "\u2163",
+    "/Fsmall": "\uF766",
+    "/G": "\u0047",
+    "/GBsquare": "\u3387",
+    "/Gacute": "\u01F4",
+    "/Gamma": "\u0393",
+    "/Gammaafrican": "\u0194",
+    "/Gangiacoptic": "\u03EA",
+    "/Gbreve": "\u011E",
+    "/Gcaron": "\u01E6",
+    "/Gcedilla": "\u0122",
+    "/Gcircle": "\u24BC",
+    "/Gcircumflex": "\u011C",
+    "/Gcommaaccent": "\u0122",
+    "/Gdot": "\u0120",
+    "/Gdotaccent": "\u0120",
+    "/Gecyrillic": "\u0413",
+    "/Ghadarmenian": "\u0542",
+    "/Ghemiddlehookcyrillic": "\u0494",
+    "/Ghestrokecyrillic": "\u0492",
+    "/Gheupturncyrillic": "\u0490",
+    "/Ghook": "\u0193",
+    "/Gimarmenian": "\u0533",
+    "/Gjecyrillic": "\u0403",
+    "/Gmacron": "\u1E20",
+    "/Gmonospace": "\uFF27",
+    "/Grave": "\uF6CE",
+    "/Gravesmall": "\uF760",
+    "/Gsmall": "\uF767",
+    "/Gsmallhook": "\u029B",
+    "/Gstroke": "\u01E4",
+    "/H": "\u0048",
+    "/H18533": "\u25CF",
+    "/H18543": "\u25AA",
+    "/H18551": "\u25AB",
+    "/H22073": "\u25A1",
+    "/HPsquare": "\u33CB",
+    "/Haabkhasiancyrillic": "\u04A8",
+    "/Hadescendercyrillic": "\u04B2",
+    "/Hardsigncyrillic": "\u042A",
+    "/Hbar": "\u0126",
+    "/Hbrevebelow": "\u1E2A",
+    "/Hcedilla": "\u1E28",
+    "/Hcircle": "\u24BD",
+    "/Hcircumflex": "\u0124",
+    "/Hdieresis": "\u1E26",
+    "/Hdotaccent": "\u1E22",
+    "/Hdotbelow": "\u1E24",
+    "/Hmonospace": "\uFF28",
+    "/Hoarmenian": "\u0540",
+    "/Horicoptic": "\u03E8",
+    "/Hsmall": "\uF768",
+    "/Hungarumlaut": "\uF6CF",
+    "/Hungarumlautsmall": "\uF6F8",
+    "/Hzsquare": "\u3390",
+    "/I": "\u0049",
+    "/IAcyrillic": "\u042F",
+    "/IJ": "\u0132",
+    "/IUcyrillic": "\u042E",
+    "/Iacute": "\u00CD",
+    "/Iacutesmall": "\uF7ED",
+    "/Ibreve": "\u012C",
+    "/Icaron": "\u01CF",
+    "/Icircle": "\u24BE",
+    "/Icircumflex": "\u00CE",
+    "/Icircumflexsmall": "\uF7EE",
+    "/Icyrillic": "\u0406",
+    "/Idblgrave": "\u0208",
+    "/Idieresis": "\u00CF",
+    "/Idieresisacute": "\u1E2E",
+    "/Idieresiscyrillic": "\u04E4",
+    "/Idieresissmall": "\uF7EF",
+    "/Idot": "\u0130",
+    "/Idotaccent": "\u0130",
+    "/Idotbelow": "\u1ECA",
+    "/Iebrevecyrillic": "\u04D6",
+    "/Iecyrillic": "\u0415",
+    "/Ifraktur": "\u2111",
+    "/Igrave": "\u00CC",
+    "/Igravesmall": "\uF7EC",
+    "/Ihookabove": "\u1EC8",
+    "/Iicyrillic": "\u0418",
+    "/Iinvertedbreve": "\u020A",
+    "/Iishortcyrillic": "\u0419",
+    "/Imacron": "\u012A",
+    "/Imacroncyrillic": "\u04E2",
+    "/Imonospace": "\uFF29",
+    "/Iniarmenian": "\u053B",
+    "/Iocyrillic": "\u0401",
+    "/Iogonek": "\u012E",
+    "/Iota": "\u0399",
+    "/Iotaafrican": "\u0196",
+    "/Iotadieresis": "\u03AA",
+    "/Iotatonos": "\u038A",
+    "/Ismall": "\uF769",
+    "/Istroke": "\u0197",
+    "/Itilde": "\u0128",
+    "/Itildebelow": "\u1E2C",
+    "/Izhitsacyrillic": "\u0474",
+    "/Izhitsadblgravecyrillic": "\u0476",
+    "/J": "\u004A",
+    "/Jaarmenian": "\u0541",
+    "/Jcircle": "\u24BF",
+    "/Jcircumflex": "\u0134",
+    "/Jecyrillic": "\u0408",
+    "/Jheharmenian": "\u054B",
+    "/Jmonospace": "\uFF2A",
+    "/Jsmall": "\uF76A",
+    "/K": "\u004B",
+    "/KBsquare": "\u3385",
+    "/KKsquare": "\u33CD",
+    "/Kabashkircyrillic": "\u04A0",
+    "/Kacute": "\u1E30",
+    "/Kacyrillic": "\u041A",
+    "/Kadescendercyrillic": "\u049A",
+    "/Kahookcyrillic": "\u04C3",
+    "/Kappa": "\u039A",
+    "/Kastrokecyrillic": "\u049E",
+    "/Kaverticalstrokecyrillic": "\u049C",
+    "/Kcaron": "\u01E8",
+    "/Kcedilla": "\u0136",
+    "/Kcircle": "\u24C0",
+    "/Kcommaaccent": "\u0136",
+    "/Kdotbelow": "\u1E32",
+    "/Keharmenian": "\u0554",
+    "/Kenarmenian": "\u053F",
+    "/Khacyrillic": "\u0425",
+    "/Kheicoptic": "\u03E6",
+    "/Khook": "\u0198",
+    "/Kjecyrillic": "\u040C",
+    "/Klinebelow": "\u1E34",
+    "/Kmonospace": "\uFF2B",
+    "/Koppacyrillic": "\u0480",
+    "/Koppagreek": "\u03DE",
+    "/Ksicyrillic": "\u046E",
+    "/Ksmall": "\uF76B",
+    "/L": "\u004C",
+    "/LJ": "\u01C7",
+    "/LL": "\uF6BF",
+    "/Lacute": "\u0139",
+    "/Lambda": "\u039B",
+    "/Lcaron": "\u013D",
+    "/Lcedilla": "\u013B",
+    "/Lcircle": "\u24C1",
+    "/Lcircumflexbelow": "\u1E3C",
+    "/Lcommaaccent": "\u013B",
+    "/Ldot": "\u013F",
+    "/Ldotaccent": "\u013F",
+    "/Ldotbelow": "\u1E36",
+    "/Ldotbelowmacron": "\u1E38",
+    "/Liwnarmenian": "\u053C",
+    "/Lj": "\u01C8",
+    "/Ljecyrillic": "\u0409",
+    "/Llinebelow": "\u1E3A",
+    "/Lmonospace": "\uFF2C",
+    "/Lslash": "\u0141",
+    "/Lslashsmall": "\uF6F9",
+    "/Lsmall": "\uF76C",
+    "/M": "\u004D",
+    "/MBsquare": "\u3386",
+    "/Macron": "\uF6D0",
+    "/Macronsmall": "\uF7AF",
+    "/Macute": "\u1E3E",
+    "/Mcircle": "\u24C2",
+    "/Mdotaccent": "\u1E40",
+    "/Mdotbelow": "\u1E42",
+    "/Menarmenian": "\u0544",
+    "/Mmonospace": "\uFF2D",
+    "/Msmall": "\uF76D",
+    "/Mturned": "\u019C",
+    "/Mu": "\u039C",
+    "/N": "\u004E",
+    "/NJ": "\u01CA",
+    "/Nacute": "\u0143",
+    "/Ncaron": "\u0147",
+    "/Ncedilla": "\u0145",
+    "/Ncircle": "\u24C3",
+    "/Ncircumflexbelow": "\u1E4A",
+    "/Ncommaaccent": "\u0145",
+    "/Ndotaccent": "\u1E44",
+    "/Ndotbelow": "\u1E46",
+    "/Nhookleft": "\u019D",
+    "/Nineroman": "\u2168",
+    "/Nj": "\u01CB",
+    "/Njecyrillic": "\u040A",
+    "/Nlinebelow": "\u1E48",
+    "/Nmonospace": "\uFF2E",
+    "/Nowarmenian": "\u0546",
+    "/Nsmall": "\uF76E",
+    "/Ntilde": "\u00D1",
+    "/Ntildesmall": "\uF7F1",
+    "/Nu": "\u039D",
+    "/O": "\u004F",
+    "/OE": "\u0152",
+    "/OEsmall": "\uF6FA",
+    "/Oacute": "\u00D3",
+    "/Oacutesmall": "\uF7F3",
+    "/Obarredcyrillic": "\u04E8",
+    "/Obarreddieresiscyrillic": "\u04EA",
+    "/Obreve": "\u014E",
+    "/Ocaron": "\u01D1",
+    "/Ocenteredtilde": "\u019F",
+    "/Ocircle": "\u24C4",
+    "/Ocircumflex": "\u00D4",
+    "/Ocircumflexacute": "\u1ED0",
+    "/Ocircumflexdotbelow": "\u1ED8",
+    "/Ocircumflexgrave": "\u1ED2",
+    "/Ocircumflexhookabove": "\u1ED4",
+    "/Ocircumflexsmall": "\uF7F4",
+    "/Ocircumflextilde": "\u1ED6",
+    "/Ocyrillic": "\u041E",
+    "/Odblacute": "\u0150",
+    "/Odblgrave": "\u020C",
+    "/Odieresis": "\u00D6",
+    "/Odieresiscyrillic": "\u04E6",
+    "/Odieresissmall": "\uF7F6",
+    "/Odotbelow": "\u1ECC",
+    "/Ogoneksmall": "\uF6FB",
+    "/Ograve": "\u00D2",
+    "/Ogravesmall": "\uF7F2",
+    "/Oharmenian": "\u0555",
+    "/Ohm": "\u2126",
+    "/Ohookabove": "\u1ECE",
+    "/Ohorn": "\u01A0",
+    "/Ohornacute": "\u1EDA",
+    "/Ohorndotbelow": "\u1EE2",
+    "/Ohorngrave": "\u1EDC",
+    "/Ohornhookabove": "\u1EDE",
+    "/Ohorntilde": "\u1EE0",
+    "/Ohungarumlaut": "\u0150",
+    "/Oi": "\u01A2",
+    "/Oinvertedbreve": "\u020E",
+    "/Omacron": "\u014C",
+    "/Omacronacute": "\u1E52",
+    "/Omacrongrave": "\u1E50",
+    "/Omega": "\u2126",
+    "/Omegacyrillic": "\u0460",
+    "/Omegagreek": "\u03A9",
+    "/Omegaroundcyrillic": "\u047A",
+    "/Omegatitlocyrillic": "\u047C",
+    "/Omegatonos": "\u038F",
+    "/Omicron": "\u039F",
+    "/Omicrontonos": "\u038C",
+    "/Omonospace": "\uFF2F",
+    "/Oneroman": "\u2160",
+    "/Oogonek": "\u01EA",
+    "/Oogonekmacron": "\u01EC",
+    "/Oopen": "\u0186",
+    "/Oslash": "\u00D8",
+    "/Oslashacute": "\u01FE",
+    "/Oslashsmall": "\uF7F8",
+    "/Osmall": "\uF76F",
+    "/Ostrokeacute": "\u01FE",
+    "/Otcyrillic": "\u047E",
+    "/Otilde": "\u00D5",
+    "/Otildeacute": "\u1E4C",
+    "/Otildedieresis": "\u1E4E",
+    "/Otildesmall": "\uF7F5",
+    "/P": "\u0050",
+    "/Pacute": "\u1E54",
+    "/Pcircle": "\u24C5",
+    "/Pdotaccent": "\u1E56",
+    "/Pecyrillic": "\u041F",
+    "/Peharmenian": "\u054A",
+    "/Pemiddlehookcyrillic": "\u04A6",
+    "/Phi": "\u03A6",
+    "/Phook": "\u01A4",
+    "/Pi": "\u03A0",
+    "/Piwrarmenian": "\u0553",
+    "/Pmonospace": "\uFF30",
+    "/Psi": "\u03A8",
+    "/Psicyrillic": "\u0470",
+    "/Psmall": "\uF770",
+    "/Q": "\u0051",
+    "/Qcircle": "\u24C6",
+    "/Qmonospace": "\uFF31",
+    "/Qsmall": "\uF771",
+    "/R": "\u0052",
+    "/Raarmenian": "\u054C",
+    "/Racute": "\u0154",
+    "/Rcaron": "\u0158",
+    "/Rcedilla": "\u0156",
+    "/Rcircle": "\u24C7",
+    "/Rcommaaccent": "\u0156",
+    "/Rdblgrave": "\u0210",
+    "/Rdotaccent": "\u1E58",
+    "/Rdotbelow": "\u1E5A",
+    "/Rdotbelowmacron": "\u1E5C",
+    "/Reharmenian": "\u0550",
+    "/Rfraktur": "\u211C",
+    "/Rho": "\u03A1",
+    "/Ringsmall": "\uF6FC",
+    "/Rinvertedbreve": "\u0212",
+    "/Rlinebelow": "\u1E5E",
+    "/Rmonospace": "\uFF32",
+    "/Rsmall": "\uF772",
+    "/Rsmallinverted": "\u0281",
+    "/Rsmallinvertedsuperior": "\u02B6",
+    "/S": "\u0053",
+    "/SF010000": "\u250C",
+    "/SF020000": "\u2514",
+    "/SF030000": "\u2510",
+    "/SF040000": "\u2518",
+    "/SF050000": "\u253C",
+    "/SF060000": "\u252C",
+    "/SF070000": "\u2534",
+    "/SF080000": "\u251C",
+    "/SF090000": "\u2524",
+    "/SF100000": "\u2500",
+    "/SF110000": "\u2502",
+    "/SF190000": "\u2561",
+    "/SF200000": "\u2562",
+    "/SF210000": "\u2556",
+    "/SF220000": "\u2555",
+    "/SF230000": "\u2563",
+    "/SF240000": "\u2551",
+    "/SF250000": "\u2557",
+    "/SF260000": "\u255D",
+    "/SF270000": "\u255C",
+    "/SF280000": "\u255B",
+    "/SF360000": "\u255E",
+    "/SF370000": "\u255F",
+    "/SF380000": "\u255A",
+    "/SF390000": "\u2554",
+    "/SF400000": "\u2569",
+    "/SF410000": "\u2566",
+    "/SF420000": "\u2560",
+    "/SF430000": "\u2550",
+    "/SF440000": "\u256C",
+    "/SF450000": "\u2567",
+    "/SF460000": "\u2568",
+    "/SF470000": "\u2564",
+    "/SF480000": "\u2565",
+    "/SF490000": "\u2559",
+    "/SF500000": "\u2558",
+    "/SF510000": "\u2552",
+    "/SF520000": "\u2553",
+    "/SF530000": "\u256B",
+    "/SF540000": "\u256A",
+    "/Sacute": "\u015A",
+    "/Sacutedotaccent": "\u1E64",
+    "/Sampigreek": "\u03E0",
+    "/Scaron": "\u0160",
+    "/Scarondotaccent": "\u1E66",
+    "/Scaronsmall": "\uF6FD",
+    "/Scedilla": "\u015E",
+    "/Schwa": "\u018F",
+    "/Schwacyrillic": "\u04D8",
+    "/Schwadieresiscyrillic": "\u04DA",
+    "/Scircle": "\u24C8",
+    "/Scircumflex": "\u015C",
+    "/Scommaaccent": "\u0218",
+    "/Sdotaccent": "\u1E60",
+    "/Sdotbelow": "\u1E62",
+    "/Sdotbelowdotaccent": "\u1E68",
+    "/Seharmenian": "\u054D",
+    "/Sevenroman": "\u2166",
+    "/Shaarmenian": "\u0547",
+    "/Shacyrillic": "\u0428",
+    "/Shchacyrillic": "\u0429",
+    "/Sheicoptic": "\u03E2",
+    "/Shhacyrillic": "\u04BA",
+    "/Shimacoptic": "\u03EC",
+    "/Sigma": "\u03A3",
+    "/Sixroman": "\u2165",
+    "/Smonospace": "\uFF33",
+    "/Softsigncyrillic": "\u042C",
+    "/Ssmall": "\uF773",
+    "/Stigmagreek": "\u03DA",
+    "/T": "\u0054",
+    "/Tau": "\u03A4",
+    "/Tbar": "\u0166",
+    "/Tcaron": "\u0164",
+    "/Tcedilla": "\u0162",
+    "/Tcircle": "\u24C9",
+    "/Tcircumflexbelow": "\u1E70",
+    "/Tcommaaccent": "\u0162",
+    "/Tdotaccent": "\u1E6A",
+    "/Tdotbelow": "\u1E6C",
+    "/Tecyrillic": "\u0422",
+    "/Tedescendercyrillic": "\u04AC",
+    "/Tenroman": "\u2169",
+    "/Tetsecyrillic": "\u04B4",
+    "/Theta": "\u0398",
+    "/Thook": "\u01AC",
+    "/Thorn": "\u00DE",
+    "/Thornsmall": "\uF7FE",
+    "/Threeroman": "\u2162",
+    "/Tildesmall": "\uF6FE",
+    "/Tiwnarmenian": "\u054F",
+    "/Tlinebelow": "\u1E6E",
+    "/Tmonospace": "\uFF34",
+    "/Toarmenian": "\u0539",
+    "/Tonefive": "\u01BC",
+    "/Tonesix": "\u0184",
+    "/Tonetwo": "\u01A7",
+    "/Tretroflexhook": "\u01AE",
+    "/Tsecyrillic": "\u0426",
+    "/Tshecyrillic": "\u040B",
+    "/Tsmall": "\uF774",
+    "/Twelveroman": "\u216B",
+    "/Tworoman": "\u2161",
+    "/U": "\u0055",
+    "/Uacute": "\u00DA",
+    "/Uacutesmall": "\uF7FA",
+    "/Ubreve": "\u016C",
+    "/Ucaron": "\u01D3",
+    "/Ucircle": "\u24CA",
+    "/Ucircumflex": "\u00DB",
+    "/Ucircumflexbelow": "\u1E76",
+    "/Ucircumflexsmall": "\uF7FB",
+    "/Ucyrillic": "\u0423",
+    "/Udblacute": "\u0170",
+    "/Udblgrave": "\u0214",
+    "/Udieresis": "\u00DC",
+    "/Udieresisacute": "\u01D7",
+    "/Udieresisbelow": "\u1E72",
+    "/Udieresiscaron": "\u01D9",
+    "/Udieresiscyrillic": "\u04F0",
+    "/Udieresisgrave": "\u01DB",
+    "/Udieresismacron": "\u01D5",
+    "/Udieresissmall": "\uF7FC",
+    "/Udotbelow": "\u1EE4",
+    "/Ugrave": "\u00D9",
+    "/Ugravesmall": "\uF7F9",
+    "/Uhookabove": "\u1EE6",
+    "/Uhorn": "\u01AF",
+    "/Uhornacute": "\u1EE8",
+    "/Uhorndotbelow": "\u1EF0",
+    "/Uhorngrave": "\u1EEA",
+    "/Uhornhookabove": "\u1EEC",
+    "/Uhorntilde": "\u1EEE",
+    "/Uhungarumlaut": "\u0170",
+    "/Uhungarumlautcyrillic": "\u04F2",
+    "/Uinvertedbreve": "\u0216",
+    "/Ukcyrillic": "\u0478",
+    "/Umacron": "\u016A",
+    "/Umacroncyrillic": "\u04EE",
+    "/Umacrondieresis": "\u1E7A",
+    "/Umonospace": "\uFF35",
+    "/Uogonek": "\u0172",
+    "/Upsilon": "\u03A5",
+    "/Upsilon1": "\u03D2",
+    "/Upsilonacutehooksymbolgreek": "\u03D3",
+    "/Upsilonafrican": "\u01B1",
+    "/Upsilondieresis": "\u03AB",
+    "/Upsilondieresishooksymbolgreek": "\u03D4",
+    "/Upsilonhooksymbol": "\u03D2",
+    "/Upsilontonos": "\u038E",
+    "/Uring": "\u016E",
+    "/Ushortcyrillic": "\u040E",
+    "/Usmall": "\uF775",
+    "/Ustraightcyrillic": "\u04AE",
+    "/Ustraightstrokecyrillic": "\u04B0",
+    "/Utilde": "\u0168",
+    "/Utildeacute": "\u1E78",
+    "/Utildebelow": "\u1E74",
+    "/V": "\u0056",
+    "/Vcircle": "\u24CB",
+    "/Vdotbelow": "\u1E7E",
+    "/Vecyrillic": "\u0412",
+    "/Vewarmenian": "\u054E",
+    "/Vhook": "\u01B2",
+    "/Vmonospace": "\uFF36",
+    "/Voarmenian": "\u0548",
+    "/Vsmall": "\uF776",
+    "/Vtilde": "\u1E7C",
+    "/W": "\u0057",
+    "/Wacute": "\u1E82",
+    "/Wcircle": "\u24CC",
+    "/Wcircumflex": "\u0174",
+    "/Wdieresis": "\u1E84",
+    "/Wdotaccent": "\u1E86",
+    "/Wdotbelow": "\u1E88",
+    "/Wgrave": "\u1E80",
+    "/Wmonospace": "\uFF37",
+    "/Wsmall": "\uF777",
+    "/X": "\u0058",
+    "/Xcircle": "\u24CD",
+    "/Xdieresis": "\u1E8C",
+    "/Xdotaccent": "\u1E8A",
+    "/Xeharmenian": "\u053D",
+    "/Xi": "\u039E",
+    "/Xmonospace": "\uFF38",
+    "/Xsmall": "\uF778",
+    "/Y": "\u0059",
+    "/Yacute": "\u00DD",
+    "/Yacutesmall": "\uF7FD",
+    "/Yatcyrillic": "\u0462",
+    "/Ycircle": "\u24CE",
+    "/Ycircumflex": "\u0176",
+    "/Ydieresis": "\u0178",
+    "/Ydieresissmall": "\uF7FF",
+    "/Ydotaccent": "\u1E8E",
+    "/Ydotbelow": "\u1EF4",
+    "/Yericyrillic": "\u042B",
+    "/Yerudieresiscyrillic": "\u04F8",
+    "/Ygrave": "\u1EF2",
+    "/Yhook": "\u01B3",
+    "/Yhookabove": "\u1EF6",
+    "/Yiarmenian": "\u0545",
+    "/Yicyrillic": "\u0407",
+    "/Yiwnarmenian": "\u0552",
+    "/Ymonospace": "\uFF39",
+    "/Ysmall": "\uF779",
+    "/Ytilde": "\u1EF8",
+    "/Yusbigcyrillic": "\u046A",
+    "/Yusbigiotifiedcyrillic": "\u046C",
+    "/Yuslittlecyrillic": "\u0466",
+    "/Yuslittleiotifiedcyrillic": "\u0468",
+    "/Z": "\u005A",
+    "/Zaarmenian": "\u0536",
+    "/Zacute": "\u0179",
+    "/Zcaron": "\u017D",
+    "/Zcaronsmall": "\uF6FF",
+    "/Zcircle": "\u24CF",
+    "/Zcircumflex": "\u1E90",
+    "/Zdot": "\u017B",
+    "/Zdotaccent": "\u017B",
+    "/Zdotbelow": "\u1E92",
+    "/Zecyrillic": "\u0417",
+    "/Zedescendercyrillic": "\u0498",
+    "/Zedieresiscyrillic": "\u04DE",
+    "/Zeta": "\u0396",
+    "/Zhearmenian": "\u053A",
+    "/Zhebrevecyrillic": "\u04C1",
+    "/Zhecyrillic": "\u0416",
+    "/Zhedescendercyrillic": "\u0496",
+    "/Zhedieresiscyrillic": "\u04DC",
+    "/Zlinebelow": "\u1E94",
+    "/Zmonospace": "\uFF3A",
+    "/Zsmall": "\uF77A",
+    "/Zstroke": "\u01B5",
+    "/a": "\u0061",
+    "/aabengali": "\u0986",
+    "/aacute": "\u00E1",
+    "/aadeva": "\u0906",
+    "/aagujarati": "\u0A86",
+    "/aagurmukhi": "\u0A06",
+    "/aamatragurmukhi": "\u0A3E",
+    "/aarusquare": "\u3303",
+    "/aavowelsignbengali": "\u09BE",
+    "/aavowelsigndeva": "\u093E",
+    "/aavowelsigngujarati": "\u0ABE",
+    "/abbreviationmarkarmenian": "\u055F",
+    "/abbreviationsigndeva": "\u0970",
+    "/abengali": "\u0985",
+    "/abopomofo": "\u311A",
+    "/abreve": "\u0103",
+    "/abreveacute": "\u1EAF",
+    "/abrevecyrillic": "\u04D1",
+    "/abrevedotbelow": "\u1EB7",
+    "/abrevegrave": "\u1EB1",
+    "/abrevehookabove": "\u1EB3",
+    "/abrevetilde": "\u1EB5",
+    "/acaron": "\u01CE",
+    "/acircle": "\u24D0",
+    "/acircumflex": "\u00E2",
+    "/acircumflexacute": "\u1EA5",
+    "/acircumflexdotbelow": "\u1EAD",
+    "/acircumflexgrave": "\u1EA7",
+    "/acircumflexhookabove": "\u1EA9",
+    "/acircumflextilde": "\u1EAB",
+    "/acute": "\u00B4",
+    "/acutebelowcmb": "\u0317",
+    "/acutecmb": "\u0301",
+    "/acutecomb": "\u0301",
+    "/acutedeva": "\u0954",
+    "/acutelowmod": "\u02CF",
+    "/acutetonecmb": "\u0341",
+    "/acyrillic": "\u0430",
+    "/adblgrave": "\u0201",
+    "/addakgurmukhi": "\u0A71",
+    "/adeva": "\u0905",
+    "/adieresis": "\u00E4",
+    "/adieresiscyrillic": "\u04D3",
+    "/adieresismacron": "\u01DF",
+    "/adotbelow": "\u1EA1",
+    "/adotmacron": "\u01E1",
+    "/ae": "\u00E6",
+    "/aeacute": "\u01FD",
+    "/aekorean": "\u3150",
+    "/aemacron": "\u01E3",
+    "/afii00208": "\u2015",
+    "/afii08941": "\u20A4",
+    "/afii10017": "\u0410",
+    "/afii10018": "\u0411",
+    "/afii10019": "\u0412",
+    "/afii10020": "\u0413",
+    "/afii10021": "\u0414",
+    "/afii10022": "\u0415",
+    "/afii10023": "\u0401",
+    "/afii10024": "\u0416",
+    "/afii10025": "\u0417",
+    "/afii10026": "\u0418",
+    "/afii10027": "\u0419",
+    "/afii10028": "\u041A",
+    "/afii10029": "\u041B",
+    "/afii10030": "\u041C",
+    "/afii10031": "\u041D",
+    "/afii10032": "\u041E",
+    "/afii10033": "\u041F",
+    "/afii10034": "\u0420",
+    "/afii10035": "\u0421",
+    "/afii10036": "\u0422",
+    "/afii10037": "\u0423",
+    "/afii10038": "\u0424",
+    "/afii10039": "\u0425",
+    "/afii10040": "\u0426",
+    "/afii10041": "\u0427",
+    "/afii10042": "\u0428",
+    "/afii10043": "\u0429",
+    "/afii10044": "\u042A",
+    "/afii10045": "\u042B",
+    "/afii10046": "\u042C",
+    "/afii10047": "\u042D",
+    "/afii10048": "\u042E",
+    "/afii10049": "\u042F",
+    "/afii10050": "\u0490",
+    "/afii10051": "\u0402",
+    "/afii10052": "\u0403",
+    "/afii10053": "\u0404",
+    "/afii10054": "\u0405",
+    "/afii10055": "\u0406",
+    "/afii10056": "\u0407",
+    "/afii10057": "\u0408",
+    "/afii10058": "\u0409",
+    "/afii10059": "\u040A",
+    "/afii10060": "\u040B",
+    "/afii10061": "\u040C",
+    "/afii10062": "\u040E",
+    "/afii10063": "\uF6C4",
+    "/afii10064": "\uF6C5",
+    "/afii10065": "\u0430",
+    "/afii10066": "\u0431",
+    "/afii10067": "\u0432",
+    "/afii10068": "\u0433",
+    "/afii10069": "\u0434",
+    "/afii10070": "\u0435",
+    "/afii10071": "\u0451",
+    "/afii10072": "\u0436",
+    "/afii10073": "\u0437",
+    "/afii10074": "\u0438",
+    "/afii10075": "\u0439",
+    "/afii10076": "\u043A",
+    "/afii10077": "\u043B",
+    "/afii10078": "\u043C",
+    "/afii10079": "\u043D",
+    "/afii10080": "\u043E",
+    "/afii10081": "\u043F",
+    "/afii10082": "\u0440",
+    "/afii10083": "\u0441",
+    "/afii10084": "\u0442",
+    "/afii10085": "\u0443",
+    "/afii10086": "\u0444",
+    "/afii10087": "\u0445",
+    "/afii10088": "\u0446",
+    "/afii10089": "\u0447",
+    "/afii10090": "\u0448",
+    "/afii10091": "\u0449",
+    "/afii10092": "\u044A",
+    "/afii10093": "\u044B",
+    "/afii10094": "\u044C",
+    "/afii10095": "\u044D",
+    "/afii10096": "\u044E",
+    "/afii10097": "\u044F",
+    "/afii10098": "\u0491",
+    "/afii10099": "\u0452",
+    "/afii10100": "\u0453",
+    "/afii10101": "\u0454",
+    "/afii10102": "\u0455",
+    "/afii10103": "\u0456",
+    "/afii10104": "\u0457",
+    "/afii10105": "\u0458",
+    "/afii10106": "\u0459",
+    "/afii10107": "\u045A",
+    "/afii10108": "\u045B",
+    "/afii10109": "\u045C",
+    "/afii10110": "\u045E",
+    "/afii10145": "\u040F",
+    "/afii10146": "\u0462",
+    "/afii10147": "\u0472",
+    "/afii10148": "\u0474",
+    "/afii10192": "\uF6C6",
+    "/afii10193": "\u045F",
+    "/afii10194": "\u0463",
+    "/afii10195": "\u0473",
+    "/afii10196": "\u0475",
+    "/afii10831": "\uF6C7",
+    "/afii10832": "\uF6C8",
+    "/afii10846": "\u04D9",
+    "/afii299": "\u200E",
+    "/afii300": "\u200F",
+    "/afii301": "\u200D",
+    "/afii57381": "\u066A",
+    "/afii57388": "\u060C",
+    "/afii57392": "\u0660",
+    "/afii57393": "\u0661",
+    "/afii57394": "\u0662",
+    "/afii57395": "\u0663",
+    "/afii57396": "\u0664",
+    "/afii57397": "\u0665",
+    "/afii57398": "\u0666",
+    "/afii57399": "\u0667",
+    "/afii57400": "\u0668",
+    "/afii57401": "\u0669",
+    "/afii57403": "\u061B",
+    "/afii57407": "\u061F",
+    "/afii57409": "\u0621",
+    "/afii57410": "\u0622",
+    "/afii57411": "\u0623",
+    "/afii57412": "\u0624",
+    "/afii57413": "\u0625",
+    "/afii57414": "\u0626",
+    "/afii57415": "\u0627",
+    "/afii57416": "\u0628",
+    "/afii57417": "\u0629",
+    "/afii57418": "\u062A",
+    "/afii57419": "\u062B",
+    "/afii57420": "\u062C",
+    "/afii57421": "\u062D",
+    "/afii57422": "\u062E",
+    "/afii57423": "\u062F",
+    "/afii57424": "\u0630",
+    "/afii57425": "\u0631",
+    "/afii57426": "\u0632",
+    "/afii57427": "\u0633",
+    "/afii57428": "\u0634",
+    "/afii57429": "\u0635",
+    "/afii57430": "\u0636",
+    "/afii57431": "\u0637",
+    "/afii57432": "\u0638",
+    "/afii57433": "\u0639",
+    "/afii57434": "\u063A",
+    "/afii57440": "\u0640",
+    "/afii57441": "\u0641",
+    "/afii57442": "\u0642",
+    "/afii57443": "\u0643",
+    "/afii57444": "\u0644",
+    "/afii57445": "\u0645",
+    "/afii57446": "\u0646",
+    "/afii57448": "\u0648",
+    "/afii57449": "\u0649",
+    "/afii57450": "\u064A",
+    "/afii57451": "\u064B",
+    "/afii57452": "\u064C",
+    "/afii57453": "\u064D",
+    "/afii57454": "\u064E",
+    "/afii57455": "\u064F",
+    "/afii57456": "\u0650",
+    "/afii57457": "\u0651",
+    "/afii57458": "\u0652",
+    "/afii57470": "\u0647",
+    "/afii57505": "\u06A4",
+    "/afii57506": "\u067E",
+    "/afii57507": "\u0686",
+    "/afii57508": "\u0698",
+    "/afii57509": "\u06AF",
+    "/afii57511": "\u0679",
+    "/afii57512": "\u0688",
+    "/afii57513": "\u0691",
+    "/afii57514": "\u06BA",
+    "/afii57519": "\u06D2",
+    "/afii57534": "\u06D5",
+    "/afii57636": "\u20AA",
+    "/afii57645": "\u05BE",
+    "/afii57658": "\u05C3",
+    "/afii57664": "\u05D0",
+    "/afii57665": "\u05D1",
+    "/afii57666": "\u05D2",
+    "/afii57667": "\u05D3",
+    "/afii57668": "\u05D4",
+    "/afii57669": "\u05D5",
+    "/afii57670": "\u05D6",
+    "/afii57671": "\u05D7",
+    "/afii57672": "\u05D8",
+    "/afii57673": "\u05D9",
+    "/afii57674": "\u05DA",
+    "/afii57675": "\u05DB",
+    "/afii57676": "\u05DC",
+    "/afii57677": "\u05DD",
+    "/afii57678": "\u05DE",
+    "/afii57679": "\u05DF",
+    "/afii57680": "\u05E0",
+    "/afii57681": "\u05E1",
+    "/afii57682": "\u05E2",
+    "/afii57683": "\u05E3",
+    "/afii57684": "\u05E4",
+    "/afii57685": "\u05E5",
+    "/afii57686": "\u05E6",
+    "/afii57687": "\u05E7",
+    "/afii57688": "\u05E8",
+    "/afii57689": "\u05E9",
+    "/afii57690": "\u05EA",
+    "/afii57694": "\uFB2A",
+    "/afii57695": "\uFB2B",
+    "/afii57700": "\uFB4B",
+    "/afii57705": "\uFB1F",
+    "/afii57716": "\u05F0",
+    "/afii57717": "\u05F1",
+    "/afii57718": "\u05F2",
+    "/afii57723": "\uFB35",
+    "/afii57793": "\u05B4",
+    "/afii57794": "\u05B5",
+    "/afii57795": "\u05B6",
+    "/afii57796": "\u05BB",
+    "/afii57797": "\u05B8",
+    "/afii57798": "\u05B7",
+    "/afii57799": "\u05B0",
+    "/afii57800": "\u05B2",
+    "/afii57801": "\u05B1",
+    "/afii57802": "\u05B3",
+    "/afii57803": "\u05C2",
+    "/afii57804": "\u05C1",
+    "/afii57806": "\u05B9",
+    "/afii57807": "\u05BC",
+    "/afii57839": "\u05BD",
+    "/afii57841": "\u05BF",
+    "/afii57842": "\u05C0",
+    "/afii57929": "\u02BC",
+    "/afii61248": "\u2105",
+    "/afii61289": "\u2113",
+    "/afii61352": "\u2116",
+    "/afii61573": "\u202C",
+    "/afii61574": "\u202D",
+    "/afii61575": "\u202E",
+    "/afii61664": "\u200C",
+    "/afii63167": "\u066D",
+    "/afii64937": "\u02BD",
+    "/agrave": "\u00E0",
+    "/agujarati": "\u0A85",
+    "/agurmukhi": "\u0A05",
+    "/ahiragana": "\u3042",
+    "/ahookabove": "\u1EA3",
+    "/aibengali": "\u0990",
+    "/aibopomofo": "\u311E",
+    "/aideva": "\u0910",
+    "/aiecyrillic": "\u04D5",
+    "/aigujarati": "\u0A90",
+    "/aigurmukhi": "\u0A10",
+    "/aimatragurmukhi": "\u0A48",
+    "/ainarabic": "\u0639",
+    "/ainfinalarabic": "\uFECA",
+    "/aininitialarabic": "\uFECB",
+    "/ainmedialarabic": "\uFECC",
+    "/ainvertedbreve": "\u0203",
+    "/aivowelsignbengali": "\u09C8",
+    "/aivowelsigndeva": "\u0948",
+    "/aivowelsigngujarati": "\u0AC8",
+    "/akatakana": "\u30A2",
+    "/akatakanahalfwidth": "\uFF71",
+    "/akorean": "\u314F",
+    "/alef": "\u05D0",
+    "/alefarabic": "\u0627",
+    "/alefdageshhebrew": "\uFB30",
+    "/aleffinalarabic": "\uFE8E",
+    "/alefhamzaabovearabic": "\u0623",
+    "/alefhamzaabovefinalarabic": "\uFE84",
+    "/alefhamzabelowarabic": "\u0625",
+    "/alefhamzabelowfinalarabic": "\uFE88",
+    "/alefhebrew": "\u05D0",
+    "/aleflamedhebrew": "\uFB4F",
+    "/alefmaddaabovearabic": "\u0622",
+    "/alefmaddaabovefinalarabic": "\uFE82",
+    "/alefmaksuraarabic": "\u0649",
+    "/alefmaksurafinalarabic": "\uFEF0",
+    "/alefmaksurainitialarabic": "\uFEF3",
+    "/alefmaksuramedialarabic": "\uFEF4",
+    "/alefpatahhebrew": "\uFB2E",
+    "/alefqamatshebrew": "\uFB2F",
+    "/aleph": "\u2135",
+    "/allequal": "\u224C",
+    "/alpha": "\u03B1",
+    "/alphatonos": "\u03AC",
+    "/amacron": "\u0101",
+    "/amonospace": "\uFF41",
+    "/ampersand": "\u0026",
+    "/ampersandmonospace": "\uFF06",
+    "/ampersandsmall": "\uF726",
+    "/amsquare": "\u33C2",
+    "/anbopomofo": "\u3122",
+    "/angbopomofo": "\u3124",
+    "/angkhankhuthai": "\u0E5A",
+    "/angle": "\u2220",
+    "/anglebracketleft": "\u3008",
+    "/anglebracketleftvertical": "\uFE3F",
+    "/anglebracketright": "\u3009",
+    "/anglebracketrightvertical": "\uFE40",
+    "/angleleft": "\u2329",
+    "/angleright": "\u232A",
+    "/angstrom": "\u212B",
+    "/anoteleia": "\u0387",
+    "/anudattadeva": "\u0952",
+    "/anusvarabengali": "\u0982",
+    "/anusvaradeva": "\u0902",
+    "/anusvaragujarati": "\u0A82",
+    "/aogonek": "\u0105",
+    "/apaatosquare": "\u3300",
+    "/aparen": "\u249C",
+    "/apostrophearmenian": "\u055A",
+    "/apostrophemod": "\u02BC",
+    "/apple": "\uF8FF",
+    "/approaches": "\u2250",
+    "/approxequal": "\u2248",
+    "/approxequalorimage": "\u2252",
+    "/approximatelyequal": "\u2245",
+    "/araeaekorean": "\u318E",
+    "/araeakorean": "\u318D",
+    "/arc": "\u2312",
+    "/arighthalfring": "\u1E9A",
+    "/aring": "\u00E5",
+    "/aringacute": "\u01FB",
+    "/aringbelow": "\u1E01",
+    "/arrowboth": "\u2194",
+    "/arrowdashdown": "\u21E3",
+    "/arrowdashleft": "\u21E0",
+    "/arrowdashright": "\u21E2",
+    "/arrowdashup": "\u21E1",
+    "/arrowdblboth": "\u21D4",
+    "/arrowdbldown": "\u21D3",
+    "/arrowdblleft": "\u21D0",
+    "/arrowdblright": "\u21D2",
+    "/arrowdblup": "\u21D1",
+    "/arrowdown": "\u2193",
+    "/arrowdownleft": "\u2199",
+    "/arrowdownright": "\u2198",
+    "/arrowdownwhite": "\u21E9",
+    "/arrowheaddownmod": "\u02C5",
+    "/arrowheadleftmod": "\u02C2",
+    "/arrowheadrightmod": "\u02C3",
+    "/arrowheadupmod": "\u02C4",
+    "/arrowhorizex": "\uF8E7",
+    "/arrowleft": "\u2190",
+    "/arrowleftdbl": "\u21D0",
+    "/arrowleftdblstroke": "\u21CD",
+    "/arrowleftoverright": "\u21C6",
+    "/arrowleftwhite": "\u21E6",
+    "/arrowright": "\u2192",
+    "/arrowrightdblstroke": "\u21CF",
+    "/arrowrightheavy": "\u279E",
+    "/arrowrightoverleft": "\u21C4",
+    "/arrowrightwhite": "\u21E8",
+    "/arrowtableft": "\u21E4",
+    "/arrowtabright": "\u21E5",
+    "/arrowup": "\u2191",
+    "/arrowupdn": "\u2195",
+    "/arrowupdnbse": "\u21A8",
+    "/arrowupdownbase": "\u21A8",
+    "/arrowupleft": "\u2196",
+    "/arrowupleftofdown": "\u21C5",
+    "/arrowupright": "\u2197",
+    "/arrowupwhite": "\u21E7",
+    "/arrowvertex": "\uF8E6",
+    "/asciicircum": "\u005E",
+    "/asciicircummonospace": "\uFF3E",
+    "/asciitilde": "\u007E",
+    "/asciitildemonospace": "\uFF5E",
+    "/ascript": "\u0251",
+    "/ascriptturned": "\u0252",
+    "/asmallhiragana": "\u3041",
+    "/asmallkatakana": "\u30A1",
+    "/asmallkatakanahalfwidth": "\uFF67",
+    "/asterisk": "\u002A",
+    "/asteriskaltonearabic": "\u066D",
+    "/asteriskarabic": "\u066D",
+    "/asteriskmath": "\u2217",
+    "/asteriskmonospace": "\uFF0A",
+    "/asterisksmall": "\uFE61",
+    "/asterism": "\u2042",
+    "/asuperior": "\uF6E9",
+    "/asymptoticallyequal": "\u2243",
+    "/at": "\u0040",
+    "/atilde": "\u00E3",
+    "/atmonospace": "\uFF20",
+    "/atsmall": "\uFE6B",
+    "/aturned": "\u0250",
+    "/aubengali": "\u0994",
+    "/aubopomofo": "\u3120",
+    "/audeva": "\u0914",
+    "/augujarati": "\u0A94",
+    "/augurmukhi": "\u0A14",
+    "/aulengthmarkbengali": "\u09D7",
+    "/aumatragurmukhi": "\u0A4C",
+    "/auvowelsignbengali": "\u09CC",
+    "/auvowelsigndeva": "\u094C",
+    "/auvowelsigngujarati": "\u0ACC",
+    "/avagrahadeva": "\u093D",
+    "/aybarmenian": "\u0561",
+    "/ayin": "\u05E2",
+    "/ayinaltonehebrew": "\uFB20",
+    "/ayinhebrew": "\u05E2",
+    "/b": "\u0062",
+    "/babengali": "\u09AC",
+    "/backslash": "\u005C",
+    "/backslashmonospace": "\uFF3C",
+    "/badeva": "\u092C",
+    "/bagujarati": "\u0AAC",
+    "/bagurmukhi": "\u0A2C",
+    "/bahiragana": "\u3070",
+    "/bahtthai": "\u0E3F",
+    "/bakatakana": "\u30D0",
+    "/bar": "\u007C",
+    "/barmonospace": "\uFF5C",
+    "/bbopomofo": "\u3105",
+    "/bcircle": "\u24D1",
+    "/bdotaccent": "\u1E03",
+    "/bdotbelow": "\u1E05",
+    "/beamedsixteenthnotes": "\u266C",
+    "/because": "\u2235",
+    "/becyrillic": "\u0431",
+    "/beharabic": "\u0628",
+    "/behfinalarabic": "\uFE90",
+    "/behinitialarabic": "\uFE91",
+    "/behiragana": "\u3079",
+    "/behmedialarabic": "\uFE92",
+    "/behmeeminitialarabic": "\uFC9F",
+    "/behmeemisolatedarabic": "\uFC08",
+    "/behnoonfinalarabic": "\uFC6D",
+    "/bekatakana": "\u30D9",
+    "/benarmenian": "\u0562",
+    "/bet": "\u05D1",
+    "/beta": "\u03B2",
+    "/betasymbolgreek": "\u03D0",
+    "/betdagesh": "\uFB31",
+    "/betdageshhebrew": "\uFB31",
+    "/bethebrew": "\u05D1",
+    "/betrafehebrew": "\uFB4C",
+    "/bhabengali": "\u09AD",
+    "/bhadeva": "\u092D",
+    "/bhagujarati": "\u0AAD",
+    "/bhagurmukhi": "\u0A2D",
+    "/bhook": "\u0253",
+    "/bihiragana": "\u3073",
+    "/bikatakana": "\u30D3",
+    "/bilabialclick": "\u0298",
+    "/bindigurmukhi": "\u0A02",
+    "/birusquare": "\u3331",
+    "/blackcircle": "\u25CF",
+    "/blackdiamond": "\u25C6",
+    "/blackdownpointingtriangle": "\u25BC",
+    "/blackleftpointingpointer": "\u25C4",
+    "/blackleftpointingtriangle": "\u25C0",
+    "/blacklenticularbracketleft": "\u3010",
+    "/blacklenticularbracketleftvertical": "\uFE3B",
+    "/blacklenticularbracketright": "\u3011",
+    "/blacklenticularbracketrightvertical": "\uFE3C",
+    "/blacklowerlefttriangle": "\u25E3",
+    "/blacklowerrighttriangle": "\u25E2",
+    "/blackrectangle": "\u25AC",
+    "/blackrightpointingpointer": "\u25BA",
+    "/blackrightpointingtriangle": "\u25B6",
+    "/blacksmallsquare": "\u25AA",
+    "/blacksmilingface": "\u263B",
+    "/blacksquare": "\u25A0",
+    "/blackstar": "\u2605",
+    "/blackupperlefttriangle": "\u25E4",
+    "/blackupperrighttriangle": "\u25E5",
+    "/blackuppointingsmalltriangle": "\u25B4",
+    "/blackuppointingtriangle": "\u25B2",
+    "/blank": "\u2423",
+    "/blinebelow": "\u1E07",
+    "/block": "\u2588",
+    "/bmonospace": "\uFF42",
+    "/bobaimaithai": "\u0E1A",
+    "/bohiragana": "\u307C",
+    "/bokatakana": "\u30DC",
+    "/bparen": "\u249D",
+    "/bqsquare": "\u33C3",
+    "/braceex": "\uF8F4",
+    "/braceleft": "\u007B",
+    "/braceleftbt": "\uF8F3",
+    "/braceleftmid": "\uF8F2",
+    "/braceleftmonospace": "\uFF5B",
+    "/braceleftsmall": "\uFE5B",
+    "/bracelefttp": "\uF8F1",
+    "/braceleftvertical": "\uFE37",
+    "/braceright": "\u007D",
+    "/bracerightbt": "\uF8FE",
+    "/bracerightmid": "\uF8FD",
+    "/bracerightmonospace": "\uFF5D",
+    "/bracerightsmall": "\uFE5C",
+    "/bracerighttp": "\uF8FC",
+    "/bracerightvertical": "\uFE38",
+    "/bracketleft": "\u005B",
+    "/bracketleftbt": "\uF8F0",
+    "/bracketleftex": "\uF8EF",
+    "/bracketleftmonospace": "\uFF3B",
+    "/bracketlefttp": "\uF8EE",
+    "/bracketright": "\u005D",
+    "/bracketrightbt": "\uF8FB",
+    "/bracketrightex": "\uF8FA",
+    "/bracketrightmonospace": "\uFF3D",
+    "/bracketrighttp": "\uF8F9",
+    "/breve": "\u02D8",
+    "/brevebelowcmb": "\u032E",
+    "/brevecmb": "\u0306",
+    "/breveinvertedbelowcmb": "\u032F",
+    "/breveinvertedcmb": "\u0311",
+    "/breveinverteddoublecmb": "\u0361",
+    "/bridgebelowcmb": "\u032A",
+    "/bridgeinvertedbelowcmb": "\u033A",
+    "/brokenbar": "\u00A6",
+    "/bstroke": "\u0180",
+    "/bsuperior": "\uF6EA",
+    "/btopbar": "\u0183",
+    "/buhiragana": "\u3076",
+    "/bukatakana": "\u30D6",
+    "/bullet": "\u2022",
+    "/bulletinverse": "\u25D8",
+    "/bulletoperator": "\u2219",
+    "/bullseye": "\u25CE",
+    "/c": "\u0063",
+    "/caarmenian": "\u056E",
+    "/cabengali": "\u099A",
+    "/cacute": "\u0107",
+    "/cadeva": "\u091A",
+    "/cagujarati": "\u0A9A",
+    "/cagurmukhi": "\u0A1A",
+    "/calsquare": "\u3388",
+    "/candrabindubengali": "\u0981",
+    "/candrabinducmb": "\u0310",
+    "/candrabindudeva": "\u0901",
+    "/candrabindugujarati": "\u0A81",
+    "/capslock": "\u21EA",
+    "/careof": "\u2105",
+    "/caron": "\u02C7",
+    "/caronbelowcmb": "\u032C",
+    "/caroncmb": "\u030C",
+    "/carriagereturn": "\u21B5",
+    "/cbopomofo": "\u3118",
+    "/ccaron": "\u010D",
+    "/ccedilla": "\u00E7",
+    "/ccedillaacute": "\u1E09",
+    "/ccircle": "\u24D2",
+    "/ccircumflex": "\u0109",
+    "/ccurl": "\u0255",
+    "/cdot": "\u010B",
+    "/cdotaccent": "\u010B",
+    "/cdsquare": "\u33C5",
+    "/cedilla": "\u00B8",
+    "/cedillacmb": "\u0327",
+    "/cent": "\u00A2",
+    "/centigrade": "\u2103",
+    "/centinferior": "\uF6DF",
+    "/centmonospace": "\uFFE0",
+    "/centoldstyle": "\uF7A2",
+    "/centsuperior": "\uF6E0",
+    "/chaarmenian": "\u0579",
+    "/chabengali": "\u099B",
+    "/chadeva": "\u091B",
+    "/chagujarati": "\u0A9B",
+    "/chagurmukhi": "\u0A1B",
+    "/chbopomofo": "\u3114",
+    "/cheabkhasiancyrillic": "\u04BD",
+    "/checkmark": "\u2713",
+    "/checyrillic": "\u0447",
+    "/chedescenderabkhasiancyrillic": "\u04BF",
+    "/chedescendercyrillic": "\u04B7",
+    "/chedieresiscyrillic": "\u04F5",
+    "/cheharmenian": "\u0573",
+    "/chekhakassiancyrillic": "\u04CC",
+    "/cheverticalstrokecyrillic": "\u04B9",
+    "/chi": "\u03C7",
+    "/chieuchacirclekorean": "\u3277",
+    "/chieuchaparenkorean": "\u3217",
+    "/chieuchcirclekorean": "\u3269",
+    "/chieuchkorean": "\u314A",
+    "/chieuchparenkorean": "\u3209",
+    "/chochangthai": "\u0E0A",
+    "/chochanthai": "\u0E08",
+    "/chochingthai": "\u0E09",
+    "/chochoethai": "\u0E0C",
+    "/chook": "\u0188",
+    "/cieucacirclekorean": "\u3276",
+    "/cieucaparenkorean": "\u3216",
+    "/cieuccirclekorean": "\u3268",
+    "/cieuckorean": "\u3148",
+    "/cieucparenkorean": "\u3208",
+    "/cieucuparenkorean": "\u321C",
+    "/circle": "\u25CB",
+    "/circlemultiply": "\u2297",
+    "/circleot": "\u2299",
+    "/circleplus": "\u2295",
+    "/circlepostalmark": "\u3036",
+    "/circlewithlefthalfblack": "\u25D0",
+    "/circlewithrighthalfblack": "\u25D1",
+    "/circumflex": "\u02C6",
+    "/circumflexbelowcmb": "\u032D",
+    "/circumflexcmb": "\u0302",
+    "/clear": "\u2327",
+    "/clickalveolar": "\u01C2",
+    "/clickdental": "\u01C0",
+    "/clicklateral": "\u01C1",
+    "/clickretroflex": "\u01C3",
+    "/club": "\u2663",
+    "/clubsuitblack": "\u2663",
+    "/clubsuitwhite": "\u2667",
+    "/cmcubedsquare": "\u33A4",
+    "/cmonospace": "\uFF43",
+    "/cmsquaredsquare": "\u33A0",
+    "/coarmenian": "\u0581",
+    "/colon": "\u003A",
+    "/colonmonetary": "\u20A1",
+    "/colonmonospace": "\uFF1A",
+    "/colonsign": "\u20A1",
+    "/colonsmall": "\uFE55",
+    "/colontriangularhalfmod": "\u02D1",
+    "/colontriangularmod": "\u02D0",
+    "/comma": "\u002C",
+    "/commaabovecmb": "\u0313",
+    "/commaaboverightcmb": "\u0315",
+    "/commaaccent": "\uF6C3",
+    "/commaarabic": "\u060C",
+    "/commaarmenian": "\u055D",
+    "/commainferior": "\uF6E1",
+    "/commamonospace": "\uFF0C",
+    "/commareversedabovecmb": "\u0314",
+    "/commareversedmod": "\u02BD",
+    "/commasmall": "\uFE50",
+    "/commasuperior": "\uF6E2",
+    "/commaturnedabovecmb": "\u0312",
+    "/commaturnedmod": "\u02BB",
+    "/compass": "\u263C",
+    "/congruent": "\u2245",
+    "/contourintegral": "\u222E",
+    "/control": "\u2303",
+    "/controlACK": "\u0006",
+    "/controlBEL": "\u0007",
+    "/controlBS": "\u0008",
+    "/controlCAN": "\u0018",
+    "/controlCR": "\u000D",
+    "/controlDC1": "\u0011",
+    "/controlDC2": "\u0012",
+    "/controlDC3": "\u0013",
+    "/controlDC4": "\u0014",
+    "/controlDEL": "\u007F",
+    "/controlDLE": "\u0010",
+    "/controlEM": "\u0019",
+    "/controlENQ": "\u0005",
+    "/controlEOT": "\u0004",
+    "/controlESC": "\u001B",
+    "/controlETB": "\u0017",
+    "/controlETX": "\u0003",
+    "/controlFF": "\u000C",
+    "/controlFS": "\u001C",
+    "/controlGS": "\u001D",
+    "/controlHT": "\u0009",
+    "/controlLF": "\u000A",
+    "/controlNAK": "\u0015",
+    "/controlRS": "\u001E",
+    "/controlSI": "\u000F",
+    "/controlSO": "\u000E",
+    "/controlSOT": "\u0002",
+    "/controlSTX": "\u0001",
+    "/controlSUB": "\u001A",
+    "/controlSYN": "\u0016",
+    "/controlUS": "\u001F",
+    "/controlVT": "\u000B",
+    "/copyright": "\u00A9",
+    "/copyrightsans": "\uF8E9",
+    "/copyrightserif": "\uF6D9",
+    "/cornerbracketleft": "\u300C",
+    "/cornerbracketlefthalfwidth": "\uFF62",
+    "/cornerbracketleftvertical": "\uFE41",
+    "/cornerbracketright": "\u300D",
+    "/cornerbracketrighthalfwidth": "\uFF63",
+    "/cornerbracketrightvertical": "\uFE42",
+    "/corporationsquare": "\u337F",
+    "/cosquare": "\u33C7",
+    "/coverkgsquare": "\u33C6",
+    "/cparen": "\u249E",
+    "/cruzeiro": "\u20A2",
+    "/cstretched": "\u0297",
+    "/curlyand": "\u22CF",
+    "/curlyor": "\u22CE",
+    "/currency": "\u00A4",
+    "/cyrBreve": "\uF6D1",
+    "/cyrFlex": "\uF6D2",
+    "/cyrbreve": "\uF6D4",
+    "/cyrflex": "\uF6D5",
+    "/d": "\u0064",
+    "/daarmenian": "\u0564",
+    "/dabengali": "\u09A6",
+    "/dadarabic": "\u0636",
+    "/dadeva": "\u0926",
+    "/dadfinalarabic": "\uFEBE",
+    "/dadinitialarabic": "\uFEBF",
+    "/dadmedialarabic": "\uFEC0",
+    "/dagesh": "\u05BC",
+    "/dageshhebrew": "\u05BC",
+    "/dagger": "\u2020",
+    "/daggerdbl": "\u2021",
+    "/dagujarati": "\u0AA6",
+    "/dagurmukhi": "\u0A26",
+    "/dahiragana": "\u3060",
+    "/dakatakana": "\u30C0",
+    "/dalarabic": "\u062F",
+    "/dalet": "\u05D3",
+    "/daletdagesh": "\uFB33",
+    "/daletdageshhebrew": "\uFB33",
+    "/dalethatafpatah": "\u05D3\u05B2",
+    "/dalethatafpatahhebrew": "\u05D3\u05B2",
+    "/dalethatafsegol": "\u05D3\u05B1",
+    "/dalethatafsegolhebrew": "\u05D3\u05B1",
+    "/dalethebrew": "\u05D3",
+    "/dalethiriq": "\u05D3\u05B4",
+    "/dalethiriqhebrew": "\u05D3\u05B4",
+    "/daletholam": "\u05D3\u05B9",
+    "/daletholamhebrew": "\u05D3\u05B9",
+    "/daletpatah": "\u05D3\u05B7",
+    "/daletpatahhebrew": "\u05D3\u05B7",
+    "/daletqamats": "\u05D3\u05B8",
+    "/daletqamatshebrew": "\u05D3\u05B8",
+    "/daletqubuts": "\u05D3\u05BB",
+    "/daletqubutshebrew": "\u05D3\u05BB",
+    "/daletsegol": "\u05D3\u05B6",
+    "/daletsegolhebrew": "\u05D3\u05B6",
+    "/daletsheva": "\u05D3\u05B0",
+    "/daletshevahebrew": "\u05D3\u05B0",
+    "/dalettsere": "\u05D3\u05B5",
+    "/dalettserehebrew": "\u05D3\u05B5",
+    "/dalfinalarabic": "\uFEAA",
+    "/dammaarabic": "\u064F",
+    "/dammalowarabic": "\u064F",
+    "/dammatanaltonearabic": "\u064C",
+    "/dammatanarabic": "\u064C",
+    "/danda": "\u0964",
+    "/dargahebrew": "\u05A7",
+    "/dargalefthebrew": "\u05A7",
+    "/dasiapneumatacyrilliccmb": "\u0485",
+    "/dblGrave": "\uF6D3",
+    "/dblanglebracketleft": "\u300A",
+    "/dblanglebracketleftvertical": "\uFE3D",
+    "/dblanglebracketright": "\u300B",
+    "/dblanglebracketrightvertical": "\uFE3E",
+    "/dblarchinvertedbelowcmb": "\u032B",
+    "/dblarrowleft": "\u21D4",
+    "/dblarrowright": "\u21D2",
+    "/dbldanda": "\u0965",
+    "/dblgrave": "\uF6D6",
+    "/dblgravecmb": "\u030F",
+    "/dblintegral": "\u222C",
+    "/dbllowline": "\u2017",
+    "/dbllowlinecmb": "\u0333",
+    "/dbloverlinecmb": "\u033F",
+    "/dblprimemod": "\u02BA",
+    "/dblverticalbar": "\u2016",
+    "/dblverticallineabovecmb": "\u030E",
+    "/dbopomofo": "\u3109",
+    "/dbsquare": "\u33C8",
+    "/dcaron": "\u010F",
+    "/dcedilla": "\u1E11",
+    "/dcircle": "\u24D3",
+    "/dcircumflexbelow": "\u1E13",
+    "/dcroat": "\u0111",
+    "/ddabengali": "\u09A1",
+    "/ddadeva": "\u0921",
+    "/ddagujarati": "\u0AA1",
+    "/ddagurmukhi": "\u0A21",
+    "/ddalarabic": "\u0688",
+    "/ddalfinalarabic": "\uFB89",
+    "/dddhadeva": "\u095C",
+    "/ddhabengali": "\u09A2",
+    "/ddhadeva": "\u0922",
+    "/ddhagujarati": "\u0AA2",
+    "/ddhagurmukhi": "\u0A22",
+    "/ddotaccent": "\u1E0B",
+    "/ddotbelow": "\u1E0D",
+    "/decimalseparatorarabic": "\u066B",
+    "/decimalseparatorpersian": "\u066B",
+    "/decyrillic": "\u0434",
+    "/degree": "\u00B0",
+    "/dehihebrew": "\u05AD",
+    "/dehiragana": "\u3067",
+    "/deicoptic": "\u03EF",
+    "/dekatakana": "\u30C7",
+    "/deleteleft": "\u232B",
+    "/deleteright": "\u2326",
+    "/delta": "\u03B4",
+    "/deltaturned": "\u018D",
+    "/denominatorminusonenumeratorbengali": "\u09F8",
+    "/dezh": "\u02A4",
+    "/dhabengali": "\u09A7",
+    "/dhadeva": "\u0927",
+    "/dhagujarati": "\u0AA7",
+    "/dhagurmukhi": "\u0A27",
+    "/dhook": "\u0257",
+    "/dialytikatonos": "\u0385",
+    "/dialytikatonoscmb": "\u0344",
+    "/diamond": "\u2666",
+    "/diamondsuitwhite": "\u2662",
+    "/dieresis": "\u00A8",
+    "/dieresisacute": "\uF6D7",
+    "/dieresisbelowcmb": "\u0324",
+    "/dieresiscmb": "\u0308",
+    "/dieresisgrave": "\uF6D8",
+    "/dieresistonos": "\u0385",
+    "/dihiragana": "\u3062",
+    "/dikatakana": "\u30C2",
+    "/dittomark": "\u3003",
+    "/divide": "\u00F7",
+    "/divides": "\u2223",
+    "/divisionslash": "\u2215",
+    "/djecyrillic": "\u0452",
+    "/dkshade": "\u2593",
+    "/dlinebelow": "\u1E0F",
+    "/dlsquare": "\u3397",
+    "/dmacron": "\u0111",
+    "/dmonospace": "\uFF44",
+    "/dnblock": "\u2584",
+    "/dochadathai": "\u0E0E",
+    "/dodekthai": "\u0E14",
+    "/dohiragana": "\u3069",
+    "/dokatakana": "\u30C9",
+    "/dollar": "\u0024",
+    "/dollarinferior": "\uF6E3",
+    "/dollarmonospace": "\uFF04",
+    "/dollaroldstyle": "\uF724",
+    "/dollarsmall": "\uFE69",
+    "/dollarsuperior": "\uF6E4",
+    "/dong": "\u20AB",
+    "/dorusquare": "\u3326",
+    "/dotaccent": "\u02D9",
+    "/dotaccentcmb": "\u0307",
+    "/dotbelowcmb": "\u0323",
+    "/dotbelowcomb": "\u0323",
+    "/dotkatakana": "\u30FB",
+    "/dotlessi": "\u0131",
+    "/dotlessj": "\uF6BE",
+    "/dotlessjstrokehook": "\u0284",
+    "/dotmath": "\u22C5",
+    "/dottedcircle": "\u25CC",
+    "/doubleyodpatah": "\uFB1F",
+    "/doubleyodpatahhebrew": "\uFB1F",
+    "/downtackbelowcmb": "\u031E",
+    "/downtackmod": "\u02D5",
+    "/dparen": "\u249F",
+    "/dsuperior": "\uF6EB",
+    "/dtail": "\u0256",
+    "/dtopbar": "\u018C",
+    "/duhiragana": "\u3065",
+    "/dukatakana": "\u30C5",
+    "/dz": "\u01F3",
+    "/dzaltone": "\u02A3",
+    "/dzcaron": "\u01C6",
+    "/dzcurl": "\u02A5",
+    "/dzeabkhasiancyrillic": "\u04E1",
+    "/dzecyrillic": "\u0455",
+    "/dzhecyrillic": "\u045F",
+    "/e": "\u0065",
+    "/eacute": "\u00E9",
+    "/earth": "\u2641",
+    "/ebengali": "\u098F",
+    "/ebopomofo": "\u311C",
+    "/ebreve": "\u0115",
+    "/ecandradeva": "\u090D",
+    "/ecandragujarati": "\u0A8D",
+    "/ecandravowelsigndeva": "\u0945",
+    "/ecandravowelsigngujarati": "\u0AC5",
+    "/ecaron": "\u011B",
+    "/ecedillabreve": "\u1E1D",
+    "/echarmenian": "\u0565",
+    "/echyiwnarmenian": "\u0587",
+    "/ecircle": "\u24D4",
+    "/ecircumflex": "\u00EA",
+    "/ecircumflexacute": "\u1EBF",
+    "/ecircumflexbelow": "\u1E19",
+    "/ecircumflexdotbelow": "\u1EC7",
+    "/ecircumflexgrave": "\u1EC1",
+    "/ecircumflexhookabove": "\u1EC3",
+    "/ecircumflextilde": "\u1EC5",
+    "/ecyrillic": "\u0454",
+    "/edblgrave": "\u0205",
+    "/edeva": "\u090F",
+    "/edieresis": "\u00EB",
+    "/edot": "\u0117",
+    "/edotaccent": "\u0117",
+    "/edotbelow": "\u1EB9",
+    "/eegurmukhi": "\u0A0F",
+    "/eematragurmukhi": "\u0A47",
+    "/efcyrillic": "\u0444",
+    "/egrave": "\u00E8",
+    "/egujarati": "\u0A8F",
+    "/eharmenian": "\u0567",
+    "/ehbopomofo": "\u311D",
+    "/ehiragana": "\u3048",
+    "/ehookabove": "\u1EBB",
+    "/eibopomofo": "\u311F",
+    "/eight": "\u0038",
+    "/eightarabic": "\u0668",
+    "/eightbengali": "\u09EE",
+    "/eightcircle": "\u2467",
+    "/eightcircleinversesansserif": "\u2791",
+    "/eightdeva": "\u096E",
+    "/eighteencircle": "\u2471",
+    "/eighteenparen": "\u2485",
+    "/eighteenperiod": "\u2499",
+    "/eightgujarati": "\u0AEE",
+    "/eightgurmukhi": "\u0A6E",
+    "/eighthackarabic": "\u0668",
+    "/eighthangzhou": "\u3028",
+    "/eighthnotebeamed": "\u266B",
+    "/eightideographicparen": "\u3227",
+    "/eightinferior": "\u2088",
+    "/eightmonospace": "\uFF18",
+    "/eightoldstyle": "\uF738",
+    "/eightparen": "\u247B",
+    "/eightperiod": "\u248F",
+    "/eightpersian": "\u06F8",
+    "/eightroman": "\u2177",
+    "/eightsuperior": "\u2078",
+    "/eightthai": "\u0E58",
+    "/einvertedbreve": "\u0207",
+    "/eiotifiedcyrillic": "\u0465",
+    "/ekatakana": "\u30A8",
+    "/ekatakanahalfwidth": "\uFF74",
+    "/ekonkargurmukhi": "\u0A74",
+    "/ekorean": "\u3154",
+    "/elcyrillic": "\u043B",
+    "/element": "\u2208",
+    "/elevencircle": "\u246A",
+    "/elevenparen": "\u247E",
+    "/elevenperiod": "\u2492",
+    "/elevenroman": "\u217A",
+    "/ellipsis": "\u2026",
+    "/ellipsisvertical": "\u22EE",
+    "/emacron": "\u0113",
+    "/emacronacute": "\u1E17",
+    "/emacrongrave": "\u1E15",
+    "/emcyrillic": "\u043C",
+    "/emdash": "\u2014",
+    "/emdashvertical": "\uFE31",
+    "/emonospace": "\uFF45",
+    "/emphasismarkarmenian": "\u055B",
+    "/emptyset": "\u2205",
+    "/enbopomofo": "\u3123",
+    "/encyrillic": "\u043D",
+    "/endash": "\u2013",
+    "/endashvertical": "\uFE32",
+    "/endescendercyrillic": "\u04A3",
+    "/eng": "\u014B",
+    "/engbopomofo": "\u3125",
+    "/enghecyrillic": "\u04A5",
+    "/enhookcyrillic": "\u04C8",
+    "/enspace": "\u2002",
+    "/eogonek": "\u0119",
+    "/eokorean": "\u3153",
+    "/eopen": "\u025B",
+    "/eopenclosed": "\u029A",
+    "/eopenreversed": "\u025C",
+    "/eopenreversedclosed": "\u025E",
+    "/eopenreversedhook": "\u025D",
+    "/eparen": "\u24A0",
+    "/epsilon": "\u03B5",
+    "/epsilontonos": "\u03AD",
+    "/equal": "\u003D",
+    "/equalmonospace": "\uFF1D",
+    "/equalsmall": "\uFE66",
+    "/equalsuperior": "\u207C",
+    "/equivalence": "\u2261",
+    "/erbopomofo": "\u3126",
+    "/ercyrillic": "\u0440",
+    "/ereversed": "\u0258",
+    "/ereversedcyrillic": "\u044D",
+    "/escyrillic": "\u0441",
+    "/esdescendercyrillic": "\u04AB",
+    "/esh": "\u0283",
+    "/eshcurl": "\u0286",
+    "/eshortdeva": "\u090E",
+    "/eshortvowelsigndeva": "\u0946",
+    "/eshreversedloop": "\u01AA",
+    "/eshsquatreversed": "\u0285",
+    "/esmallhiragana": "\u3047",
+    "/esmallkatakana": "\u30A7",
+    "/esmallkatakanahalfwidth": "\uFF6A",
+    "/estimated": "\u212E",
+    "/esuperior": "\uF6EC",
+    "/eta": "\u03B7",
+    "/etarmenian": "\u0568",
+    "/etatonos": "\u03AE",
+    "/eth": "\u00F0",
+    "/etilde": "\u1EBD",
+    "/etildebelow": "\u1E1B",
+    "/etnahtafoukhhebrew": "\u0591",
+    "/etnahtafoukhlefthebrew": "\u0591",
+    "/etnahtahebrew": "\u0591",
+    "/etnahtalefthebrew": "\u0591",
+    "/eturned": "\u01DD",
+    "/eukorean": "\u3161",
+    "/euro": "\u20AC",
+    "/evowelsignbengali": "\u09C7",
+    "/evowelsigndeva": "\u0947",
+    "/evowelsigngujarati": "\u0AC7",
+    "/exclam": "\u0021",
+    "/exclamarmenian": "\u055C",
+    "/exclamdbl": "\u203C",
+    "/exclamdown": "\u00A1",
+    "/exclamdownsmall": "\uF7A1",
+    "/exclammonospace": "\uFF01",
+    "/exclamsmall": "\uF721",
+    "/existential": "\u2203",
+    "/ezh": "\u0292",
+    "/ezhcaron": "\u01EF",
+    "/ezhcurl": "\u0293",
+    "/ezhreversed": "\u01B9",
+    "/ezhtail": "\u01BA",
+    "/f": "\u0066",
+    "/fadeva": "\u095E",
+    "/fagurmukhi": "\u0A5E",
+    "/fahrenheit": "\u2109",
+    "/fathaarabic": "\u064E",
+    "/fathalowarabic": "\u064E",
+    "/fathatanarabic": "\u064B",
+    "/fbopomofo": "\u3108",
+    "/fcircle": "\u24D5",
+    "/fdotaccent": "\u1E1F",
+    "/feharabic": "\u0641",
+    "/feharmenian": "\u0586",
+    "/fehfinalarabic": "\uFED2",
+    "/fehinitialarabic": "\uFED3",
+    "/fehmedialarabic": "\uFED4",
+    "/feicoptic": "\u03E5",
+    "/female": "\u2640",
+    "/ff": "\uFB00",
+    "/ffi": "\uFB03",
+    "/ffl": "\uFB04",
+    "/fi": "\uFB01",
+    "/fifteencircle": "\u246E",
+    "/fifteenparen": "\u2482",
+    "/fifteenperiod": "\u2496",
+    "/figuredash": "\u2012",
+    "/filledbox": "\u25A0",
+    "/filledrect": "\u25AC",
+    "/finalkaf": "\u05DA",
+    "/finalkafdagesh": "\uFB3A",
+    "/finalkafdageshhebrew": "\uFB3A",
+    "/finalkafhebrew": "\u05DA",
+    "/finalkafqamats": "\u05DA\u05B8",
+    "/finalkafqamatshebrew": "\u05DA\u05B8",
+    "/finalkafsheva": "\u05DA\u05B0",
+    "/finalkafshevahebrew": "\u05DA\u05B0",
+    "/finalmem": "\u05DD",
+    "/finalmemhebrew": "\u05DD",
+    "/finalnun": "\u05DF",
+    "/finalnunhebrew": "\u05DF",
+    "/finalpe": "\u05E3",
+    "/finalpehebrew": "\u05E3",
+    "/finaltsadi": "\u05E5",
+    "/finaltsadihebrew": "\u05E5",
+    "/firsttonechinese": "\u02C9",
+    "/fisheye": "\u25C9",
+    "/fitacyrillic": "\u0473",
+    "/five": "\u0035",
+    "/fivearabic": "\u0665",
+    "/fivebengali": "\u09EB",
+    "/fivecircle": "\u2464",
+    "/fivecircleinversesansserif": "\u278E",
+    "/fivedeva": "\u096B",
+    "/fiveeighths": "\u215D",
+    "/fivegujarati": "\u0AEB",
+    "/fivegurmukhi": "\u0A6B",
+    "/fivehackarabic": "\u0665",
+    "/fivehangzhou": "\u3025",
+    "/fiveideographicparen": "\u3224",
+    "/fiveinferior": "\u2085",
+    "/fivemonospace": "\uFF15",
+    "/fiveoldstyle": "\uF735",
+    "/fiveparen": "\u2478",
+    "/fiveperiod": "\u248C",
+    "/fivepersian": "\u06F5",
+    "/fiveroman": "\u2174",
+    "/fivesuperior": "\u2075",
+    "/fivethai": "\u0E55",
+    "/fl": "\uFB02",
+    "/florin": "\u0192",
+    "/fmonospace": "\uFF46",
+    "/fmsquare": "\u3399",
+    "/fofanthai": "\u0E1F",
+    "/fofathai": "\u0E1D",
+    "/fongmanthai": "\u0E4F",
+    "/forall": "\u2200",
+    "/four": "\u0034",
+    "/fourarabic": "\u0664",
+    "/fourbengali": "\u09EA",
+    "/fourcircle": "\u2463",
+    "/fourcircleinversesansserif": "\u278D",
+    "/fourdeva": "\u096A",
+    "/fourgujarati": "\u0AEA",
+    "/fourgurmukhi": "\u0A6A",
+    "/fourhackarabic": "\u0664",
+    "/fourhangzhou": "\u3024",
+    "/fourideographicparen": "\u3223",
+    "/fourinferior": "\u2084",
+    "/fourmonospace": "\uFF14",
+    "/fournumeratorbengali": "\u09F7",
+    "/fouroldstyle": "\uF734",
+    "/fourparen": "\u2477",
+    "/fourperiod": "\u248B",
+    "/fourpersian": "\u06F4",
+    "/fourroman": "\u2173",
+    "/foursuperior": "\u2074",
+    "/fourteencircle": "\u246D",
+    "/fourteenparen": "\u2481",
+    "/fourteenperiod": "\u2495",
+    "/fourthai": "\u0E54",
+    "/fourthtonechinese": "\u02CB",
+    "/fparen": "\u24A1",
+    "/fraction": "\u2044",
+    "/franc": "\u20A3",
+    "/g": "\u0067",
+    "/gabengali": "\u0997",
+    "/gacute": "\u01F5",
+    "/gadeva": "\u0917",
+    "/gafarabic": "\u06AF",
+    "/gaffinalarabic": "\uFB93",
+    "/gafinitialarabic": "\uFB94",
+    "/gafmedialarabic": "\uFB95",
+    "/gagujarati": "\u0A97",
+    "/gagurmukhi": "\u0A17",
+    "/gahiragana": "\u304C",
+    "/gakatakana": "\u30AC",
+    "/gamma": "\u03B3",
+    "/gammalatinsmall": "\u0263",
+    "/gammasuperior": "\u02E0",
+    "/gangiacoptic": "\u03EB",
+    "/gbopomofo": "\u310D",
+    "/gbreve": "\u011F",
+    "/gcaron": "\u01E7",
+    "/gcedilla": "\u0123",
+    "/gcircle": "\u24D6",
+    "/gcircumflex": "\u011D",
+    "/gcommaaccent": "\u0123",
+    "/gdot": "\u0121",
+    "/gdotaccent": "\u0121",
+    "/gecyrillic": "\u0433",
+    "/gehiragana": "\u3052",
+    "/gekatakana": "\u30B2",
+    "/geometricallyequal": "\u2251",
+    "/gereshaccenthebrew": "\u059C",
+    "/gereshhebrew": "\u05F3",
+    "/gereshmuqdamhebrew": "\u059D",
+    "/germandbls": "\u00DF",
+    "/gershayimaccenthebrew": "\u059E",
+    "/gershayimhebrew": "\u05F4",
+    "/getamark": "\u3013",
+    "/ghabengali": "\u0998",
+    "/ghadarmenian": "\u0572",
+    "/ghadeva": "\u0918",
+    "/ghagujarati": "\u0A98",
+    "/ghagurmukhi": "\u0A18",
+    "/ghainarabic": "\u063A",
+    "/ghainfinalarabic": "\uFECE",
+    "/ghaininitialarabic": "\uFECF",
+    "/ghainmedialarabic": "\uFED0",
+    "/ghemiddlehookcyrillic": "\u0495",
+    "/ghestrokecyrillic": "\u0493",
+    "/gheupturncyrillic": "\u0491",
+    "/ghhadeva": "\u095A",
+    "/ghhagurmukhi": "\u0A5A",
+    "/ghook": "\u0260",
+    "/ghzsquare": "\u3393",
+    "/gihiragana": "\u304E",
+    "/gikatakana": "\u30AE",
+    "/gimarmenian": "\u0563",
+    "/gimel": "\u05D2",
+    "/gimeldagesh": "\uFB32",
+    "/gimeldageshhebrew": "\uFB32",
+    "/gimelhebrew": "\u05D2",
+    "/gjecyrillic": "\u0453",
+    "/glottalinvertedstroke": "\u01BE",
+    "/glottalstop": "\u0294",
+    "/glottalstopinverted": "\u0296",
+    "/glottalstopmod": "\u02C0",
+    "/glottalstopreversed": "\u0295",
+    "/glottalstopreversedmod": "\u02C1",
+    "/glottalstopreversedsuperior": "\u02E4",
+    "/glottalstopstroke": "\u02A1",
+    "/glottalstopstrokereversed": "\u02A2",
+    "/gmacron": "\u1E21",
+    "/gmonospace": "\uFF47",
+    "/gohiragana": "\u3054",
+    "/gokatakana": "\u30B4",
+    "/gparen": "\u24A2",
+    "/gpasquare": "\u33AC",
+    "/gradient": "\u2207",
+    "/grave": "\u0060",
+    "/gravebelowcmb": "\u0316",
+    "/gravecmb": "\u0300",
+    "/gravecomb": "\u0300",
+    "/gravedeva": "\u0953",
+    "/gravelowmod": "\u02CE",
+    "/gravemonospace": "\uFF40",
+    "/gravetonecmb": "\u0340",
+    "/greater": "\u003E",
+    "/greaterequal": "\u2265",
+    "/greaterequalorless": "\u22DB",
+    "/greatermonospace": "\uFF1E",
+    "/greaterorequivalent": "\u2273",
+    "/greaterorless": "\u2277",
+    "/greateroverequal": "\u2267",
+    "/greatersmall": "\uFE65",
+    "/gscript": "\u0261",
+    "/gstroke": "\u01E5",
+    "/guhiragana": "\u3050",
+    "/guillemotleft": "\u00AB",
+    "/guillemotright": "\u00BB",
+    "/guilsinglleft": "\u2039",
+    "/guilsinglright": "\u203A",
+    "/gukatakana": "\u30B0",
+    "/guramusquare": "\u3318",
+    "/gysquare": "\u33C9",
+    "/h": "\u0068",
+    "/haabkhasiancyrillic": "\u04A9",
+    "/haaltonearabic": "\u06C1",
+    "/habengali": "\u09B9",
+    "/hadescendercyrillic": "\u04B3",
+    "/hadeva": "\u0939",
+    "/hagujarati": "\u0AB9",
+    "/hagurmukhi": "\u0A39",
+    "/haharabic": "\u062D",
+    "/hahfinalarabic": "\uFEA2",
+    "/hahinitialarabic": "\uFEA3",
+    "/hahiragana": "\u306F",
+    "/hahmedialarabic": "\uFEA4",
+    "/haitusquare": "\u332A",
+    "/hakatakana": "\u30CF",
+    "/hakatakanahalfwidth": "\uFF8A",
+    "/halantgurmukhi": "\u0A4D",
+    "/hamzaarabic": "\u0621",
+    "/hamzadammaarabic": "\u0621\u064F",
+    "/hamzadammatanarabic": "\u0621\u064C",
+    "/hamzafathaarabic": "\u0621\u064E",
+    "/hamzafathatanarabic": "\u0621\u064B",
+    "/hamzalowarabic": "\u0621",
+    "/hamzalowkasraarabic": "\u0621\u0650",
+    "/hamzalowkasratanarabic": "\u0621\u064D",
+    "/hamzasukunarabic": "\u0621\u0652",
+    "/hangulfiller": "\u3164",
+    "/hardsigncyrillic": "\u044A",
+    "/harpoonleftbarbup": "\u21BC",
+    "/harpoonrightbarbup": "\u21C0",
+    "/hasquare": "\u33CA",
+    "/hatafpatah": "\u05B2",
+    "/hatafpatah16": "\u05B2",
+    "/hatafpatah23": "\u05B2",
+    "/hatafpatah2f": "\u05B2",
+    "/hatafpatahhebrew": "\u05B2",
+    "/hatafpatahnarrowhebrew": "\u05B2",
+    "/hatafpatahquarterhebrew": "\u05B2",
+    "/hatafpatahwidehebrew": "\u05B2",
+    "/hatafqamats": "\u05B3",
+    "/hatafqamats1b": "\u05B3",
+    "/hatafqamats28": "\u05B3",
+    "/hatafqamats34": "\u05B3",
+    "/hatafqamatshebrew": "\u05B3",
+    "/hatafqamatsnarrowhebrew": "\u05B3",
+    "/hatafqamatsquarterhebrew": "\u05B3",
+    "/hatafqamatswidehebrew": "\u05B3",
+    "/hatafsegol": "\u05B1",
+    "/hatafsegol17": "\u05B1",
+    "/hatafsegol24": "\u05B1",
+    "/hatafsegol30": "\u05B1",
+    "/hatafsegolhebrew": "\u05B1",
+    "/hatafsegolnarrowhebrew": "\u05B1",
+    "/hatafsegolquarterhebrew": "\u05B1",
+    "/hatafsegolwidehebrew": "\u05B1",
+    "/hbar": "\u0127",
+    "/hbopomofo": "\u310F",
+    "/hbrevebelow": "\u1E2B",
+    "/hcedilla": "\u1E29",
+    "/hcircle": "\u24D7",
+    "/hcircumflex": "\u0125",
+    "/hdieresis": "\u1E27",
+    "/hdotaccent": "\u1E23",
+    "/hdotbelow": "\u1E25",
+    "/he": "\u05D4",
+    "/heart": "\u2665",
+    "/heartsuitblack": "\u2665",
+    "/heartsuitwhite": "\u2661",
+    "/hedagesh": "\uFB34",
+    "/hedageshhebrew": "\uFB34",
+    "/hehaltonearabic": "\u06C1",
+    "/heharabic": "\u0647",
+    "/hehebrew": "\u05D4",
+    "/hehfinalaltonearabic": "\uFBA7",
+    "/hehfinalalttwoarabic": "\uFEEA",
+    "/hehfinalarabic": "\uFEEA",
+    "/hehhamzaabovefinalarabic": "\uFBA5",
+    "/hehhamzaaboveisolatedarabic": "\uFBA4",
+    "/hehinitialaltonearabic": "\uFBA8",
+    "/hehinitialarabic": "\uFEEB",
+    "/hehiragana": "\u3078",
+    "/hehmedialaltonearabic": "\uFBA9",
+    "/hehmedialarabic": "\uFEEC",
+    "/heiseierasquare": "\u337B",
+    "/hekatakana": "\u30D8",
+    "/hekatakanahalfwidth": "\uFF8D",
+    "/hekutaarusquare": "\u3336",
+    "/henghook": "\u0267",
+    "/herutusquare": "\u3339",
+    "/het": "\u05D7",
+    "/hethebrew": "\u05D7",
+    "/hhook": "\u0266",
+    "/hhooksuperior": "\u02B1",
+    "/hieuhacirclekorean": "\u327B",
+    "/hieuhaparenkorean": "\u321B",
+    "/hieuhcirclekorean": "\u326D",
+    "/hieuhkorean": "\u314E",
+    "/hieuhparenkorean": "\u320D",
+    "/hihiragana": "\u3072",
+    "/hikatakana": "\u30D2",
+    "/hikatakanahalfwidth": "\uFF8B",
+    "/hiriq": "\u05B4",
+    "/hiriq14": "\u05B4",
+    "/hiriq21": "\u05B4",
+    "/hiriq2d": "\u05B4",
+    "/hiriqhebrew": "\u05B4",
+    "/hiriqnarrowhebrew": "\u05B4",
+    "/hiriqquarterhebrew": "\u05B4",
+    "/hiriqwidehebrew": "\u05B4",
+    "/hlinebelow": "\u1E96",
+    "/hmonospace": "\uFF48",
+    "/hoarmenian": "\u0570",
+    "/hohipthai": "\u0E2B",
+    "/hohiragana": "\u307B",
+    "/hokatakana": "\u30DB",
+    "/hokatakanahalfwidth": "\uFF8E",
+    "/holam": "\u05B9",
+    "/holam19": "\u05B9",
+    "/holam26": "\u05B9",
+    "/holam32": "\u05B9",
+    "/holamhebrew": "\u05B9",
+    "/holamnarrowhebrew": "\u05B9",
+    "/holamquarterhebrew": "\u05B9",
+    "/holamwidehebrew": "\u05B9",
+    "/honokhukthai": "\u0E2E",
+    "/hookabovecomb": "\u0309",
+    "/hookcmb": "\u0309",
+    "/hookpalatalizedbelowcmb": "\u0321",
+    "/hookretroflexbelowcmb": "\u0322",
+    "/hoonsquare": "\u3342",
+    "/horicoptic": "\u03E9",
+    "/horizontalbar": "\u2015",
+    "/horncmb": "\u031B",
+    "/hotsprings": "\u2668",
+    "/house": "\u2302",
+    "/hparen": "\u24A3",
+    "/hsuperior": "\u02B0",
+    "/hturned": "\u0265",
+    "/huhiragana": "\u3075",
+    "/huiitosquare": "\u3333",
+    "/hukatakana": "\u30D5",
+    "/hukatakanahalfwidth": "\uFF8C",
+    "/hungarumlaut": "\u02DD",
+    "/hungarumlautcmb": "\u030B",
+    "/hv": "\u0195",
+    "/hyphen": "\u002D",
+    "/hypheninferior": "\uF6E5",
+    "/hyphenmonospace": "\uFF0D",
+    "/hyphensmall": "\uFE63",
+    "/hyphensuperior": "\uF6E6",
+    "/hyphentwo": "\u2010",
+    "/i": "\u0069",
+    "/iacute": "\u00ED",
+    "/iacyrillic": "\u044F",
+    "/ibengali": "\u0987",
+    "/ibopomofo": "\u3127",
+    "/ibreve": "\u012D",
+    "/icaron": "\u01D0",
+    "/icircle": "\u24D8",
+    "/icircumflex": "\u00EE",
+    "/icyrillic": "\u0456",
+    "/idblgrave": "\u0209",
+    "/ideographearthcircle": "\u328F",
+    "/ideographfirecircle": "\u328B",
+    "/ideographicallianceparen": "\u323F",
+    "/ideographiccallparen": "\u323A",
+    "/ideographiccentrecircle": "\u32A5",
+    "/ideographicclose": "\u3006",
+    "/ideographiccomma": "\u3001",
+    "/ideographiccommaleft": "\uFF64",
+    "/ideographiccongratulationparen": "\u3237",
+    "/ideographiccorrectcircle": "\u32A3",
+    "/ideographicearthparen": "\u322F",
+    "/ideographicenterpriseparen": "\u323D",
+    "/ideographicexcellentcircle": "\u329D",
+    "/ideographicfestivalparen": "\u3240",
+    "/ideographicfinancialcircle": "\u3296",
+    "/ideographicfinancialparen": "\u3236",
+    "/ideographicfireparen": "\u322B",
+    "/ideographichaveparen": "\u3232",
+    "/ideographichighcircle": "\u32A4",
+    "/ideographiciterationmark": "\u3005",
+    "/ideographiclaborcircle": "\u3298",
+    "/ideographiclaborparen": "\u3238",
+    "/ideographicleftcircle": "\u32A7",
+    "/ideographiclowcircle": "\u32A6",
+    "/ideographicmedicinecircle": "\u32A9",
+    "/ideographicmetalparen": "\u322E",
+    "/ideographicmoonparen": "\u322A",
+    "/ideographicnameparen": "\u3234",
+    "/ideographicperiod": "\u3002",
+    "/ideographicprintcircle": "\u329E",
+    "/ideographicreachparen": "\u3243",
+    "/ideographicrepresentparen": "\u3239",
+    "/ideographicresourceparen": "\u323E",
+    "/ideographicrightcircle": "\u32A8",
+    "/ideographicsecretcircle": "\u3299",
+    "/ideographicselfparen": "\u3242",
+    "/ideographicsocietyparen": "\u3233",
+    "/ideographicspace": "\u3000",
+    "/ideographicspecialparen": "\u3235",
+    "/ideographicstockparen": "\u3231",
+    "/ideographicstudyparen": "\u323B",
+    "/ideographicsunparen": "\u3230",
+    "/ideographicsuperviseparen": "\u323C",
+    "/ideographicwaterparen": "\u322C",
+    "/ideographicwoodparen": "\u322D",
+    "/ideographiczero": "\u3007",
+    "/ideographmetalcircle": "\u328E",
+    "/ideographmooncircle": "\u328A",
+    "/ideographnamecircle": "\u3294",
+    "/ideographsuncircle": "\u3290",
+    "/ideographwatercircle": "\u328C",
+    "/ideographwoodcircle": "\u328D",
+    "/ideva": "\u0907",
+    "/idieresis": "\u00EF",
+    "/idieresisacute": "\u1E2F",
+    "/idieresiscyrillic": "\u04E5",
+    "/idotbelow": "\u1ECB",
+    "/iebrevecyrillic": "\u04D7",
+    "/iecyrillic": "\u0435",
+    "/ieungacirclekorean": "\u3275",
+    "/ieungaparenkorean": "\u3215",
+    "/ieungcirclekorean": "\u3267",
+    "/ieungkorean": "\u3147",
+    "/ieungparenkorean": "\u3207",
+    "/igrave": "\u00EC",
+    "/igujarati": "\u0A87",
+    "/igurmukhi": "\u0A07",
+    "/ihiragana": "\u3044",
+    "/ihookabove": "\u1EC9",
+    "/iibengali": "\u0988",
+    "/iicyrillic": "\u0438",
+    "/iideva": "\u0908",
+    "/iigujarati": "\u0A88",
+    "/iigurmukhi": "\u0A08",
+    "/iimatragurmukhi": "\u0A40",
+    "/iinvertedbreve": "\u020B",
+    "/iishortcyrillic": "\u0439",
+    "/iivowelsignbengali": "\u09C0",
+    "/iivowelsigndeva": "\u0940",
+    "/iivowelsigngujarati": "\u0AC0",
+    "/ij": "\u0133",
+    "/ikatakana": "\u30A4",
+    "/ikatakanahalfwidth": "\uFF72",
+    "/ikorean": "\u3163",
+    "/ilde": "\u02DC",
+    "/iluyhebrew": "\u05AC",
+    "/imacron": "\u012B",
+    "/imacroncyrillic": "\u04E3",
+    "/imageorapproximatelyequal": "\u2253",
+    "/imatragurmukhi": "\u0A3F",
+    "/imonospace": "\uFF49",
+    "/increment": "\u2206",
+    "/infinity": "\u221E",
+    "/iniarmenian": "\u056B",
+    "/integral": "\u222B",
+    "/integralbottom": "\u2321",
+    "/integralbt": "\u2321",
+    "/integralex": "\uF8F5",
+    "/integraltop": "\u2320",
+    "/integraltp": "\u2320",
+    "/intersection": "\u2229",
+    "/intisquare": "\u3305",
+    "/invbullet": "\u25D8",
+    "/invcircle": "\u25D9",
+    "/invsmileface": "\u263B",
+    "/iocyrillic": "\u0451",
+    "/iogonek": "\u012F",
+    "/iota": "\u03B9",
+    "/iotadieresis": "\u03CA",
+    "/iotadieresistonos": "\u0390",
+    "/iotalatin": "\u0269",
+    "/iotatonos": "\u03AF",
+    "/iparen": "\u24A4",
+    "/irigurmukhi": "\u0A72",
+    "/ismallhiragana": "\u3043",
+    "/ismallkatakana": "\u30A3",
+    "/ismallkatakanahalfwidth": "\uFF68",
+    "/issharbengali": "\u09FA",
+    "/istroke": "\u0268",
+    "/isuperior": "\uF6ED",
+    "/iterationhiragana": "\u309D",
+    "/iterationkatakana": "\u30FD",
+    "/itilde": "\u0129",
+    "/itildebelow": "\u1E2D",
+    "/iubopomofo": "\u3129",
+    "/iucyrillic": "\u044E",
+    "/ivowelsignbengali": "\u09BF",
+    "/ivowelsigndeva": "\u093F",
+    "/ivowelsigngujarati": "\u0ABF",
+    "/izhitsacyrillic": "\u0475",
+    "/izhitsadblgravecyrillic": "\u0477",
+    "/j": "\u006A",
+    "/jaarmenian": "\u0571",
+    "/jabengali": "\u099C",
+    "/jadeva": "\u091C",
+    "/jagujarati": "\u0A9C",
+    "/jagurmukhi": "\u0A1C",
+    "/jbopomofo": "\u3110",
+    "/jcaron": "\u01F0",
+    "/jcircle": "\u24D9",
+    "/jcircumflex": "\u0135",
+    "/jcrossedtail": "\u029D",
+    "/jdotlessstroke": "\u025F",
+    "/jecyrillic": "\u0458",
+    "/jeemarabic": "\u062C",
+    "/jeemfinalarabic": "\uFE9E",
+    "/jeeminitialarabic": "\uFE9F",
+    "/jeemmedialarabic": "\uFEA0",
+    "/jeharabic": "\u0698",
+    "/jehfinalarabic": "\uFB8B",
+    "/jhabengali": "\u099D",
+    "/jhadeva": "\u091D",
+    "/jhagujarati": "\u0A9D",
+    "/jhagurmukhi": "\u0A1D",
+    "/jheharmenian": "\u057B",
+    "/jis": "\u3004",
+    "/jmonospace": "\uFF4A",
+    "/jparen": "\u24A5",
+    "/jsuperior": "\u02B2",
+    "/k": "\u006B",
+    "/kabashkircyrillic": "\u04A1",
+    "/kabengali": "\u0995",
+    "/kacute": "\u1E31",
+    "/kacyrillic": "\u043A",
+    "/kadescendercyrillic": "\u049B",
+    "/kadeva": "\u0915",
+    "/kaf": "\u05DB",
+    "/kafarabic": "\u0643",
+    "/kafdagesh": "\uFB3B",
+    "/kafdageshhebrew": "\uFB3B",
+    "/kaffinalarabic": "\uFEDA",
+    "/kafhebrew": "\u05DB",
+    "/kafinitialarabic": "\uFEDB",
+    "/kafmedialarabic": "\uFEDC",
+    "/kafrafehebrew": "\uFB4D",
+    "/kagujarati": "\u0A95",
+    "/kagurmukhi": "\u0A15",
+    "/kahiragana": "\u304B",
+    "/kahookcyrillic": "\u04C4",
+    "/kakatakana": "\u30AB",
+    "/kakatakanahalfwidth": "\uFF76",
+    "/kappa": "\u03BA",
+    "/kappasymbolgreek": "\u03F0",
+    "/kapyeounmieumkorean": "\u3171",
+    "/kapyeounphieuphkorean": "\u3184",
+    "/kapyeounpieupkorean": "\u3178",
+    "/kapyeounssangpieupkorean": "\u3179",
+    "/karoriisquare": "\u330D",
+    "/kashidaautoarabic": "\u0640",
+    "/kashidaautonosidebearingarabic": "\u0640",
+    "/kasmallkatakana": "\u30F5",
+    "/kasquare": "\u3384",
+    "/kasraarabic": "\u0650",
+    "/kasratanarabic": "\u064D",
+    "/kastrokecyrillic": "\u049F",
+    "/katahiraprolongmarkhalfwidth": "\uFF70",
+    "/kaverticalstrokecyrillic": "\u049D",
+    "/kbopomofo": "\u310E",
+    "/kcalsquare": "\u3389",
+    "/kcaron": "\u01E9",
+    "/kcedilla": "\u0137",
+    "/kcircle": "\u24DA",
+    "/kcommaaccent": "\u0137",
+    "/kdotbelow": "\u1E33",
+    "/keharmenian": "\u0584",
+    "/kehiragana": "\u3051",
+    "/kekatakana": "\u30B1",
+    "/kekatakanahalfwidth": "\uFF79",
+    "/kenarmenian": "\u056F",
+    "/kesmallkatakana": "\u30F6",
+    "/kgreenlandic": "\u0138",
+    "/khabengali": "\u0996",
+    "/khacyrillic": "\u0445",
+    "/khadeva": "\u0916",
+    "/khagujarati": "\u0A96",
+    "/khagurmukhi": "\u0A16",
+    "/khaharabic": "\u062E",
+    "/khahfinalarabic": "\uFEA6",
+    "/khahinitialarabic": "\uFEA7",
+    "/khahmedialarabic": "\uFEA8",
+    "/kheicoptic": "\u03E7",
+    "/khhadeva": "\u0959",
+    "/khhagurmukhi": "\u0A59",
+    "/khieukhacirclekorean": "\u3278",
+    "/khieukhaparenkorean": "\u3218",
+    "/khieukhcirclekorean": "\u326A",
+    "/khieukhkorean": "\u314B",
+    "/khieukhparenkorean": "\u320A",
+    "/khokhaithai": "\u0E02",
+    "/khokhonthai": "\u0E05",
+    "/khokhuatthai": "\u0E03",
+    "/khokhwaithai": "\u0E04",
+    "/khomutthai": "\u0E5B",
+    "/khook": "\u0199",
+    "/khorakhangthai": "\u0E06",
+    "/khzsquare": "\u3391",
+    "/kihiragana": "\u304D",
+    "/kikatakana": "\u30AD",
+    "/kikatakanahalfwidth": "\uFF77",
+    "/kiroguramusquare": "\u3315",
+    "/kiromeetorusquare": "\u3316",
+    "/kirosquare": "\u3314",
+    "/kiyeokacirclekorean": "\u326E",
+    "/kiyeokaparenkorean": "\u320E",
+    "/kiyeokcirclekorean": "\u3260",
+    "/kiyeokkorean": "\u3131",
+    "/kiyeokparenkorean": "\u3200",
+    "/kiyeoksioskorean": "\u3133",
+    "/kjecyrillic": "\u045C",
+    "/klinebelow": "\u1E35",
+    "/klsquare": "\u3398",
+    "/kmcubedsquare": "\u33A6",
+    "/kmonospace": "\uFF4B",
+    "/kmsquaredsquare": "\u33A2",
+    "/kohiragana": "\u3053",
+    "/kohmsquare": "\u33C0",
+    "/kokaithai": "\u0E01",
+    "/kokatakana": "\u30B3",
+    "/kokatakanahalfwidth": "\uFF7A",
+    "/kooposquare": "\u331E",
+    "/koppacyrillic": "\u0481",
+    "/koreanstandardsymbol": "\u327F",
+    "/koroniscmb": "\u0343",
+    "/kparen": "\u24A6",
+    "/kpasquare": "\u33AA",
+    "/ksicyrillic": "\u046F",
+    "/ktsquare": "\u33CF",
+    "/kturned": "\u029E",
+    "/kuhiragana": "\u304F",
+    "/kukatakana": "\u30AF",
+    "/kukatakanahalfwidth": "\uFF78",
+    "/kvsquare": "\u33B8",
+    "/kwsquare": "\u33BE",
+    "/l": "\u006C",
+    "/labengali": "\u09B2",
+    "/lacute": "\u013A",
+    "/ladeva": "\u0932",
+    "/lagujarati": "\u0AB2",
+    "/lagurmukhi": "\u0A32",
+    "/lakkhangyaothai": "\u0E45",
+    "/lamaleffinalarabic": "\uFEFC",
+    "/lamalefhamzaabovefinalarabic": "\uFEF8",
+    "/lamalefhamzaaboveisolatedarabic": "\uFEF7",
+    "/lamalefhamzabelowfinalarabic": "\uFEFA",
+    "/lamalefhamzabelowisolatedarabic": "\uFEF9",
+    "/lamalefisolatedarabic": "\uFEFB",
+    "/lamalefmaddaabovefinalarabic": "\uFEF6",
+    "/lamalefmaddaaboveisolatedarabic": "\uFEF5",
+    "/lamarabic": "\u0644",
+    "/lambda": "\u03BB",
+    "/lambdastroke": "\u019B",
+    "/lamed": "\u05DC",
+    "/lameddagesh": "\uFB3C",
+    "/lameddageshhebrew": "\uFB3C",
+    "/lamedhebrew": "\u05DC",
+    "/lamedholam": "\u05DC\u05B9",
+    "/lamedholamdagesh": "\u05DC\u05B9\u05BC",
+    "/lamedholamdageshhebrew": "\u05DC\u05B9\u05BC",
+    "/lamedholamhebrew": "\u05DC\u05B9",
+    "/lamfinalarabic": "\uFEDE",
+    "/lamhahinitialarabic": "\uFCCA",
+    "/laminitialarabic": "\uFEDF",
+    "/lamjeeminitialarabic": "\uFCC9",
+    "/lamkhahinitialarabic": "\uFCCB",
+    "/lamlamhehisolatedarabic": "\uFDF2",
+    "/lammedialarabic": "\uFEE0",
+    "/lammeemhahinitialarabic": "\uFD88",
+    "/lammeeminitialarabic": "\uFCCC",
+    "/lammeemjeeminitialarabic": "\uFEDF\uFEE4\uFEA0",
+    "/lammeemkhahinitialarabic": "\uFEDF\uFEE4\uFEA8",
+    "/largecircle": "\u25EF",
+    "/lbar": "\u019A",
+    "/lbelt": "\u026C",
+    "/lbopomofo": "\u310C",
+    "/lcaron": "\u013E",
+    "/lcedilla": "\u013C",
+    "/lcircle": "\u24DB",
+    "/lcircumflexbelow": "\u1E3D",
+    "/lcommaaccent": "\u013C",
+    "/ldot": "\u0140",
+    "/ldotaccent": "\u0140",
+    "/ldotbelow": "\u1E37",
+    "/ldotbelowmacron": "\u1E39",
+    "/leftangleabovecmb": "\u031A",
+    "/lefttackbelowcmb": "\u0318",
+    "/less": "\u003C",
+    "/lessequal": "\u2264",
+    "/lessequalorgreater": "\u22DA",
+    "/lessmonospace": "\uFF1C",
+    "/lessorequivalent": "\u2272",
+    "/lessorgreater": "\u2276",
+    "/lessoverequal": "\u2266",
+    "/lesssmall": "\uFE64",
+    "/lezh": "\u026E",
+    "/lfblock": "\u258C",
+    "/lhookretroflex": "\u026D",
+    "/lira": "\u20A4",
+    "/liwnarmenian": "\u056C",
+    "/lj": "\u01C9",
+    "/ljecyrillic": "\u0459",
+    "/ll": "\uF6C0",
+    "/lladeva": "\u0933",
+    "/llagujarati": "\u0AB3",
+    "/llinebelow": "\u1E3B",
+    "/llladeva": "\u0934",
+    "/llvocalicbengali": "\u09E1",
+    "/llvocalicdeva": "\u0961",
+    "/llvocalicvowelsignbengali": "\u09E3",
+    "/llvocalicvowelsigndeva": "\u0963",
+    "/lmiddletilde": "\u026B",
+    "/lmonospace": "\uFF4C",
+    "/lmsquare": "\u33D0",
+    "/lochulathai": "\u0E2C",
+    "/logicaland": "\u2227",
+    "/logicalnot": "\u00AC",
+    "/logicalnotreversed": "\u2310",
+    "/logicalor": "\u2228",
+    "/lolingthai": "\u0E25",
+    "/longs": "\u017F",
+    "/lowlinecenterline": "\uFE4E",
+    "/lowlinecmb": "\u0332",
+    "/lowlinedashed": "\uFE4D",
+    "/lozenge": "\u25CA",
+    "/lparen": "\u24A7",
+    "/lslash": "\u0142",
+    "/lsquare": "\u2113",
+    "/lsuperior": "\uF6EE",
+    "/ltshade": "\u2591",
+    "/luthai": "\u0E26",
+    "/lvocalicbengali": "\u098C",
+    "/lvocalicdeva": "\u090C",
+    "/lvocalicvowelsignbengali": "\u09E2",
+    "/lvocalicvowelsigndeva": "\u0962",
+    "/lxsquare": "\u33D3",
+    "/m": "\u006D",
+    "/mabengali": "\u09AE",
+    "/macron": "\u00AF",
+    "/macronbelowcmb": "\u0331",
+    "/macroncmb": "\u0304",
+    "/macronlowmod": "\u02CD",
+    "/macronmonospace": "\uFFE3",
+    "/macute": "\u1E3F",
+    "/madeva": "\u092E",
+    "/magujarati": "\u0AAE",
+    "/magurmukhi": "\u0A2E",
+    "/mahapakhhebrew": "\u05A4",
+    "/mahapakhlefthebrew": "\u05A4",
+    "/mahiragana": "\u307E",
+    "/maichattawalowleftthai": "\uF895",
+    "/maichattawalowrightthai": "\uF894",
+    "/maichattawathai": "\u0E4B",
+    "/maichattawaupperleftthai": "\uF893",
+    "/maieklowleftthai": "\uF88C",
+    "/maieklowrightthai": "\uF88B",
+    "/maiekthai": "\u0E48",
+    "/maiekupperleftthai": "\uF88A",
+    "/maihanakatleftthai": "\uF884",
+    "/maihanakatthai": "\u0E31",
+    "/maitaikhuleftthai": "\uF889",
+    "/maitaikhuthai": "\u0E47",
+    "/maitholowleftthai": "\uF88F",
+    "/maitholowrightthai": "\uF88E",
+    "/maithothai": "\u0E49",
+    "/maithoupperleftthai": "\uF88D",
+    "/maitrilowleftthai": "\uF892",
+    "/maitrilowrightthai": "\uF891",
+    "/maitrithai": "\u0E4A",
+    "/maitriupperleftthai": "\uF890",
+    "/maiyamokthai": "\u0E46",
+    "/makatakana": "\u30DE",
+    "/makatakanahalfwidth": "\uFF8F",
+    "/male": "\u2642",
+    "/mansyonsquare": "\u3347",
+    "/maqafhebrew": "\u05BE",
+    "/mars": "\u2642",
+    "/masoracirclehebrew": "\u05AF",
+    "/masquare": "\u3383",
+    "/mbopomofo": "\u3107",
+    "/mbsquare": "\u33D4",
+    "/mcircle": "\u24DC",
+    "/mcubedsquare": "\u33A5",
+    "/mdotaccent": "\u1E41",
+    "/mdotbelow": "\u1E43",
+    "/meemarabic": "\u0645",
+    "/meemfinalarabic": "\uFEE2",
+    "/meeminitialarabic": "\uFEE3",
+    "/meemmedialarabic": "\uFEE4",
+    "/meemmeeminitialarabic": "\uFCD1",
+    "/meemmeemisolatedarabic": "\uFC48",
+    "/meetorusquare": "\u334D",
+    "/mehiragana": "\u3081",
+    "/meizierasquare": "\u337E",
+    "/mekatakana": "\u30E1",
+    "/mekatakanahalfwidth": "\uFF92",
+    "/mem": "\u05DE",
+    "/memdagesh": "\uFB3E",
+    "/memdageshhebrew": "\uFB3E",
+    "/memhebrew": "\u05DE",
+    "/menarmenian": "\u0574",
+    "/merkhahebrew": "\u05A5",
+    "/merkhakefulahebrew": "\u05A6",
+    "/merkhakefulalefthebrew": "\u05A6",
+    "/merkhalefthebrew": "\u05A5",
+    "/mhook": "\u0271",
+    "/mhzsquare": "\u3392",
+    "/middledotkatakanahalfwidth": "\uFF65",
+    "/middot": "\u00B7",
+    "/mieumacirclekorean": "\u3272",
+    "/mieumaparenkorean": "\u3212",
+    "/mieumcirclekorean": "\u3264",
+    "/mieumkorean": "\u3141",
+    "/mieumpansioskorean": "\u3170",
+    "/mieumparenkorean": "\u3204",
+    "/mieumpieupkorean": "\u316E",
+    "/mieumsioskorean": "\u316F",
+    "/mihiragana": "\u307F",
+    "/mikatakana": "\u30DF",
+    "/mikatakanahalfwidth": "\uFF90",
+    "/minus": "\u2212",
+    "/minusbelowcmb": "\u0320",
+    "/minuscircle": "\u2296",
+    "/minusmod": "\u02D7",
+    "/minusplus": "\u2213",
+    "/minute": "\u2032",
+    "/miribaarusquare": "\u334A",
+    "/mirisquare": "\u3349",
+    "/mlonglegturned": "\u0270",
+    "/mlsquare": "\u3396",
+    "/mmcubedsquare": "\u33A3",
+    "/mmonospace": "\uFF4D",
+    "/mmsquaredsquare": "\u339F",
+    "/mohiragana": "\u3082",
+    "/mohmsquare": "\u33C1",
+    "/mokatakana": "\u30E2",
+    "/mokatakanahalfwidth": "\uFF93",
+    "/molsquare": "\u33D6",
+    "/momathai": "\u0E21",
+    "/moverssquare": "\u33A7",
+    "/moverssquaredsquare": "\u33A8",
+    "/mparen": "\u24A8",
+    "/mpasquare": "\u33AB",
+    "/mssquare": "\u33B3",
+    "/msuperior": "\uF6EF",
+    "/mturned": "\u026F",
+    "/mu": "\u00B5",
+    "/mu1": "\u00B5",
+    "/muasquare": "\u3382",
+    "/muchgreater": "\u226B",
+    "/muchless": "\u226A",
+    "/mufsquare": "\u338C",
+    "/mugreek": "\u03BC",
+    "/mugsquare": "\u338D",
+    "/muhiragana": "\u3080",
+    "/mukatakana": "\u30E0",
+    "/mukatakanahalfwidth": "\uFF91",
+    "/mulsquare": "\u3395",
+    "/multiply": "\u00D7",
+    "/mumsquare": "\u339B",
+    "/munahhebrew": "\u05A3",
+    "/munahlefthebrew": "\u05A3",
+    "/musicalnote": "\u266A",
+    "/musicalnotedbl": "\u266B",
+    "/musicflatsign": "\u266D",
+    "/musicsharpsign": "\u266F",
+    "/mussquare": "\u33B2",
+    "/muvsquare": "\u33B6",
+    "/muwsquare": "\u33BC",
+    "/mvmegasquare": "\u33B9",
+    "/mvsquare": "\u33B7",
+    "/mwmegasquare": "\u33BF",
+    "/mwsquare": "\u33BD",
+    "/n": "\u006E",
+    "/nabengali": "\u09A8",
+    "/nabla": "\u2207",
+    "/nacute": "\u0144",
+    "/nadeva": "\u0928",
+    "/nagujarati": "\u0AA8",
+    "/nagurmukhi": "\u0A28",
+    "/nahiragana": "\u306A",
+    "/nakatakana": "\u30CA",
+    "/nakatakanahalfwidth": "\uFF85",
+    "/napostrophe": "\u0149",
+    "/nasquare": "\u3381",
+    "/nbopomofo": "\u310B",
+    "/nbspace": "\u00A0",
+    "/ncaron": "\u0148",
+    "/ncedilla": "\u0146",
+    "/ncircle": "\u24DD",
+    "/ncircumflexbelow": "\u1E4B",
+    "/ncommaaccent": "\u0146",
+    "/ndotaccent": "\u1E45",
+    "/ndotbelow": "\u1E47",
+    "/nehiragana": "\u306D",
+    "/nekatakana": "\u30CD",
+    "/nekatakanahalfwidth": "\uFF88",
+    "/newsheqelsign": "\u20AA",
+    "/nfsquare": "\u338B",
+    "/ngabengali": "\u0999",
+    "/ngadeva": "\u0919",
+    "/ngagujarati": "\u0A99",
+    "/ngagurmukhi": "\u0A19",
+    "/ngonguthai": "\u0E07",
+    "/nhiragana": "\u3093",
+    "/nhookleft": "\u0272",
+    "/nhookretroflex": "\u0273",
+    "/nieunacirclekorean": "\u326F",
+    "/nieunaparenkorean": "\u320F",
+    "/nieuncieuckorean": "\u3135",
+    "/nieuncirclekorean": "\u3261",
+    "/nieunhieuhkorean": "\u3136",
+    "/nieunkorean": "\u3134",
+    "/nieunpansioskorean": "\u3168",
+    "/nieunparenkorean": "\u3201",
+    "/nieunsioskorean": "\u3167",
+    "/nieuntikeutkorean": "\u3166",
+    "/nihiragana": "\u306B",
+    "/nikatakana": "\u30CB",
+    "/nikatakanahalfwidth": "\uFF86",
+    "/nikhahitleftthai": "\uF899",
+    "/nikhahitthai": "\u0E4D",
+    "/nine": "\u0039",
+    "/ninearabic": "\u0669",
+    "/ninebengali": "\u09EF",
+    "/ninecircle": "\u2468",
+    "/ninecircleinversesansserif": "\u2792",
+    "/ninedeva": "\u096F",
+    "/ninegujarati": "\u0AEF",
+    "/ninegurmukhi": "\u0A6F",
+    "/ninehackarabic": "\u0669",
+    "/ninehangzhou": "\u3029",
+    "/nineideographicparen": "\u3228",
+    "/nineinferior": "\u2089",
+    "/ninemonospace": "\uFF19",
+    "/nineoldstyle": "\uF739",
+    "/nineparen": "\u247C",
+    "/nineperiod": "\u2490",
+    "/ninepersian": "\u06F9",
+    "/nineroman": "\u2178",
+    "/ninesuperior": "\u2079",
+    "/nineteencircle": "\u2472",
+    "/nineteenparen": "\u2486",
+    "/nineteenperiod": "\u249A",
+    "/ninethai": "\u0E59",
+    "/nj": "\u01CC",
+    "/njecyrillic": "\u045A",
+    "/nkatakana": "\u30F3",
+    "/nkatakanahalfwidth": "\uFF9D",
+    "/nlegrightlong": "\u019E",
+    "/nlinebelow": "\u1E49",
+    "/nmonospace": "\uFF4E",
+    "/nmsquare": "\u339A",
+    "/nnabengali": "\u09A3",
+    "/nnadeva": "\u0923",
+    "/nnagujarati": "\u0AA3",
+    "/nnagurmukhi": "\u0A23",
+    "/nnnadeva": "\u0929",
+    "/nohiragana": "\u306E",
+    "/nokatakana": "\u30CE",
+    "/nokatakanahalfwidth": "\uFF89",
+    "/nonbreakingspace": "\u00A0",
+    "/nonenthai": "\u0E13",
+    "/nonuthai": "\u0E19",
+    "/noonarabic": "\u0646",
+    "/noonfinalarabic": "\uFEE6",
+    "/noonghunnaarabic": "\u06BA",
+    "/noonghunnafinalarabic": "\uFB9F",
+    "/noonhehinitialarabic": "\uFEE7\uFEEC",
+    "/nooninitialarabic": "\uFEE7",
+    "/noonjeeminitialarabic": "\uFCD2",
+    "/noonjeemisolatedarabic": "\uFC4B",
+    "/noonmedialarabic": "\uFEE8",
+    "/noonmeeminitialarabic": "\uFCD5",
+    "/noonmeemisolatedarabic": "\uFC4E",
+    "/noonnoonfinalarabic": "\uFC8D",
+    "/notcontains": "\u220C",
+    "/notelement": "\u2209",
+    "/notelementof": "\u2209",
+    "/notequal": "\u2260",
+    "/notgreater": "\u226F",
+    "/notgreaternorequal": "\u2271",
+    "/notgreaternorless": "\u2279",
+    "/notidentical": "\u2262",
+    "/notless": "\u226E",
+    "/notlessnorequal": "\u2270",
+    "/notparallel": "\u2226",
+    "/notprecedes": "\u2280",
+    "/notsubset": "\u2284",
+    "/notsucceeds": "\u2281",
+    "/notsuperset": "\u2285",
+    "/nowarmenian": "\u0576",
+    "/nparen": "\u24A9",
+    "/nssquare": "\u33B1",
+    "/nsuperior": "\u207F",
+    "/ntilde": "\u00F1",
+    "/nu": "\u03BD",
+    "/nuhiragana": "\u306C",
+    "/nukatakana": "\u30CC",
+    "/nukatakanahalfwidth": "\uFF87",
+    "/nuktabengali": "\u09BC",
+    "/nuktadeva": "\u093C",
+    "/nuktagujarati": "\u0ABC",
+    "/nuktagurmukhi": "\u0A3C",
+    "/numbersign": "\u0023",
+    "/numbersignmonospace": "\uFF03",
+    "/numbersignsmall": "\uFE5F",
+    "/numeralsigngreek": "\u0374",
+    "/numeralsignlowergreek": "\u0375",
+    "/numero": "\u2116",
+    "/nun": "\u05E0",
+    "/nundagesh": "\uFB40",
+    "/nundageshhebrew": "\uFB40",
+    "/nunhebrew": "\u05E0",
+    "/nvsquare": "\u33B5",
+    "/nwsquare": "\u33BB",
+    "/nyabengali": "\u099E",
+    "/nyadeva": "\u091E",
+    "/nyagujarati": "\u0A9E",
+    "/nyagurmukhi": "\u0A1E",
+    "/o": "\u006F",
+    "/oacute": "\u00F3",
+    "/oangthai": "\u0E2D",
+    "/obarred": "\u0275",
+    "/obarredcyrillic": "\u04E9",
+    "/obarreddieresiscyrillic": "\u04EB",
+    "/obengali": "\u0993",
+    "/obopomofo": "\u311B",
+    "/obreve": "\u014F",
+    "/ocandradeva": "\u0911",
+    "/ocandragujarati": "\u0A91",
+    "/ocandravowelsigndeva": "\u0949",
+    "/ocandravowelsigngujarati": "\u0AC9",
+    "/ocaron": "\u01D2",
+    "/ocircle": "\u24DE",
+    "/ocircumflex": "\u00F4",
+    "/ocircumflexacute": "\u1ED1",
+    "/ocircumflexdotbelow": "\u1ED9",
+    "/ocircumflexgrave": "\u1ED3",
+    "/ocircumflexhookabove": "\u1ED5",
+    "/ocircumflextilde": "\u1ED7",
+    "/ocyrillic": "\u043E",
+    "/odblacute": "\u0151",
+    "/odblgrave": "\u020D",
+    "/odeva": "\u0913",
+    "/odieresis": "\u00F6",
+    "/odieresiscyrillic": "\u04E7",
+    "/odotbelow": "\u1ECD",
+    "/oe": "\u0153",
+    "/oekorean": "\u315A",
+    "/ogonek": "\u02DB",
+    "/ogonekcmb": "\u0328",
+    "/ograve": "\u00F2",
+    "/ogujarati": "\u0A93",
+    "/oharmenian": "\u0585",
+    "/ohiragana": "\u304A",
+    "/ohookabove": "\u1ECF",
+    "/ohorn": "\u01A1",
+    "/ohornacute": "\u1EDB",
+    "/ohorndotbelow": "\u1EE3",
+    "/ohorngrave": "\u1EDD",
+    "/ohornhookabove": "\u1EDF",
+    "/ohorntilde": "\u1EE1",
+    "/ohungarumlaut": "\u0151",
+    "/oi": "\u01A3",
+    "/oinvertedbreve": "\u020F",
+    "/okatakana": "\u30AA",
+    "/okatakanahalfwidth": "\uFF75",
+    "/okorean": "\u3157",
+    "/olehebrew": "\u05AB",
+    "/omacron": "\u014D",
+    "/omacronacute": "\u1E53",
+    "/omacrongrave": "\u1E51",
+    "/omdeva": "\u0950",
+    "/omega": "\u03C9",
+    "/omega1": "\u03D6",
+    "/omegacyrillic": "\u0461",
+    "/omegalatinclosed": "\u0277",
+    "/omegaroundcyrillic": "\u047B",
+    "/omegatitlocyrillic": "\u047D",
+    "/omegatonos": "\u03CE",
+    "/omgujarati": "\u0AD0",
+    "/omicron": "\u03BF",
+    "/omicrontonos": "\u03CC",
+    "/omonospace": "\uFF4F",
+    "/one": "\u0031",
+    "/onearabic": "\u0661",
+    "/onebengali": "\u09E7",
+    "/onecircle": "\u2460",
+    "/onecircleinversesansserif": "\u278A",
+    "/onedeva": "\u0967",
+    "/onedotenleader": "\u2024",
+    "/oneeighth": "\u215B",
+    "/onefitted": "\uF6DC",
+    "/onegujarati": "\u0AE7",
+    "/onegurmukhi": "\u0A67",
+    "/onehackarabic": "\u0661",
+    "/onehalf": "\u00BD",
+    "/onehangzhou": "\u3021",
+    "/oneideographicparen": "\u3220",
+    "/oneinferior": "\u2081",
+    "/onemonospace": "\uFF11",
+    "/onenumeratorbengali": "\u09F4",
+    "/oneoldstyle": "\uF731",
+    "/oneparen": "\u2474",
+    "/oneperiod": "\u2488",
+    "/onepersian": "\u06F1",
+    "/onequarter": "\u00BC",
+    "/oneroman": "\u2170",
+    "/onesuperior": "\u00B9",
+    "/onethai": "\u0E51",
+    "/onethird": "\u2153",
+    "/oogonek": "\u01EB",
+    "/oogonekmacron": "\u01ED",
+    "/oogurmukhi": "\u0A13",
+    "/oomatragurmukhi": "\u0A4B",
+    "/oopen": "\u0254",
+    "/oparen": "\u24AA",
+    "/openbullet": "\u25E6",
+    "/option": "\u2325",
+    "/ordfeminine": "\u00AA",
+    "/ordmasculine": "\u00BA",
+    "/orthogonal": "\u221F",
+    "/oshortdeva": "\u0912",
+    "/oshortvowelsigndeva": "\u094A",
+    "/oslash": "\u00F8",
+    "/oslashacute": "\u01FF",
+    "/osmallhiragana": "\u3049",
+    "/osmallkatakana": "\u30A9",
+    "/osmallkatakanahalfwidth": "\uFF6B",
+    "/ostrokeacute": "\u01FF",
+    "/osuperior": "\uF6F0",
+    "/otcyrillic": "\u047F",
+    "/otilde": "\u00F5",
+    "/otildeacute": "\u1E4D",
+    "/otildedieresis": "\u1E4F",
+    "/oubopomofo": "\u3121",
+    "/overline": "\u203E",
+    "/overlinecenterline": "\uFE4A",
+    "/overlinecmb": "\u0305",
+    "/overlinedashed": "\uFE49",
+    "/overlinedblwavy": "\uFE4C",
+    "/overlinewavy": "\uFE4B",
+    "/overscore": "\u00AF",
+    "/ovowelsignbengali": "\u09CB",
+    "/ovowelsigndeva": "\u094B",
+    "/ovowelsigngujarati": "\u0ACB",
+    "/p": "\u0070",
+    "/paampssquare": "\u3380",
+    "/paasentosquare": "\u332B",
+    "/pabengali": "\u09AA",
+    "/pacute": "\u1E55",
+    "/padeva": "\u092A",
+    "/pagedown": "\u21DF",
+    "/pageup": "\u21DE",
+    "/pagujarati": "\u0AAA",
+    "/pagurmukhi": "\u0A2A",
+    "/pahiragana": "\u3071",
+    "/paiyannoithai": "\u0E2F",
+    "/pakatakana": "\u30D1",
+    "/palatalizationcyrilliccmb": "\u0484",
+    "/palochkacyrillic": "\u04C0",
+    "/pansioskorean": "\u317F",
+    "/paragraph": "\u00B6",
+    "/parallel": "\u2225",
+    "/parenleft": "\u0028",
+    "/parenleftaltonearabic": "\uFD3E",
+    "/parenleftbt": "\uF8ED",
+    "/parenleftex": "\uF8EC",
+    "/parenleftinferior": "\u208D",
+    "/parenleftmonospace": "\uFF08",
+    "/parenleftsmall": "\uFE59",
+    "/parenleftsuperior": "\u207D",
+    "/parenlefttp": "\uF8EB",
+    "/parenleftvertical": "\uFE35",
+    "/parenright": "\u0029",
+    "/parenrightaltonearabic": "\uFD3F",
+    "/parenrightbt": "\uF8F8",
+    "/parenrightex": "\uF8F7",
+    "/parenrightinferior": "\u208E",
+    "/parenrightmonospace": "\uFF09",
+    "/parenrightsmall": "\uFE5A",
+    "/parenrightsuperior": "\u207E",
+    "/parenrighttp": "\uF8F6",
+    "/parenrightvertical": "\uFE36",
+    "/partialdiff": "\u2202",
+    "/paseqhebrew": "\u05C0",
+    "/pashtahebrew": "\u0599",
+    "/pasquare": "\u33A9",
+    "/patah": "\u05B7",
+    "/patah11": "\u05B7",
+    "/patah1d": "\u05B7",
+    "/patah2a": "\u05B7",
+    "/patahhebrew": "\u05B7",
+    "/patahnarrowhebrew": "\u05B7",
+    "/patahquarterhebrew": "\u05B7",
+    "/patahwidehebrew": "\u05B7",
+    "/pazerhebrew": "\u05A1",
+    "/pbopomofo": "\u3106",
+    "/pcircle": "\u24DF",
+    "/pdotaccent": "\u1E57",
+    "/pe": "\u05E4",
+    "/pecyrillic": "\u043F",
+    "/pedagesh": "\uFB44",
+    "/pedageshhebrew": "\uFB44",
+    "/peezisquare": "\u333B",
+    "/pefinaldageshhebrew": "\uFB43",
+    "/peharabic": "\u067E",
+    "/peharmenian": "\u057A",
+    "/pehebrew": "\u05E4",
+    "/pehfinalarabic": "\uFB57",
+    "/pehinitialarabic": "\uFB58",
+    "/pehiragana": "\u307A",
+    "/pehmedialarabic": "\uFB59",
+    "/pekatakana": "\u30DA",
+    "/pemiddlehookcyrillic": "\u04A7",
+    "/perafehebrew": "\uFB4E",
+    "/percent": "\u0025",
+    "/percentarabic": "\u066A",
+    "/percentmonospace": "\uFF05",
+    "/percentsmall": "\uFE6A",
+    "/period": "\u002E",
+    "/periodarmenian": "\u0589",
+    "/periodcentered": "\u00B7",
+    "/periodhalfwidth": "\uFF61",
+    "/periodinferior": "\uF6E7",
+    "/periodmonospace": "\uFF0E",
+    "/periodsmall": "\uFE52",
+    "/periodsuperior": "\uF6E8",
+    "/perispomenigreekcmb": "\u0342",
+    "/perpendicular": "\u22A5",
+    "/perthousand": "\u2030",
+    "/peseta": "\u20A7",
+    "/pfsquare": "\u338A",
+    "/phabengali": "\u09AB",
+    "/phadeva": "\u092B",
+    "/phagujarati": "\u0AAB",
+    "/phagurmukhi": "\u0A2B",
+    "/phi": "\u03C6",
+    "/phi1": "\u03D5",
+    "/phieuphacirclekorean": "\u327A",
+    "/phieuphaparenkorean": "\u321A",
+    "/phieuphcirclekorean": "\u326C",
+    "/phieuphkorean": "\u314D",
+    "/phieuphparenkorean": "\u320C",
+    "/philatin": "\u0278",
+    "/phinthuthai": "\u0E3A",
+    "/phisymbolgreek": "\u03D5",
+    "/phook": "\u01A5",
+    "/phophanthai": "\u0E1E",
+    "/phophungthai": "\u0E1C",
+    "/phosamphaothai": "\u0E20",
+    "/pi": "\u03C0",
+    "/pieupacirclekorean": "\u3273",
+    "/pieupaparenkorean": "\u3213",
+    "/pieupcieuckorean": "\u3176",
+    "/pieupcirclekorean": "\u3265",
+    "/pieupkiyeokkorean": "\u3172",
+    "/pieupkorean": "\u3142",
+    "/pieupparenkorean": "\u3205",
+    "/pieupsioskiyeokkorean": "\u3174",
+    "/pieupsioskorean": "\u3144",
+    "/pieupsiostikeutkorean": "\u3175",
+    "/pieupthieuthkorean": "\u3177",
+    "/pieuptikeutkorean": "\u3173",
+    "/pihiragana": "\u3074",
+    "/pikatakana": "\u30D4",
+    "/pisymbolgreek": "\u03D6",
+    "/piwrarmenian": "\u0583",
+    "/plus": "\u002B",
+    "/plusbelowcmb": "\u031F",
+    "/pluscircle": "\u2295",
+    "/plusminus": "\u00B1",
+    "/plusmod": "\u02D6",
+    "/plusmonospace": "\uFF0B",
+    "/plussmall": "\uFE62",
+    "/plussuperior": "\u207A",
+    "/pmonospace": "\uFF50",
+    "/pmsquare": "\u33D8",
+    "/pohiragana": "\u307D",
+    "/pointingindexdownwhite": "\u261F",
+    "/pointingindexleftwhite": "\u261C",
+    "/pointingindexrightwhite": "\u261E",
+    "/pointingindexupwhite": "\u261D",
+    "/pokatakana": "\u30DD",
+    "/poplathai": "\u0E1B",
+    "/postalmark": "\u3012",
+    "/postalmarkface": "\u3020",
+    "/pparen": "\u24AB",
+    "/precedes": "\u227A",
+    "/prescription": "\u211E",
+    "/primemod": "\u02B9",
+    "/primereversed": "\u2035",
+    "/product": "\u220F",
+    "/projective": "\u2305",
+    "/prolongedkana": "\u30FC",
+    "/propellor": "\u2318",
+    "/propersubset": "\u2282",
+    "/propersuperset": "\u2283",
+    "/proportion": "\u2237",
+    "/proportional": "\u221D",
+    "/psi": "\u03C8",
+    "/psicyrillic": "\u0471",
+    "/psilipneumatacyrilliccmb": "\u0486",
+    "/pssquare": "\u33B0",
+    "/puhiragana": "\u3077",
+    "/pukatakana": "\u30D7",
+    "/pvsquare": "\u33B4",
+    "/pwsquare": "\u33BA",
+    "/q": "\u0071",
+    "/qadeva": "\u0958",
+    "/qadmahebrew": "\u05A8",
+    "/qafarabic": "\u0642",
+    "/qaffinalarabic": "\uFED6",
+    "/qafinitialarabic": "\uFED7",
+    "/qafmedialarabic": "\uFED8",
+    "/qamats": "\u05B8",
+    "/qamats10": "\u05B8",
+    "/qamats1a": "\u05B8",
+    "/qamats1c": "\u05B8",
+    "/qamats27": "\u05B8",
+    "/qamats29": "\u05B8",
+    "/qamats33": "\u05B8",
+    "/qamatsde": "\u05B8",
+    "/qamatshebrew": "\u05B8",
+    "/qamatsnarrowhebrew": "\u05B8",
+    "/qamatsqatanhebrew": "\u05B8",
+    "/qamatsqatannarrowhebrew": "\u05B8",
+    "/qamatsqatanquarterhebrew": "\u05B8",
+    "/qamatsqatanwidehebrew": "\u05B8",
+    "/qamatsquarterhebrew": "\u05B8",
+    "/qamatswidehebrew": "\u05B8",
+    "/qarneyparahebrew": "\u059F",
+    "/qbopomofo": "\u3111",
+    "/qcircle": "\u24E0",
+    "/qhook": "\u02A0",
+    "/qmonospace": "\uFF51",
+    "/qof": "\u05E7",
+    "/qofdagesh": "\uFB47",
+    "/qofdageshhebrew": "\uFB47",
+    "/qofhatafpatah": "\u05E7\u05B2",
+    "/qofhatafpatahhebrew": "\u05E7\u05B2",
+    "/qofhatafsegol": "\u05E7\u05B1",
+    "/qofhatafsegolhebrew": "\u05E7\u05B1",
+    "/qofhebrew": "\u05E7",
+    "/qofhiriq": "\u05E7\u05B4",
+    "/qofhiriqhebrew": "\u05E7\u05B4",
+    "/qofholam": "\u05E7\u05B9",
+    "/qofholamhebrew": "\u05E7\u05B9",
+    "/qofpatah": "\u05E7\u05B7",
+    "/qofpatahhebrew": "\u05E7\u05B7",
+    "/qofqamats": "\u05E7\u05B8",
+    "/qofqamatshebrew": "\u05E7\u05B8",
+    "/qofqubuts": "\u05E7\u05BB",
+    "/qofqubutshebrew": "\u05E7\u05BB",
+    "/qofsegol": "\u05E7\u05B6",
+    "/qofsegolhebrew": "\u05E7\u05B6",
+    "/qofsheva": "\u05E7\u05B0",
+    "/qofshevahebrew": "\u05E7\u05B0",
+    "/qoftsere": "\u05E7\u05B5",
+    "/qoftserehebrew": "\u05E7\u05B5",
+    "/qparen": "\u24AC",
+    "/quarternote": "\u2669",
+    "/qubuts": "\u05BB",
+    "/qubuts18": "\u05BB",
+    "/qubuts25": "\u05BB",
+    "/qubuts31": "\u05BB",
+    "/qubutshebrew": "\u05BB",
+    "/qubutsnarrowhebrew": "\u05BB",
+    "/qubutsquarterhebrew": "\u05BB",
+    "/qubutswidehebrew": "\u05BB",
+    "/question": "\u003F",
+    "/questionarabic": "\u061F",
+    "/questionarmenian": "\u055E",
+    "/questiondown": "\u00BF",
+    "/questiondownsmall": "\uF7BF",
+    "/questiongreek": "\u037E",
+    "/questionmonospace": "\uFF1F",
+    "/questionsmall": "\uF73F",
+    "/quotedbl": "\u0022",
+    "/quotedblbase": "\u201E",
+    "/quotedblleft": "\u201C",
+    "/quotedblmonospace": "\uFF02",
+    "/quotedblprime": "\u301E",
+    "/quotedblprimereversed": "\u301D",
+    "/quotedblright": "\u201D",
+    "/quoteleft": "\u2018",
+    "/quoteleftreversed": "\u201B",
+    "/quotereversed": "\u201B",
+    "/quoteright": "\u2019",
+    "/quoterightn": "\u0149",
+    "/quotesinglbase": "\u201A",
+    "/quotesingle": "\u0027",
+    "/quotesinglemonospace": "\uFF07",
+    "/r": "\u0072",
+    "/raarmenian": "\u057C",
+    "/rabengali": "\u09B0",
+    "/racute": "\u0155",
+    "/radeva": "\u0930",
+    "/radical": "\u221A",
+    "/radicalex": "\uF8E5",
+    "/radoverssquare": "\u33AE",
+    "/radoverssquaredsquare": "\u33AF",
+    "/radsquare": "\u33AD",
+    "/rafe": "\u05BF",
+    "/rafehebrew": "\u05BF",
+    "/ragujarati": "\u0AB0",
+    "/ragurmukhi": "\u0A30",
+    "/rahiragana": "\u3089",
+    "/rakatakana": "\u30E9",
+    "/rakatakanahalfwidth": "\uFF97",
+    "/ralowerdiagonalbengali": "\u09F1",
+    "/ramiddlediagonalbengali": "\u09F0",
+    "/ramshorn": "\u0264",
+    "/ratio": "\u2236",
+    "/rbopomofo": "\u3116",
+    "/rcaron": "\u0159",
+    "/rcedilla": "\u0157",
+    "/rcircle": "\u24E1",
+    "/rcommaaccent": "\u0157",
+    "/rdblgrave": "\u0211",
+    "/rdotaccent": "\u1E59",
+    "/rdotbelow": "\u1E5B",
+    "/rdotbelowmacron": "\u1E5D",
+    "/referencemark": "\u203B",
+    "/reflexsubset": "\u2286",
+    "/reflexsuperset": "\u2287",
+    "/registered": "\u00AE",
+    "/registersans": "\uF8E8",
+    "/registerserif": "\uF6DA",
+    "/reharabic": "\u0631",
+    "/reharmenian": "\u0580",
+    "/rehfinalarabic": "\uFEAE",
+    "/rehiragana": "\u308C",
+    "/rehyehaleflamarabic": "\u0631\uFEF3\uFE8E\u0644",
+    "/rekatakana": "\u30EC",
+    "/rekatakanahalfwidth": "\uFF9A",
+    "/resh": "\u05E8",
+    "/reshdageshhebrew": "\uFB48",
+    "/reshhatafpatah": "\u05E8\u05B2",
+    "/reshhatafpatahhebrew": "\u05E8\u05B2",
+    "/reshhatafsegol": "\u05E8\u05B1",
+    "/reshhatafsegolhebrew": "\u05E8\u05B1",
+    "/reshhebrew": "\u05E8",
+    "/reshhiriq": "\u05E8\u05B4",
+    "/reshhiriqhebrew": "\u05E8\u05B4",
+    "/reshholam": "\u05E8\u05B9",
+    "/reshholamhebrew": "\u05E8\u05B9",
+    "/reshpatah": "\u05E8\u05B7",
+    "/reshpatahhebrew": "\u05E8\u05B7",
+    "/reshqamats": "\u05E8\u05B8",
+    "/reshqamatshebrew": "\u05E8\u05B8",
+    "/reshqubuts": "\u05E8\u05BB",
+    "/reshqubutshebrew": "\u05E8\u05BB",
+    "/reshsegol": "\u05E8\u05B6",
+    "/reshsegolhebrew": "\u05E8\u05B6",
+    "/reshsheva": "\u05E8\u05B0",
+    "/reshshevahebrew": "\u05E8\u05B0",
+    "/reshtsere": "\u05E8\u05B5",
+    "/reshtserehebrew": "\u05E8\u05B5",
+    "/reversedtilde": "\u223D",
+    "/reviahebrew": "\u0597",
+    "/reviamugrashhebrew": "\u0597",
+    "/revlogicalnot": "\u2310",
+    "/rfishhook": "\u027E",
+    "/rfishhookreversed": "\u027F",
+    "/rhabengali": "\u09DD",
+    "/rhadeva": "\u095D",
+    "/rho": "\u03C1",
+    "/rhook": "\u027D",
+    "/rhookturned": "\u027B",
+    "/rhookturnedsuperior": "\u02B5",
+    "/rhosymbolgreek": "\u03F1",
+    "/rhotichookmod": "\u02DE",
+    "/rieulacirclekorean": "\u3271",
+    "/rieulaparenkorean": "\u3211",
+    "/rieulcirclekorean": "\u3263",
+    "/rieulhieuhkorean": "\u3140",
+    "/rieulkiyeokkorean": "\u313A",
+    "/rieulkiyeoksioskorean": "\u3169",
+    "/rieulkorean": "\u3139",
+    "/rieulmieumkorean": "\u313B",
+    "/rieulpansioskorean": "\u316C",
+    "/rieulparenkorean": "\u3203",
+    "/rieulphieuphkorean": "\u313F",
+    "/rieulpieupkorean": "\u313C",
+    "/rieulpieupsioskorean": "\u316B",
+    "/rieulsioskorean": "\u313D",
+    "/rieulthieuthkorean": "\u313E",
+    "/rieultikeutkorean": "\u316A",
+    "/rieulyeorinhieuhkorean": "\u316D",
+    "/rightangle": "\u221F",
+    "/righttackbelowcmb": "\u0319",
+    "/righttriangle": "\u22BF",
+    "/rihiragana": "\u308A",
+    "/rikatakana": "\u30EA",
+    "/rikatakanahalfwidth": "\uFF98",
+    "/ring": "\u02DA",
+    "/ringbelowcmb": "\u0325",
+    "/ringcmb": "\u030A",
+    "/ringhalfleft": "\u02BF",
+    "/ringhalfleftarmenian": "\u0559",
+    "/ringhalfleftbelowcmb": "\u031C",
+    "/ringhalfleftcentered": "\u02D3",
+    "/ringhalfright": "\u02BE",
+    "/ringhalfrightbelowcmb": "\u0339",
+    "/ringhalfrightcentered": "\u02D2",
+    "/rinvertedbreve": "\u0213",
+    "/rittorusquare": "\u3351",
+    "/rlinebelow": "\u1E5F",
+    "/rlongleg": "\u027C",
+    "/rlonglegturned": "\u027A",
+    "/rmonospace": "\uFF52",
+    "/rohiragana": "\u308D",
+    "/rokatakana": "\u30ED",
+    "/rokatakanahalfwidth": "\uFF9B",
+    "/roruathai": "\u0E23",
+    "/rparen": "\u24AD",
+    "/rrabengali": "\u09DC",
+    "/rradeva": "\u0931",
+    "/rragurmukhi": "\u0A5C",
+    "/rreharabic": "\u0691",
+    "/rrehfinalarabic": "\uFB8D",
+    "/rrvocalicbengali": "\u09E0",
+    "/rrvocalicdeva": "\u0960",
+    "/rrvocalicgujarati": "\u0AE0",
+    "/rrvocalicvowelsignbengali": "\u09C4",
+    "/rrvocalicvowelsigndeva": "\u0944",
+    "/rrvocalicvowelsigngujarati": "\u0AC4",
+    "/rsuperior": "\uF6F1",
+    "/rtblock": "\u2590",
+    "/rturned": "\u0279",
+    "/rturnedsuperior": "\u02B4",
+    "/ruhiragana": "\u308B",
+    "/rukatakana": "\u30EB",
+    "/rukatakanahalfwidth": "\uFF99",
+    "/rupeemarkbengali": "\u09F2",
+    "/rupeesignbengali": "\u09F3",
+    "/rupiah": "\uF6DD",
+    "/ruthai": "\u0E24",
+    "/rvocalicbengali": "\u098B",
+    "/rvocalicdeva": "\u090B",
+    "/rvocalicgujarati": "\u0A8B",
+    "/rvocalicvowelsignbengali": "\u09C3",
+    "/rvocalicvowelsigndeva": "\u0943",
+    "/rvocalicvowelsigngujarati": "\u0AC3",
+    "/s": "\u0073",
+    "/sabengali": "\u09B8",
+    "/sacute": "\u015B",
+    "/sacutedotaccent": "\u1E65",
+    "/sadarabic": "\u0635",
+    "/sadeva": "\u0938",
+    "/sadfinalarabic": "\uFEBA",
+    "/sadinitialarabic": "\uFEBB",
+    "/sadmedialarabic": "\uFEBC",
+    "/sagujarati": "\u0AB8",
+    "/sagurmukhi": "\u0A38",
+    "/sahiragana": "\u3055",
+    "/sakatakana": "\u30B5",
+    "/sakatakanahalfwidth": "\uFF7B",
+    "/sallallahoualayhewasallamarabic": "\uFDFA",
+    "/samekh": "\u05E1",
+    "/samekhdagesh": "\uFB41",
+    "/samekhdageshhebrew": "\uFB41",
+    "/samekhhebrew": "\u05E1",
+    "/saraaathai": "\u0E32",
+    "/saraaethai": "\u0E41",
+    "/saraaimaimalaithai": "\u0E44",
+    "/saraaimaimuanthai": "\u0E43",
+    "/saraamthai": "\u0E33",
+    "/saraathai": "\u0E30",
+    "/saraethai": "\u0E40",
+    "/saraiileftthai": "\uF886",
+    "/saraiithai": "\u0E35",
+    "/saraileftthai": "\uF885",
+    "/saraithai": "\u0E34",
+    "/saraothai": "\u0E42",
+    "/saraueeleftthai": "\uF888",
+    "/saraueethai": "\u0E37",
+    "/saraueleftthai": "\uF887",
+    "/sarauethai": "\u0E36",
+    "/sarauthai": "\u0E38",
+    "/sarauuthai": "\u0E39",
+    "/sbopomofo": "\u3119",
+    "/scaron": "\u0161",
+    "/scarondotaccent": "\u1E67",
+    "/scedilla": "\u015F",
+    "/schwa": "\u0259",
+    "/schwacyrillic": "\u04D9",
+    "/schwadieresiscyrillic": "\u04DB",
+    "/schwahook": "\u025A",
+    "/scircle": "\u24E2",
+    "/scircumflex": "\u015D",
+    "/scommaaccent": "\u0219",
+    "/sdotaccent": "\u1E61",
+    "/sdotbelow": "\u1E63",
+    "/sdotbelowdotaccent": "\u1E69",
+    "/seagullbelowcmb": "\u033C",
+    "/second": "\u2033",
+    "/secondtonechinese": "\u02CA",
+    "/section": "\u00A7",
+    "/seenarabic": "\u0633",
+    "/seenfinalarabic": "\uFEB2",
+    "/seeninitialarabic": "\uFEB3",
+    "/seenmedialarabic": "\uFEB4",
+    "/segol": "\u05B6",
+    "/segol13": "\u05B6",
+    "/segol1f": "\u05B6",
+    "/segol2c": "\u05B6",
+    "/segolhebrew": "\u05B6",
+    "/segolnarrowhebrew": "\u05B6",
+    "/segolquarterhebrew": "\u05B6",
+    "/segoltahebrew": "\u0592",
+    "/segolwidehebrew": "\u05B6",
+    "/seharmenian": "\u057D",
+    "/sehiragana": "\u305B",
+    "/sekatakana": "\u30BB",
+    "/sekatakanahalfwidth": "\uFF7E",
+    "/semicolon": "\u003B",
+    "/semicolonarabic": "\u061B",
+    "/semicolonmonospace": "\uFF1B",
+    "/semicolonsmall": "\uFE54",
+    "/semivoicedmarkkana": "\u309C",
+    "/semivoicedmarkkanahalfwidth": "\uFF9F",
+    "/sentisquare": "\u3322",
+    "/sentosquare": "\u3323",
+    "/seven": "\u0037",
+    "/sevenarabic": "\u0667",
+    "/sevenbengali": "\u09ED",
+    "/sevencircle": "\u2466",
+    "/sevencircleinversesansserif": "\u2790",
+    "/sevendeva": "\u096D",
+    "/seveneighths": "\u215E",
+    "/sevengujarati": "\u0AED",
+    "/sevengurmukhi": "\u0A6D",
+    "/sevenhackarabic": "\u0667",
+    "/sevenhangzhou": "\u3027",
+    "/sevenideographicparen": "\u3226",
+    "/seveninferior": "\u2087",
+    "/sevenmonospace": "\uFF17",
+    "/sevenoldstyle": "\uF737",
+    "/sevenparen": "\u247A",
+    "/sevenperiod": "\u248E",
+    "/sevenpersian": "\u06F7",
+    "/sevenroman": "\u2176",
+    "/sevensuperior": "\u2077",
+    "/seventeencircle": "\u2470",
+    "/seventeenparen": "\u2484",
+    "/seventeenperiod": "\u2498",
+    "/seventhai": "\u0E57",
+    "/sfthyphen": "\u00AD",
+    "/shaarmenian": "\u0577",
+    "/shabengali": "\u09B6",
+    "/shacyrillic": "\u0448",
+    "/shaddaarabic": "\u0651",
+    "/shaddadammaarabic": "\uFC61",
+    "/shaddadammatanarabic": "\uFC5E",
+    "/shaddafathaarabic": "\uFC60",
+    "/shaddafathatanarabic": "\u0651\u064B",
+    "/shaddakasraarabic": "\uFC62",
+    "/shaddakasratanarabic": "\uFC5F",
+    "/shade": "\u2592",
+    "/shadedark": "\u2593",
+    "/shadelight": "\u2591",
+    "/shademedium": "\u2592",
+    "/shadeva": "\u0936",
+    "/shagujarati": "\u0AB6",
+    "/shagurmukhi": "\u0A36",
+    "/shalshelethebrew": "\u0593",
+    "/shbopomofo": "\u3115",
+    "/shchacyrillic": "\u0449",
+    "/sheenarabic": "\u0634",
+    "/sheenfinalarabic": "\uFEB6",
+    "/sheeninitialarabic": "\uFEB7",
+    "/sheenmedialarabic": "\uFEB8",
+    "/sheicoptic": "\u03E3",
+    "/sheqel": "\u20AA",
+    "/sheqelhebrew": "\u20AA",
+    "/sheva": "\u05B0",
+    "/sheva115": "\u05B0",
+    "/sheva15": "\u05B0",
+    "/sheva22": "\u05B0",
+    "/sheva2e": "\u05B0",
+    "/shevahebrew": "\u05B0",
+    "/shevanarrowhebrew": "\u05B0",
+    "/shevaquarterhebrew": "\u05B0",
+    "/shevawidehebrew": "\u05B0",
+    "/shhacyrillic": "\u04BB",
+    "/shimacoptic": "\u03ED",
+    "/shin": "\u05E9",
+    "/shindagesh": "\uFB49",
+    "/shindageshhebrew": "\uFB49",
+    "/shindageshshindot": "\uFB2C",
+    "/shindageshshindothebrew": "\uFB2C",
+    "/shindageshsindot": "\uFB2D",
+    "/shindageshsindothebrew": "\uFB2D",
+    "/shindothebrew": "\u05C1",
+    "/shinhebrew": "\u05E9",
+    "/shinshindot": "\uFB2A",
+    "/shinshindothebrew": "\uFB2A",
+    "/shinsindot": "\uFB2B",
+    "/shinsindothebrew": "\uFB2B",
+    "/shook": "\u0282",
+    "/sigma": "\u03C3",
+    "/sigma1": "\u03C2",
+    "/sigmafinal": "\u03C2",
+    "/sigmalunatesymbolgreek": "\u03F2",
+    "/sihiragana": "\u3057",
+    "/sikatakana": "\u30B7",
+    "/sikatakanahalfwidth": "\uFF7C",
+    "/siluqhebrew": "\u05BD",
+    "/siluqlefthebrew": "\u05BD",
+    "/similar": "\u223C",
+    "/sindothebrew": "\u05C2",
+    "/siosacirclekorean": "\u3274",
+    "/siosaparenkorean": "\u3214",
+    "/sioscieuckorean": "\u317E",
+    "/sioscirclekorean": "\u3266",
+    "/sioskiyeokkorean": "\u317A",
+    "/sioskorean": "\u3145",
+    "/siosnieunkorean": "\u317B",
+    "/siosparenkorean": "\u3206",
+    "/siospieupkorean": "\u317D",
+    "/siostikeutkorean": "\u317C",
+    "/six": "\u0036",
+    "/sixarabic": "\u0666",
+    "/sixbengali": "\u09EC",
+    "/sixcircle": "\u2465",
+    "/sixcircleinversesansserif": "\u278F",
+    "/sixdeva": "\u096C",
+    "/sixgujarati": "\u0AEC",
+    "/sixgurmukhi": "\u0A6C",
+    "/sixhackarabic": "\u0666",
+    "/sixhangzhou": "\u3026",
+    "/sixideographicparen": "\u3225",
+    "/sixinferior": "\u2086",
+    "/sixmonospace": "\uFF16",
+    "/sixoldstyle": "\uF736",
+    "/sixparen": "\u2479",
+    "/sixperiod": "\u248D",
+    "/sixpersian": "\u06F6",
+    "/sixroman": "\u2175",
+    "/sixsuperior": "\u2076",
+    "/sixteencircle": "\u246F",
+    "/sixteencurrencydenominatorbengali": "\u09F9",
+    "/sixteenparen": "\u2483",
+    "/sixteenperiod": "\u2497",
+    "/sixthai": "\u0E56",
+    "/slash": "\u002F",
+    "/slashmonospace": "\uFF0F",
+    "/slong": "\u017F",
+    "/slongdotaccent": "\u1E9B",
+    "/smileface": "\u263A",
+    "/smonospace": "\uFF53",
+    "/sofpasuqhebrew": "\u05C3",
+    "/softhyphen": "\u00AD",
+    "/softsigncyrillic": "\u044C",
+    "/sohiragana": "\u305D",
+    "/sokatakana": "\u30BD",
+    "/sokatakanahalfwidth": "\uFF7F",
+    "/soliduslongoverlaycmb": "\u0338",
+    "/solidusshortoverlaycmb": "\u0337",
+    "/sorusithai": "\u0E29",
+    "/sosalathai": "\u0E28",
+    "/sosothai": "\u0E0B",
+    "/sosuathai": "\u0E2A",
+    "/space": "\u0020",
+    "/spacehackarabic": "\u0020",
+    "/spade": "\u2660",
+    "/spadesuitblack": "\u2660",
+    "/spadesuitwhite": "\u2664",
+    "/sparen": "\u24AE",
+    "/squarebelowcmb": "\u033B",
+    "/squarecc": "\u33C4",
+    "/squarecm": "\u339D",
+    "/squarediagonalcrosshatchfill": "\u25A9",
+    "/squarehorizontalfill": "\u25A4",
+    "/squarekg": "\u338F",
+    "/squarekm": "\u339E",
+    "/squarekmcapital": "\u33CE",
+    "/squareln": "\u33D1",
+    "/squarelog": "\u33D2",
+    "/squaremg": "\u338E",
+    "/squaremil": "\u33D5",
+    "/squaremm": "\u339C",
+    "/squaremsquared": "\u33A1",
+    "/squareorthogonalcrosshatchfill": "\u25A6",
+    "/squareupperlefttolowerrightfill": "\u25A7",
+    "/squareupperrighttolowerleftfill": "\u25A8",
+    "/squareverticalfill": "\u25A5",
+    "/squarewhitewithsmallblack": "\u25A3",
+    "/srsquare": "\u33DB",
+    "/ssabengali": "\u09B7",
+    "/ssadeva": "\u0937",
+    "/ssagujarati": "\u0AB7",
+    "/ssangcieuckorean": "\u3149",
+    "/ssanghieuhkorean": "\u3185",
+    "/ssangieungkorean": "\u3180",
+    "/ssangkiyeokkorean": "\u3132",
+    "/ssangnieunkorean": "\u3165",
+    "/ssangpieupkorean": "\u3143",
+    "/ssangsioskorean": "\u3146",
+    "/ssangtikeutkorean": "\u3138",
+    "/ssuperior": "\uF6F2",
+    "/sterling": "\u00A3",
+    "/sterlingmonospace": "\uFFE1",
+    "/strokelongoverlaycmb": "\u0336",
+    "/strokeshortoverlaycmb": "\u0335",
+    "/subset": "\u2282",
+    "/subsetnotequal": "\u228A",
+    "/subsetorequal": "\u2286",
+    "/succeeds": "\u227B",
+    "/suchthat": "\u220B",
+    "/suhiragana": "\u3059",
+    "/sukatakana": "\u30B9",
+    "/sukatakanahalfwidth": "\uFF7D",
+    "/sukunarabic": "\u0652",
+    "/summation": "\u2211",
+    "/sun": "\u263C",
+    "/superset": "\u2283",
+    "/supersetnotequal": "\u228B",
+    "/supersetorequal": "\u2287",
+    "/svsquare": "\u33DC",
+    "/syouwaerasquare": "\u337C",
+    "/t": "\u0074",
+    "/tabengali": "\u09A4",
+    "/tackdown": "\u22A4",
+    "/tackleft": "\u22A3",
+    "/tadeva": "\u0924",
+    "/tagujarati": "\u0AA4",
+    "/tagurmukhi": "\u0A24",
+    "/taharabic": "\u0637",
+    "/tahfinalarabic": "\uFEC2",
+    "/tahinitialarabic": "\uFEC3",
+    "/tahiragana": "\u305F",
+    "/tahmedialarabic": "\uFEC4",
+    "/taisyouerasquare": "\u337D",
+    "/takatakana": "\u30BF",
+    "/takatakanahalfwidth": "\uFF80",
+    "/tatweelarabic": "\u0640",
+    "/tau": "\u03C4",
+    "/tav": "\u05EA",
+    "/tavdages": "\uFB4A",
+    "/tavdagesh": "\uFB4A",
+    "/tavdageshhebrew": "\uFB4A",
+    "/tavhebrew": "\u05EA",
+    "/tbar": "\u0167",
+    "/tbopomofo": "\u310A",
+    "/tcaron": "\u0165",
+    "/tccurl": "\u02A8",
+    "/tcedilla": "\u0163",
+    "/tcheharabic": "\u0686",
+    "/tchehfinalarabic": "\uFB7B",
+    "/tchehinitialarabic": "\uFB7C",
+    "/tchehmedialarabic": "\uFB7D",
+    "/tchehmeeminitialarabic": "\uFB7C\uFEE4",
+    "/tcircle": "\u24E3",
+    "/tcircumflexbelow": "\u1E71",
+    "/tcommaaccent": "\u0163",
+    "/tdieresis": "\u1E97",
+    "/tdotaccent": "\u1E6B",
+    "/tdotbelow": "\u1E6D",
+    "/tecyrillic": "\u0442",
+    "/tedescendercyrillic": "\u04AD",
+    "/teharabic": "\u062A",
+    "/tehfinalarabic": "\uFE96",
+    "/tehhahinitialarabic": "\uFCA2",
+    "/tehhahisolatedarabic": "\uFC0C",
+    "/tehinitialarabic": "\uFE97",
+    "/tehiragana": "\u3066",
+    "/tehjeeminitialarabic": "\uFCA1",
+    "/tehjeemisolatedarabic": "\uFC0B",
+    "/tehmarbutaarabic": "\u0629",
+    "/tehmarbutafinalarabic": "\uFE94",
+    "/tehmedialarabic": "\uFE98",
+    "/tehmeeminitialarabic": "\uFCA4",
+    "/tehmeemisolatedarabic": "\uFC0E",
+    "/tehnoonfinalarabic": "\uFC73",
+    "/tekatakana": "\u30C6",
+    "/tekatakanahalfwidth": "\uFF83",
+    "/telephone": "\u2121",
+    "/telephoneblack": "\u260E",
+    "/telishagedolahebrew": "\u05A0",
+    "/telishaqetanahebrew": "\u05A9",
+    "/tencircle": "\u2469",
+    "/tenideographicparen": "\u3229",
+    "/tenparen": "\u247D",
+    "/tenperiod": "\u2491",
+    "/tenroman": "\u2179",
+    "/tesh": "\u02A7",
+    "/tet": "\u05D8",
+    "/tetdagesh": "\uFB38",
+    "/tetdageshhebrew": "\uFB38",
+    "/tethebrew": "\u05D8",
+    "/tetsecyrillic": "\u04B5",
+    "/tevirhebrew": "\u059B",
+    "/tevirlefthebrew": "\u059B",
+    "/thabengali": "\u09A5",
+    "/thadeva": "\u0925",
+    "/thagujarati": "\u0AA5",
+    "/thagurmukhi": "\u0A25",
+    "/thalarabic": "\u0630",
+    "/thalfinalarabic": "\uFEAC",
+    "/thanthakhatlowleftthai": "\uF898",
+    "/thanthakhatlowrightthai": "\uF897",
+    "/thanthakhatthai": "\u0E4C",
+    "/thanthakhatupperleftthai": "\uF896",
+    "/theharabic": "\u062B",
+    "/thehfinalarabic": "\uFE9A",
+    "/thehinitialarabic": "\uFE9B",
+    "/thehmedialarabic": "\uFE9C",
+    "/thereexists": "\u2203",
+    "/therefore": "\u2234",
+    "/theta": "\u03B8",
+    "/theta1": "\u03D1",
+    "/thetasymbolgreek": "\u03D1",
+    "/thieuthacirclekorean": "\u3279",
+    "/thieuthaparenkorean": "\u3219",
+    "/thieuthcirclekorean": "\u326B",
+    "/thieuthkorean": "\u314C",
+    "/thieuthparenkorean": "\u320B",
+    "/thirteencircle": "\u246C",
+    "/thirteenparen": "\u2480",
+    "/thirteenperiod": "\u2494",
+    "/thonangmonthothai": "\u0E11",
+    "/thook": "\u01AD",
+    "/thophuthaothai": "\u0E12",
+    "/thorn": "\u00FE",
+    "/thothahanthai": "\u0E17",
+    "/thothanthai": "\u0E10",
+    "/thothongthai": "\u0E18",
+    "/thothungthai": "\u0E16",
+    "/thousandcyrillic": "\u0482",
+    "/thousandsseparatorarabic": "\u066C",
+    "/thousandsseparatorpersian": "\u066C",
+    "/three": "\u0033",
+    "/threearabic": "\u0663",
+    "/threebengali": "\u09E9",
+    "/threecircle": "\u2462",
+    "/threecircleinversesansserif": "\u278C",
+    "/threedeva": "\u0969",
+    "/threeeighths": "\u215C",
+    "/threegujarati": "\u0AE9",
+    "/threegurmukhi": "\u0A69",
+    "/threehackarabic": "\u0663",
+    "/threehangzhou": "\u3023",
+    "/threeideographicparen": "\u3222",
+    "/threeinferior": "\u2083",
+    "/threemonospace": "\uFF13",
+    "/threenumeratorbengali": "\u09F6",
+    "/threeoldstyle": "\uF733",
+    "/threeparen": "\u2476",
+    "/threeperiod": "\u248A",
+    "/threepersian": "\u06F3",
+    "/threequarters": "\u00BE",
+    "/threequartersemdash": "\uF6DE",
+    "/threeroman": "\u2172",
+    "/threesuperior": "\u00B3",
+    "/threethai": "\u0E53",
+    "/thzsquare": "\u3394",
+    "/tihiragana": "\u3061",
+    "/tikatakana": "\u30C1",
+    "/tikatakanahalfwidth": "\uFF81",
+    "/tikeutacirclekorean": "\u3270",
+    "/tikeutaparenkorean": "\u3210",
+    "/tikeutcirclekorean": "\u3262",
+    "/tikeutkorean": "\u3137",
+    "/tikeutparenkorean": "\u3202",
+    "/tilde": "\u02DC",
+    "/tildebelowcmb": "\u0330",
+    "/tildecmb": "\u0303",
+    "/tildecomb": "\u0303",
+    "/tildedoublecmb": "\u0360",
+    "/tildeoperator": "\u223C",
+    "/tildeoverlaycmb": "\u0334",
+    "/tildeverticalcmb": "\u033E",
+    "/timescircle": "\u2297",
+    "/tipehahebrew": "\u0596",
+    "/tipehalefthebrew": "\u0596",
+    "/tippigurmukhi": "\u0A70",
+    "/titlocyrilliccmb": "\u0483",
+    "/tiwnarmenian": "\u057F",
+    "/tlinebelow": "\u1E6F",
+    "/tmonospace": "\uFF54",
+    "/toarmenian": "\u0569",
+    "/tohiragana": "\u3068",
+    "/tokatakana": "\u30C8",
+    "/tokatakanahalfwidth": "\uFF84",
+    "/tonebarextrahighmod": "\u02E5",
+    "/tonebarextralowmod": "\u02E9",
+    "/tonebarhighmod": "\u02E6",
+    "/tonebarlowmod": "\u02E8",
+    "/tonebarmidmod": "\u02E7",
+    "/tonefive": "\u01BD",
+    "/tonesix": "\u0185",
+    "/tonetwo": "\u01A8",
+    "/tonos": "\u0384",
+    "/tonsquare": "\u3327",
+    "/topatakthai": "\u0E0F",
+    "/tortoiseshellbracketleft": "\u3014",
+    "/tortoiseshellbracketleftsmall": "\uFE5D",
+    "/tortoiseshellbracketleftvertical": "\uFE39",
+    "/tortoiseshellbracketright": "\u3015",
+    "/tortoiseshellbracketrightsmall": "\uFE5E",
+    "/tortoiseshellbracketrightvertical": "\uFE3A",
+    "/totaothai": "\u0E15",
+    "/tpalatalhook": "\u01AB",
+    "/tparen": "\u24AF",
+    "/trademark": "\u2122",
+    "/trademarksans": "\uF8EA",
+    "/trademarkserif": "\uF6DB",
+    "/tretroflexhook": "\u0288",
+    "/triagdn": "\u25BC",
+    "/triaglf": "\u25C4",
+    "/triagrt": "\u25BA",
+    "/triagup": "\u25B2",
+    "/ts": "\u02A6",
+    "/tsadi": "\u05E6",
+    "/tsadidagesh": "\uFB46",
+    "/tsadidageshhebrew": "\uFB46",
+    "/tsadihebrew": "\u05E6",
+    "/tsecyrillic": "\u0446",
+    "/tsere": "\u05B5",
+    "/tsere12": "\u05B5",
+    "/tsere1e": "\u05B5",
+    "/tsere2b": "\u05B5",
+    "/tserehebrew": "\u05B5",
+    "/tserenarrowhebrew": "\u05B5",
+    "/tserequarterhebrew": "\u05B5",
+    "/tserewidehebrew": "\u05B5",
+    "/tshecyrillic": "\u045B",
+    "/tsuperior": "\uF6F3",
+    "/ttabengali": "\u099F",
+    "/ttadeva": "\u091F",
+    "/ttagujarati": "\u0A9F",
+    "/ttagurmukhi": "\u0A1F",
+    "/tteharabic": "\u0679",
+    "/ttehfinalarabic": "\uFB67",
+    "/ttehinitialarabic": "\uFB68",
+    "/ttehmedialarabic": "\uFB69",
+    "/tthabengali": "\u09A0",
+    "/tthadeva": "\u0920",
+    "/tthagujarati": "\u0AA0",
+    "/tthagurmukhi": "\u0A20",
+    "/tturned": "\u0287",
+    "/tuhiragana": "\u3064",
+    "/tukatakana": "\u30C4",
+    "/tukatakanahalfwidth": "\uFF82",
+    "/tusmallhiragana": "\u3063",
+    "/tusmallkatakana": "\u30C3",
+    "/tusmallkatakanahalfwidth": "\uFF6F",
+    "/twelvecircle": "\u246B",
+    "/twelveparen": "\u247F",
+    "/twelveperiod": "\u2493",
+    "/twelveroman": "\u217B",
+    "/twentycircle": "\u2473",
+    "/twentyhangzhou": "\u5344",
+    "/twentyparen": "\u2487",
+    "/twentyperiod": "\u249B",
+    "/two": "\u0032",
+    "/twoarabic": "\u0662",
+    "/twobengali": "\u09E8",
+    "/twocircle": "\u2461",
+    "/twocircleinversesansserif": "\u278B",
+    "/twodeva": "\u0968",
+    "/twodotenleader": "\u2025",
+    "/twodotleader": "\u2025",
+    "/twodotleadervertical": "\uFE30",
+    "/twogujarati": "\u0AE8",
+    "/twogurmukhi": "\u0A68",
+    "/twohackarabic": "\u0662",
+    "/twohangzhou": "\u3022",
+    "/twoideographicparen": "\u3221",
+    "/twoinferior": "\u2082",
+    "/twomonospace": "\uFF12",
+    "/twonumeratorbengali": "\u09F5",
+    "/twooldstyle": "\uF732",
+    "/twoparen": "\u2475",
+    "/twoperiod": "\u2489",
+    "/twopersian": "\u06F2",
+    "/tworoman": "\u2171",
+    "/twostroke": "\u01BB",
+    "/twosuperior": "\u00B2",
+    "/twothai": "\u0E52",
+    "/twothirds": "\u2154",
+    "/u": "\u0075",
+    "/uacute": "\u00FA",
+    "/ubar": "\u0289",
+    "/ubengali": "\u0989",
+    "/ubopomofo": "\u3128",
+    "/ubreve": "\u016D",
+    "/ucaron": "\u01D4",
+    "/ucircle": "\u24E4",
+    "/ucircumflex": "\u00FB",
+    "/ucircumflexbelow": "\u1E77",
+    "/ucyrillic": "\u0443",
+    "/udattadeva": "\u0951",
+    "/udblacute": "\u0171",
+    "/udblgrave": "\u0215",
+    "/udeva": "\u0909",
+    "/udieresis": "\u00FC",
+    "/udieresisacute": "\u01D8",
+    "/udieresisbelow": "\u1E73",
+    "/udieresiscaron": "\u01DA",
+    "/udieresiscyrillic": "\u04F1",
+    "/udieresisgrave": "\u01DC",
+    "/udieresismacron": "\u01D6",
+    "/udotbelow": "\u1EE5",
+    "/ugrave": "\u00F9",
+    "/ugujarati": "\u0A89",
+    "/ugurmukhi": "\u0A09",
+    "/uhiragana": "\u3046",
+    "/uhookabove": "\u1EE7",
+    "/uhorn": "\u01B0",
+    "/uhornacute": "\u1EE9",
+    "/uhorndotbelow": "\u1EF1",
+    "/uhorngrave": "\u1EEB",
+    "/uhornhookabove": "\u1EED",
+    "/uhorntilde": "\u1EEF",
+    "/uhungarumlaut": "\u0171",
+    "/uhungarumlautcyrillic": "\u04F3",
+    "/uinvertedbreve": "\u0217",
+    "/ukatakana": "\u30A6",
+    "/ukatakanahalfwidth": "\uFF73",
+    "/ukcyrillic": "\u0479",
+    "/ukorean": "\u315C",
+    "/umacron": "\u016B",
+    "/umacroncyrillic": "\u04EF",
+    "/umacrondieresis": "\u1E7B",
+    "/umatragurmukhi": "\u0A41",
+    "/umonospace": "\uFF55",
+    "/underscore": "\u005F",
+    "/underscoredbl": "\u2017",
+    "/underscoremonospace": "\uFF3F",
+    "/underscorevertical": "\uFE33",
+    "/underscorewavy": "\uFE4F",
+    "/union": "\u222A",
+    "/universal": "\u2200",
+    "/uogonek": "\u0173",
+    "/uparen": "\u24B0",
+    "/upblock": "\u2580",
+    "/upperdothebrew": "\u05C4",
+    "/upsilon": "\u03C5",
+    "/upsilondieresis": "\u03CB",
+    "/upsilondieresistonos": "\u03B0",
+    "/upsilonlatin": "\u028A",
+    "/upsilontonos": "\u03CD",
+    "/uptackbelowcmb": "\u031D",
+    "/uptackmod": "\u02D4",
+    "/uragurmukhi": "\u0A73",
+    "/uring": "\u016F",
+    "/ushortcyrillic": "\u045E",
+    "/usmallhiragana": "\u3045",
+    "/usmallkatakana": "\u30A5",
+    "/usmallkatakanahalfwidth": "\uFF69",
+    "/ustraightcyrillic": "\u04AF",
+    "/ustraightstrokecyrillic": "\u04B1",
+    "/utilde": "\u0169",
+    "/utildeacute": "\u1E79",
+    "/utildebelow": "\u1E75",
+    "/uubengali": "\u098A",
+    "/uudeva": "\u090A",
+    "/uugujarati": "\u0A8A",
+    "/uugurmukhi": "\u0A0A",
+    "/uumatragurmukhi": "\u0A42",
+    "/uuvowelsignbengali": "\u09C2",
+    "/uuvowelsigndeva": "\u0942",
+    "/uuvowelsigngujarati": "\u0AC2",
+    "/uvowelsignbengali": "\u09C1",
+    "/uvowelsigndeva": "\u0941",
+    "/uvowelsigngujarati": "\u0AC1",
+    "/v": "\u0076",
+    "/vadeva": "\u0935",
+    "/vagujarati": "\u0AB5",
+    "/vagurmukhi": "\u0A35",
+    "/vakatakana": "\u30F7",
+    "/vav": "\u05D5",
+    "/vavdagesh": "\uFB35",
+    "/vavdagesh65": "\uFB35",
+    "/vavdageshhebrew": "\uFB35",
+    "/vavhebrew": "\u05D5",
+    "/vavholam": "\uFB4B",
+    "/vavholamhebrew": "\uFB4B",
+    "/vavvavhebrew": "\u05F0",
+    "/vavyodhebrew": "\u05F1",
+    "/vcircle": "\u24E5",
+    "/vdotbelow": "\u1E7F",
+    "/vecyrillic": "\u0432",
+    "/veharabic": "\u06A4",
+    "/vehfinalarabic": "\uFB6B",
+    "/vehinitialarabic": "\uFB6C",
+    "/vehmedialarabic": "\uFB6D",
+    "/vekatakana": "\u30F9",
+    "/venus": "\u2640",
+    "/verticalbar": "\u007C",
+    "/verticallineabovecmb": "\u030D",
+    "/verticallinebelowcmb": "\u0329",
+    "/verticallinelowmod": "\u02CC",
+    "/verticallinemod": "\u02C8",
+    "/vewarmenian": "\u057E",
+    "/vhook": "\u028B",
+    "/vikatakana": "\u30F8",
+    "/viramabengali": "\u09CD",
+    "/viramadeva": "\u094D",
+    "/viramagujarati": "\u0ACD",
+    "/visargabengali": "\u0983",
+    "/visargadeva": "\u0903",
+    "/visargagujarati": "\u0A83",
+    "/vmonospace": "\uFF56",
+    "/voarmenian": "\u0578",
+    "/voicediterationhiragana": "\u309E",
+    "/voicediterationkatakana": "\u30FE",
+    "/voicedmarkkana": "\u309B",
+    "/voicedmarkkanahalfwidth": "\uFF9E",
+    "/vokatakana": "\u30FA",
+    "/vparen": "\u24B1",
+    "/vtilde": "\u1E7D",
+    "/vturned": "\u028C",
+    "/vuhiragana": "\u3094",
+    "/vukatakana": "\u30F4",
+    "/w": "\u0077",
+    "/wacute": "\u1E83",
+    "/waekorean": "\u3159",
+    "/wahiragana": "\u308F",
+    "/wakatakana": "\u30EF",
+    "/wakatakanahalfwidth": "\uFF9C",
+    "/wakorean": "\u3158",
+    "/wasmallhiragana": "\u308E",
+    "/wasmallkatakana": "\u30EE",
+    "/wattosquare": "\u3357",
+    "/wavedash": "\u301C",
+    "/wavyunderscorevertical": "\uFE34",
+    "/wawarabic": "\u0648",
+    "/wawfinalarabic": "\uFEEE",
+    "/wawhamzaabovearabic": "\u0624",
+    "/wawhamzaabovefinalarabic": "\uFE86",
+    "/wbsquare": "\u33DD",
+    "/wcircle": "\u24E6",
+    "/wcircumflex": "\u0175",
+    "/wdieresis": "\u1E85",
+    "/wdotaccent": "\u1E87",
+    "/wdotbelow": "\u1E89",
+    "/wehiragana": "\u3091",
+    "/weierstrass": "\u2118",
+    "/wekatakana": "\u30F1",
+    "/wekorean": "\u315E",
+    "/weokorean": "\u315D",
+    "/wgrave": "\u1E81",
+    "/whitebullet": "\u25E6",
+    "/whitecircle": "\u25CB",
+    "/whitecircleinverse": "\u25D9",
+    "/whitecornerbracketleft": "\u300E",
+    "/whitecornerbracketleftvertical": "\uFE43",
+    "/whitecornerbracketright": "\u300F",
+    "/whitecornerbracketrightvertical": "\uFE44",
+    "/whitediamond": "\u25C7",
+    "/whitediamondcontainingblacksmalldiamond": "\u25C8",
+    "/whitedownpointingsmalltriangle": "\u25BF",
+    "/whitedownpointingtriangle": "\u25BD",
+    "/whiteleftpointingsmalltriangle": "\u25C3",
+    "/whiteleftpointingtriangle": "\u25C1",
+    "/whitelenticularbracketleft": "\u3016",
+    "/whitelenticularbracketright": "\u3017",
+    "/whiterightpointingsmalltriangle": "\u25B9",
+    "/whiterightpointingtriangle": "\u25B7",
+    "/whitesmallsquare": "\u25AB",
+    "/whitesmilingface": "\u263A",
+    "/whitesquare": "\u25A1",
+    "/whitestar": "\u2606",
+    "/whitetelephone": "\u260F",
+    "/whitetortoiseshellbracketleft": "\u3018",
+    "/whitetortoiseshellbracketright": "\u3019",
+    "/whiteuppointingsmalltriangle": "\u25B5",
+    "/whiteuppointingtriangle": "\u25B3",
+    "/wihiragana": "\u3090",
+    "/wikatakana": "\u30F0",
+    "/wikorean": "\u315F",
+    "/wmonospace": "\uFF57",
+    "/wohiragana": "\u3092",
+    "/wokatakana": "\u30F2",
+    "/wokatakanahalfwidth": "\uFF66",
+    "/won": "\u20A9",
+    "/wonmonospace": "\uFFE6",
+    "/wowaenthai": "\u0E27",
+    "/wparen": "\u24B2",
+    "/wring": "\u1E98",
+    "/wsuperior": "\u02B7",
+    "/wturned": "\u028D",
+    "/wynn": "\u01BF",
+    "/x": "\u0078",
+    "/xabovecmb": "\u033D",
+    "/xbopomofo": "\u3112",
+    "/xcircle": "\u24E7",
+    "/xdieresis": "\u1E8D",
+    "/xdotaccent": "\u1E8B",
+    "/xeharmenian": "\u056D",
+    "/xi": "\u03BE",
+    "/xmonospace": "\uFF58",
+    "/xparen": "\u24B3",
+    "/xsuperior": "\u02E3",
+    "/y": "\u0079",
+    "/yaadosquare": "\u334E",
+    "/yabengali": "\u09AF",
+    "/yacute": "\u00FD",
+    "/yadeva": "\u092F",
+    "/yaekorean": "\u3152",
+    "/yagujarati": "\u0AAF",
+    "/yagurmukhi": "\u0A2F",
+    "/yahiragana": "\u3084",
+    "/yakatakana": "\u30E4",
+    "/yakatakanahalfwidth": "\uFF94",
+    "/yakorean": "\u3151",
+    "/yamakkanthai": "\u0E4E",
+    "/yasmallhiragana": "\u3083",
+    "/yasmallkatakana": "\u30E3",
+    "/yasmallkatakanahalfwidth": "\uFF6C",
+    "/yatcyrillic": "\u0463",
+    "/ycircle": "\u24E8",
+    "/ycircumflex": "\u0177",
+    "/ydieresis": "\u00FF",
+    "/ydotaccent": "\u1E8F",
+    "/ydotbelow": "\u1EF5",
+    "/yeharabic": "\u064A",
+    "/yehbarreearabic": "\u06D2",
+    "/yehbarreefinalarabic": "\uFBAF",
+    "/yehfinalarabic": "\uFEF2",
+    "/yehhamzaabovearabic": "\u0626",
+    "/yehhamzaabovefinalarabic": "\uFE8A",
+    "/yehhamzaaboveinitialarabic": "\uFE8B",
+    "/yehhamzaabovemedialarabic": "\uFE8C",
+    "/yehinitialarabic": "\uFEF3",
+    "/yehmedialarabic": "\uFEF4",
+    "/yehmeeminitialarabic": "\uFCDD",
+    "/yehmeemisolatedarabic": "\uFC58",
+    "/yehnoonfinalarabic": "\uFC94",
+    "/yehthreedotsbelowarabic": "\u06D1",
+    "/yekorean": "\u3156",
+    "/yen": "\u00A5",
+    "/yenmonospace": "\uFFE5",
+    "/yeokorean": "\u3155",
+    "/yeorinhieuhkorean": "\u3186",
+    "/yerahbenyomohebrew": "\u05AA",
+    "/yerahbenyomolefthebrew": "\u05AA",
+    "/yericyrillic": "\u044B",
+    "/yerudieresiscyrillic": "\u04F9",
+    "/yesieungkorean": "\u3181",
+    "/yesieungpansioskorean": "\u3183",
+    "/yesieungsioskorean": "\u3182",
+    "/yetivhebrew": "\u059A",
+    "/ygrave": "\u1EF3",
+    "/yhook": "\u01B4",
+    "/yhookabove": "\u1EF7",
+    "/yiarmenian": "\u0575",
+    "/yicyrillic": "\u0457",
+    "/yikorean": "\u3162",
+    "/yinyang": "\u262F",
+    "/yiwnarmenian": "\u0582",
+    "/ymonospace": "\uFF59",
+    "/yod": "\u05D9",
+    "/yoddagesh": "\uFB39",
+    "/yoddageshhebrew": "\uFB39",
+    "/yodhebrew": "\u05D9",
+    "/yodyodhebrew": "\u05F2",
+    "/yodyodpatahhebrew": "\uFB1F",
+    "/yohiragana": "\u3088",
+    "/yoikorean": "\u3189",
+    "/yokatakana": "\u30E8",
+    "/yokatakanahalfwidth": "\uFF96",
+    "/yokorean": "\u315B",
+    "/yosmallhiragana": "\u3087",
+    "/yosmallkatakana": "\u30E7",
+    "/yosmallkatakanahalfwidth": "\uFF6E",
+    "/yotgreek": "\u03F3",
+    "/yoyaekorean": "\u3188",
+    "/yoyakorean": "\u3187",
+    "/yoyakthai": "\u0E22",
+    "/yoyingthai": "\u0E0D",
+    "/yparen": "\u24B4",
+    "/ypogegrammeni": "\u037A",
+    "/ypogegrammenigreekcmb": "\u0345",
+    "/yr": "\u01A6",
+    "/yring": "\u1E99",
+    "/ysuperior": "\u02B8",
+    "/ytilde": "\u1EF9",
+    "/yturned": "\u028E",
+    "/yuhiragana": "\u3086",
+    "/yuikorean": "\u318C",
+    "/yukatakana": "\u30E6",
+    "/yukatakanahalfwidth": "\uFF95",
+    "/yukorean": "\u3160",
+    "/yusbigcyrillic": "\u046B",
+    "/yusbigiotifiedcyrillic": "\u046D",
+    "/yuslittlecyrillic": "\u0467",
+    "/yuslittleiotifiedcyrillic": "\u0469",
+    "/yusmallhiragana": "\u3085",
+    "/yusmallkatakana": "\u30E5",
+    "/yusmallkatakanahalfwidth": "\uFF6D",
+    "/yuyekorean": "\u318B",
+    "/yuyeokorean": "\u318A",
+    "/yyabengali": "\u09DF",
+    "/yyadeva": "\u095F",
+    "/z": "\u007A",
+    "/zaarmenian": "\u0566",
+    "/zacute": "\u017A",
+    "/zadeva": "\u095B",
+    "/zagurmukhi": "\u0A5B",
+    "/zaharabic": "\u0638",
+    "/zahfinalarabic": "\uFEC6",
+    "/zahinitialarabic": "\uFEC7",
+    "/zahiragana": "\u3056",
+    "/zahmedialarabic": "\uFEC8",
+    "/zainarabic": "\u0632",
+    "/zainfinalarabic": "\uFEB0",
+    "/zakatakana": "\u30B6",
+    "/zaqefgadolhebrew": "\u0595",
+    "/zaqefqatanhebrew": "\u0594",
+    "/zarqahebrew": "\u0598",
+    "/zayin": "\u05D6",
+    "/zayindagesh": "\uFB36",
+    "/zayindageshhebrew": "\uFB36",
+    "/zayinhebrew": "\u05D6",
+    "/zbopomofo": "\u3117",
+    "/zcaron": "\u017E",
+    "/zcircle": "\u24E9",
+    "/zcircumflex": "\u1E91",
+    "/zcurl": "\u0291",
+    "/zdot": "\u017C",
+    "/zdotaccent": "\u017C",
+    "/zdotbelow": "\u1E93",
+    "/zecyrillic": "\u0437",
+    "/zedescendercyrillic": "\u0499",
+    "/zedieresiscyrillic": "\u04DF",
+    "/zehiragana": "\u305C",
+    "/zekatakana": "\u30BC",
+    "/zero": "\u0030",
+    "/zeroarabic": "\u0660",
+    "/zerobengali": "\u09E6",
+    "/zerodeva": "\u0966",
+    "/zerogujarati": "\u0AE6",
+    "/zerogurmukhi": "\u0A66",
+    "/zerohackarabic": "\u0660",
+    "/zeroinferior": "\u2080",
+    "/zeromonospace": "\uFF10",
+    "/zerooldstyle": "\uF730",
+    "/zeropersian": "\u06F0",
+    "/zerosuperior": "\u2070",
+    "/zerothai": "\u0E50",
+    "/zerowidthjoiner": "\uFEFF",
+    "/zerowidthnonjoiner": "\u200C",
+    "/zerowidthspace": "\u200B",
+    "/zeta": "\u03B6",
+    "/zhbopomofo": "\u3113",
+    "/zhearmenian": "\u056A",
+    "/zhebrevecyrillic": "\u04C2",
+    "/zhecyrillic": "\u0436",
+    "/zhedescendercyrillic": "\u0497",
+    "/zhedieresiscyrillic": "\u04DD",
+    "/zihiragana": "\u3058",
+    "/zikatakana": "\u30B8",
+    "/zinorhebrew": "\u05AE",
+    "/zlinebelow": "\u1E95",
+    "/zmonospace": "\uFF5A",
+    "/zohiragana": "\u305E",
+    "/zokatakana": "\u30BE",
+    "/zparen": "\u24B5",
+    "/zretroflexhook": "\u0290",
+    "/zstroke": "\u01B6",
+    "/zuhiragana": "\u305A",
+    "/zukatakana": "\u30BA",
+    # glyphNamesToUnicode.txt
+    "/guillemetleft": "\u00AB",
+    "/hyphensoft": "\u00AD",
+    "/two.superior": "\u00B2",
+    "/three.superior": "\u00B3",
+    "/mu.math": "\u00B5",
+    "/one.superior": "\u00B9",
+    "/guillemetright": "\u00BB",
+    "/kra": "\u0138",
+    "/fhook": "\u0192",
+    "/lt:Gamma": "\u0194",
+    "/lt:Iota": "\u0196",
+    "/nlongrightleg": "\u019E",
+    "/Obar": "\u019F",
+    "/lt:Upsilon": "\u01B1",
+    "/Hwair": "\u01F6",
+    "/Wynn": "\u01F7",
+    "/Ngrave": "\u01F8",
+    "/ngrave": "\u01F9",
+    "/Agravedbl": "\u0200",
+    "/agravedbl": "\u0201",
+    "/Egravedbl": "\u0204",
+    "/egravedbl": "\u0205",
+    "/Igravedbl": "\u0208",
+    "/igravedbl": "\u0209",
+    "/Ogravedbl": "\u020C",
+    "/ogravedbl": "\u020D",
+    "/Rgravedbl": "\u0210",
+    "/rgravedbl": "\u0211",
+    "/Ugravedbl": "\u0214",
+    "/ugravedbl": "\u0215",
+    "/Yogh": "\u021C",
+    "/yogh": "\u021D",
+    "/Hcaron": "\u021E",
+    "/hcaron": "\u021F",
+    "/Nlongrightleg": "\u0220",
+    "/dcurl": "\u0221",
+    "/Ou": "\u0222",
+    "/ou": "\u0223",
+    "/Zhook": "\u0224",
+    "/zhook": "\u0225",
+    "/Adot": "\u0226",
+    "/adot": "\u0227",
+    "/Ecedilla": "\u0228",
+    "/ecedilla": "\u0229",
+    "/Odieresismacron": "\u022A",
+    "/odieresismacron": "\u022B",
+    "/Otildemacron": "\u022C",
+    "/otildemacron": "\u022D",
+    "/Odot": "\u022E",
+    "/odot": "\u022F",
+    "/Odotmacron": "\u0230",
+    "/odotmacron": "\u0231",
+    "/Ymacron": "\u0232",
+    "/ymacron": "\u0233",
+    "/lcurl": "\u0234",
+    "/ncurl": "\u0235",
+    "/tcurl": "\u0236",
+    "/dbdigraph": "\u0238",
+    "/qpdigraph": "\u0239",
+    "/Astroke": "\u023A",
+    "/Cstroke": "\u023B",
+    "/cstroke": "\u023C",
+    "/Lbar": "\u023D",
+    "/Twithdiagonalstroke": "\u023E",
+    "/sswashtail": "\u023F",
+    "/zswashtail": "\u0240",
+    "/Glottalstop": "\u0241",
+    "/Bstroke": "\u0243",
+    "/Ubar": "\u0244",
+    "/Vturned": "\u0245",
+    "/Estroke": "\u0246",
+    "/estroke": "\u0247",
+    "/Jstroke": "\u0248",
+    "/jstroke": "\u0249",
+    "/Qsmallhooktail": "\u024A",
+    "/qhooktail": "\u024B",
+    "/Rstroke": "\u024C",
+    "/rstroke": "\u024D",
+    "/Ystroke": "\u024E",
+    "/ystroke": "\u024F",
+    "/ltgr:alpha": "\u0251",
+    "/alphaturned": "\u0252",
+    "/ipa:ereversed": "\u0258",
+    "/dotlessjstroke": "\u025F",
+    "/ipa:gscript": "\u0261",
+    "/ltgr:gamma": "\u0263",
+    "/ltgr:iota": "\u0269",
+    "/ipa:Ismall": "\u026A",
+    "/lretroflex": "\u026D",
+    "/nretroflex": "\u0273",
+    "/omegaclosed": "\u0277",
+    "/ltgr:phi": "\u0278",
+    "/ipa:rtail": "\u027D",
+    "/Rinvertedsmall": "\u0281",
+    "/tretroflex": "\u0288",
+    "/ipa:upsilon": "\u028A",
+    "/zretroflex": "\u0290",
+    "/ipa:glottalstop": "\u0294",
+    "/pharyngealvoicedfricative": "\u0295",
+    "/Cstretched": "\u0297",
+    "/clickbilabial": "\u0298",
+    "/Ghooksmall": "\u029B",
+    "/dzed": "\u02A3",
+    "/dzedcurl": "\u02A5",
+    "/feng": "\u02A9",
+    "/ls": "\u02AA",
+    "/lzed": "\u02AB",
+    "/percussivebilabial": "\u02AC",
+    "/percussivebidental": "\u02AD",
+    "/hfishhookturned": "\u02AE",
+    "/handtailfishhookturned": "\u02AF",
+    "/hsupmod": "\u02B0",
+    "/hhooksupmod": "\u02B1",
+    "/jsupmod": "\u02B2",
+    "/rsupmod": "\u02B3",
+    "/rturnedsupmod": "\u02B4",
+    "/rhookturnedsupmod": "\u02B5",
+    "/Rsupinvertedmod": "\u02B6",
+    "/wsupmod": "\u02B7",
+    "/ysupmod": "\u02B8",
+    "/primedblmod": "\u02BA",
+    "/ringhalfrightmod": "\u02BE",
+    "/ringhalfleftmod": "\u02BF",
+    "/macronmod": "\u02C9",
+    "/acutemod": "\u02CA",
+    "/gravemod": "\u02CB",
+    "/ringhalfrightcentredmod": "\u02D2",
+    "/ringhalfleftcentredmod": "\u02D3",
+    "/tackupmod": "\u02D4",
+    "/tackdownmod": "\u02D5",
+    "/plussignmod": "\u02D6",
+    "/minussignmod": "\u02D7",
+    "/crossmod": "\u02DF",
+    "/gammasupmod": "\u02E0",
+    "/lsupmod": "\u02E1",
+    "/ssupmod": "\u02E2",
+    "/xsupmod": "\u02E3",
+    "/glottalstopsupreversedmod": "\u02E4",
+    "/yintonemod": "\u02EA",
+    "/yangtonemod": "\u02EB",
+    "/voicingmod": "\u02EC",
+    "/unaspiratedmod": "\u02ED",
+    "/apostrophedblmod": "\u02EE",
+    "/arrowheaddownlowmod": "\u02EF",
+    "/arrowheaduplowmod": "\u02F0",
+    "/arrowheadleftlowmod": "\u02F1",
+    "/arrowheadrightlowmod": "\u02F2",
+    "/ringlowmod": "\u02F3",
+    "/gravemiddlemod": "\u02F4",
+    "/gravedblmiddlemod": "\u02F5",
+    "/acutedblmiddlemod": "\u02F6",
+    "/tildelowmod": "\u02F7",
+    "/colonraisedmod": "\u02F8",
+    "/tonehighbeginmod": "\u02F9",
+    "/tonehighendmod": "\u02FA",
+    "/tonelowbeginmod": "\u02FB",
+    "/tonelowendmod": "\u02FC",
+    "/shelfmod": "\u02FD",
+    "/shelfopenmod": "\u02FE",
+    "/arrowleftlowmod": "\u02FF",
+    "/hookabovecmb": "\u0309",
+    "/ringabovecmb": "\u030A",
+    "/gravedoublecmb": "\u030F",
+    "/invertedbrevecmb": "\u0311",
+    "/turnedabovecmb": "\u0313",
+    "/reversedcommaabovecmb": "\u0314",
+    "/turnedcommaabovecmb": "\u0315",
+    "/halfleftringbelowcmb": "\u031C",
+    "/palatalizedhookbelowcmb": "\u0321",
+    "/retroflexhookbelowcmb": "\u0322",
+    "/commaaccentbelowcmb": "\u0326",
+    "/belowbrevecmb": "\u032E",
+    "/invertedbelowbrevecmb": "\u032F",
+    "/lowlinedoublecmb": "\u0333",
+    "/overlaystrokeshortcmb": "\u0335",
+    "/overlaystrokelongcmb": "\u0336",
+    "/halfrightringbelowcmb": "\u0339",
+    "/invertedbridgebelowcmb": "\u033A",
+    "/perispomenicmb": "\u0342",
+    "/iotasubcmb": "\u0345",
+    "/bridgeabovecmb": "\u0346",
+    "/equalbelowcmb": "\u0347",
+    "/dblverticallinebelowcmb": "\u0348",
+    "/leftanglebelowcmb": "\u0349",
+    "/nottildeabovecmb": "\u034A",
+    "/homotheticabovecmb": "\u034B",
+    "/almostequalabovecmb": "\u034C",
+    "/arrowleftrightbelowcmb": "\u034D",
+    "/arrowupbelowcmb": "\u034E",
+    "/graphemejoinercmb": "\u034F",
+    "/arrowheadrightabovecmb": "\u0350",
+    "/halfleftringabovecmb": "\u0351",
+    "/fermatacmb": "\u0352",
+    "/xbelowcmb": "\u0353",
+    "/arrowheadleftbelowcmb": "\u0354",
+    "/arrowheadrightbelowcmb": "\u0355",
+    "/arrowheadrightarrowheadupbelowcmb": "\u0356",
+    "/halfrightringabovecmb": "\u0357",
+    "/dotrightabovecmb": "\u0358",
+    "/asteriskbelowcmb": "\u0359",
+    "/doubleringbelowcmb": "\u035A",
+    "/zigzagabovecmb": "\u035B",
+    "/doublebelowbrevecmb": "\u035C",
+    "/doublebrevecmb": "\u035D",
+    "/macrondoublecmb": "\u035E",
+    "/macrondoublebelowcmb": "\u035F",
+    "/inverteddoublebrevecmb": "\u0361",
+    "/arrowrightdoublebelowcmb": "\u0362",
+    "/acmb": "\u0363",
+    "/ecmb": "\u0364",
+    "/icmb": "\u0365",
+    "/ocmb": "\u0366",
+    "/ucmb": "\u0367",
+    "/ccmb": "\u0368",
+    "/dcmb": "\u0369",
+    "/hcmb": "\u036A",
+    "/mcmb": "\u036B",
+    "/rcmb": "\u036C",
+    "/tcmb": "\u036D",
+    "/vcmb": "\u036E",
+    "/xcmb": "\u036F",
+    "/Heta": "\u0370",
+    "/heta": "\u0371",
+    "/Sampiarchaic": "\u0372",
+    "/sampiarchaic": "\u0373",
+    "/numeralsign": "\u0374",
+    "/lownumeralsign": "\u0375",
+    "/Digammapamphylian": "\u0376",
+    "/digammapamphylian": "\u0377",
+    "/iotasub": "\u037A",
+    "/sigmalunatereversedsymbol": "\u037B",
+    "/sigmalunatedottedsymbol": "\u037C",
+    "/sigmalunatedottedreversedsymbol": "\u037D",
+    "/gr:question": "\u037E",
+    "/Yot": "\u037F",
+    "/finalsigma": "\u03C2",
+    "/Kaisymbol": "\u03CF",
+    "/betasymbol": "\u03D0",
+    "/theta.math": "\u03D1",
+    "/Upsilonacutehooksymbol": "\u03D3",
+    "/Upsilonadieresishooksymbol": "\u03D4",
+    "/phi.math": "\u03D5",
+    "/pi.math": "\u03D6",
+    "/kaisymbol": "\u03D7",
+    "/Koppaarchaic": "\u03D8",
+    "/koppaarchaic": "\u03D9",
+    "/Stigma": "\u03DA",
+    "/stigma": "\u03DB",
+    "/Digamma": "\u03DC",
+    "/digamma": "\u03DD",
+    "/Koppa": "\u03DE",
+    "/koppa": "\u03DF",
+    "/Sampi": "\u03E0",
+    "/sampi": "\u03E1",
+    "/kappa.math": "\u03F0",
+    "/rhosymbol": "\u03F1",
+    "/sigmalunatesymbol": "\u03F2",
+    "/yot": "\u03F3",
+    "/Thetasymbol": "\u03F4",
+    "/epsilonlunatesymbol": "\u03F5",
+    "/epsilonreversedlunatesymbol": "\u03F6",
+    "/Sho": "\u03F7",
+    "/sho": "\u03F8",
+    "/Sigmalunatesymbol": "\u03F9",
+    "/San": "\u03FA",
+    "/san": "\u03FB",
+    "/rhostrokesymbol": "\u03FC",
+    "/Sigmareversedlunatesymbol": "\u03FD",
+    "/Sigmalunatesymboldotted": "\u03FE",
+    "/Reverseddottedsigmalunatesymbol": "\u03FF",
+    "/Iegravecyr": "\u0400",
+    "/Iocyr": "\u0401",
+    "/Djecyr": "\u0402",
+    "/Gjecyr": "\u0403",
+    "/Eukrcyr": "\u0404",
+    "/Dzecyr": "\u0405",
+    "/Iukrcyr": "\u0406",
+    "/Yukrcyr": "\u0407",
+    "/Jecyr": "\u0408",
+    "/Ljecyr": "\u0409",
+    "/Njecyr": "\u040A",
+    "/Tshecyr": "\u040B",
+    "/Kjecyr": "\u040C",
+    "/Igravecyr": "\u040D",
+    "/Ushortcyr": "\u040E",
+    "/Dzhecyr": "\u040F",
+    "/Acyr": "\u0410",
+    "/Becyr": "\u0411",
+    "/Vecyr": "\u0412",
+    "/Gecyr": "\u0413",
+    "/Decyr": "\u0414",
+    "/Iecyr": "\u0415",
+    "/Zhecyr": "\u0416",
+    "/Zecyr": "\u0417",
+    "/Icyr": "\u0418",
+    "/Ishortcyr": "\u0419",
+    "/Kacyr": "\u041A",
+    "/Elcyr": "\u041B",
+    "/Emcyr": "\u041C",
+    "/Encyr": "\u041D",
+    "/Ocyr": "\u041E",
+    "/Pecyr": "\u041F",
+    "/Ercyr": "\u0420",
+    "/Escyr": "\u0421",
+    "/Tecyr": "\u0422",
+    "/Ucyr": "\u0423",
+    "/Efcyr": "\u0424",
+    "/Hacyr": "\u0425",
+    "/Tsecyr": "\u0426",
+    "/Checyr": "\u0427",
+    "/Shacyr": "\u0428",
+    "/Shchacyr": "\u0429",
+    "/Hardcyr": "\u042A",
+    "/Ylongcyr": "\u042B",
+    "/Softcyr": "\u042C",
+    "/Ereversedcyr": "\u042D",
+    "/Yucyr": "\u042E",
+    "/Yacyr": "\u042F",
+    "/acyr": "\u0430",
+    "/becyr": "\u0431",
+    "/vecyr": "\u0432",
+    "/gecyr": "\u0433",
+    "/decyr": "\u0434",
+    "/iecyr": "\u0435",
+    "/zhecyr": "\u0436",
+    "/zecyr": "\u0437",
+    "/icyr": "\u0438",
+    "/ishortcyr": "\u0439",
+    "/kacyr": "\u043A",
+    "/elcyr": "\u043B",
+    "/emcyr": "\u043C",
+    "/encyr": "\u043D",
+    "/ocyr": "\u043E",
+    "/pecyr": "\u043F",
+    "/ercyr": "\u0440",
+    "/escyr": "\u0441",
+    "/tecyr": "\u0442",
+    "/ucyr": "\u0443",
+    "/efcyr": "\u0444",
+    "/hacyr": "\u0445",
+    "/tsecyr": "\u0446",
+    "/checyr": "\u0447",
+    "/shacyr": "\u0448",
+    "/shchacyr": "\u0449",
+    "/hardcyr": "\u044A",
+    "/ylongcyr": "\u044B",
+    "/softcyr": "\u044C",
+    "/ereversedcyr": "\u044D",
+    "/yucyr": "\u044E",
+    "/yacyr": "\u044F",
+    "/iegravecyr": "\u0450",
+    "/iocyr": "\u0451",
+    "/djecyr": "\u0452",
+    "/gjecyr": "\u0453",
+    "/eukrcyr": "\u0454",
+    "/dzecyr": "\u0455",
+    "/iukrcyr": "\u0456",
+    "/yukrcyr": "\u0457",
+    "/jecyr": "\u0458",
+    "/ljecyr": "\u0459",
+    "/njecyr": "\u045A",
+    "/tshecyr": "\u045B",
+    "/kjecyr": "\u045C",
+    "/igravecyr": "\u045D",
+    "/ushortcyr": "\u045E",
+    "/dzhecyr": "\u045F",
+    "/Omegacyr": "\u0460",
+    "/omegacyr": "\u0461",
+    "/Yatcyr": "\u0462",
+    "/yatcyr": "\u0463",
+    "/Eiotifiedcyr": "\u0464",
+    "/eiotifiedcyr": "\u0465",
+    "/Yuslittlecyr": "\u0466",
+    "/yuslittlecyr": "\u0467",
+    "/Yuslittleiotifiedcyr": "\u0468",
+    "/yuslittleiotifiedcyr": "\u0469",
+    "/Yusbigcyr": "\u046A",
+    "/yusbigcyr": "\u046B",
+    "/Yusbigiotifiedcyr": "\u046C",
+    "/yusbigiotifiedcyr": "\u046D",
+    "/Ksicyr": "\u046E",
+    "/ksicyr": "\u046F",
+    "/Psicyr": "\u0470",
+    "/psicyr": "\u0471",
+    "/Fitacyr": "\u0472",
+    "/fitacyr": "\u0473",
+    "/Izhitsacyr": "\u0474",
+    "/izhitsacyr": "\u0475",
+    "/Izhitsagravedblcyr": "\u0476",
+    "/izhitsagravedblcyr": "\u0477",
+    "/Ukcyr": "\u0478",
+    "/ukcyr": "\u0479",
+    "/Omegaroundcyr": "\u047A",
+    "/omegaroundcyr": "\u047B",
+    "/Omegatitlocyr": "\u047C",
+    "/omegatitlocyr": "\u047D",
+    "/Otcyr": "\u047E",
+    "/otcyr": "\u047F",
+    "/Koppacyr": "\u0480",
+    "/koppacyr": "\u0481",
+    "/thousandscyr": "\u0482",
+    "/titlocmbcyr": "\u0483",
+    "/palatcmbcyr": "\u0484",
+    "/dasiacmbcyr": "\u0485",
+    "/psilicmbcyr": "\u0486",
+    "/pokrytiecmbcyr": "\u0487",
+    "/hundredthousandscmbcyr": "\u0488",
+    "/millionscmbcyr": "\u0489",
+    "/Ishortsharptailcyr": "\u048A",
+    "/ishortsharptailcyr": "\u048B",
+    "/Semisoftcyr": "\u048C",
+    "/semisoftcyr": "\u048D",
+    "/Ertickcyr": "\u048E",
+    "/ertickcyr": "\u048F",
+    "/Geupcyr": "\u0490",
+    "/geupcyr": "\u0491",
+    "/Gestrokecyr": "\u0492",
+    "/gestrokecyr": "\u0493",
+    "/Gehookcyr": "\u0494",
+    "/gehookcyr": "\u0495",
+    "/Zhetailcyr": "\u0496",
+    "/zhetailcyr": "\u0497",
+    "/Zetailcyr": "\u0498",
+    "/zetailcyr": "\u0499",
+    "/Katailcyr": "\u049A",
+    "/katailcyr": "\u049B",
+    "/Kaverticalstrokecyr": "\u049C",
+    "/kaverticalstrokecyr": "\u049D",
+    "/Kastrokecyr": "\u049E",
+    "/kastrokecyr": "\u049F",
+    "/Kabashkcyr": "\u04A0",
+    "/kabashkcyr": "\u04A1",
+    "/Entailcyr": "\u04A2",
+    "/entailcyr": "\u04A3",
+    "/Engecyr": "\u04A4",
+    "/engecyr": "\u04A5",
+    "/Pehookcyr": "\u04A6",
+    "/pehookcyr": "\u04A7",
+    "/Haabkhcyr": "\u04A8",
+    "/haabkhcyr": "\u04A9",
+    "/Estailcyr": "\u04AA",
+    "/estailcyr": "\u04AB",
+    "/Tetailcyr": "\u04AC",
+    "/tetailcyr": "\u04AD",
+    "/Ustraightcyr": "\u04AE",
+    "/ustraightcyr": "\u04AF",
+    "/Ustraightstrokecyr": "\u04B0",
+    "/ustraightstrokecyr": "\u04B1",
+    "/Xatailcyr": "\u04B2",
+    "/xatailcyr": "\u04B3",
+    "/Tetsecyr": "\u04B4",
+    "/tetsecyr": "\u04B5",
+    "/Chetailcyr": "\u04B6",
+    "/chetailcyr": "\u04B7",
+    "/Chevertcyr": "\u04B8",
+    "/chevertcyr": "\u04B9",
+    "/Shhacyr": "\u04BA",
+    "/shhacyr": "\u04BB",
+    "/Cheabkhcyr": "\u04BC",
+    "/cheabkhcyr": "\u04BD",
+    "/Cheabkhtailcyr": "\u04BE",
+    "/cheabkhtailcyr": "\u04BF",
+    "/Palochkacyr": "\u04C0",
+    "/Zhebrevecyr": "\u04C1",
+    "/zhebrevecyr": "\u04C2",
+    "/Kahookcyr": "\u04C3",
+    "/kahookcyr": "\u04C4",
+    "/Elsharptailcyr": "\u04C5",
+    "/elsharptailcyr": "\u04C6",
+    "/Enhookcyr": "\u04C7",
+    "/enhookcyr": "\u04C8",
+    "/Ensharptailcyr": "\u04C9",
+    "/ensharptailcyr": "\u04CA",
+    "/Chekhakascyr": "\u04CB",
+    "/chekhakascyr": "\u04CC",
+    "/Emsharptailcyr": "\u04CD",
+    "/emsharptailcyr": "\u04CE",
+    "/palochkacyr": "\u04CF",
+    "/Abrevecyr": "\u04D0",
+    "/abrevecyr": "\u04D1",
+    "/Adieresiscyr": "\u04D2",
+    "/adieresiscyr": "\u04D3",
+    "/Aiecyr": "\u04D4",
+    "/aiecyr": "\u04D5",
+    "/Iebrevecyr": "\u04D6",
+    "/iebrevecyr": "\u04D7",
+    "/Schwacyr": "\u04D8",
+    "/schwacyr": "\u04D9",
+    "/Schwadieresiscyr": "\u04DA",
+    "/schwadieresiscyr": "\u04DB",
+    "/Zhedieresiscyr": "\u04DC",
+    "/zhedieresiscyr": "\u04DD",
+    "/Zedieresiscyr": "\u04DE",
+    "/zedieresiscyr": "\u04DF",
+    "/Dzeabkhcyr": "\u04E0",
+    "/dzeabkhcyr": "\u04E1",
+    "/Imacroncyr": "\u04E2",
+    "/imacroncyr": "\u04E3",
+    "/Idieresiscyr": "\u04E4",
+    "/idieresiscyr": "\u04E5",
+    "/Odieresiscyr": "\u04E6",
+    "/odieresiscyr": "\u04E7",
+    "/Obarcyr": "\u04E8",
+    "/obarcyr": "\u04E9",
+    "/Obardieresiscyr": "\u04EA",
+    "/obardieresiscyr": "\u04EB",
+    "/Ereverseddieresiscyr": "\u04EC",
+    "/ereverseddieresiscyr": "\u04ED",
+    "/Umacroncyr": "\u04EE",
+    "/umacroncyr": "\u04EF",
+    "/Udieresiscyr": "\u04F0",
+    "/udieresiscyr": "\u04F1",
+    "/Uacutedblcyr": "\u04F2",
+    "/uacutedblcyr": "\u04F3",
+    "/Chedieresiscyr": "\u04F4",
+    "/chedieresiscyr": "\u04F5",
+    "/Getailcyr": "\u04F6",
+    "/getailcyr": "\u04F7",
+    "/Ylongdieresiscyr": "\u04F8",
+    "/ylongdieresiscyr": "\u04F9",
+    "/Gehookstrokecyr": "\u04FA",
+    "/gehookstrokecyr": "\u04FB",
+    "/Hahookcyr": "\u04FC",
+    "/hahookcyr": "\u04FD",
+    "/Hastrokecyr": "\u04FE",
+    "/hastrokecyr": "\u04FF",
+    "/Dekomicyr": "\u0500",
+    "/dekomicyr": "\u0501",
+    "/Djekomicyr": "\u0502",
+    "/djekomicyr": "\u0503",
+    "/Zjekomicyr": "\u0504",
+    "/zjekomicyr": "\u0505",
+    "/Dzjekomicyr": "\u0506",
+    "/dzjekomicyr": "\u0507",
+    "/Ljekomicyr": "\u0508",
+    "/ljekomicyr": "\u0509",
+    "/Njekomicyr": "\u050A",
+    "/njekomicyr": "\u050B",
+    "/Sjekomicyr": "\u050C",
+    "/sjekomicyr": "\u050D",
+    "/Tjekomicyr": "\u050E",
+    "/tjekomicyr": "\u050F",
+    "/Reversedzecyr": "\u0510",
+    "/reversedzecyr": "\u0511",
+    "/Elhookcyr": "\u0512",
+    "/elhookcyr": "\u0513",
+    "/Lhacyr": "\u0514",
+    "/lhacyr": "\u0515",
+    "/Rhacyr": "\u0516",
+    "/rhacyr": "\u0517",
+    "/Yaecyr": "\u0518",
+    "/yaecyr": "\u0519",
+    "/Qacyr": "\u051A",
+    "/qacyr": "\u051B",
+    "/Wecyr": "\u051C",
+    "/wecyr": "\u051D",
+    "/Kaaleutcyr": "\u051E",
+    "/kaaleutcyr": "\u051F",
+    "/Elmiddlehookcyr": "\u0520",
+    "/elmiddlehookcyr": "\u0521",
+    "/Enmiddlehookcyr": "\u0522",
+    "/enmiddlehookcyr": "\u0523",
+    "/Petailcyr": "\u0524",
+    "/petailcyr": "\u0525",
+    "/Shhatailcyr": "\u0526",
+    "/shhatailcyr": "\u0527",
+    "/Enhookleftcyr": "\u0528",
+    "/enhookleftcyr": "\u0529",
+    "/Dzzhecyr": "\u052A",
+    "/dzzhecyr": "\u052B",
+    "/Dchecyr": "\u052C",
+    "/dchecyr": "\u052D",
+    "/Eltailcyr": "\u052E",
+    "/eltailcyr": "\u052F",
+    "/Aybarmn": "\u0531",
+    "/Benarmn": "\u0532",
+    "/Gimarmn": "\u0533",
+    "/Daarmn": "\u0534",
+    "/Echarmn": "\u0535",
+    "/Zaarmn": "\u0536",
+    "/Eharmn": "\u0537",
+    "/Etarmn": "\u0538",
+    "/Toarmn": "\u0539",
+    "/Zhearmn": "\u053A",
+    "/Iniarmn": "\u053B",
+    "/Liwnarmn": "\u053C",
+    "/Xeharmn": "\u053D",
+    "/Caarmn": "\u053E",
+    "/Kenarmn": "\u053F",
+    "/Hoarmn": "\u0540",
+    "/Jaarmn": "\u0541",
+    "/Ghadarmn": "\u0542",
+    "/Cheharmn": "\u0543",
+    "/Menarmn": "\u0544",
+    "/Yiarmn": "\u0545",
+    "/Nowarmn": "\u0546",
+    "/Shaarmn": "\u0547",
+    "/Voarmn": "\u0548",
+    "/Chaarmn": "\u0549",
+    "/Peharmn": "\u054A",
+    "/Jheharmn": "\u054B",
+    "/Raarmn": "\u054C",
+    "/Seharmn": "\u054D",
+    "/Vewarmn": "\u054E",
+    "/Tiwnarmn": "\u054F",
+    "/Reharmn": "\u0550",
+    "/Coarmn": "\u0551",
+    "/Yiwnarmn": "\u0552",
+    "/Piwrarmn": "\u0553",
+    "/Keharmn": "\u0554",
+    "/Oharmn": "\u0555",
+    "/Feharmn": "\u0556",
+    "/ringhalfleftarmn": "\u0559",
+    "/apostrophearmn": "\u055A",
+    "/emphasismarkarmn": "\u055B",
+    "/exclamarmn": "\u055C",
+    "/commaarmn": "\u055D",
+    "/questionarmn": "\u055E",
+    "/abbreviationmarkarmn": "\u055F",
+    "/turnedaybarmn": "\u0560",
+    "/aybarmn": "\u0561",
+    "/benarmn": "\u0562",
+    "/gimarmn": "\u0563",
+    "/daarmn": "\u0564",
+    "/echarmn": "\u0565",
+    "/zaarmn": "\u0566",
+    "/eharmn": "\u0567",
+    "/etarmn": "\u0568",
+    "/toarmn": "\u0569",
+    "/zhearmn": "\u056A",
+    "/iniarmn": "\u056B",
+    "/liwnarmn": "\u056C",
+    "/xeharmn": "\u056D",
+    "/caarmn": "\u056E",
+    "/kenarmn": "\u056F",
+    "/hoarmn": "\u0570",
+    "/jaarmn": "\u0571",
+    "/ghadarmn": "\u0572",
+    "/cheharmn": "\u0573",
+    "/menarmn": "\u0574",
+    "/yiarmn": "\u0575",
+    "/nowarmn": "\u0576",
+    "/shaarmn": "\u0577",
+    "/voarmn": "\u0578",
+    "/chaarmn": "\u0579",
+    "/peharmn": "\u057A",
+    "/jheharmn": "\u057B",
+    "/raarmn": "\u057C",
+    "/seharmn": "\u057D",
+    "/vewarmn": "\u057E",
+    "/tiwnarmn": "\u057F",
+    "/reharmn": "\u0580",
+    "/coarmn": "\u0581",
+    "/yiwnarmn": "\u0582",
+    "/piwrarmn": "\u0583",
+    "/keharmn": "\u0584",
+    "/oharmn": "\u0585",
+    "/feharmn": "\u0586",
+    "/ech_yiwnarmn": "\u0587",
+    "/yiwithstrokearmn": "\u0588",
+    "/periodarmn": "\u0589",
+    "/hyphenarmn": "\u058A",
+    "/rightfacingeternitysignarmn": "\u058D",
+    "/leftfacingeternitysignarmn": "\u058E",
+    "/dramsignarmn": "\u058F",
+    "/etnahta:hb": "\u0591",
+    "/segolta:hb": "\u0592",
+    "/shalshelet:hb": "\u0593",
+    "/zaqefQatan:hb": "\u0594",
+    "/zaqefGadol:hb": "\u0595",
+    "/tifcha:hb": "\u0596",
+    "/revia:hb": "\u0597",
+    "/zarqa:hb": "\u0598",
+    "/pashta:hb": "\u0599",
+    "/yetiv:hb": "\u059A",
+    "/tevir:hb": "\u059B",
+    "/azla:hb": "\u059C",
+    "/gereshMuqdam:hb": "\u059D",
+    "/SheneGerishin:hb": "\u059E",
+    "/qarneFarah:hb": "\u059F",
+    "/telishaGedolah:hb": "\u05A0",
+    "/pazer:hb": "\u05A1",
+    "/atnachHafukh:hb": "\u05A2",
+    "/munach:hb": "\u05A3",
+    "/mahpach:hb": "\u05A4",
+    "/mercha:hb": "\u05A5",
+    "/merchaKefulah:hb": "\u05A6",
+    "/darga:hb": "\u05A7",
+    "/qadma:hb": "\u05A8",
+    "/telishaQetannah:hb": "\u05A9",
+    "/yerachBenYomo:hb": "\u05AA",
+    "/ole:hb": "\u05AB",
+    "/iluy:hb": "\u05AC",
+    "/dehi:hb": "\u05AD",
+    "/tsinnorit:hb": "\u05AE",
+    "/masoraCircle:hb": "\u05AF",
+    "/sheva:hb": "\u05B0",
+    "/hatafSegol:hb": "\u05B1",
+    "/hatafPatah:hb": "\u05B2",
+    "/hatafQamats:hb": "\u05B3",
+    "/hiriq:hb": "\u05B4",
+    "/tsere:hb": "\u05B5",
+    "/segol:hb": "\u05B6",
+    "/patah:hb": "\u05B7",
+    "/qamats:hb": "\u05B8",
+    "/holam:hb": "\u05B9",
+    "/holamHaser:hb": "\u05BA",
+    "/qubuts:hb": "\u05BB",
+    "/dagesh:hb": "\u05BC",
+    "/meteg:hb": "\u05BD",
+    "/maqaf:hb": "\u05BE",
+    "/rafe:hb": "\u05BF",
+    "/paseq:hb": "\u05C0",
+    "/shinDot:hb": "\u05C1",
+    "/sinDot:hb": "\u05C2",
+    "/sofPasuq:hb": "\u05C3",
+    "/dotupper:hb": "\u05C4",
+    "/dotlower:hb": "\u05C5",
+    "/nunHafukha:hb": "\u05C6",
+    "/qamatsQatan:hb": "\u05C7",
+    "/alef:hb": "\u05D0",
+    "/bet:hb": "\u05D1",
+    "/gimel:hb": "\u05D2",
+    "/dalet:hb": "\u05D3",
+    "/he:hb": "\u05D4",
+    "/vav:hb": "\u05D5",
+    "/zayin:hb": "\u05D6",
+    "/het:hb": "\u05D7",
+    "/tet:hb": "\u05D8",
+    "/yod:hb": "\u05D9",
+    "/finalkaf:hb": "\u05DA",
+    "/kaf:hb": "\u05DB",
+    "/lamed:hb": "\u05DC",
+    "/finalmem:hb": "\u05DD",
+    "/mem:hb": "\u05DE",
+    "/finalnun:hb": "\u05DF",
+    "/nun:hb": "\u05E0",
+    "/samekh:hb": "\u05E1",
+    "/ayin:hb": "\u05E2",
+    "/finalpe:hb": "\u05E3",
+    "/pe:hb": "\u05E4",
+    "/finaltsadi:hb": "\u05E5",
+    "/tsadi:hb": "\u05E6",
+    "/qof:hb": "\u05E7",
+    "/resh:hb": "\u05E8",
+    "/shin:hb": "\u05E9",
+    "/tav:hb": "\u05EA",
+    "/yodtriangle:hb": "\u05EF",
+    "/vav_vav:hb": "\u05F0",
+    "/vav_yod:hb": "\u05F1",
+    "/yod_yod:hb": "\u05F2",
+    "/geresh:hb": "\u05F3",
+    "/gershayim:hb": "\u05F4",
+    "/arnumbersign": "\u0600",
+    "/Sanah": "\u0601",
+    "/footnote": "\u0602",
+    "/Safha": "\u0603",
+    "/samvat": "\u0604",
+    "/numbermarkabove": "\u0605",
+    "/arcuberoot": "\u0606",
+    "/arfourthroot": "\u0607",
+    "/ray": "\u0608",
+    "/permille": "\u0609",
+    "/arperthousand": "\u060A",
+    "/afghani": "\u060B",
+    "/arcomma": "\u060C",
+    "/dateseparator": "\u060D",
+    "/poeticverse": "\u060E",
+    "/misra": "\u060F",
+    "/HonSAW": "\u0610",
+    "/HonAA": "\u0611",
+    "/HonRA": "\u0612",
+    "/aHonRAA": "\u0613",
+    "/takhallus": "\u0614",
+    "/tahabove": "\u0615",
+    "/alefLamYehabove": "\u0616",
+    "/zainabove": "\u0617",
+    "/fathasmall": "\u0618",
+    "/dammasmall": "\u0619",
+    "/kasrasmall": "\u061A",
+    "/arsemicolon": "\u061B",
+    "/mark": "\u061C",
+    "/endoftextmark": "\u061D",
+    "/tripledot": "\u061E",
+    "/arquestion": "\u061F",
+    "/kashmiriyeh": "\u0620",
+    "/hamza": "\u0621",
+    "/alefmadda": "\u0622",
+    "/alefhamza": "\u0623",
+    "/wawhamza": "\u0624",
+    "/alefhamzabelow": "\u0625",
+    "/yehhamza": "\u0626",
+    "/beh": "\u0628",
+    "/tehmarbuta": "\u0629",
+    "/teh": "\u062A",
+    "/theh": "\u062B",
+    "/jeem": "\u062C",
+    "/hah": "\u062D",
+    "/khah": "\u062E",
+    "/dal": "\u062F",
+    "/thal": "\u0630",
+    "/reh": "\u0631",
+    "/zain": "\u0632",
+    "/seen": "\u0633",
+    "/sheen": "\u0634",
+    "/sad": "\u0635",
+    "/dad": "\u0636",
+    "/tah": "\u0637",
+    "/zah": "\u0638",
+    "/ain": "\u0639",
+    "/ghain": "\u063A",
+    "/kehehtwodotsabove": "\u063B",
+    "/kehehthreedotsbelow": "\u063C",
+    "/yehfarsiinvertedV": "\u063D",
+    "/yehfarsitwodotsabove": "\u063E",
+    "/yehfarsithreedotsabove": "\u063F",
+    "/kashida": "\u0640",
+    "/feh": "\u0641",
+    "/qaf": "\u0642",
+    "/lam": "\u0644",
+    "/meem": "\u0645",
+    "/noon": "\u0646",
+    "/heh": "\u0647",
+    "/waw": "\u0648",
+    "/alefmaksura": "\u0649",
+    "/yeh": "\u064A",
+    "/fathatan": "\u064B",
+    "/dammatan": "\u064C",
+    "/kasratan": "\u064D",
+    "/fatha": "\u064E",
+    "/damma": "\u064F",
+    "/kasra": "\u0650",
+    "/shadda": "\u0651",
+    "/sukun": "\u0652",
+    "/madda": "\u0653",
+    "/hamzaabove": "\u0654",
+    "/hamzabelow": "\u0655",
+    "/subscriptalef": "\u0656",
+    "/inverteddamma": "\u0657",
+    "/marknoonghunna": "\u0658",
+    "/zwarakay": "\u0659",
+    "/vowelVabove": "\u065A",
+    "/vowelinvertedVabove": "\u065B",
+    "/voweldotbelow": "\u065C",
+    "/dammareversed": "\u065D",
+    "/fathatwodotsdots": "\u065E",
+    "/wavyhamzabelow": "\u065F",
+    "/arzero": "\u0660",
+    "/arone": "\u0661",
+    "/artwo": "\u0662",
+    "/arthree": "\u0663",
+    "/arfour": "\u0664",
+    "/arfive": "\u0665",
+    "/arsix": "\u0666",
+    "/arseven": "\u0667",
+    "/areight": "\u0668",
+    "/arnine": "\u0669",
+    "/arpercent": "\u066A",
+    "/ardecimalseparator": "\u066B",
+    "/thousandsseparator": "\u066C",
+    "/fivepointedstar": "\u066D",
+    "/dotlessbeh": "\u066E",
+    "/dotlessqaf": "\u066F",
+    "/alefabove": "\u0670",
+    "/alefwasla": "\u0671",
+    "/alefwavyhamza": "\u0672",
+    "/alefwavyhamzabelow": "\u0673",
+    "/highhamza": "\u0674",
+    "/alefhighhamza": "\u0675",
+    "/wawhighhamza": "\u0676",
+    "/uhamza": "\u0677",
+    "/yehhighhamza": "\u0678",
+    "/tteh": "\u0679",
+    "/tteheh": "\u067A",
+    "/beeh": "\u067B",
+    "/tehring": "\u067C",
+    "/tehdownthreedotsabove": "\u067D",
+    "/peh": "\u067E",
+    "/teheh": "\u067F",
+    "/beheh": "\u0680",
+    "/hahhamza": "\u0681",
+    "/hahtwodotsvertical": "\u0682",
+    "/nyeh": "\u0683",
+    "/dyeh": "\u0684",
+    "/hahthreedotsabove": "\u0685",
+    "/tcheh": "\u0686",
+    "/tcheheh": "\u0687",
+    "/ddal": "\u0688",
+    "/dalring": "\u0689",
+    "/daldotbelow": "\u068A",
+    "/daldotbelowtahsmall": "\u068B",
+    "/dahal": "\u068C",
+    "/ddahal": "\u068D",
+    "/dul": "\u068E",
+    "/daldownthreedotsabove": "\u068F",
+    "/dalfourdotsabove": "\u0690",
+    "/rreh": "\u0691",
+    "/rehVabove": "\u0692",
+    "/rehring": "\u0693",
+    "/rehdotbelow": "\u0694",
+    "/rehVbelow": "\u0695",
+    "/rehdotbelowdotabove": "\u0696",
+    "/rehtwodotsabove": "\u0697",
+    "/jeh": "\u0698",
+    "/rehfourdotsabove": "\u0699",
+    "/seendotbelowdotabove": "\u069A",
+    "/seenthreedotsbelow": "\u069B",
+    "/seenthreedotsbelowthreedotsabove": "\u069C",
+    "/sadtwodotsbelow": "\u069D",
+    "/sadthreedotsabove": "\u069E",
+    "/tahthreedotsabove": "\u069F",
+    "/ainthreedotsabove": "\u06A0",
+    "/dotlessfeh": "\u06A1",
+    "/fehdotbelowright": "\u06A2",
+    "/fehdotbelow": "\u06A3",
+    "/veh": "\u06A4",
+    "/fehthreedotsbelow": "\u06A5",
+    "/peheh": "\u06A6",
+    "/qafdotabove": "\u06A7",
+    "/qafthreedotsabove": "\u06A8",
+    "/keheh": "\u06A9",
+    "/kafswash": "\u06AA",
+    "/kafring": "\u06AB",
+    "/kafdotabove": "\u06AC",
+    "/ng": "\u06AD",
+    "/kafthreedotsbelow": "\u06AE",
+    "/gaf": "\u06AF",
+    "/gafring": "\u06B0",
+    "/ngoeh": "\u06B1",
+    "/gaftwodotsbelow": "\u06B2",
+    "/gueh": "\u06B3",
+    "/gafthreedotsabove": "\u06B4",
+    "/lamVabove": "\u06B5",
+    "/lamdotabove": "\u06B6",
+    "/lamthreedotsabove": "\u06B7",
+    "/lamthreedotsbelow": "\u06B8",
+    "/noondotbelow": "\u06B9",
+    "/noonghunna": "\u06BA",
+    "/rnoon": "\u06BB",
+    "/noonring": "\u06BC",
+    "/noonthreedotsabove": "\u06BD",
+    "/hehdoachashmee": "\u06BE",
+    "/tchehdotabove": "\u06BF",
+    "/hehyeh": "\u06C0",
+    "/hehgoal": "\u06C1",
+    "/hehgoalhamza": "\u06C2",
+    "/tehmarbutagoal": "\u06C3",
+    "/wawring": "\u06C4",
+    "/oekirghiz": "\u06C5",
+    "/aroe": "\u06C6",
+    "/aru": "\u06C7",
+    "/yu": "\u06C8",
+    "/yukirghiz": "\u06C9",
+    "/wawtwodotsabove": "\u06CA",
+    "/ve": "\u06CB",
+    "/yehfarsi": "\u06CC",
+    "/yehtail": "\u06CD",
+    "/yehVabove": "\u06CE",
+    "/wawdotabove": "\u06CF",
+    "/are": "\u06D0",
+    "/yehthreedotsbelow": "\u06D1",
+    "/yehbarree": "\u06D2",
+    "/yehbarreehamza": "\u06D3",
+    "/periodurdu": "\u06D4",
+    "/arae": "\u06D5",
+    "/sad_lam_alefmaksuraabove": "\u06D6",
+    "/qaf_lam_alefmaksuraabove": "\u06D7",
+    "/meemabove.init": "\u06D8",
+    "/lamalefabove": "\u06D9",
+    "/jeemabove": "\u06DA",
+    "/threedotsaboveabove": "\u06DB",
+    "/seenabove": "\u06DC",
+    "/Ayahend": "\u06DD",
+    "/RubElHizbstart": "\u06DE",
+    "/roundedzeroabove": "\u06DF",
+    "/zerosquareabove": "\u06E0",
+    "/dotlesskhahabove": "\u06E1",
+    "/meemabove": "\u06E2",
+    "/seenlow": "\u06E3",
+    "/maddaabove": "\u06E4",
+    "/wawsmall": "\u06E5",
+    "/yehsmall": "\u06E6",
+    "/yehabove": "\u06E7",
+    "/noonabove": "\u06E8",
+    "/Sajdah": "\u06E9",
+    "/stopbelow": "\u06EA",
+    "/stopabove": "\u06EB",
+    "/filledstopabove": "\u06EC",
+    "/meembelow": "\u06ED",
+    "/dalinvertedV": "\u06EE",
+    "/rehinvertedV": "\u06EF",
+    "/perzero": "\u06F0",
+    "/perone": "\u06F1",
+    "/pertwo": "\u06F2",
+    "/perthree": "\u06F3",
+    "/perfour": "\u06F4",
+    "/perfive": "\u06F5",
+    "/persix": "\u06F6",
+    "/perseven": "\u06F7",
+    "/pereight": "\u06F8",
+    "/pernine": "\u06F9",
+    "/sheendotbelow": "\u06FA",
+    "/daddotbelow": "\u06FB",
+    "/ghaindotbelow": "\u06FC",
+    "/ampersandSindhi": "\u06FD",
+    "/menpostSindhi": "\u06FE",
+    "/hehinvertedV": "\u06FF",
+    "/behThreeDotsHorizontallyBelow": "\u0750",
+    "/behDotBelowThreeDotsAbove": "\u0751",
+    "/behThreeDotsUpBelow": "\u0752",
+    "/behThreeDotsUpBelowTwoDotsAbove": "\u0753",
+    "/behTwoDotsBelowDotAbove": "\u0754",
+    "/behInvertedSmallVBelow": "\u0755",
+    "/behSmallV": "\u0756",
+    "/hahTwoDotsAbove": "\u0757",
+    "/hahThreeDotsUpBelow": "\u0758",
+    "/dalTwoDotsVerticallyBelowSmallTah": "\u0759",
+    "/dalInvertedSmallVBelow": "\u075A",
+    "/rehStroke": "\u075B",
+    "/seenFourDotsAbove": "\u075C",
+    "/ainTwoDotsAbove": "\u075D",
+    "/ainThreeDotsDownAbove": "\u075E",
+    "/ainTwoDotsVerticallyAbove": "\u075F",
+    "/fehTwoDotsBelow": "\u0760",
+    "/fehThreeDotsUpBelow": "\u0761",
+    "/kehehDotAbove": "\u0762",
+    "/kehehThreeDotsAbove": "\u0763",
+    "/kehehThreeDotsUpBelow": "\u0764",
+    "/meemDotAbove": "\u0765",
+    "/meemDotBelow": "\u0766",
+    "/noonTwoDotsBelow": "\u0767",
+    "/noonSmallTah": "\u0768",
+    "/noonSmallV": "\u0769",
+    "/lamBar": "\u076A",
+    "/rehTwoDotsVerticallyAbove": "\u076B",
+    "/rehHamzaAbove": "\u076C",
+    "/seenTwoDotsVerticallyAbove": "\u076D",
+    "/hahSmallTahBelow": "\u076E",
+    "/hahSmallTahTwoDots": "\u076F",
+    "/seenSmallTahTwoDots": "\u0770",
+    "/rehSmallTahTwoDots": "\u0771",
+    "/hahSmallTahAbove": "\u0772",
+    "/alefDigitTwoAbove": "\u0773",
+    "/alefDigitThreeAbove": "\u0774",
+    "/farsiYehDigitTwoAbove": "\u0775",
+    "/farsiYehDigitThreeAbove": "\u0776",
+    "/farsiYehDigitFourBelow": "\u0777",
+    "/wawDigitTwoAbove": "\u0778",
+    "/wawDigitThreeAbove": "\u0779",
+    "/yehBarreeDigitTwoAbove": "\u077A",
+    "/yehBarreeDigitThreeAbove": "\u077B",
+    "/hahDigitFourBelow": "\u077C",
+    "/seenDigitFourAbove": "\u077D",
+    "/seenInvertedV": "\u077E",
+    "/kafTwoDotsAbove": "\u077F",
+    "/deva:candrabinduinverted": "\u0900",
+    "/deva:candrabindu": "\u0901",
+    "/deva:anusvara": "\u0902",
+    "/deva:visarga": "\u0903",
+    "/deva:ashort": "\u0904",
+    "/deva:a": "\u0905",
+    "/deva:aa": "\u0906",
+    "/deva:i": "\u0907",
+    "/deva:ii": "\u0908",
+    "/deva:u": "\u0909",
+    "/deva:uu": "\u090A",
+    "/deva:vocalicr": "\u090B",
+    "/deva:vocalicl": "\u090C",
+    "/deva:ecandra": "\u090D",
+    "/deva:eshort": "\u090E",
+    "/deva:e": "\u090F",
+    "/deva:ai": "\u0910",
+    "/deva:ocandra": "\u0911",
+    "/deva:oshort": "\u0912",
+    "/deva:o": "\u0913",
+    "/deva:au": "\u0914",
+    "/deva:ka": "\u0915",
+    "/deva:kha": "\u0916",
+    "/deva:ga": "\u0917",
+    "/deva:gha": "\u0918",
+    "/deva:nga": "\u0919",
+    "/deva:ca": "\u091A",
+    "/deva:cha": "\u091B",
+    "/deva:ja": "\u091C",
+    "/deva:jha": "\u091D",
+    "/deva:nya": "\u091E",
+    "/deva:tta": "\u091F",
+    "/deva:ttha": "\u0920",
+    "/deva:dda": "\u0921",
+    "/deva:ddha": "\u0922",
+    "/deva:nna": "\u0923",
+    "/deva:ta": "\u0924",
+    "/deva:tha": "\u0925",
+    "/deva:da": "\u0926",
+    "/deva:dha": "\u0927",
+    "/deva:na": "\u0928",
+    "/deva:nnna": "\u0929",
+    "/deva:pa": "\u092A",
+    "/deva:pha": "\u092B",
+    "/deva:ba": "\u092C",
+    "/deva:bha": "\u092D",
+    "/deva:ma": "\u092E",
+    "/deva:ya": "\u092F",
+    "/deva:ra": "\u0930",
+    "/deva:rra": "\u0931",
+    "/deva:la": "\u0932",
+    "/deva:lla": "\u0933",
+    "/deva:llla": "\u0934",
+    "/deva:va": "\u0935",
+    "/deva:sha": "\u0936",
+    "/deva:ssa": "\u0937",
+    "/deva:sa": "\u0938",
+    "/deva:ha": "\u0939",
+    "/deva:oesign": "\u093A",
+    "/deva:ooesign": "\u093B",
+    "/deva:nukta": "\u093C",
+    "/deva:avagraha": "\u093D",
+    "/deva:aasign": "\u093E",
+    "/deva:isign": "\u093F",
+    "/deva:iisign": "\u0940",
+    "/deva:usign": "\u0941",
+    "/deva:uusign": "\u0942",
+    "/deva:vocalicrsign": "\u0943",
+    "/deva:vocalicrrsign": "\u0944",
+    "/deva:esigncandra": "\u0945",
+    "/deva:esignshort": "\u0946",
+    "/deva:esign": "\u0947",
+    "/deva:aisign": "\u0948",
+    "/deva:osigncandra": "\u0949",
+    "/deva:osignshort": "\u094A",
+    "/deva:osign": "\u094B",
+    "/deva:ausign": "\u094C",
+    "/deva:virama": "\u094D",
+    "/deva:esignprishthamatra": "\u094E",
+    "/deva:awsign": "\u094F",
+    "/deva:om": "\u0950",
+    "/deva:udatta": "\u0951",
+    "/deva:anudatta": "\u0952",
+    "/deva:grave": "\u0953",
+    "/deva:acute": "\u0954",
+    "/deva:esigncandralong": "\u0955",
+    "/deva:uesign": "\u0956",
+    "/deva:uuesign": "\u0957",
+    "/deva:qa": "\u0958",
+    "/deva:khha": "\u0959",
+    "/deva:ghha": "\u095A",
+    "/deva:za": "\u095B",
+    "/deva:dddha": "\u095C",
+    "/deva:rha": "\u095D",
+    "/deva:fa": "\u095E",
+    "/deva:yya": "\u095F",
+    "/deva:vocalicrr": "\u0960",
+    "/deva:vocalicll": "\u0961",
+    "/deva:vocaliclsign": "\u0962",
+    "/deva:vocalicllsign": "\u0963",
+    "/deva:danda": "\u0964",
+    "/deva:dbldanda": "\u0965",
+    "/deva:zero": "\u0966",
+    "/deva:one": "\u0967",
+    "/deva:two": "\u0968",
+    "/deva:three": "\u0969",
+    "/deva:four": "\u096A",
+    "/deva:five": "\u096B",
+    "/deva:six": "\u096C",
+    "/deva:seven": "\u096D",
+    "/deva:eight": "\u096E",
+    "/deva:nine": "\u096F",
+    "/deva:abbreviation": "\u0970",
+    "/deva:dothigh": "\u0971",
+    "/deva:acandra": "\u0972",
+    "/deva:oe": "\u0973",
+    "/deva:ooe": "\u0974",
+    "/deva:aw": "\u0975",
+    "/deva:ue": "\u0976",
+    "/deva:uue": "\u0977",
+    "/deva:marwaridda": "\u0978",
+    "/deva:zha": "\u0979",
+    "/deva:yaheavy": "\u097A",
+    "/deva:gga": "\u097B",
+    "/deva:jja": "\u097C",
+    "/deva:glottalstop": "\u097D",
+    "/deva:ddda": "\u097E",
+    "/deva:bba": "\u097F",
+    "/beng:anji": "\u0980",
+    "/beng:candrabindu": "\u0981",
+    "/beng:anusvara": "\u0982",
+    "/beng:visarga": "\u0983",
+    "/beng:a": "\u0985",
+    "/beng:aa": "\u0986",
+    "/beng:i": "\u0987",
+    "/beng:ii": "\u0988",
+    "/beng:u": "\u0989",
+    "/beng:uu": "\u098A",
+    "/beng:vocalicr": "\u098B",
+    "/beng:vocalicl": "\u098C",
+    "/beng:e": "\u098F",
+    "/beng:ai": "\u0990",
+    "/beng:o": "\u0993",
+    "/beng:au": "\u0994",
+    "/beng:ka": "\u0995",
+    "/beng:kha": "\u0996",
+    "/beng:ga": "\u0997",
+    "/beng:gha": "\u0998",
+    "/beng:nga": "\u0999",
+    "/beng:ca": "\u099A",
+    "/beng:cha": "\u099B",
+    "/beng:ja": "\u099C",
+    "/beng:jha": "\u099D",
+    "/beng:nya": "\u099E",
+    "/beng:tta": "\u099F",
+    "/beng:ttha": "\u09A0",
+    "/beng:dda": "\u09A1",
+    "/beng:ddha": "\u09A2",
+    "/beng:nna": "\u09A3",
+    "/beng:ta": "\u09A4",
+    "/beng:tha": "\u09A5",
+    "/beng:da": "\u09A6",
+    "/beng:dha": "\u09A7",
+    "/beng:na": "\u09A8",
+    "/beng:pa": "\u09AA",
+    "/beng:pha": "\u09AB",
+    "/beng:ba": "\u09AC",
+    "/beng:bha": "\u09AD",
+    "/beng:ma": "\u09AE",
+    "/beng:ya": "\u09AF",
+    "/beng:ra": "\u09B0",
+    "/beng:la": "\u09B2",
+    "/beng:sha": "\u09B6",
+    "/beng:ssa": "\u09B7",
+    "/beng:sa": "\u09B8",
+    "/beng:ha": "\u09B9",
+    "/beng:nukta": "\u09BC",
+    "/beng:avagraha": "\u09BD",
+    "/beng:aasign": "\u09BE",
+    "/beng:isign": "\u09BF",
+    "/beng:iisign": "\u09C0",
+    "/beng:usign": "\u09C1",
+    "/beng:uusign": "\u09C2",
+    "/beng:vocalicrsign": "\u09C3",
+    "/beng:vocalicrrsign": "\u09C4",
+    "/beng:esign": "\u09C7",
+    "/beng:aisign": "\u09C8",
+    "/beng:osign": "\u09CB",
+    "/beng:ausign": "\u09CC",
+    "/beng:virama": "\u09CD",
+    "/beng:khandata": "\u09CE",
+    "/beng:aulengthmark": "\u09D7",
+    "/beng:rra": "\u09DC",
+    "/beng:rha": "\u09DD",
+    "/beng:yya": "\u09DF",
+    "/beng:vocalicrr": "\u09E0",
+    "/beng:vocalicll": "\u09E1",
+    "/beng:vocaliclsign": "\u09E2",
+    "/beng:vocalicllsign": "\u09E3",
+    "/beng:zero": "\u09E6",
+    "/beng:one": "\u09E7",
+    "/beng:two": "\u09E8",
+    "/beng:three": "\u09E9",
+    "/beng:four": "\u09EA",
+    "/beng:five": "\u09EB",
+    "/beng:six": "\u09EC",
+    "/beng:seven": "\u09ED",
+    "/beng:eight": "\u09EE",
+    "/beng:nine": "\u09EF",
+    "/beng:ramiddiagonal": "\u09F0",
+    "/beng:ralowdiagonal": "\u09F1",
+    "/beng:rupeemark": "\u09F2",
+    "/beng:rupee": "\u09F3",
+    "/beng:onecurrencynumerator": "\u09F4",
+    "/beng:twocurrencynumerator": "\u09F5",
+    "/beng:threecurrencynumerator": "\u09F6",
+    "/beng:fourcurrencynumerator": "\u09F7",
+    "/beng:currencyoneless": "\u09F8",
+    "/beng:sixteencurrencydenominator": "\u09F9",
+    "/beng:isshar": "\u09FA",
+    "/beng:gandamark": "\u09FB",
+    "/beng:vedicanusvara": "\u09FC",
+    "/beng:abbreviationsign": "\u09FD",
+    "/beng:sandhimark": "\u09FE",
+    "/guru:adakbindisign": "\u0A01",
+    "/guru:bindisign": "\u0A02",
+    "/guru:visarga": "\u0A03",
+    "/guru:a": "\u0A05",
+    "/guru:aa": "\u0A06",
+    "/guru:i": "\u0A07",
+    "/guru:ii": "\u0A08",
+    "/guru:u": "\u0A09",
+    "/guru:uu": "\u0A0A",
+    "/guru:ee": "\u0A0F",
+    "/guru:ai": "\u0A10",
+    "/guru:oo": "\u0A13",
+    "/guru:au": "\u0A14",
+    "/guru:ka": "\u0A15",
+    "/guru:kha": "\u0A16",
+    "/guru:ga": "\u0A17",
+    "/guru:gha": "\u0A18",
+    "/guru:nga": "\u0A19",
+    "/guru:ca": "\u0A1A",
+    "/guru:cha": "\u0A1B",
+    "/guru:ja": "\u0A1C",
+    "/guru:jha": "\u0A1D",
+    "/guru:nya": "\u0A1E",
+    "/guru:tta": "\u0A1F",
+    "/guru:ttha": "\u0A20",
+    "/guru:dda": "\u0A21",
+    "/guru:ddha": "\u0A22",
+    "/guru:nna": "\u0A23",
+    "/guru:ta": "\u0A24",
+    "/guru:tha": "\u0A25",
+    "/guru:da": "\u0A26",
+    "/guru:dha": "\u0A27",
+    "/guru:na": "\u0A28",
+    "/guru:pa": "\u0A2A",
+    "/guru:pha": "\u0A2B",
+    "/guru:ba": "\u0A2C",
+    "/guru:bha": "\u0A2D",
+    "/guru:ma": "\u0A2E",
+    "/guru:ya": "\u0A2F",
+    "/guru:ra": "\u0A30",
+    "/guru:la": "\u0A32",
+    "/guru:lla": "\u0A33",
+    "/guru:va": "\u0A35",
+    "/guru:sha": "\u0A36",
+    "/guru:sa": "\u0A38",
+    "/guru:ha": "\u0A39",
+    "/guru:nukta": "\u0A3C",
+    "/guru:aasign": "\u0A3E",
+    "/guru:isign": "\u0A3F",
+    "/guru:iisign": "\u0A40",
+    "/guru:usign": "\u0A41",
+    "/guru:uusign": "\u0A42",
+    "/guru:eesign": "\u0A47",
+    "/guru:aisign": "\u0A48",
+    "/guru:oosign": "\u0A4B",
+    "/guru:ausign": "\u0A4C",
+    "/guru:virama": "\u0A4D",
+    "/guru:udaatsign": "\u0A51",
+    "/guru:khha": "\u0A59",
+    "/guru:ghha": "\u0A5A",
+    "/guru:za": "\u0A5B",
+    "/guru:rra": "\u0A5C",
+    "/guru:fa": "\u0A5E",
+    "/guru:zero": "\u0A66",
+    "/guru:one": "\u0A67",
+    "/guru:two": "\u0A68",
+    "/guru:three": "\u0A69",
+    "/guru:four": "\u0A6A",
+    "/guru:five": "\u0A6B",
+    "/guru:six": "\u0A6C",
+    "/guru:seven": "\u0A6D",
+    "/guru:eight": "\u0A6E",
+    "/guru:nine": "\u0A6F",
+    "/guru:tippi": "\u0A70",
+    "/guru:addak": "\u0A71",
+    "/guru:iri": "\u0A72",
+    "/guru:ura": "\u0A73",
+    "/guru:ekonkar": "\u0A74",
+    "/guru:yakashsign": "\u0A75",
+    "/guru:abbreviationsign": "\u0A76",
+    "/gujr:candrabindu": "\u0A81",
+    "/gujr:anusvara": "\u0A82",
+    "/gujr:visarga": "\u0A83",
+    "/gujr:a": "\u0A85",
+    "/gujr:aa": "\u0A86",
+    "/gujr:i": "\u0A87",
+    "/gujr:ii": "\u0A88",
+    "/gujr:u": "\u0A89",
+    "/gujr:uu": "\u0A8A",
+    "/gujr:vocalicr": "\u0A8B",
+    "/gujr:vocalicl": "\u0A8C",
+    "/gujr:ecandra": "\u0A8D",
+    "/gujr:e": "\u0A8F",
+    "/gujr:ai": "\u0A90",
+    "/gujr:ocandra": "\u0A91",
+    "/gujr:o": "\u0A93",
+    "/gujr:au": "\u0A94",
+    "/gujr:ka": "\u0A95",
+    "/gujr:kha": "\u0A96",
+    "/gujr:ga": "\u0A97",
+    "/gujr:gha": "\u0A98",
+    "/gujr:nga": "\u0A99",
+    "/gujr:ca": "\u0A9A",
+    "/gujr:cha": "\u0A9B",
+    "/gujr:ja": "\u0A9C",
+    "/gujr:jha": "\u0A9D",
+    "/gujr:nya": "\u0A9E",
+    "/gujr:tta": "\u0A9F",
+    "/gujr:ttha": "\u0AA0",
+    "/gujr:dda": "\u0AA1",
+    "/gujr:ddha": "\u0AA2",
+    "/gujr:nna": "\u0AA3",
+    "/gujr:ta": "\u0AA4",
+    "/gujr:tha": "\u0AA5",
+    "/gujr:da": "\u0AA6",
+    "/gujr:dha": "\u0AA7",
+    "/gujr:na": "\u0AA8",
+    "/gujr:pa": "\u0AAA",
+    "/gujr:pha": "\u0AAB",
+    "/gujr:ba": "\u0AAC",
+    "/gujr:bha": "\u0AAD",
+    "/gujr:ma": "\u0AAE",
+    "/gujr:ya": "\u0AAF",
+    "/gujr:ra": "\u0AB0",
+    "/gujr:la": "\u0AB2",
+    "/gujr:lla": "\u0AB3",
+    "/gujr:va": "\u0AB5",
+    "/gujr:sha": "\u0AB6",
+    "/gujr:ssa": "\u0AB7",
+    "/gujr:sa": "\u0AB8",
+    "/gujr:ha": "\u0AB9",
+    "/gujr:nukta": "\u0ABC",
+    "/gujr:avagraha": "\u0ABD",
+    "/gujr:aasign": "\u0ABE",
+    "/gujr:isign": "\u0ABF",
+    "/gujr:iisign": "\u0AC0",
+    "/gujr:usign": "\u0AC1",
+    "/gujr:uusign": "\u0AC2",
+    "/gujr:vocalicrsign": "\u0AC3",
+    "/gujr:vocalicrrsign": "\u0AC4",
+    "/gujr:esigncandra": "\u0AC5",
+    "/gujr:esign": "\u0AC7",
+    "/gujr:aisign": "\u0AC8",
+    "/gujr:osigncandra": "\u0AC9",
+    "/gujr:osign": "\u0ACB",
+    "/gujr:ausign": "\u0ACC",
+    "/gujr:virama": "\u0ACD",
+    "/gujr:om": "\u0AD0",
+    "/gujr:vocalicrr": "\u0AE0",
+    "/gujr:vocalicll": "\u0AE1",
+    "/gujr:vocaliclsign": "\u0AE2",
+    "/gujr:vocalicllsign": "\u0AE3",
+    "/gujr:zero": "\u0AE6",
+    "/gujr:one": "\u0AE7",
+    "/gujr:two": "\u0AE8",
+    "/gujr:three": "\u0AE9",
+    "/gujr:four": "\u0AEA",
+    "/gujr:five": "\u0AEB",
+    "/gujr:six": "\u0AEC",
+    "/gujr:seven": "\u0AED",
+    "/gujr:eight": "\u0AEE",
+    "/gujr:nine": "\u0AEF",
+    "/gujr:abbreviation": "\u0AF0",
+    "/gujr:rupee": "\u0AF1",
+    "/gujr:zha": "\u0AF9",
+    "/gujr:sukun": "\u0AFA",
+    "/gujr:shadda": "\u0AFB",
+    "/gujr:maddah": "\u0AFC",
+    "/gujr:threedotnuktaabove": "\u0AFD",
+    "/gujr:circlenuktaabove": "\u0AFE",
+    "/gujr:twocirclenuktaabove": "\u0AFF",
+    "/orya:candrabindu": "\u0B01",
+    "/orya:anusvara": "\u0B02",
+    "/orya:visarga": "\u0B03",
+    "/orya:a": "\u0B05",
+    "/orya:aa": "\u0B06",
+    "/orya:i": "\u0B07",
+    "/orya:ii": "\u0B08",
+    "/orya:u": "\u0B09",
+    "/orya:uu": "\u0B0A",
+    "/orya:vocalicr": "\u0B0B",
+    "/orya:vocalicl": "\u0B0C",
+    "/orya:e": "\u0B0F",
+    "/orya:ai": "\u0B10",
+    "/orya:o": "\u0B13",
+    "/orya:au": "\u0B14",
+    "/orya:ka": "\u0B15",
+    "/orya:kha": "\u0B16",
+    "/orya:ga": "\u0B17",
+    "/orya:gha": "\u0B18",
+    "/orya:nga": "\u0B19",
+    "/orya:ca": "\u0B1A",
+    "/orya:cha": "\u0B1B",
+    "/orya:ja": "\u0B1C",
+    "/orya:jha": "\u0B1D",
+    "/orya:nya": "\u0B1E",
+    "/orya:tta": "\u0B1F",
+    "/orya:ttha": "\u0B20",
+    "/orya:dda": "\u0B21",
+    "/orya:ddha": "\u0B22",
+    "/orya:nna": "\u0B23",
+    "/orya:ta": "\u0B24",
+    "/orya:tha": "\u0B25",
+    "/orya:da": "\u0B26",
+    "/orya:dha": "\u0B27",
+    "/orya:na": "\u0B28",
+    "/orya:pa": "\u0B2A",
+    "/orya:pha": "\u0B2B",
+    "/orya:ba": "\u0B2C",
+    "/orya:bha": "\u0B2D",
+    "/orya:ma": "\u0B2E",
+    "/orya:ya": "\u0B2F",
+    "/orya:ra": "\u0B30",
+    "/orya:la": "\u0B32",
+    "/orya:lla": "\u0B33",
+    "/orya:va": "\u0B35",
+    "/orya:sha": "\u0B36",
+    "/orya:ssa": "\u0B37",
+    "/orya:sa": "\u0B38",
+    "/orya:ha": "\u0B39",
+    "/orya:nukta": "\u0B3C",
+    "/orya:avagraha": "\u0B3D",
+    "/orya:aasign": "\u0B3E",
+    "/orya:isign": "\u0B3F",
+    "/orya:iisign": "\u0B40",
+    "/orya:usign": "\u0B41",
+    "/orya:uusign": "\u0B42",
+    "/orya:vocalicrsign": "\u0B43",
+    "/orya:vocalicrrsign": "\u0B44",
+    "/orya:esign": "\u0B47",
+    "/orya:aisign": "\u0B48",
+    "/orya:osign": "\u0B4B",
+    "/orya:ausign": "\u0B4C",
+    "/orya:virama": "\u0B4D",
+    "/orya:signoverline": "\u0B55",
+    "/orya:ailengthmark": "\u0B56",
+    "/orya:aulengthmark": "\u0B57",
+    "/orya:rra": "\u0B5C",
+    "/orya:rha": "\u0B5D",
+    "/orya:yya": "\u0B5F",
+    "/orya:vocalicrr": "\u0B60",
+    "/orya:vocalicll": "\u0B61",
+    "/orya:vocaliclsign": "\u0B62",
+    "/orya:vocalicllsign": "\u0B63",
+    "/orya:zero": "\u0B66",
+    "/orya:one": "\u0B67",
+    "/orya:two": "\u0B68",
+    "/orya:three": "\u0B69",
+    "/orya:four": "\u0B6A",
+    "/orya:five": "\u0B6B",
+    "/orya:six": "\u0B6C",
+    "/orya:seven": "\u0B6D",
+    "/orya:eight": "\u0B6E",
+    "/orya:nine": "\u0B6F",
+    "/orya:isshar": "\u0B70",
+    "/orya:wa": "\u0B71",
+    "/orya:onequarter": "\u0B72",
+    "/orya:onehalf": "\u0B73",
+    "/orya:threequarters": "\u0B74",
+    "/orya:onesixteenth": "\u0B75",
+    "/orya:oneeighth": "\u0B76",
+    "/orya:threesixteenths": "\u0B77",
+    "/taml:anusvara": "\u0B82",
+    "/taml:visarga": "\u0B83",
+    "/taml:a": "\u0B85",
+    "/taml:aa": "\u0B86",
+    "/taml:i": "\u0B87",
+    "/taml:ii": "\u0B88",
+    "/taml:u": "\u0B89",
+    "/taml:uu": "\u0B8A",
+    "/taml:e": "\u0B8E",
+    "/taml:ee": "\u0B8F",
+    "/taml:ai": "\u0B90",
+    "/taml:o": "\u0B92",
+    "/taml:oo": "\u0B93",
+    "/taml:au": "\u0B94",
+    "/taml:ka": "\u0B95",
+    "/taml:nga": "\u0B99",
+    "/taml:ca": "\u0B9A",
+    "/taml:ja": "\u0B9C",
+    "/taml:nya": "\u0B9E",
+    "/taml:tta": "\u0B9F",
+    "/taml:nna": "\u0BA3",
+    "/taml:ta": "\u0BA4",
+    "/taml:na": "\u0BA8",
+    "/taml:nnna": "\u0BA9",
+    "/taml:pa": "\u0BAA",
+    "/taml:ma": "\u0BAE",
+    "/taml:ya": "\u0BAF",
+    "/taml:ra": "\u0BB0",
+    "/taml:rra": "\u0BB1",
+    "/taml:la": "\u0BB2",
+    "/taml:lla": "\u0BB3",
+    "/taml:llla": "\u0BB4",
+    "/taml:va": "\u0BB5",
+    "/taml:sha": "\u0BB6",
+    "/taml:ssa": "\u0BB7",
+    "/taml:sa": "\u0BB8",
+    "/taml:ha": "\u0BB9",
+    "/taml:aasign": "\u0BBE",
+    "/taml:isign": "\u0BBF",
+    "/taml:iisign": "\u0BC0",
+    "/taml:usign": "\u0BC1",
+    "/taml:uusign": "\u0BC2",
+    "/taml:esign": "\u0BC6",
+    "/taml:eesign": "\u0BC7",
+    "/taml:aisign": "\u0BC8",
+    "/taml:osign": "\u0BCA",
+    "/taml:oosign": "\u0BCB",
+    "/taml:ausign": "\u0BCC",
+    "/taml:virama": "\u0BCD",
+    "/taml:om": "\u0BD0",
+    "/taml:aulengthmark": "\u0BD7",
+    "/taml:zero": "\u0BE6",
+    "/taml:one": "\u0BE7",
+    "/taml:two": "\u0BE8",
+    "/taml:three": "\u0BE9",
+    "/taml:four": "\u0BEA",
+    "/taml:five": "\u0BEB",
+    "/taml:six": "\u0BEC",
+    "/taml:seven": "\u0BED",
+    "/taml:eight": "\u0BEE",
+    "/taml:nine": "\u0BEF",
+    "/taml:ten": "\u0BF0",
+    "/taml:onehundred": "\u0BF1",
+    "/taml:onethousand": "\u0BF2",
+    "/taml:daysign": "\u0BF3",
+    "/taml:monthsign": "\u0BF4",
+    "/taml:yearsign": "\u0BF5",
+    "/taml:debitsign": "\u0BF6",
+    "/taml:creditsign": "\u0BF7",
+    "/taml:asabovesign": "\u0BF8",
+    "/taml:rupee": "\u0BF9",
+    "/taml:sign": "\u0BFA",
+    "/telu:combiningcandrabinduabovesign": "\u0C00",
+    "/telu:candrabindusign": "\u0C01",
+    "/telu:anusvara": "\u0C02",
+    "/telu:visarga": "\u0C03",
+    "/telu:combininganusvaraabovesign": "\u0C04",
+    "/telu:a": "\u0C05",
+    "/telu:aa": "\u0C06",
+    "/telu:i": "\u0C07",
+    "/telu:ii": "\u0C08",
+    "/telu:u": "\u0C09",
+    "/telu:uu": "\u0C0A",
+    "/telu:vocalicr": "\u0C0B",
+    "/telu:vocalicl": "\u0C0C",
+    "/telu:e": "\u0C0E",
+    "/telu:ee": "\u0C0F",
+    "/telu:ai": "\u0C10",
+    "/telu:o": "\u0C12",
+    "/telu:oo": "\u0C13",
+    "/telu:au": "\u0C14",
+    "/telu:ka": "\u0C15",
+    "/telu:kha": "\u0C16",
+    "/telu:ga": "\u0C17",
+    "/telu:gha": "\u0C18",
+    "/telu:nga": "\u0C19",
+    "/telu:ca": "\u0C1A",
+    "/telu:cha": "\u0C1B",
+    "/telu:ja": "\u0C1C",
+    "/telu:jha": "\u0C1D",
+    "/telu:nya": "\u0C1E",
+    "/telu:tta": "\u0C1F",
+    "/telu:ttha": "\u0C20",
+    "/telu:dda": "\u0C21",
+    "/telu:ddha": "\u0C22",
+    "/telu:nna": "\u0C23",
+    "/telu:ta": "\u0C24",
+    "/telu:tha": "\u0C25",
+    "/telu:da": "\u0C26",
+    "/telu:dha": "\u0C27",
+    "/telu:na": "\u0C28",
+    "/telu:pa": "\u0C2A",
+    "/telu:pha": "\u0C2B",
+    "/telu:ba": "\u0C2C",
+    "/telu:bha": "\u0C2D",
+    "/telu:ma": "\u0C2E",
+    "/telu:ya": "\u0C2F",
+    "/telu:ra": "\u0C30",
+    "/telu:rra": "\u0C31",
+    "/telu:la": "\u0C32",
+    "/telu:lla": "\u0C33",
+    "/telu:llla": "\u0C34",
+    "/telu:va": "\u0C35",
+    "/telu:sha": "\u0C36",
+    "/telu:ssa": "\u0C37",
+    "/telu:sa": "\u0C38",
+    "/telu:ha": "\u0C39",
+    "/telu:nukta": "\u0C3C",
+    "/telu:avagraha": "\u0C3D",
+    "/telu:aasign": "\u0C3E",
+    "/telu:isign": "\u0C3F",
+    "/telu:iisign": "\u0C40",
+    "/telu:usign": "\u0C41",
+    "/telu:uusign": "\u0C42",
+    "/telu:vocalicrsign": "\u0C43",
+    "/telu:vocalicrrsign": "\u0C44",
+    "/telu:esign": "\u0C46",
+    "/telu:eesign": "\u0C47",
+    "/telu:aisign": "\u0C48",
+    "/telu:osign": "\u0C4A",
+    "/telu:oosign": "\u0C4B",
+    "/telu:ausign": "\u0C4C",
+    "/telu:virama": "\u0C4D",
+    "/telu:lengthmark": "\u0C55",
+    "/telu:ailengthmark": "\u0C56",
+    "/telu:tsa": "\u0C58",
+    "/telu:dza": "\u0C59",
+    "/telu:rrra": "\u0C5A",
+    "/telu:nakaarapollu": "\u0C5D",
+    "/telu:vocalicrr": "\u0C60",
+    "/telu:vocalicll": "\u0C61",
+    "/telu:vocaliclsign": "\u0C62",
+    "/telu:vocalicllsign": "\u0C63",
+    "/telu:zero": "\u0C66",
+    "/telu:one": "\u0C67",
+    "/telu:two": "\u0C68",
+    "/telu:three": "\u0C69",
+    "/telu:four": "\u0C6A",
+    "/telu:five": "\u0C6B",
+    "/telu:six": "\u0C6C",
+    "/telu:seven": "\u0C6D",
+    "/telu:eight": "\u0C6E",
+    "/telu:nine": "\u0C6F",
+    "/telu:siddhamsign": "\u0C77",
+    "/telu:fractionzeroforoddpowersoffour": "\u0C78",
+    "/telu:fractiononeforoddpowersoffour": "\u0C79",
+    "/telu:fractiontwoforoddpowersoffour": "\u0C7A",
+    "/telu:fractionthreeforoddpowersoffour": "\u0C7B",
+    "/telu:fractiononeforevenpowersoffour": "\u0C7C",
+    "/telu:fractiontwoforevenpowersoffour": "\u0C7D",
+    "/telu:fractionthreeforevenpowersoffour": "\u0C7E",
+    "/telu:tuumusign": "\u0C7F",
+    "/knda:signspacingcandrabindu": "\u0C80",
+    "/knda:signcandrabindu": "\u0C81",
+    "/knda:anusvara": "\u0C82",
+    "/knda:visarga": "\u0C83",
+    "/knda:signsiddham": "\u0C84",
+    "/knda:a": "\u0C85",
+    "/knda:aa": "\u0C86",
+    "/knda:i": "\u0C87",
+    "/knda:ii": "\u0C88",
+    "/knda:u": "\u0C89",
+    "/knda:uu": "\u0C8A",
+    "/knda:rvocal": "\u0C8B",
+    "/knda:lvocal": "\u0C8C",
+    "/knda:e": "\u0C8E",
+    "/knda:ee": "\u0C8F",
+    "/knda:ai": "\u0C90",
+    "/knda:o": "\u0C92",
+    "/knda:oo": "\u0C93",
+    "/knda:au": "\u0C94",
+    "/knda:ka": "\u0C95",
+    "/knda:kha": "\u0C96",
+    "/knda:ga": "\u0C97",
+    "/knda:gha": "\u0C98",
+    "/knda:nga": "\u0C99",
+    "/knda:ca": "\u0C9A",
+    "/knda:cha": "\u0C9B",
+    "/knda:ja": "\u0C9C",
+    "/knda:jha": "\u0C9D",
+    "/knda:nya": "\u0C9E",
+    "/knda:tta": "\u0C9F",
+    "/knda:ttha": "\u0CA0",
+    "/knda:dda": "\u0CA1",
+    "/knda:ddha": "\u0CA2",
+    "/knda:nna": "\u0CA3",
+    "/knda:ta": "\u0CA4",
+    "/knda:tha": "\u0CA5",
+    "/knda:da": "\u0CA6",
+    "/knda:dha": "\u0CA7",
+    "/knda:na": "\u0CA8",
+    "/knda:pa": "\u0CAA",
+    "/knda:pha": "\u0CAB",
+    "/knda:ba": "\u0CAC",
+    "/knda:bha": "\u0CAD",
+    "/knda:ma": "\u0CAE",
+    "/knda:ya": "\u0CAF",
+    "/knda:ra": "\u0CB0",
+    "/knda:rra": "\u0CB1",
+    "/knda:la": "\u0CB2",
+    "/knda:lla": "\u0CB3",
+    "/knda:va": "\u0CB5",
+    "/knda:sha": "\u0CB6",
+    "/knda:ssa": "\u0CB7",
+    "/knda:sa": "\u0CB8",
+    "/knda:ha": "\u0CB9",
+    "/knda:nukta": "\u0CBC",
+    "/knda:avagraha": "\u0CBD",
+    "/knda:aasign": "\u0CBE",
+    "/knda:isign": "\u0CBF",
+    "/knda:iisign": "\u0CC0",
+    "/knda:usign": "\u0CC1",
+    "/knda:uusign": "\u0CC2",
+    "/knda:rvocalsign": "\u0CC3",
+    "/knda:rrvocalsign": "\u0CC4",
+    "/knda:esign": "\u0CC6",
+    "/knda:eesign": "\u0CC7",
+    "/knda:aisign": "\u0CC8",
+    "/knda:osign": "\u0CCA",
+    "/knda:oosign": "\u0CCB",
+    "/knda:ausign": "\u0CCC",
+    "/knda:virama": "\u0CCD",
+    "/knda:length": "\u0CD5",
+    "/knda:ailength": "\u0CD6",
+    "/knda:nakaarapollu": "\u0CDD",
+    "/knda:fa": "\u0CDE",
+    "/knda:rrvocal": "\u0CE0",
+    "/knda:llvocal": "\u0CE1",
+    "/knda:lvocalsign": "\u0CE2",
+    "/knda:llvocalsign": "\u0CE3",
+    "/knda:zero": "\u0CE6",
+    "/knda:one": "\u0CE7",
+    "/knda:two": "\u0CE8",
+    "/knda:three": "\u0CE9",
+    "/knda:four": "\u0CEA",
+    "/knda:five": "\u0CEB",
+    "/knda:six": "\u0CEC",
+    "/knda:seven": "\u0CED",
+    "/knda:eight": "\u0CEE",
+    "/knda:nine": "\u0CEF",
+    "/knda:jihvamuliya": "\u0CF1",
+    "/knda:upadhmaniya": "\u0CF2",
+    "/knda:signcombininganusvaraaboveright": "\u0CF3",
+    "/mlym:combininganusvaraabovesign": "\u0D00",
+    "/mlym:candrabindusign": "\u0D01",
+    "/mlym:anusvarasign": "\u0D02",
+    "/mlym:visargasign": "\u0D03",
+    "/mlym:vedicanusvara": "\u0D04",
+    "/mlym:a": "\u0D05",
+    "/mlym:aa": "\u0D06",
+    "/mlym:i": "\u0D07",
+    "/mlym:ii": "\u0D08",
+    "/mlym:u": "\u0D09",
+    "/mlym:uu": "\u0D0A",
+    "/mlym:rvocal": "\u0D0B",
+    "/mlym:lvocal": "\u0D0C",
+    "/mlym:e": "\u0D0E",
+    "/mlym:ee": "\u0D0F",
+    "/mlym:ai": "\u0D10",
+    "/mlym:o": "\u0D12",
+    "/mlym:oo": "\u0D13",
+    "/mlym:au": "\u0D14",
+    "/mlym:ka": "\u0D15",
+    "/mlym:kha": "\u0D16",
+    "/mlym:ga": "\u0D17",
+    "/mlym:gha": "\u0D18",
+    "/mlym:nga": "\u0D19",
+    "/mlym:ca": "\u0D1A",
+    "/mlym:cha": "\u0D1B",
+    "/mlym:ja": "\u0D1C",
+    "/mlym:jha": "\u0D1D",
+    "/mlym:nya": "\u0D1E",
+    "/mlym:tta": "\u0D1F",
+    "/mlym:ttha": "\u0D20",
+    "/mlym:dda": "\u0D21",
+    "/mlym:ddha": "\u0D22",
+    "/mlym:nna": "\u0D23",
+    "/mlym:ta": "\u0D24",
+    "/mlym:tha": "\u0D25",
+    "/mlym:da": "\u0D26",
+    "/mlym:dha": "\u0D27",
+    "/mlym:na": "\u0D28",
+    "/mlym:nnna": "\u0D29",
+    "/mlym:pa": "\u0D2A",
+    "/mlym:pha": "\u0D2B",
+    "/mlym:ba": "\u0D2C",
+    "/mlym:bha": "\u0D2D",
+    "/mlym:ma": "\u0D2E",
+    "/mlym:ya": "\u0D2F",
+    "/mlym:ra": "\u0D30",
+    "/mlym:rra": "\u0D31",
+    "/mlym:la": "\u0D32",
+    "/mlym:lla": "\u0D33",
+    "/mlym:llla": "\u0D34",
+    "/mlym:va": "\u0D35",
+    "/mlym:sha": "\u0D36",
+    "/mlym:ssa": "\u0D37",
+    "/mlym:sa": "\u0D38",
+    "/mlym:ha": "\u0D39",
+    "/mlym:ttta": "\u0D3A",
+    "/mlym:verticalbarviramasign": "\u0D3B",
+    "/mlym:circularviramasign": "\u0D3C",
+    "/mlym:avagrahasign": "\u0D3D",
+    "/mlym:aasign": "\u0D3E",
+    "/mlym:isign": "\u0D3F",
+    "/mlym:iisign": "\u0D40",
+    "/mlym:usign": "\u0D41",
+    "/mlym:uusign": "\u0D42",
+    "/mlym:rvocalsign": "\u0D43",
+    "/mlym:rrvocalsign": "\u0D44",
+    "/mlym:esign": "\u0D46",
+    "/mlym:eesign": "\u0D47",
+    "/mlym:aisign": "\u0D48",
+    "/mlym:osign": "\u0D4A",
+    "/mlym:oosign": "\u0D4B",
+    "/mlym:ausign": "\u0D4C",
+    "/mlym:viramasign": "\u0D4D",
+    "/mlym:dotreph": "\u0D4E",
+    "/mlym:parasign": "\u0D4F",
+    "/mlym:mchillu": "\u0D54",
+    "/mlym:ychillu": "\u0D55",
+    "/mlym:lllchillu": "\u0D56",
+    "/mlym:aulength": "\u0D57",
+    "/mlym:oneone-hundred-and-sixtieth": "\u0D58",
+    "/mlym:onefortieth": "\u0D59",
+    "/mlym:threeeightieths": "\u0D5A",
+    "/mlym:onetwentieth": "\u0D5B",
+    "/mlym:onetenth": "\u0D5C",
+    "/mlym:threetwentieths": "\u0D5D",
+    "/mlym:onefifth": "\u0D5E",
+    "/mlym:archaicii": "\u0D5F",
+    "/mlym:rrvocal": "\u0D60",
+    "/mlym:llvocal": "\u0D61",
+    "/mlym:lvocalsign": "\u0D62",
+    "/mlym:llvocalsign": "\u0D63",
+    "/mlym:zero": "\u0D66",
+    "/mlym:one": "\u0D67",
+    "/mlym:two": "\u0D68",
+    "/mlym:three": "\u0D69",
+    "/mlym:four": "\u0D6A",
+    "/mlym:five": "\u0D6B",
+    "/mlym:six": "\u0D6C",
+    "/mlym:seven": "\u0D6D",
+    "/mlym:eight": "\u0D6E",
+    "/mlym:nine": "\u0D6F",
+    "/mlym:ten": "\u0D70",
+    "/mlym:onehundred": "\u0D71",
+    "/mlym:onethousand": "\u0D72",
+    "/mlym:onequarter": "\u0D73",
+    "/mlym:onehalf": "\u0D74",
+    "/mlym:threequarters": "\u0D75",
+    "/mlym:onesixteenth": "\u0D76",
+    "/mlym:oneeighth": "\u0D77",
+    "/mlym:threesixteenths": "\u0D78",
+    "/mlym:date": "\u0D79",
+    "/mlym:nnchillu": "\u0D7A",
+    "/mlym:nchillu": "\u0D7B",
+    "/mlym:rrchillu": "\u0D7C",
+    "/mlym:lchillu": "\u0D7D",
+    "/mlym:llchillu": "\u0D7E",
+    "/mlym:kchillu": "\u0D7F",
+    "/sinh:candrabindu": "\u0D81",
+    "/sinh:anusvara": "\u0D82",
+    "/sinh:visarga": "\u0D83",
+    "/sinh:a": "\u0D85",
+    "/sinh:aa": "\u0D86",
+    "/sinh:ae": "\u0D87",
+    "/sinh:aae": "\u0D88",
+    "/sinh:i": "\u0D89",
+    "/sinh:ii": "\u0D8A",
+    "/sinh:u": "\u0D8B",
+    "/sinh:uu": "\u0D8C",
+    "/sinh:vocalicr": "\u0D8D",
+    "/sinh:vocalicrr": "\u0D8E",
+    "/sinh:vocalicl": "\u0D8F",
+    "/sinh:vocalicll": "\u0D90",
+    "/sinh:e": "\u0D91",
+    "/sinh:ee": "\u0D92",
+    "/sinh:ai": "\u0D93",
+    "/sinh:o": "\u0D94",
+    "/sinh:oo": "\u0D95",
+    "/sinh:au": "\u0D96",
+    "/sinh:ka": "\u0D9A",
+    "/sinh:kha": "\u0D9B",
+    "/sinh:ga": "\u0D9C",
+    "/sinh:gha": "\u0D9D",
+    "/sinh:nga": "\u0D9E",
+    "/sinh:nnga": "\u0D9F",
+    "/sinh:ca": "\u0DA0",
+    "/sinh:cha": "\u0DA1",
+    "/sinh:ja": "\u0DA2",
+    "/sinh:jha": "\u0DA3",
+    "/sinh:nya": "\u0DA4",
+    "/sinh:jnya": "\u0DA5",
+    "/sinh:nyja": "\u0DA6",
+    "/sinh:tta": "\u0DA7",
+    "/sinh:ttha": "\u0DA8",
+    "/sinh:dda": "\u0DA9",
+    "/sinh:ddha": "\u0DAA",
+    "/sinh:nna": "\u0DAB",
+    "/sinh:nndda": "\u0DAC",
+    "/sinh:ta": "\u0DAD",
+    "/sinh:tha": "\u0DAE",
+    "/sinh:da": "\u0DAF",
+    "/sinh:dha": "\u0DB0",
+    "/sinh:na": "\u0DB1",
+    "/sinh:nda": "\u0DB3",
+    "/sinh:pa": "\u0DB4",
+    "/sinh:pha": "\u0DB5",
+    "/sinh:ba": "\u0DB6",
+    "/sinh:bha": "\u0DB7",
+    "/sinh:ma": "\u0DB8",
+    "/sinh:mba": "\u0DB9",
+    "/sinh:ya": "\u0DBA",
+    "/sinh:ra": "\u0DBB",
+    "/sinh:la": "\u0DBD",
+    "/sinh:va": "\u0DC0",
+    "/sinh:sha": "\u0DC1",
+    "/sinh:ssa": "\u0DC2",
+    "/sinh:sa": "\u0DC3",
+    "/sinh:ha": "\u0DC4",
+    "/sinh:lla": "\u0DC5",
+    "/sinh:fa": "\u0DC6",
+    "/sinh:virama": "\u0DCA",
+    "/sinh:aasign": "\u0DCF",
+    "/sinh:aesign": "\u0DD0",
+    "/sinh:aaesign": "\u0DD1",
+    "/sinh:isign": "\u0DD2",
+    "/sinh:iisign": "\u0DD3",
+    "/sinh:usign": "\u0DD4",
+    "/sinh:uusign": "\u0DD6",
+    "/sinh:vocalicrsign": "\u0DD8",
+    "/sinh:esign": "\u0DD9",
+    "/sinh:eesign": "\u0DDA",
+    "/sinh:aisign": "\u0DDB",
+    "/sinh:osign": "\u0DDC",
+    "/sinh:oosign": "\u0DDD",
+    "/sinh:ausign": "\u0DDE",
+    "/sinh:vocaliclsign": "\u0DDF",
+    "/sinh:zerolith": "\u0DE6",
+    "/sinh:onelith": "\u0DE7",
+    "/sinh:twolith": "\u0DE8",
+    "/sinh:threelith": "\u0DE9",
+    "/sinh:fourlith": "\u0DEA",
+    "/sinh:fivelith": "\u0DEB",
+    "/sinh:sixlith": "\u0DEC",
+    "/sinh:sevenlith": "\u0DED",
+    "/sinh:eightlith": "\u0DEE",
+    "/sinh:ninelith": "\u0DEF",
+    "/sinh:vocalicrrsign": "\u0DF2",
+    "/sinh:vocalicllsign": "\u0DF3",
+    "/sinh:kunddaliya": "\u0DF4",
+    "/th-kokai": "\u0E01",
+    "/th-khokhai": "\u0E02",
+    "/th-khokhuat": "\u0E03",
+    "/th-khokhwai": "\u0E04",
+    "/th-khokhon": "\u0E05",
+    "/th-khorakhang": "\u0E06",
+    "/th-ngongu": "\u0E07",
+    "/th-chochan": "\u0E08",
+    "/th-choching": "\u0E09",
+    "/th-chochang": "\u0E0A",
+    "/th-soso": "\u0E0B",
+    "/th-chochoe": "\u0E0C",
+    "/th-yoying": "\u0E0D",
+    "/th-dochada": "\u0E0E",
+    "/th-topatak": "\u0E0F",
+    "/th-thothan": "\u0E10",
+    "/th-thonangmontho": "\u0E11",
+    "/th-thophuthao": "\u0E12",
+    "/th-nonen": "\u0E13",
+    "/th-dodek": "\u0E14",
+    "/th-totao": "\u0E15",
+    "/th-thothung": "\u0E16",
+    "/th-thothahan": "\u0E17",
+    "/th-thothong": "\u0E18",
+    "/th-nonu": "\u0E19",
+    "/th-bobaimai": "\u0E1A",
+    "/th-popla": "\u0E1B",
+    "/th-phophung": "\u0E1C",
+    "/th-fofa": "\u0E1D",
+    "/th-phophan": "\u0E1E",
+    "/th-fofan": "\u0E1F",
+    "/th-phosamphao": "\u0E20",
+    "/th-moma": "\u0E21",
+    "/th-yoyak": "\u0E22",
+    "/th-rorua": "\u0E23",
+    "/th-ru": "\u0E24",
+    "/th-loling": "\u0E25",
+    "/th-lu": "\u0E26",
+    "/th-wowaen": "\u0E27",
+    "/th-sosala": "\u0E28",
+    "/th-sorusi": "\u0E29",
+    "/th-sosua": "\u0E2A",
+    "/th-hohip": "\u0E2B",
+    "/th-lochula": "\u0E2C",
+    "/th-oang": "\u0E2D",
+    "/th-honokhuk": "\u0E2E",
+    "/th-paiyannoi": "\u0E2F",
+    "/th-saraa": "\u0E30",
+    "/th-maihan-akat": "\u0E31",
+    "/th-saraaa": "\u0E32",
+    "/th-saraam": "\u0E33",
+    "/th-sarai": "\u0E34",
+    "/th-saraii": "\u0E35",
+    "/th-saraue": "\u0E36",
+    "/th-sarauee": "\u0E37",
+    "/th-sarau": "\u0E38",
+    "/th-sarauu": "\u0E39",
+    "/th-phinthu": "\u0E3A",
+    "/th-baht": "\u0E3F",
+    "/th-sarae": "\u0E40",
+    "/th-saraae": "\u0E41",
+    "/th-sarao": "\u0E42",
+    "/th-saraaimaimuan": "\u0E43",
+    "/th-saraaimaimalai": "\u0E44",
+    "/th-lakkhangyao": "\u0E45",
+    "/th-maiyamok": "\u0E46",
+    "/th-maitaikhu": "\u0E47",
+    "/th-maiek": "\u0E48",
+    "/th-maitho": "\u0E49",
+    "/th-maitri": "\u0E4A",
+    "/th-maichattawa": "\u0E4B",
+    "/th-thanthakhat": "\u0E4C",
+    "/th-nikhahit": "\u0E4D",
+    "/th-yamakkan": "\u0E4E",
+    "/th-fongman": "\u0E4F",
+    "/th-zero": "\u0E50",
+    "/th-one": "\u0E51",
+    "/th-two": "\u0E52",
+    "/th-three": "\u0E53",
+    "/th-four": "\u0E54",
+    "/th-five": "\u0E55",
+    "/th-six": "\u0E56",
+    "/th-seven": "\u0E57",
+    "/th-eight": "\u0E58",
+    "/th-nine": "\u0E59",
+    "/th-angkhankhu": "\u0E5A",
+    "/th-khomut": "\u0E5B",
+    "/tibt:omsyllable": "\u0F00",
+    "/tibt:gteryigmgotruncatedamark": "\u0F01",
+    "/tibt:gteryigmgoumrnambcadmamark": "\u0F02",
+    "/tibt:gteryigmgoumgtertshegmamark": "\u0F03",
+    "/tibt:yigmgomdunmainitialmark": "\u0F04",
+    "/tibt:yigmgosgabmaclosingmark": "\u0F05",
+    "/tibt:caretyigmgophurshadmamark": "\u0F06",
+    "/tibt:yigmgotshegshadmamark": "\u0F07",
+    "/tibt:sbrulshadmark": "\u0F08",
+    "/tibt:bskuryigmgomark": "\u0F09",
+    "/tibt:bkashogyigmgomark": "\u0F0A",
+    "/tibt:intersyllabictshegmark": "\u0F0B",
+    "/tibt:delimitertshegbstarmark": "\u0F0C",
+    "/tibt:shadmark": "\u0F0D",
+    "/tibt:nyisshadmark": "\u0F0E",
+    "/tibt:tshegshadmark": "\u0F0F",
+    "/tibt:nyistshegshadmark": "\u0F10",
+    "/tibt:rinchenspungsshadmark": "\u0F11",
+    "/tibt:rgyagramshadmark": "\u0F12",
+    "/tibt:caretdzudrtagsmelongcanmark": "\u0F13",
+    "/tibt:gtertshegmark": "\u0F14",
+    "/tibt:chadrtagslogotypesign": "\u0F15",
+    "/tibt:lhagrtagslogotypesign": "\u0F16",
+    "/tibt:astrologicalsgragcancharrtagssign": "\u0F17",
+    "/tibt:astrologicalkhyudpasign": "\u0F18",
+    "/tibt:astrologicalsdongtshugssign": "\u0F19",
+    "/tibt:rdeldkargcigsign": "\u0F1A",
+    "/tibt:rdeldkargnyissign": "\u0F1B",
+    "/tibt:rdeldkargsumsign": "\u0F1C",
+    "/tibt:rdelnaggcigsign": "\u0F1D",
+    "/tibt:rdelnaggnyissign": "\u0F1E",
+    "/tibt:rdeldkarrdelnagsign": "\u0F1F",
+    "/tibt:zero": "\u0F20",
+    "/tibt:one": "\u0F21",
+    "/tibt:two": "\u0F22",
+    "/tibt:three": "\u0F23",
+    "/tibt:four": "\u0F24",
+    "/tibt:five": "\u0F25",
+    "/tibt:six": "\u0F26",
+    "/tibt:seven": "\u0F27",
+    "/tibt:eight": "\u0F28",
+    "/tibt:nine": "\u0F29",
+    "/tibt:halfone": "\u0F2A",
+    "/tibt:halftwo": "\u0F2B",
+    "/tibt:halfthree": "\u0F2C",
+    "/tibt:halffour": "\u0F2D",
+    "/tibt:halffive": "\u0F2E",
+    "/tibt:halfsix": "\u0F2F",
+    "/tibt:halfseven": "\u0F30",
+    "/tibt:halfeight": "\u0F31",
+    "/tibt:halfnine": "\u0F32",
+    "/tibt:halfzero": "\u0F33",
+    "/tibt:bsdusrtagsmark": "\u0F34",
+    "/tibt:ngasbzungnyizlamark": "\u0F35",
+    "/tibt:caretdzudrtagsbzhimigcanmark": "\u0F36",
+    "/tibt:ngasbzungsgorrtagsmark": "\u0F37",
+    "/tibt:chemgomark": "\u0F38",
+    "/tibt:tsaphrumark": "\u0F39",
+    "/tibt:gugrtagsgyonmark": "\u0F3A",
+    "/tibt:gugrtagsgyasmark": "\u0F3B",
+    "/tibt:angkhanggyonmark": "\u0F3C",
+    "/tibt:angkhanggyasmark": "\u0F3D",
+    "/tibt:yartshessign": "\u0F3E",
+    "/tibt:martshessign": "\u0F3F",
+    "/tibt:ka": "\u0F40",
+    "/tibt:kha": "\u0F41",
+    "/tibt:ga": "\u0F42",
+    "/tibt:gha": "\u0F43",
+    "/tibt:nga": "\u0F44",
+    "/tibt:ca": "\u0F45",
+    "/tibt:cha": "\u0F46",
+    "/tibt:ja": "\u0F47",
+    "/tibt:nya": "\u0F49",
+    "/tibt:tta": "\u0F4A",
+    "/tibt:ttha": "\u0F4B",
+    "/tibt:dda": "\u0F4C",
+    "/tibt:ddha": "\u0F4D",
+    "/tibt:nna": "\u0F4E",
+    "/tibt:ta": "\u0F4F",
+    "/tibt:tha": "\u0F50",
+    "/tibt:da": "\u0F51",
+    "/tibt:dha": "\u0F52",
+    "/tibt:na": "\u0F53",
+    "/tibt:pa": "\u0F54",
+    "/tibt:pha": "\u0F55",
+    "/tibt:ba": "\u0F56",
+    "/tibt:bha": "\u0F57",
+    "/tibt:ma": "\u0F58",
+    "/tibt:tsa": "\u0F59",
+    "/tibt:tsha": "\u0F5A",
+    "/tibt:dza": "\u0F5B",
+    "/tibt:dzha": "\u0F5C",
+    "/tibt:wa": "\u0F5D",
+    "/tibt:zha": "\u0F5E",
+    "/tibt:za": "\u0F5F",
+    "/tibt:AA": "\u0F60",
+    "/tibt:ya": "\u0F61",
+    "/tibt:ra": "\u0F62",
+    "/tibt:la": "\u0F63",
+    "/tibt:sha": "\u0F64",
+    "/tibt:ssa": "\u0F65",
+    "/tibt:sa": "\u0F66",
+    "/tibt:ha": "\u0F67",
+    "/tibt:a": "\u0F68",
+    "/tibt:kssa": "\u0F69",
+    "/tibt:rafixed": "\u0F6A",
+    "/tibt:kka": "\u0F6B",
+    "/tibt:rra": "\u0F6C",
+    "/tibt:aavowelsign": "\u0F71",
+    "/tibt:ivowelsign": "\u0F72",
+    "/tibt:iivowelsign": "\u0F73",
+    "/tibt:uvowelsign": "\u0F74",
+    "/tibt:uuvowelsign": "\u0F75",
+    "/tibt:rvocalicvowelsign": "\u0F76",
+    "/tibt:rrvocalicvowelsign": "\u0F77",
+    "/tibt:lvocalicvowelsign": "\u0F78",
+    "/tibt:llvocalicvowelsign": "\u0F79",
+    "/tibt:evowelsign": "\u0F7A",
+    "/tibt:eevowelsign": "\u0F7B",
+    "/tibt:ovowelsign": "\u0F7C",
+    "/tibt:oovowelsign": "\u0F7D",
+    "/tibt:rjessungarosign": "\u0F7E",
+    "/tibt:rnambcadsign": "\u0F7F",
+    "/tibt:reversedivowelsign": "\u0F80",
+    "/tibt:reversediivowelsign": "\u0F81",
+    "/tibt:nyizlanaadasign": "\u0F82",
+    "/tibt:snaldansign": "\u0F83",
+    "/tibt:halantamark": "\u0F84",
+    "/tibt:palutamark": "\u0F85",
+    "/tibt:lcirtagssign": "\u0F86",
+    "/tibt:yangrtagssign": "\u0F87",
+    "/tibt:lcetsacansign": "\u0F88",
+    "/tibt:mchucansign": "\u0F89",
+    "/tibt:grucanrgyingssign": "\u0F8A",
+    "/tibt:grumedrgyingssign": "\u0F8B",
+    "/tibt:invertedmchucansign": "\u0F8C",
+    "/tibt:lcetsacansubjoinedsign": "\u0F8D",
+    "/tibt:mchucansubjoinedsign": "\u0F8E",
+    "/tibt:invertedmchucansubjoinedsign": "\u0F8F",
+    "/tibt:kasubjoined": "\u0F90",
+    "/tibt:khasubjoined": "\u0F91",
+    "/tibt:gasubjoined": "\u0F92",
+    "/tibt:ghasubjoined": "\u0F93",
+    "/tibt:ngasubjoined": "\u0F94",
+    "/tibt:casubjoined": "\u0F95",
+    "/tibt:chasubjoined": "\u0F96",
+    "/tibt:jasubjoined": "\u0F97",
+    "/tibt:nyasubjoined": "\u0F99",
+    "/tibt:ttasubjoined": "\u0F9A",
+    "/tibt:tthasubjoined": "\u0F9B",
+    "/tibt:ddasubjoined": "\u0F9C",
+    "/tibt:ddhasubjoined": "\u0F9D",
+    "/tibt:nnasubjoined": "\u0F9E",
+    "/tibt:tasubjoined": "\u0F9F",
+    "/tibt:thasubjoined": "\u0FA0",
+    "/tibt:dasubjoined": "\u0FA1",
+    "/tibt:dhasubjoined": "\u0FA2",
+    "/tibt:nasubjoined": "\u0FA3",
+    "/tibt:pasubjoined": "\u0FA4",
+    "/tibt:phasubjoined": "\u0FA5",
+    "/tibt:basubjoined": "\u0FA6",
+    "/tibt:bhasubjoined": "\u0FA7",
+    "/tibt:masubjoined": "\u0FA8",
+    "/tibt:tsasubjoined": "\u0FA9",
+    "/tibt:tshasubjoined": "\u0FAA",
+    "/tibt:dzasubjoined": "\u0FAB",
+    "/tibt:dzhasubjoined": "\u0FAC",
+    "/tibt:wasubjoined": "\u0FAD",
+    "/tibt:zhasubjoined": "\u0FAE",
+    "/tibt:zasubjoined": "\u0FAF",
+    "/tibt:subjoinedAA": "\u0FB0",
+    "/tibt:yasubjoined": "\u0FB1",
+    "/tibt:rasubjoined": "\u0FB2",
+    "/tibt:lasubjoined": "\u0FB3",
+    "/tibt:shasubjoined": "\u0FB4",
+    "/tibt:ssasubjoined": "\u0FB5",
+    "/tibt:sasubjoined": "\u0FB6",
+    "/tibt:hasubjoined": "\u0FB7",
+    "/tibt:asubjoined": "\u0FB8",
+    "/tibt:kssasubjoined": "\u0FB9",
+    "/tibt:wasubjoinedfixed": "\u0FBA",
+    "/tibt:yasubjoinedfixed": "\u0FBB",
+    "/tibt:rasubjoinedfixed": "\u0FBC",
+    "/tibt:kurukha": "\u0FBE",
+    "/tibt:kurukhabzhimigcan": "\u0FBF",
+    "/tibt:heavybeatcantillationsign": "\u0FC0",
+    "/tibt:lightbeatcantillationsign": "\u0FC1",
+    "/tibt:cangteucantillationsign": "\u0FC2",
+    "/tibt:sbubchalcantillationsign": "\u0FC3",
+    "/tibt:drilbusymbol": "\u0FC4",
+    "/tibt:rdorjesymbol": "\u0FC5",
+    "/tibt:padmagdansymbol": "\u0FC6",
+    "/tibt:rdorjergyagramsymbol": "\u0FC7",
+    "/tibt:phurpasymbol": "\u0FC8",
+    "/tibt:norbusymbol": "\u0FC9",
+    "/tibt:norbunyiskhyilsymbol": "\u0FCA",
+    "/tibt:norbugsumkhyilsymbol": "\u0FCB",
+    "/tibt:norbubzhikhyilsymbol": "\u0FCC",
+    "/tibt:rdelnagrdeldkarsign": "\u0FCE",
+    "/tibt:rdelnaggsumsign": "\u0FCF",
+    "/tibt:bskashoggimgorgyanmark": "\u0FD0",
+    "/tibt:mnyamyiggimgorgyanmark": "\u0FD1",
+    "/tibt:nyistshegmark": "\u0FD2",
+    "/tibt:brdarnyingyigmgomdunmainitialmark": "\u0FD3",
+    "/tibt:brdarnyingyigmgosgabmaclosingmark": "\u0FD4",
+    "/tibt:svastiright": "\u0FD5",
+    "/tibt:svastileft": "\u0FD6",
+    "/tibt:svastirightdot": "\u0FD7",
+    "/tibt:svastileftdot": "\u0FD8",
+    "/tibt:leadingmchanrtagsmark": "\u0FD9",
+    "/tibt:trailingmchanrtagsmark": "\u0FDA",
+    "/AnGeok": "\u10A0",
+    "/BanGeok": "\u10A1",
+    "/GanGeok": "\u10A2",
+    "/DonGeok": "\u10A3",
+    "/EnGeok": "\u10A4",
+    "/VinGeok": "\u10A5",
+    "/ZenGeok": "\u10A6",
+    "/TanGeok": "\u10A7",
+    "/InGeok": "\u10A8",
+    "/KanGeok": "\u10A9",
+    "/LasGeok": "\u10AA",
+    "/ManGeok": "\u10AB",
+    "/NarGeok": "\u10AC",
+    "/OnGeok": "\u10AD",
+    "/ParGeok": "\u10AE",
+    "/ZharGeok": "\u10AF",
+    "/RaeGeok": "\u10B0",
+    "/SanGeok": "\u10B1",
+    "/TarGeok": "\u10B2",
+    "/UnGeok": "\u10B3",
+    "/PharGeok": "\u10B4",
+    "/KharGeok": "\u10B5",
+    "/GhanGeok": "\u10B6",
+    "/QarGeok": "\u10B7",
+    "/ShinGeok": "\u10B8",
+    "/ChinGeok": "\u10B9",
+    "/CanGeok": "\u10BA",
+    "/JilGeok": "\u10BB",
+    "/CilGeok": "\u10BC",
+    "/CharGeok": "\u10BD",
+    "/XanGeok": "\u10BE",
+    "/JhanGeok": "\u10BF",
+    "/HaeGeok": "\u10C0",
+    "/HeGeok": "\u10C1",
+    "/HieGeok": "\u10C2",
+    "/WeGeok": "\u10C3",
+    "/HarGeok": "\u10C4",
+    "/HoeGeok": "\u10C5",
+    "/YnGeok": "\u10C7",
+    "/AenGeok": "\u10CD",
+    "/anGeor": "\u10D0",
+    "/banGeor": "\u10D1",
+    "/ganGeor": "\u10D2",
+    "/donGeor": "\u10D3",
+    "/enGeor": "\u10D4",
+    "/vinGeor": "\u10D5",
+    "/zenGeor": "\u10D6",
+    "/tanGeor": "\u10D7",
+    "/inGeor": "\u10D8",
+    "/kanGeor": "\u10D9",
+    "/lasGeor": "\u10DA",
+    "/manGeor": "\u10DB",
+    "/narGeor": "\u10DC",
+    "/onGeor": "\u10DD",
+    "/parGeor": "\u10DE",
+    "/zharGeor": "\u10DF",
+    "/raeGeor": "\u10E0",
+    "/sanGeor": "\u10E1",
+    "/tarGeor": "\u10E2",
+    "/unGeor": "\u10E3",
+    "/pharGeor": "\u10E4",
+    "/kharGeor": "\u10E5",
+    "/ghanGeor": "\u10E6",
+    "/qarGeor": "\u10E7",
+    "/shinGeor": "\u10E8",
+    "/chinGeor": "\u10E9",
+    "/canGeor": "\u10EA",
+    "/jilGeor": "\u10EB",
+    "/cilGeor": "\u10EC",
+    "/charGeor": "\u10ED",
+    "/xanGeor": "\u10EE",
+    "/jhanGeor": "\u10EF",
+    "/haeGeor": "\u10F0",
+    "/heGeor": "\u10F1",
+    "/hieGeor": "\u10F2",
+    "/weGeor": "\u10F3",
+    "/harGeor": "\u10F4",
+    "/hoeGeor": "\u10F5",
+    "/fiGeor": "\u10F6",
+    "/ynGeor": "\u10F7",
+    "/elifiGeor": "\u10F8",
+    "/turnedganGeor": "\u10F9",
+    "/ainGeor": "\u10FA",
+    "/geor:paragraphseparator": "\u10FB",
+    "/narmodGeor": "\u10FC",
+    "/aenGeor": "\u10FD",
+    "/hardsignGeor": "\u10FE",
+    "/labialsignGeor": "\u10FF",
+    "/ko:kiyeokchoseong": "\u1100",
+    "/ko:ssangkiyeokchoseong": "\u1101",
+    "/ko:nieunchoseong": "\u1102",
+    "/ko:tikeutchoseong": "\u1103",
+    "/ko:ssangtikeutchoseong": "\u1104",
+    "/ko:rieulchoseong": "\u1105",
+    "/ko:mieumchoseong": "\u1106",
+    "/ko:pieupchoseong": "\u1107",
+    "/ko:ssangpieupchoseong": "\u1108",
+    "/ko:sioschoseong": "\u1109",
+    "/ko:ssangsioschoseong": "\u110A",
+    "/ko:ieungchoseong": "\u110B",
+    "/ko:cieucchoseong": "\u110C",
+    "/ko:ssangcieucchoseong": "\u110D",
+    "/ko:chieuchchoseong": "\u110E",
+    "/ko:khieukhchoseong": "\u110F",
+    "/ko:thieuthchoseong": "\u1110",
+    "/ko:phieuphchoseong": "\u1111",
+    "/ko:hieuhchoseong": "\u1112",
+    "/ko:nieunkiyeokchoseong": "\u1113",
+    "/ko:ssangnieunchoseong": "\u1114",
+    "/ko:nieuntikeutchoseong": "\u1115",
+    "/ko:nieunpieupchoseong": "\u1116",
+    "/ko:tikeutkiyeokchoseong": "\u1117",
+    "/ko:rieulnieunchoseong": "\u1118",
+    "/ko:ssangrieulchoseong": "\u1119",
+    "/ko:rieulhieuhchoseong": "\u111A",
+    "/ko:kapyeounrieulchoseong": "\u111B",
+    "/ko:mieumpieupchoseong": "\u111C",
+    "/ko:kapyeounmieumchoseong": "\u111D",
+    "/ko:pieupkiyeokchoseong": "\u111E",
+    "/ko:pieupnieunchoseong": "\u111F",
+    "/ko:pieuptikeutchoseong": "\u1120",
+    "/ko:pieupsioschoseong": "\u1121",
+    "/ko:pieupsioskiyeokchoseong": "\u1122",
+    "/ko:pieupsiostikeutchoseong": "\u1123",
+    "/ko:pieupsiospieupchoseong": "\u1124",
+    "/ko:pieupssangsioschoseong": "\u1125",
+    "/ko:pieupsioscieucchoseong": "\u1126",
+    "/ko:pieupcieucchoseong": "\u1127",
+    "/ko:pieupchieuchchoseong": "\u1128",
+    "/ko:pieupthieuthchoseong": "\u1129",
+    "/ko:pieupphieuphchoseong": "\u112A",
+    "/ko:kapyeounpieupchoseong": "\u112B",
+    "/ko:kapyeounssangpieupchoseong": "\u112C",
+    "/ko:sioskiyeokchoseong": "\u112D",
+    "/ko:siosnieunchoseong": "\u112E",
+    "/ko:siostikeutchoseong": "\u112F",
+    "/ko:siosrieulchoseong": "\u1130",
+    "/ko:siosmieumchoseong": "\u1131",
+    "/ko:siospieupchoseong": "\u1132",
+    "/ko:siospieupkiyeokchoseong": "\u1133",
+    "/ko:siosssangsioschoseong": "\u1134",
+    "/ko:siosieungchoseong": "\u1135",
+    "/ko:sioscieucchoseong": "\u1136",
+    "/ko:sioschieuchchoseong": "\u1137",
+    "/ko:sioskhieukhchoseong": "\u1138",
+    "/ko:siosthieuthchoseong": "\u1139",
+    "/ko:siosphieuphchoseong": "\u113A",
+    "/ko:sioshieuhchoseong": "\u113B",
+    "/ko:chitueumsioschoseong": "\u113C",
+    "/ko:chitueumssangsioschoseong": "\u113D",
+    "/ko:ceongchieumsioschoseong": "\u113E",
+    "/ko:ceongchieumssangsioschoseong": "\u113F",
+    "/ko:pansioschoseong": "\u1140",
+    "/ko:ieungkiyeokchoseong": "\u1141",
+    "/ko:ieungtikeutchoseong": "\u1142",
+    "/ko:ieungmieumchoseong": "\u1143",
+    "/ko:ieungpieupchoseong": "\u1144",
+    "/ko:ieungsioschoseong": "\u1145",
+    "/ko:ieungpansioschoseong": "\u1146",
+    "/ko:ssangieungchoseong": "\u1147",
+    "/ko:ieungcieucchoseong": "\u1148",
+    "/ko:ieungchieuchchoseong": "\u1149",
+    "/ko:ieungthieuthchoseong": "\u114A",
+    "/ko:ieungphieuphchoseong": "\u114B",
+    "/ko:yesieungchoseong": "\u114C",
+    "/ko:cieucieungchoseong": "\u114D",
+    "/ko:chitueumcieucchoseong": "\u114E",
+    "/ko:chitueumssangcieucchoseong": "\u114F",
+    "/ko:ceongchieumcieucchoseong": "\u1150",
+    "/ko:ceongchieumssangcieucchoseong": "\u1151",
+    "/ko:chieuchkhieukhchoseong": "\u1152",
+    "/ko:chieuchhieuhchoseong": "\u1153",
+    "/ko:chitueumchieuchchoseong": "\u1154",
+    "/ko:ceongchieumchieuchchoseong": "\u1155",
+    "/ko:phieuphpieupchoseong": "\u1156",
+    "/ko:kapyeounphieuphchoseong": "\u1157",
+    "/ko:ssanghieuhchoseong": "\u1158",
+    "/ko:yeorinhieuhchoseong": "\u1159",
+    "/ko:kiyeoktikeutchoseong": "\u115A",
+    "/ko:nieunsioschoseong": "\u115B",
+    "/ko:nieuncieucchoseong": "\u115C",
+    "/ko:nieunhieuhchoseong": "\u115D",
+    "/ko:tikeutrieulchoseong": "\u115E",
+    "/ko:fillerchoseong": "\u115F",
+    "/ko:fillerjungseong": "\u1160",
+    "/ko:ajungseong": "\u1161",
+    "/ko:aejungseong": "\u1162",
+    "/ko:yajungseong": "\u1163",
+    "/ko:yaejungseong": "\u1164",
+    "/ko:eojungseong": "\u1165",
+    "/ko:ejungseong": "\u1166",
+    "/ko:yeojungseong": "\u1167",
+    "/ko:yejungseong": "\u1168",
+    "/ko:ojungseong": "\u1169",
+    "/ko:wajungseong": "\u116A",
+    "/ko:waejungseong": "\u116B",
+    "/ko:oejungseong": "\u116C",
+    "/ko:yojungseong": "\u116D",
+    "/ko:ujungseong": "\u116E",
+    "/ko:weojungseong": "\u116F",
+    "/ko:wejungseong": "\u1170",
+    "/ko:wijungseong": "\u1171",
+    "/ko:yujungseong": "\u1172",
+    "/ko:eujungseong": "\u1173",
+    "/ko:yijungseong": "\u1174",
+    "/ko:ijungseong": "\u1175",
+    "/ko:aojungseong": "\u1176",
+    "/ko:aujungseong": "\u1177",
+    "/ko:yaojungseong": "\u1178",
+    "/ko:yayojungseong": "\u1179",
+    "/ko:eoojungseong": "\u117A",
+    "/ko:eoujungseong": "\u117B",
+    "/ko:eo_eujungseong": "\u117C",
+    "/ko:yeoojungseong": "\u117D",
+    "/ko:yeoujungseong": "\u117E",
+    "/ko:o_eojungseong": "\u117F",
+    "/ko:o_ejungseong": "\u1180",
+    "/ko:oyejungseong": "\u1181",
+    "/ko:oojungseong": "\u1182",
+    "/ko:oujungseong": "\u1183",
+    "/ko:yoyajungseong": "\u1184",
+    "/ko:yoyaejungseong": "\u1185",
+    "/ko:yoyeojungseong": "\u1186",
+    "/ko:yoojungseong": "\u1187",
+    "/ko:yoijungseong": "\u1188",
+    "/ko:uajungseong": "\u1189",
+    "/ko:uaejungseong": "\u118A",
+    "/ko:ueo_eujungseong": "\u118B",
+    "/ko:uyejungseong": "\u118C",
+    "/ko:uujungseong": "\u118D",
+    "/ko:yuajungseong": "\u118E",
+    "/ko:yueojungseong": "\u118F",
+    "/ko:yuejungseong": "\u1190",
+    "/ko:yuyeojungseong": "\u1191",
+    "/ko:yuyejungseong": "\u1192",
+    "/ko:yuujungseong": "\u1193",
+    "/ko:yuijungseong": "\u1194",
+    "/ko:euujungseong": "\u1195",
+    "/ko:eueujungseong": "\u1196",
+    "/ko:yiujungseong": "\u1197",
+    "/ko:iajungseong": "\u1198",
+    "/ko:iyajungseong": "\u1199",
+    "/ko:iojungseong": "\u119A",
+    "/ko:iujungseong": "\u119B",
+    "/ko:ieujungseong": "\u119C",
+    "/ko:iaraeajungseong": "\u119D",
+    "/ko:araeajungseong": "\u119E",
+    "/ko:araeaeojungseong": "\u119F",
+    "/ko:araeaujungseong": "\u11A0",
+    "/ko:araeaijungseong": "\u11A1",
+    "/ko:ssangaraeajungseong": "\u11A2",
+    "/ko:aeujungseong": "\u11A3",
+    "/ko:yaujungseong": "\u11A4",
+    "/ko:yeoyajungseong": "\u11A5",
+    "/ko:oyajungseong": "\u11A6",
+    "/ko:oyaejungseong": "\u11A7",
+    "/ko:kiyeokjongseong": "\u11A8",
+    "/ko:ssangkiyeokjongseong": "\u11A9",
+    "/ko:kiyeoksiosjongseong": "\u11AA",
+    "/ko:nieunjongseong": "\u11AB",
+    "/ko:nieuncieucjongseong": "\u11AC",
+    "/ko:nieunhieuhjongseong": "\u11AD",
+    "/ko:tikeutjongseong": "\u11AE",
+    "/ko:rieuljongseong": "\u11AF",
+    "/ko:rieulkiyeokjongseong": "\u11B0",
+    "/ko:rieulmieumjongseong": "\u11B1",
+    "/ko:rieulpieupjongseong": "\u11B2",
+    "/ko:rieulsiosjongseong": "\u11B3",
+    "/ko:rieulthieuthjongseong": "\u11B4",
+    "/ko:rieulphieuphjongseong": "\u11B5",
+    "/ko:rieulhieuhjongseong": "\u11B6",
+    "/ko:mieumjongseong": "\u11B7",
+    "/ko:pieupjongseong": "\u11B8",
+    "/ko:pieupsiosjongseong": "\u11B9",
+    "/ko:siosjongseong": "\u11BA",
+    "/ko:ssangsiosjongseong": "\u11BB",
+    "/ko:ieungjongseong": "\u11BC",
+    "/ko:cieucjongseong": "\u11BD",
+    "/ko:chieuchjongseong": "\u11BE",
+    "/ko:khieukhjongseong": "\u11BF",
+    "/ko:thieuthjongseong": "\u11C0",
+    "/ko:phieuphjongseong": "\u11C1",
+    "/ko:hieuhjongseong": "\u11C2",
+    "/ko:kiyeokrieuljongseong": "\u11C3",
+    "/ko:kiyeoksioskiyeokjongseong": "\u11C4",
+    "/ko:nieunkiyeokjongseong": "\u11C5",
+    "/ko:nieuntikeutjongseong": "\u11C6",
+    "/ko:nieunsiosjongseong": "\u11C7",
+    "/ko:nieunpansiosjongseong": "\u11C8",
+    "/ko:nieunthieuthjongseong": "\u11C9",
+    "/ko:tikeutkiyeokjongseong": "\u11CA",
+    "/ko:tikeutrieuljongseong": "\u11CB",
+    "/ko:rieulkiyeoksiosjongseong": "\u11CC",
+    "/ko:rieulnieunjongseong": "\u11CD",
+    "/ko:rieultikeutjongseong": "\u11CE",
+    "/ko:rieultikeuthieuhjongseong": "\u11CF",
+    "/ko:ssangrieuljongseong": "\u11D0",
+    "/ko:rieulmieumkiyeokjongseong": "\u11D1",
+    "/ko:rieulmieumsiosjongseong": "\u11D2",
+    "/ko:rieulpieupsiosjongseong": "\u11D3",
+    "/ko:rieulpieuphieuhjongseong": "\u11D4",
+    "/ko:rieulkapyeounpieupjongseong": "\u11D5",
+    "/ko:rieulssangsiosjongseong": "\u11D6",
+    "/ko:rieulpansiosjongseong": "\u11D7",
+    "/ko:rieulkhieukhjongseong": "\u11D8",
+    "/ko:rieulyeorinhieuhjongseong": "\u11D9",
+    "/ko:mieumkiyeokjongseong": "\u11DA",
+    "/ko:mieumrieuljongseong": "\u11DB",
+    "/ko:mieumpieupjongseong": "\u11DC",
+    "/ko:mieumsiosjongseong": "\u11DD",
+    "/ko:mieumssangsiosjongseong": "\u11DE",
+    "/ko:mieumpansiosjongseong": "\u11DF",
+    "/ko:mieumchieuchjongseong": "\u11E0",
+    "/ko:mieumhieuhjongseong": "\u11E1",
+    "/ko:kapyeounmieumjongseong": "\u11E2",
+    "/ko:pieuprieuljongseong": "\u11E3",
+    "/ko:pieupphieuphjongseong": "\u11E4",
+    "/ko:pieuphieuhjongseong": "\u11E5",
+    "/ko:kapyeounpieupjongseong": "\u11E6",
+    "/ko:sioskiyeokjongseong": "\u11E7",
+    "/ko:siostikeutjongseong": "\u11E8",
+    "/ko:siosrieuljongseong": "\u11E9",
+    "/ko:siospieupjongseong": "\u11EA",
+    "/ko:pansiosjongseong": "\u11EB",
+    "/ko:ieungkiyeokjongseong": "\u11EC",
+    "/ko:ieungssangkiyeokjongseong": "\u11ED",
+    "/ko:ssangieungjongseong": "\u11EE",
+    "/ko:ieungkhieukhjongseong": "\u11EF",
+    "/ko:yesieungjongseong": "\u11F0",
+    "/ko:yesieungsiosjongseong": "\u11F1",
+    "/ko:yesieungpansiosjongseong": "\u11F2",
+    "/ko:phieuphpieupjongseong": "\u11F3",
+    "/ko:kapyeounphieuphjongseong": "\u11F4",
+    "/ko:hieuhnieunjongseong": "\u11F5",
+    "/ko:hieuhrieuljongseong": "\u11F6",
+    "/ko:hieuhmieumjongseong": "\u11F7",
+    "/ko:hieuhpieupjongseong": "\u11F8",
+    "/ko:yeorinhieuhjongseong": "\u11F9",
+    "/ko:kiyeoknieunjongseong": "\u11FA",
+    "/ko:kiyeokpieupjongseong": "\u11FB",
+    "/ko:kiyeokchieuchjongseong": "\u11FC",
+    "/ko:kiyeokkhieukhjongseong": "\u11FD",
+    "/ko:kiyeokhieuhjongseong": "\u11FE",
+    "/ko:ssangnieunjongseong": "\u11FF",
+    "/ethi:ha": "\u1200",
+    "/ethi:hu": "\u1201",
+    "/ethi:hi": "\u1202",
+    "/ethi:haa": "\u1203",
+    "/ethi:hee": "\u1204",
+    "/ethi:he": "\u1205",
+    "/ethi:ho": "\u1206",
+    "/ethi:hoa": "\u1207",
+    "/ethi:la": "\u1208",
+    "/ethi:lu": "\u1209",
+    "/ethi:li": "\u120A",
+    "/ethi:laa": "\u120B",
+    "/ethi:lee": "\u120C",
+    "/ethi:le": "\u120D",
+    "/ethi:lo": "\u120E",
+    "/ethi:lwa": "\u120F",
+    "/ethi:hha": "\u1210",
+    "/ethi:hhu": "\u1211",
+    "/ethi:hhi": "\u1212",
+    "/ethi:hhaa": "\u1213",
+    "/ethi:hhee": "\u1214",
+    "/ethi:hhe": "\u1215",
+    "/ethi:hho": "\u1216",
+    "/ethi:hhwa": "\u1217",
+    "/ethi:ma": "\u1218",
+    "/ethi:mu": "\u1219",
+    "/ethi:mi": "\u121A",
+    "/ethi:maa": "\u121B",
+    "/ethi:mee": "\u121C",
+    "/ethi:me": "\u121D",
+    "/ethi:mo": "\u121E",
+    "/ethi:mwa": "\u121F",
+    "/ethi:sza": "\u1220",
+    "/ethi:szu": "\u1221",
+    "/ethi:szi": "\u1222",
+    "/ethi:szaa": "\u1223",
+    "/ethi:szee": "\u1224",
+    "/ethi:sze": "\u1225",
+    "/ethi:szo": "\u1226",
+    "/ethi:szwa": "\u1227",
+    "/ethi:ra": "\u1228",
+    "/ethi:ru": "\u1229",
+    "/ethi:ri": "\u122A",
+    "/ethi:raa": "\u122B",
+    "/ethi:ree": "\u122C",
+    "/ethi:re": "\u122D",
+    "/ethi:ro": "\u122E",
+    "/ethi:rwa": "\u122F",
+    "/ethi:sa": "\u1230",
+    "/ethi:su": "\u1231",
+    "/ethi:si": "\u1232",
+    "/ethi:saa": "\u1233",
+    "/ethi:see": "\u1234",
+    "/ethi:se": "\u1235",
+    "/ethi:so": "\u1236",
+    "/ethi:swa": "\u1237",
+    "/ethi:sha": "\u1238",
+    "/ethi:shu": "\u1239",
+    "/ethi:shi": "\u123A",
+    "/ethi:shaa": "\u123B",
+    "/ethi:shee": "\u123C",
+    "/ethi:she": "\u123D",
+    "/ethi:sho": "\u123E",
+    "/ethi:shwa": "\u123F",
+    "/ethi:qa": "\u1240",
+    "/ethi:qu": "\u1241",
+    "/ethi:qi": "\u1242",
+    "/ethi:qaa": "\u1243",
+    "/ethi:qee": "\u1244",
+    "/ethi:qe": "\u1245",
+    "/ethi:qo": "\u1246",
+    "/ethi:qoa": "\u1247",
+    "/ethi:qwa": "\u1248",
+    "/ethi:qwi": "\u124A",
+    "/ethi:qwaa": "\u124B",
+    "/ethi:qwee": "\u124C",
+    "/ethi:qwe": "\u124D",
+    "/ethi:qha": "\u1250",
+    "/ethi:qhu": "\u1251",
+    "/ethi:qhi": "\u1252",
+    "/ethi:qhaa": "\u1253",
+    "/ethi:qhee": "\u1254",
+    "/ethi:qhe": "\u1255",
+    "/ethi:qho": "\u1256",
+    "/ethi:qhwa": "\u1258",
+    "/ethi:qhwi": "\u125A",
+    "/ethi:qhwaa": "\u125B",
+    "/ethi:qhwee": "\u125C",
+    "/ethi:qhwe": "\u125D",
+    "/ethi:ba": "\u1260",
+    "/ethi:bu": "\u1261",
+    "/ethi:bi": "\u1262",
+    "/ethi:baa": "\u1263",
+    "/ethi:bee": "\u1264",
+    "/ethi:be": "\u1265",
+    "/ethi:bo": "\u1266",
+    "/ethi:bwa": "\u1267",
+    "/ethi:va": "\u1268",
+    "/ethi:vu": "\u1269",
+    "/ethi:vi": "\u126A",
+    "/ethi:vaa": "\u126B",
+    "/ethi:vee": "\u126C",
+    "/ethi:ve": "\u126D",
+    "/ethi:vo": "\u126E",
+    "/ethi:vwa": "\u126F",
+    "/ethi:ta": "\u1270",
+    "/ethi:tu": "\u1271",
+    "/ethi:ti": "\u1272",
+    "/ethi:taa": "\u1273",
+    "/ethi:tee": "\u1274",
+    "/ethi:te": "\u1275",
+    "/ethi:to": "\u1276",
+    "/ethi:twa": "\u1277",
+    "/ethi:ca": "\u1278",
+    "/ethi:cu": "\u1279",
+    "/ethi:ci": "\u127A",
+    "/ethi:caa": "\u127B",
+    "/ethi:cee": "\u127C",
+    "/ethi:ce": "\u127D",
+    "/ethi:co": "\u127E",
+    "/ethi:cwa": "\u127F",
+    "/ethi:xa": "\u1280",
+    "/ethi:xu": "\u1281",
+    "/ethi:xi": "\u1282",
+    "/ethi:xaa": "\u1283",
+    "/ethi:xee": "\u1284",
+    "/ethi:xe": "\u1285",
+    "/ethi:xo": "\u1286",
+    "/ethi:xoa": "\u1287",
+    "/ethi:xwa": "\u1288",
+    "/ethi:xwi": "\u128A",
+    "/ethi:xwaa": "\u128B",
+    "/ethi:xwee": "\u128C",
+    "/ethi:xwe": "\u128D",
+    "/ethi:na": "\u1290",
+    "/ethi:nu": "\u1291",
+    "/ethi:ni": "\u1292",
+    "/ethi:naa": "\u1293",
+    "/ethi:nee": "\u1294",
+    "/ethi:ne": "\u1295",
+    "/ethi:no": "\u1296",
+    "/ethi:nwa": "\u1297",
+    "/ethi:nya": "\u1298",
+    "/ethi:nyu": "\u1299",
+    "/ethi:nyi": "\u129A",
+    "/ethi:nyaa": "\u129B",
+    "/ethi:nyee": "\u129C",
+    "/ethi:nye": "\u129D",
+    "/ethi:nyo": "\u129E",
+    "/ethi:nywa": "\u129F",
+    "/ethi:aglottal": "\u12A0",
+    "/ethi:uglottal": "\u12A1",
+    "/ethi:iglottal": "\u12A2",
+    "/ethi:aaglottal": "\u12A3",
+    "/ethi:eeglottal": "\u12A4",
+    "/ethi:eglottal": "\u12A5",
+    "/ethi:oglottal": "\u12A6",
+    "/ethi:waglottal": "\u12A7",
+    "/ethi:ka": "\u12A8",
+    "/ethi:ku": "\u12A9",
+    "/ethi:ki": "\u12AA",
+    "/ethi:kaa": "\u12AB",
+    "/ethi:kee": "\u12AC",
+    "/ethi:ke": "\u12AD",
+    "/ethi:ko": "\u12AE",
+    "/ethi:koa": "\u12AF",
+    "/ethi:kwa": "\u12B0",
+    "/ethi:kwi": "\u12B2",
+    "/ethi:kwaa": "\u12B3",
+    "/ethi:kwee": "\u12B4",
+    "/ethi:kwe": "\u12B5",
+    "/ethi:kxa": "\u12B8",
+    "/ethi:kxu": "\u12B9",
+    "/ethi:kxi": "\u12BA",
+    "/ethi:kxaa": "\u12BB",
+    "/ethi:kxee": "\u12BC",
+    "/ethi:kxe": "\u12BD",
+    "/ethi:kxo": "\u12BE",
+    "/ethi:kxwa": "\u12C0",
+    "/ethi:kxwi": "\u12C2",
+    "/ethi:kxwaa": "\u12C3",
+    "/ethi:kxwee": "\u12C4",
+    "/ethi:kxwe": "\u12C5",
+    "/ethi:wa": "\u12C8",
+    "/ethi:wu": "\u12C9",
+    "/ethi:wi": "\u12CA",
+    "/ethi:waa": "\u12CB",
+    "/ethi:wee": "\u12CC",
+    "/ethi:we": "\u12CD",
+    "/ethi:wo": "\u12CE",
+    "/ethi:woa": "\u12CF",
+    "/ethi:pharyngeala": "\u12D0",
+    "/ethi:pharyngealu": "\u12D1",
+    "/ethi:pharyngeali": "\u12D2",
+    "/ethi:pharyngealaa": "\u12D3",
+    "/ethi:pharyngealee": "\u12D4",
+    "/ethi:pharyngeale": "\u12D5",
+    "/ethi:pharyngealo": "\u12D6",
+    "/ethi:za": "\u12D8",
+    "/ethi:zu": "\u12D9",
+    "/ethi:zi": "\u12DA",
+    "/ethi:zaa": "\u12DB",
+    "/ethi:zee": "\u12DC",
+    "/ethi:ze": "\u12DD",
+    "/ethi:zo": "\u12DE",
+    "/ethi:zwa": "\u12DF",
+    "/ethi:zha": "\u12E0",
+    "/ethi:zhu": "\u12E1",
+    "/ethi:zhi": "\u12E2",
+    "/ethi:zhaa": "\u12E3",
+    "/ethi:zhee": "\u12E4",
+    "/ethi:zhe": "\u12E5",
+    "/ethi:zho": "\u12E6",
+    "/ethi:zhwa": "\u12E7",
+    "/ethi:ya": "\u12E8",
+    "/ethi:yu": "\u12E9",
+    "/ethi:yi": "\u12EA",
+    "/ethi:yaa": "\u12EB",
+    "/ethi:yee": "\u12EC",
+    "/ethi:ye": "\u12ED",
+    "/ethi:yo": "\u12EE",
+    "/ethi:yoa": "\u12EF",
+    "/ethi:da": "\u12F0",
+    "/ethi:du": "\u12F1",
+    "/ethi:di": "\u12F2",
+    "/ethi:daa": "\u12F3",
+    "/ethi:dee": "\u12F4",
+    "/ethi:de": "\u12F5",
+    "/ethi:do": "\u12F6",
+    "/ethi:dwa": "\u12F7",
+    "/ethi:dda": "\u12F8",
+    "/ethi:ddu": "\u12F9",
+    "/ethi:ddi": "\u12FA",
+    "/ethi:ddaa": "\u12FB",
+    "/ethi:ddee": "\u12FC",
+    "/ethi:dde": "\u12FD",
+    "/ethi:ddo": "\u12FE",
+    "/ethi:ddwa": "\u12FF",
+    "/ethi:ja": "\u1300",
+    "/ethi:ju": "\u1301",
+    "/ethi:ji": "\u1302",
+    "/ethi:jaa": "\u1303",
+    "/ethi:jee": "\u1304",
+    "/ethi:je": "\u1305",
+    "/ethi:jo": "\u1306",
+    "/ethi:jwa": "\u1307",
+    "/ethi:ga": "\u1308",
+    "/ethi:gu": "\u1309",
+    "/ethi:gi": "\u130A",
+    "/ethi:gaa": "\u130B",
+    "/ethi:gee": "\u130C",
+    "/ethi:ge": "\u130D",
+    "/ethi:go": "\u130E",
+    "/ethi:goa": "\u130F",
+    "/ethi:gwa": "\u1310",
+    "/ethi:gwi": "\u1312",
+    "/ethi:gwaa": "\u1313",
+    "/ethi:gwee": "\u1314",
+    "/ethi:gwe": "\u1315",
+    "/ethi:gga": "\u1318",
+    "/ethi:ggu": "\u1319",
+    "/ethi:ggi": "\u131A",
+    "/ethi:ggaa": "\u131B",
+    "/ethi:ggee": "\u131C",
+    "/ethi:gge": "\u131D",
+    "/ethi:ggo": "\u131E",
+    "/ethi:ggwaa": "\u131F",
+    "/ethi:tha": "\u1320",
+    "/ethi:thu": "\u1321",
+    "/ethi:thi": "\u1322",
+    "/ethi:thaa": "\u1323",
+    "/ethi:thee": "\u1324",
+    "/ethi:the": "\u1325",
+    "/ethi:tho": "\u1326",
+    "/ethi:thwa": "\u1327",
+    "/ethi:cha": "\u1328",
+    "/ethi:chu": "\u1329",
+    "/ethi:chi": "\u132A",
+    "/ethi:chaa": "\u132B",
+    "/ethi:chee": "\u132C",
+    "/ethi:che": "\u132D",
+    "/ethi:cho": "\u132E",
+    "/ethi:chwa": "\u132F",
+    "/ethi:pha": "\u1330",
+    "/ethi:phu": "\u1331",
+    "/ethi:phi": "\u1332",
+    "/ethi:phaa": "\u1333",
+    "/ethi:phee": "\u1334",
+    "/ethi:phe": "\u1335",
+    "/ethi:pho": "\u1336",
+    "/ethi:phwa": "\u1337",
+    "/ethi:tsa": "\u1338",
+    "/ethi:tsu": "\u1339",
+    "/ethi:tsi": "\u133A",
+    "/ethi:tsaa": "\u133B",
+    "/ethi:tsee": "\u133C",
+    "/ethi:tse": "\u133D",
+    "/ethi:tso": "\u133E",
+    "/ethi:tswa": "\u133F",
+    "/ethi:tza": "\u1340",
+    "/ethi:tzu": "\u1341",
+    "/ethi:tzi": "\u1342",
+    "/ethi:tzaa": "\u1343",
+    "/ethi:tzee": "\u1344",
+    "/ethi:tze": "\u1345",
+    "/ethi:tzo": "\u1346",
+    "/ethi:tzoa": "\u1347",
+    "/ethi:fa": "\u1348",
+    "/ethi:fu": "\u1349",
+    "/ethi:fi": "\u134A",
+    "/ethi:faa": "\u134B",
+    "/ethi:fee": "\u134C",
+    "/ethi:fe": "\u134D",
+    "/ethi:fo": "\u134E",
+    "/ethi:fwa": "\u134F",
+    "/ethi:pa": "\u1350",
+    "/ethi:pu": "\u1351",
+    "/ethi:pi": "\u1352",
+    "/ethi:paa": "\u1353",
+    "/ethi:pee": "\u1354",
+    "/ethi:pe": "\u1355",
+    "/ethi:po": "\u1356",
+    "/ethi:pwa": "\u1357",
+    "/ethi:rya": "\u1358",
+    "/ethi:mya": "\u1359",
+    "/ethi:fya": "\u135A",
+    "/ethi:geminationandvowellengthmarkcmb": "\u135D",
+    "/ethi:vowellengthmarkcmb": "\u135E",
+    "/ethi:geminationmarkcmb": "\u135F",
+    "/ethi:sectionmark": "\u1360",
+    "/ethi:wordspace": "\u1361",
+    "/ethi:fullstop": "\u1362",
+    "/ethi:comma": "\u1363",
+    "/ethi:semicolon": "\u1364",
+    "/ethi:colon": "\u1365",
+    "/ethi:prefacecolon": "\u1366",
+    "/ethi:questionmark": "\u1367",
+    "/ethi:paragraphseparator": "\u1368",
+    "/ethi:one": "\u1369",
+    "/ethi:two": "\u136A",
+    "/ethi:three": "\u136B",
+    "/ethi:four": "\u136C",
+    "/ethi:five": "\u136D",
+    "/ethi:six": "\u136E",
+    "/ethi:seven": "\u136F",
+    "/ethi:eight": "\u1370",
+    "/ethi:nine": "\u1371",
+    "/ethi:ten": "\u1372",
+    "/ethi:twenty": "\u1373",
+    "/ethi:thirty": "\u1374",
+    "/ethi:forty": "\u1375",
+    "/ethi:fifty": "\u1376",
+    "/ethi:sixty": "\u1377",
+    "/ethi:seventy": "\u1378",
+    "/ethi:eighty": "\u1379",
+    "/ethi:ninety": "\u137A",
+    "/ethi:hundred": "\u137B",
+    "/ethi:tenthousand": "\u137C",
+    "/ethi:mwasebatbeit": "\u1380",
+    "/ethi:mwi": "\u1381",
+    "/ethi:mwee": "\u1382",
+    "/ethi:mwe": "\u1383",
+    "/ethi:bwasebatbeit": "\u1384",
+    "/ethi:bwi": "\u1385",
+    "/ethi:bwee": "\u1386",
+    "/ethi:bwe": "\u1387",
+    "/ethi:fwasebatbeit": "\u1388",
+    "/ethi:fwi": "\u1389",
+    "/ethi:fwee": "\u138A",
+    "/ethi:fwe": "\u138B",
+    "/ethi:pwasebatbeit": "\u138C",
+    "/ethi:pwi": "\u138D",
+    "/ethi:pwee": "\u138E",
+    "/ethi:pwe": "\u138F",
+    "/ethi:yizet": "\u1390",
+    "/ethi:deret": "\u1391",
+    "/ethi:rikrik": "\u1392",
+    "/ethi:shortrikrik": "\u1393",
+    "/ethi:difat": "\u1394",
+    "/ethi:kenat": "\u1395",
+    "/ethi:chiret": "\u1396",
+    "/ethi:hidet": "\u1397",
+    "/ethi:derethidet": "\u1398",
+    "/ethi:kurt": "\u1399",
+    "/cher:a": "\u13A0",
+    "/cher:e": "\u13A1",
+    "/cher:i": "\u13A2",
+    "/cher:o": "\u13A3",
+    "/cher:u": "\u13A4",
+    "/cher:v": "\u13A5",
+    "/cher:ga": "\u13A6",
+    "/cher:ka": "\u13A7",
+    "/cher:ge": "\u13A8",
+    "/cher:gi": "\u13A9",
+    "/cher:go": "\u13AA",
+    "/cher:gu": "\u13AB",
+    "/cher:gv": "\u13AC",
+    "/cher:ha": "\u13AD",
+    "/cher:he": "\u13AE",
+    "/cher:hi": "\u13AF",
+    "/cher:ho": "\u13B0",
+    "/cher:hu": "\u13B1",
+    "/cher:hv": "\u13B2",
+    "/cher:la": "\u13B3",
+    "/cher:le": "\u13B4",
+    "/cher:li": "\u13B5",
+    "/cher:lo": "\u13B6",
+    "/cher:lu": "\u13B7",
+    "/cher:lv": "\u13B8",
+    "/cher:ma": "\u13B9",
+    "/cher:me": "\u13BA",
+    "/cher:mi": "\u13BB",
+    "/cher:mo": "\u13BC",
+    "/cher:mu": "\u13BD",
+    "/cher:na": "\u13BE",
+    "/cher:hna": "\u13BF",
+    "/cher:nah": "\u13C0",
+    "/cher:ne": "\u13C1",
+    "/cher:ni": "\u13C2",
+    "/cher:no": "\u13C3",
+    "/cher:nu": "\u13C4",
+    "/cher:nv": "\u13C5",
+    "/cher:qua": "\u13C6",
+    "/cher:que": "\u13C7",
+    "/cher:qui": "\u13C8",
+    "/cher:quo": "\u13C9",
+    "/cher:quu": "\u13CA",
+    "/cher:quv": "\u13CB",
+    "/cher:sa": "\u13CC",
+    "/cher:s": "\u13CD",
+    "/cher:se": "\u13CE",
+    "/cher:si": "\u13CF",
+    "/cher:so": "\u13D0",
+    "/cher:su": "\u13D1",
+    "/cher:sv": "\u13D2",
+    "/cher:da": "\u13D3",
+    "/cher:ta": "\u13D4",
+    "/cher:de": "\u13D5",
+    "/cher:te": "\u13D6",
+    "/cher:di": "\u13D7",
+    "/cher:ti": "\u13D8",
+    "/cher:do": "\u13D9",
+    "/cher:du": "\u13DA",
+    "/cher:dv": "\u13DB",
+    "/cher:dla": "\u13DC",
+    "/cher:tla": "\u13DD",
+    "/cher:tle": "\u13DE",
+    "/cher:tli": "\u13DF",
+    "/cher:tlo": "\u13E0",
+    "/cher:tlu": "\u13E1",
+    "/cher:tlv": "\u13E2",
+    "/cher:tsa": "\u13E3",
+    "/cher:tse": "\u13E4",
+    "/cher:tsi": "\u13E5",
+    "/cher:tso": "\u13E6",
+    "/cher:tsu": "\u13E7",
+    "/cher:tsv": "\u13E8",
+    "/cher:wa": "\u13E9",
+    "/cher:we": "\u13EA",
+    "/cher:wi": "\u13EB",
+    "/cher:wo": "\u13EC",
+    "/cher:wu": "\u13ED",
+    "/cher:wv": "\u13EE",
+    "/cher:ya": "\u13EF",
+    "/cher:ye": "\u13F0",
+    "/cher:yi": "\u13F1",
+    "/cher:yo": "\u13F2",
+    "/cher:yu": "\u13F3",
+    "/cher:yv": "\u13F4",
+    "/cher:mv": "\u13F5",
+    "/cher:yesmall": "\u13F8",
+    "/cher:yismall": "\u13F9",
+    "/cher:yosmall": "\u13FA",
+    "/cher:yusmall": "\u13FB",
+    "/cher:yvsmall": "\u13FC",
+    "/cher:mvsmall": "\u13FD",
+    "/runr:fehu_feoh_fe_f": "\u16A0",
+    "/runr:v": "\u16A1",
+    "/runr:uruz_ur_u": "\u16A2",
+    "/runr:yr": "\u16A3",
+    "/runr:y": "\u16A4",
+    "/runr:w": "\u16A5",
+    "/runr:thurisaz_thurs_thorn": "\u16A6",
+    "/runr:eth": "\u16A7",
+    "/runr:ansuz_a": "\u16A8",
+    "/runr:os_o": "\u16A9",
+    "/runr:ac_a": "\u16AA",
+    "/runr:aesc": "\u16AB",
+    "/runr:long_branch_oss_o": "\u16AC",
+    "/runr:short_twig_oss_o": "\u16AD",
+    "/runr:o": "\u16AE",
+    "/runr:oe": "\u16AF",
+    "/runr:on": "\u16B0",
+    "/runr:raido_rad_reid_r": "\u16B1",
+    "/runr:kauna": "\u16B2",
+    "/runr:cen": "\u16B3",
+    "/runr:kaun_k": "\u16B4",
+    "/runr:g": "\u16B5",
+    "/runr:eng": "\u16B6",
+    "/runr:gebo_gyfu_g": "\u16B7",
+    "/runr:gar": "\u16B8",
+    "/runr:wunjo_wynn_w": "\u16B9",
+    "/runr:haglaz_h": "\u16BA",
+    "/runr:haegl_h": "\u16BB",
+    "/runr:long_branch_hagall_h": "\u16BC",
+    "/runr:short_twig_hagall_h": "\u16BD",
+    "/runr:naudiz_nyd_naud_n": "\u16BE",
+    "/runr:short_twig_naud_n": "\u16BF",
+    "/runr:dotted_n": "\u16C0",
+    "/runr:isaz_is_iss_i": "\u16C1",
+    "/runr:e": "\u16C2",
+    "/runr:jeran_j": "\u16C3",
+    "/runr:ger": "\u16C4",
+    "/runr:long_branch_ar_ae": "\u16C5",
+    "/runr:short_twig_ar_a": "\u16C6",
+    "/runr:iwaz_eoh": "\u16C7",
+    "/runr:pertho_peorth_p": "\u16C8",
+    "/runr:algiz_eolhx": "\u16C9",
+    "/runr:sowilo_s": "\u16CA",
+    "/runr:sigel_long_branch_sol_s": "\u16CB",
+    "/runr:short_twig_sol_s": "\u16CC",
+    "/runr:c": "\u16CD",
+    "/runr:z": "\u16CE",
+    "/runr:tiwaz_tir_tyr_t": "\u16CF",
+    "/runr:short_twig_tyr_t": "\u16D0",
+    "/runr:d": "\u16D1",
+    "/runr:berkanan_beorc_bjarkan_b": "\u16D2",
+    "/runr:short_twig_bjarkan_b": "\u16D3",
+    "/runr:dotted_p": "\u16D4",
+    "/runr:open_p": "\u16D5",
+    "/runr:ehwaz_eh_e": "\u16D6",
+    "/runr:mannaz_man_m": "\u16D7",
+    "/runr:long_branch_madr_m": "\u16D8",
+    "/runr:short_twig_madr_m": "\u16D9",
+    "/runr:laukaz_lagu_logr_l": "\u16DA",
+    "/runr:dotted_l": "\u16DB",
+    "/runr:ingwaz": "\u16DC",
+    "/runr:ing": "\u16DD",
+    "/runr:dagaz_daeg_d": "\u16DE",
+    "/runr:othalan_ethel_o": "\u16DF",
+    "/runr:ear": "\u16E0",
+    "/runr:ior": "\u16E1",
+    "/runr:cweorth": "\u16E2",
+    "/runr:calc": "\u16E3",
+    "/runr:cealc": "\u16E4",
+    "/runr:stan": "\u16E5",
+    "/runr:long_branch_yr": "\u16E6",
+    "/runr:short_twig_yr": "\u16E7",
+    "/runr:icelandic_yr": "\u16E8",
+    "/runr:q": "\u16E9",
+    "/runr:x": "\u16EA",
+    "/runr:single_punctuation": "\u16EB",
+    "/runr:multiple_punctuation": "\u16EC",
+    "/runr:cross_punctuation": "\u16ED",
+    "/runr:arlaug_symbol": "\u16EE",
+    "/runr:tvimadur_symbol": "\u16EF",
+    "/runr:belgthor_symbol": "\u16F0",
+    "/runr:k": "\u16F1",
+    "/runr:sh": "\u16F2",
+    "/runr:oo": "\u16F3",
+    "/runr:franks_casket_os": "\u16F4",
+    "/runr:franks_casket_is": "\u16F5",
+    "/runr:franks_casket_eh": "\u16F6",
+    "/runr:franks_casket_ac": "\u16F7",
+    "/runr:franks_casket_aesc": "\u16F8",
+    "/mong:birga": "\u1800",
+    "/mong:ellipsis": "\u1801",
+    "/mong:comma": "\u1802",
+    "/mong:period": "\u1803",
+    "/mong:colon": "\u1804",
+    "/mong:fourdots": "\u1805",
+    "/mong:softhyphentodo": "\u1806",
+    "/mong:syllableboundarymarkersibe": "\u1807",
+    "/mong:commamanchu": "\u1808",
+    "/mong:periodmanchu": "\u1809",
+    "/mong:nirugu": "\u180A",
+    "/mong:freevariationselectorone": "\u180B",
+    "/mong:freevariationselectortwo": "\u180C",
+    "/mong:freevariationselectorthree": "\u180D",
+    "/mong:vowelseparator": "\u180E",
+    "/mong:freevariationselectorfour": "\u180F",
+    "/mong:zero": "\u1810",
+    "/mong:one": "\u1811",
+    "/mong:two": "\u1812",
+    "/mong:three": "\u1813",
+    "/mong:four": "\u1814",
+    "/mong:five": "\u1815",
+    "/mong:six": "\u1816",
+    "/mong:seven": "\u1817",
+    "/mong:eight": "\u1818",
+    "/mong:nine": "\u1819",
+    "/mong:a": "\u1820",
+    "/mong:e": "\u1821",
+    "/mong:i": "\u1822",
+    "/mong:o": "\u1823",
+    "/mong:u": "\u1824",
+    "/mong:oe": "\u1825",
+    "/mong:ue": "\u1826",
+    "/mong:ee": "\u1827",
+    "/mong:na": "\u1828",
+    "/mong:ang": "\u1829",
+    "/mong:ba": "\u182A",
+    "/mong:pa": "\u182B",
+    "/mong:qa": "\u182C",
+    "/mong:ga": "\u182D",
+    "/mong:ma": "\u182E",
+    "/mong:la": "\u182F",
+    "/mong:sa": "\u1830",
+    "/mong:sha": "\u1831",
+    "/mong:ta": "\u1832",
+    "/mong:da": "\u1833",
+    "/mong:cha": "\u1834",
+    "/mong:ja": "\u1835",
+    "/mong:ya": "\u1836",
+    "/mong:ra": "\u1837",
+    "/mong:wa": "\u1838",
+    "/mong:fa": "\u1839",
+    "/mong:ka": "\u183A",
+    "/mong:kha": "\u183B",
+    "/mong:tsa": "\u183C",
+    "/mong:za": "\u183D",
+    "/mong:haa": "\u183E",
+    "/mong:zra": "\u183F",
+    "/mong:lha": "\u1840",
+    "/mong:zhi": "\u1841",
+    "/mong:chi": "\u1842",
+    "/mong:longvowelsigntodo": "\u1843",
+    "/mong:etodo": "\u1844",
+    "/mong:itodo": "\u1845",
+    "/mong:otodo": "\u1846",
+    "/mong:utodo": "\u1847",
+    "/mong:oetodo": "\u1848",
+    "/mong:uetodo": "\u1849",
+    "/mong:angtodo": "\u184A",
+    "/mong:batodo": "\u184B",
+    "/mong:patodo": "\u184C",
+    "/mong:qatodo": "\u184D",
+    "/mong:gatodo": "\u184E",
+    "/mong:matodo": "\u184F",
+    "/mong:tatodo": "\u1850",
+    "/mong:datodo": "\u1851",
+    "/mong:chatodo": "\u1852",
+    "/mong:jatodo": "\u1853",
+    "/mong:tsatodo": "\u1854",
+    "/mong:yatodo": "\u1855",
+    "/mong:watodo": "\u1856",
+    "/mong:katodo": "\u1857",
+    "/mong:gaatodo": "\u1858",
+    "/mong:haatodo": "\u1859",
+    "/mong:jiatodo": "\u185A",
+    "/mong:niatodo": "\u185B",
+    "/mong:dzatodo": "\u185C",
+    "/mong:esibe": "\u185D",
+    "/mong:isibe": "\u185E",
+    "/mong:iysibe": "\u185F",
+    "/mong:uesibe": "\u1860",
+    "/mong:usibe": "\u1861",
+    "/mong:angsibe": "\u1862",
+    "/mong:kasibe": "\u1863",
+    "/mong:gasibe": "\u1864",
+    "/mong:hasibe": "\u1865",
+    "/mong:pasibe": "\u1866",
+    "/mong:shasibe": "\u1867",
+    "/mong:tasibe": "\u1868",
+    "/mong:dasibe": "\u1869",
+    "/mong:jasibe": "\u186A",
+    "/mong:fasibe": "\u186B",
+    "/mong:gaasibe": "\u186C",
+    "/mong:haasibe": "\u186D",
+    "/mong:tsasibe": "\u186E",
+    "/mong:zasibe": "\u186F",
+    "/mong:raasibe": "\u1870",
+    "/mong:chasibe": "\u1871",
+    "/mong:zhasibe": "\u1872",
+    "/mong:imanchu": "\u1873",
+    "/mong:kamanchu": "\u1874",
+    "/mong:ramanchu": "\u1875",
+    "/mong:famanchu": "\u1876",
+    "/mong:zhamanchu": "\u1877",
+    "/mong:chawithtwodots": "\u1878",
+    "/mong:anusvaraonealigali": "\u1880",
+    "/mong:visargaonealigali": "\u1881",
+    "/mong:damarualigali": "\u1882",
+    "/mong:ubadamaaligali": "\u1883",
+    "/mong:ubadamaaligaliinverted": "\u1884",
+    "/mong:baludaaligali": "\u1885",
+    "/mong:baludaaligalithree": "\u1886",
+    "/mong:aaligali": "\u1887",
+    "/mong:ialigali": "\u1888",
+    "/mong:kaaligali": "\u1889",
+    "/mong:ngaaligali": "\u188A",
+    "/mong:caaligali": "\u188B",
+    "/mong:ttaaligali": "\u188C",
+    "/mong:tthaaligali": "\u188D",
+    "/mong:ddaaligali": "\u188E",
+    "/mong:nnaaligali": "\u188F",
+    "/mong:taaligali": "\u1890",
+    "/mong:daaligali": "\u1891",
+    "/mong:paaligali": "\u1892",
+    "/mong:phaaligali": "\u1893",
+    "/mong:ssaaligali": "\u1894",
+    "/mong:zhaaligali": "\u1895",
+    "/mong:zaaligali": "\u1896",
+    "/mong:ahaligali": "\u1897",
+    "/mong:tatodoaligali": "\u1898",
+    "/mong:zhatodoaligali": "\u1899",
+    "/mong:ghamanchualigali": "\u189A",
+    "/mong:ngamanchualigali": "\u189B",
+    "/mong:camanchualigali": "\u189C",
+    "/mong:jhamanchualigali": "\u189D",
+    "/mong:ttamanchualigali": "\u189E",
+    "/mong:ddhamanchualigali": "\u189F",
+    "/mong:tamanchualigali": "\u18A0",
+    "/mong:dhamanchualigali": "\u18A1",
+    "/mong:ssamanchualigali": "\u18A2",
+    "/mong:cyamanchualigali": "\u18A3",
+    "/mong:zhamanchualigali": "\u18A4",
+    "/mong:zamanchualigali": "\u18A5",
+    "/mong:ualigalihalf": "\u18A6",
+    "/mong:yaaligalihalf": "\u18A7",
+    "/mong:bhamanchualigali": "\u18A8",
+    "/mong:dagalgaaligali": "\u18A9",
+    "/mong:lhamanchualigali": "\u18AA",
+    "/AnGeor": "\u1C90",
+    "/BanGeor": "\u1C91",
+    "/GanGeor": "\u1C92",
+    "/DonGeor": "\u1C93",
+    "/EnGeor": "\u1C94",
+    "/VinGeor": "\u1C95",
+    "/ZenGeor": "\u1C96",
+    "/TanGeor": "\u1C97",
+    "/InGeor": "\u1C98",
+    "/KanGeor": "\u1C99",
+    "/LasGeor": "\u1C9A",
+    "/ManGeor": "\u1C9B",
+    "/NarGeor": "\u1C9C",
+    "/OnGeor": "\u1C9D",
+    "/ParGeor": "\u1C9E",
+    "/ZharGeor": "\u1C9F",
+    "/RaeGeor": "\u1CA0",
+    "/SanGeor": "\u1CA1",
+    "/TarGeor": "\u1CA2",
+    "/UnGeor": "\u1CA3",
+    "/PharGeor": "\u1CA4",
+    "/KharGeor": "\u1CA5",
+    "/GhanGeor": "\u1CA6",
+    "/QarGeor": "\u1CA7",
+    "/ShinGeor": "\u1CA8",
+    "/ChinGeor": "\u1CA9",
+    "/CanGeor": "\u1CAA",
+    "/JilGeor": "\u1CAB",
+    "/CilGeor": "\u1CAC",
+    "/CharGeor": "\u1CAD",
+    "/XanGeor": "\u1CAE",
+    "/JhanGeor": "\u1CAF",
+    "/HaeGeor": "\u1CB0",
+    "/HeGeor": "\u1CB1",
+    "/HieGeor": "\u1CB2",
+    "/WeGeor": "\u1CB3",
+    "/HarGeor": "\u1CB4",
+    "/HoeGeor": "\u1CB5",
+    "/FiGeor": "\u1CB6",
+    "/YnGeor": "\u1CB7",
+    "/ElifiGeor": "\u1CB8",
+    "/TurnedganGeor": "\u1CB9",
+    "/AinGeor": "\u1CBA",
+    "/AenGeor": "\u1CBD",
+    "/HardsignGeor": "\u1CBE",
+    "/LabialsignGeor": "\u1CBF",
+    "/ve:karshanatone": "\u1CD0",
+    "/ve:sharatone": "\u1CD1",
+    "/ve:prenkhatone": "\u1CD2",
+    "/ve:nihshvasasign": "\u1CD3",
+    "/ve:yajurmidlinesvaritasign": "\u1CD4",
+    "/ve:yajuraggravatedindependentsvaritatone": "\u1CD5",
+    "/ve:yajurindependentsvaritatone": "\u1CD6",
+    "/ve:yajurkathakaindependentsvaritatone": "\u1CD7",
+    "/ve:belowtonecandra": "\u1CD8",
+    "/ve:yajurkathakaindependentsvaritaschroedertone": "\u1CD9",
+    "/ve:svaritatonedbl": "\u1CDA",
+    "/ve:svaritatonetpl": "\u1CDB",
+    "/ve:kathakaanudattatone": "\u1CDC",
+    "/ve:dotbelowtone": "\u1CDD",
+    "/ve:twodotsbelowtone": "\u1CDE",
+    "/ve:threedotsbelowtone": "\u1CDF",
+    "/ve:rigkashmiriindependentsvaritatone": "\u1CE0",
+    "/ve:atharvaindependentsvaritatone": "\u1CE1",
+    "/ve:visargasvaritasign": "\u1CE2",
+    "/ve:visargaudattasign": "\u1CE3",
+    "/ve:visargaudattasignreversed": "\u1CE4",
+    "/ve:visargaanudattasign": "\u1CE5",
+    "/ve:visargaanudattasignreversed": "\u1CE6",
+    "/ve:visargaudattawithtailsign": "\u1CE7",
+    "/ve:visargaanudattawithtailsign": "\u1CE8",
+    "/ve:anusvaraantargomukhasign": "\u1CE9",
+    "/ve:anusvarabahirgomukhasign": "\u1CEA",
+    "/ve:anusvaravamagomukhasign": "\u1CEB",
+    "/ve:anusvaravamagomukhawithtailsign": "\u1CEC",
+    "/ve:tiryaksign": "\u1CED",
+    "/ve:hexiformanusvarasignlong": "\u1CEE",
+    "/ve:anusvarasignlong": "\u1CEF",
+    "/ve:rthanganusvarasignlong": "\u1CF0",
+    "/ve:anusvaraubhayatomukhasign": "\u1CF1",
+    "/ve:ardhavisargasign": "\u1CF2",
+    "/ve:rotatedardhavisargasign": "\u1CF3",
+    "/ve:abovetonecandra": "\u1CF4",
+    "/ve:jihvamuliyasign": "\u1CF5",
+    "/ve:upadhmaniyasign": "\u1CF6",
+    "/ve:atikramasign": "\u1CF7",
+    "/ve:ringabovetone": "\u1CF8",
+    "/ve:ringabovetonedbl": "\u1CF9",
+    "/ve:anusvaraantargomukhasigndbl": "\u1CFA",
+    "/aeturned": "\u1D02",
+    "/Bbarsmall": "\u1D03",
+    "/eopenturned": "\u1D08",
+    "/iturned": "\u1D09",
+    "/Lsmallstroke": "\u1D0C",
+    "/Nsmallreversed": "\u1D0E",
+    "/Oopensmall": "\u1D10",
+    "/osideways": "\u1D11",
+    "/oopensideways": "\u1D12",
+    "/ostrokesideways": "\u1D13",
+    "/oeturned": "\u1D14",
+    "/OUsmall": "\u1D15",
+    "/otophalf": "\u1D16",
+    "/obottomhalf": "\u1D17",
+    "/Rsmallreversed": "\u1D19",
+    "/Rsmallturned": "\u1D1A",
+    "/usideways": "\u1D1D",
+    "/usidewaysdieresised": "\u1D1E",
+    "/mturnedsideways": "\u1D1F",
+    "/Ezhsmall": "\u1D23",
+    "/spirantvoicedlaryngeal": "\u1D24",
+    "/phon:ain": "\u1D25",
+    "/gr:Gammasmall": "\u1D26",
+    "/gr:Lambdasmall": "\u1D27",
+    "/gr:Pismall": "\u1D28",
+    "/gr:RsmallHO": "\u1D29",
+    "/gr:Psismall": "\u1D2A",
+    "/Elsmallcyr": "\u1D2B",
+    "/Amod": "\u1D2C",
+    "/Aemod": "\u1D2D",
+    "/Bmod": "\u1D2E",
+    "/Bbarmod": "\u1D2F",
+    "/Dmod": "\u1D30",
+    "/Emod": "\u1D31",
+    "/Ereversedmod": "\u1D32",
+    "/Gmod": "\u1D33",
+    "/Hmod": "\u1D34",
+    "/Imod": "\u1D35",
+    "/Jmod": "\u1D36",
+    "/Kmod": "\u1D37",
+    "/Lmod": "\u1D38",
+    "/Mmod": "\u1D39",
+    "/Nmod": "\u1D3A",
+    "/Nreversedmod": "\u1D3B",
+    "/Omod": "\u1D3C",
+    "/Oumod": "\u1D3D",
+    "/Pmod": "\u1D3E",
+    "/Rmod": "\u1D3F",
+    "/Tmod": "\u1D40",
+    "/Umod": "\u1D41",
+    "/Wmod": "\u1D42",
+    "/amod": "\u1D43",
+    "/aturnedmod": "\u1D44",
+    "/alphamod": "\u1D45",
+    "/aeturnedmod": "\u1D46",
+    "/bmod": "\u1D47",
+    "/dmod": "\u1D48",
+    "/emod": "\u1D49",
+    "/schwamod": "\u1D4A",
+    "/eopenmod": "\u1D4B",
+    "/eopenturnedmod": "\u1D4C",
+    "/gmod": "\u1D4D",
+    "/iturnedmod": "\u1D4E",
+    "/kmod": "\u1D4F",
+    "/mmod": "\u1D50",
+    "/engmod": "\u1D51",
+    "/omod": "\u1D52",
+    "/oopenmod": "\u1D53",
+    "/otophalfmod": "\u1D54",
+    "/obottomhalfmod": "\u1D55",
+    "/pmod": "\u1D56",
+    "/tmod": "\u1D57",
+    "/umod": "\u1D58",
+    "/usidewaysmod": "\u1D59",
+    "/mturnedmod": "\u1D5A",
+    "/vmod": "\u1D5B",
+    "/phon:ainmod": "\u1D5C",
+    "/betamod": "\u1D5D",
+    "/gr:gammamod": "\u1D5E",
+    "/deltamod": "\u1D5F",
+    "/gr:phimod": "\u1D60",
+    "/chimod": "\u1D61",
+    "/isubscript": "\u1D62",
+    "/rsubscript": "\u1D63",
+    "/usubscript": "\u1D64",
+    "/vsubscript": "\u1D65",
+    "/gr:betasubscript": "\u1D66",
+    "/gr:gammasubscript": "\u1D67",
+    "/gr:rhosubscript": "\u1D68",
+    "/gr:phisubscript": "\u1D69",
+    "/gr:chisubscript": "\u1D6A",
+    "/ue": "\u1D6B",
+    "/bmiddletilde": "\u1D6C",
+    "/dmiddletilde": "\u1D6D",
+    "/fmiddletilde": "\u1D6E",
+    "/mmiddletilde": "\u1D6F",
+    "/nmiddletilde": "\u1D70",
+    "/pmiddletilde": "\u1D71",
+    "/rmiddletilde": "\u1D72",
+    "/rfishmiddletilde": "\u1D73",
+    "/smiddletilde": "\u1D74",
+    "/tmiddletilde": "\u1D75",
+    "/zmiddletilde": "\u1D76",
+    "/gturned": "\u1D77",
+    "/ENcyrmod": "\u1D78",
+    "/ginsular": "\u1D79",
+    "/thstrike": "\u1D7A",
+    "/Ismallstroke": "\u1D7B",
+    "/iotastroke": "\u1D7C",
+    "/pstroke": "\u1D7D",
+    "/Usmallstroke": "\u1D7E",
+    "/upsilonstroke": "\u1D7F",
+    "/bpalatalhook": "\u1D80",
+    "/dpalatalhook": "\u1D81",
+    "/fpalatalhook": "\u1D82",
+    "/gpalatalhook": "\u1D83",
+    "/kpalatalhook": "\u1D84",
+    "/lpalatalhook": "\u1D85",
+    "/mpalatalhook": "\u1D86",
+    "/npalatalhook": "\u1D87",
+    "/ppalatalhook": "\u1D88",
+    "/rpalatalhook": "\u1D89",
+    "/spalatalhook": "\u1D8A",
+    "/eshpalatalhook": "\u1D8B",
+    "/vpalatalhook": "\u1D8C",
+    "/xpalatalhook": "\u1D8D",
+    "/zpalatalhook": "\u1D8E",
+    "/aretroflexhook": "\u1D8F",
+    "/alpharetroflexhook": "\u1D90",
+    "/dhooktail": "\u1D91",
+    "/eretroflexhook": "\u1D92",
+    "/eopenretroflexhook": "\u1D93",
+    "/eopenreversedretroflexhook": "\u1D94",
+    "/schwaretroflexhook": "\u1D95",
+    "/iretroflexhook": "\u1D96",
+    "/oopenretroflexhook": "\u1D97",
+    "/eshretroflexhook": "\u1D98",
+    "/uretroflexhook": "\u1D99",
+    "/ezhretroflexhook": "\u1D9A",
+    "/alphaturnedmod": "\u1D9B",
+    "/cmod": "\u1D9C",
+    "/ccurlmod": "\u1D9D",
+    "/ethmod": "\u1D9E",
+    "/eopenreversedmod": "\u1D9F",
+    "/fmod": "\u1DA0",
+    "/dotlessjstrokemod": "\u1DA1",
+    "/gscriptmod": "\u1DA2",
+    "/hturnedmod": "\u1DA3",
+    "/istrokemod": "\u1DA4",
+    "/iotamod": "\u1DA5",
+    "/Ismallmod": "\u1DA6",
+    "/Istrokesmallmod": "\u1DA7",
+    "/jcrossedtailmod": "\u1DA8",
+    "/lretroflexhookmod": "\u1DA9",
+    "/lpalatalhookmod": "\u1DAA",
+    "/Lsmallmod": "\u1DAB",
+    "/mhookmod": "\u1DAC",
+    "/mlonglegturnedmod": "\u1DAD",
+    "/nlefthookmod": "\u1DAE",
+    "/nretroflexhookmod": "\u1DAF",
+    "/Nsmallmod": "\u1DB0",
+    "/obarmod": "\u1DB1",
+    "/phimod": "\u1DB2",
+    "/shookmod": "\u1DB3",
+    "/eshmod": "\u1DB4",
+    "/tpalatalhookmod": "\u1DB5",
+    "/ubarmod": "\u1DB6",
+    "/upsilonmod": "\u1DB7",
+    "/Usmallmod": "\u1DB8",
+    "/vhookmod": "\u1DB9",
+    "/vturnedmod": "\u1DBA",
+    "/zmod": "\u1DBB",
+    "/zretroflexhookmod": "\u1DBC",
+    "/zcurlmod": "\u1DBD",
+    "/ezhmod": "\u1DBE",
+    "/thetamod": "\u1DBF",
+    "/dottedgravecmb": "\u1DC0",
+    "/dottedacutecmb": "\u1DC1",
+    "/snakebelowcmb": "\u1DC2",
+    "/suspensionmarkcmb": "\u1DC3",
+    "/macronacutecmb": "\u1DC4",
+    "/gravemacroncmb": "\u1DC5",
+    "/macrongravecmb": "\u1DC6",
+    "/acutemacroncmb": "\u1DC7",
+    "/graveacutegravecmb": "\u1DC8",
+    "/acutegraveacutecmb": "\u1DC9",
+    "/rbelowcmb": "\u1DCA",
+    "/brevemacroncmb": "\u1DCB",
+    "/macronbrevecmb": "\u1DCC",
+    "/doubleabovecircumflexcmb": "\u1DCD",
+    "/aboveogonekcmb": "\u1DCE",
+    "/zigzagbelowcmb": "\u1DCF",
+    "/isbelowcmb": "\u1DD0",
+    "/urabovecmb": "\u1DD1",
+    "/usabovecmb": "\u1DD2",
+    "/aaboveflatcmb": "\u1DD3",
+    "/aecmb": "\u1DD4",
+    "/aocmb": "\u1DD5",
+    "/avcmb": "\u1DD6",
+    "/ccedillacmb": "\u1DD7",
+    "/insulardcmb": "\u1DD8",
+    "/ethcmb": "\u1DD9",
+    "/gcmb": "\u1DDA",
+    "/gsmallcmb": "\u1DDB",
+    "/kcmb": "\u1DDC",
+    "/lcmb": "\u1DDD",
+    "/lsmallcmb": "\u1DDE",
+    "/msmallcmb": "\u1DDF",
+    "/ncmb": "\u1DE0",
+    "/nsmallcmb": "\u1DE1",
+    "/rsmallcmb": "\u1DE2",
+    "/rrotundacmb": "\u1DE3",
+    "/scmb": "\u1DE4",
+    "/longscmb": "\u1DE5",
+    "/zcmb": "\u1DE6",
+    "/alphacmb": "\u1DE7",
+    "/bcmb": "\u1DE8",
+    "/betacmb": "\u1DE9",
+    "/schwacmb": "\u1DEA",
+    "/fcmb": "\u1DEB",
+    "/lwithdoublemiddletildecmb": "\u1DEC",
+    "/owithlightcentralizationstrokecmb": "\u1DED",
+    "/pcmb": "\u1DEE",
+    "/eshcmb": "\u1DEF",
+    "/uwithlightcentralizationstrokecmb": "\u1DF0",
+    "/wcmb": "\u1DF1",
+    "/adieresiscmb": "\u1DF2",
+    "/odieresiscmb": "\u1DF3",
+    "/udieresiscmb": "\u1DF4",
+    "/uptackabovecmb": "\u1DF5",
+    "/kavykaaboverightcmb": "\u1DF6",
+    "/kavykaaboveleftcmb": "\u1DF7",
+    "/dotaboveleftcmb": "\u1DF8",
+    "/wideinvertedbridgebelowcmb": "\u1DF9",
+    "/dotbelowleftcmb": "\u1DFA",
+    "/deletionmarkcmb": "\u1DFB",
+    "/doubleinvertedbelowbrevecmb": "\u1DFC",
+    "/almostequaltobelowcmb": "\u1DFD",
+    "/leftarrowheadabovecmb": "\u1DFE",
+    "/rightarrowheadanddownarrowheadbelowcmb": "\u1DFF",
+    "/Bdot": "\u1E02",
+    "/bdot": "\u1E03",
+    "/Ddot": "\u1E0A",
+    "/ddot": "\u1E0B",
+    "/Dcommaaccent": "\u1E10",
+    "/dcommaaccent": "\u1E11",
+    "/Fdot": "\u1E1E",
+    "/fdot": "\u1E1F",
+    "/Hdot": "\u1E22",
+    "/hdot": "\u1E23",
+    "/Lmacrondot": "\u1E38",
+    "/lmacrondot": "\u1E39",
+    "/Mdot": "\u1E40",
+    "/mdot": "\u1E41",
+    "/Ndot": "\u1E44",
+    "/ndot": "\u1E45",
+    "/Pdot": "\u1E56",
+    "/pdot": "\u1E57",
+    "/Rdot": "\u1E58",
+    "/rdot": "\u1E59",
+    "/Rmacrondot": "\u1E5C",
+    "/rmacrondot": "\u1E5D",
+    "/Sdot": "\u1E60",
+    "/sdot": "\u1E61",
+    "/Scarondot": "\u1E66",
+    "/scarondot": "\u1E67",
+    "/Sdotbelowdotabove": "\u1E68",
+    "/sdotbelowdotabove": "\u1E69",
+    "/Tdot": "\u1E6A",
+    "/tdot": "\u1E6B",
+    "/Wdot": "\u1E86",
+    "/wdot": "\u1E87",
+    "/Xdot": "\u1E8A",
+    "/xdot": "\u1E8B",
+    "/Ydot": "\u1E8E",
+    "/ydot": "\u1E8F",
+    "/longsdot": "\u1E9B",
+    "/longswithdiagonalstroke": "\u1E9C",
+    "/longswithhighstroke": "\u1E9D",
+    "/Germandbls": "\u1E9E",
+    "/lt:delta": "\u1E9F",
+    "/Ahoi": "\u1EA2",
+    "/ahoi": "\u1EA3",
+    "/Acircumflexhoi": "\u1EA8",
+    "/acircumflexhoi": "\u1EA9",
+    "/Abrevehoi": "\u1EB2",
+    "/abrevehoi": "\u1EB3",
+    "/Ehoi": "\u1EBA",
+    "/ehoi": "\u1EBB",
+    "/Ecircumflexhoi": "\u1EC2",
+    "/ecircumflexhoi": "\u1EC3",
+    "/Ihoi": "\u1EC8",
+    "/ihoi": "\u1EC9",
+    "/Ohoi": "\u1ECE",
+    "/ohoi": "\u1ECF",
+    "/Ocircumflexhoi": "\u1ED4",
+    "/ocircumflexhoi": "\u1ED5",
+    "/Ohornhoi": "\u1EDE",
+    "/ohornhoi": "\u1EDF",
+    "/Uhoi": "\u1EE6",
+    "/uhoi": "\u1EE7",
+    "/Uhornhoi": "\u1EEC",
+    "/uhornhoi": "\u1EED",
+    "/Yhoi": "\u1EF6",
+    "/yhoi": "\u1EF7",
+    "/LLwelsh": "\u1EFA",
+    "/llwelsh": "\u1EFB",
+    "/Vwelsh": "\u1EFC",
+    "/vwelsh": "\u1EFD",
+    "/Yloop": "\u1EFE",
+    "/yloop": "\u1EFF",
+    "/alphalenis": "\u1F00",
+    "/alphaasper": "\u1F01",
+    "/alphalenisgrave": "\u1F02",
+    "/alphaaspergrave": "\u1F03",
+    "/alphalenisacute": "\u1F04",
+    "/alphaasperacute": "\u1F05",
+    "/alphalenistilde": "\u1F06",
+    "/alphaaspertilde": "\u1F07",
+    "/Alphalenis": "\u1F08",
+    "/Alphaasper": "\u1F09",
+    "/Alphalenisgrave": "\u1F0A",
+    "/Alphaaspergrave": "\u1F0B",
+    "/Alphalenisacute": "\u1F0C",
+    "/Alphaasperacute": "\u1F0D",
+    "/Alphalenistilde": "\u1F0E",
+    "/Alphaaspertilde": "\u1F0F",
+    "/epsilonlenis": "\u1F10",
+    "/epsilonasper": "\u1F11",
+    "/epsilonlenisgrave": "\u1F12",
+    "/epsilonaspergrave": "\u1F13",
+    "/epsilonlenisacute": "\u1F14",
+    "/epsilonasperacute": "\u1F15",
+    "/Epsilonlenis": "\u1F18",
+    "/Epsilonasper": "\u1F19",
+    "/Epsilonlenisgrave": "\u1F1A",
+    "/Epsilonaspergrave": "\u1F1B",
+    "/Epsilonlenisacute": "\u1F1C",
+    "/Epsilonasperacute": "\u1F1D",
+    "/etalenis": "\u1F20",
+    "/etaasper": "\u1F21",
+    "/etalenisgrave": "\u1F22",
+    "/etaaspergrave": "\u1F23",
+    "/etalenisacute": "\u1F24",
+    "/etaasperacute": "\u1F25",
+    "/etalenistilde": "\u1F26",
+    "/etaaspertilde": "\u1F27",
+    "/Etalenis": "\u1F28",
+    "/Etaasper": "\u1F29",
+    "/Etalenisgrave": "\u1F2A",
+    "/Etaaspergrave": "\u1F2B",
+    "/Etalenisacute": "\u1F2C",
+    "/Etaasperacute": "\u1F2D",
+    "/Etalenistilde": "\u1F2E",
+    "/Etaaspertilde": "\u1F2F",
+    "/iotalenis": "\u1F30",
+    "/iotaasper": "\u1F31",
+    "/iotalenisgrave": "\u1F32",
+    "/iotaaspergrave": "\u1F33",
+    "/iotalenisacute": "\u1F34",
+    "/iotaasperacute": "\u1F35",
+    "/iotalenistilde": "\u1F36",
+    "/iotaaspertilde": "\u1F37",
+    "/Iotalenis": "\u1F38",
+    "/Iotaasper": "\u1F39",
+    "/Iotalenisgrave": "\u1F3A",
+    "/Iotaaspergrave": "\u1F3B",
+    "/Iotalenisacute": "\u1F3C",
+    "/Iotaasperacute": "\u1F3D",
+    "/Iotalenistilde": "\u1F3E",
+    "/Iotaaspertilde": "\u1F3F",
+    "/omicronlenis": "\u1F40",
+    "/omicronasper": "\u1F41",
+    "/omicronlenisgrave": "\u1F42",
+    "/omicronaspergrave": "\u1F43",
+    "/omicronlenisacute": "\u1F44",
+    "/omicronasperacute": "\u1F45",
+    "/Omicronlenis": "\u1F48",
+    "/Omicronasper": "\u1F49",
+    "/Omicronlenisgrave": "\u1F4A",
+    "/Omicronaspergrave": "\u1F4B",
+    "/Omicronlenisacute": "\u1F4C",
+    "/Omicronasperacute": "\u1F4D",
+    "/upsilonlenis": "\u1F50",
+    "/upsilonasper": "\u1F51",
+    "/upsilonlenisgrave": "\u1F52",
+    "/upsilonaspergrave": "\u1F53",
+    "/upsilonlenisacute": "\u1F54",
+    "/upsilonasperacute": "\u1F55",
+    "/upsilonlenistilde": "\u1F56",
+    "/upsilonaspertilde": "\u1F57",
+    "/Upsilonasper": "\u1F59",
+    "/Upsilonaspergrave": "\u1F5B",
+    "/Upsilonasperacute": "\u1F5D",
+    "/Upsilonaspertilde": "\u1F5F",
+    "/omegalenis": "\u1F60",
+    "/omegaasper": "\u1F61",
+    "/omegalenisgrave": "\u1F62",
+    "/omegaaspergrave": "\u1F63",
+    "/omegalenisacute": "\u1F64",
+    "/omegaasperacute": "\u1F65",
+    "/omegalenistilde": "\u1F66",
+    "/omegaaspertilde": "\u1F67",
+    "/Omegalenis": "\u1F68",
+    "/Omegaasper": "\u1F69",
+    "/Omegalenisgrave": "\u1F6A",
+    "/Omegaaspergrave": "\u1F6B",
+    "/Omegalenisacute": "\u1F6C",
+    "/Omegaasperacute": "\u1F6D",
+    "/Omegalenistilde": "\u1F6E",
+    "/Omegaaspertilde": "\u1F6F",
+    "/alphagrave": "\u1F70",
+    "/alphaacute": "\u1F71",
+    "/epsilongrave": "\u1F72",
+    "/epsilonacute": "\u1F73",
+    "/etagrave": "\u1F74",
+    "/etaacute": "\u1F75",
+    "/iotagrave": "\u1F76",
+    "/iotaacute": "\u1F77",
+    "/omicrongrave": "\u1F78",
+    "/omicronacute": "\u1F79",
+    "/upsilongrave": "\u1F7A",
+    "/upsilonacute": "\u1F7B",
+    "/omegagrave": "\u1F7C",
+    "/omegaacute": "\u1F7D",
+    "/alphalenisiotasub": "\u1F80",
+    "/alphaasperiotasub": "\u1F81",
+    "/alphalenisgraveiotasub": "\u1F82",
+    "/alphaaspergraveiotasub": "\u1F83",
+    "/alphalenisacuteiotasub": "\u1F84",
+    "/alphaasperacuteiotasub": "\u1F85",
+    "/alphalenistildeiotasub": "\u1F86",
+    "/alphaaspertildeiotasub": "\u1F87",
+    "/Alphalenisiotasub": "\u1F88",
+    "/Alphaasperiotasub": "\u1F89",
+    "/Alphalenisgraveiotasub": "\u1F8A",
+    "/Alphaaspergraveiotasub": "\u1F8B",
+    "/Alphalenisacuteiotasub": "\u1F8C",
+    "/Alphaasperacuteiotasub": "\u1F8D",
+    "/Alphalenistildeiotasub": "\u1F8E",
+    "/Alphaaspertildeiotasub": "\u1F8F",
+    "/etalenisiotasub": "\u1F90",
+    "/etaasperiotasub": "\u1F91",
+    "/etalenisgraveiotasub": "\u1F92",
+    "/etaaspergraveiotasub": "\u1F93",
+    "/etalenisacuteiotasub": "\u1F94",
+    "/etaasperacuteiotasub": "\u1F95",
+    "/etalenistildeiotasub": "\u1F96",
+    "/etaaspertildeiotasub": "\u1F97",
+    "/Etalenisiotasub": "\u1F98",
+    "/Etaasperiotasub": "\u1F99",
+    "/Etalenisgraveiotasub": "\u1F9A",
+    "/Etaaspergraveiotasub": "\u1F9B",
+    "/Etalenisacuteiotasub": "\u1F9C",
+    "/Etaasperacuteiotasub": "\u1F9D",
+    "/Etalenistildeiotasub": "\u1F9E",
+    "/Etaaspertildeiotasub": "\u1F9F",
+    "/omegalenisiotasub": "\u1FA0",
+    "/omegaasperiotasub": "\u1FA1",
+    "/omegalenisgraveiotasub": "\u1FA2",
+    "/omegaaspergraveiotasub": "\u1FA3",
+    "/omegalenisacuteiotasub": "\u1FA4",
+    "/omegaasperacuteiotasub": "\u1FA5",
+    "/omegalenistildeiotasub": "\u1FA6",
+    "/omegaaspertildeiotasub": "\u1FA7",
+    "/Omegalenisiotasub": "\u1FA8",
+    "/Omegaasperiotasub": "\u1FA9",
+    "/Omegalenisgraveiotasub": "\u1FAA",
+    "/Omegaaspergraveiotasub": "\u1FAB",
+    "/Omegalenisacuteiotasub": "\u1FAC",
+    "/Omegaasperacuteiotasub": "\u1FAD",
+    "/Omegalenistildeiotasub": "\u1FAE",
+    "/Omegaaspertildeiotasub": "\u1FAF",
+    "/alphabreve": "\u1FB0",
+    "/alphawithmacron": "\u1FB1",
+    "/alphagraveiotasub": "\u1FB2",
+    "/alphaiotasub": "\u1FB3",
+    "/alphaacuteiotasub": "\u1FB4",
+    "/alphatilde": "\u1FB6",
+    "/alphatildeiotasub": "\u1FB7",
+    "/Alphabreve": "\u1FB8",
+    "/Alphawithmacron": "\u1FB9",
+    "/Alphagrave": "\u1FBA",
+    "/Alphaacute": "\u1FBB",
+    "/Alphaiotasub": "\u1FBC",
+    "/KORONIS": "\u1FBD",
+    "/iotaadscript": "\u1FBE",
+    "/lenis": "\u1FBF",
+    "/gr:tilde": "\u1FC0",
+    "/dieresistilde": "\u1FC1",
+    "/etagraveiotasub": "\u1FC2",
+    "/etaiotasub": "\u1FC3",
+    "/etaacuteiotasub": "\u1FC4",
+    "/etatilde": "\u1FC6",
+    "/etatildeiotasub": "\u1FC7",
+    "/Epsilongrave": "\u1FC8",
+    "/Epsilonacute": "\u1FC9",
+    "/Etagrave": "\u1FCA",
+    "/Etaacute": "\u1FCB",
+    "/Etaiotasub": "\u1FCC",
+    "/lenisgrave": "\u1FCD",
+    "/lenisacute": "\u1FCE",
+    "/lenistilde": "\u1FCF",
+    "/iotabreve": "\u1FD0",
+    "/iotawithmacron": "\u1FD1",
+    "/iotadieresisgrave": "\u1FD2",
+    "/iotadieresisacute": "\u1FD3",
+    "/iotatilde": "\u1FD6",
+    "/iotadieresistilde": "\u1FD7",
+    "/Iotabreve": "\u1FD8",
+    "/Iotawithmacron": "\u1FD9",
+    "/Iotagrave": "\u1FDA",
+    "/Iotaacute": "\u1FDB",
+    "/aspergrave": "\u1FDD",
+    "/asperacute": "\u1FDE",
+    "/aspertilde": "\u1FDF",
+    "/upsilonbreve": "\u1FE0",
+    "/upsilonwithmacron": "\u1FE1",
+    "/upsilondieresisgrave": "\u1FE2",
+    "/upsilondieresisacute": "\u1FE3",
+    "/rholenis": "\u1FE4",
+    "/rhoasper": "\u1FE5",
+    "/upsilontilde": "\u1FE6",
+    "/upsilondieresistilde": "\u1FE7",
+    "/Upsilonbreve": "\u1FE8",
+    "/Upsilonwithmacron": "\u1FE9",
+    "/Upsilongrave": "\u1FEA",
+    "/Upsilonacute": "\u1FEB",
+    "/Rhoasper": "\u1FEC",
+    "/gr:grave": "\u1FEF",
+    "/omegagraveiotasub": "\u1FF2",
+    "/omegaiotasub": "\u1FF3",
+    "/omegaacuteiotasub": "\u1FF4",
+    "/omegatilde": "\u1FF6",
+    "/omegatildeiotasub": "\u1FF7",
+    "/Omicrongrave": "\u1FF8",
+    "/Omicronacute": "\u1FF9",
+    "/Omegagrave": "\u1FFA",
+    "/Omegaacute": "\u1FFB",
+    "/Omegaiotasub": "\u1FFC",
+    "/gr:acute": "\u1FFD",
+    "/asper": "\u1FFE",
+    "/enquad": "\u2000",
+    "/emquad": "\u2001",
+    "/emspace": "\u2003",
+    "/threeperemspace": "\u2004",
+    "/fourperemspace": "\u2005",
+    "/sixperemspace": "\u2006",
+    "/figurespace": "\u2007",
+    "/punctuationspace": "\u2008",
+    "/thinspace": "\u2009",
+    "/hairspace": "\u200A",
+    "/lefttorightmark": "\u200E",
+    "/righttoleftmark": "\u200F",
+    "/gnrl:hyphen": "\u2010",
+    "/nonbreakinghyphen": "\u2011",
+    "/verticalbardbl": "\u2016",
+    "/quotedblreversed": "\u201F",
+    "/triangularbullet": "\u2023",
+    "/hyphenationpoint": "\u2027",
+    "/lineseparator": "\u2028",
+    "/paragraphseparator": "\u2029",
+    "/lefttorightembed": "\u202A",
+    "/righttoleftembed": "\u202B",
+    "/popdirectionalformatting": "\u202C",
+    "/lefttorightoverride": "\u202D",
+    "/righttoleftoverride": "\u202E",
+    "/narrownobreakspace": "\u202F",
+    "/pertenthousandsign": "\u2031",
+    "/millisecond": "\u2034",
+    "/minutereversed": "\u2035",
+    "/secondreversed": "\u2036",
+    "/millisecondreversed": "\u2037",
+    "/caret": "\u2038",
+    "/interrobang": "\u203D",
+    "/undertie": "\u203F",
+    "/charactertie": "\u2040",
+    "/caretinsertionpoint": "\u2041",
+    "/hyphenbullet": "\u2043",
+    "/bracketleftsquarequill": "\u2045",
+    "/bracketrightsquarequill": "\u2046",
+    "/questiondbl": "\u2047",
+    "/questionexclamationmark": "\u2048",
+    "/exclamationquestion": "\u2049",
+    "/tironiansignet": "\u204A",
+    "/pilcrowsignreversed": "\u204B",
+    "/blackwardsbulletleft": "\u204C",
+    "/blackwardsbulletright": "\u204D",
+    "/lowasterisk": "\u204E",
+    "/semicolonreversed": "\u204F",
+    "/closeup": "\u2050",
+    "/twoasterisksalignedvertically": "\u2051",
+    "/commercialminussign": "\u2052",
+    "/swungdash": "\u2053",
+    "/invertedundertie": "\u2054",
+    "/flowerpunctuationmark": "\u2055",
+    "/threedotpunctuation": "\u2056",
+    "/quadrupleminute": "\u2057",
+    "/fourdotpunctuation": "\u2058",
+    "/fivedotpunctuation": "\u2059",
+    "/twodotpunctuation": "\u205A",
+    "/fourdotmark": "\u205B",
+    "/dottedcross": "\u205C",
+    "/tricolon": "\u205D",
+    "/verticalfourdots": "\u205E",
+    "/mediummathematicalspace": "\u205F",
+    "/wordjoiner": "\u2060",
+    "/functionapplication": "\u2061",
+    "/invisibletimes": "\u2062",
+    "/invisibleseparator": "\u2063",
+    "/invisibleplus": "\u2064",
+    "/lefttorightisolate": "\u2066",
+    "/righttoleftisolate": "\u2067",
+    "/firststrongisolate": "\u2068",
+    "/popdirectionalisolate": "\u2069",
+    "/inhibitsymmetricswapping": "\u206A",
+    "/activatesymmetricswapping": "\u206B",
+    "/inhibitarabicformshaping": "\u206C",
+    "/activatearabicformshaping": "\u206D",
+    "/nationaldigitshapes": "\u206E",
+    "/nominaldigitshapes": "\u206F",
+    "/zero.superior": "\u2070",
+    "/i.superior": "\u2071",
+    "/four.superior": "\u2074",
+    "/five.superior": "\u2075",
+    "/six.superior": "\u2076",
+    "/seven.superior": "\u2077",
+    "/eight.superior": "\u2078",
+    "/nine.superior": "\u2079",
+    "/plus.superior": "\u207A",
+    "/minus.superior": "\u207B",
+    "/equal.superior": "\u207C",
+    "/parenleft.superior": "\u207D",
+    "/parenright.superior": "\u207E",
+    "/n.superior": "\u207F",
+    "/zero.inferior": "\u2080",
+    "/one.inferior": "\u2081",
+    "/two.inferior": "\u2082",
+    "/three.inferior": "\u2083",
+    "/four.inferior": "\u2084",
+    "/five.inferior": "\u2085",
+    "/six.inferior": "\u2086",
+    "/seven.inferior": "\u2087",
+    "/eight.inferior": "\u2088",
+    "/nine.inferior": "\u2089",
+    "/plus.inferior": "\u208A",
+    "/minus.inferior": "\u208B",
+    "/equal.inferior": "\u208C",
+    "/parenleft.inferior": "\u208D",
+    "/parenright.inferior": "\u208E",
+    "/a.inferior": "\u2090",
+    "/e.inferior": "\u2091",
+    "/o.inferior": "\u2092",
+    "/x.inferior": "\u2093",
+    "/schwa.inferior": "\u2094",
+    "/h.inferior": "\u2095",
+    "/k.inferior": "\u2096",
+    "/l.inferior": "\u2097",
+    "/m.inferior": "\u2098",
+    "/n.inferior": "\u2099",
+    "/p.inferior": "\u209A",
+    "/s.inferior": "\u209B",
+    "/t.inferior": "\u209C",
+    "/euroarchaic": "\u20A0",
+    "/mill": "\u20A5",
+    "/naira": "\u20A6",
+    "/rupee": "\u20A8",
+    "/newsheqel": "\u20AA",
+    "/kip": "\u20AD",
+    "/tugrik": "\u20AE",
+    "/drachma": "\u20AF",
+    "/germanpenny": "\u20B0",
+    "/peso": "\u20B1",
+    "/guarani": "\u20B2",
+    "/austral": "\u20B3",
+    "/hryvnia": "\u20B4",
+    "/cedi": "\u20B5",
+    "/livretournois": "\u20B6",
+    "/spesmilo": "\u20B7",
+    "/tenge": "\u20B8",
+    "/indianrupee": "\u20B9",
+    "/turkishlira": "\u20BA",
+    "/nordicmark": "\u20BB",
+    "/manat": "\u20BC",
+    "/ruble": "\u20BD",
+    "/lari": "\u20BE",
+    "/bitcoin": "\u20BF",
+    "/som": "\u20C0",
+    "/leftHarpoonAbovecmb": "\u20D0",
+    "/rightHarpoonAbovecmb": "\u20D1",
+    "/longVerticalLineOverlaycmb": "\u20D2",
+    "/shortVerticalLineOverlaycmb": "\u20D3",
+    "/anticlockwiseArrowAbovecmb": "\u20D4",
+    "/clockwiseArrowAbovecmb": "\u20D5",
+    "/leftArrowAbovecmb": "\u20D6",
+    "/rightArrowAbovecmb": "\u20D7",
+    "/ringOverlaycmb": "\u20D8",
+    "/clockwiseRingOverlaycmb": "\u20D9",
+    "/anticlockwiseRingOverlaycmb": "\u20DA",
+    "/threeDotsAbovecmb": "\u20DB",
+    "/fourDotsAbovecmb": "\u20DC",
+    "/enclosingCirclecmb": "\u20DD",
+    "/enclosingSquarecmb": "\u20DE",
+    "/enclosingDiamondcmb": "\u20DF",
+    "/enclosingCircleBackslashcmb": "\u20E0",
+    "/leftRightArrowAbovecmb": "\u20E1",
+    "/enclosingScreencmb": "\u20E2",
+    "/enclosingKeycapcmb": "\u20E3",
+    "/enclosingUpwardPointingTrianglecmb": "\u20E4",
+    "/reverseSolidusOverlaycmb": "\u20E5",
+    "/doubleVerticalOverlaystrokecmb": "\u20E6",
+    "/annuitySymbolcmb": "\u20E7",
+    "/tripleUnderdotcmb": "\u20E8",
+    "/wideBridgeAbovecmb": "\u20E9",
+    "/leftwardsArrowOverlaycmb": "\u20EA",
+    "/longDoubleSolidusOverlaycmb": "\u20EB",
+    "/rightwardsHarpoonBDownwardsbarcmb": "\u20EC",
+    "/leftwardsHarpoonBDownwardsbarcmb": "\u20ED",
+    "/leftArrowBelowcmb": "\u20EE",
+    "/rightArrowBelowcmb": "\u20EF",
+    "/asteriskAbovecmb": "\u20F0",
+    "/accountof": "\u2100",
+    "/addressedsubject": "\u2101",
+    "/Cdblstruck": "\u2102",
+    "/degreecelsius": "\u2103",
+    "/centreline": "\u2104",
+    "/cadauna": "\u2106",
+    "/euler": "\u2107",
+    "/scruple": "\u2108",
+    "/degreefahrenheit": "\u2109",
+    "/lttr:gscript": "\u210A",
+    "/Hscript": "\u210B",
+    "/Hfraktur": "\u210C",
+    "/Hdblstruck": "\u210D",
+    "/planck": "\u210E",
+    "/plancktwopi": "\u210F",
+    "/Iscript": "\u2110",
+    "/Lscript": "\u2112",
+    "/litre": "\u2113",
+    "/lbbar": "\u2114",
+    "/Ndblstruck": "\u2115",
+    "/soundcopyright": "\u2117",
+    "/Pdblstruck": "\u2119",
+    "/Qdblstruck": "\u211A",
+    "/Rscript": "\u211B",
+    "/Rdblstruck": "\u211D",
+    "/response": "\u211F",
+    "/servicemark": "\u2120",
+    "/versicle": "\u2123",
+    "/Zdblstruck": "\u2124",
+    "/ounce": "\u2125",
+    "/ohm": "\u2126",
+    "/ohminverted": "\u2127",
+    "/Zfraktur": "\u2128",
+    "/iotaturned": "\u2129",
+    "/kelvin": "\u212A",
+    "/Bscript": "\u212C",
+    "/Cfraktur": "\u212D",
+    "/escript": "\u212F",
+    "/Escript": "\u2130",
+    "/Fscript": "\u2131",
+    "/Fturned": "\u2132",
+    "/Mscript": "\u2133",
+    "/oscript": "\u2134",
+    "/information": "\u2139",
+    "/Qrotated": "\u213A",
+    "/facsimile": "\u213B",
+    "/pidblstruck": "\u213C",
+    "/gammadblstruck": "\u213D",
+    "/Gammadblstruck": "\u213E",
+    "/Pidblstruck": "\u213F",
+    "/summationdblstruck": "\u2140",
+    "/Gturnedsans": "\u2141",
+    "/Lturnedsans": "\u2142",
+    "/Lreversedsans": "\u2143",
+    "/Yturnedsans": "\u2144",
+    "/Ddblstruckitalic": "\u2145",
+    "/ddblstruckitalic": "\u2146",
+    "/edblstruckitalic": "\u2147",
+    "/idblstruckitalic": "\u2148",
+    "/jdblstruckitalic": "\u2149",
+    "/propertyline": "\u214A",
+    "/ampersandturned": "\u214B",
+    "/per": "\u214C",
+    "/aktieselskab": "\u214D",
+    "/fturned": "\u214E",
+    "/forsamaritan": "\u214F",
+    "/oneseventh": "\u2150",
+    "/oneninth": "\u2151",
+    "/onetenth": "\u2152",
+    "/onefifth": "\u2155",
+    "/twofifths": "\u2156",
+    "/threefifths": "\u2157",
+    "/fourfifths": "\u2158",
+    "/onesixth": "\u2159",
+    "/fivesixths": "\u215A",
+    "/onefraction": "\u215F",
+    "/one.roman": "\u2160",
+    "/two.roman": "\u2161",
+    "/three.roman": "\u2162",
+    "/four.roman": "\u2163",
+    "/five.roman": "\u2164",
+    "/six.roman": "\u2165",
+    "/seven.roman": "\u2166",
+    "/eight.roman": "\u2167",
+    "/nine.roman": "\u2168",
+    "/ten.roman": "\u2169",
+    "/eleven.roman": "\u216A",
+    "/twelve.roman": "\u216B",
+    "/fifty.roman": "\u216C",
+    "/onehundred.roman": "\u216D",
+    "/fivehundred.roman": "\u216E",
+    "/onethousand.roman": "\u216F",
+    "/one.romansmall": "\u2170",
+    "/two.romansmall": "\u2171",
+    "/three.romansmall": "\u2172",
+    "/four.romansmall": "\u2173",
+    "/five.romansmall": "\u2174",
+    "/six.romansmall": "\u2175",
+    "/seven.romansmall": "\u2176",
+    "/eight.romansmall": "\u2177",
+    "/nine.romansmall": "\u2178",
+    "/ten.romansmall": "\u2179",
+    "/eleven.romansmall": "\u217A",
+    "/twelve.romansmall": "\u217B",
+    "/fifty.romansmall": "\u217C",
+    "/onehundred.romansmall": "\u217D",
+    "/fivehundred.romansmall": "\u217E",
+    "/onethousand.romansmall": "\u217F",
+    "/onethousandcd.roman": "\u2180",
+    "/fivethousand.roman": "\u2181",
+    "/tenthousand.roman": "\u2182",
+    "/reversedonehundred.roman": "\u2183",
+    "/creversed": "\u2184",
+    "/sixlateform.roman": "\u2185",
+    "/fiftyearlyform.roman": "\u2186",
+    "/fiftythousand.roman": "\u2187",
+    "/onehundredthousand.roman": "\u2188",
+    "/zerothirds": "\u2189",
+    "/turneddigittwo": "\u218A",
+    "/turneddigitthree": "\u218B",
+    "/arrowleftright": "\u2194",
+    "/arrowupdown": "\u2195",
+    "/arrowNW": "\u2196",
+    "/arrowNE": "\u2197",
+    "/arrowSE": "\u2198",
+    "/arrowSW": "\u2199",
+    "/arrowleftstroke": "\u219A",
+    "/arrowrightstroke": "\u219B",
+    "/arrowleftwave": "\u219C",
+    "/arrowrightwave": "\u219D",
+    "/arrowlefttwoheaded": "\u219E",
+    "/arrowuptwoheaded": "\u219F",
+    "/arrowrighttwoheaded": "\u21A0",
+    "/arrowdowntwoheaded": "\u21A1",
+    "/arrowlefttail": "\u21A2",
+    "/arrowrighttail": "\u21A3",
+    "/arrowleftfrombar": "\u21A4",
+    "/arrowupfrombar": "\u21A5",
+    "/arrowrightfrombar": "\u21A6",
+    "/arrowdownfrombar": "\u21A7",
+    "/arrowupdownwithbase": "\u21A8",
+    "/arrowlefthook": "\u21A9",
+    "/arrowrighthook": "\u21AA",
+    "/arrowleftloop": "\u21AB",
+    "/arrowrightloop": "\u21AC",
+    "/arrowleftrightwave": "\u21AD",
+    "/arrowleftrightstroke": "\u21AE",
+    "/arrowdownzigzag": "\u21AF",
+    "/arrowleftuptip": "\u21B0",
+    "/arrowrightuptip": "\u21B1",
+    "/arrowleftdowntip": "\u21B2",
+    "/arrowrightdowntip": "\u21B3",
+    "/arrowrightdowncorner": "\u21B4",
+    "/arrowleftdowncorner": "\u21B5",
+    "/arrowanticlockwisesemicircle": "\u21B6",
+    "/arrowclockwisesemicircle": "\u21B7",
+    "/arrowlongNWtobar": "\u21B8",
+    "/arrowleftoverrighttobar": "\u21B9",
+    "/arrowanticlockwiseopencircle": "\u21BA",
+    "/arrowclockwiseopencircle": "\u21BB",
+    "/harpoonleftbarbdown": "\u21BD",
+    "/harpoonupbarbright": "\u21BE",
+    "/harpoonupbarbleft": "\u21BF",
+    "/harpoonrightbarbdown": "\u21C1",
+    "/harpoondownbarbright": "\u21C2",
+    "/harpoondownbarbleft": "\u21C3",
+    "/rightarrowoverleftarrow": "\u21C4",
+    "/uparrowleftofdownarrow": "\u21C5",
+    "/leftarrowoverrightarrow": "\u21C6",
+    "/arrowspairedleft": "\u21C7",
+    "/arrowspairedup": "\u21C8",
+    "/arrowspairedright": "\u21C9",
+    "/arrowspaireddown": "\u21CA",
+    "/leftharpoonoverrightharpoon": "\u21CB",
+    "/rightharpoonoverleftharpoon": "\u21CC",
+    "/dblarrowleftstroke": "\u21CD",
+    "/dblarrowleftrightstroke": "\u21CE",
+    "/dblarrowrightstroke": "\u21CF",
+    "/dblarrowup": "\u21D1",
+    "/dblarrowdown": "\u21D3",
+    "/dblarrowleftright": "\u21D4",
+    "/dblarrowupdown": "\u21D5",
+    "/dblarrowNW": "\u21D6",
+    "/dblarrowNE": "\u21D7",
+    "/dblarrowSE": "\u21D8",
+    "/dblarrowSW": "\u21D9",
+    "/triplearrowleft": "\u21DA",
+    "/triplearrowright": "\u21DB",
+    "/arrowleftsquiggle": "\u21DC",
+    "/arrowrightsquiggle": "\u21DD",
+    "/dblstrokearrowup": "\u21DE",
+    "/dblstrokearrowdown": "\u21DF",
+    "/arrowleftdashed": "\u21E0",
+    "/arrowupdashed": "\u21E1",
+    "/arrowrightdashed": "\u21E2",
+    "/arrowdowndashed": "\u21E3",
+    "/arrowlefttobar": "\u21E4",
+    "/arrowrighttobar": "\u21E5",
+    "/whitearrowleft": "\u21E6",
+    "/whitearrowup": "\u21E7",
+    "/whitearrowright": "\u21E8",
+    "/whitearrowdown": "\u21E9",
+    "/whitearrowupfrombar": "\u21EA",
+    "/whitearrowonpedestalup": "\u21EB",
+    "/horizontalbarwhitearrowonpedestalup": "\u21EC",
+    "/verticalbarwhitearrowonpedestalup": "\u21ED",
+    "/whitedblarrowup": "\u21EE",
+    "/whitedblarrowonpedestalup": "\u21EF",
+    "/whitearrowfromwallright": "\u21F0",
+    "/tocornerarrowNW": "\u21F1",
+    "/tocornerarrowSE": "\u21F2",
+    "/whitearrowupdown": "\u21F3",
+    "/arrowrightsmallcircle": "\u21F4",
+    "/downwarrowleftofuparrow": "\u21F5",
+    "/threerightarrows": "\u21F6",
+    "/verticalstrokearrowleft": "\u21F7",
+    "/verticalstrokearrowright": "\u21F8",
+    "/verticalstrokearrowleftright": "\u21F9",
+    "/verticalsdbltrokearrowleft": "\u21FA",
+    "/verticalsdbltrokearrowright": "\u21FB",
+    "/verticalsdbltrokearrowleftright": "\u21FC",
+    "/openheadarrowleft": "\u21FD",
+    "/openheadarrowright": "\u21FE",
+    "/openheadarrowleftright": "\u21FF",
+    "/complement": "\u2201",
+    "/notexistential": "\u2204",
+    "/elementsmall": "\u220A",
+    "/containsasmembersmall": "\u220D",
+    "/endpro": "\u220E",
+    "/coproductarray": "\u2210",
+    "/dotplus": "\u2214",
+    "/setminus": "\u2216",
+    "/ringoperator": "\u2218",
+    "/math:cuberoot": "\u221B",
+    "/math:fourthroot": "\u221C",
+    "/measuredangle": "\u2221",
+    "/sphericalangle": "\u2222",
+    "/doesnotdivide": "\u2224",
+    "/integraldbl": "\u222C",
+    "/integraltpl": "\u222D",
+    "/integralcontour": "\u222E",
+    "/integralsurface": "\u222F",
+    "/integralvolume": "\u2230",
+    "/integralclockwise": "\u2231",
+    "/integralcontourclockwise": "\u2232",
+    "/integralcontouranticlockwise": "\u2233",
+    "/dotminus": "\u2238",
+    "/excess": "\u2239",
+    "/geometricproportion": "\u223A",
+    "/homotic": "\u223B",
+    "/tildereversed": "\u223D",
+    "/lazysinverted": "\u223E",
+    "/sinewave": "\u223F",
+    "/wreathproduct": "\u2240",
+    "/nottilde": "\u2241",
+    "/minustilde": "\u2242",
+    "/asympticallyequal": "\u2243",
+    "/notasympticallyequal": "\u2244",
+    "/approximatelybutnotactuallyequal": "\u2246",
+    "/neirapproximatelynoractuallyequal": "\u2247",
+    "/notalmostequal": "\u2249",
+    "/almostequalorequal": "\u224A",
+    "/tildetpl": "\u224B",
+    "/equivalent": "\u224D",
+    "/geometricallyequivalent": "\u224E",
+    "/differencebetween": "\u224F",
+    "/approacheslimit": "\u2250",
+    "/approximatelyequalorimage": "\u2252",
+    "/colonequals": "\u2254",
+    "/equalscolon": "\u2255",
+    "/ringinequal": "\u2256",
+    "/ringequal": "\u2257",
+    "/corresponds": "\u2258",
+    "/estimates": "\u2259",
+    "/equiangular": "\u225A",
+    "/starequals": "\u225B",
+    "/deltaequal": "\u225C",
+    "/equalbydefinition": "\u225D",
+    "/measuredby": "\u225E",
+    "/questionedequal": "\u225F",
+    "/strictlyequivalent": "\u2263",
+    "/lessbutnotequal": "\u2268",
+    "/greaterbutnotequal": "\u2269",
+    "/between": "\u226C",
+    "/notequivalent": "\u226D",
+    "/neirlessnorequal": "\u2270",
+    "/neirgreaternorequal": "\u2271",
+    "/neirlessnorequivalent": "\u2274",
+    "/neirgreaternorequivalent": "\u2275",
+    "/neirlessnorgreater": "\u2278",
+    "/neirgreaternorless": "\u2279",
+    "/precedesorequal": "\u227C",
+    "/succeedsorequal": "\u227D",
+    "/precedesorequivalent": "\u227E",
+    "/succeedsorequivalent": "\u227F",
+    "/doesnotprecede": "\u2280",
+    "/doesnotsucceed": "\u2281",
+    "/notasersetup": "\u2285",
+    "/neirasubsetnorequal": "\u2288",
+    "/neirasersetnorequalup": "\u2289",
+    "/sersetnotequalup": "\u228B",
+    "/multiset": "\u228C",
+    "/multisetmultiplication": "\u228D",
+    "/multisetunion": "\u228E",
+    "/squareimage": "\u228F",
+    "/squareoriginal": "\u2290",
+    "/squareimageorequal": "\u2291",
+    "/squareoriginalorequal": "\u2292",
+    "/squarecap": "\u2293",
+    "/squarecup": "\u2294",
+    "/circledminus": "\u2296",
+    "/circleddivisionslash": "\u2298",
+    "/circleddotoperator": "\u2299",
+    "/circledringoperator": "\u229A",
+    "/circledasteriskoperator": "\u229B",
+    "/circledequals": "\u229C",
+    "/circleddash": "\u229D",
+    "/squaredplus": "\u229E",
+    "/squaredminus": "\u229F",
+    "/squaredtimes": "\u22A0",
+    "/squareddotoperator": "\u22A1",
+    "/tackright": "\u22A2",
+    "/tackup": "\u22A5",
+    "/assertion": "\u22A6",
+    "/models": "\u22A7",
+    "/true": "\u22A8",
+    "/forces": "\u22A9",
+    "/turnstiletplverticalbarright": "\u22AA",
+    "/turnstiledblverticalbarright": "\u22AB",
+    "/doesnotprove": "\u22AC",
+    "/nottrue": "\u22AD",
+    "/doesnotforce": "\u22AE",
+    "/negatedturnstiledblverticalbarright": "\u22AF",
+    "/precedesunderrelation": "\u22B0",
+    "/succeedsunderrelation": "\u22B1",
+    "/normalsubgroup": "\u22B2",
+    "/containsasnormalsubgroup": "\u22B3",
+    "/normalsubgroorequalup": "\u22B4",
+    "/containsasnormalsubgroorequalup": "\u22B5",
+    "/original": "\u22B6",
+    "/image": "\u22B7",
+    "/multimap": "\u22B8",
+    "/hermitianconjugatematrix": "\u22B9",
+    "/intercalate": "\u22BA",
+    "/xor": "\u22BB",
+    "/nand": "\u22BC",
+    "/nor": "\u22BD",
+    "/anglearcright": "\u22BE",
+    "/triangleright": "\u22BF",
+    "/logicalandarray": "\u22C0",
+    "/logicalorarray": "\u22C1",
+    "/intersectionarray": "\u22C2",
+    "/unionarray": "\u22C3",
+    "/diamondoperator": "\u22C4",
+    "/staroperator": "\u22C6",
+    "/divisiontimes": "\u22C7",
+    "/math:bowtie": "\u22C8",
+    "/normalfacrsemidirectproductleft": "\u22C9",
+    "/normalfacrsemidirectproductright": "\u22CA",
+    "/semidirectproductleft": "\u22CB",
+    "/semidirectproductright": "\u22CC",
+    "/tildeequalsreversed": "\u22CD",
+    "/curlylogicalor": "\u22CE",
+    "/curlylogicaland": "\u22CF",
+    "/subsetdbl": "\u22D0",
+    "/sersetdblup": "\u22D1",
+    "/intersectiondbl": "\u22D2",
+    "/uniondbl": "\u22D3",
+    "/pitchfork": "\u22D4",
+    "/equalandparallel": "\u22D5",
+    "/lessdot": "\u22D6",
+    "/greaterdot": "\u22D7",
+    "/verymuchless": "\u22D8",
+    "/verymuchgreater": "\u22D9",
+    "/equalorless": "\u22DC",
+    "/equalorgreater": "\u22DD",
+    "/equalorprecedes": "\u22DE",
+    "/equalorsucceeds": "\u22DF",
+    "/doesnotprecedeorequal": "\u22E0",
+    "/doesnotsucceedorequal": "\u22E1",
+    "/notsquareimageorequal": "\u22E2",
+    "/notsquareoriginalorequal": "\u22E3",
+    "/squareimageornotequal": "\u22E4",
+    "/squareoriginalornotequal": "\u22E5",
+    "/lessbutnotequivalent": "\u22E6",
+    "/greaterbutnotequivalent": "\u22E7",
+    "/precedesbutnotequivalent": "\u22E8",
+    "/succeedsbutnotequivalent": "\u22E9",
+    "/notnormalsubgroup": "\u22EA",
+    "/doesnotcontainasnormalsubgroup": "\u22EB",
+    "/notnormalsubgroorequalup": "\u22EC",
+    "/doesnotcontainasnormalsubgroorequalup": "\u22ED",
+    "/ellipsismidhorizontal": "\u22EF",
+    "/ellipsisdiagonalupright": "\u22F0",
+    "/ellipsisdiagonaldownright": "\u22F1",
+    "/elementlonghorizontalstroke": "\u22F2",
+    "/elementverticalbarhorizontalstroke": "\u22F3",
+    "/elementsmallverticalbarhorizontalstroke": "\u22F4",
+    "/elementdotabove": "\u22F5",
+    "/elementoverbar": "\u22F6",
+    "/elementoverbarsmall": "\u22F7",
+    "/elementunderbar": "\u22F8",
+    "/elementtwoshorizontalstroke": "\u22F9",
+    "/containslonghorizontalstroke": "\u22FA",
+    "/containsverticalbarhorizontalstroke": "\u22FB",
+    "/containssmallverticalbarhorizontalstroke": "\u22FC",
+    "/containsoverbar": "\u22FD",
+    "/containsoverbarsmall": "\u22FE",
+    "/znotationbagmembership": "\u22FF",
+    "/diametersign": "\u2300",
+    "/electricarrow": "\u2301",
+    "/arrowheadup": "\u2303",
+    "/arrowheaddown": "\u2304",
+    "/perspective": "\u2306",
+    "/wavyline": "\u2307",
+    "/ceilingleft": "\u2308",
+    "/ceilingright": "\u2309",
+    "/floorleft": "\u230A",
+    "/floorright": "\u230B",
+    "/cropbottomright": "\u230C",
+    "/cropbottomleft": "\u230D",
+    "/croptopright": "\u230E",
+    "/croptopleft": "\u230F",
+    "/lozengesquare": "\u2311",
+    "/segment": "\u2313",
+    "/sector": "\u2314",
+    "/telephonerecorder": "\u2315",
+    "/positionindicator": "\u2316",
+    "/viewdatasquare": "\u2317",
+    "/placeofinterestsign": "\u2318",
+    "/notsignturned": "\u2319",
+    "/watch": "\u231A",
+    "/hourglass": "\u231B",
+    "/cornertopleft": "\u231C",
+    "/cornertopright": "\u231D",
+    "/cornerbottomleft": "\u231E",
+    "/cornerbottomright": "\u231F",
+    "/frown": "\u2322",
+    "/smile": "\u2323",
+    "/arrowheadtwobarsuphorizontal": "\u2324",
+    "/eraseright": "\u2326",
+    "/board": "\u2328",
+    "/eraseleft": "\u232B",
+    "/benzenering": "\u232C",
+    "/cylindricity": "\u232D",
+    "/allaroundprofile": "\u232E",
+    "/symmetry": "\u232F",
+    "/totalrunout": "\u2330",
+    "/dimensionorigin": "\u2331",
+    "/conicaltaper": "\u2332",
+    "/slope": "\u2333",
+    "/counterbore": "\u2334",
+    "/countersink": "\u2335",
+    "/beamfunc": "\u2336",
+    "/squishquadfunc": "\u2337",
+    "/quadequalfunc": "\u2338",
+    "/quaddividefunc": "\u2339",
+    "/quaddiamondfunc": "\u233A",
+    "/quadjotfunc": "\u233B",
+    "/quadcirclefunc": "\u233C",
+    "/circlestilefunc": "\u233D",
+    "/circlejotfunc": "\u233E",
+    "/slashbarfunc": "\u233F",
+    "/backslashbarfunc": "\u2340",
+    "/quadslashfunc": "\u2341",
+    "/quadbackslashfunc": "\u2342",
+    "/quadlessfunc": "\u2343",
+    "/quadgreaterfunc": "\u2344",
+    "/vaneleftfunc": "\u2345",
+    "/vanerightfunc": "\u2346",
+    "/quadarrowleftfunc": "\u2347",
+    "/quadarrowrightfunc": "\u2348",
+    "/circlebackslashfunc": "\u2349",
+    "/tackunderlinedownfunc": "\u234A",
+    "/deltastilefunc": "\u234B",
+    "/quadcaretdownfunc": "\u234C",
+    "/quaddeltafunc": "\u234D",
+    "/tackjotdownfunc": "\u234E",
+    "/vaneupfunc": "\u234F",
+    "/quadarrowupfunc": "\u2350",
+    "/tackoverbarupfunc": "\u2351",
+    "/delstilefunc": "\u2352",
+    "/quadcaretupfunc": "\u2353",
+    "/quaddelfunc": "\u2354",
+    "/tackjotupfunc": "\u2355",
+    "/vanedownfunc": "\u2356",
+    "/quadarrowdownfunc": "\u2357",
+    "/quoteunderlinefunc": "\u2358",
+    "/deltaunderlinefunc": "\u2359",
+    "/diamondunderlinefunc": "\u235A",
+    "/jotunderlinefunc": "\u235B",
+    "/circleunderlinefunc": "\u235C",
+    "/shoejotupfunc": "\u235D",
+    "/quotequadfunc": "\u235E",
+    "/circlestarfunc": "\u235F",
+    "/quadcolonfunc": "\u2360",
+    "/tackdiaeresisupfunc": "\u2361",
+    "/deldiaeresisfunc": "\u2362",
+    "/stardiaeresisfunc": "\u2363",
+    "/jotdiaeresisfunc": "\u2364",
+    "/circlediaeresisfunc": "\u2365",
+    "/shoestiledownfunc": "\u2366",
+    "/shoestileleftfunc": "\u2367",
+    "/tildediaeresisfunc": "\u2368",
+    "/diaeresisgreaterfunc": "\u2369",
+    "/commabarfunc": "\u236A",
+    "/deltildefunc": "\u236B",
+    "/zildefunc": "\u236C",
+    "/stiletildefunc": "\u236D",
+    "/semicolonunderlinefunc": "\u236E",
+    "/quadnotequalfunc": "\u236F",
+    "/quadquestionfunc": "\u2370",
+    "/carettildedownfunc": "\u2371",
+    "/carettildeupfunc": "\u2372",
+    "/iotafunc": "\u2373",
+    "/rhofunc": "\u2374",
+    "/omegafunc": "\u2375",
+    "/alphaunderlinefunc": "\u2376",
+    "/epsilonunderlinefunc": "\u2377",
+    "/iotaunderlinefunc": "\u2378",
+    "/omegaunderlinefunc": "\u2379",
+    "/alphafunc": "\u237A",
+    "/notcheckmark": "\u237B",
+    "/anglezigzagarrowdownright": "\u237C",
+    "/shoulderedopenbox": "\u237D",
+    "/bell": "\u237E",
+    "/linemiddledotvertical": "\u237F",
+    "/insertion": "\u2380",
+    "/continuousunderline": "\u2381",
+    "/discontinuousunderline": "\u2382",
+    "/emphasis": "\u2383",
+    "/composition": "\u2384",
+    "/centrelineverticalsquarewhite": "\u2385",
+    "/enter": "\u2386",
+    "/alternative": "\u2387",
+    "/helm": "\u2388",
+    "/circledbarnotchhorizontal": "\u2389",
+    "/circledtriangledown": "\u238A",
+    "/brokencirclenorthwestarrow": "\u238B",
+    "/undo": "\u238C",
+    "/monostable": "\u238D",
+    "/hysteresis": "\u238E",
+    "/htypeopencircuit": "\u238F",
+    "/ltypeopencircuit": "\u2390",
+    "/passivedown": "\u2391",
+    "/outputpassiveup": "\u2392",
+    "/directcurrentformtwo": "\u2393",
+    "/softwarefunction": "\u2394",
+    "/quadfunc": "\u2395",
+    "/misc:decimalseparator": "\u2396",
+    "/previouspage": "\u2397",
+    "/nextpage": "\u2398",
+    "/printscreen": "\u2399",
+    "/clearscreen": "\u239A",
+    "/parenhookupleft": "\u239B",
+    "/parenextensionleft": "\u239C",
+    "/parenlowerhookleft": "\u239D",
+    "/parenhookupright": "\u239E",
+    "/parenextensionright": "\u239F",
+    "/parenlowerhookright": "\u23A0",
+    "/bracketcornerupleftsquare": "\u23A1",
+    "/bracketextensionleftsquare": "\u23A2",
+    "/bracketlowercornerleftsquare": "\u23A3",
+    "/bracketcorneruprightsquare": "\u23A4",
+    "/bracketextensionrightsquare": "\u23A5",
+    "/bracketlowercornerrightsquare": "\u23A6",
+    "/brackethookupleftcurly": "\u23A7",
+    "/bracketmiddlepieceleftcurly": "\u23A8",
+    "/bracketlowerhookleftcurly": "\u23A9",
+    "/bracketextensioncurly": "\u23AA",
+    "/brackethookuprightcurly": "\u23AB",
+    "/bracketmiddlepiecerightcurly": "\u23AC",
+    "/bracketlowerhookrightcurly": "\u23AD",
+    "/integralextension": "\u23AE",
+    "/lineextensionhorizontal": "\u23AF",
+    "/bracketsectionupleftlowerrightcurly": "\u23B0",
+    "/bracketsectionuprightlowerleftcurly": "\u23B1",
+    "/summationtop": "\u23B2",
+    "/summationbottom": "\u23B3",
+    "/brackettopsquare": "\u23B4",
+    "/bracketbottomsquare": "\u23B5",
+    "/bracketoverbrackettopbottomsquare": "\u23B6",
+    "/radicalbottom": "\u23B7",
+    "/boxlineverticalleft": "\u23B8",
+    "/boxlineverticalright": "\u23B9",
+    "/scanonehorizontal": "\u23BA",
+    "/scanthreehorizontal": "\u23BB",
+    "/scansevenhorizontal": "\u23BC",
+    "/scanninehorizontal": "\u23BD",
+    "/dentistrytopverticalright": "\u23BE",
+    "/dentistrybottomverticalright": "\u23BF",
+    "/dentistrycirclevertical": "\u23C0",
+    "/dentistrycircledownhorizontal": "\u23C1",
+    "/dentistrycircleuphorizontal": "\u23C2",
+    "/dentistrytrianglevertical": "\u23C3",
+    "/dentistrytriangledownhorizontal": "\u23C4",
+    "/dentistrytriangleuphorizontal": "\u23C5",
+    "/dentistrywavevertical": "\u23C6",
+    "/dentistrywavedownhorizontal": "\u23C7",
+    "/dentistrywaveuphorizontal": "\u23C8",
+    "/dentistrydownhorizontal": "\u23C9",
+    "/dentistryuphorizontal": "\u23CA",
+    "/dentistrytopverticalleft": "\u23CB",
+    "/dentistrybottomverticalleft": "\u23CC",
+    "/footsquare": "\u23CD",
+    "/return": "\u23CE",
+    "/eject": "\u23CF",
+    "/lineextensionvertical": "\u23D0",
+    "/brevemetrical": "\u23D1",
+    "/longovershortmetrical": "\u23D2",
+    "/shortoverlongmetrical": "\u23D3",
+    "/longovertwoshortsmetrical": "\u23D4",
+    "/twoshortsoverlongmetrical": "\u23D5",
+    "/twoshortsjoinedmetrical": "\u23D6",
+    "/trisememetrical": "\u23D7",
+    "/tetrasememetrical": "\u23D8",
+    "/pentasememetrical": "\u23D9",
+    "/earthground": "\u23DA",
+    "/fuse": "\u23DB",
+    "/parentop": "\u23DC",
+    "/parenbottom": "\u23DD",
+    "/brackettopcurly": "\u23DE",
+    "/bracketbottomcurly": "\u23DF",
+    "/bracketshelltop": "\u23E0",
+    "/bracketshellbottom": "\u23E1",
+    "/trapeziumwhite": "\u23E2",
+    "/benzeneringcircle": "\u23E3",
+    "/straightness": "\u23E4",
+    "/flatness": "\u23E5",
+    "/accurrent": "\u23E6",
+    "/electricalintersection": "\u23E7",
+    "/decimalexponent": "\u23E8",
+    "/blackpointingdoubletriangleright": "\u23E9",
+    "/blackpointingdoubletriangleleft": "\u23EA",
+    "/blackpointingdoubletriangleup": "\u23EB",
+    "/blackpointingdoubletriangledown": "\u23EC",
+    "/blackpointingdoubletrianglebarverticalright": "\u23ED",
+    "/blackpointingdoubletrianglebarverticalleft": "\u23EE",
+    "/blackpointingtriangledoublebarverticalright": "\u23EF",
+    "/alarmclock": "\u23F0",
+    "/swatchtop": "\u23F1",
+    "/timerclock": "\u23F2",
+    "/hourglassflowings": "\u23F3",
+    "/blackmediumpointingtriangleleft": "\u23F4",
+    "/blackmediumpointingtriangleright": "\u23F5",
+    "/blackmediumpointingtriangleup": "\u23F6",
+    "/blackmediumpointingtriangledown": "\u23F7",
+    "/doublebarvertical": "\u23F8",
+    "/blackforstopsquare": "\u23F9",
+    "/blackcircleforrecord": "\u23FA",
+    "/power": "\u23FB",
+    "/poweronoff": "\u23FC",
+    "/poweron": "\u23FD",
+    "/powersleep": "\u23FE",
+    "/observereye": "\u23FF",
+    "/cntr:null": "\u2400",
+    "/cntr:startofheading": "\u2401",
+    "/cntr:startoftext": "\u2402",
+    "/cntr:endoftext": "\u2403",
+    "/cntr:endoftransmission": "\u2404",
+    "/cntr:enquiry": "\u2405",
+    "/cntr:acknowledge": "\u2406",
+    "/cntr:bell": "\u2407",
+    "/cntr:backspace": "\u2408",
+    "/cntr:horizontaltab": "\u2409",
+    "/cntr:linefeed": "\u240A",
+    "/cntr:verticaltab": "\u240B",
+    "/cntr:formfeed": "\u240C",
+    "/cntr:carriagereturn": "\u240D",
+    "/cntr:shiftout": "\u240E",
+    "/cntr:shiftin": "\u240F",
+    "/cntr:datalinkescape": "\u2410",
+    "/cntr:devicecontrolone": "\u2411",
+    "/cntr:devicecontroltwo": "\u2412",
+    "/cntr:devicecontrolthree": "\u2413",
+    "/cntr:devicecontrolfour": "\u2414",
+    "/cntr:negativeacknowledge": "\u2415",
+    "/cntr:synchronousidle": "\u2416",
+    "/cntr:endoftransmissionblock": "\u2417",
+    "/cntr:cancel": "\u2418",
+    "/cntr:endofmedium": "\u2419",
+    "/cntr:substitute": "\u241A",
+    "/cntr:escape": "\u241B",
+    "/cntr:fileseparator": "\u241C",
+    "/cntr:groupseparator": "\u241D",
+    "/cntr:recordseparator": "\u241E",
+    "/cntr:unitseparator": "\u241F",
+    "/cntr:space": "\u2420",
+    "/cntr:delete": "\u2421",
+    "/cntr:blank": "\u2422",
+    "/cntr:openbox": "\u2423",
+    "/cntr:newline": "\u2424",
+    "/cntr:deleteformtwo": "\u2425",
+    "/cntr:substituteformtwo": "\u2426",
+    "/cntr:deletesquarecheckerboardform": "\u2427",
+    "/cntr:deleterectangularcheckerboardform": "\u2428",
+    "/cntr:deletemediumshadeform": "\u2429",
+    "/ocr:hook": "\u2440",
+    "/ocr:chair": "\u2441",
+    "/fork": "\u2442",
+    "/invertedfork": "\u2443",
+    "/beltbuckle": "\u2444",
+    "/ocr:bowtie": "\u2445",
+    "/branchbankidentification": "\u2446",
+    "/amountofcheck": "\u2447",
+    "/ocr:dash": "\u2448",
+    "/customeraccountnumber": "\u2449",
+    "/backslashdbl": "\u244A",
+    "/oneparenthesized": "\u2474",
+    "/twoparenthesized": "\u2475",
+    "/threeparenthesized": "\u2476",
+    "/fourparenthesized": "\u2477",
+    "/fiveparenthesized": "\u2478",
+    "/sixparenthesized": "\u2479",
+    "/sevenparenthesized": "\u247A",
+    "/eightparenthesized": "\u247B",
+    "/nineparenthesized": "\u247C",
+    "/tenparenthesized": "\u247D",
+    "/elevenparenthesized": "\u247E",
+    "/twelveparenthesized": "\u247F",
+    "/thirteenparenthesized": "\u2480",
+    "/fourteenparenthesized": "\u2481",
+    "/fifteenparenthesized": "\u2482",
+    "/sixteenparenthesized": "\u2483",
+    "/seventeenparenthesized": "\u2484",
+    "/eighteenparenthesized": "\u2485",
+    "/nineteenparenthesized": "\u2486",
+    "/twentyparenthesized": "\u2487",
+    "/aparenthesized": "\u249C",
+    "/bparenthesized": "\u249D",
+    "/cparenthesized": "\u249E",
+    "/dparenthesized": "\u249F",
+    "/eparenthesized": "\u24A0",
+    "/fparenthesized": "\u24A1",
+    "/gparenthesized": "\u24A2",
+    "/hparenthesized": "\u24A3",
+    "/iparenthesized": "\u24A4",
+    "/jparenthesized": "\u24A5",
+    "/kparenthesized": "\u24A6",
+    "/lparenthesized": "\u24A7",
+    "/mparenthesized": "\u24A8",
+    "/nparenthesized": "\u24A9",
+    "/oparenthesized": "\u24AA",
+    "/pparenthesized": "\u24AB",
+    "/qparenthesized": "\u24AC",
+    "/rparenthesized": "\u24AD",
+    "/sparenthesized": "\u24AE",
+    "/tparenthesized": "\u24AF",
+    "/uparenthesized": "\u24B0",
+    "/vparenthesized": "\u24B1",
+    "/wparenthesized": "\u24B2",
+    "/xparenthesized": "\u24B3",
+    "/yparenthesized": "\u24B4",
+    "/zparenthesized": "\u24B5",
+    "/zerocircle": "\u24EA",
+    "/elevencircleblack": "\u24EB",
+    "/twelvecircleblack": "\u24EC",
+    "/thirteencircleblack": "\u24ED",
+    "/fourteencircleblack": "\u24EE",
+    "/fifteencircleblack": "\u24EF",
+    "/sixteencircleblack": "\u24F0",
+    "/seventeencircleblack": "\u24F1",
+    "/eighteencircleblack": "\u24F2",
+    "/nineteencircleblack": "\u24F3",
+    "/twentycircleblack": "\u24F4",
+    "/onecircledbl": "\u24F5",
+    "/twocircledbl": "\u24F6",
+    "/threecircledbl": "\u24F7",
+    "/fourcircledbl": "\u24F8",
+    "/fivecircledbl": "\u24F9",
+    "/sixcircledbl": "\u24FA",
+    "/sevencircledbl": "\u24FB",
+    "/eightcircledbl": "\u24FC",
+    "/ninecircledbl": "\u24FD",
+    "/tencircledbl": "\u24FE",
+    "/zerocircleblack": "\u24FF",
+    "/lighthorz": "\u2500",
+    "/heavyhorz": "\u2501",
+    "/lightvert": "\u2502",
+    "/heavyvert": "\u2503",
+    "/lighttrpldashhorz": "\u2504",
+    "/heavytrpldashhorz": "\u2505",
+    "/lighttrpldashvert": "\u2506",
+    "/heavytrpldashvert": "\u2507",
+    "/lightquaddashhorz": "\u2508",
+    "/heavyquaddashhorz": "\u2509",
+    "/lightquaddashvert": "\u250A",
+    "/heavyquaddashvert": "\u250B",
+    "/lightdnright": "\u250C",
+    "/dnlightrightheavy": "\u250D",
+    "/dnheavyrightlight": "\u250E",
+    "/heavydnright": "\u250F",
+    "/lightdnleft": "\u2510",
+    "/dnlightleftheavy": "\u2511",
+    "/dnheavyleftlight": "\u2512",
+    "/heavydnleft": "\u2513",
+    "/lightupright": "\u2514",
+    "/uplightrightheavy": "\u2515",
+    "/upheavyrightlight": "\u2516",
+    "/heavyupright": "\u2517",
+    "/lightupleft": "\u2518",
+    "/uplightleftheavy": "\u2519",
+    "/upheavyleftlight": "\u251A",
+    "/heavyupleft": "\u251B",
+    "/lightvertright": "\u251C",
+    "/vertlightrightheavy": "\u251D",
+    "/upheavyrightdnlight": "\u251E",
+    "/dnheavyrightuplight": "\u251F",
+    "/vertheavyrightlight": "\u2520",
+    "/dnlightrightupheavy": "\u2521",
+    "/uplightrightdnheavy": "\u2522",
+    "/heavyvertright": "\u2523",
+    "/lightvertleft": "\u2524",
+    "/vertlightleftheavy": "\u2525",
+    "/upheavyleftdnlight": "\u2526",
+    "/dnheavyleftuplight": "\u2527",
+    "/vertheavyleftlight": "\u2528",
+    "/dnlightleftupheavy": "\u2529",
+    "/uplightleftdnheavy": "\u252A",
+    "/heavyvertleft": "\u252B",
+    "/lightdnhorz": "\u252C",
+    "/leftheavyrightdnlight": "\u252D",
+    "/rightheavyleftdnlight": "\u252E",
+    "/dnlighthorzheavy": "\u252F",
+    "/dnheavyhorzlight": "\u2530",
+    "/rightlightleftdnheavy": "\u2531",
+    "/leftlightrightdnheavy": "\u2532",
+    "/heavydnhorz": "\u2533",
+    "/lightuphorz": "\u2534",
+    "/leftheavyrightuplight": "\u2535",
+    "/rightheavyleftuplight": "\u2536",
+    "/uplighthorzheavy": "\u2537",
+    "/upheavyhorzlight": "\u2538",
+    "/rightlightleftupheavy": "\u2539",
+    "/leftlightrightupheavy": "\u253A",
+    "/heavyuphorz": "\u253B",
+    "/lightverthorz": "\u253C",
+    "/leftheavyrightvertlight": "\u253D",
+    "/rightheavyleftvertlight": "\u253E",
+    "/vertlighthorzheavy": "\u253F",
+    "/upheavydnhorzlight": "\u2540",
+    "/dnheavyuphorzlight": "\u2541",
+    "/vertheavyhorzlight": "\u2542",
+    "/leftupheavyrightdnlight": "\u2543",
+    "/rightupheavyleftdnlight": "\u2544",
+    "/leftdnheavyrightuplight": "\u2545",
+    "/rightdnheavyleftuplight": "\u2546",
+    "/dnlightuphorzheavy": "\u2547",
+    "/uplightdnhorzheavy": "\u2548",
+    "/rightlightleftvertheavy": "\u2549",
+    "/leftlightrightvertheavy": "\u254A",
+    "/heavyverthorz": "\u254B",
+    "/lightdbldashhorz": "\u254C",
+    "/heavydbldashhorz": "\u254D",
+    "/lightdbldashvert": "\u254E",
+    "/heavydbldashvert": "\u254F",
+    "/dblhorz": "\u2550",
+    "/dblvert": "\u2551",
+    "/dnsngrightdbl": "\u2552",
+    "/dndblrightsng": "\u2553",
+    "/dbldnright": "\u2554",
+    "/dnsngleftdbl": "\u2555",
+    "/dndblleftsng": "\u2556",
+    "/dbldnleft": "\u2557",
+    "/upsngrightdbl": "\u2558",
+    "/updblrightsng": "\u2559",
+    "/dblupright": "\u255A",
+    "/upsngleftdbl": "\u255B",
+    "/updblleftsng": "\u255C",
+    "/dblupleft": "\u255D",
+    "/vertsngrightdbl": "\u255E",
+    "/vertdblrightsng": "\u255F",
+    "/dblvertright": "\u2560",
+    "/vertsngleftdbl": "\u2561",
+    "/vertdblleftsng": "\u2562",
+    "/dblvertleft": "\u2563",
+    "/dnsnghorzdbl": "\u2564",
+    "/dndblhorzsng": "\u2565",
+    "/dbldnhorz": "\u2566",
+    "/upsnghorzdbl": "\u2567",
+    "/updblhorzsng": "\u2568",
+    "/dbluphorz": "\u2569",
+    "/vertsnghorzdbl": "\u256A",
+    "/vertdblhorzsng": "\u256B",
+    "/dblverthorz": "\u256C",
+    "/lightarcdnright": "\u256D",
+    "/lightarcdnleft": "\u256E",
+    "/lightarcupleft": "\u256F",
+    "/lightarcupright": "\u2570",
+    "/lightdiaguprightdnleft": "\u2571",
+    "/lightdiagupleftdnright": "\u2572",
+    "/lightdiagcross": "\u2573",
+    "/lightleft": "\u2574",
+    "/lightup": "\u2575",
+    "/lightright": "\u2576",
+    "/lightdn": "\u2577",
+    "/heavyleft": "\u2578",
+    "/heavyup": "\u2579",
+    "/heavyright": "\u257A",
+    "/heavydn": "\u257B",
+    "/lightleftheavyright": "\u257C",
+    "/lightupheavydn": "\u257D",
+    "/heavyleftlightright": "\u257E",
+    "/heavyuplightdn": "\u257F",
+    "/upperHalfBlock": "\u2580",
+    "/lowerOneEighthBlock": "\u2581",
+    "/lowerOneQuarterBlock": "\u2582",
+    "/lowerThreeEighthsBlock": "\u2583",
+    "/lowerHalfBlock": "\u2584",
+    "/lowerFiveEighthsBlock": "\u2585",
+    "/lowerThreeQuartersBlock": "\u2586",
+    "/lowerSevenEighthsBlock": "\u2587",
+    "/fullBlock": "\u2588",
+    "/leftSevenEighthsBlock": "\u2589",
+    "/leftThreeQuartersBlock": "\u258A",
+    "/leftFiveEighthsBlock": "\u258B",
+    "/leftHalfBlock": "\u258C",
+    "/leftThreeEighthsBlock": "\u258D",
+    "/leftOneQuarterBlock": "\u258E",
+    "/leftOneEighthBlock": "\u258F",
+    "/rightHalfBlock": "\u2590",
+    "/lightShade": "\u2591",
+    "/mediumShade": "\u2592",
+    "/darkShade": "\u2593",
+    "/upperOneEighthBlock": "\u2594",
+    "/rightOneEighthBlock": "\u2595",
+    "/quadrantLowerLeft": "\u2596",
+    "/quadrantLowerRight": "\u2597",
+    "/quadrantUpperLeft": "\u2598",
+    "/quadrantUpperLeftAndLowerLeftAndLowerRight": "\u2599",
+    "/quadrantUpperLeftAndLowerRight": "\u259A",
+    "/quadrantUpperLeftAndUpperRightAndLowerLeft": "\u259B",
+    "/quadrantUpperLeftAndUpperRightAndLowerRight": "\u259C",
+    "/quadrantUpperRight": "\u259D",
+    "/quadrantUpperRightAndLowerLeft": "\u259E",
+    "/quadrantUpperRightAndLowerLeftAndLowerRight": "\u259F",
+    "/squareblack": "\u25A0",
+    "/squarewhite": "\u25A1",
+    "/squarewhiteround": "\u25A2",
+    "/squarewhitewithsquaresmallblack": "\u25A3",
+    "/squaresmallblack": "\u25AA",
+    "/squaresmallwhite": "\u25AB",
+    "/rectangleblack": "\u25AC",
+    "/rectanglewhite": "\u25AD",
+    "/rectangleverticalblack": "\u25AE",
+    "/rectangleverticalwhite": "\u25AF",
+    "/parallelogramblack": "\u25B0",
+    "/parallelogramwhite": "\u25B1",
+    "/triangleupblack": "\u25B2",
+    "/triangleupwhite": "\u25B3",
+    "/triangleupsmallblack": "\u25B4",
+    "/triangleupsmallwhite": "\u25B5",
+    "/trianglerightblack": "\u25B6",
+    "/trianglerightwhite": "\u25B7",
+    "/trianglerightsmallblack": "\u25B8",
+    "/trianglerightsmallwhite": "\u25B9",
+    "/pointerrightblack": "\u25BA",
+    "/pointerrightwhite": "\u25BB",
+    "/triangledownblack": "\u25BC",
+    "/triangledownwhite": "\u25BD",
+    "/triangledownsmallblack": "\u25BE",
+    "/triangledownsmallwhite": "\u25BF",
+    "/triangleleftblack": "\u25C0",
+    "/triangleleftwhite": "\u25C1",
+    "/triangleleftsmallblack": "\u25C2",
+    "/triangleleftsmallwhite": "\u25C3",
+    "/pointerleftblack": "\u25C4",
+    "/pointerleftwhite": "\u25C5",
+    "/gmtr:diamondblack": "\u25C6",
+    "/gmtr:diamondwhite": "\u25C7",
+    "/diamondwhitewithdiamondsmallblack": "\u25C8",
+    "/circlewhite": "\u25CB",
+    "/circledotted": "\u25CC",
+    "/circleverticalfill": "\u25CD",
+    "/circleblack": "\u25CF",
+    "/circlehalfleftblack": "\u25D0",
+    "/circlehalfrightblack": "\u25D1",
+    "/circlelowerhalfblack": "\u25D2",
+    "/circleupperhalfblack": "\u25D3",
+    "/circleupperquadrantrightblack": "\u25D4",
+    "/circleallbutupperquadrantleftblack": "\u25D5",
+    "/halfcircleleftblack": "\u25D6",
+    "/halfcirclerightblack": "\u25D7",
+    "/circleinversewhite": "\u25D9",
+    "/upperhalfcircleinversewhite": "\u25DA",
+    "/lowerhalfcircleinversewhite": "\u25DB",
+    "/upperquadrantcirculararcleft": "\u25DC",
+    "/upperquadrantcirculararcright": "\u25DD",
+    "/lowerquadrantcirculararcright": "\u25DE",
+    "/lowerquadrantcirculararcleft": "\u25DF",
+    "/upperhalfcircle": "\u25E0",
+    "/lowerhalfcircle": "\u25E1",
+    "/lowertrianglerightblack": "\u25E2",
+    "/lowertriangleleftblack": "\u25E3",
+    "/uppertriangleleftblack": "\u25E4",
+    "/uppertrianglerightblack": "\u25E5",
+    "/squarehalfleftblack": "\u25E7",
+    "/squarehalfrightblack": "\u25E8",
+    "/squareupperdiagonalhalfleftblack": "\u25E9",
+    "/squarelowerdiagonalhalfrightblack": "\u25EA",
+    "/squarewhitebisectinglinevertical": "\u25EB",
+    "/triangledotupwhite": "\u25EC",
+    "/trianglehalfupleftblack": "\u25ED",
+    "/trianglehalfuprightblack": "\u25EE",
+    "/squarewhiteupperquadrantleft": "\u25F0",
+    "/squarewhitelowerquadrantleft": "\u25F1",
+    "/squarewhitelowerquadrantright": "\u25F2",
+    "/squarewhiteupperquadrantright": "\u25F3",
+    "/circleupperquadrantleftwhite": "\u25F4",
+    "/circlelowerquadrantleftwhite": "\u25F5",
+    "/circlelowerquadrantrightwhite": "\u25F6",
+    "/circleupperquadrantrightwhite": "\u25F7",
+    "/uppertriangleleft": "\u25F8",
+    "/uppertriangleright": "\u25F9",
+    "/lowertriangleleft": "\u25FA",
+    "/squaremediumwhite": "\u25FB",
+    "/squaremediumblack": "\u25FC",
+    "/squaresmallmediumwhite": "\u25FD",
+    "/squaresmallmediumblack": "\u25FE",
+    "/lowertriangleright": "\u25FF",
+    "/sunraysblack": "\u2600",
+    "/cloud": "\u2601",
+    "/umbrella": "\u2602",
+    "/snowman": "\u2603",
+    "/comet": "\u2604",
+    "/starblack": "\u2605",
+    "/starwhite": "\u2606",
+    "/lightning": "\u2607",
+    "/thunderstorm": "\u2608",
+    "/nodeascending": "\u260A",
+    "/nodedescending": "\u260B",
+    "/conjunction": "\u260C",
+    "/opposition": "\u260D",
+    "/telephonewhite": "\u260F",
+    "/checkbox": "\u2610",
+    "/checkboxchecked": "\u2611",
+    "/checkboxx": "\u2612",
+    "/saltire": "\u2613",
+    "/umbrellaraindrops": "\u2614",
+    "/hotbeverage": "\u2615",
+    "/shogipiecewhite": "\u2616",
+    "/shogipieceblack": "\u2617",
+    "/shamrock": "\u2618",
+    "/floralheartbulletreversedrotated": "\u2619",
+    "/pointingindexleftblack": "\u261A",
+    "/pointingindexrightblack": "\u261B",
+    "/skullcrossbones": "\u2620",
+    "/caution": "\u2621",
+    "/radioactive": "\u2622",
+    "/biohazard": "\u2623",
+    "/caduceus": "\u2624",
+    "/ankh": "\u2625",
+    "/orthodoxcross": "\u2626",
+    "/chirho": "\u2627",
+    "/crossoflorraine": "\u2628",
+    "/crossofjerusalem": "\u2629",
+    "/starcrescent": "\u262A",
+    "/farsi": "\u262B",
+    "/adishakti": "\u262C",
+    "/hammersickle": "\u262D",
+    "/peace": "\u262E",
+    "/trigramheaven": "\u2630",
+    "/trigramlake": "\u2631",
+    "/trigramfire": "\u2632",
+    "/trigramthunder": "\u2633",
+    "/trigramwind": "\u2634",
+    "/trigramwater": "\u2635",
+    "/trigrammountain": "\u2636",
+    "/trigramearth": "\u2637",
+    "/wheelofdharma": "\u2638",
+    "/frowningfacewhite": "\u2639",
+    "/smilingfacewhite": "\u263A",
+    "/smilingfaceblack": "\u263B",
+    "/sunrayswhite": "\u263C",
+    "/firstquartermoon": "\u263D",
+    "/lastquartermoon": "\u263E",
+    "/mercury": "\u263F",
+    "/jiterup": "\u2643",
+    "/saturn": "\u2644",
+    "/uranus": "\u2645",
+    "/neptune": "\u2646",
+    "/pluto": "\u2647",
+    "/aries": "\u2648",
+    "/taurus": "\u2649",
+    "/gemini": "\u264A",
+    "/cancer": "\u264B",
+    "/leo": "\u264C",
+    "/virgo": "\u264D",
+    "/libra": "\u264E",
+    "/scorpius": "\u264F",
+    "/sagittarius": "\u2650",
+    "/capricorn": "\u2651",
+    "/aquarius": "\u2652",
+    "/pisces": "\u2653",
+    "/kingwhite": "\u2654",
+    "/queenwhite": "\u2655",
+    "/rookwhite": "\u2656",
+    "/bishopwhite": "\u2657",
+    "/knightwhite": "\u2658",
+    "/pawnwhite": "\u2659",
+    "/kingblack": "\u265A",
+    "/queenblack": "\u265B",
+    "/rookblack": "\u265C",
+    "/bishopblack": "\u265D",
+    "/knightblack": "\u265E",
+    "/pawnblack": "\u265F",
+    "/spadeblack": "\u2660",
+    "/heartwhite": "\u2661",
+    "/misc:diamondwhite": "\u2662",
+    "/clubblack": "\u2663",
+    "/spadewhite": "\u2664",
+    "/heartblack": "\u2665",
+    "/misc:diamondblack": "\u2666",
+    "/clubwhite": "\u2667",
+    "/eighthnote": "\u266A",
+    "/beamedeighthnotes": "\u266B",
+    "/musicflat": "\u266D",
+    "/musicnatural": "\u266E",
+    "/musicsharp": "\u266F",
+    "/westsyriaccross": "\u2670",
+    "/eastsyriaccross": "\u2671",
+    "/recycleuniversal": "\u2672",
+    "/recycleoneplastics": "\u2673",
+    "/recycletwoplastics": "\u2674",
+    "/recyclethreeplastics": "\u2675",
+    "/recyclefourplastics": "\u2676",
+    "/recyclefiveplastics": "\u2677",
+    "/recyclesixplastics": "\u2678",
+    "/recyclesevenplastics": "\u2679",
+    "/recyclegeneric": "\u267A",
+    "/recycleuniversalblack": "\u267B",
+    "/recycledpaper": "\u267C",
+    "/recyclepartiallypaper": "\u267D",
+    "/permanentpaper": "\u267E",
+    "/wheelchair": "\u267F",
+    "/dieone": "\u2680",
+    "/dietwo": "\u2681",
+    "/diethree": "\u2682",
+    "/diefour": "\u2683",
+    "/diefive": "\u2684",
+    "/diesix": "\u2685",
+    "/circledotrightwhite": "\u2686",
+    "/circletwodotswhite": "\u2687",
+    "/circlewhitedotrightblack": "\u2688",
+    "/circletwodotsblackwhite": "\u2689",
+    "/monogramyang": "\u268A",
+    "/monogramyin": "\u268B",
+    "/digramgreateryang": "\u268C",
+    "/digramlesseryin": "\u268D",
+    "/digramlesseryang": "\u268E",
+    "/digramgreateryin": "\u268F",
+    "/flagwhite": "\u2690",
+    "/flagblack": "\u2691",
+    "/hammerpick": "\u2692",
+    "/anchor": "\u2693",
+    "/crossedswords": "\u2694",
+    "/staffofaesculapius": "\u2695",
+    "/scales": "\u2696",
+    "/alembic": "\u2697",
+    "/flower": "\u2698",
+    "/gear": "\u2699",
+    "/staffofhermes": "\u269A",
+    "/atom": "\u269B",
+    "/fleurdelis": "\u269C",
+    "/staroutlinedwhite": "\u269D",
+    "/threelinesconvergingright": "\u269E",
+    "/threelinesconvergingleft": "\u269F",
+    "/warning": "\u26A0",
+    "/highvoltage": "\u26A1",
+    "/dfemaledbl": "\u26A2",
+    "/dmaledbl": "\u26A3",
+    "/interlockedfemalemale": "\u26A4",
+    "/malefemale": "\u26A5",
+    "/malestroke": "\u26A6",
+    "/malestrokemalefemale": "\u26A7",
+    "/verticalmalestroke": "\u26A8",
+    "/horizontalmalestroke": "\u26A9",
+    "/mediumcirclewhite": "\u26AA",
+    "/mediumcircleblack": "\u26AB",
+    "/mediumsmallcirclewhite": "\u26AC",
+    "/marriage": "\u26AD",
+    "/divorce": "\u26AE",
+    "/unmarriedpartnership": "\u26AF",
+    "/coffin": "\u26B0",
+    "/funeralurn": "\u26B1",
+    "/neuter": "\u26B2",
+    "/ceres": "\u26B3",
+    "/pallas": "\u26B4",
+    "/juno": "\u26B5",
+    "/vesta": "\u26B6",
+    "/chiron": "\u26B7",
+    "/moonlilithblack": "\u26B8",
+    "/sextile": "\u26B9",
+    "/semisextile": "\u26BA",
+    "/quincunx": "\u26BB",
+    "/sesquiquadrate": "\u26BC",
+    "/soccerball": "\u26BD",
+    "/baseball": "\u26BE",
+    "/squaredkey": "\u26BF",
+    "/draughtsmanwhite": "\u26C0",
+    "/draughtskingwhite": "\u26C1",
+    "/draughtsmanblack": "\u26C2",
+    "/draughtskingblack": "\u26C3",
+    "/snowmanoutsnow": "\u26C4",
+    "/sunbehindcloud": "\u26C5",
+    "/rain": "\u26C6",
+    "/snowmanblack": "\u26C7",
+    "/thundercloudrain": "\u26C8",
+    "/turnedshogipiecewhite": "\u26C9",
+    "/turnedshogipieceblack": "\u26CA",
+    "/diamondinsquarewhite": "\u26CB",
+    "/crossinglanes": "\u26CC",
+    "/disabledcar": "\u26CD",
+    "/ophiuchus": "\u26CE",
+    "/pick": "\u26CF",
+    "/carsliding": "\u26D0",
+    "/helmetcrosswhite": "\u26D1",
+    "/circledcrossinglanes": "\u26D2",
+    "/chains": "\u26D3",
+    "/noentry": "\u26D4",
+    "/alternateonewayleftwaytraffic": "\u26D5",
+    "/twowayleftwaytrafficblack": "\u26D6",
+    "/twowayleftwaytrafficwhite": "\u26D7",
+    "/lanemergeleftblack": "\u26D8",
+    "/lanemergeleftwhite": "\u26D9",
+    "/driveslow": "\u26DA",
+    "/pointingtriangledownheavywhite": "\u26DB",
+    "/closedentryleft": "\u26DC",
+    "/squaredsaltire": "\u26DD",
+    "/fallingdiagonalincircleinsquareblackwhite": "\u26DE",
+    "/truckblack": "\u26DF",
+    "/restrictedentryoneleft": "\u26E0",
+    "/restrictedentrytwoleft": "\u26E1",
+    "/astronomicaluranus": "\u26E2",
+    "/circlestroketwodotsaboveheavy": "\u26E3",
+    "/pentagram": "\u26E4",
+    "/hedinterlacedpentagramright": "\u26E5",
+    "/hedinterlacedpentagramleft": "\u26E6",
+    "/invertedpentagram": "\u26E7",
+    "/crossonshieldblack": "\u26E8",
+    "/shintoshrine": "\u26E9",
+    "/church": "\u26EA",
+    "/castle": "\u26EB",
+    "/historicsite": "\u26EC",
+    "/gearouthub": "\u26ED",
+    "/gearhles": "\u26EE",
+    "/maplighthouse": "\u26EF",
+    "/mountain": "\u26F0",
+    "/umbrellaonground": "\u26F1",
+    "/fountain": "\u26F2",
+    "/flaginhole": "\u26F3",
+    "/ferry": "\u26F4",
+    "/sailboat": "\u26F5",
+    "/squarefourcorners": "\u26F6",
+    "/skier": "\u26F7",
+    "/iceskate": "\u26F8",
+    "/personball": "\u26F9",
+    "/tent": "\u26FA",
+    "/japanesebank": "\u26FB",
+    "/headstonegraveyard": "\u26FC",
+    "/fuelpump": "\u26FD",
+    "/consquareupblack": "\u26FE",
+    "/flaghorizontalmiddlestripeblackwhite": "\u26FF",
+    "/safetyscissorsblack": "\u2700",
+    "/scissorsupperblade": "\u2701",
+    "/scissorsblack": "\u2702",
+    "/scissorslowerblade": "\u2703",
+    "/scissorswhite": "\u2704",
+    "/checkwhiteheavy": "\u2705",
+    "/telephonelocationsign": "\u2706",
+    "/tapedrive": "\u2707",
+    "/airplane": "\u2708",
+    "/envelope": "\u2709",
+    "/raisedfist": "\u270A",
+    "/raisedh": "\u270B",
+    "/hvictory": "\u270C",
+    "/hwriting": "\u270D",
+    "/pencillowerright": "\u270E",
+    "/pencil": "\u270F",
+    "/pencilupperright": "\u2710",
+    "/nibwhite": "\u2711",
+    "/nibblack": "\u2712",
+    "/check": "\u2713",
+    "/checkheavy": "\u2714",
+    "/multiplicationx": "\u2715",
+    "/multiplicationxheavy": "\u2716",
+    "/ballotx": "\u2717",
+    "/ballotxheavy": "\u2718",
+    "/greekcrossoutlined": "\u2719",
+    "/greekcrossheavy": "\u271A",
+    "/crosscentreopen": "\u271B",
+    "/crosscentreopenheavy": "\u271C",
+    "/latincross": "\u271D",
+    "/latincrossshadowedwhite": "\u271E",
+    "/latincrossoutlined": "\u271F",
+    "/maltesecross": "\u2720",
+    "/starofdavid": "\u2721",
+    "/asteriskteardropfour": "\u2722",
+    "/asteriskballoonfour": "\u2723",
+    "/asteriskballoonheavyfour": "\u2724",
+    "/asteriskclubfour": "\u2725",
+    "/starpointedblackfour": "\u2726",
+    "/starpointedwhitefour": "\u2727",
+    "/sparkles": "\u2728",
+    "/staroutlinedstresswhite": "\u2729",
+    "/starcircledwhite": "\u272A",
+    "/starcentreopenblack": "\u272B",
+    "/starcentreblackwhite": "\u272C",
+    "/staroutlinedblack": "\u272D",
+    "/staroutlinedblackheavy": "\u272E",
+    "/starpinwheel": "\u272F",
+    "/starshadowedwhite": "\u2730",
+    "/asteriskheavy": "\u2731",
+    "/asteriskcentreopen": "\u2732",
+    "/spokedasteriskeight": "\u2733",
+    "/starpointedblackeight": "\u2734",
+    "/starpointedpinwheeleight": "\u2735",
+    "/starpointedblacksix": "\u2736",
+    "/compasstarpointedblackeight": "\u2737",
+    "/compasstarpointedblackheavyeight": "\u2738",
+    "/starpointedblacktwelve": "\u2739",
+    "/asteriskpointedsixteen": "\u273A",
+    "/asteriskteardrop": "\u273B",
+    "/asteriskteardropcentreopen": "\u273C",
+    "/asteriskteardropheavy": "\u273D",
+    "/florettepetalledblackwhitesix": "\u273E",
+    "/floretteblack": "\u273F",
+    "/florettewhite": "\u2740",
+    "/floretteoutlinedpetalledblackeight": "\u2741",
+    "/starcentreopenpointedcircledeight": "\u2742",
+    "/asteriskteardroppinwheelheavy": "\u2743",
+    "/snowflake": "\u2744",
+    "/snowflaketight": "\u2745",
+    "/chevronsnowflakeheavy": "\u2746",
+    "/sparkle": "\u2747",
+    "/sparkleheavy": "\u2748",
+    "/asteriskballoon": "\u2749",
+    "/asteriskteardroppropellereight": "\u274A",
+    "/asteriskteardroppropellerheavyeight": "\u274B",
+    "/cross": "\u274C",
+    "/circleshadowedwhite": "\u274D",
+    "/squaredcrossnegative": "\u274E",
+    "/squareshadowlowerrightwhite": "\u274F",
+    "/squareshadowupperrightwhite": "\u2750",
+    "/squarelowerrightshadowedwhite": "\u2751",
+    "/squareupperrightshadowedwhite": "\u2752",
+    "/questionblackornament": "\u2753",
+    "/questionwhiteornament": "\u2754",
+    "/exclamationwhiteornament": "\u2755",
+    "/diamondminusxblackwhite": "\u2756",
+    "/exclamationheavy": "\u2757",
+    "/verticalbarlight": "\u2758",
+    "/verticalbarmedium": "\u2759",
+    "/verticalbarheavy": "\u275A",
+    "/commaheavyturnedornament": "\u275B",
+    "/commaheavyornament": "\u275C",
+    "/commaheavydoubleturnedornament": "\u275D",
+    "/commaheavydoubleornament": "\u275E",
+    "/lowcommaheavyornament": "\u275F",
+    "/lowcommaheavydoubleornament": "\u2760",
+    "/curvedstemparagraphsignornament": "\u2761",
+    "/exclamationheavyornament": "\u2762",
+    "/heartexclamationheavyornament": "\u2763",
+    "/heartblackheavy": "\u2764",
+    "/heartbulletrotatedblackheavy": "\u2765",
+    "/floralheart": "\u2766",
+    "/floralheartbulletrotated": "\u2767",
+    "/parenthesisleftmediumornament": "\u2768",
+    "/parenthesisrightmediumornament": "\u2769",
+    "/parenthesisleftflattenedmediumornament": "\u276A",
+    "/parenthesisrightflattenedmediumornament": "\u276B",
+    "/bracketleftpointedanglemediumornament": "\u276C",
+    "/bracketrightpointedanglemediumornament": "\u276D",
+    "/quotationleftpointedangleheavyornament": "\u276E",
+    "/quotationrightpointedangleheavyornament": "\u276F",
+    "/bracketleftpointedangleheavyornament": "\u2770",
+    "/bracketrightpointedangleheavyornament": "\u2771",
+    "/bracketshellleftlightornament": "\u2772",
+    "/bracketshellrightlightornament": "\u2773",
+    "/curlybracketleftmediumornament": "\u2774",
+    "/curlybracketrightmediumornament": "\u2775",
+    "/onenegativecircled": "\u2776",
+    "/twonegativecircled": "\u2777",
+    "/threenegativecircled": "\u2778",
+    "/fournegativecircled": "\u2779",
+    "/fivenegativecircled": "\u277A",
+    "/sixnegativecircled": "\u277B",
+    "/sevennegativecircled": "\u277C",
+    "/eightnegativecircled": "\u277D",
+    "/ninenegativecircled": "\u277E",
+    "/tennegativecircled": "\u277F",
+    "/onesanscircled": "\u2780",
+    "/twosanscircled": "\u2781",
+    "/threesanscircled": "\u2782",
+    "/foursanscircled": "\u2783",
+    "/fivesanscircled": "\u2784",
+    "/sixsanscircled": "\u2785",
+    "/sevensanscircled": "\u2786",
+    "/eightsanscircled": "\u2787",
+    "/ninesanscircled": "\u2788",
+    "/tensanscircled": "\u2789",
+    "/onesansnegativecircled": "\u278A",
+    "/twosansnegativecircled": "\u278B",
+    "/threesansnegativecircled": "\u278C",
+    "/foursansnegativecircled": "\u278D",
+    "/fivesansnegativecircled": "\u278E",
+    "/sixsansnegativecircled": "\u278F",
+    "/sevensansnegativecircled": "\u2790",
+    "/eightsansnegativecircled": "\u2791",
+    "/ninesansnegativecircled": "\u2792",
+    "/tensansnegativecircled": "\u2793",
+    "/arrowrightwideheavy": "\u2794",
+    "/plussignheavy": "\u2795",
+    "/minussignheavy": "\u2796",
+    "/divisionsignheavy": "\u2797",
+    "/arrowheavySE": "\u2798",
+    "/arrowheavyNE": "\u279A",
+    "/arrowrightpointed": "\u279B",
+    "/arrowrightroundheavy": "\u279C",
+    "/arrowrighttriangle": "\u279D",
+    "/arrowrighttriangleheavy": "\u279E",
+    "/arrowrighttriangledashed": "\u279F",
+    "/arrowrighttriangledashedheavy": "\u27A0",
+    "/arrowrightblack": "\u27A1",
+    "/arrowheadrightthreeDtoplight": "\u27A2",
+    "/arrowheadrightthreeDbottomlight": "\u27A3",
+    "/arrowheadrightblack": "\u27A4",
+    "/arrowrightcurvedownblackheavy": "\u27A5",
+    "/arrowrightcurveupblackheavy": "\u27A6",
+    "/arrowrightsquatblack": "\u27A7",
+    "/arrowrightpointedblackheavy": "\u27A8",
+    "/arrowrightrightshadedwhite": "\u27A9",
+    "/arrowrightleftshadedwhite": "\u27AA",
+    "/arrowrightbacktiltedshadowedwhite": "\u27AB",
+    "/arrowrightfronttiltedshadowedwhite": "\u27AC",
+    "/arrowshadowrightlowerwhiteheavy": "\u27AD",
+    "/arrowshadowrightupperwhiteheavy": "\u27AE",
+    "/arrowshadowrightnotchedlowerwhite": "\u27AF",
+    "/curlyloop": "\u27B0",
+    "/arrowshadowrightnotchedupperwhite": "\u27B1",
+    "/arrowrightcircledwhiteheavy": "\u27B2",
+    "/arrowrightfeatheredwhite": "\u27B3",
+    "/arrowfeatheredblackSE": "\u27B4",
+    "/arrowrightfeatheredblack": "\u27B5",
+    "/arrowfeatheredblackNE": "\u27B6",
+    "/arrowfeatheredblackheavySE": "\u27B7",
+    "/arrowrightfeatheredblackheavy": "\u27B8",
+    "/arrowfeatheredblackheavyNE": "\u27B9",
+    "/arrowteardropright": "\u27BA",
+    "/arrowteardroprightheavy": "\u27BB",
+    "/arrowrightwedge": "\u27BC",
+    "/arrowrightwedgeheavy": "\u27BD",
+    "/arrowrightoutlinedopen": "\u27BE",
+    "/curlyloopdouble": "\u27BF",
+    "/threedimensionalangle": "\u27C0",
+    "/tricontainingtriwhiteanglesmall": "\u27C1",
+    "/opensubset": "\u27C3",
+    "/opensuperset": "\u27C4",
+    "/bagdelimitersshapeleft": "\u27C5",
+    "/bagdelimitersshaperight": "\u27C6",
+    "/ordotinside": "\u27C7",
+    "/solidussubsetreversepreceding": "\u27C8",
+    "/solidussupersetpreceding": "\u27C9",
+    "/verticalbarhorizontalstroke": "\u27CA",
+    "/risingdiagonal": "\u27CB",
+    "/longdivision": "\u27CC",
+    "/fallingdiagonal": "\u27CD",
+    "/dlogicalsquare": "\u27CE",
+    "/dlogicalorsquare": "\u27CF",
+    "/centreddotwhitediamond": "\u27D0",
+    "/andwithdot": "\u27D1",
+    "/elementopeningup": "\u27D2",
+    "/lowercornerdotright": "\u27D3",
+    "/cornerdotupleft": "\u27D4",
+    "/outerjoinleft": "\u27D5",
+    "/outerjoinright": "\u27D6",
+    "/outerjoinfull": "\u27D7",
+    "/largetackup": "\u27D8",
+    "/largetackdown": "\u27D9",
+    "/turnstileleftrightdbl": "\u27DA",
+    "/tackleftright": "\u27DB",
+    "/multimapleft": "\u27DC",
+    "/longtackright": "\u27DD",
+    "/longtackleft": "\u27DE",
+    "/tackcircleaboveup": "\u27DF",
+    "/lozengedividedbyrulehorizontal": "\u27E0",
+    "/convavediamondwhite": "\u27E1",
+    "/tickconvavediamondleftwhite": "\u27E2",
+    "/tickconvavediamondrightwhite": "\u27E3",
+    "/tickleftwhitesquare": "\u27E4",
+    "/tickrightwhitesquare": "\u27E5",
+    "/bracketwhitesquareleft": "\u27E6",
+    "/bracketwhitesquareright": "\u27E7",
+    "/bracketangleleft": "\u27E8",
+    "/bracketangleright": "\u27E9",
+    "/bracketangledblleft": "\u27EA",
+    "/bracketangledblright": "\u27EB",
+    "/bracketshellwhiteleft": "\u27EC",
+    "/bracketshellwhiteright": "\u27ED",
+    "/parenflatleft": "\u27EE",
+    "/parenflatright": "\u27EF",
+    "/brblank": "\u2800",
+    "/dots1": "\u2801",
+    "/dots2": "\u2802",
+    "/dots12": "\u2803",
+    "/dots3": "\u2804",
+    "/dots13": "\u2805",
+    "/dots23": "\u2806",
+    "/dots123": "\u2807",
+    "/dots4": "\u2808",
+    "/dots14": "\u2809",
+    "/dots24": "\u280A",
+    "/dots124": "\u280B",
+    "/dots34": "\u280C",
+    "/dots134": "\u280D",
+    "/dots234": "\u280E",
+    "/dots1234": "\u280F",
+    "/dots5": "\u2810",
+    "/dots15": "\u2811",
+    "/dots25": "\u2812",
+    "/dots125": "\u2813",
+    "/dots35": "\u2814",
+    "/dots135": "\u2815",
+    "/dots235": "\u2816",
+    "/dots1235": "\u2817",
+    "/dots45": "\u2818",
+    "/dots145": "\u2819",
+    "/dots245": "\u281A",
+    "/dots1245": "\u281B",
+    "/dots345": "\u281C",
+    "/dots1345": "\u281D",
+    "/dots2345": "\u281E",
+    "/dots12345": "\u281F",
+    "/dots6": "\u2820",
+    "/dots16": "\u2821",
+    "/dots26": "\u2822",
+    "/dots126": "\u2823",
+    "/dots36": "\u2824",
+    "/dots136": "\u2825",
+    "/dots236": "\u2826",
+    "/dots1236": "\u2827",
+    "/dots46": "\u2828",
+    "/dots146": "\u2829",
+    "/dots246": "\u282A",
+    "/dots1246": "\u282B",
+    "/dots346": "\u282C",
+    "/dots1346": "\u282D",
+    "/dots2346": "\u282E",
+    "/dots12346": "\u282F",
+    "/dots56": "\u2830",
+    "/dots156": "\u2831",
+    "/dots256": "\u2832",
+    "/dots1256": "\u2833",
+    "/dots356": "\u2834",
+    "/dots1356": "\u2835",
+    "/dots2356": "\u2836",
+    "/dots12356": "\u2837",
+    "/dots456": "\u2838",
+    "/dots1456": "\u2839",
+    "/dots2456": "\u283A",
+    "/dots12456": "\u283B",
+    "/dots3456": "\u283C",
+    "/dots13456": "\u283D",
+    "/dots23456": "\u283E",
+    "/dots123456": "\u283F",
+    "/dots7": "\u2840",
+    "/dots17": "\u2841",
+    "/dots27": "\u2842",
+    "/dots127": "\u2843",
+    "/dots37": "\u2844",
+    "/dots137": "\u2845",
+    "/dots237": "\u2846",
+    "/dots1237": "\u2847",
+    "/dots47": "\u2848",
+    "/dots147": "\u2849",
+    "/dots247": "\u284A",
+    "/dots1247": "\u284B",
+    "/dots347": "\u284C",
+    "/dots1347": "\u284D",
+    "/dots2347": "\u284E",
+    "/dots12347": "\u284F",
+    "/dots57": "\u2850",
+    "/dots157": "\u2851",
+    "/dots257": "\u2852",
+    "/dots1257": "\u2853",
+    "/dots357": "\u2854",
+    "/dots1357": "\u2855",
+    "/dots2357": "\u2856",
+    "/dots12357": "\u2857",
+    "/dots457": "\u2858",
+    "/dots1457": "\u2859",
+    "/dots2457": "\u285A",
+    "/dots12457": "\u285B",
+    "/dots3457": "\u285C",
+    "/dots13457": "\u285D",
+    "/dots23457": "\u285E",
+    "/dots123457": "\u285F",
+    "/dots67": "\u2860",
+    "/dots167": "\u2861",
+    "/dots267": "\u2862",
+    "/dots1267": "\u2863",
+    "/dots367": "\u2864",
+    "/dots1367": "\u2865",
+    "/dots2367": "\u2866",
+    "/dots12367": "\u2867",
+    "/dots467": "\u2868",
+    "/dots1467": "\u2869",
+    "/dots2467": "\u286A",
+    "/dots12467": "\u286B",
+    "/dots3467": "\u286C",
+    "/dots13467": "\u286D",
+    "/dots23467": "\u286E",
+    "/dots123467": "\u286F",
+    "/dots567": "\u2870",
+    "/dots1567": "\u2871",
+    "/dots2567": "\u2872",
+    "/dots12567": "\u2873",
+    "/dots3567": "\u2874",
+    "/dots13567": "\u2875",
+    "/dots23567": "\u2876",
+    "/dots123567": "\u2877",
+    "/dots4567": "\u2878",
+    "/dots14567": "\u2879",
+    "/dots24567": "\u287A",
+    "/dots124567": "\u287B",
+    "/dots34567": "\u287C",
+    "/dots134567": "\u287D",
+    "/dots234567": "\u287E",
+    "/dots1234567": "\u287F",
+    "/dots8": "\u2880",
+    "/dots18": "\u2881",
+    "/dots28": "\u2882",
+    "/dots128": "\u2883",
+    "/dots38": "\u2884",
+    "/dots138": "\u2885",
+    "/dots238": "\u2886",
+    "/dots1238": "\u2887",
+    "/dots48": "\u2888",
+    "/dots148": "\u2889",
+    "/dots248": "\u288A",
+    "/dots1248": "\u288B",
+    "/dots348": "\u288C",
+    "/dots1348": "\u288D",
+    "/dots2348": "\u288E",
+    "/dots12348": "\u288F",
+    "/dots58": "\u2890",
+    "/dots158": "\u2891",
+    "/dots258": "\u2892",
+    "/dots1258": "\u2893",
+    "/dots358": "\u2894",
+    "/dots1358": "\u2895",
+    "/dots2358": "\u2896",
+    "/dots12358": "\u2897",
+    "/dots458": "\u2898",
+    "/dots1458": "\u2899",
+    "/dots2458": "\u289A",
+    "/dots12458": "\u289B",
+    "/dots3458": "\u289C",
+    "/dots13458": "\u289D",
+    "/dots23458": "\u289E",
+    "/dots123458": "\u289F",
+    "/dots68": "\u28A0",
+    "/dots168": "\u28A1",
+    "/dots268": "\u28A2",
+    "/dots1268": "\u28A3",
+    "/dots368": "\u28A4",
+    "/dots1368": "\u28A5",
+    "/dots2368": "\u28A6",
+    "/dots12368": "\u28A7",
+    "/dots468": "\u28A8",
+    "/dots1468": "\u28A9",
+    "/dots2468": "\u28AA",
+    "/dots12468": "\u28AB",
+    "/dots3468": "\u28AC",
+    "/dots13468": "\u28AD",
+    "/dots23468": "\u28AE",
+    "/dots123468": "\u28AF",
+    "/dots568": "\u28B0",
+    "/dots1568": "\u28B1",
+    "/dots2568": "\u28B2",
+    "/dots12568": "\u28B3",
+    "/dots3568": "\u28B4",
+    "/dots13568": "\u28B5",
+    "/dots23568": "\u28B6",
+    "/dots123568": "\u28B7",
+    "/dots4568": "\u28B8",
+    "/dots14568": "\u28B9",
+    "/dots24568": "\u28BA",
+    "/dots124568": "\u28BB",
+    "/dots34568": "\u28BC",
+    "/dots134568": "\u28BD",
+    "/dots234568": "\u28BE",
+    "/dots1234568": "\u28BF",
+    "/dots78": "\u28C0",
+    "/dots178": "\u28C1",
+    "/dots278": "\u28C2",
+    "/dots1278": "\u28C3",
+    "/dots378": "\u28C4",
+    "/dots1378": "\u28C5",
+    "/dots2378": "\u28C6",
+    "/dots12378": "\u28C7",
+    "/dots478": "\u28C8",
+    "/dots1478": "\u28C9",
+    "/dots2478": "\u28CA",
+    "/dots12478": "\u28CB",
+    "/dots3478": "\u28CC",
+    "/dots13478": "\u28CD",
+    "/dots23478": "\u28CE",
+    "/dots123478": "\u28CF",
+    "/dots578": "\u28D0",
+    "/dots1578": "\u28D1",
+    "/dots2578": "\u28D2",
+    "/dots12578": "\u28D3",
+    "/dots3578": "\u28D4",
+    "/dots13578": "\u28D5",
+    "/dots23578": "\u28D6",
+    "/dots123578": "\u28D7",
+    "/dots4578": "\u28D8",
+    "/dots14578": "\u28D9",
+    "/dots24578": "\u28DA",
+    "/dots124578": "\u28DB",
+    "/dots34578": "\u28DC",
+    "/dots134578": "\u28DD",
+    "/dots234578": "\u28DE",
+    "/dots1234578": "\u28DF",
+    "/dots678": "\u28E0",
+    "/dots1678": "\u28E1",
+    "/dots2678": "\u28E2",
+    "/dots12678": "\u28E3",
+    "/dots3678": "\u28E4",
+    "/dots13678": "\u28E5",
+    "/dots23678": "\u28E6",
+    "/dots123678": "\u28E7",
+    "/dots4678": "\u28E8",
+    "/dots14678": "\u28E9",
+    "/dots24678": "\u28EA",
+    "/dots124678": "\u28EB",
+    "/dots34678": "\u28EC",
+    "/dots134678": "\u28ED",
+    "/dots234678": "\u28EE",
+    "/dots1234678": "\u28EF",
+    "/dots5678": "\u28F0",
+    "/dots15678": "\u28F1",
+    "/dots25678": "\u28F2",
+    "/dots125678": "\u28F3",
+    "/dots35678": "\u28F4",
+    "/dots135678": "\u28F5",
+    "/dots235678": "\u28F6",
+    "/dots1235678": "\u28F7",
+    "/dots45678": "\u28F8",
+    "/dots145678": "\u28F9",
+    "/dots245678": "\u28FA",
+    "/dots1245678": "\u28FB",
+    "/dots345678": "\u28FC",
+    "/dots1345678": "\u28FD",
+    "/dots2345678": "\u28FE",
+    "/dots12345678": "\u28FF",
+    "/rightwardsTwoheadedArrowWithVerticalStroke": "\u2900",
+    "/rightwardsTwoheadedArrowWithDoubleVerticalStroke": "\u2901",
+    "/leftwardsDoubleArrowWithVerticalStroke": "\u2902",
+    "/rightwardsDoubleArrowWithVerticalStroke": "\u2903",
+    "/leftRightDoubleArrowWithVerticalStroke": "\u2904",
+    "/rightwardsTwoheadedArrowFromBar": "\u2905",
+    "/leftwardsDoubleArrowFromBar": "\u2906",
+    "/rightwardsDoubleArrowFromBar": "\u2907",
+    "/downwardsArrowWithHorizontalStroke": "\u2908",
+    "/upwardsArrowWithHorizontalStroke": "\u2909",
+    "/upwardsTripleArrow": "\u290A",
+    "/downwardsTripleArrow": "\u290B",
+    "/leftwardsDoubleDashArrow": "\u290C",
+    "/rightwardsDoubleDashArrow": "\u290D",
+    "/leftwardsTripleDashArrow": "\u290E",
+    "/rightwardsTripleDashArrow": "\u290F",
+    "/rightwardsTwoheadedTripleDashArrow": "\u2910",
+    "/rightwardsArrowWithDottedStem": "\u2911",
+    "/upwardsArrowToBar": "\u2912",
+    "/downwardsArrowToBar": "\u2913",
+    "/rightwardsArrowWithTailWithVerticalStroke": "\u2914",
+    "/rightwardsArrowWithTailWithDoubleVerticalStroke": "\u2915",
+    "/rightwardsTwoheadedArrowWithTail": "\u2916",
+    "/rightwardsTwoheadedArrowWithTailWithVerticalStroke": "\u2917",
+    "/rightwardsTwoheadedArrowWithTailWithDoubleVerticalStroke": "\u2918",
+    "/leftwardsArrowtail": "\u2919",
+    "/rightwardsArrowtail": "\u291A",
+    "/leftwardsDoubleArrowtail": "\u291B",
+    "/rightwardsDoubleArrowtail": "\u291C",
+    "/leftwardsArrowToBlackDiamond": "\u291D",
+    "/rightwardsArrowToBlackDiamond": "\u291E",
+    "/leftwardsArrowFromBarToBlackDiamond": "\u291F",
+    "/rightwardsArrowFromBarToBlackDiamond": "\u2920",
+    "/northWestAndSouthEastArrow": "\u2921",
+    "/northEastAndSouthWestArrow": "\u2922",
+    "/northWestArrowWithHook": "\u2923",
+    "/northEastArrowWithHook": "\u2924",
+    "/southEastArrowWithHook": "\u2925",
+    "/southWestArrowWithHook": "\u2926",
+    "/northWestArrowAndNorthEastArrow": "\u2927",
+    "/northEastArrowAndSouthEastArrow": "\u2928",
+    "/southEastArrowAndSouthWestArrow": "\u2929",
+    "/southWestArrowAndNorthWestArrow": "\u292A",
+    "/risingDiagonalCrossingFallingDiagonal": "\u292B",
+    "/fallingDiagonalCrossingRisingDiagonal": "\u292C",
+    "/southEastArrowCrossingNorthEastArrow": "\u292D",
+    "/northEastArrowCrossingSouthEastArrow": "\u292E",
+    "/fallingDiagonalCrossingNorthEastArrow": "\u292F",
+    "/risingDiagonalCrossingSouthEastArrow": "\u2930",
+    "/northEastArrowCrossingNorthWestArrow": "\u2931",
+    "/northWestArrowCrossingNorthEastArrow": "\u2932",
+    "/waveArrowPointingDirectlyRight": "\u2933",
+    "/arrowPointingRightwardsThenCurvingUpwards": "\u2934",
+    "/arrowPointingRightwardsThenCurvingDownwards": "\u2935",
+    "/arrowPointingDownwardsThenCurvingLeftwards": "\u2936",
+    "/arrowPointingDownwardsThenCurvingRightwards": "\u2937",
+    "/rightsideArcClockwiseArrow": "\u2938",
+    "/leftsideArcAnticlockwiseArrow": "\u2939",
+    "/topArcAnticlockwiseArrow": "\u293A",
+    "/bottomArcAnticlockwiseArrow": "\u293B",
+    "/topArcClockwiseArrowWithMinus": "\u293C",
+    "/topArcAnticlockwiseArrowWithPlus": "\u293D",
+    "/lowerRightSemicircularClockwiseArrow": "\u293E",
+    "/lowerLeftSemicircularAnticlockwiseArrow": "\u293F",
+    "/anticlockwiseClosedCircleArrow": "\u2940",
+    "/clockwiseClosedCircleArrow": "\u2941",
+    "/rightwardsArrowAboveShortLeftwardsArrow": "\u2942",
+    "/leftwardsArrowAboveShortRightwardsArrow": "\u2943",
+    "/shortRightwardsArrowAboveLeftwardsArrow": "\u2944",
+    "/rightwardsArrowWithPlusBelow": "\u2945",
+    "/leftwardsArrowWithPlusBelow": "\u2946",
+    "/rightwardsArrowThroughX": "\u2947",
+    "/leftRightArrowThroughSmallCircle": "\u2948",
+    "/upwardsTwoheadedArrowFromSmallCircle": "\u2949",
+    "/leftBarbUpRightBarbDownHarpoon": "\u294A",
+    "/leftBarbDownRightBarbUpHarpoon": "\u294B",
+    "/upBarbRightDownBarbLeftHarpoon": "\u294C",
+    "/upBarbLeftDownBarbRightHarpoon": "\u294D",
+    "/leftBarbUpRightBarbUpHarpoon": "\u294E",
+    "/upBarbRightDownBarbRightHarpoon": "\u294F",
+    "/leftBarbDownRightBarbDownHarpoon": "\u2950",
+    "/upBarbLeftDownBarbLeftHarpoon": "\u2951",
+    "/leftwardsHarpoonWithBarbUpToBar": "\u2952",
+    "/rightwardsHarpoonWithBarbUpToBar": "\u2953",
+    "/upwardsHarpoonWithBarbRightToBar": "\u2954",
+    "/downwardsHarpoonWithBarbRightToBar": "\u2955",
+    "/leftwardsHarpoonWithBarbDownToBar": "\u2956",
+    "/rightwardsHarpoonWithBarbDownToBar": "\u2957",
+    "/upwardsHarpoonWithBarbLeftToBar": "\u2958",
+    "/downwardsHarpoonWithBarbLeftToBar": "\u2959",
+    "/leftwardsHarpoonWithBarbUpFromBar": "\u295A",
+    "/rightwardsHarpoonWithBarbUpFromBar": "\u295B",
+    "/upwardsHarpoonWithBarbRightFromBar": "\u295C",
+    "/downwardsHarpoonWithBarbRightFromBar": "\u295D",
+    "/leftwardsHarpoonWithBarbDownFromBar": "\u295E",
+    "/rightwardsHarpoonWithBarbDownFromBar": "\u295F",
+    "/upwardsHarpoonWithBarbLeftFromBar": "\u2960",
+    "/downwardsHarpoonWithBarbLeftFromBar": "\u2961",
+    "/leftwardsHarpoonWithBarbUpAboveLeftwardsHarpoonWithBarbDown": "\u2962",
+    "/upwardsHarpoonWithBarbLeftBesideUpwardsHarpoonWithBarbRight": "\u2963",
+    "/rightwardsHarpoonWithBarbUpAboveRightwardsHarpoonWithBarbDown": "\u2964",
+    "/downwardsHarpoonWithBarbLeftBesideDownwardsHarpoonWithBarbRight": "\u2965",
+    "/leftwardsHarpoonWithBarbUpAboveRightwardsHarpoonWithBarbUp": "\u2966",
+    "/leftwardsHarpoonWithBarbDownAboveRightwardsHarpoonWithBarbDown": "\u2967",
+    "/rightwardsHarpoonWithBarbUpAboveLeftwardsHarpoonWithBarbUp": "\u2968",
+    "/rightwardsHarpoonWithBarbDownAboveLeftwardsHarpoonWithBarbDown": "\u2969",
+    "/leftwardsHarpoonWithBarbUpAboveLongDash": "\u296A",
+    "/leftwardsHarpoonWithBarbDownBelowLongDash": "\u296B",
+    "/rightwardsHarpoonWithBarbUpAboveLongDash": "\u296C",
+    "/rightwardsHarpoonWithBarbDownBelowLongDash": "\u296D",
+    "/upwardsHarpoonWithBarbLeftBesideDownwardsHarpoonWithBarbRight": "\u296E",
+    "/downwardsHarpoonWithBarbLeftBesideUpwardsHarpoonWithBarbRight": "\u296F",
+    "/rightDoubleArrowWithRoundedHead": "\u2970",
+    "/equalsSignAboveRightwardsArrow": "\u2971",
+    "/tildeOperatorAboveRightwardsArrow": "\u2972",
+    "/leftwardsArrowAboveTildeOperator": "\u2973",
+    "/rightwardsArrowAboveTildeOperator": "\u2974",
+    "/rightwardsArrowAboveAlmostEqualTo": "\u2975",
+    "/lessthanAboveLeftwardsArrow": "\u2976",
+    "/leftwardsArrowThroughLessthan": "\u2977",
+    "/greaterthanAboveRightwardsArrow": "\u2978",
+    "/subsetAboveRightwardsArrow": "\u2979",
+    "/leftwardsArrowThroughSubset": "\u297A",
+    "/supersetAboveLeftwardsArrow": "\u297B",
+    "/leftFishTail": "\u297C",
+    "/rightFishTail": "\u297D",
+    "/upFishTail": "\u297E",
+    "/downFishTail": "\u297F",
+    "/tripleVerticalBarDelimiter": "\u2980",
+    "/zNotationSpot": "\u2981",
+    "/zNotationTypeColon": "\u2982",
+    "/leftWhiteCurlyBracket": "\u2983",
+    "/rightWhiteCurlyBracket": "\u2984",
+    "/leftWhiteParenthesis": "\u2985",
+    "/rightWhiteParenthesis": "\u2986",
+    "/zNotationLeftImageBracket": "\u2987",
+    "/zNotationRightImageBracket": "\u2988",
+    "/zNotationLeftBindingBracket": "\u2989",
+    "/zNotationRightBindingBracket": "\u298A",
+    "/leftSquareBracketWithUnderbar": "\u298B",
+    "/rightSquareBracketWithUnderbar": "\u298C",
+    "/leftSquareBracketWithTickInTopCorner": "\u298D",
+    "/rightSquareBracketWithTickInBottomCorner": "\u298E",
+    "/leftSquareBracketWithTickInBottomCorner": "\u298F",
+    "/rightSquareBracketWithTickInTopCorner": "\u2990",
+    "/leftAngleBracketWithDot": "\u2991",
+    "/rightAngleBracketWithDot": "\u2992",
+    "/leftArcLessthanBracket": "\u2993",
+    "/rightArcGreaterthanBracket": "\u2994",
+    "/doubleLeftArcGreaterthanBracket": "\u2995",
+    "/doubleRightArcLessthanBracket": "\u2996",
+    "/leftBlackTortoiseShellBracket": "\u2997",
+    "/rightBlackTortoiseShellBracket": "\u2998",
+    "/dottedFence": "\u2999",
+    "/verticalZigzagLine": "\u299A",
+    "/measuredAngleOpeningLeft": "\u299B",
+    "/rightAngleVariantWithSquare": "\u299C",
+    "/measuredRightAngleWithDot": "\u299D",
+    "/angleWithSInside": "\u299E",
+    "/acuteAngle": "\u299F",
+    "/sphericalAngleOpeningLeft": "\u29A0",
+    "/sphericalAngleOpeningUp": "\u29A1",
+    "/turnedAngle": "\u29A2",
+    "/reversedAngle": "\u29A3",
+    "/angleWithUnderbar": "\u29A4",
+    "/reversedAngleWithUnderbar": "\u29A5",
+    "/obliqueAngleOpeningUp": "\u29A6",
+    "/obliqueAngleOpeningDown": "\u29A7",
+    "/measuredAngleWithOpenArmEndingInArrowPointingUpAndRight": "\u29A8",
+    "/measuredAngleWithOpenArmEndingInArrowPointingUpAndLeft": "\u29A9",
+    "/measuredAngleWithOpenArmEndingInArrowPointingDownAndRight": "\u29AA",
+    "/measuredAngleWithOpenArmEndingInArrowPointingDownAndLeft": "\u29AB",
+    "/measuredAngleWithOpenArmEndingInArrowPointingRightAndUp": "\u29AC",
+    "/measuredAngleWithOpenArmEndingInArrowPointingLeftAndUp": "\u29AD",
+    "/measuredAngleWithOpenArmEndingInArrowPointingRightAndDown": "\u29AE",
+    "/measuredAngleWithOpenArmEndingInArrowPointingLeftAndDown": "\u29AF",
+    "/reversedEmptySet": "\u29B0",
+    "/emptySetWithOverbar": "\u29B1",
+    "/emptySetWithSmallCircleAbove": "\u29B2",
+    "/emptySetWithRightArrowAbove": "\u29B3",
+    "/emptySetWithLeftArrowAbove": "\u29B4",
+    "/circleWithHorizontalBar": "\u29B5",
+    "/circledVerticalBar": "\u29B6",
+    "/circledParallel": "\u29B7",
+    "/circledReverseSolidus": "\u29B8",
+    "/circledPerpendicular": "\u29B9",
+    "/circleDividedByHorizontalBarAndTopHalfDividedByVerticalBar": "\u29BA",
+    "/circleWithSuperimposedX": "\u29BB",
+    "/circledAnticlockwiserotatedDivisionSign": "\u29BC",
+    "/upArrowThroughCircle": "\u29BD",
+    "/circledWhiteBullet": "\u29BE",
+    "/circledBullet": "\u29BF",
+    "/circledLessthan": "\u29C0",
+    "/circledGreaterthan": "\u29C1",
+    "/circleWithSmallCircleToTheRight": "\u29C2",
+    "/circleWithTwoHorizontalStrokesToTheRight": "\u29C3",
+    "/squaredRisingDiagonalSlash": "\u29C4",
+    "/squaredFallingDiagonalSlash": "\u29C5",
+    "/squaredAsterisk": "\u29C6",
+    "/squaredSmallCircle": "\u29C7",
+    "/squaredSquare": "\u29C8",
+    "/twoJoinedSquares": "\u29C9",
+    "/triangleWithDotAbove": "\u29CA",
+    "/triangleWithUnderbar": "\u29CB",
+    "/sInTriangle": "\u29CC",
+    "/triangleWithSerifsAtBottom": "\u29CD",
+    "/rightTriangleAboveLeftTriangle": "\u29CE",
+    "/leftTriangleBesideVerticalBar": "\u29CF",
+    "/verticalBarBesideRightTriangle": "\u29D0",
+    "/bowtieWithLeftHalfBlack": "\u29D1",
+    "/bowtieWithRightHalfBlack": "\u29D2",
+    "/blackBowtie": "\u29D3",
+    "/timesWithLeftHalfBlack": "\u29D4",
+    "/timesWithRightHalfBlack": "\u29D5",
+    "/whiteHourglass": "\u29D6",
+    "/blackHourglass": "\u29D7",
+    "/leftWigglyFence": "\u29D8",
+    "/rightWigglyFence": "\u29D9",
+    "/leftDoubleWigglyFence": "\u29DA",
+    "/rightDoubleWigglyFence": "\u29DB",
+    "/incompleteInfinity": "\u29DC",
+    "/tieOverInfinity": "\u29DD",
+    "/infinityNegatedWithVerticalBar": "\u29DE",
+    "/doubleendedMultimap": "\u29DF",
+    "/squareWithContouredOutline": "\u29E0",
+    "/increasesAs": "\u29E1",
+    "/shuffleProduct": "\u29E2",
+    "/equalsSignAndSlantedParallel": "\u29E3",
+    "/equalsSignAndSlantedParallelWithTildeAbove": "\u29E4",
+    "/identicalToAndSlantedParallel": "\u29E5",
+    "/gleichStark": "\u29E6",
+    "/thermodynamic": "\u29E7",
+    "/downpointingTriangleWithLeftHalfBlack": "\u29E8",
+    "/downpointingTriangleWithRightHalfBlack": "\u29E9",
+    "/blackDiamondWithDownArrow": "\u29EA",
+    "/blackLozenge": "\u29EB",
+    "/whiteCircleWithDownArrow": "\u29EC",
+    "/blackCircleWithDownArrow": "\u29ED",
+    "/errorbarredWhiteSquare": "\u29EE",
+    "/errorbarredBlackSquare": "\u29EF",
+    "/errorbarredWhiteDiamond": "\u29F0",
+    "/errorbarredBlackDiamond": "\u29F1",
+    "/errorbarredWhiteCircle": "\u29F2",
+    "/errorbarredBlackCircle": "\u29F3",
+    "/ruledelayed": "\u29F4",
+    "/reverseSolidusOperator": "\u29F5",
+    "/solidusWithOverbar": "\u29F6",
+    "/reverseSolidusWithHorizontalStroke": "\u29F7",
+    "/bigSolidus": "\u29F8",
+    "/bigReverseSolidus": "\u29F9",
+    "/doublePlus": "\u29FA",
+    "/triplePlus": "\u29FB",
+    "/leftpointingCurvedAngleBracket": "\u29FC",
+    "/rightpointingCurvedAngleBracket": "\u29FD",
+    "/tiny": "\u29FE",
+    "/miny": "\u29FF",
+    "/naryCircledDotOperator": "\u2A00",
+    "/naryCircledPlusOperator": "\u2A01",
+    "/naryCircledTimesOperator": "\u2A02",
+    "/naryUnionOperatorWithDot": "\u2A03",
+    "/naryUnionOperatorWithPlus": "\u2A04",
+    "/narySquareIntersectionOperator": "\u2A05",
+    "/narySquareUnionOperator": "\u2A06",
+    "/twoLogicalAndOperator": "\u2A07",
+    "/twoLogicalOrOperator": "\u2A08",
+    "/naryTimesOperator": "\u2A09",
+    "/moduloTwoSum": "\u2A0A",
+    "/summationWithIntegral": "\u2A0B",
+    "/quadrupleIntegralOperator": "\u2A0C",
+    "/finitePartIntegral": "\u2A0D",
+    "/integralWithDoubleStroke": "\u2A0E",
+    "/integralAverageWithSlash": "\u2A0F",
+    "/circulationFunction": "\u2A10",
+    "/anticlockwiseIntegration": "\u2A11",
+    "/lineIntegrationWithRectangularPathAroundPole": "\u2A12",
+    "/lineIntegrationWithSemicircularPathAroundPole": "\u2A13",
+    "/lineIntegrationNotIncludingThePole": "\u2A14",
+    "/integralAroundAPointOperator": "\u2A15",
+    "/quaternionIntegralOperator": "\u2A16",
+    "/integralWithLeftwardsArrowWithHook": "\u2A17",
+    "/integralWithTimesSign": "\u2A18",
+    "/integralWithIntersection": "\u2A19",
+    "/integralWithUnion": "\u2A1A",
+    "/integralWithOverbar": "\u2A1B",
+    "/integralWithUnderbar": "\u2A1C",
+    "/join": "\u2A1D",
+    "/largeLeftTriangleOperator": "\u2A1E",
+    "/zNotationSchemaComposition": "\u2A1F",
+    "/zNotationSchemaPiping": "\u2A20",
+    "/zNotationSchemaProjection": "\u2A21",
+    "/plusSignWithSmallCircleAbove": "\u2A22",
+    "/plusSignWithCircumflexAccentAbove": "\u2A23",
+    "/plusSignWithTildeAbove": "\u2A24",
+    "/plusSignWithDotBelow": "\u2A25",
+    "/plusSignWithTildeBelow": "\u2A26",
+    "/plusSignWithSubscriptTwo": "\u2A27",
+    "/plusSignWithBlackTriangle": "\u2A28",
+    "/minusSignWithCommaAbove": "\u2A29",
+    "/minusSignWithDotBelow": "\u2A2A",
+    "/minusSignWithFallingDots": "\u2A2B",
+    "/minusSignWithRisingDots": "\u2A2C",
+    "/plusSignInLeftHalfCircle": "\u2A2D",
+    "/plusSignInRightHalfCircle": "\u2A2E",
+    "/vectorOrCrossProduct": "\u2A2F",
+    "/multiplicationSignWithDotAbove": "\u2A30",
+    "/multiplicationSignWithUnderbar": "\u2A31",
+    "/semidirectProductWithBottomClosed": "\u2A32",
+    "/smashProduct": "\u2A33",
+    "/multiplicationSignInLeftHalfCircle": "\u2A34",
+    "/multiplicationSignInRightHalfCircle": "\u2A35",
+    "/circledMultiplicationSignWithCircumflexAccent": "\u2A36",
+    "/multiplicationSignInDoubleCircle": "\u2A37",
+    "/circledDivisionSign": "\u2A38",
+    "/plusSignInTriangle": "\u2A39",
+    "/minusSignInTriangle": "\u2A3A",
+    "/multiplicationSignInTriangle": "\u2A3B",
+    "/interiorProduct": "\u2A3C",
+    "/righthandInteriorProduct": "\u2A3D",
+    "/zNotationRelationalComposition": "\u2A3E",
+    "/amalgamationOrCoproduct": "\u2A3F",
+    "/intersectionWithDot": "\u2A40",
+    "/unionWithMinusSign": "\u2A41",
+    "/unionWithOverbar": "\u2A42",
+    "/intersectionWithOverbar": "\u2A43",
+    "/intersectionWithLogicalAnd": "\u2A44",
+    "/unionWithLogicalOr": "\u2A45",
+    "/unionAboveIntersection": "\u2A46",
+    "/intersectionAboveUnion": "\u2A47",
+    "/unionAboveBarAboveIntersection": "\u2A48",
+    "/intersectionAboveBarAboveUnion": "\u2A49",
+    "/unionBesideAndJoinedWithUnion": "\u2A4A",
+    "/intersectionBesideAndJoinedWithIntersection": "\u2A4B",
+    "/closedUnionWithSerifs": "\u2A4C",
+    "/closedIntersectionWithSerifs": "\u2A4D",
+    "/doubleSquareIntersection": "\u2A4E",
+    "/doubleSquareUnion": "\u2A4F",
+    "/closedUnionWithSerifsAndSmashProduct": "\u2A50",
+    "/logicalAndWithDotAbove": "\u2A51",
+    "/logicalOrWithDotAbove": "\u2A52",
+    "/doubleLogicalAnd": "\u2A53",
+    "/doubleLogicalOr": "\u2A54",
+    "/twoIntersectingLogicalAnd": "\u2A55",
+    "/twoIntersectingLogicalOr": "\u2A56",
+    "/slopingLargeOr": "\u2A57",
+    "/slopingLargeAnd": "\u2A58",
+    "/logicalOrOverlappingLogicalAnd": "\u2A59",
+    "/logicalAndWithMiddleStem": "\u2A5A",
+    "/logicalOrWithMiddleStem": "\u2A5B",
+    "/logicalAndWithHorizontalDash": "\u2A5C",
+    "/logicalOrWithHorizontalDash": "\u2A5D",
+    "/logicalAndWithDoubleOverbar": "\u2A5E",
+    "/logicalAndWithUnderbar": "\u2A5F",
+    "/logicalAndWithDoubleUnderbar": "\u2A60",
+    "/smallVeeWithUnderbar": "\u2A61",
+    "/logicalOrWithDoubleOverbar": "\u2A62",
+    "/logicalOrWithDoubleUnderbar": "\u2A63",
+    "/zNotationDomainAntirestriction": "\u2A64",
+    "/zNotationRangeAntirestriction": "\u2A65",
+    "/equalsSignWithDotBelow": "\u2A66",
+    "/identicalWithDotAbove": "\u2A67",
+    "/tripleHorizontalBarWithDoubleVerticalStroke": "\u2A68",
+    "/tripleHorizontalBarWithTripleVerticalStroke": "\u2A69",
+    "/tildeOperatorWithDotAbove": "\u2A6A",
+    "/tildeOperatorWithRisingDots": "\u2A6B",
+    "/similarMinusSimilar": "\u2A6C",
+    "/congruentWithDotAbove": "\u2A6D",
+    "/equalsWithAsterisk": "\u2A6E",
+    "/almostEqualToWithCircumflexAccent": "\u2A6F",
+    "/approximatelyEqualOrEqualTo": "\u2A70",
+    "/equalsSignAbovePlusSign": "\u2A71",
+    "/plusSignAboveEqualsSign": "\u2A72",
+    "/equalsSignAboveTildeOperator": "\u2A73",
+    "/doubleColonEqual": "\u2A74",
+    "/twoConsecutiveEqualsSigns": "\u2A75",
+    "/threeConsecutiveEqualsSigns": "\u2A76",
+    "/equalsSignWithTwoDotsAboveAndTwoDotsBelow": "\u2A77",
+    "/equivalentWithFourDotsAbove": "\u2A78",
+    "/lessthanWithCircleInside": "\u2A79",
+    "/greaterthanWithCircleInside": "\u2A7A",
+    "/lessthanWithQuestionMarkAbove": "\u2A7B",
+    "/greaterthanWithQuestionMarkAbove": "\u2A7C",
+    "/lessthanOrSlantedEqualTo": "\u2A7D",
+    "/greaterthanOrSlantedEqualTo": "\u2A7E",
+    "/lessthanOrSlantedEqualToWithDotInside": "\u2A7F",
+    "/greaterthanOrSlantedEqualToWithDotInside": "\u2A80",
+    "/lessthanOrSlantedEqualToWithDotAbove": "\u2A81",
+    "/greaterthanOrSlantedEqualToWithDotAbove": "\u2A82",
+    "/lessthanOrSlantedEqualToWithDotAboveRight": "\u2A83",
+    "/greaterthanOrSlantedEqualToWithDotAboveLeft": "\u2A84",
+    "/lessthanOrApproximate": "\u2A85",
+    "/greaterthanOrApproximate": "\u2A86",
+    "/lessthanAndSinglelineNotEqualTo": "\u2A87",
+    "/greaterthanAndSinglelineNotEqualTo": "\u2A88",
+    "/lessthanAndNotApproximate": "\u2A89",
+    "/greaterthanAndNotApproximate": "\u2A8A",
+    "/lessthanAboveDoublelineEqualAboveGreaterthan": "\u2A8B",
+    "/greaterthanAboveDoublelineEqualAboveLessthan": "\u2A8C",
+    "/lessthanAboveSimilarOrEqual": "\u2A8D",
+    "/greaterthanAboveSimilarOrEqual": "\u2A8E",
+    "/lessthanAboveSimilarAboveGreaterthan": "\u2A8F",
+    "/greaterthanAboveSimilarAboveLessthan": "\u2A90",
+    "/lessthanAboveGreaterthanAboveDoublelineEqual": "\u2A91",
+    "/greaterthanAboveLessthanAboveDoublelineEqual": "\u2A92",
+    "/lessthanAboveSlantedEqualAboveGreaterthanAboveSlantedEqual": "\u2A93",
+    "/greaterthanAboveSlantedEqualAboveLessthanAboveSlantedEqual": "\u2A94",
+    "/slantedEqualToOrLessthan": "\u2A95",
+    "/slantedEqualToOrGreaterthan": "\u2A96",
+    "/slantedEqualToOrLessthanWithDotInside": "\u2A97",
+    "/slantedEqualToOrGreaterthanWithDotInside": "\u2A98",
+    "/doublelineEqualToOrLessthan": "\u2A99",
+    "/doublelineEqualToOrGreaterthan": "\u2A9A",
+    "/doublelineSlantedEqualToOrLessthan": "\u2A9B",
+    "/doublelineSlantedEqualToOrGreaterthan": "\u2A9C",
+    "/similarOrLessthan": "\u2A9D",
+    "/similarOrGreaterthan": "\u2A9E",
+    "/similarAboveLessthanAboveEqualsSign": "\u2A9F",
+    "/similarAboveGreaterthanAboveEqualsSign": "\u2AA0",
+    "/doubleNestedLessthan": "\u2AA1",
+    "/doubleNestedGreaterthan": "\u2AA2",
+    "/doubleNestedLessthanWithUnderbar": "\u2AA3",
+    "/greaterthanOverlappingLessthan": "\u2AA4",
+    "/greaterthanBesideLessthan": "\u2AA5",
+    "/lessthanClosedByCurve": "\u2AA6",
+    "/greaterthanClosedByCurve": "\u2AA7",
+    "/lessthanClosedByCurveAboveSlantedEqual": "\u2AA8",
+    "/greaterthanClosedByCurveAboveSlantedEqual": "\u2AA9",
+    "/smallerThan": "\u2AAA",
+    "/largerThan": "\u2AAB",
+    "/smallerThanOrEqualTo": "\u2AAC",
+    "/largerThanOrEqualTo": "\u2AAD",
+    "/equalsSignWithBumpyAbove": "\u2AAE",
+    "/precedesAboveSinglelineEqualsSign": "\u2AAF",
+    "/succeedsAboveSinglelineEqualsSign": "\u2AB0",
+    "/precedesAboveSinglelineNotEqualTo": "\u2AB1",
+    "/succeedsAboveSinglelineNotEqualTo": "\u2AB2",
+    "/precedesAboveEqualsSign": "\u2AB3",
+    "/succeedsAboveEqualsSign": "\u2AB4",
+    "/precedesAboveNotEqualTo": "\u2AB5",
+    "/succeedsAboveNotEqualTo": "\u2AB6",
+    "/precedesAboveAlmostEqualTo": "\u2AB7",
+    "/succeedsAboveAlmostEqualTo": "\u2AB8",
+    "/precedesAboveNotAlmostEqualTo": "\u2AB9",
+    "/succeedsAboveNotAlmostEqualTo": "\u2ABA",
+    "/doublePrecedes": "\u2ABB",
+    "/doubleSucceeds": "\u2ABC",
+    "/subsetWithDot": "\u2ABD",
+    "/supersetWithDot": "\u2ABE",
+    "/subsetWithPlusSignBelow": "\u2ABF",
+    "/supersetWithPlusSignBelow": "\u2AC0",
+    "/subsetWithMultiplicationSignBelow": "\u2AC1",
+    "/supersetWithMultiplicationSignBelow": "\u2AC2",
+    "/subsetOfOrEqualToWithDotAbove": "\u2AC3",
+    "/supersetOfOrEqualToWithDotAbove": "\u2AC4",
+    "/subsetOfAboveEqualsSign": "\u2AC5",
+    "/supersetOfAboveEqualsSign": "\u2AC6",
+    "/subsetOfAboveTildeOperator": "\u2AC7",
+    "/supersetOfAboveTildeOperator": "\u2AC8",
+    "/subsetOfAboveAlmostEqualTo": "\u2AC9",
+    "/supersetOfAboveAlmostEqualTo": "\u2ACA",
+    "/subsetOfAboveNotEqualTo": "\u2ACB",
+    "/supersetOfAboveNotEqualTo": "\u2ACC",
+    "/squareLeftOpenBoxOperator": "\u2ACD",
+    "/squareRightOpenBoxOperator": "\u2ACE",
+    "/closedSubset": "\u2ACF",
+    "/closedSuperset": "\u2AD0",
+    "/closedSubsetOrEqualTo": "\u2AD1",
+    "/closedSupersetOrEqualTo": "\u2AD2",
+    "/subsetAboveSuperset": "\u2AD3",
+    "/supersetAboveSubset": "\u2AD4",
+    "/subsetAboveSubset": "\u2AD5",
+    "/supersetAboveSuperset": "\u2AD6",
+    "/supersetBesideSubset": "\u2AD7",
+    "/supersetBesideAndJoinedByDashWithSubset": "\u2AD8",
+    "/elementOfOpeningDownwards": "\u2AD9",
+    "/pitchforkWithTeeTop": "\u2ADA",
+    "/transversalIntersection": "\u2ADB",
+    "/forking": "\u2ADC",
+    "/nonforking": "\u2ADD",
+    "/shortLeftTack": "\u2ADE",
+    "/shortDownTack": "\u2ADF",
+    "/shortUpTack": "\u2AE0",
+    "/perpendicularWithS": "\u2AE1",
+    "/verticalBarTripleRightTurnstile": "\u2AE2",
+    "/doubleVerticalBarLeftTurnstile": "\u2AE3",
+    "/verticalBarDoubleLeftTurnstile": "\u2AE4",
+    "/doubleVerticalBarDoubleLeftTurnstile": "\u2AE5",
+    "/longDashFromLeftMemberOfDoubleVertical": "\u2AE6",
+    "/shortDownTackWithOverbar": "\u2AE7",
+    "/shortUpTackWithUnderbar": "\u2AE8",
+    "/shortUpTackAboveShortDownTack": "\u2AE9",
+    "/doubleDownTack": "\u2AEA",
+    "/doubleUpTack": "\u2AEB",
+    "/doubleStrokeNotSign": "\u2AEC",
+    "/reversedDoubleStrokeNotSign": "\u2AED",
+    "/doesNotDivideWithReversedNegationSlash": "\u2AEE",
+    "/verticalLineWithCircleAbove": "\u2AEF",
+    "/verticalLineWithCircleBelow": "\u2AF0",
+    "/downTackWithCircleBelow": "\u2AF1",
+    "/parallelWithHorizontalStroke": "\u2AF2",
+    "/parallelWithTildeOperator": "\u2AF3",
+    "/tripleVerticalBarBinaryRelation": "\u2AF4",
+    "/tripleVerticalBarWithHorizontalStroke": "\u2AF5",
+    "/tripleColonOperator": "\u2AF6",
+    "/tripleNestedLessthan": "\u2AF7",
+    "/tripleNestedGreaterthan": "\u2AF8",
+    "/doublelineSlantedLessthanOrEqualTo": "\u2AF9",
+    "/doublelineSlantedGreaterthanOrEqualTo": "\u2AFA",
+    "/tripleSolidusBinaryRelation": "\u2AFB",
+    "/largeTripleVerticalBarOperator": "\u2AFC",
+    "/doubleSolidusOperator": "\u2AFD",
+    "/whiteVerticalBar": "\u2AFE",
+    "/naryWhiteVerticalBar": "\u2AFF",
+    "/northEastWhiteArrow": "\u2B00",
+    "/northWestWhiteArrow": "\u2B01",
+    "/southEastWhiteArrow": "\u2B02",
+    "/southWestWhiteArrow": "\u2B03",
+    "/leftRightWhiteArrow": "\u2B04",
+    "/leftwardsBlackArrow": "\u2B05",
+    "/upwardsBlackArrow": "\u2B06",
+    "/downwardsBlackArrow": "\u2B07",
+    "/northEastBlackArrow": "\u2B08",
+    "/northWestBlackArrow": "\u2B09",
+    "/southEastBlackArrow": "\u2B0A",
+    "/southWestBlackArrow": "\u2B0B",
+    "/leftRightBlackArrow": "\u2B0C",
+    "/upDownBlackArrow": "\u2B0D",
+    "/rightwardsArrowWithTipDownwards": "\u2B0E",
+    "/rightwardsArrowWithTipUpwards": "\u2B0F",
+    "/leftwardsArrowWithTipDownwards": "\u2B10",
+    "/leftwardsArrowWithTipUpwards": "\u2B11",
+    "/squareWithTopHalfBlack": "\u2B12",
+    "/squareWithBottomHalfBlack": "\u2B13",
+    "/squareWithUpperRightDiagonalHalfBlack": "\u2B14",
+    "/squareWithLowerLeftDiagonalHalfBlack": "\u2B15",
+    "/diamondWithLeftHalfBlack": "\u2B16",
+    "/diamondWithRightHalfBlack": "\u2B17",
+    "/diamondWithTopHalfBlack": "\u2B18",
+    "/diamondWithBottomHalfBlack": "\u2B19",
+    "/dottedSquare": "\u2B1A",
+    "/blackLargeSquare": "\u2B1B",
+    "/whiteLargeSquare": "\u2B1C",
+    "/blackVerySmallSquare": "\u2B1D",
+    "/whiteVerySmallSquare": "\u2B1E",
+    "/blackPentagon": "\u2B1F",
+    "/whitePentagon": "\u2B20",
+    "/whiteHexagon": "\u2B21",
+    "/blackHexagon": "\u2B22",
+    "/horizontalBlackHexagon": "\u2B23",
+    "/blackLargeCircle": "\u2B24",
+    "/blackMediumDiamond": "\u2B25",
+    "/whiteMediumDiamond": "\u2B26",
+    "/blackMediumLozenge": "\u2B27",
+    "/whiteMediumLozenge": "\u2B28",
+    "/blackSmallDiamond": "\u2B29",
+    "/blackSmallLozenge": "\u2B2A",
+    "/whiteSmallLozenge": "\u2B2B",
+    "/blackHorizontalEllipse": "\u2B2C",
+    "/whiteHorizontalEllipse": "\u2B2D",
+    "/blackVerticalEllipse": "\u2B2E",
+    "/whiteVerticalEllipse": "\u2B2F",
+    "/leftArrowWithSmallCircle": "\u2B30",
+    "/threeLeftwardsArrows": "\u2B31",
+    "/leftArrowWithCircledPlus": "\u2B32",
+    "/longLeftwardsSquiggleArrow": "\u2B33",
+    "/leftwardsTwoheadedArrowWithVerticalStroke": "\u2B34",
+    "/leftwardsTwoheadedArrowWithDoubleVerticalStroke": "\u2B35",
+    "/leftwardsTwoheadedArrowFromBar": "\u2B36",
+    "/leftwardsTwoheadedTripleDashArrow": "\u2B37",
+    "/leftwardsArrowWithDottedStem": "\u2B38",
+    "/leftwardsArrowWithTailWithVerticalStroke": "\u2B39",
+    "/leftwardsArrowWithTailWithDoubleVerticalStroke": "\u2B3A",
+    "/leftwardsTwoheadedArrowWithTail": "\u2B3B",
+    "/leftwardsTwoheadedArrowWithTailWithVerticalStroke": "\u2B3C",
+    "/leftwardsTwoheadedArrowWithTailWithDoubleVerticalStroke": "\u2B3D",
+    "/leftwardsArrowThroughX": "\u2B3E",
+    "/waveArrowPointingDirectlyLeft": "\u2B3F",
+    "/equalsSignAboveLeftwardsArrow": "\u2B40",
+    "/reverseTildeOperatorAboveLeftwardsArrow": "\u2B41",
+    "/leftwardsArrowAboveReverseAlmostEqualTo": "\u2B42",
+    "/rightwardsArrowThroughGreaterthan": "\u2B43",
+    "/rightwardsArrowThroughSuperset": "\u2B44",
+    "/leftwardsQuadrupleArrow": "\u2B45",
+    "/rightwardsQuadrupleArrow": "\u2B46",
+    "/reverseTildeOperatorAboveRightwardsArrow": "\u2B47",
+    "/rightwardsArrowAboveReverseAlmostEqualTo": "\u2B48",
+    "/tildeOperatorAboveLeftwardsArrow": "\u2B49",
+    "/leftwardsArrowAboveAlmostEqualTo": "\u2B4A",
+    "/leftwardsArrowAboveReverseTildeOperator": "\u2B4B",
+    "/rightwardsArrowAboveReverseTildeOperator": "\u2B4C",
+    "/downwardsTriangleheadedZigzagArrow": "\u2B4D",
+    "/shortSlantedNorthArrow": "\u2B4E",
+    "/shortBackslantedSouthArrow": "\u2B4F",
+    "/whiteMediumStar": "\u2B50",
+    "/blackSmallStar": "\u2B51",
+    "/whiteSmallStar": "\u2B52",
+    "/blackRightpointingPentagon": "\u2B53",
+    "/whiteRightpointingPentagon": "\u2B54",
+    "/heavyLargeCircle": "\u2B55",
+    "/heavyOvalWithOvalInside": "\u2B56",
+    "/heavyCircleWithCircleInside": "\u2B57",
+    "/heavyCircle": "\u2B58",
+    "/heavyCircledSaltire": "\u2B59",
+    "/slantedNorthArrowWithHookedHead": "\u2B5A",
+    "/backslantedSouthArrowWithHookedTail": "\u2B5B",
+    "/slantedNorthArrowWithHorizontalTail": "\u2B5C",
+    "/backslantedSouthArrowWithHorizontalTail": "\u2B5D",
+    "/bentArrowPointingDownwardsThenNorthEast": "\u2B5E",
+    "/shortBentArrowPointingDownwardsThenNorthEast": "\u2B5F",
+    "/leftwardsTriangleheadedArrow": "\u2B60",
+    "/upwardsTriangleheadedArrow": "\u2B61",
+    "/rightwardsTriangleheadedArrow": "\u2B62",
+    "/downwardsTriangleheadedArrow": "\u2B63",
+    "/leftRightTriangleheadedArrow": "\u2B64",
+    "/upDownTriangleheadedArrow": "\u2B65",
+    "/northWestTriangleheadedArrow": "\u2B66",
+    "/northEastTriangleheadedArrow": "\u2B67",
+    "/southEastTriangleheadedArrow": "\u2B68",
+    "/southWestTriangleheadedArrow": "\u2B69",
+    "/leftwardsTriangleheadedDashedArrow": "\u2B6A",
+    "/upwardsTriangleheadedDashedArrow": "\u2B6B",
+    "/rightwardsTriangleheadedDashedArrow": "\u2B6C",
+    "/downwardsTriangleheadedDashedArrow": "\u2B6D",
+    "/clockwiseTriangleheadedOpenCircleArrow": "\u2B6E",
+    "/anticlockwiseTriangleheadedOpenCircleArrow": "\u2B6F",
+    "/leftwardsTriangleheadedArrowToBar": "\u2B70",
+    "/upwardsTriangleheadedArrowToBar": "\u2B71",
+    "/rightwardsTriangleheadedArrowToBar": "\u2B72",
+    "/downwardsTriangleheadedArrowToBar": "\u2B73",
+    "/northWestTriangleheadedArrowToBar": "\u2B76",
+    "/northEastTriangleheadedArrowToBar": "\u2B77",
+    "/southEastTriangleheadedArrowToBar": "\u2B78",
+    "/southWestTriangleheadedArrowToBar": "\u2B79",
+    "/leftwardsTriangleheadedArrowWithDoubleHorizontalStroke": "\u2B7A",
+    "/upwardsTriangleheadedArrowWithDoubleHorizontalStroke": "\u2B7B",
+    "/rightwardsTriangleheadedArrowWithDoubleHorizontalStroke": "\u2B7C",
+    "/downwardsTriangleheadedArrowWithDoubleHorizontalStroke": "\u2B7D",
+    "/horizontalTabKey": "\u2B7E",
+    "/verticalTabKey": "\u2B7F",
+    "/leftwardsTriangleheadedArrowOverRightwardsTriangleheadedArrow": "\u2B80",
+    "/upwardsTriangleheadedArrowLeftwardsOfDownwardsTriangleheadedArrow": "\u2B81",
+    "/rightwardsTriangleheadedArrowOverLeftwardsTriangleheadedArrow": "\u2B82",
+    "/downwardsTriangleheadedArrowLeftwardsOfUpwardsTriangleheadedArrow": "\u2B83",
+    "/leftwardsTriangleheadedPairedArrows": "\u2B84",
+    "/upwardsTriangleheadedPairedArrows": "\u2B85",
+    "/rightwardsTriangleheadedPairedArrows": "\u2B86",
+    "/downwardsTriangleheadedPairedArrows": "\u2B87",
+    "/leftwardsBlackCircledWhiteArrow": "\u2B88",
+    "/upwardsBlackCircledWhiteArrow": "\u2B89",
+    "/rightwardsBlackCircledWhiteArrow": "\u2B8A",
+    "/downwardsBlackCircledWhiteArrow": "\u2B8B",
+    "/anticlockwiseTriangleheadedRightUshapedArrow": "\u2B8C",
+    "/anticlockwiseTriangleheadedBottomUshapedArrow": "\u2B8D",
+    "/anticlockwiseTriangleheadedLeftUshapedArrow": "\u2B8E",
+    "/anticlockwiseTriangleheadedTopUshapedArrow": "\u2B8F",
+    "/returnLeft": "\u2B90",
+    "/returnRight": "\u2B91",
+    "/newlineLeft": "\u2B92",
+    "/newlineRight": "\u2B93",
+    "/fourCornerArrowsCirclingAnticlockwise": "\u2B94",
+    "/rightwardsBlackArrow": "\u2B95",
+    "/symbolForTypeAElectronics": "\u2B97",
+    "/threedToplightedLeftwardsEquilateralArrowhead": "\u2B98",
+    "/threedRightlightedUpwardsEquilateralArrowhead": "\u2B99",
+    "/threedToplightedRightwardsEquilateralArrowhead": "\u2B9A",
+    "/threedLeftlightedDownwardsEquilateralArrowhead": "\u2B9B",
+    "/blackLeftwardsEquilateralArrowhead": "\u2B9C",
+    "/blackUpwardsEquilateralArrowhead": "\u2B9D",
+    "/blackRightwardsEquilateralArrowhead": "\u2B9E",
+    "/blackDownwardsEquilateralArrowhead": "\u2B9F",
+    "/downwardsTriangleheadedArrowWithLongTipLeftwards": "\u2BA0",
+    "/downwardsTriangleheadedArrowWithLongTipRightwards": "\u2BA1",
+    "/upwardsTriangleheadedArrowWithLongTipLeftwards": "\u2BA2",
+    "/upwardsTriangleheadedArrowWithLongTipRightwards": "\u2BA3",
+    "/leftwardsTriangleheadedArrowWithLongTipUpwards": "\u2BA4",
+    "/rightwardsTriangleheadedArrowWithLongTipUpwards": "\u2BA5",
+    "/leftwardsTriangleheadedArrowWithLongTipDownwards": "\u2BA6",
+    "/rightwardsTriangleheadedArrowWithLongTipDownwards": "\u2BA7",
+    "/blackCurvedDownwardsAndLeftwardsArrow": "\u2BA8",
+    "/blackCurvedDownwardsAndRightwardsArrow": "\u2BA9",
+    "/blackCurvedUpwardsAndLeftwardsArrow": "\u2BAA",
+    "/blackCurvedUpwardsAndRightwardsArrow": "\u2BAB",
+    "/blackCurvedLeftwardsAndUpwardsArrow": "\u2BAC",
+    "/blackCurvedRightwardsAndUpwardsArrow": "\u2BAD",
+    "/blackCurvedLeftwardsAndDownwardsArrow": "\u2BAE",
+    "/blackCurvedRightwardsAndDownwardsArrow": "\u2BAF",
+    "/ribbonArrowDownLeft": "\u2BB0",
+    "/ribbonArrowDownRight": "\u2BB1",
+    "/ribbonArrowUpLeft": "\u2BB2",
+    "/ribbonArrowUpRight": "\u2BB3",
+    "/ribbonArrowLeftUp": "\u2BB4",
+    "/ribbonArrowRightUp": "\u2BB5",
+    "/ribbonArrowLeftDown": "\u2BB6",
+    "/ribbonArrowRightDown": "\u2BB7",
+    "/upwardsWhiteArrowFromBarWithHorizontalBar": "\u2BB8",
+    "/upArrowheadInARectangleBox": "\u2BB9",
+    "/overlappingWhiteSquares": "\u2BBA",
+    "/overlappingWhiteAndBlackSquares": "\u2BBB",
+    "/overlappingBlackSquares": "\u2BBC",
+    "/ballotBoxWithLightX": "\u2BBD",
+    "/circledX": "\u2BBE",
+    "/circledBoldX": "\u2BBF",
+    "/blackSquareCentred": "\u2BC0",
+    "/blackDiamondCentred": "\u2BC1",
+    "/turnedBlackPentagon": "\u2BC2",
+    "/horizontalBlackOctagon": "\u2BC3",
+    "/blackOctagon": "\u2BC4",
+    "/blackMediumUppointingTriangleCentred": "\u2BC5",
+    "/blackMediumDownpointingTriangleCentred": "\u2BC6",
+    "/blackMediumLeftpointingTriangleCentred": "\u2BC7",
+    "/blackMediumRightpointingTriangleCentred": "\u2BC8",
+    "/neptuneFormTwo": "\u2BC9",
+    "/topHalfBlackCircle": "\u2BCA",
+    "/bottomHalfBlackCircle": "\u2BCB",
+    "/lightFourPointedBlackCusp": "\u2BCC",
+    "/rotatedLightFourPointedBlackCusp": "\u2BCD",
+    "/whiteFourPointedCusp": "\u2BCE",
+    "/rotatedWhiteFourPointedCusp": "\u2BCF",
+    "/squarePositionIndicator": "\u2BD0",
+    "/uncertaintySign": "\u2BD1",
+    "/groupMark": "\u2BD2",
+    "/plutoFormTwo": "\u2BD3",
+    "/plutoFormThree": "\u2BD4",
+    "/plutoFormFour": "\u2BD5",
+    "/plutoFormFive": "\u2BD6",
+    "/transpluto": "\u2BD7",
+    "/proserpina": "\u2BD8",
+    "/astraea": "\u2BD9",
+    "/hygiea": "\u2BDA",
+    "/pholus": "\u2BDB",
+    "/nessus": "\u2BDC",
+    "/whiteMoonSelena": "\u2BDD",
+    "/blackDiamondOnCross": "\u2BDE",
+    "/trueLightMoonArta": "\u2BDF",
+    "/cupido": "\u2BE0",
+    "/hades": "\u2BE1",
+    "/zeus": "\u2BE2",
+    "/kronos": "\u2BE3",
+    "/apollon": "\u2BE4",
+    "/admetos": "\u2BE5",
+    "/vulcanus": "\u2BE6",
+    "/poseidon": "\u2BE7",
+    "/leftHalfBlackStar": "\u2BE8",
+    "/rightHalfBlackStar": "\u2BE9",
+    "/starWithLeftHalfBlack": "\u2BEA",
+    "/starWithRightHalfBlack": "\u2BEB",
+    "/leftwardsTwoheadedArrowWithTriangleArrowheads": "\u2BEC",
+    "/upwardsTwoheadedArrowWithTriangleArrowheads": "\u2BED",
+    "/rightwardsTwoheadedArrowWithTriangleArrowheads": "\u2BEE",
+    "/downwardsTwoheadedArrowWithTriangleArrowheads": "\u2BEF",
+    "/erisFormOne": "\u2BF0",
+    "/erisFormTwo": "\u2BF1",
+    "/sedna": "\u2BF2",
+    "/russianAstrologicalSymbolVigintile": "\u2BF3",
+    "/russianAstrologicalSymbolNovile": "\u2BF4",
+    "/russianAstrologicalSymbolQuintile": "\u2BF5",
+    "/russianAstrologicalSymbolBinovile": "\u2BF6",
+    "/russianAstrologicalSymbolSentagon": "\u2BF7",
+    "/russianAstrologicalSymbolTredecile": "\u2BF8",
+    "/equalsSignWithInfinityBelow": "\u2BF9",
+    "/unitedSymbol": "\u2BFA",
+    "/separatedSymbol": "\u2BFB",
+    "/doubledSymbol": "\u2BFC",
+    "/passedSymbol": "\u2BFD",
+    "/reversedRightAngle": "\u2BFE",
+    "/hellschreiberPauseSymbol": "\u2BFF",
+    "/Azu": "\u2C00",
+    "/Buky": "\u2C01",
+    "/Vede": "\u2C02",
+    "/Glagoli": "\u2C03",
+    "/Dobro": "\u2C04",
+    "/Yestu": "\u2C05",
+    "/Zhivete": "\u2C06",
+    "/Dzelo": "\u2C07",
+    "/Zemlja": "\u2C08",
+    "/Izhe": "\u2C09",
+    "/Initializhe": "\u2C0A",
+    "/glag:I": "\u2C0B",
+    "/Djervi": "\u2C0C",
+    "/Kako": "\u2C0D",
+    "/Ljudije": "\u2C0E",
+    "/Myslite": "\u2C0F",
+    "/Nashi": "\u2C10",
+    "/Onu": "\u2C11",
+    "/Pokoji": "\u2C12",
+    "/Ritsi": "\u2C13",
+    "/Slovo": "\u2C14",
+    "/Tvrido": "\u2C15",
+    "/Uku": "\u2C16",
+    "/Fritu": "\u2C17",
+    "/Heru": "\u2C18",
+    "/Otu": "\u2C19",
+    "/Pe": "\u2C1A",
+    "/Shta": "\u2C1B",
+    "/Tsi": "\u2C1C",
+    "/Chrivi": "\u2C1D",
+    "/Sha": "\u2C1E",
+    "/Yeru": "\u2C1F",
+    "/Yeri": "\u2C20",
+    "/Yati": "\u2C21",
+    "/Spideryha": "\u2C22",
+    "/Yu": "\u2C23",
+    "/Smallyus": "\u2C24",
+    "/Smallyuswithtail": "\u2C25",
+    "/Yo": "\u2C26",
+    "/Iotatedsmallyus": "\u2C27",
+    "/Bigyus": "\u2C28",
+    "/Iotatedbigyus": "\u2C29",
+    "/Fita": "\u2C2A",
+    "/Izhitsa": "\u2C2B",
+    "/Shtapic": "\u2C2C",
+    "/Trokutastia": "\u2C2D",
+    "/Latinatemyslite": "\u2C2E",
+    "/Caudatechrivi": "\u2C2F",
+    "/azu": "\u2C30",
+    "/buky": "\u2C31",
+    "/vede": "\u2C32",
+    "/glagoli": "\u2C33",
+    "/dobro": "\u2C34",
+    "/yestu": "\u2C35",
+    "/zhivete": "\u2C36",
+    "/dzelo": "\u2C37",
+    "/zemlja": "\u2C38",
+    "/izhe": "\u2C39",
+    "/initializhe": "\u2C3A",
+    "/glag:i": "\u2C3B",
+    "/djervi": "\u2C3C",
+    "/kako": "\u2C3D",
+    "/ljudije": "\u2C3E",
+    "/myslite": "\u2C3F",
+    "/nashi": "\u2C40",
+    "/onu": "\u2C41",
+    "/pokoji": "\u2C42",
+    "/ritsi": "\u2C43",
+    "/slovo": "\u2C44",
+    "/tvrido": "\u2C45",
+    "/uku": "\u2C46",
+    "/fritu": "\u2C47",
+    "/heru": "\u2C48",
+    "/otu": "\u2C49",
+    "/shta": "\u2C4B",
+    "/tsi": "\u2C4C",
+    "/chrivi": "\u2C4D",
+    "/sha": "\u2C4E",
+    "/yeru": "\u2C4F",
+    "/yeri": "\u2C50",
+    "/yati": "\u2C51",
+    "/spideryha": "\u2C52",
+    "/glag:yu": "\u2C53",
+    "/smallyus": "\u2C54",
+    "/smallyuswithtail": "\u2C55",
+    "/yo": "\u2C56",
+    "/iotatedsmallyus": "\u2C57",
+    "/bigyus": "\u2C58",
+    "/iotatedbigyus": "\u2C59",
+    "/fita": "\u2C5A",
+    "/izhitsa": "\u2C5B",
+    "/shtapic": "\u2C5C",
+    "/trokutastia": "\u2C5D",
+    "/latinatemyslite": "\u2C5E",
+    "/caudatechrivi": "\u2C5F",
+    "/Ldblbar": "\u2C60",
+    "/ldblbar": "\u2C61",
+    "/Lmiddletilde": "\u2C62",
+    "/Pstroke": "\u2C63",
+    "/Rtail": "\u2C64",
+    "/astroke": "\u2C65",
+    "/tstroke": "\u2C66",
+    "/Hdescender": "\u2C67",
+    "/hdescender": "\u2C68",
+    "/Kdescender": "\u2C69",
+    "/kdescender": "\u2C6A",
+    "/Zdescender": "\u2C6B",
+    "/zdescender": "\u2C6C",
+    "/lt:Alpha": "\u2C6D",
+    "/Mhook": "\u2C6E",
+    "/Aturned": "\u2C6F",
+    "/lt:Alphaturned": "\u2C70",
+    "/vrighthook": "\u2C71",
+    "/Whook": "\u2C72",
+    "/whook": "\u2C73",
+    "/vcurl": "\u2C74",
+    "/Hhalf": "\u2C75",
+    "/hhalf": "\u2C76",
+    "/phitailless": "\u2C77",
+    "/enotch": "\u2C78",
+    "/rtailturned": "\u2C79",
+    "/olowringinside": "\u2C7A",
+    "/Esmallturned": "\u2C7B",
+    "/j.inferior": "\u2C7C",
+    "/Vmod": "\u2C7D",
+    "/Sswashtail": "\u2C7E",
+    "/Zswashtail": "\u2C7F",
+    "/anGeok": "\u2D00",
+    "/banGeok": "\u2D01",
+    "/ganGeok": "\u2D02",
+    "/donGeok": "\u2D03",
+    "/enGeok": "\u2D04",
+    "/vinGeok": "\u2D05",
+    "/zenGeok": "\u2D06",
+    "/tanGeok": "\u2D07",
+    "/inGeok": "\u2D08",
+    "/kanGeok": "\u2D09",
+    "/lasGeok": "\u2D0A",
+    "/manGeok": "\u2D0B",
+    "/narGeok": "\u2D0C",
+    "/onGeok": "\u2D0D",
+    "/parGeok": "\u2D0E",
+    "/zharGeok": "\u2D0F",
+    "/raeGeok": "\u2D10",
+    "/sanGeok": "\u2D11",
+    "/tarGeok": "\u2D12",
+    "/unGeok": "\u2D13",
+    "/pharGeok": "\u2D14",
+    "/kharGeok": "\u2D15",
+    "/ghanGeok": "\u2D16",
+    "/qarGeok": "\u2D17",
+    "/shinGeok": "\u2D18",
+    "/chinGeok": "\u2D19",
+    "/canGeok": "\u2D1A",
+    "/jilGeok": "\u2D1B",
+    "/cilGeok": "\u2D1C",
+    "/charGeok": "\u2D1D",
+    "/xanGeok": "\u2D1E",
+    "/jhanGeok": "\u2D1F",
+    "/haeGeok": "\u2D20",
+    "/heGeok": "\u2D21",
+    "/hieGeok": "\u2D22",
+    "/weGeok": "\u2D23",
+    "/harGeok": "\u2D24",
+    "/hoeGeok": "\u2D25",
+    "/ynGeok": "\u2D27",
+    "/aenGeok": "\u2D2D",
+    "/ethi:loa": "\u2D80",
+    "/ethi:moa": "\u2D81",
+    "/ethi:roa": "\u2D82",
+    "/ethi:soa": "\u2D83",
+    "/ethi:shoa": "\u2D84",
+    "/ethi:boa": "\u2D85",
+    "/ethi:toa": "\u2D86",
+    "/ethi:coa": "\u2D87",
+    "/ethi:noa": "\u2D88",
+    "/ethi:nyoa": "\u2D89",
+    "/ethi:oaglottal": "\u2D8A",
+    "/ethi:zoa": "\u2D8B",
+    "/ethi:doa": "\u2D8C",
+    "/ethi:ddoa": "\u2D8D",
+    "/ethi:joa": "\u2D8E",
+    "/ethi:thoa": "\u2D8F",
+    "/ethi:choa": "\u2D90",
+    "/ethi:phoa": "\u2D91",
+    "/ethi:poa": "\u2D92",
+    "/ethi:ggwa": "\u2D93",
+    "/ethi:ggwi": "\u2D94",
+    "/ethi:ggwee": "\u2D95",
+    "/ethi:ggwe": "\u2D96",
+    "/ethi:ssa": "\u2DA0",
+    "/ethi:ssu": "\u2DA1",
+    "/ethi:ssi": "\u2DA2",
+    "/ethi:ssaa": "\u2DA3",
+    "/ethi:ssee": "\u2DA4",
+    "/ethi:sse": "\u2DA5",
+    "/ethi:sso": "\u2DA6",
+    "/ethi:cca": "\u2DA8",
+    "/ethi:ccu": "\u2DA9",
+    "/ethi:cci": "\u2DAA",
+    "/ethi:ccaa": "\u2DAB",
+    "/ethi:ccee": "\u2DAC",
+    "/ethi:cce": "\u2DAD",
+    "/ethi:cco": "\u2DAE",
+    "/ethi:zza": "\u2DB0",
+    "/ethi:zzu": "\u2DB1",
+    "/ethi:zzi": "\u2DB2",
+    "/ethi:zzaa": "\u2DB3",
+    "/ethi:zzee": "\u2DB4",
+    "/ethi:zze": "\u2DB5",
+    "/ethi:zzo": "\u2DB6",
+    "/ethi:ccha": "\u2DB8",
+    "/ethi:cchu": "\u2DB9",
+    "/ethi:cchi": "\u2DBA",
+    "/ethi:cchaa": "\u2DBB",
+    "/ethi:cchee": "\u2DBC",
+    "/ethi:cche": "\u2DBD",
+    "/ethi:ccho": "\u2DBE",
+    "/ethi:qya": "\u2DC0",
+    "/ethi:qyu": "\u2DC1",
+    "/ethi:qyi": "\u2DC2",
+    "/ethi:qyaa": "\u2DC3",
+    "/ethi:qyee": "\u2DC4",
+    "/ethi:qye": "\u2DC5",
+    "/ethi:qyo": "\u2DC6",
+    "/ethi:kya": "\u2DC8",
+    "/ethi:kyu": "\u2DC9",
+    "/ethi:kyi": "\u2DCA",
+    "/ethi:kyaa": "\u2DCB",
+    "/ethi:kyee": "\u2DCC",
+    "/ethi:kye": "\u2DCD",
+    "/ethi:kyo": "\u2DCE",
+    "/ethi:xya": "\u2DD0",
+    "/ethi:xyu": "\u2DD1",
+    "/ethi:xyi": "\u2DD2",
+    "/ethi:xyaa": "\u2DD3",
+    "/ethi:xyee": "\u2DD4",
+    "/ethi:xye": "\u2DD5",
+    "/ethi:xyo": "\u2DD6",
+    "/ethi:gya": "\u2DD8",
+    "/ethi:gyu": "\u2DD9",
+    "/ethi:gyi": "\u2DDA",
+    "/ethi:gyaa": "\u2DDB",
+    "/ethi:gyee": "\u2DDC",
+    "/ethi:gye": "\u2DDD",
+    "/ethi:gyo": "\u2DDE",
+    "/anglemarkersubstitutionright": "\u2E00",
+    "/anglemarkerdottedsubstitutionright": "\u2E01",
+    "/bracketsubstitutionleft": "\u2E02",
+    "/bracketsubstitutionright": "\u2E03",
+    "/bracketdottedsubstitutionleft": "\u2E04",
+    "/bracketdottedsubstitutionright": "\u2E05",
+    "/markerraisedinterpolation": "\u2E06",
+    "/markerdottedraisedinterpolation": "\u2E07",
+    "/markerdottedtransposition": "\u2E08",
+    "/brackettranspositionleft": "\u2E09",
+    "/brackettranspositionright": "\u2E0A",
+    "/squareraised": "\u2E0B",
+    "/bracketraisedleft": "\u2E0C",
+    "/bracketraisedright": "\u2E0D",
+    "/coroniseditorial": "\u2E0E",
+    "/paragraphos": "\u2E0F",
+    "/paragraphosforked": "\u2E10",
+    "/paragraphosforkedreversed": "\u2E11",
+    "/hypodiastole": "\u2E12",
+    "/obelosdotted": "\u2E13",
+    "/ancoradown": "\u2E14",
+    "/ancoraup": "\u2E15",
+    "/angledottedright": "\u2E16",
+    "/hyphendbloblique": "\u2E17",
+    "/interrobanginverted": "\u2E18",
+    "/palmbranch": "\u2E19",
+    "/hyphendieresis": "\u2E1A",
+    "/tildering": "\u2E1B",
+    "/bracketparaphraselowleft": "\u2E1C",
+    "/bracketparaphraselowright": "\u2E1D",
+    "/tildedotaccent": "\u2E1E",
+    "/tildedotbelow": "\u2E1F",
+    "/barquillverticalleft": "\u2E20",
+    "/barquillverticalright": "\u2E21",
+    "/brackethalftopleft": "\u2E22",
+    "/brackethalftopright": "\u2E23",
+    "/brackethalfbottomleft": "\u2E24",
+    "/brackethalfbottomright": "\u2E25",
+    "/ubracketleft": "\u2E26",
+    "/ubracketright": "\u2E27",
+    "/parendblleft": "\u2E28",
+    "/parendblright": "\u2E29",
+    "/twodotsoveronedot": "\u2E2A",
+    "/onedotovertwodots": "\u2E2B",
+    "/dotsquarefour": "\u2E2C",
+    "/fivedot": "\u2E2D",
+    "/questionreversed": "\u2E2E",
+    "/tildevertical": "\u2E2F",
+    "/pointring": "\u2E30",
+    "/wordseparatormiddledot": "\u2E31",
+    "/turnedcomma": "\u2E32",
+    "/dotraised": "\u2E33",
+    "/commaraised": "\u2E34",
+    "/turnedsemicolon": "\u2E35",
+    "/daggerwithguardleft": "\u2E36",
+    "/daggerwithguardright": "\u2E37",
+    "/turneddagger": "\u2E38",
+    "/sectionsignhalftop": "\u2E39",
+    "/emdashdbl": "\u2E3A",
+    "/emdashtpl": "\u2E3B",
+    "/stenographicfullstop": "\u2E3C",
+    "/sixdotsvertical": "\u2E3D",
+    "/wigglylinevertical": "\u2E3E",
+    "/capitulum": "\u2E3F",
+    "/hyphendbl": "\u2E40",
+    "/commareversed": "\u2E41",
+    "/quotedbllowreversed": "\u2E42",
+    "/dashwithupturnleft": "\u2E43",
+    "/suspensiondbl": "\u2E44",
+    "/kavykainvertedlow": "\u2E45",
+    "/kavykawithkavykaaboveinvertedlow": "\u2E46",
+    "/kavykalow": "\u2E47",
+    "/kavykawithdotlow": "\u2E48",
+    "/stackedcommadbl": "\u2E49",
+    "/solidusdotted": "\u2E4A",
+    "/tripledagger": "\u2E4B",
+    "/medievalcomma": "\u2E4C",
+    "/paragraphus": "\u2E4D",
+    "/punctuselevatus": "\u2E4E",
+    "/cornishversedivider": "\u2E4F",
+    "/crosspattywithcrossbarright": "\u2E50",
+    "/crosspattywithcrossbarleft": "\u2E51",
+    "/tironiansigncapitalet": "\u2E52",
+    "/medievalexclamation": "\u2E53",
+    "/medievalquestion": "\u2E54",
+    "/squarebracketwithstrokeleft": "\u2E55",
+    "/squarebracketwithstrokeright": "\u2E56",
+    "/squarebracketwithstrokedblleft": "\u2E57",
+    "/squarebracketwithstrokedblright": "\u2E58",
+    "/parenhalftopleft": "\u2E59",
+    "/parenhalftopright": "\u2E5A",
+    "/parenhalfbottomleft": "\u2E5B",
+    "/parenhalfbottomright": "\u2E5C",
+    "/hyphenoblique": "\u2E5D",
+    "/whitesquarebracketleft": "\u301A",
+    "/whitesquarebracketright": "\u301B",
+    "/lowquotedblprime": "\u301F",
+    "/ideographicleveltonemark": "\u302A",
+    "/ideographicrisingtonemark": "\u302B",
+    "/ideographicdepartingtonemark": "\u302C",
+    "/ideographicenteringtonemark": "\u302D",
+    "/hangulsingledottonemark": "\u302E",
+    "/hanguldottonemarkdbl": "\u302F",
+    "/wavydash": "\u3030",
+    "/verticalkanarepeatmark": "\u3031",
+    "/verticalkanarepeatwithvoicedsoundmark": "\u3032",
+    "/verticalkanarepeatmarkupperhalf": "\u3033",
+    "/verticalkanarepeatwithvoicedsoundmarkupperhalf": "\u3034",
+    "/verticalkanarepeatmarklowerhalf": "\u3035",
+    "/ideographictelegraphlinefeedseparatorsymbol": "\u3037",
+    "/tenhangzhou": "\u3038",
+    "/thirtyhangzhou": "\u303A",
+    "/verticalideographiciterationmark": "\u303B",
+    "/masumark": "\u303C",
+    "/partalternationmark": "\u303D",
+    "/ideographicvariationindicator": "\u303E",
+    "/ideographichalffillspace": "\u303F",
+    "/hira:asmall": "\u3041",
+    "/hira:a": "\u3042",
+    "/hira:ismall": "\u3043",
+    "/hira:i": "\u3044",
+    "/hira:usmall": "\u3045",
+    "/hira:u": "\u3046",
+    "/hira:esmall": "\u3047",
+    "/hira:e": "\u3048",
+    "/hira:osmall": "\u3049",
+    "/hira:o": "\u304A",
+    "/hira:ka": "\u304B",
+    "/hira:ga": "\u304C",
+    "/hira:ki": "\u304D",
+    "/hira:gi": "\u304E",
+    "/hira:ku": "\u304F",
+    "/hira:gu": "\u3050",
+    "/hira:ke": "\u3051",
+    "/hira:ge": "\u3052",
+    "/hira:ko": "\u3053",
+    "/hira:go": "\u3054",
+    "/hira:sa": "\u3055",
+    "/hira:za": "\u3056",
+    "/hira:si": "\u3057",
+    "/hira:zi": "\u3058",
+    "/hira:su": "\u3059",
+    "/hira:zu": "\u305A",
+    "/hira:se": "\u305B",
+    "/hira:ze": "\u305C",
+    "/hira:so": "\u305D",
+    "/hira:zo": "\u305E",
+    "/hira:ta": "\u305F",
+    "/hira:da": "\u3060",
+    "/hira:ti": "\u3061",
+    "/hira:di": "\u3062",
+    "/hira:tusmall": "\u3063",
+    "/hira:tu": "\u3064",
+    "/hira:du": "\u3065",
+    "/hira:te": "\u3066",
+    "/hira:de": "\u3067",
+    "/hira:to": "\u3068",
+    "/hira:do": "\u3069",
+    "/hira:na": "\u306A",
+    "/hira:ni": "\u306B",
+    "/hira:nu": "\u306C",
+    "/hira:ne": "\u306D",
+    "/hira:no": "\u306E",
+    "/hira:ha": "\u306F",
+    "/hira:ba": "\u3070",
+    "/hira:pa": "\u3071",
+    "/hira:hi": "\u3072",
+    "/hira:bi": "\u3073",
+    "/hira:pi": "\u3074",
+    "/hira:hu": "\u3075",
+    "/hira:bu": "\u3076",
+    "/hira:pu": "\u3077",
+    "/hira:he": "\u3078",
+    "/hira:be": "\u3079",
+    "/hira:pe": "\u307A",
+    "/hira:ho": "\u307B",
+    "/hira:bo": "\u307C",
+    "/hira:po": "\u307D",
+    "/hira:ma": "\u307E",
+    "/hira:mi": "\u307F",
+    "/hira:mu": "\u3080",
+    "/hira:me": "\u3081",
+    "/hira:mo": "\u3082",
+    "/hira:yasmall": "\u3083",
+    "/hira:ya": "\u3084",
+    "/hira:yusmall": "\u3085",
+    "/hira:yu": "\u3086",
+    "/hira:yosmall": "\u3087",
+    "/hira:yo": "\u3088",
+    "/hira:ra": "\u3089",
+    "/hira:ri": "\u308A",
+    "/hira:ru": "\u308B",
+    "/hira:re": "\u308C",
+    "/hira:ro": "\u308D",
+    "/hira:wasmall": "\u308E",
+    "/hira:wa": "\u308F",
+    "/hira:wi": "\u3090",
+    "/hira:we": "\u3091",
+    "/hira:wo": "\u3092",
+    "/hira:n": "\u3093",
+    "/hira:vu": "\u3094",
+    "/hira:kasmall": "\u3095",
+    "/hira:kesmall": "\u3096",
+    "/hira:voicedmarkkanacmb": "\u3099",
+    "/hira:semivoicedmarkkanacmb": "\u309A",
+    "/hira:voicedmarkkana": "\u309B",
+    "/hira:semivoicedmarkkana": "\u309C",
+    "/hira:iterationhiragana": "\u309D",
+    "/hira:voicediterationhiragana": "\u309E",
+    "/hira:digraphyori": "\u309F",
+    "/kata:doublehyphenkana": "\u30A0",
+    "/kata:asmall": "\u30A1",
+    "/kata:a": "\u30A2",
+    "/kata:ismall": "\u30A3",
+    "/kata:i": "\u30A4",
+    "/kata:usmall": "\u30A5",
+    "/kata:u": "\u30A6",
+    "/kata:esmall": "\u30A7",
+    "/kata:e": "\u30A8",
+    "/kata:osmall": "\u30A9",
+    "/kata:o": "\u30AA",
+    "/kata:ka": "\u30AB",
+    "/kata:ga": "\u30AC",
+    "/kata:ki": "\u30AD",
+    "/kata:gi": "\u30AE",
+    "/kata:ku": "\u30AF",
+    "/kata:gu": "\u30B0",
+    "/kata:ke": "\u30B1",
+    "/kata:ge": "\u30B2",
+    "/kata:ko": "\u30B3",
+    "/kata:go": "\u30B4",
+    "/kata:sa": "\u30B5",
+    "/kata:za": "\u30B6",
+    "/kata:si": "\u30B7",
+    "/kata:zi": "\u30B8",
+    "/kata:su": "\u30B9",
+    "/kata:zu": "\u30BA",
+    "/kata:se": "\u30BB",
+    "/kata:ze": "\u30BC",
+    "/kata:so": "\u30BD",
+    "/kata:zo": "\u30BE",
+    "/kata:ta": "\u30BF",
+    "/kata:da": "\u30C0",
+    "/kata:ti": "\u30C1",
+    "/kata:di": "\u30C2",
+    "/kata:tusmall": "\u30C3",
+    "/kata:tu": "\u30C4",
+    "/kata:du": "\u30C5",
+    "/kata:te": "\u30C6",
+    "/kata:de": "\u30C7",
+    "/kata:to": "\u30C8",
+    "/kata:do": "\u30C9",
+    "/kata:na": "\u30CA",
+    "/kata:ni": "\u30CB",
+    "/kata:nu": "\u30CC",
+    "/kata:ne": "\u30CD",
+    "/kata:no": "\u30CE",
+    "/kata:ha": "\u30CF",
+    "/kata:ba": "\u30D0",
+    "/kata:pa": "\u30D1",
+    "/kata:hi": "\u30D2",
+    "/kata:bi": "\u30D3",
+    "/kata:pi": "\u30D4",
+    "/kata:hu": "\u30D5",
+    "/kata:bu": "\u30D6",
+    "/kata:pu": "\u30D7",
+    "/kata:he": "\u30D8",
+    "/kata:be": "\u30D9",
+    "/kata:pe": "\u30DA",
+    "/kata:ho": "\u30DB",
+    "/kata:bo": "\u30DC",
+    "/kata:po": "\u30DD",
+    "/kata:ma": "\u30DE",
+    "/kata:mi": "\u30DF",
+    "/kata:mu": "\u30E0",
+    "/kata:me": "\u30E1",
+    "/kata:mo": "\u30E2",
+    "/kata:yasmall": "\u30E3",
+    "/kata:ya": "\u30E4",
+    "/kata:yusmall": "\u30E5",
+    "/kata:yu": "\u30E6",
+    "/kata:yosmall": "\u30E7",
+    "/kata:yo": "\u30E8",
+    "/kata:ra": "\u30E9",
+    "/kata:ri": "\u30EA",
+    "/kata:ru": "\u30EB",
+    "/kata:re": "\u30EC",
+    "/kata:ro": "\u30ED",
+    "/kata:wasmall": "\u30EE",
+    "/kata:wa": "\u30EF",
+    "/kata:wi": "\u30F0",
+    "/kata:we": "\u30F1",
+    "/kata:wo": "\u30F2",
+    "/kata:n": "\u30F3",
+    "/kata:vu": "\u30F4",
+    "/kata:kasmall": "\u30F5",
+    "/kata:kesmall": "\u30F6",
+    "/kata:va": "\u30F7",
+    "/kata:vi": "\u30F8",
+    "/kata:ve": "\u30F9",
+    "/kata:vo": "\u30FA",
+    "/kata:middledot": "\u30FB",
+    "/kata:prolongedkana": "\u30FC",
+    "/kata:iteration": "\u30FD",
+    "/kata:voicediteration": "\u30FE",
+    "/kata:digraphkoto": "\u30FF",
+    "/bopo:b": "\u3105",
+    "/bopo:p": "\u3106",
+    "/bopo:m": "\u3107",
+    "/bopo:f": "\u3108",
+    "/bopo:d": "\u3109",
+    "/bopo:t": "\u310A",
+    "/bopo:n": "\u310B",
+    "/bopo:l": "\u310C",
+    "/bopo:g": "\u310D",
+    "/bopo:k": "\u310E",
+    "/bopo:h": "\u310F",
+    "/bopo:j": "\u3110",
+    "/bopo:q": "\u3111",
+    "/bopo:x": "\u3112",
+    "/bopo:zh": "\u3113",
+    "/bopo:ch": "\u3114",
+    "/bopo:sh": "\u3115",
+    "/bopo:r": "\u3116",
+    "/bopo:z": "\u3117",
+    "/bopo:c": "\u3118",
+    "/bopo:s": "\u3119",
+    "/bopo:a": "\u311A",
+    "/bopo:o": "\u311B",
+    "/bopo:e": "\u311C",
+    "/bopo:eh": "\u311D",
+    "/bopo:ai": "\u311E",
+    "/bopo:ei": "\u311F",
+    "/bopo:au": "\u3120",
+    "/bopo:ou": "\u3121",
+    "/bopo:an": "\u3122",
+    "/bopo:en": "\u3123",
+    "/bopo:ang": "\u3124",
+    "/bopo:eng": "\u3125",
+    "/bopo:er": "\u3126",
+    "/bopo:i": "\u3127",
+    "/bopo:u": "\u3128",
+    "/bopo:iu": "\u3129",
+    "/bopo:v": "\u312A",
+    "/bopo:ng": "\u312B",
+    "/bopo:gn": "\u312C",
+    "/bopo:ih": "\u312D",
+    "/bopo:owithdotabove": "\u312E",
+    "/bopo:nn": "\u312F",
+    "/ko:kiyeok": "\u3131",
+    "/ko:ssangkiyeok": "\u3132",
+    "/ko:kiyeoksios": "\u3133",
+    "/ko:nieun": "\u3134",
+    "/ko:nieuncieuc": "\u3135",
+    "/ko:nieunhieuh": "\u3136",
+    "/ko:tikeut": "\u3137",
+    "/ko:ssangtikeut": "\u3138",
+    "/ko:rieul": "\u3139",
+    "/ko:rieulkiyeok": "\u313A",
+    "/ko:rieulmieum": "\u313B",
+    "/ko:rieulpieup": "\u313C",
+    "/ko:rieulsios": "\u313D",
+    "/ko:rieulthieuth": "\u313E",
+    "/ko:rieulphieuph": "\u313F",
+    "/ko:rieulhieuh": "\u3140",
+    "/ko:mieum": "\u3141",
+    "/ko:pieup": "\u3142",
+    "/ko:ssangpieup": "\u3143",
+    "/ko:pieupsios": "\u3144",
+    "/ko:sios": "\u3145",
+    "/ko:ssangsios": "\u3146",
+    "/ko:ieung": "\u3147",
+    "/ko:cieuc": "\u3148",
+    "/ko:ssangcieuc": "\u3149",
+    "/ko:chieuch": "\u314A",
+    "/ko:khieukh": "\u314B",
+    "/ko:thieuth": "\u314C",
+    "/ko:phieuph": "\u314D",
+    "/ko:hieuh": "\u314E",
+    "/ko:a": "\u314F",
+    "/ko:ae": "\u3150",
+    "/ko:ya": "\u3151",
+    "/ko:yae": "\u3152",
+    "/ko:eo": "\u3153",
+    "/ko:e": "\u3154",
+    "/ko:yeo": "\u3155",
+    "/ko:ye": "\u3156",
+    "/ko:o": "\u3157",
+    "/ko:wa": "\u3158",
+    "/ko:wae": "\u3159",
+    "/ko:oe": "\u315A",
+    "/ko:yo": "\u315B",
+    "/ko:u": "\u315C",
+    "/ko:weo": "\u315D",
+    "/ko:we": "\u315E",
+    "/ko:wi": "\u315F",
+    "/ko:yu": "\u3160",
+    "/ko:eu": "\u3161",
+    "/ko:yi": "\u3162",
+    "/ko:i": "\u3163",
+    "/ko:filler": "\u3164",
+    "/ko:ssangnieun": "\u3165",
+    "/ko:nieuntikeut": "\u3166",
+    "/ko:nieunsios": "\u3167",
+    "/ko:nieunpansios": "\u3168",
+    "/ko:rieulkiyeoksios": "\u3169",
+    "/ko:rieultikeut": "\u316A",
+    "/ko:rieulpieupsios": "\u316B",
+    "/ko:rieulpansios": "\u316C",
+    "/ko:rieulyeorinhieuh": "\u316D",
+    "/ko:mieumpieup": "\u316E",
+    "/ko:mieumsios": "\u316F",
+    "/ko:mieumpansios": "\u3170",
+    "/ko:kapyeounmieum": "\u3171",
+    "/ko:pieupkiyeok": "\u3172",
+    "/ko:pieuptikeut": "\u3173",
+    "/ko:pieupsioskiyeok": "\u3174",
+    "/ko:pieupsiostikeut": "\u3175",
+    "/ko:pieupcieuc": "\u3176",
+    "/ko:pieupthieuth": "\u3177",
+    "/ko:kapyeounpieup": "\u3178",
+    "/ko:kapyeounssangpieup": "\u3179",
+    "/ko:sioskiyeok": "\u317A",
+    "/ko:siosnieun": "\u317B",
+    "/ko:siostikeut": "\u317C",
+    "/ko:siospieup": "\u317D",
+    "/ko:sioscieuc": "\u317E",
+    "/ko:pansios": "\u317F",
+    "/ko:ssangieung": "\u3180",
+    "/ko:yesieung": "\u3181",
+    "/ko:yesieungsios": "\u3182",
+    "/ko:yesieungpansios": "\u3183",
+    "/ko:kapyeounphieuph": "\u3184",
+    "/ko:ssanghieuh": "\u3185",
+    "/ko:yeorinhieuh": "\u3186",
+    "/ko:yoya": "\u3187",
+    "/ko:yoyae": "\u3188",
+    "/ko:yoi": "\u3189",
+    "/ko:yuyeo": "\u318A",
+    "/ko:yuye": "\u318B",
+    "/ko:yui": "\u318C",
+    "/ko:araea": "\u318D",
+    "/ko:araeae": "\u318E",
+    "/hangulkiyeokparen": "\u3200",
+    "/hangulnieunparen": "\u3201",
+    "/hangultikeutparen": "\u3202",
+    "/hangulrieulparen": "\u3203",
+    "/hangulmieumparen": "\u3204",
+    "/hangulpieupparen": "\u3205",
+    "/hangulsiosparen": "\u3206",
+    "/hangulieungparen": "\u3207",
+    "/hangulcieucparen": "\u3208",
+    "/hangulchieuchparen": "\u3209",
+    "/hangulkhieukhparen": "\u320A",
+    "/hangulthieuthparen": "\u320B",
+    "/hangulphieuphparen": "\u320C",
+    "/hangulhieuhparen": "\u320D",
+    "/hangulkiyeokaparen": "\u320E",
+    "/hangulnieunaparen": "\u320F",
+    "/hangultikeutaparen": "\u3210",
+    "/hangulrieulaparen": "\u3211",
+    "/hangulmieumaparen": "\u3212",
+    "/hangulpieupaparen": "\u3213",
+    "/hangulsiosaparen": "\u3214",
+    "/hangulieungaparen": "\u3215",
+    "/hangulcieucaparen": "\u3216",
+    "/hangulchieuchaparen": "\u3217",
+    "/hangulkhieukhaparen": "\u3218",
+    "/hangulthieuthaparen": "\u3219",
+    "/hangulphieuphaparen": "\u321A",
+    "/hangulhieuhaparen": "\u321B",
+    "/hangulcieucuparen": "\u321C",
+    "/ojeonparen": "\u321D",
+    "/ohuparen": "\u321E",
+    "/moonideographicparen": "\u322A",
+    "/fireideographicparen": "\u322B",
+    "/waterideographicparen": "\u322C",
+    "/woodideographicparen": "\u322D",
+    "/metalideographicparen": "\u322E",
+    "/earthideographicparen": "\u322F",
+    "/sunideographicparen": "\u3230",
+    "/stockideographicparen": "\u3231",
+    "/haveideographicparen": "\u3232",
+    "/societyideographicparen": "\u3233",
+    "/nameideographicparen": "\u3234",
+    "/specialideographicparen": "\u3235",
+    "/financialideographicparen": "\u3236",
+    "/congratulationideographicparen": "\u3237",
+    "/laborideographicparen": "\u3238",
+    "/representideographicparen": "\u3239",
+    "/callideographicparen": "\u323A",
+    "/studyideographicparen": "\u323B",
+    "/superviseideographicparen": "\u323C",
+    "/enterpriseideographicparen": "\u323D",
+    "/resourceideographicparen": "\u323E",
+    "/allianceideographicparen": "\u323F",
+    "/festivalideographicparen": "\u3240",
+    "/restideographicparen": "\u3241",
+    "/selfideographicparen": "\u3242",
+    "/reachideographicparen": "\u3243",
+    "/questionideographiccircled": "\u3244",
+    "/kindergartenideographiccircled": "\u3245",
+    "/schoolideographiccircled": "\u3246",
+    "/kotoideographiccircled": "\u3247",
+    "/tencirclesquare": "\u3248",
+    "/twentycirclesquare": "\u3249",
+    "/thirtycirclesquare": "\u324A",
+    "/fortycirclesquare": "\u324B",
+    "/fiftycirclesquare": "\u324C",
+    "/sixtycirclesquare": "\u324D",
+    "/seventycirclesquare": "\u324E",
+    "/eightycirclesquare": "\u324F",
+    "/partnership": "\u3250",
+    "/twentyonecircle": "\u3251",
+    "/twentytwocircle": "\u3252",
+    "/twentythreecircle": "\u3253",
+    "/twentyfourcircle": "\u3254",
+    "/twentyfivecircle": "\u3255",
+    "/twentysixcircle": "\u3256",
+    "/twentysevencircle": "\u3257",
+    "/twentyeightcircle": "\u3258",
+    "/twentyninecircle": "\u3259",
+    "/thirtycircle": "\u325A",
+    "/thirtyonecircle": "\u325B",
+    "/thirtytwocircle": "\u325C",
+    "/thirtythreecircle": "\u325D",
+    "/thirtyfourcircle": "\u325E",
+    "/thirtyfivecircle": "\u325F",
+    "/chamkocircle": "\u327C",
+    "/jueuicircle": "\u327D",
+    "/ieungucirclekorean": "\u327E",
+    "/oneideographiccircled": "\u3280",
+    "/twoideographiccircled": "\u3281",
+    "/threeideographiccircled": "\u3282",
+    "/fourideographiccircled": "\u3283",
+    "/fiveideographiccircled": "\u3284",
+    "/sixideographiccircled": "\u3285",
+    "/sevenideographiccircled": "\u3286",
+    "/eightideographiccircled": "\u3287",
+    "/nineideographiccircled": "\u3288",
+    "/tenideographiccircled": "\u3289",
+    "/moonideographiccircled": "\u328A",
+    "/fireideographiccircled": "\u328B",
+    "/waterideographiccircled": "\u328C",
+    "/woodideographiccircled": "\u328D",
+    "/metalideographiccircled": "\u328E",
+    "/earthideographiccircled": "\u328F",
+    "/sunideographiccircled": "\u3290",
+    "/stockideographiccircled": "\u3291",
+    "/haveideographiccircled": "\u3292",
+    "/societyideographiccircled": "\u3293",
+    "/nameideographiccircled": "\u3294",
+    "/specialideographiccircled": "\u3295",
+    "/financialideographiccircled": "\u3296",
+    "/congratulationideographiccircled": "\u3297",
+    "/laborideographiccircled": "\u3298",
+    "/secretideographiccircled": "\u3299",
+    "/maleideographiccircled": "\u329A",
+    "/femaleideographiccircled": "\u329B",
+    "/suitableideographiccircled": "\u329C",
+    "/excellentideographiccircled": "\u329D",
+    "/printideographiccircled": "\u329E",
+    "/attentionideographiccircled": "\u329F",
+    "/itemideographiccircled": "\u32A0",
+    "/restideographiccircled": "\u32A1",
+    "/copyideographiccircled": "\u32A2",
+    "/correctideographiccircled": "\u32A3",
+    "/highideographiccircled": "\u32A4",
+    "/centreideographiccircled": "\u32A5",
+    "/lowideographiccircled": "\u32A6",
+    "/leftideographiccircled": "\u32A7",
+    "/rightideographiccircled": "\u32A8",
+    "/medicineideographiccircled": "\u32A9",
+    "/religionideographiccircled": "\u32AA",
+    "/studyideographiccircled": "\u32AB",
+    "/superviseideographiccircled": "\u32AC",
+    "/enterpriseideographiccircled": "\u32AD",
+    "/resourceideographiccircled": "\u32AE",
+    "/allianceideographiccircled": "\u32AF",
+    "/nightideographiccircled": "\u32B0",
+    "/thirtysixcircle": "\u32B1",
+    "/thirtysevencircle": "\u32B2",
+    "/thirtyeightcircle": "\u32B3",
+    "/thirtyninecircle": "\u32B4",
+    "/fortycircle": "\u32B5",
+    "/fortyonecircle": "\u32B6",
+    "/fortytwocircle": "\u32B7",
+    "/fortythreecircle": "\u32B8",
+    "/fortyfourcircle": "\u32B9",
+    "/fortyfivecircle": "\u32BA",
+    "/fortysixcircle": "\u32BB",
+    "/fortysevencircle": "\u32BC",
+    "/fortyeightcircle": "\u32BD",
+    "/fortyninecircle": "\u32BE",
+    "/fiftycircle": "\u32BF",
+    "/januarytelegraph": "\u32C0",
+    "/februarytelegraph": "\u32C1",
+    "/marchtelegraph": "\u32C2",
+    "/apriltelegraph": "\u32C3",
+    "/maytelegraph": "\u32C4",
+    "/junetelegraph": "\u32C5",
+    "/julytelegraph": "\u32C6",
+    "/augusttelegraph": "\u32C7",
+    "/septembertelegraph": "\u32C8",
+    "/octobertelegraph": "\u32C9",
+    "/novembertelegraph": "\u32CA",
+    "/decembertelegraph": "\u32CB",
+    "/Hgfullwidth": "\u32CC",
+    "/ergfullwidth": "\u32CD",
+    "/eVfullwidth": "\u32CE",
+    "/LTDfullwidth": "\u32CF",
+    "/acirclekatakana": "\u32D0",
+    "/icirclekatakana": "\u32D1",
+    "/ucirclekatakana": "\u32D2",
+    "/ecirclekatakana": "\u32D3",
+    "/ocirclekatakana": "\u32D4",
+    "/kacirclekatakana": "\u32D5",
+    "/kicirclekatakana": "\u32D6",
+    "/kucirclekatakana": "\u32D7",
+    "/kecirclekatakana": "\u32D8",
+    "/kocirclekatakana": "\u32D9",
+    "/sacirclekatakana": "\u32DA",
+    "/sicirclekatakana": "\u32DB",
+    "/sucirclekatakana": "\u32DC",
+    "/secirclekatakana": "\u32DD",
+    "/socirclekatakana": "\u32DE",
+    "/tacirclekatakana": "\u32DF",
+    "/ticirclekatakana": "\u32E0",
+    "/tucirclekatakana": "\u32E1",
+    "/tecirclekatakana": "\u32E2",
+    "/tocirclekatakana": "\u32E3",
+    "/nacirclekatakana": "\u32E4",
+    "/nicirclekatakana": "\u32E5",
+    "/nucirclekatakana": "\u32E6",
+    "/necirclekatakana": "\u32E7",
+    "/nocirclekatakana": "\u32E8",
+    "/hacirclekatakana": "\u32E9",
+    "/hicirclekatakana": "\u32EA",
+    "/hucirclekatakana": "\u32EB",
+    "/hecirclekatakana": "\u32EC",
+    "/hocirclekatakana": "\u32ED",
+    "/macirclekatakana": "\u32EE",
+    "/micirclekatakana": "\u32EF",
+    "/mucirclekatakana": "\u32F0",
+    "/mecirclekatakana": "\u32F1",
+    "/mocirclekatakana": "\u32F2",
+    "/yacirclekatakana": "\u32F3",
+    "/yucirclekatakana": "\u32F4",
+    "/yocirclekatakana": "\u32F5",
+    "/racirclekatakana": "\u32F6",
+    "/ricirclekatakana": "\u32F7",
+    "/rucirclekatakana": "\u32F8",
+    "/recirclekatakana": "\u32F9",
+    "/rocirclekatakana": "\u32FA",
+    "/wacirclekatakana": "\u32FB",
+    "/wicirclekatakana": "\u32FC",
+    "/wecirclekatakana": "\u32FD",
+    "/wocirclekatakana": "\u32FE",
+    "/squareeranamereiwa": "\u32FF",
+    "/aruhuasquare": "\u3301",
+    "/anpeasquare": "\u3302",
+    "/iningusquare": "\u3304",
+    "/uonsquare": "\u3306",
+    "/esukuudosquare": "\u3307",
+    "/eekaasquare": "\u3308",
+    "/onsusquare": "\u3309",
+    "/oomusquare": "\u330A",
+    "/kairisquare": "\u330B",
+    "/karattosquare": "\u330C",
+    "/garonsquare": "\u330E",
+    "/ganmasquare": "\u330F",
+    "/gigasquare": "\u3310",
+    "/giniisquare": "\u3311",
+    "/kyuriisquare": "\u3312",
+    "/girudaasquare": "\u3313",
+    "/kirowattosquare": "\u3317",
+    "/guramutonsquare": "\u3319",
+    "/kuruzeirosquare": "\u331A",
+    "/kuroonesquare": "\u331B",
+    "/keesusquare": "\u331C",
+    "/korunasquare": "\u331D",
+    "/saikurusquare": "\u331F",
+    "/santiimusquare": "\u3320",
+    "/siringusquare": "\u3321",
+    "/daasusquare": "\u3324",
+    "/desisquare": "\u3325",
+    "/nanosquare": "\u3328",
+    "/nottosquare": "\u3329",
+    "/paatusquare": "\u332C",
+    "/baarerusquare": "\u332D",
+    "/piasutorusquare": "\u332E",
+    "/pikurusquare": "\u332F",
+    "/pikosquare": "\u3330",
+    "/huaraddosquare": "\u3332",
+    "/bussyerusquare": "\u3334",
+    "/huransquare": "\u3335",
+    "/pesosquare": "\u3337",
+    "/penihisquare": "\u3338",
+    "/pensusquare": "\u333A",
+    "/beetasquare": "\u333C",
+    "/pointosquare": "\u333D",
+    "/borutosquare": "\u333E",
+    "/honsquare": "\u333F",
+    "/pondosquare": "\u3340",
+    "/hoorusquare": "\u3341",
+    "/maikurosquare": "\u3343",
+    "/mairusquare": "\u3344",
+    "/mahhasquare": "\u3345",
+    "/marukusquare": "\u3346",
+    "/mikuronsquare": "\u3348",
+    "/megasquare": "\u334B",
+    "/megatonsquare": "\u334C",
+    "/yaarusquare": "\u334F",
+    "/yuansquare": "\u3350",
+    "/rirasquare": "\u3352",
+    "/rupiisquare": "\u3353",
+    "/ruuburusquare": "\u3354",
+    "/remusquare": "\u3355",
+    "/rentogensquare": "\u3356",
+    "/ideographictelegraphsymbolforhourzero": "\u3358",
+    "/ideographictelegraphsymbolforhourone": "\u3359",
+    "/ideographictelegraphsymbolforhourtwo": "\u335A",
+    "/ideographictelegraphsymbolforhourthree": "\u335B",
+    "/ideographictelegraphsymbolforhourfour": "\u335C",
+    "/ideographictelegraphsymbolforhourfive": "\u335D",
+    "/ideographictelegraphsymbolforhoursix": "\u335E",
+    "/ideographictelegraphsymbolforhourseven": "\u335F",
+    "/ideographictelegraphsymbolforhoureight": "\u3360",
+    "/ideographictelegraphsymbolforhournine": "\u3361",
+    "/ideographictelegraphsymbolforhourten": "\u3362",
+    "/ideographictelegraphsymbolforhoureleven": "\u3363",
+    "/ideographictelegraphsymbolforhourtwelve": "\u3364",
+    "/ideographictelegraphsymbolforhourthirteen": "\u3365",
+    "/ideographictelegraphsymbolforhourfourteen": "\u3366",
+    "/ideographictelegraphsymbolforhourfifteen": "\u3367",
+    "/ideographictelegraphsymbolforhoursixteen": "\u3368",
+    "/ideographictelegraphsymbolforhourseventeen": "\u3369",
+    "/ideographictelegraphsymbolforhoureighteen": "\u336A",
+    "/ideographictelegraphsymbolforhournineteen": "\u336B",
+    "/ideographictelegraphsymbolforhourtwenty": "\u336C",
+    "/ideographictelegraphsymbolforhourtwentyone": "\u336D",
+    "/ideographictelegraphsymbolforhourtwentytwo": "\u336E",
+    "/ideographictelegraphsymbolforhourtwentythree": "\u336F",
+    "/ideographictelegraphsymbolforhourtwentyfour": "\u3370",
+    "/hpafullwidth": "\u3371",
+    "/dafullwidth": "\u3372",
+    "/aufullwidth": "\u3373",
+    "/barfullwidth": "\u3374",
+    "/ovfullwidth": "\u3375",
+    "/pcfullwidth": "\u3376",
+    "/dmfullwidth": "\u3377",
+    "/dm2fullwidth": "\u3378",
+    "/dm3fullwidth": "\u3379",
+    "/iufullwidth": "\u337A",
+    "/eranameheiseisquare": "\u337B",
+    "/eranamesyouwasquare": "\u337C",
+    "/eranametaisyousquare": "\u337D",
+    "/eranamemeizisquare": "\u337E",
+    "/paampsfullwidth": "\u3380",
+    "/nafullwidth": "\u3381",
+    "/muafullwidth": "\u3382",
+    "/mafullwidth": "\u3383",
+    "/kafullwidth": "\u3384",
+    "/kbfullwidth": "\u3385",
+    "/mbfullwidth": "\u3386",
+    "/gbfullwidth": "\u3387",
+    "/calfullwidth": "\u3388",
+    "/kcalfullwidth": "\u3389",
+    "/pffullwidth": "\u338A",
+    "/nffullwidth": "\u338B",
+    "/muffullwidth": "\u338C",
+    "/mugfullwidth": "\u338D",
+    "/mgfullwidth": "\u338E",
+    "/kgfullwidth": "\u338F",
+    "/hzfullwidth": "\u3390",
+    "/khzfullwidth": "\u3391",
+    "/mhzfullwidth": "\u3392",
+    "/ghzfullwidth": "\u3393",
+    "/thzfullwidth": "\u3394",
+    "/mulfullwidth": "\u3395",
+    "/mlfullwidth": "\u3396",
+    "/dlfullwidth": "\u3397",
+    "/klfullwidth": "\u3398",
+    "/fmfullwidth": "\u3399",
+    "/nmfullwidth": "\u339A",
+    "/mumfullwidth": "\u339B",
+    "/mmfullwidth": "\u339C",
+    "/cmfullwidth": "\u339D",
+    "/kmfullwidth": "\u339E",
+    "/mm2fullwidth": "\u339F",
+    "/cm2fullwidth": "\u33A0",
+    "/m2fullwidth": "\u33A1",
+    "/km2fullwidth": "\u33A2",
+    "/mm3fullwidth": "\u33A3",
+    "/cm3fullwidth": "\u33A4",
+    "/m3fullwidth": "\u33A5",
+    "/km3fullwidth": "\u33A6",
+    "/moversfullwidth": "\u33A7",
+    "/movers2fullwidth": "\u33A8",
+    "/pafullwidth": "\u33A9",
+    "/kpafullwidth": "\u33AA",
+    "/mpafullwidth": "\u33AB",
+    "/gpafullwidth": "\u33AC",
+    "/radfullwidth": "\u33AD",
+    "/radoversfullwidth": "\u33AE",
+    "/radovers2fullwidth": "\u33AF",
+    "/psfullwidth": "\u33B0",
+    "/nsfullwidth": "\u33B1",
+    "/musfullwidth": "\u33B2",
+    "/msfullwidth": "\u33B3",
+    "/pvfullwidth": "\u33B4",
+    "/nvfullwidth": "\u33B5",
+    "/muvfullwidth": "\u33B6",
+    "/mvfullwidth": "\u33B7",
+    "/kvfullwidth": "\u33B8",
+    "/mvmegafullwidth": "\u33B9",
+    "/pwfullwidth": "\u33BA",
+    "/nwfullwidth": "\u33BB",
+    "/muwfullwidth": "\u33BC",
+    "/mwfullwidth": "\u33BD",
+    "/kwfullwidth": "\u33BE",
+    "/mwmegafullwidth": "\u33BF",
+    "/kohmfullwidth": "\u33C0",
+    "/mohmfullwidth": "\u33C1",
+    "/amfullwidth": "\u33C2",
+    "/bqfullwidth": "\u33C3",
+    "/ccfullwidth": "\u33C4",
+    "/cdfullwidth": "\u33C5",
+    "/coverkgfullwidth": "\u33C6",
+    "/cofullwidth": "\u33C7",
+    "/dbfullwidth": "\u33C8",
+    "/gyfullwidth": "\u33C9",
+    "/hafullwidth": "\u33CA",
+    "/hpfullwidth": "\u33CB",
+    "/infullwidth": "\u33CC",
+    "/kkfullwidth": "\u33CD",
+    "/kmcapitalfullwidth": "\u33CE",
+    "/ktfullwidth": "\u33CF",
+    "/lmfullwidth": "\u33D0",
+    "/lnfullwidth": "\u33D1",
+    "/logfullwidth": "\u33D2",
+    "/lxfullwidth": "\u33D3",
+    "/mbsmallfullwidth": "\u33D4",
+    "/milfullwidth": "\u33D5",
+    "/molfullwidth": "\u33D6",
+    "/phfullwidth": "\u33D7",
+    "/pmfullwidth": "\u33D8",
+    "/ppmfullwidth": "\u33D9",
+    "/prfullwidth": "\u33DA",
+    "/srfullwidth": "\u33DB",
+    "/svfullwidth": "\u33DC",
+    "/wbfullwidth": "\u33DD",
+    "/vovermfullwidth": "\u33DE",
+    "/aovermfullwidth": "\u33DF",
+    "/dayonetelegraph": "\u33E0",
+    "/daytwotelegraph": "\u33E1",
+    "/daythreetelegraph": "\u33E2",
+    "/dayfourtelegraph": "\u33E3",
+    "/dayfivetelegraph": "\u33E4",
+    "/daysixtelegraph": "\u33E5",
+    "/dayseventelegraph": "\u33E6",
+    "/dayeighttelegraph": "\u33E7",
+    "/dayninetelegraph": "\u33E8",
+    "/daytentelegraph": "\u33E9",
+    "/dayeleventelegraph": "\u33EA",
+    "/daytwelvetelegraph": "\u33EB",
+    "/daythirteentelegraph": "\u33EC",
+    "/dayfourteentelegraph": "\u33ED",
+    "/dayfifteentelegraph": "\u33EE",
+    "/daysixteentelegraph": "\u33EF",
+    "/dayseventeentelegraph": "\u33F0",
+    "/dayeighteentelegraph": "\u33F1",
+    "/daynineteentelegraph": "\u33F2",
+    "/daytwentytelegraph": "\u33F3",
+    "/daytwentyonetelegraph": "\u33F4",
+    "/daytwentytwotelegraph": "\u33F5",
+    "/daytwentythreetelegraph": "\u33F6",
+    "/daytwentyfourtelegraph": "\u33F7",
+    "/daytwentyfivetelegraph": "\u33F8",
+    "/daytwentysixtelegraph": "\u33F9",
+    "/daytwentyseventelegraph": "\u33FA",
+    "/daytwentyeighttelegraph": "\u33FB",
+    "/daytwentyninetelegraph": "\u33FC",
+    "/daythirtytelegraph": "\u33FD",
+    "/daythirtyonetelegraph": "\u33FE",
+    "/galsquare": "\u33FF",
+    "/stresstonemod": "\uA720",
+    "/stresslowtonemod": "\uA721",
+    "/Egyptalef": "\uA722",
+    "/egyptalef": "\uA723",
+    "/Egyptain": "\uA724",
+    "/egyptain": "\uA725",
+    "/Heng": "\uA726",
+    "/heng": "\uA727",
+    "/Tz": "\uA728",
+    "/tz": "\uA729",
+    "/Tresillo": "\uA72A",
+    "/tresillo": "\uA72B",
+    "/Cuatrillo": "\uA72C",
+    "/cuatrillo": "\uA72D",
+    "/Cuatrillocomma": "\uA72E",
+    "/cuatrillocomma": "\uA72F",
+    "/AA": "\uA732",
+    "/aa": "\uA733",
+    "/AO": "\uA734",
+    "/ao": "\uA735",
+    "/AU": "\uA736",
+    "/au": "\uA737",
+    "/AV": "\uA738",
+    "/av": "\uA739",
+    "/AVhorizontalbar": "\uA73A",
+    "/avhorizontalbar": "\uA73B",
+    "/AY": "\uA73C",
+    "/ay": "\uA73D",
+    "/Cdotreversed": "\uA73E",
+    "/cdotreversed": "\uA73F",
+    "/Kstroke": "\uA740",
+    "/kstroke": "\uA741",
+    "/Kdiagonalstroke": "\uA742",
+    "/kdiagonalstroke": "\uA743",
+    "/Kstrokediagonalstroke": "\uA744",
+    "/kstrokediagonalstroke": "\uA745",
+    "/Lbroken": "\uA746",
+    "/lbroken": "\uA747",
+    "/Lstroke": "\uA748",
+    "/lstroke": "\uA749",
+    "/Ostroke": "\uA74A",
+    "/ostroke": "\uA74B",
+    "/Oloop": "\uA74C",
+    "/oloop": "\uA74D",
+    "/OO": "\uA74E",
+    "/oo": "\uA74F",
+    "/Pstrokedescender": "\uA750",
+    "/pstrokedescender": "\uA751",
+    "/Pflourish": "\uA752",
+    "/pflourish": "\uA753",
+    "/Ptail": "\uA754",
+    "/ptail": "\uA755",
+    "/Qstrokedescender": "\uA756",
+    "/qstrokedescender": "\uA757",
+    "/Qdiagonalstroke": "\uA758",
+    "/qdiagonalstroke": "\uA759",
+    "/Rrotunda": "\uA75A",
+    "/rrotunda": "\uA75B",
+    "/Rumrotunda": "\uA75C",
+    "/rumrotunda": "\uA75D",
+    "/Vdiagonalstroke": "\uA75E",
+    "/vdiagonalstroke": "\uA75F",
+    "/Vy": "\uA760",
+    "/vy": "\uA761",
+    "/Visigothicz": "\uA762",
+    "/visigothicz": "\uA763",
+    "/Thornstroke": "\uA764",
+    "/thornstroke": "\uA765",
+    "/Thornstrokedescender": "\uA766",
+    "/thornstrokedescender": "\uA767",
+    "/Vend": "\uA768",
+    "/vend": "\uA769",
+    "/Et": "\uA76A",
+    "/et": "\uA76B",
+    "/Is": "\uA76C",
+    "/is": "\uA76D",
+    "/Con": "\uA76E",
+    "/con": "\uA76F",
+    "/usmod": "\uA770",
+    "/dum": "\uA771",
+    "/lum": "\uA772",
+    "/mum": "\uA773",
+    "/num": "\uA774",
+    "/rum": "\uA775",
+    "/Rumsmall": "\uA776",
+    "/tum": "\uA777",
+    "/um": "\uA778",
+    "/Dinsular": "\uA779",
+    "/dinsular": "\uA77A",
+    "/Finsular": "\uA77B",
+    "/finsular": "\uA77C",
+    "/Ginsular": "\uA77D",
+    "/Ginsularturned": "\uA77E",
+    "/ginsularturned": "\uA77F",
+    "/Lturned": "\uA780",
+    "/lturned": "\uA781",
+    "/Rinsular": "\uA782",
+    "/rinsular": "\uA783",
+    "/Sinsular": "\uA784",
+    "/sinsular": "\uA785",
+    "/Tinsular": "\uA786",
+    "/tinsular": "\uA787",
+    "/circumflexlow": "\uA788",
+    "/colonmod": "\uA789",
+    "/shortequalsmod": "\uA78A",
+    "/Saltillo": "\uA78B",
+    "/saltillo": "\uA78C",
+    "/Hturned": "\uA78D",
+    "/lbeltretroflex": "\uA78E",
+    "/sinologicaldot": "\uA78F",
+    "/Ndescender": "\uA790",
+    "/ndescender": "\uA791",
+    "/Cbar": "\uA792",
+    "/cbar": "\uA793",
+    "/cpalatalhook": "\uA794",
+    "/hpalatalhook": "\uA795",
+    "/Bflourish": "\uA796",
+    "/bflourish": "\uA797",
+    "/Fstroke": "\uA798",
+    "/fstroke": "\uA799",
+    "/Volapukae": "\uA79A",
+    "/volapukae": "\uA79B",
+    "/Volapukoe": "\uA79C",
+    "/volapukoe": "\uA79D",
+    "/Volapukue": "\uA79E",
+    "/volapukue": "\uA79F",
+    "/Gobliquestroke": "\uA7A0",
+    "/gobliquestroke": "\uA7A1",
+    "/Kobliquestroke": "\uA7A2",
+    "/kobliquestroke": "\uA7A3",
+    "/Nobliquestroke": "\uA7A4",
+    "/nobliquestroke": "\uA7A5",
+    "/Robliquestroke": "\uA7A6",
+    "/robliquestroke": "\uA7A7",
+    "/Sobliquestroke": "\uA7A8",
+    "/sobliquestroke": "\uA7A9",
+    "/Hhook": "\uA7AA",
+    "/Ereversedopen": "\uA7AB",
+    "/Scriptg": "\uA7AC",
+    "/Lbelt": "\uA7AD",
+    "/Kturned": "\uA7B0",
+    "/Tturned": "\uA7B1",
+    "/Jcrossed-tail": "\uA7B2",
+    "/ltgr:Chi": "\uA7B3",
+    "/ltgr:Beta": "\uA7B4",
+    "/ltgr:beta": "\uA7B5",
+    "/ltgr:Omega": "\uA7B6",
+    "/ltgr:omega": "\uA7B7",
+    "/Ustroke": "\uA7B8",
+    "/ustroke": "\uA7B9",
+    "/Glottala": "\uA7BA",
+    "/glottala": "\uA7BB",
+    "/Glottali": "\uA7BC",
+    "/glottali": "\uA7BD",
+    "/Glottalu": "\uA7BE",
+    "/glottalu": "\uA7BF",
+    "/Oldpolisho": "\uA7C0",
+    "/oldpolisho": "\uA7C1",
+    "/Anglicanaw": "\uA7C2",
+    "/anglicanaw": "\uA7C3",
+    "/Cpalatalhook": "\uA7C4",
+    "/Shook": "\uA7C5",
+    "/Zpalatalhook": "\uA7C6",
+    "/Dshortstroke": "\uA7C7",
+    "/dshortstroke": "\uA7C8",
+    "/Sshortstroke": "\uA7C9",
+    "/sshortstroke": "\uA7CA",
+    "/Ramshorn": "\uA7CB",
+    "/Sdiagonalstroke": "\uA7CC",
+    "/sdiagonalstroke": "\uA7CD",
+    "/Ginsularclosed": "\uA7D0",
+    "/ginsularclosed": "\uA7D1",
+    "/doublethorn": "\uA7D3",
+    "/doublewynn": "\uA7D5",
+    "/Middlescotss": "\uA7D6",
+    "/middlescotss": "\uA7D7",
+    "/Sigmoids": "\uA7D8",
+    "/sigmoids": "\uA7D9",
+    "/ltgr:Lambda": "\uA7DA",
+    "/ltgr:lambda": "\uA7DB",
+    "/Lambdastroke": "\uA7DC",
+    "/Cmod": "\uA7F2",
+    "/Fmod": "\uA7F3",
+    "/Qmod": "\uA7F4",
+    "/Halfhreversed": "\uA7F5",
+    "/halfhreversed": "\uA7F6",
+    "/iepigraphicsideways": "\uA7F7",
+    "/Hstrokemod": "\uA7F8",
+    "/ligatureoemod": "\uA7F9",
+    "/Mturnedsmall": "\uA7FA",
+    "/freversedepigraphic": "\uA7FB",
+    "/preversedepigraphic": "\uA7FC",
+    "/mepigraphicinverted": "\uA7FD",
+    "/iaepigraphic": "\uA7FE",
+    "/archaicmepigraphic": "\uA7FF",
+    "/panyangga": "\uA980",
+    "/cecak": "\uA981",
+    "/layar": "\uA982",
+    "/wignyan": "\uA983",
+    "/java:a": "\uA984",
+    "/ikawi": "\uA985",
+    "/java:i": "\uA986",
+    "/ii": "\uA987",
+    "/java:u": "\uA988",
+    "/pacerek": "\uA989",
+    "/ngalelet": "\uA98A",
+    "/ngaleletraswadi": "\uA98B",
+    "/java:e": "\uA98C",
+    "/ai": "\uA98D",
+    "/java:o": "\uA98E",
+    "/ka": "\uA98F",
+    "/kasasak": "\uA990",
+    "/kamurda": "\uA991",
+    "/ga": "\uA992",
+    "/gamurda": "\uA993",
+    "/nga": "\uA994",
+    "/ca": "\uA995",
+    "/camurda": "\uA996",
+    "/ja": "\uA997",
+    "/nyamurda": "\uA998",
+    "/jamahaprana": "\uA999",
+    "/nya": "\uA99A",
+    "/tta": "\uA99B",
+    "/ttamahaprana": "\uA99C",
+    "/dda": "\uA99D",
+    "/ddamahaprana": "\uA99E",
+    "/namurda": "\uA99F",
+    "/ta": "\uA9A0",
+    "/tamurda": "\uA9A1",
+    "/da": "\uA9A2",
+    "/damahaprana": "\uA9A3",
+    "/na": "\uA9A4",
+    "/pa": "\uA9A5",
+    "/pamurda": "\uA9A6",
+    "/ba": "\uA9A7",
+    "/bamurda": "\uA9A8",
+    "/ma": "\uA9A9",
+    "/ya": "\uA9AA",
+    "/ra": "\uA9AB",
+    "/raagung": "\uA9AC",
+    "/la": "\uA9AD",
+    "/wa": "\uA9AE",
+    "/samurda": "\uA9AF",
+    "/samahaprana": "\uA9B0",
+    "/sa": "\uA9B1",
+    "/ha": "\uA9B2",
+    "/cecaktelu": "\uA9B3",
+    "/tarungvowel": "\uA9B4",
+    "/tolongvowel": "\uA9B5",
+    "/wuluvowel": "\uA9B6",
+    "/wulumelikvowel": "\uA9B7",
+    "/sukuvowel": "\uA9B8",
+    "/sukumendutvowel": "\uA9B9",
+    "/talingvowel": "\uA9BA",
+    "/dirgamurevowel": "\uA9BB",
+    "/pepetvowel": "\uA9BC",
+    "/keretconsonant": "\uA9BD",
+    "/pengkalconsonant": "\uA9BE",
+    "/cakraconsonant": "\uA9BF",
+    "/pangkon": "\uA9C0",
+    "/rerengganleft": "\uA9C1",
+    "/rerengganright": "\uA9C2",
+    "/andappada": "\uA9C3",
+    "/madyapada": "\uA9C4",
+    "/luhurpada": "\uA9C5",
+    "/windupada": "\uA9C6",
+    "/pangkatpada": "\uA9C7",
+    "/lingsapada": "\uA9C8",
+    "/lungsipada": "\uA9C9",
+    "/adegpada": "\uA9CA",
+    "/adegadegpada": "\uA9CB",
+    "/piselehpada": "\uA9CC",
+    "/turnedpiselehpada": "\uA9CD",
+    "/pangrangkep": "\uA9CF",
+    "/java:zero": "\uA9D0",
+    "/java:one": "\uA9D1",
+    "/java:two": "\uA9D2",
+    "/java:three": "\uA9D3",
+    "/java:four": "\uA9D4",
+    "/java:five": "\uA9D5",
+    "/java:six": "\uA9D6",
+    "/java:seven": "\uA9D7",
+    "/java:eight": "\uA9D8",
+    "/java:nine": "\uA9D9",
+    "/tirtatumetespada": "\uA9DE",
+    "/isen-isenpada": "\uA9DF",
+    "/ethi:tthu": "\uAB01",
+    "/ethi:tthi": "\uAB02",
+    "/ethi:tthaa": "\uAB03",
+    "/ethi:tthee": "\uAB04",
+    "/ethi:tthe": "\uAB05",
+    "/ethi:ttho": "\uAB06",
+    "/ethi:ddhu": "\uAB09",
+    "/ethi:ddhi": "\uAB0A",
+    "/ethi:ddhaa": "\uAB0B",
+    "/ethi:ddhee": "\uAB0C",
+    "/ethi:ddhe": "\uAB0D",
+    "/ethi:ddho": "\uAB0E",
+    "/ethi:dzu": "\uAB11",
+    "/ethi:dzi": "\uAB12",
+    "/ethi:dzaa": "\uAB13",
+    "/ethi:dzee": "\uAB14",
+    "/ethi:dze": "\uAB15",
+    "/ethi:dzo": "\uAB16",
+    "/ethi:cchha": "\uAB20",
+    "/ethi:cchhu": "\uAB21",
+    "/ethi:cchhi": "\uAB22",
+    "/ethi:cchhaa": "\uAB23",
+    "/ethi:cchhee": "\uAB24",
+    "/ethi:cchhe": "\uAB25",
+    "/ethi:cchho": "\uAB26",
+    "/ethi:bba": "\uAB28",
+    "/ethi:bbu": "\uAB29",
+    "/ethi:bbi": "\uAB2A",
+    "/ethi:bbaa": "\uAB2B",
+    "/ethi:bbee": "\uAB2C",
+    "/ethi:bbe": "\uAB2D",
+    "/ethi:bbo": "\uAB2E",
+    "/redalphabar": "\uAB30",
+    "/areversedschwa": "\uAB31",
+    "/efractur": "\uAB32",
+    "/redebar": "\uAB33",
+    "/eflourish": "\uAB34",
+    "/flenis": "\uAB35",
+    "/gtailscript": "\uAB36",
+    "/llazyinverteds": "\uAB37",
+    "/lmiddledbltilde": "\uAB38",
+    "/lmiddlering": "\uAB39",
+    "/mtail": "\uAB3A",
+    "/ntail": "\uAB3B",
+    "/engtail": "\uAB3C",
+    "/ofractur": "\uAB3D",
+    "/ofracturstroke": "\uAB3E",
+    "/ostrokeopen": "\uAB3F",
+    "/oeinverted": "\uAB40",
+    "/oestroketurned": "\uAB41",
+    "/oehorizontalstroketurned": "\uAB42",
+    "/ooopenturned": "\uAB43",
+    "/ooopenstroketurned": "\uAB44",
+    "/stirrupr": "\uAB45",
+    "/Rrightlegsmall": "\uAB46",
+    "/routhandle": "\uAB47",
+    "/rdbl": "\uAB48",
+    "/rtail": "\uAB49",
+    "/rtaildbl": "\uAB4A",
+    "/rscript": "\uAB4B",
+    "/rringscript": "\uAB4C",
+    "/baselineesh": "\uAB4D",
+    "/urightlegshort": "\uAB4E",
+    "/urightlegbarshort": "\uAB4F",
+    "/ui": "\uAB50",
+    "/uiturned": "\uAB51",
+    "/ulefthook": "\uAB52",
+    "/ltgr:chi": "\uAB53",
+    "/chilowrightring": "\uAB54",
+    "/chilowleftserif": "\uAB55",
+    "/xlowrightring": "\uAB56",
+    "/xlongleftleg": "\uAB57",
+    "/xlongleftlegandlowrightring": "\uAB58",
+    "/xlongleftlegserif": "\uAB59",
+    "/yrightlegshort": "\uAB5A",
+    "/breveinvertedmod": "\uAB5B",
+    "/hengmod": "\uAB5C",
+    "/llazyinvertedsmod": "\uAB5D",
+    "/lmiddletildemod": "\uAB5E",
+    "/ulefthookmod": "\uAB5F",
+    "/sakhayat": "\uAB60",
+    "/iotifiede": "\uAB61",
+    "/oeopen": "\uAB62",
+    "/uo": "\uAB63",
+    "/alphainverted": "\uAB64",
+    "/Omegasmall": "\uAB65",
+    "/dzdigraphretroflexhook": "\uAB66",
+    "/tsdigraphretroflexhook": "\uAB67",
+    "/rmiddletildeturned": "\uAB68",
+    "/wturnedmod": "\uAB69",
+    "/modLetterLeftTack": "\uAB6A",
+    "/modLetterRightTack": "\uAB6B",
+    "/chrk:asmall": "\uAB70",
+    "/chrk:esmall": "\uAB71",
+    "/chrk:ismall": "\uAB72",
+    "/chrk:osmall": "\uAB73",
+    "/chrk:usmall": "\uAB74",
+    "/chrk:vsmall": "\uAB75",
+    "/chrk:gasmall": "\uAB76",
+    "/chrk:kasmall": "\uAB77",
+    "/chrk:gesmall": "\uAB78",
+    "/chrk:gismall": "\uAB79",
+    "/chrk:gosmall": "\uAB7A",
+    "/chrk:gusmall": "\uAB7B",
+    "/chrk:gvsmall": "\uAB7C",
+    "/chrk:hasmall": "\uAB7D",
+    "/chrk:hesmall": "\uAB7E",
+    "/chrk:hismall": "\uAB7F",
+    "/chrk:hosmall": "\uAB80",
+    "/chrk:husmall": "\uAB81",
+    "/chrk:hvsmall": "\uAB82",
+    "/chrk:lasmall": "\uAB83",
+    "/chrk:lesmall": "\uAB84",
+    "/chrk:lismall": "\uAB85",
+    "/chrk:losmall": "\uAB86",
+    "/chrk:lusmall": "\uAB87",
+    "/chrk:lvsmall": "\uAB88",
+    "/chrk:masmall": "\uAB89",
+    "/chrk:mesmall": "\uAB8A",
+    "/chrk:mismall": "\uAB8B",
+    "/chrk:mosmall": "\uAB8C",
+    "/chrk:musmall": "\uAB8D",
+    "/chrk:nasmall": "\uAB8E",
+    "/chrk:hnasmall": "\uAB8F",
+    "/chrk:nahsmall": "\uAB90",
+    "/chrk:nesmall": "\uAB91",
+    "/chrk:nismall": "\uAB92",
+    "/chrk:nosmall": "\uAB93",
+    "/chrk:nusmall": "\uAB94",
+    "/chrk:nvsmall": "\uAB95",
+    "/chrk:quasmall": "\uAB96",
+    "/chrk:quesmall": "\uAB97",
+    "/chrk:quismall": "\uAB98",
+    "/chrk:quosmall": "\uAB99",
+    "/chrk:quusmall": "\uAB9A",
+    "/chrk:quvsmall": "\uAB9B",
+    "/chrk:sasmall": "\uAB9C",
+    "/chrk:ssmall": "\uAB9D",
+    "/chrk:sesmall": "\uAB9E",
+    "/chrk:sismall": "\uAB9F",
+    "/chrk:sosmall": "\uABA0",
+    "/chrk:susmall": "\uABA1",
+    "/chrk:svsmall": "\uABA2",
+    "/chrk:dasmall": "\uABA3",
+    "/chrk:tasmall": "\uABA4",
+    "/chrk:desmall": "\uABA5",
+    "/chrk:tesmall": "\uABA6",
+    "/chrk:dismall": "\uABA7",
+    "/chrk:tismall": "\uABA8",
+    "/chrk:dosmall": "\uABA9",
+    "/chrk:dusmall": "\uABAA",
+    "/chrk:dvsmall": "\uABAB",
+    "/chrk:dlasmall": "\uABAC",
+    "/chrk:tlasmall": "\uABAD",
+    "/chrk:tlesmall": "\uABAE",
+    "/chrk:tlismall": "\uABAF",
+    "/chrk:tlosmall": "\uABB0",
+    "/chrk:tlusmall": "\uABB1",
+    "/chrk:tlvsmall": "\uABB2",
+    "/chrk:tsasmall": "\uABB3",
+    "/chrk:tsesmall": "\uABB4",
+    "/chrk:tsismall": "\uABB5",
+    "/chrk:tsosmall": "\uABB6",
+    "/chrk:tsusmall": "\uABB7",
+    "/chrk:tsvsmall": "\uABB8",
+    "/chrk:wasmall": "\uABB9",
+    "/chrk:wesmall": "\uABBA",
+    "/chrk:wismall": "\uABBB",
+    "/chrk:wosmall": "\uABBC",
+    "/chrk:wusmall": "\uABBD",
+    "/chrk:wvsmall": "\uABBE",
+    "/chrk:yasmall": "\uABBF",
+    "/f_f": "\uFB00",
+    "/f_f_i": "\uFB03",
+    "/f_f_l": "\uFB04",
+    "/longs_t": "\uFB05",
+    "/s_t": "\uFB06",
+    "/men_nowarmn": "\uFB13",
+    "/men_echarmn": "\uFB14",
+    "/men_iniarmn": "\uFB15",
+    "/vew_nowarmn": "\uFB16",
+    "/men_xeharmn": "\uFB17",
+    "/yodwithhiriq:hb": "\uFB1D",
+    "/varikajudeospanish:hb": "\uFB1E",
+    "/yod_yod_patah:hb": "\uFB1F",
+    "/ayinalt:hb": "\uFB20",
+    "/alefwide:hb": "\uFB21",
+    "/daletwide:hb": "\uFB22",
+    "/hewide:hb": "\uFB23",
+    "/kafwide:hb": "\uFB24",
+    "/lamedwide:hb": "\uFB25",
+    "/finalmemwide:hb": "\uFB26",
+    "/reshwide:hb": "\uFB27",
+    "/tavwide:hb": "\uFB28",
+    "/plussignalt:hb": "\uFB29",
+    "/shinwithshinDot:hb": "\uFB2A",
+    "/shinwithsinDot:hb": "\uFB2B",
+    "/shinwithdageshandshinDot:hb": "\uFB2C",
+    "/shinwithdageshandsinDot:hb": "\uFB2D",
+    "/alefwithpatah:hb": "\uFB2E",
+    "/alefwithqamats:hb": "\uFB2F",
+    "/alefwithmapiq:hb": "\uFB30",
+    "/betwithdagesh:hb": "\uFB31",
+    "/gimelwithdagesh:hb": "\uFB32",
+    "/daletwithdagesh:hb": "\uFB33",
+    "/hewithmapiq:hb": "\uFB34",
+    "/vavwithdagesh:hb": "\uFB35",
+    "/zayinwithdagesh:hb": "\uFB36",
+    "/tetwithdagesh:hb": "\uFB38",
+    "/yodwithdagesh:hb": "\uFB39",
+    "/finalkafwithdagesh:hb": "\uFB3A",
+    "/kafwithdagesh:hb": "\uFB3B",
+    "/lamedwithdagesh:hb": "\uFB3C",
+    "/memwithdagesh:hb": "\uFB3E",
+    "/nunwithdagesh:hb": "\uFB40",
+    "/samekhwithdagesh:hb": "\uFB41",
+    "/finalpewithdagesh:hb": "\uFB43",
+    "/pewithdagesh:hb": "\uFB44",
+    "/tsadiwithdagesh:hb": "\uFB46",
+    "/qofwithdagesh:hb": "\uFB47",
+    "/reshwithdagesh:hb": "\uFB48",
+    "/shinwithdagesh:hb": "\uFB49",
+    "/tavwithdagesh:hb": "\uFB4A",
+    "/vavwithholam:hb": "\uFB4B",
+    "/betwithrafe:hb": "\uFB4C",
+    "/kafwithrafe:hb": "\uFB4D",
+    "/pewithrafe:hb": "\uFB4E",
+    "/ligaturealeflamed:hb": "\uFB4F",
+    "/alefwasla.isol": "\uFB50",
+    "/alefwasla.fina": "\uFB51",
+    "/beeh.isol": "\uFB52",
+    "/beeh.fina": "\uFB53",
+    "/beeh.init": "\uFB54",
+    "/beeh.medi": "\uFB55",
+    "/peh.isol": "\uFB56",
+    "/peh.fina": "\uFB57",
+    "/peh.init": "\uFB58",
+    "/peh.medi": "\uFB59",
+    "/beheh.isol": "\uFB5A",
+    "/beheh.fina": "\uFB5B",
+    "/beheh.init": "\uFB5C",
+    "/beheh.medi": "\uFB5D",
+    "/tteheh.isol": "\uFB5E",
+    "/tteheh.fina": "\uFB5F",
+    "/tteheh.init": "\uFB60",
+    "/tteheh.medi": "\uFB61",
+    "/teheh.isol": "\uFB62",
+    "/teheh.fina": "\uFB63",
+    "/teheh.init": "\uFB64",
+    "/teheh.medi": "\uFB65",
+    "/tteh.isol": "\uFB66",
+    "/tteh.fina": "\uFB67",
+    "/tteh.init": "\uFB68",
+    "/tteh.medi": "\uFB69",
+    "/veh.isol": "\uFB6A",
+    "/veh.fina": "\uFB6B",
+    "/veh.init": "\uFB6C",
+    "/veh.medi": "\uFB6D",
+    "/peheh.isol": "\uFB6E",
+    "/peheh.fina": "\uFB6F",
+    "/peheh.init": "\uFB70",
+    "/peheh.medi": "\uFB71",
+    "/dyeh.isol": "\uFB72",
+    "/dyeh.fina": "\uFB73",
+    "/dyeh.init": "\uFB74",
+    "/dyeh.medi": "\uFB75",
+    "/nyeh.isol": "\uFB76",
+    "/nyeh.fina": "\uFB77",
+    "/nyeh.init": "\uFB78",
+    "/nyeh.medi": "\uFB79",
+    "/tcheh.isol": "\uFB7A",
+    "/tcheh.fina": "\uFB7B",
+    "/tcheh.init": "\uFB7C",
+    "/tcheh.medi": "\uFB7D",
+    "/tcheheh.isol": "\uFB7E",
+    "/tcheheh.fina": "\uFB7F",
+    "/tcheheh.init": "\uFB80",
+    "/tcheheh.medi": "\uFB81",
+    "/ddahal.isol": "\uFB82",
+    "/ddahal.fina": "\uFB83",
+    "/dahal.isol": "\uFB84",
+    "/dahal.fina": "\uFB85",
+    "/dul.isol": "\uFB86",
+    "/dul.fina": "\uFB87",
+    "/ddal.isol": "\uFB88",
+    "/ddal.fina": "\uFB89",
+    "/jeh.isol": "\uFB8A",
+    "/jeh.fina": "\uFB8B",
+    "/rreh.isol": "\uFB8C",
+    "/rreh.fina": "\uFB8D",
+    "/keheh.isol": "\uFB8E",
+    "/keheh.fina": "\uFB8F",
+    "/keheh.init": "\uFB90",
+    "/keheh.medi": "\uFB91",
+    "/gaf.isol": "\uFB92",
+    "/gaf.fina": "\uFB93",
+    "/gaf.init": "\uFB94",
+    "/gaf.medi": "\uFB95",
+    "/gueh.isol": "\uFB96",
+    "/gueh.fina": "\uFB97",
+    "/gueh.init": "\uFB98",
+    "/gueh.medi": "\uFB99",
+    "/ngoeh.isol": "\uFB9A",
+    "/ngoeh.fina": "\uFB9B",
+    "/ngoeh.init": "\uFB9C",
+    "/ngoeh.medi": "\uFB9D",
+    "/noonghunna.isol": "\uFB9E",
+    "/noonghunna.fina": "\uFB9F",
+    "/rnoon.isol": "\uFBA0",
+    "/rnoon.fina": "\uFBA1",
+    "/rnoon.init": "\uFBA2",
+    "/rnoon.medi": "\uFBA3",
+    "/hehyeh.isol": "\uFBA4",
+    "/hehyeh.fina": "\uFBA5",
+    "/hehgoal.isol": "\uFBA6",
+    "/hehgoal.fina": "\uFBA7",
+    "/hehgoal.init": "\uFBA8",
+    "/hehgoal.medi": "\uFBA9",
+    "/hehdoachashmee.isol": "\uFBAA",
+    "/hehdoachashmee.fina": "\uFBAB",
+    "/hehdoachashmee.init": "\uFBAC",
+    "/hehdoachashmee.medi": "\uFBAD",
+    "/yehbarree.isol": "\uFBAE",
+    "/yehbarree.fina": "\uFBAF",
+    "/yehbarreehamza.isol": "\uFBB0",
+    "/yehbarreehamza.fina": "\uFBB1",
+    "/symboldotabove": "\uFBB2",
+    "/symboldotbelow": "\uFBB3",
+    "/symboltwodotsabove": "\uFBB4",
+    "/symboltwodotsbelow": "\uFBB5",
+    "/symbolabovethreedotsabove": "\uFBB6",
+    "/symbolbelowthreedotsabove": "\uFBB7",
+    "/symbolpointingabovedownthreedotsabove": "\uFBB8",
+    "/symbolpointingbelowdownthreedotsabove": "\uFBB9",
+    "/symbolfourdotsabove": "\uFBBA",
+    "/symbolfourdotsbelow": "\uFBBB",
+    "/symboldoubleverticalbarbelow": "\uFBBC",
+    "/symboltwodotsverticallyabove": "\uFBBD",
+    "/symboltwodotsverticallybelow": "\uFBBE",
+    "/symbolring": "\uFBBF",
+    "/symboltahabovesmall": "\uFBC0",
+    "/symboltahbelowsmall": "\uFBC1",
+    "/symbolabovewasla": "\uFBC2",
+    "/ng.isol": "\uFBD3",
+    "/ng.fina": "\uFBD4",
+    "/ng.init": "\uFBD5",
+    "/ng.medi": "\uFBD6",
+    "/u.isol": "\uFBD7",
+    "/u.fina": "\uFBD8",
+    "/oe.isol": "\uFBD9",
+    "/oe.fina": "\uFBDA",
+    "/yu.isol": "\uFBDB",
+    "/yu.fina": "\uFBDC",
+    "/uhamza.isol": "\uFBDD",
+    "/ve.isol": "\uFBDE",
+    "/ve.fina": "\uFBDF",
+    "/oekirghiz.isol": "\uFBE0",
+    "/oekirghiz.fina": "\uFBE1",
+    "/yukirghiz.isol": "\uFBE2",
+    "/yukirghiz.fina": "\uFBE3",
+    "/e.isol": "\uFBE4",
+    "/e.fina": "\uFBE5",
+    "/e.init": "\uFBE6",
+    "/e.medi": "\uFBE7",
+    "/uighurkazakhkirghizalefmaksura.init": "\uFBE8",
+    "/uighurkazakhkirghizalefmaksura.medi": "\uFBE9",
+    "/yeh.init_hamzaabove.medi_alef.fina": "\uFBEA",
+    "/yeh.medi_hamzaabove.medi_alef.fina": "\uFBEB",
+    "/yeh.init_hamzaabove.medi_ae.fina": "\uFBEC",
+    "/yeh.medi_hamzaabove.medi_ae.fina": "\uFBED",
+    "/yeh.init_hamzaabove.medi_waw.fina": "\uFBEE",
+    "/yeh.medi_hamzaabove.medi_waw.fina": "\uFBEF",
+    "/yeh.init_hamzaabove.medi_u.fina": "\uFBF0",
+    "/yeh.medi_hamzaabove.medi_u.fina": "\uFBF1",
+    "/yeh.init_hamzaabove.medi_oe.fina": "\uFBF2",
+    "/yeh.medi_hamzaabove.medi_oe.fina": "\uFBF3",
+    "/yeh.init_hamzaabove.medi_yu.fina": "\uFBF4",
+    "/yeh.medi_hamzaabove.medi_yu.fina": "\uFBF5",
+    "/yeh.init_hamzaabove.medi_e.fina": "\uFBF6",
+    "/yeh.medi_hamzaabove.medi_e.fina": "\uFBF7",
+    "/yeh.init_hamzaabove.medi_e.medi": "\uFBF8",
+    "/uighurkirghizyeh.init_hamzaabove.medi_alefmaksura.fina": "\uFBF9",
+    "/uighurkirghizyeh.medi_hamzaabove.medi_alefmaksura.fina": "\uFBFA",
+    "/uighurkirghizyeh.init_hamzaabove.medi_alefmaksura.medi": "\uFBFB",
+    "/yehfarsi.isol": "\uFBFC",
+    "/yehfarsi.fina": "\uFBFD",
+    "/yehfarsi.init": "\uFBFE",
+    "/yehfarsi.medi": "\uFBFF",
+    "/yeh.init_hamzaabove.medi_jeem.fina": "\uFC00",
+    "/yeh.init_hamzaabove.medi_hah.fina": "\uFC01",
+    "/yeh.init_hamzaabove.medi_meem.fina": "\uFC02",
+    "/yeh.init_hamzaabove.medi_alefmaksura.fina": "\uFC03",
+    "/yeh.init_hamzaabove.medi_yeh.fina": "\uFC04",
+    "/beh.init_jeem.fina": "\uFC05",
+    "/beh.init_hah.fina": "\uFC06",
+    "/beh.init_khah.fina": "\uFC07",
+    "/beh.init_meem.fina": "\uFC08",
+    "/beh.init_alefmaksura.fina": "\uFC09",
+    "/beh.init_yeh.fina": "\uFC0A",
+    "/teh.init_jeem.fina": "\uFC0B",
+    "/teh.init_hah.fina": "\uFC0C",
+    "/teh.init_khah.fina": "\uFC0D",
+    "/teh.init_meem.fina": "\uFC0E",
+    "/teh.init_alefmaksura.fina": "\uFC0F",
+    "/teh.init_yeh.fina": "\uFC10",
+    "/theh.init_jeem.fina": "\uFC11",
+    "/theh.init_meem.fina": "\uFC12",
+    "/theh.init_alefmaksura.fina": "\uFC13",
+    "/theh.init_yeh.fina": "\uFC14",
+    "/jeem.init_hah.fina": "\uFC15",
+    "/jeem.init_meem.fina": "\uFC16",
+    "/hah.init_jeem.fina": "\uFC17",
+    "/hah.init_meem.fina": "\uFC18",
+    "/khah.init_jeem.fina": "\uFC19",
+    "/khah.init_hah.fina": "\uFC1A",
+    "/khah.init_meem.fina": "\uFC1B",
+    "/seen.init_jeem.fina": "\uFC1C",
+    "/seen.init_hah.fina": "\uFC1D",
+    "/seen.init_khah.fina": "\uFC1E",
+    "/seen.init_meem.fina": "\uFC1F",
+    "/sad.init_hah.fina": "\uFC20",
+    "/sad.init_meem.fina": "\uFC21",
+    "/dad.init_jeem.fina": "\uFC22",
+    "/dad.init_hah.fina": "\uFC23",
+    "/dad.init_khah.fina": "\uFC24",
+    "/dad.init_meem.fina": "\uFC25",
+    "/tah.init_hah.fina": "\uFC26",
+    "/tah.init_meem.fina": "\uFC27",
+    "/zah.init_meem.fina": "\uFC28",
+    "/ain.init_jeem.fina": "\uFC29",
+    "/ain.init_meem.fina": "\uFC2A",
+    "/ghain.init_jeem.fina": "\uFC2B",
+    "/ghain.init_meem.fina": "\uFC2C",
+    "/feh.init_jeem.fina": "\uFC2D",
+    "/feh.init_hah.fina": "\uFC2E",
+    "/feh.init_khah.fina": "\uFC2F",
+    "/feh.init_meem.fina": "\uFC30",
+    "/feh.init_alefmaksura.fina": "\uFC31",
+    "/feh.init_yeh.fina": "\uFC32",
+    "/qaf.init_hah.fina": "\uFC33",
+    "/qaf.init_meem.fina": "\uFC34",
+    "/qaf.init_alefmaksura.fina": "\uFC35",
+    "/qaf.init_yeh.fina": "\uFC36",
+    "/kaf.init_alef.fina": "\uFC37",
+    "/kaf.init_jeem.fina": "\uFC38",
+    "/kaf.init_hah.fina": "\uFC39",
+    "/kaf.init_khah.fina": "\uFC3A",
+    "/kaf.init_lam.fina": "\uFC3B",
+    "/kaf.init_meem.fina": "\uFC3C",
+    "/kaf.init_alefmaksura.fina": "\uFC3D",
+    "/kaf.init_yeh.fina": "\uFC3E",
+    "/lam.init_jeem.fina": "\uFC3F",
+    "/lam.init_hah.fina": "\uFC40",
+    "/lam.init_khah.fina": "\uFC41",
+    "/lam.init_meem.fina": "\uFC42",
+    "/lam.init_alefmaksura.fina": "\uFC43",
+    "/lam.init_yeh.fina": "\uFC44",
+    "/meem.init_jeem.fina": "\uFC45",
+    "/meem.init_hah.fina": "\uFC46",
+    "/meem.init_khah.fina": "\uFC47",
+    "/meem.init_meem.fina": "\uFC48",
+    "/meem.init_alefmaksura.fina": "\uFC49",
+    "/meem.init_yeh.fina": "\uFC4A",
+    "/noon.init_jeem.fina": "\uFC4B",
+    "/noon.init_hah.fina": "\uFC4C",
+    "/noon.init_khah.fina": "\uFC4D",
+    "/noon.init_meem.fina": "\uFC4E",
+    "/noon.init_alefmaksura.fina": "\uFC4F",
+    "/noon.init_yeh.fina": "\uFC50",
+    "/heh.init_jeem.fina": "\uFC51",
+    "/heh.init_meem.fina": "\uFC52",
+    "/heh.init_alefmaksura.fina": "\uFC53",
+    "/heh.init_yeh.fina": "\uFC54",
+    "/yeh.init_jeem.fina": "\uFC55",
+    "/yeh.init_hah.fina": "\uFC56",
+    "/yeh.init_khah.fina": "\uFC57",
+    "/yeh.init_meem.fina": "\uFC58",
+    "/yeh.init_alefmaksura.fina": "\uFC59",
+    "/yeh.init_yeh.fina": "\uFC5A",
+    "/thal.init_superscriptalef.fina": "\uFC5B",
+    "/reh.init_superscriptalef.fina": "\uFC5C",
+    "/alefmaksura.init_superscriptalef.fina": "\uFC5D",
+    "/shaddaDammatanIsol": "\uFC5E",
+    "/shaddaKasratanIsol": "\uFC5F",
+    "/shaddaFathaIsol": "\uFC60",
+    "/shaddaDammaIsol": "\uFC61",
+    "/shaddaKasraIsol": "\uFC62",
+    "/shaddaAlefIsol": "\uFC63",
+    "/yeh.medi_hamzaabove.medi_reh.fina": "\uFC64",
+    "/yeh.medi_hamzaabove.medi_zain.fina": "\uFC65",
+    "/yeh.medi_hamzaabove.medi_meem.fina": "\uFC66",
+    "/yeh.medi_hamzaabove.medi_noon.fina": "\uFC67",
+    "/yeh.medi_hamzaabove.medi_alefmaksura.fina": "\uFC68",
+    "/yeh.medi_hamzaabove.medi_yeh.fina": "\uFC69",
+    "/beh.medi_reh.fina": "\uFC6A",
+    "/beh.medi_zain.fina": "\uFC6B",
+    "/beh.medi_meem.fina": "\uFC6C",
+    "/beh.medi_noon.fina": "\uFC6D",
+    "/beh.medi_alefmaksura.fina": "\uFC6E",
+    "/beh.medi_yeh.fina": "\uFC6F",
+    "/teh.medi_reh.fina": "\uFC70",
+    "/teh.medi_zain.fina": "\uFC71",
+    "/teh.medi_meem.fina": "\uFC72",
+    "/teh.medi_noon.fina": "\uFC73",
+    "/teh.medi_alefmaksura.fina": "\uFC74",
+    "/teh.medi_yeh.fina": "\uFC75",
+    "/theh.medi_reh.fina": "\uFC76",
+    "/theh.medi_zain.fina": "\uFC77",
+    "/theh.medi_meem.fina": "\uFC78",
+    "/theh.medi_noon.fina": "\uFC79",
+    "/theh.medi_alefmaksura.fina": "\uFC7A",
+    "/theh.medi_yeh.fina": "\uFC7B",
+    "/feh.medi_alefmaksura.fina": "\uFC7C",
+    "/feh.medi_yeh.fina": "\uFC7D",
+    "/qaf.medi_alefmaksura.fina": "\uFC7E",
+    "/qaf.medi_yeh.fina": "\uFC7F",
+    "/kaf.medi_alef.fina": "\uFC80",
+    "/kaf.medi_lam.fina": "\uFC81",
+    "/kaf.medi_meem.fina": "\uFC82",
+    "/kaf.medi_alefmaksura.fina": "\uFC83",
+    "/kaf.medi_yeh.fina": "\uFC84",
+    "/lam.medi_meem.fina": "\uFC85",
+    "/lam.medi_alefmaksura.fina": "\uFC86",
+    "/lam.medi_yeh.fina": "\uFC87",
+    "/meem.medi_alef.fina": "\uFC88",
+    "/meem.medi_meem.fina": "\uFC89",
+    "/noon.medi_reh.fina": "\uFC8A",
+    "/noon.medi_zain.fina": "\uFC8B",
+    "/noon.medi_meem.fina": "\uFC8C",
+    "/noon.medi_noon.fina": "\uFC8D",
+    "/noon.medi_alefmaksura.fina": "\uFC8E",
+    "/noon.medi_yeh.fina": "\uFC8F",
+    "/alefmaksura.medi_superscriptalef.fina": "\uFC90",
+    "/yeh.medi_reh.fina": "\uFC91",
+    "/yeh.medi_zain.fina": "\uFC92",
+    "/yeh.medi_meem.fina": "\uFC93",
+    "/yeh.medi_noon.fina": "\uFC94",
+    "/yeh.medi_alefmaksura.fina": "\uFC95",
+    "/yeh.medi_yeh.fina": "\uFC96",
+    "/yeh.init_hamzaabove.medi_jeem.medi": "\uFC97",
+    "/yeh.init_hamzaabove.medi_hah.medi": "\uFC98",
+    "/yeh.init_hamzaabove.medi_khah.medi": "\uFC99",
+    "/yeh.init_hamzaabove.medi_meem.medi": "\uFC9A",
+    "/yeh.init_hamzaabove.medi_heh.medi": "\uFC9B",
+    "/beh.init_jeem.medi": "\uFC9C",
+    "/beh.init_hah.medi": "\uFC9D",
+    "/beh.init_khah.medi": "\uFC9E",
+    "/beh.init_meem.medi": "\uFC9F",
+    "/beh.init_heh.medi": "\uFCA0",
+    "/teh.init_jeem.medi": "\uFCA1",
+    "/teh.init_hah.medi": "\uFCA2",
+    "/teh.init_khah.medi": "\uFCA3",
+    "/teh.init_meem.medi": "\uFCA4",
+    "/teh.init_heh.medi": "\uFCA5",
+    "/theh.init_meem.medi": "\uFCA6",
+    "/jeem.init_hah.medi": "\uFCA7",
+    "/jeem.init_meem.medi": "\uFCA8",
+    "/hah.init_jeem.medi": "\uFCA9",
+    "/hah.init_meem.medi": "\uFCAA",
+    "/khah.init_jeem.medi": "\uFCAB",
+    "/khah.init_meem.medi": "\uFCAC",
+    "/seen.init_jeem.medi": "\uFCAD",
+    "/seen.init_hah.medi": "\uFCAE",
+    "/seen.init_khah.medi": "\uFCAF",
+    "/seen.init_meem.medi": "\uFCB0",
+    "/sad.init_hah.medi": "\uFCB1",
+    "/sad.init_khah.medi": "\uFCB2",
+    "/sad.init_meem.medi": "\uFCB3",
+    "/dad.init_jeem.medi": "\uFCB4",
+    "/dad.init_hah.medi": "\uFCB5",
+    "/dad.init_khah.medi": "\uFCB6",
+    "/dad.init_meem.medi": "\uFCB7",
+    "/tah.init_hah.medi": "\uFCB8",
+    "/zah.init_meem.medi": "\uFCB9",
+    "/ain.init_jeem.medi": "\uFCBA",
+    "/ain.init_meem.medi": "\uFCBB",
+    "/ghain.init_jeem.medi": "\uFCBC",
+    "/ghain.init_meem.medi": "\uFCBD",
+    "/feh.init_jeem.medi": "\uFCBE",
+    "/feh.init_hah.medi": "\uFCBF",
+    "/feh.init_khah.medi": "\uFCC0",
+    "/feh.init_meem.medi": "\uFCC1",
+    "/qaf.init_hah.medi": "\uFCC2",
+    "/qaf.init_meem.medi": "\uFCC3",
+    "/kaf.init_jeem.medi": "\uFCC4",
+    "/kaf.init_hah.medi": "\uFCC5",
+    "/kaf.init_khah.medi": "\uFCC6",
+    "/kaf.init_lam.medi": "\uFCC7",
+    "/kaf.init_meem.medi": "\uFCC8",
+    "/lam.init_jeem.medi": "\uFCC9",
+    "/lam.init_hah.medi": "\uFCCA",
+    "/lam.init_khah.medi": "\uFCCB",
+    "/lam.init_meem.medi": "\uFCCC",
+    "/lam.init_heh.medi": "\uFCCD",
+    "/meem.init_jeem.medi": "\uFCCE",
+    "/meem.init_hah.medi": "\uFCCF",
+    "/meem.init_khah.medi": "\uFCD0",
+    "/meem.init_meem.medi": "\uFCD1",
+    "/noon.init_jeem.medi": "\uFCD2",
+    "/noon.init_hah.medi": "\uFCD3",
+    "/noon.init_khah.medi": "\uFCD4",
+    "/noon.init_meem.medi": "\uFCD5",
+    "/noon.init_heh.medi": "\uFCD6",
+    "/heh.init_jeem.medi": "\uFCD7",
+    "/heh.init_meem.medi": "\uFCD8",
+    "/heh.init_superscriptalef.medi": "\uFCD9",
+    "/yeh.init_jeem.medi": "\uFCDA",
+    "/yeh.init_hah.medi": "\uFCDB",
+    "/yeh.init_khah.medi": "\uFCDC",
+    "/yeh.init_meem.medi": "\uFCDD",
+    "/yeh.init_heh.medi": "\uFCDE",
+    "/yeh.medi_hamzaabove.medi_meem.medi": "\uFCDF",
+    "/yeh.medi_hamzaabove.medi_heh.medi": "\uFCE0",
+    "/beh.medi_meem.medi": "\uFCE1",
+    "/beh.medi_heh.medi": "\uFCE2",
+    "/teh.medi_meem.medi": "\uFCE3",
+    "/teh.medi_heh.medi": "\uFCE4",
+    "/theh.medi_meem.medi": "\uFCE5",
+    "/theh.medi_heh.medi": "\uFCE6",
+    "/seen.medi_meem.medi": "\uFCE7",
+    "/seen.medi_heh.medi": "\uFCE8",
+    "/sheen.medi_meem.medi": "\uFCE9",
+    "/sheen.medi_heh.medi": "\uFCEA",
+    "/kaf.medi_lam.medi": "\uFCEB",
+    "/kaf.medi_meem.medi": "\uFCEC",
+    "/lam.medi_meem.medi": "\uFCED",
+    "/noon.medi_meem.medi": "\uFCEE",
+    "/noon.medi_heh.medi": "\uFCEF",
+    "/yeh.medi_meem.medi": "\uFCF0",
+    "/yeh.medi_heh.medi": "\uFCF1",
+    "/shaddaFathaMedi": "\uFCF2",
+    "/shaddaDammaMedi": "\uFCF3",
+    "/shaddaKasraMedi": "\uFCF4",
+    "/tah.init_alefmaksura.fina": "\uFCF5",
+    "/tah.init_yeh.fina": "\uFCF6",
+    "/ain.init_alefmaksura.fina": "\uFCF7",
+    "/ain.init_yeh.fina": "\uFCF8",
+    "/ghain.init_alefmaksura.fina": "\uFCF9",
+    "/ghain.init_yeh.fina": "\uFCFA",
+    "/seen.init_alefmaksura.fina": "\uFCFB",
+    "/seen.init_yeh.fina": "\uFCFC",
+    "/sheen.init_alefmaksura.fina": "\uFCFD",
+    "/sheen.init_yeh.fina": "\uFCFE",
+    "/hah.init_alefmaksura.fina": "\uFCFF",
+    "/hah.init_yeh.fina": "\uFD00",
+    "/jeem.init_alefmaksura.fina": "\uFD01",
+    "/jeem.init_yeh.fina": "\uFD02",
+    "/khah.init_alefmaksura.fina": "\uFD03",
+    "/khah.init_yeh.fina": "\uFD04",
+    "/sad.init_alefmaksura.fina": "\uFD05",
+    "/sad.init_yeh.fina": "\uFD06",
+    "/dad.init_alefmaksura.fina": "\uFD07",
+    "/dad.init_yeh.fina": "\uFD08",
+    "/sheen.init_jeem.fina": "\uFD09",
+    "/sheen.init_hah.fina": "\uFD0A",
+    "/sheen.init_khah.fina": "\uFD0B",
+    "/sheen.init_meem.fina": "\uFD0C",
+    "/sheen.init_reh.fina": "\uFD0D",
+    "/seen.init_reh.fina": "\uFD0E",
+    "/sad.init_reh.fina": "\uFD0F",
+    "/dad.init_reh.fina": "\uFD10",
+    "/tah.medi_alefmaksura.fina": "\uFD11",
+    "/tah.medi_yeh.fina": "\uFD12",
+    "/ain.medi_alefmaksura.fina": "\uFD13",
+    "/ain.medi_yeh.fina": "\uFD14",
+    "/ghain.medi_alefmaksura.fina": "\uFD15",
+    "/ghain.medi_yeh.fina": "\uFD16",
+    "/seen.medi_alefmaksura.fina": "\uFD17",
+    "/seen.medi_yeh.fina": "\uFD18",
+    "/sheen.medi_alefmaksura.fina": "\uFD19",
+    "/sheen.medi_yeh.fina": "\uFD1A",
+    "/hah.medi_alefmaksura.fina": "\uFD1B",
+    "/hah.medi_yeh.fina": "\uFD1C",
+    "/jeem.medi_alefmaksura.fina": "\uFD1D",
+    "/jeem.medi_yeh.fina": "\uFD1E",
+    "/khah.medi_alefmaksura.fina": "\uFD1F",
+    "/khah.medi_yeh.fina": "\uFD20",
+    "/sad.medi_alefmaksura.fina": "\uFD21",
+    "/sad.medi_yeh.fina": "\uFD22",
+    "/dad.medi_alefmaksura.fina": "\uFD23",
+    "/dad.medi_yeh.fina": "\uFD24",
+    "/sheen.medi_jeem.fina": "\uFD25",
+    "/sheen.medi_hah.fina": "\uFD26",
+    "/sheen.medi_khah.fina": "\uFD27",
+    "/sheen.medi_meem.fina": "\uFD28",
+    "/sheen.medi_reh.fina": "\uFD29",
+    "/seen.medi_reh.fina": "\uFD2A",
+    "/sad.medi_reh.fina": "\uFD2B",
+    "/dad.medi_reh.fina": "\uFD2C",
+    "/sheen.init_jeem.medi": "\uFD2D",
+    "/sheen.init_hah.medi": "\uFD2E",
+    "/sheen.init_khah.medi": "\uFD2F",
+    "/sheen.init_meem.medi": "\uFD30",
+    "/seen.init_heh.medi": "\uFD31",
+    "/sheen.init_heh.medi": "\uFD32",
+    "/tah.init_meem.medi": "\uFD33",
+    "/seen.medi_jeem.medi": "\uFD34",
+    "/seen.medi_hah.medi": "\uFD35",
+    "/seen.medi_khah.medi": "\uFD36",
+    "/sheen.medi_jeem.medi": "\uFD37",
+    "/sheen.medi_hah.medi": "\uFD38",
+    "/sheen.medi_khah.medi": "\uFD39",
+    "/tah.medi_meem.medi": "\uFD3A",
+    "/zah.medi_meem.medi": "\uFD3B",
+    "/alef.medi_fathatan.fina": "\uFD3C",
+    "/alef.init_fathatan.fina": "\uFD3D",
+    "/ornateleftparenthesis": "\uFD3E",
+    "/ornaterightparenthesis": "\uFD3F",
+    "/RahimahuAllaah": "\uFD40",
+    "/RadiAllaahuAnh": "\uFD41",
+    "/RadiAllaahuAnhaa": "\uFD42",
+    "/RadiAllaahuAnhum": "\uFD43",
+    "/RadiAllaahuAnhumaa": "\uFD44",
+    "/RadiAllaahuAnhunna": "\uFD45",
+    "/SallallaahuAlayhiWaAalih": "\uFD46",
+    "/AlayhiAsSalaam": "\uFD47",
+    "/AlayhimAsSalaam": "\uFD48",
+    "/AlayhimaaAsSalaam": "\uFD49",
+    "/AlayhiAsSalaatuWasSalaam": "\uFD4A",
+    "/QuddisaSirrah": "\uFD4B",
+    "/SallallahuAlayhiWaaaliheeWaSallam": "\uFD4C",
+    "/AlayhaaAsSalaam": "\uFD4D",
+    "/TabaarakaWaTaaalaa": "\uFD4E",
+    "/RahimahumAllaah": "\uFD4F",
+    "/teh.init_jeem.medi_meem.medi": "\uFD50",
+    "/teh.medi_hah.medi_jeem.fina": "\uFD51",
+    "/teh.init_hah.medi_jeem.medi": "\uFD52",
+    "/teh.init_hah.medi_meem.medi": "\uFD53",
+    "/teh.init_khah.medi_meem.medi": "\uFD54",
+    "/teh.init_meem.medi_jeem.medi": "\uFD55",
+    "/teh.init_meem.medi_hah.medi": "\uFD56",
+    "/teh.init_meem.medi_khah.medi": "\uFD57",
+    "/jeem.medi_meem.medi_hah.fina": "\uFD58",
+    "/jeem.init_meem.medi_hah.medi": "\uFD59",
+    "/hah.medi_meem.medi_yeh.fina": "\uFD5A",
+    "/hah.medi_meem.medi_alefmaksura.fina": "\uFD5B",
+    "/seen.init_hah.medi_jeem.medi": "\uFD5C",
+    "/seen.init_jeem.medi_hah.medi": "\uFD5D",
+    "/seen.medi_jeem.medi_alefmaksura.fina": "\uFD5E",
+    "/seen.medi_meem.medi_hah.fina": "\uFD5F",
+    "/seen.init_meem.medi_hah.medi": "\uFD60",
+    "/seen.init_meem.medi_jeem.medi": "\uFD61",
+    "/seen.medi_meem.medi_meem.fina": "\uFD62",
+    "/seen.init_meem.medi_meem.medi": "\uFD63",
+    "/sad.medi_hah.medi_hah.fina": "\uFD64",
+    "/sad.init_hah.medi_hah.medi": "\uFD65",
+    "/sad.medi_meem.medi_meem.fina": "\uFD66",
+    "/sheen.medi_hah.medi_meem.fina": "\uFD67",
+    "/sheen.init_hah.medi_meem.medi": "\uFD68",
+    "/sheen.medi_jeem.medi_yeh.fina": "\uFD69",
+    "/sheen.medi_meem.medi_khah.fina": "\uFD6A",
+    "/sheen.init_meem.medi_khah.medi": "\uFD6B",
+    "/sheen.medi_meem.medi_meem.fina": "\uFD6C",
+    "/sheen.init_meem.medi_meem.medi": "\uFD6D",
+    "/dad.medi_hah.medi_alefmaksura.fina": "\uFD6E",
+    "/dad.medi_khah.medi_meem.fina": "\uFD6F",
+    "/dad.init_khah.medi_meem.medi": "\uFD70",
+    "/tah.medi_meem.medi_hah.fina": "\uFD71",
+    "/tah.init_meem.medi_hah.medi": "\uFD72",
+    "/tah.init_meem.medi_meem.medi": "\uFD73",
+    "/tah.medi_meem.medi_yeh.fina": "\uFD74",
+    "/ain.medi_jeem.medi_meem.fina": "\uFD75",
+    "/ain.medi_meem.medi_meem.fina": "\uFD76",
+    "/ain.init_meem.medi_meem.medi": "\uFD77",
+    "/ain.medi_meem.medi_alefmaksura.fina": "\uFD78",
+    "/ghain.medi_meem.medi_meem.fina": "\uFD79",
+    "/ghain.medi_meem.medi_yeh.fina": "\uFD7A",
+    "/ghain.medi_meem.medi_alefmaksura.fina": "\uFD7B",
+    "/feh.medi_khah.medi_meem.fina": "\uFD7C",
+    "/feh.init_khah.medi_meem.medi": "\uFD7D",
+    "/qaf.medi_meem.medi_hah.fina": "\uFD7E",
+    "/qaf.medi_meem.medi_meem.fina": "\uFD7F",
+    "/lam.medi_hah.medi_meem.fina": "\uFD80",
+    "/lam.medi_hah.medi_yeh.fina": "\uFD81",
+    "/lam.medi_hah.medi_alefmaksura.fina": "\uFD82",
+    "/lam.init_jeem.medi_jeem.medi": "\uFD83",
+    "/lam.medi_jeem.medi_jeem.fina": "\uFD84",
+    "/lam.medi_khah.medi_meem.fina": "\uFD85",
+    "/lam.init_khah.medi_meem.medi": "\uFD86",
+    "/lam.medi_meem.medi_hah.fina": "\uFD87",
+    "/lam.init_meem.medi_hah.medi": "\uFD88",
+    "/meem.init_hah.medi_jeem.medi": "\uFD89",
+    "/meem.init_hah.medi_meem.medi": "\uFD8A",
+    "/meem.medi_hah.medi_yeh.fina": "\uFD8B",
+    "/meem.init_jeem.medi_hah.medi": "\uFD8C",
+    "/meem.init_jeem.medi_meem.medi": "\uFD8D",
+    "/meem.init_khah.medi_jeem.medi": "\uFD8E",
+    "/meem.init_khah.medi_meem.medi": "\uFD8F",
+    "/meem.init_jeem.medi_khah.medi": "\uFD92",
+    "/heh.init_meem.medi_jeem.medi": "\uFD93",
+    "/heh.init_meem.medi_meem.medi": "\uFD94",
+    "/noon.init_hah.medi_meem.medi": "\uFD95",
+    "/noon.medi_hah.medi_alefmaksura.fina": "\uFD96",
+    "/noon.medi_jeem.medi_meem.fina": "\uFD97",
+    "/noon.init_jeem.medi_meem.medi": "\uFD98",
+    "/noon.medi_jeem.medi_alefmaksura.fina": "\uFD99",
+    "/noon.medi_meem.medi_yeh.fina": "\uFD9A",
+    "/noon.medi_meem.medi_alefmaksura.fina": "\uFD9B",
+    "/yeh.medi_meem.medi_meem.fina": "\uFD9C",
+    "/yeh.init_meem.medi_meem.medi": "\uFD9D",
+    "/beh.medi_khah.medi_yeh.fina": "\uFD9E",
+    "/teh.medi_jeem.medi_yeh.fina": "\uFD9F",
+    "/teh.medi_jeem.medi_alefmaksura.fina": "\uFDA0",
+    "/teh.medi_khah.medi_yeh.fina": "\uFDA1",
+    "/teh.medi_khah.medi_alefmaksura.fina": "\uFDA2",
+    "/teh.medi_meem.medi_yeh.fina": "\uFDA3",
+    "/teh.medi_meem.medi_alefmaksura.fina": "\uFDA4",
+    "/jeem.medi_meem.medi_yeh.fina": "\uFDA5",
+    "/jeem.medi_hah.medi_alefmaksura.fina": "\uFDA6",
+    "/jeem.medi_meem.medi_alefmaksura.fina": "\uFDA7",
+    "/seen.medi_khah.medi_alefmaksura.fina": "\uFDA8",
+    "/sad.medi_hah.medi_yeh.fina": "\uFDA9",
+    "/sheen.medi_hah.medi_yeh.fina": "\uFDAA",
+    "/dad.medi_hah.medi_yeh.fina": "\uFDAB",
+    "/lam.medi_jeem.medi_yeh.fina": "\uFDAC",
+    "/lam.medi_meem.medi_yeh.fina": "\uFDAD",
+    "/yeh.medi_hah.medi_yeh.fina": "\uFDAE",
+    "/yeh.medi_jeem.medi_yeh.fina": "\uFDAF",
+    "/yeh.medi_meem.medi_yeh.fina": "\uFDB0",
+    "/meem.medi_meem.medi_yeh.fina": "\uFDB1",
+    "/qaf.medi_meem.medi_yeh.fina": "\uFDB2",
+    "/noon.medi_hah.medi_yeh.fina": "\uFDB3",
+    "/qaf.init_meem.medi_hah.medi": "\uFDB4",
+    "/lam.init_hah.medi_meem.medi": "\uFDB5",
+    "/ain.medi_meem.medi_yeh.fina": "\uFDB6",
+    "/kaf.medi_meem.medi_yeh.fina": "\uFDB7",
+    "/noon.init_jeem.medi_hah.medi": "\uFDB8",
+    "/meem.medi_khah.medi_yeh.fina": "\uFDB9",
+    "/lam.init_jeem.medi_meem.medi": "\uFDBA",
+    "/kaf.medi_meem.medi_meem.fina": "\uFDBB",
+    "/lam.medi_jeem.medi_meem.fina": "\uFDBC",
+    "/noon.medi_jeem.medi_hah.fina": "\uFDBD",
+    "/jeem.medi_hah.medi_yeh.fina": "\uFDBE",
+    "/hah.medi_jeem.medi_yeh.fina": "\uFDBF",
+    "/meem.medi_jeem.medi_yeh.fina": "\uFDC0",
+    "/feh.medi_meem.medi_yeh.fina": "\uFDC1",
+    "/beh.medi_hah.medi_yeh.fina": "\uFDC2",
+    "/kaf.init_meem.medi_meem.medi": "\uFDC3",
+    "/ain.init_jeem.medi_meem.medi": "\uFDC4",
+    "/sad.init_meem.medi_meem.medi": "\uFDC5",
+    "/seen.medi_khah.medi_yeh.fina": "\uFDC6",
+    "/noon.medi_jeem.medi_yeh.fina": "\uFDC7",
+    "/SalaamuhuAlaynaa": "\uFDCF",
+    "/SallaUsedAsKoranicStopSign": "\uFDF0",
+    "/QalaUsedAsKoranicStopSign": "\uFDF1",
+    "/Allah": "\uFDF2",
+    "/Akbar": "\uFDF3",
+    "/Mohammad": "\uFDF4",
+    "/Salam": "\uFDF5",
+    "/Rasoul": "\uFDF6",
+    "/Alayhe": "\uFDF7",
+    "/Wasallam": "\uFDF8",
+    "/Salla": "\uFDF9",
+    "/SallallahouAlayheWasallam": "\uFDFA",
+    "/Jallajalalouhou": "\uFDFB",
+    "/rial": "\uFDFC",
+    "/BismillahArRahmanArRaheem": "\uFDFD",
+    "/SubhaanahuWaTaaalaa": "\uFDFE",
+    "/AzzaWaJall": "\uFDFF",
+    "/vert:comma": "\uFE10",
+    "/vert:ideographiccomma": "\uFE11",
+    "/vert:ideographicfullstop": "\uFE12",
+    "/vert:colon": "\uFE13",
+    "/vert:semicolon": "\uFE14",
+    "/vert:exclam": "\uFE15",
+    "/vert:question": "\uFE16",
+    "/vert:bracketwhiteleft": "\uFE17",
+    "/vert:brakcetwhiteright": "\uFE18",
+    "/vert:ellipsishor": "\uFE19",
+    "/underscorewavyvertical": "\uFE34",
+    "/sesamedot": "\uFE45",
+    "/whitesesamedot": "\uFE46",
+    "/squarebracketleftvertical": "\uFE47",
+    "/squarebracketrightvertical": "\uFE48",
+    "/underscoredashed": "\uFE4D",
+    "/underscorecenterline": "\uFE4E",
+    "/ideographiccommasmall": "\uFE51",
+    "/emdashsmall": "\uFE58",
+    "/parenthesisleftsmall": "\uFE59",
+    "/parenthesisrightsmall": "\uFE5A",
+    "/backslashsmall": "\uFE68",
+    "/commercialatsmall": "\uFE6B",
+    "/fathatanIsol": "\uFE70",
+    "/tatweelFathatanAbove": "\uFE71",
+    "/dammatanIsol": "\uFE72",
+    "/kashidaFina": "\uFE73",
+    "/kasratanIsol": "\uFE74",
+    "/fathaIsol": "\uFE76",
+    "/fathaMedi": "\uFE77",
+    "/dammaIsol": "\uFE78",
+    "/dammaMedi": "\uFE79",
+    "/kasraIsol": "\uFE7A",
+    "/kasraMedi": "\uFE7B",
+    "/shaddaIsol": "\uFE7C",
+    "/shaddaMedi": "\uFE7D",
+    "/sukunIsol": "\uFE7E",
+    "/sukunMedi": "\uFE7F",
+    "/hamzaIsol": "\uFE80",
+    "/alefmadda.isol": "\uFE81",
+    "/alefmadda.fina": "\uFE82",
+    "/alefhamza.isol": "\uFE83",
+    "/alefhamza.fina": "\uFE84",
+    "/wawhamza.isol": "\uFE85",
+    "/wawhamza.fina": "\uFE86",
+    "/alefhamzabelow.isol": "\uFE87",
+    "/alefhamzabelow.fina": "\uFE88",
+    "/yehhamza.isol": "\uFE89",
+    "/yehhamza.fina": "\uFE8A",
+    "/yehhamza.init": "\uFE8B",
+    "/yehhamza.medi": "\uFE8C",
+    "/alef.isol": "\uFE8D",
+    "/alef.fina": "\uFE8E",
+    "/beh.isol": "\uFE8F",
+    "/beh.fina": "\uFE90",
+    "/beh.init": "\uFE91",
+    "/beh.medi": "\uFE92",
+    "/tehmarbuta.isol": "\uFE93",
+    "/tehmarbuta.fina": "\uFE94",
+    "/teh.isol": "\uFE95",
+    "/teh.fina": "\uFE96",
+    "/teh.init": "\uFE97",
+    "/teh.medi": "\uFE98",
+    "/theh.isol": "\uFE99",
+    "/theh.fina": "\uFE9A",
+    "/theh.init": "\uFE9B",
+    "/theh.medi": "\uFE9C",
+    "/jeem.isol": "\uFE9D",
+    "/jeem.fina": "\uFE9E",
+    "/jeem.init": "\uFE9F",
+    "/jeem.medi": "\uFEA0",
+    "/hah.isol": "\uFEA1",
+    "/hah.fina": "\uFEA2",
+    "/hah.init": "\uFEA3",
+    "/hah.medi": "\uFEA4",
+    "/khah.isol": "\uFEA5",
+    "/khah.fina": "\uFEA6",
+    "/khah.init": "\uFEA7",
+    "/khah.medi": "\uFEA8",
+    "/dal.isol": "\uFEA9",
+    "/dal.fina": "\uFEAA",
+    "/thal.isol": "\uFEAB",
+    "/thal.fina": "\uFEAC",
+    "/reh.isol": "\uFEAD",
+    "/reh.fina": "\uFEAE",
+    "/zain.isol": "\uFEAF",
+    "/zain.fina": "\uFEB0",
+    "/seen.isol": "\uFEB1",
+    "/seen.fina": "\uFEB2",
+    "/seen.init": "\uFEB3",
+    "/seen.medi": "\uFEB4",
+    "/sheen.isol": "\uFEB5",
+    "/sheen.fina": "\uFEB6",
+    "/sheen.init": "\uFEB7",
+    "/sheen.medi": "\uFEB8",
+    "/sad.isol": "\uFEB9",
+    "/sad.fina": "\uFEBA",
+    "/sad.init": "\uFEBB",
+    "/sad.medi": "\uFEBC",
+    "/dad.isol": "\uFEBD",
+    "/dad.fina": "\uFEBE",
+    "/dad.init": "\uFEBF",
+    "/dad.medi": "\uFEC0",
+    "/tah.isol": "\uFEC1",
+    "/tah.fina": "\uFEC2",
+    "/tah.init": "\uFEC3",
+    "/tah.medi": "\uFEC4",
+    "/zah.isol": "\uFEC5",
+    "/zah.fina": "\uFEC6",
+    "/zah.init": "\uFEC7",
+    "/zah.medi": "\uFEC8",
+    "/ain.isol": "\uFEC9",
+    "/ain.fina": "\uFECA",
+    "/ain.init": "\uFECB",
+    "/ain.medi": "\uFECC",
+    "/ghain.isol": "\uFECD",
+    "/ghain.fina": "\uFECE",
+    "/ghain.init": "\uFECF",
+    "/ghain.medi": "\uFED0",
+    "/feh.isol": "\uFED1",
+    "/feh.fina": "\uFED2",
+    "/feh.init": "\uFED3",
+    "/feh.medi": "\uFED4",
+    "/qaf.isol": "\uFED5",
+    "/qaf.fina": "\uFED6",
+    "/qaf.init": "\uFED7",
+    "/qaf.medi": "\uFED8",
+    "/kaf.isol": "\uFED9",
+    "/kaf.fina": "\uFEDA",
+    "/kaf.init": "\uFEDB",
+    "/kaf.medi": "\uFEDC",
+    "/lam.isol": "\uFEDD",
+    "/lam.fina": "\uFEDE",
+    "/lam.init": "\uFEDF",
+    "/lam.medi": "\uFEE0",
+    "/meem.isol": "\uFEE1",
+    "/meem.fina": "\uFEE2",
+    "/meem.init": "\uFEE3",
+    "/meem.medi": "\uFEE4",
+    "/noon.isol": "\uFEE5",
+    "/noon.fina": "\uFEE6",
+    "/noon.init": "\uFEE7",
+    "/noon.medi": "\uFEE8",
+    "/heh.isol": "\uFEE9",
+    "/heh.fina": "\uFEEA",
+    "/heh.init": "\uFEEB",
+    "/heh.medi": "\uFEEC",
+    "/waw.isol": "\uFEED",
+    "/waw.fina": "\uFEEE",
+    "/alefmaksura.isol": "\uFEEF",
+    "/alefmaksura.fina": "\uFEF0",
+    "/yeh.isol": "\uFEF1",
+    "/yeh.fina": "\uFEF2",
+    "/yeh.init": "\uFEF3",
+    "/yeh.medi": "\uFEF4",
+    "/lam.init_alef.medi_maddaabove.fina": "\uFEF5",
+    "/lam.medi_alef.medi_maddaabove.fina": "\uFEF6",
+    "/lam.init_alef.medi_hamzaabove.fina": "\uFEF7",
+    "/lam.medi_alef.medi_hamzaabove.fina": "\uFEF8",
+    "/lam.init_alef.medi_hamzabelow.fina": "\uFEF9",
+    "/lam.medi_alef.medi_hamzabelow.fina": "\uFEFA",
+    "/lam.init_alef.fina": "\uFEFB",
+    "/lam.medi_alef.fina": "\uFEFC",
+    "/zerowidthnobreakspace": "\uFEFF",
+    "/fwd:exclam": "\uFF01",
+    "/fwd:quotedbl": "\uFF02",
+    "/fwd:numbersign": "\uFF03",
+    "/fwd:dollar": "\uFF04",
+    "/fwd:percent": "\uFF05",
+    "/fwd:ampersand": "\uFF06",
+    "/fwd:quotesingle": "\uFF07",
+    "/fwd:parenthesisleft": "\uFF08",
+    "/fwd:parenthesisright": "\uFF09",
+    "/fwd:asterisk": "\uFF0A",
+    "/fwd:plus": "\uFF0B",
+    "/fwd:comma": "\uFF0C",
+    "/fwd:hyphen": "\uFF0D",
+    "/fwd:period": "\uFF0E",
+    "/fwd:slash": "\uFF0F",
+    "/fwd:zero": "\uFF10",
+    "/fwd:one": "\uFF11",
+    "/fwd:two": "\uFF12",
+    "/fwd:three": "\uFF13",
+    "/fwd:four": "\uFF14",
+    "/fwd:five": "\uFF15",
+    "/fwd:six": "\uFF16",
+    "/fwd:seven": "\uFF17",
+    "/fwd:eight": "\uFF18",
+    "/fwd:nine": "\uFF19",
+    "/fwd:colon": "\uFF1A",
+    "/fwd:semicolon": "\uFF1B",
+    "/fwd:less": "\uFF1C",
+    "/fwd:equal": "\uFF1D",
+    "/fwd:greater": "\uFF1E",
+    "/fwd:question": "\uFF1F",
+    "/fwd:at": "\uFF20",
+    "/fwd:A": "\uFF21",
+    "/fwd:B": "\uFF22",
+    "/fwd:C": "\uFF23",
+    "/fwd:D": "\uFF24",
+    "/fwd:E": "\uFF25",
+    "/fwd:F": "\uFF26",
+    "/fwd:G": "\uFF27",
+    "/fwd:H": "\uFF28",
+    "/fwd:I": "\uFF29",
+    "/fwd:J": "\uFF2A",
+    "/fwd:K": "\uFF2B",
+    "/fwd:L": "\uFF2C",
+    "/fwd:M": "\uFF2D",
+    "/fwd:N": "\uFF2E",
+    "/fwd:O": "\uFF2F",
+    "/fwd:P": "\uFF30",
+    "/fwd:Q": "\uFF31",
+    "/fwd:R": "\uFF32",
+    "/fwd:S": "\uFF33",
+    "/fwd:T": "\uFF34",
+    "/fwd:U": "\uFF35",
+    "/fwd:V": "\uFF36",
+    "/fwd:W": "\uFF37",
+    "/fwd:X": "\uFF38",
+    "/fwd:Y": "\uFF39",
+    "/fwd:Z": "\uFF3A",
+    "/fwd:bracketleft": "\uFF3B",
+    "/fwd:backslash": "\uFF3C",
+    "/fwd:bracketright": "\uFF3D",
+    "/fwd:asciicircum": "\uFF3E",
+    "/fwd:underscore": "\uFF3F",
+    "/fwd:grave": "\uFF40",
+    "/fwd:a": "\uFF41",
+    "/fwd:b": "\uFF42",
+    "/fwd:c": "\uFF43",
+    "/fwd:d": "\uFF44",
+    "/fwd:e": "\uFF45",
+    "/fwd:f": "\uFF46",
+    "/fwd:g": "\uFF47",
+    "/fwd:h": "\uFF48",
+    "/fwd:i": "\uFF49",
+    "/fwd:j": "\uFF4A",
+    "/fwd:k": "\uFF4B",
+    "/fwd:l": "\uFF4C",
+    "/fwd:m": "\uFF4D",
+    "/fwd:n": "\uFF4E",
+    "/fwd:o": "\uFF4F",
+    "/fwd:p": "\uFF50",
+    "/fwd:q": "\uFF51",
+    "/fwd:r": "\uFF52",
+    "/fwd:s": "\uFF53",
+    "/fwd:t": "\uFF54",
+    "/fwd:u": "\uFF55",
+    "/fwd:v": "\uFF56",
+    "/fwd:w": "\uFF57",
+    "/fwd:x": "\uFF58",
+    "/fwd:y": "\uFF59",
+    "/fwd:z": "\uFF5A",
+    "/fwd:braceleft": "\uFF5B",
+    "/fwd:bar": "\uFF5C",
+    "/fwd:braceright": "\uFF5D",
+    "/fwd:asciitilde": "\uFF5E",
+    "/fwd:leftwhiteparenthesis": "\uFF5F",
+    "/fwd:rightwhiteparenthesis": "\uFF60",
+    "/hwd:ideographicfullstop": "\uFF61",
+    "/hwd:leftcornerbracket": "\uFF62",
+    "/hwd:rightcornerbracket": "\uFF63",
+    "/hwd:ideographiccomma": "\uFF64",
+    "/hwd:kata:middledot": "\uFF65",
+    "/hwd:kata:wo": "\uFF66",
+    "/hwd:kata:asmall": "\uFF67",
+    "/hwd:kata:ismall": "\uFF68",
+    "/hwd:kata:usmall": "\uFF69",
+    "/hwd:kata:esmall": "\uFF6A",
+    "/hwd:kata:osmall": "\uFF6B",
+    "/hwd:kata:yasmall": "\uFF6C",
+    "/hwd:kata:yusmall": "\uFF6D",
+    "/hwd:kata:yosmall": "\uFF6E",
+    "/hwd:kata:tusmall": "\uFF6F",
+    "/hwd:kata:prolongedkana": "\uFF70",
+    "/hwd:kata:a": "\uFF71",
+    "/hwd:kata:i": "\uFF72",
+    "/hwd:kata:u": "\uFF73",
+    "/hwd:kata:e": "\uFF74",
+    "/hwd:kata:o": "\uFF75",
+    "/hwd:kata:ka": "\uFF76",
+    "/hwd:kata:ki": "\uFF77",
+    "/hwd:kata:ku": "\uFF78",
+    "/hwd:kata:ke": "\uFF79",
+    "/hwd:kata:ko": "\uFF7A",
+    "/hwd:kata:sa": "\uFF7B",
+    "/hwd:kata:si": "\uFF7C",
+    "/hwd:kata:su": "\uFF7D",
+    "/hwd:kata:se": "\uFF7E",
+    "/hwd:kata:so": "\uFF7F",
+    "/hwd:kata:ta": "\uFF80",
+    "/hwd:kata:ti": "\uFF81",
+    "/hwd:kata:tu": "\uFF82",
+    "/hwd:kata:te": "\uFF83",
+    "/hwd:kata:to": "\uFF84",
+    "/hwd:kata:na": "\uFF85",
+    "/hwd:kata:ni": "\uFF86",
+    "/hwd:kata:nu": "\uFF87",
+    "/hwd:kata:ne": "\uFF88",
+    "/hwd:kata:no": "\uFF89",
+    "/hwd:kata:ha": "\uFF8A",
+    "/hwd:kata:hi": "\uFF8B",
+    "/hwd:kata:hu": "\uFF8C",
+    "/hwd:kata:he": "\uFF8D",
+    "/hwd:kata:ho": "\uFF8E",
+    "/hwd:kata:ma": "\uFF8F",
+    "/hwd:kata:mi": "\uFF90",
+    "/hwd:kata:mu": "\uFF91",
+    "/hwd:kata:me": "\uFF92",
+    "/hwd:kata:mo": "\uFF93",
+    "/hwd:kata:ya": "\uFF94",
+    "/hwd:kata:yu": "\uFF95",
+    "/hwd:kata:yo": "\uFF96",
+    "/hwd:kata:ra": "\uFF97",
+    "/hwd:kata:ri": "\uFF98",
+    "/hwd:kata:ru": "\uFF99",
+    "/hwd:kata:re": "\uFF9A",
+    "/hwd:kata:ro": "\uFF9B",
+    "/hwd:kata:wa": "\uFF9C",
+    "/hwd:kata:n": "\uFF9D",
+    "/hwd:kata:voiced": "\uFF9E",
+    "/hwd:kata:semi-voiced": "\uFF9F",
+    "/hwd:hangulfiller": "\uFFA0",
+    "/hwd:kiyeok": "\uFFA1",
+    "/hwd:ssangkiyeok": "\uFFA2",
+    "/hwd:kiyeoksios": "\uFFA3",
+    "/hwd:nieun": "\uFFA4",
+    "/hwd:nieuncieuc": "\uFFA5",
+    "/hwd:nieunhieuh": "\uFFA6",
+    "/hwd:tikeut": "\uFFA7",
+    "/hwd:ssangtikeut": "\uFFA8",
+    "/hwd:rieul": "\uFFA9",
+    "/hwd:rieulkiyeok": "\uFFAA",
+    "/hwd:rieulmieum": "\uFFAB",
+    "/hwd:rieulpieup": "\uFFAC",
+    "/hwd:rieulsios": "\uFFAD",
+    "/hwd:rieulthieuth": "\uFFAE",
+    "/hwd:rieulphieuph": "\uFFAF",
+    "/hwd:rieulhieuh": "\uFFB0",
+    "/hwd:mieum": "\uFFB1",
+    "/hwd:pieup": "\uFFB2",
+    "/hwd:ssangpieup": "\uFFB3",
+    "/hwd:pieupsios": "\uFFB4",
+    "/hwd:sios": "\uFFB5",
+    "/hwd:ssangsios": "\uFFB6",
+    "/hwd:ieung": "\uFFB7",
+    "/hwd:cieuc": "\uFFB8",
+    "/hwd:ssangcieuc": "\uFFB9",
+    "/hwd:chieuch": "\uFFBA",
+    "/hwd:khieukh": "\uFFBB",
+    "/hwd:thieuth": "\uFFBC",
+    "/hwd:phieuph": "\uFFBD",
+    "/hwd:hieuh": "\uFFBE",
+    "/hwd:a": "\uFFC2",
+    "/hwd:ae": "\uFFC3",
+    "/hwd:ya": "\uFFC4",
+    "/hwd:yae": "\uFFC5",
+    "/hwd:eo": "\uFFC6",
+    "/hwd:e": "\uFFC7",
+    "/hwd:yeo": "\uFFCA",
+    "/hwd:ye": "\uFFCB",
+    "/hwd:o": "\uFFCC",
+    "/hwd:wa": "\uFFCD",
+    "/hwd:wae": "\uFFCE",
+    "/hwd:oe": "\uFFCF",
+    "/hwd:yo": "\uFFD2",
+    "/hwd:u": "\uFFD3",
+    "/hwd:weo": "\uFFD4",
+    "/hwd:we": "\uFFD5",
+    "/hwd:wi": "\uFFD6",
+    "/hwd:yu": "\uFFD7",
+    "/hwd:eu": "\uFFDA",
+    "/hwd:yi": "\uFFDB",
+    "/hwd:i": "\uFFDC",
+    "/fwd:centsign": "\uFFE0",
+    "/fwd:poundsign": "\uFFE1",
+    "/fwd:notsign": "\uFFE2",
+    "/fwd:macron": "\uFFE3",
+    "/fwd:brokenbar": "\uFFE4",
+    "/fwd:yensign": "\uFFE5",
+    "/fwd:wonsign": "\uFFE6",
+    "/hwd:formslightvertical": "\uFFE8",
+    "/hwd:leftwardsarrow": "\uFFE9",
+    "/hwd:upwardsarrow": "\uFFEA",
+    "/hwd:rightwardsarrow": "\uFFEB",
+    "/hwd:downwardsarrow": "\uFFEC",
+    "/hwd:blacksquare": "\uFFED",
+    "/hwd:whitecircle": "\uFFEE",
+    "/interlinearanchor": "\uFFF9",
+    "/interlinearseparator": "\uFFFA",
+    "/interlinearterminator": "\uFFFB",
+    "/replacementcharobj": "\uFFFC",
+    "/replacementchar": "\uFFFD",
+    "/modifierAasmall": "\U00010780",
+    "/modifierLetterSuperscriptTriangularColon": "\U00010781",
+    "/modifierLetterSuperscriptHalfTriangularColon": "\U00010782",
+    "/aemod": "\U00010783",
+    "/modifierBsmall": "\U00010784",
+    "/bWithHookmod": "\U00010785",
+    "/dzDigraphmod": "\U00010787",
+    "/dzDigraphWithRetroflexHookmod": "\U00010788",
+    "/dzDigraphWithCurlmod": "\U00010789",
+    "/dezhDigraphmod": "\U0001078A",
+    "/dWithTailmod": "\U0001078B",
+    "/dWithHookmod": "\U0001078C",
+    "/dWithHookAndTailmod": "\U0001078D",
+    "/reversedEmod": "\U0001078E",
+    "/closedReversedOpenEmod": "\U0001078F",
+    "/fengDigraphmod": "\U00010790",
+    "/ramsHornmod": "\U00010791",
+    "/modifierGsmall": "\U00010792",
+    "/gWithHookmod": "\U00010793",
+    "/modifierGWithHooksmall": "\U00010794",
+    "/hWithStrokemod": "\U00010795",
+    "/modifierHsmall": "\U00010796",
+    "/hengWithHookmod": "\U00010797",
+    "/dotlessJWithStrokeAndHookmod": "\U00010798",
+    "/lsDigraphmod": "\U00010799",
+    "/lzDigraphmod": "\U0001079A",
+    "/lWithBeltmod": "\U0001079B",
+    "/modifierLWithBeltsmall": "\U0001079C",
+    "/lWithRetroflexHookAndBeltmod": "\U0001079D",
+    "/lezhmod": "\U0001079E",
+    "/lezhWithRetroflexHookmod": "\U0001079F",
+    "/turnedYmod": "\U000107A0",
+    "/turnedYWithBeltmod": "\U000107A1",
+    "/oWithStrokemod": "\U000107A2",
+    "/modifierOesmall": "\U000107A3",
+    "/closedOmegamod": "\U000107A4",
+    "/qmod": "\U000107A5",
+    "/turnedRWithLongLegmod": "\U000107A6",
+    "/turnedRWithLongLegAndRetroflexHookmod": "\U000107A7",
+    "/rWithTailmod": "\U000107A8",
+    "/rWithFishhookmod": "\U000107A9",
+    "/modifierRsmall": "\U000107AA",
+    "/tcDigraphWithCurlmod": "\U000107AB",
+    "/tsDigraphmod": "\U000107AC",
+    "/tsDigraphWithRetroflexHookmod": "\U000107AD",
+    "/teshDigraphmod": "\U000107AE",
+    "/tWithRetroflexHookmod": "\U000107AF",
+    "/vWithRightHookmod": "\U000107B0",
+    "/modifierYsmall": "\U000107B2",
+    "/modifierLetterGlottalStopWithStroke": "\U000107B3",
+    "/modifierLetterReversedGlottalStopWithStroke": "\U000107B4",
+    "/modifierLetterBilabialClick": "\U000107B5",
+    "/modifierLetterDentalClick": "\U000107B6",
+    "/modifierLetterLateralClick": "\U000107B7",
+    "/modifierLetterAlveolarClick": "\U000107B8",
+    "/modifierLetterRetroflexClickWithRetroflexHook": "\U000107B9",
+    "/sWithCurlmod": "\U000107BA",
+    "/zanb:a": "\U00011A00",
+    "/zanb:vowelsigni": "\U00011A01",
+    "/zanb:vowelsignue": "\U00011A02",
+    "/zanb:vowelsignu": "\U00011A03",
+    "/zanb:vowelsigne": "\U00011A04",
+    "/zanb:vowelsignoe": "\U00011A05",
+    "/zanb:vowelsigno": "\U00011A06",
+    "/zanb:vowelsignai": "\U00011A07",
+    "/zanb:vowelsignau": "\U00011A08",
+    "/zanb:vowelsignreversedi": "\U00011A09",
+    "/zanb:vowellengthmark": "\U00011A0A",
+    "/zanb:ka": "\U00011A0B",
+    "/zanb:kha": "\U00011A0C",
+    "/zanb:ga": "\U00011A0D",
+    "/zanb:gha": "\U00011A0E",
+    "/zanb:nga": "\U00011A0F",
+    "/zanb:ca": "\U00011A10",
+    "/zanb:cha": "\U00011A11",
+    "/zanb:ja": "\U00011A12",
+    "/zanb:nya": "\U00011A13",
+    "/zanb:tta": "\U00011A14",
+    "/zanb:ttha": "\U00011A15",
+    "/zanb:dda": "\U00011A16",
+    "/zanb:ddha": "\U00011A17",
+    "/zanb:nna": "\U00011A18",
+    "/zanb:ta": "\U00011A19",
+    "/zanb:tha": "\U00011A1A",
+    "/zanb:da": "\U00011A1B",
+    "/zanb:dha": "\U00011A1C",
+    "/zanb:na": "\U00011A1D",
+    "/zanb:pa": "\U00011A1E",
+    "/zanb:pha": "\U00011A1F",
+    "/zanb:ba": "\U00011A20",
+    "/zanb:bha": "\U00011A21",
+    "/zanb:ma": "\U00011A22",
+    "/zanb:tsa": "\U00011A23",
+    "/zanb:tsha": "\U00011A24",
+    "/zanb:dza": "\U00011A25",
+    "/zanb:dzha": "\U00011A26",
+    "/zanb:zha": "\U00011A27",
+    "/zanb:za": "\U00011A28",
+    "/zanb:dashA": "\U00011A29",
+    "/zanb:ya": "\U00011A2A",
+    "/zanb:ra": "\U00011A2B",
+    "/zanb:la": "\U00011A2C",
+    "/zanb:va": "\U00011A2D",
+    "/zanb:sha": "\U00011A2E",
+    "/zanb:ssa": "\U00011A2F",
+    "/zanb:sa": "\U00011A30",
+    "/zanb:ha": "\U00011A31",
+    "/zanb:kssa": "\U00011A32",
+    "/zanb:finalconsonantmark": "\U00011A33",
+    "/zanb:signvirama": "\U00011A34",
+    "/zanb:signcandrabindu": "\U00011A35",
+    "/zanb:signcandrabinduwithornament": "\U00011A36",
+    "/zanb:signcandrawithornament": "\U00011A37",
+    "/zanb:signanusvara": "\U00011A38",
+    "/zanb:signvisarga": "\U00011A39",
+    "/zanb:raclusterinit": "\U00011A3A",
+    "/zanb:yaclusterfina": "\U00011A3B",
+    "/zanb:raclusterfina": "\U00011A3C",
+    "/zanb:laclusterfina": "\U00011A3D",
+    "/zanb:vaclusterfina": "\U00011A3E",
+    "/zanb:initialheadmark": "\U00011A3F",
+    "/zanb:closingheadmark": "\U00011A40",
+    "/zanb:marktsheg": "\U00011A41",
+    "/zanb:markshad": "\U00011A42",
+    "/zanb:markdoubleshad": "\U00011A43",
+    "/zanb:marklongtsheg": "\U00011A44",
+    "/zanb:initialheadmarkdbllined": "\U00011A45",
+    "/zanb:closingheadmarkdbllined": "\U00011A46",
+    "/zanb:subjoiner": "\U00011A47",
+    "/soyo:a": "\U00011A50",
+    "/soyo:iVowelSign": "\U00011A51",
+    "/soyo:ueVowelSign": "\U00011A52",
+    "/soyo:uVowelSign": "\U00011A53",
+    "/soyo:eVowelSign": "\U00011A54",
+    "/soyo:oVowelSign": "\U00011A55",
+    "/soyo:oeVowelSign": "\U00011A56",
+    "/soyo:aiVowelSign": "\U00011A57",
+    "/soyo:auVowelSign": "\U00011A58",
+    "/soyo:vocalicRVowelSign": "\U00011A59",
+    "/soyo:vocalicLVowelSign": "\U00011A5A",
+    "/soyo:vowelLengthMark": "\U00011A5B",
+    "/soyo:ka": "\U00011A5C",
+    "/soyo:kha": "\U00011A5D",
+    "/soyo:ga": "\U00011A5E",
+    "/soyo:gha": "\U00011A5F",
+    "/soyo:nga": "\U00011A60",
+    "/soyo:ca": "\U00011A61",
+    "/soyo:cha": "\U00011A62",
+    "/soyo:ja": "\U00011A63",
+    "/soyo:jha": "\U00011A64",
+    "/soyo:nya": "\U00011A65",
+    "/soyo:tta": "\U00011A66",
+    "/soyo:ttha": "\U00011A67",
+    "/soyo:dda": "\U00011A68",
+    "/soyo:ddha": "\U00011A69",
+    "/soyo:nna": "\U00011A6A",
+    "/soyo:ta": "\U00011A6B",
+    "/soyo:tha": "\U00011A6C",
+    "/soyo:da": "\U00011A6D",
+    "/soyo:dha": "\U00011A6E",
+    "/soyo:na": "\U00011A6F",
+    "/soyo:pa": "\U00011A70",
+    "/soyo:pha": "\U00011A71",
+    "/soyo:ba": "\U00011A72",
+    "/soyo:bha": "\U00011A73",
+    "/soyo:ma": "\U00011A74",
+    "/soyo:tsa": "\U00011A75",
+    "/soyo:tsha": "\U00011A76",
+    "/soyo:dza": "\U00011A77",
+    "/soyo:zha": "\U00011A78",
+    "/soyo:za": "\U00011A79",
+    "/soyo:-a": "\U00011A7A",
+    "/soyo:ya": "\U00011A7B",
+    "/soyo:ra": "\U00011A7C",
+    "/soyo:la": "\U00011A7D",
+    "/soyo:va": "\U00011A7E",
+    "/soyo:sha": "\U00011A7F",
+    "/soyo:ssa": "\U00011A80",
+    "/soyo:sa": "\U00011A81",
+    "/soyo:ha": "\U00011A82",
+    "/soyo:kssa": "\U00011A83",
+    "/soyo:signJihvamuliya": "\U00011A84",
+    "/soyo:signUpadhmaniya": "\U00011A85",
+    "/soyo:raClusterInitial": "\U00011A86",
+    "/soyo:laClusterInitial": "\U00011A87",
+    "/soyo:shaClusterInitial": "\U00011A88",
+    "/soyo:saClusterInitial": "\U00011A89",
+    "/soyo:finalConsonantSignG": "\U00011A8A",
+    "/soyo:finalConsonantSignK": "\U00011A8B",
+    "/soyo:finalConsonantSignNg": "\U00011A8C",
+    "/soyo:finalConsonantSignD": "\U00011A8D",
+    "/soyo:finalConsonantSignN": "\U00011A8E",
+    "/soyo:finalConsonantSignB": "\U00011A8F",
+    "/soyo:finalConsonantSignM": "\U00011A90",
+    "/soyo:finalConsonantSignR": "\U00011A91",
+    "/soyo:finalConsonantSignL": "\U00011A92",
+    "/soyo:finalConsonantSignSh": "\U00011A93",
+    "/soyo:finalConsonantSignS": "\U00011A94",
+    "/soyo:finalConsonantSign-a": "\U00011A95",
+    "/soyo:signAnusvara": "\U00011A96",
+    "/soyo:signVisarga": "\U00011A97",
+    "/soyo:geminationMark": "\U00011A98",
+    "/soyo:subjoiner": "\U00011A99",
+    "/soyo:markTsheg": "\U00011A9A",
+    "/soyo:markShad": "\U00011A9B",
+    "/soyo:markDoubleShad": "\U00011A9C",
+    "/soyo:markPluta": "\U00011A9D",
+    "/soyo:headMarkWithMoonAndSunAndTripleFlame": "\U00011A9E",
+    "/soyo:headMarkWithMoonAndSunAndFlame": "\U00011A9F",
+    "/soyo:headMarkWithMoonAndSun": "\U00011AA0",
+    "/soyo:terminalMark-1": "\U00011AA1",
+    "/soyo:terminalMark-2": "\U00011AA2",
+    "/Abold": "\U0001D400",
+    "/Bbold": "\U0001D401",
+    "/Cbold": "\U0001D402",
+    "/Dbold": "\U0001D403",
+    "/Ebold": "\U0001D404",
+    "/Fbold": "\U0001D405",
+    "/Gbold": "\U0001D406",
+    "/Hbold": "\U0001D407",
+    "/Ibold": "\U0001D408",
+    "/Jbold": "\U0001D409",
+    "/Kbold": "\U0001D40A",
+    "/Lbold": "\U0001D40B",
+    "/Mbold": "\U0001D40C",
+    "/Nbold": "\U0001D40D",
+    "/Obold": "\U0001D40E",
+    "/Pbold": "\U0001D40F",
+    "/Qbold": "\U0001D410",
+    "/Rbold": "\U0001D411",
+    "/Sbold": "\U0001D412",
+    "/Tbold": "\U0001D413",
+    "/Ubold": "\U0001D414",
+    "/Vbold": "\U0001D415",
+    "/Wbold": "\U0001D416",
+    "/Xbold": "\U0001D417",
+    "/Ybold": "\U0001D418",
+    "/Zbold": "\U0001D419",
+    "/abold": "\U0001D41A",
+    "/bbold": "\U0001D41B",
+    "/cbold": "\U0001D41C",
+    "/dbold": "\U0001D41D",
+    "/ebold": "\U0001D41E",
+    "/fbold": "\U0001D41F",
+    "/gbold": "\U0001D420",
+    "/hbold": "\U0001D421",
+    "/ibold": "\U0001D422",
+    "/jbold": "\U0001D423",
+    "/kbold": "\U0001D424",
+    "/lbold": "\U0001D425",
+    "/mbold": "\U0001D426",
+    "/nbold": "\U0001D427",
+    "/obold": "\U0001D428",
+    "/pbold": "\U0001D429",
+    "/qbold": "\U0001D42A",
+    "/rbold": "\U0001D42B",
+    "/sbold": "\U0001D42C",
+    "/tbold": "\U0001D42D",
+    "/ubold": "\U0001D42E",
+    "/vbold": "\U0001D42F",
+    "/wbold": "\U0001D430",
+    "/xbold": "\U0001D431",
+    "/ybold": "\U0001D432",
+    "/zbold": "\U0001D433",
+    "/Aitalic": "\U0001D434",
+    "/Bitalic": "\U0001D435",
+    "/Citalic": "\U0001D436",
+    "/Ditalic": "\U0001D437",
+    "/Eitalic": "\U0001D438",
+    "/Fitalic": "\U0001D439",
+    "/Gitalic": "\U0001D43A",
+    "/Hitalic": "\U0001D43B",
+    "/Iitalic": "\U0001D43C",
+    "/Jitalic": "\U0001D43D",
+    "/Kitalic": "\U0001D43E",
+    "/Litalic": "\U0001D43F",
+    "/Mitalic": "\U0001D440",
+    "/Nitalic": "\U0001D441",
+    "/Oitalic": "\U0001D442",
+    "/Pitalic": "\U0001D443",
+    "/Qitalic": "\U0001D444",
+    "/Ritalic": "\U0001D445",
+    "/Sitalic": "\U0001D446",
+    "/Titalic": "\U0001D447",
+    "/Uitalic": "\U0001D448",
+    "/Vitalic": "\U0001D449",
+    "/Witalic": "\U0001D44A",
+    "/Xitalic": "\U0001D44B",
+    "/Yitalic": "\U0001D44C",
+    "/Zitalic": "\U0001D44D",
+    "/aitalic": "\U0001D44E",
+    "/bitalic": "\U0001D44F",
+    "/citalic": "\U0001D450",
+    "/ditalic": "\U0001D451",
+    "/eitalic": "\U0001D452",
+    "/fitalic": "\U0001D453",
+    "/gitalic": "\U0001D454",
+    "/iitalic": "\U0001D456",
+    "/jitalic": "\U0001D457",
+    "/kitalic": "\U0001D458",
+    "/litalic": "\U0001D459",
+    "/mitalic": "\U0001D45A",
+    "/nitalic": "\U0001D45B",
+    "/oitalic": "\U0001D45C",
+    "/pitalic": "\U0001D45D",
+    "/qitalic": "\U0001D45E",
+    "/ritalic": "\U0001D45F",
+    "/sitalic": "\U0001D460",
+    "/titalic": "\U0001D461",
+    "/uitalic": "\U0001D462",
+    "/vitalic": "\U0001D463",
+    "/witalic": "\U0001D464",
+    "/xitalic": "\U0001D465",
+    "/yitalic": "\U0001D466",
+    "/zitalic": "\U0001D467",
+    "/Abolditalic": "\U0001D468",
+    "/Bbolditalic": "\U0001D469",
+    "/Cbolditalic": "\U0001D46A",
+    "/Dbolditalic": "\U0001D46B",
+    "/Ebolditalic": "\U0001D46C",
+    "/Fbolditalic": "\U0001D46D",
+    "/Gbolditalic": "\U0001D46E",
+    "/Hbolditalic": "\U0001D46F",
+    "/Ibolditalic": "\U0001D470",
+    "/Jbolditalic": "\U0001D471",
+    "/Kbolditalic": "\U0001D472",
+    "/Lbolditalic": "\U0001D473",
+    "/Mbolditalic": "\U0001D474",
+    "/Nbolditalic": "\U0001D475",
+    "/Obolditalic": "\U0001D476",
+    "/Pbolditalic": "\U0001D477",
+    "/Qbolditalic": "\U0001D478",
+    "/Rbolditalic": "\U0001D479",
+    "/Sbolditalic": "\U0001D47A",
+    "/Tbolditalic": "\U0001D47B",
+    "/Ubolditalic": "\U0001D47C",
+    "/Vbolditalic": "\U0001D47D",
+    "/Wbolditalic": "\U0001D47E",
+    "/Xbolditalic": "\U0001D47F",
+    "/Ybolditalic": "\U0001D480",
+    "/Zbolditalic": "\U0001D481",
+    "/abolditalic": "\U0001D482",
+    "/bbolditalic": "\U0001D483",
+    "/cbolditalic": "\U0001D484",
+    "/dbolditalic": "\U0001D485",
+    "/ebolditalic": "\U0001D486",
+    "/fbolditalic": "\U0001D487",
+    "/gbolditalic": "\U0001D488",
+    "/hbolditalic": "\U0001D489",
+    "/ibolditalic": "\U0001D48A",
+    "/jbolditalic": "\U0001D48B",
+    "/kbolditalic": "\U0001D48C",
+    "/lbolditalic": "\U0001D48D",
+    "/mbolditalic": "\U0001D48E",
+    "/nbolditalic": "\U0001D48F",
+    "/obolditalic": "\U0001D490",
+    "/pbolditalic": "\U0001D491",
+    "/qbolditalic": "\U0001D492",
+    "/rbolditalic": "\U0001D493",
+    "/sbolditalic": "\U0001D494",
+    "/tbolditalic": "\U0001D495",
+    "/ubolditalic": "\U0001D496",
+    "/vbolditalic": "\U0001D497",
+    "/wbolditalic": "\U0001D498",
+    "/xbolditalic": "\U0001D499",
+    "/ybolditalic": "\U0001D49A",
+    "/zbolditalic": "\U0001D49B",
+    "/Ascript": "\U0001D49C",
+    "/Cscript": "\U0001D49E",
+    "/Dscript": "\U0001D49F",
+    "/Gscript": "\U0001D4A2",
+    "/Jscript": "\U0001D4A5",
+    "/Kscript": "\U0001D4A6",
+    "/Nscript": "\U0001D4A9",
+    "/Oscript": "\U0001D4AA",
+    "/Pscript": "\U0001D4AB",
+    "/Qscript": "\U0001D4AC",
+    "/Sscript": "\U0001D4AE",
+    "/Tscript": "\U0001D4AF",
+    "/Uscript": "\U0001D4B0",
+    "/Vscript": "\U0001D4B1",
+    "/Wscript": "\U0001D4B2",
+    "/Xscript": "\U0001D4B3",
+    "/Yscript": "\U0001D4B4",
+    "/Zscript": "\U0001D4B5",
+    "/bscript": "\U0001D4B7",
+    "/cscript": "\U0001D4B8",
+    "/dscript": "\U0001D4B9",
+    "/fscript": "\U0001D4BB",
+    "/hscript": "\U0001D4BD",
+    "/iscript": "\U0001D4BE",
+    "/jscript": "\U0001D4BF",
+    "/kscript": "\U0001D4C0",
+    "/lscript": "\U0001D4C1",
+    "/mscript": "\U0001D4C2",
+    "/nscript": "\U0001D4C3",
+    "/pscript": "\U0001D4C5",
+    "/qscript": "\U0001D4C6",
+    "/math:rscript": "\U0001D4C7",
+    "/sscript": "\U0001D4C8",
+    "/tscript": "\U0001D4C9",
+    "/uscript": "\U0001D4CA",
+    "/vscript": "\U0001D4CB",
+    "/wscript": "\U0001D4CC",
+    "/xscript": "\U0001D4CD",
+    "/yscript": "\U0001D4CE",
+    "/zscript": "\U0001D4CF",
+    "/Aboldscript": "\U0001D4D0",
+    "/Bboldscript": "\U0001D4D1",
+    "/Cboldscript": "\U0001D4D2",
+    "/Dboldscript": "\U0001D4D3",
+    "/Eboldscript": "\U0001D4D4",
+    "/Fboldscript": "\U0001D4D5",
+    "/Gboldscript": "\U0001D4D6",
+    "/Hboldscript": "\U0001D4D7",
+    "/Iboldscript": "\U0001D4D8",
+    "/Jboldscript": "\U0001D4D9",
+    "/Kboldscript": "\U0001D4DA",
+    "/Lboldscript": "\U0001D4DB",
+    "/Mboldscript": "\U0001D4DC",
+    "/Nboldscript": "\U0001D4DD",
+    "/Oboldscript": "\U0001D4DE",
+    "/Pboldscript": "\U0001D4DF",
+    "/Qboldscript": "\U0001D4E0",
+    "/Rboldscript": "\U0001D4E1",
+    "/Sboldscript": "\U0001D4E2",
+    "/Tboldscript": "\U0001D4E3",
+    "/Uboldscript": "\U0001D4E4",
+    "/Vboldscript": "\U0001D4E5",
+    "/Wboldscript": "\U0001D4E6",
+    "/Xboldscript": "\U0001D4E7",
+    "/Yboldscript": "\U0001D4E8",
+    "/Zboldscript": "\U0001D4E9",
+    "/aboldscript": "\U0001D4EA",
+    "/bboldscript": "\U0001D4EB",
+    "/cboldscript": "\U0001D4EC",
+    "/dboldscript": "\U0001D4ED",
+    "/eboldscript": "\U0001D4EE",
+    "/fboldscript": "\U0001D4EF",
+    "/gboldscript": "\U0001D4F0",
+    "/hboldscript": "\U0001D4F1",
+    "/iboldscript": "\U0001D4F2",
+    "/jboldscript": "\U0001D4F3",
+    "/kboldscript": "\U0001D4F4",
+    "/lboldscript": "\U0001D4F5",
+    "/mboldscript": "\U0001D4F6",
+    "/nboldscript": "\U0001D4F7",
+    "/oboldscript": "\U0001D4F8",
+    "/pboldscript": "\U0001D4F9",
+    "/qboldscript": "\U0001D4FA",
+    "/rboldscript": "\U0001D4FB",
+    "/sboldscript": "\U0001D4FC",
+    "/tboldscript": "\U0001D4FD",
+    "/uboldscript": "\U0001D4FE",
+    "/vboldscript": "\U0001D4FF",
+    "/wboldscript": "\U0001D500",
+    "/xboldscript": "\U0001D501",
+    "/yboldscript": "\U0001D502",
+    "/zboldscript": "\U0001D503",
+    "/Afraktur": "\U0001D504",
+    "/Bfraktur": "\U0001D505",
+    "/Dfraktur": "\U0001D507",
+    "/Efraktur": "\U0001D508",
+    "/Ffraktur": "\U0001D509",
+    "/Gfraktur": "\U0001D50A",
+    "/Jfraktur": "\U0001D50D",
+    "/Kfraktur": "\U0001D50E",
+    "/Lfraktur": "\U0001D50F",
+    "/Mfraktur": "\U0001D510",
+    "/Nfraktur": "\U0001D511",
+    "/Ofraktur": "\U0001D512",
+    "/Pfraktur": "\U0001D513",
+    "/Qfraktur": "\U0001D514",
+    "/Sfraktur": "\U0001D516",
+    "/Tfraktur": "\U0001D517",
+    "/Ufraktur": "\U0001D518",
+    "/Vfraktur": "\U0001D519",
+    "/Wfraktur": "\U0001D51A",
+    "/Xfraktur": "\U0001D51B",
+    "/Yfraktur": "\U0001D51C",
+    "/afraktur": "\U0001D51E",
+    "/bfraktur": "\U0001D51F",
+    "/cfraktur": "\U0001D520",
+    "/dfraktur": "\U0001D521",
+    "/efraktur": "\U0001D522",
+    "/ffraktur": "\U0001D523",
+    "/gfraktur": "\U0001D524",
+    "/hfraktur": "\U0001D525",
+    "/ifraktur": "\U0001D526",
+    "/jfraktur": "\U0001D527",
+    "/kfraktur": "\U0001D528",
+    "/lfraktur": "\U0001D529",
+    "/mfraktur": "\U0001D52A",
+    "/nfraktur": "\U0001D52B",
+    "/ofraktur": "\U0001D52C",
+    "/pfraktur": "\U0001D52D",
+    "/qfraktur": "\U0001D52E",
+    "/rfraktur": "\U0001D52F",
+    "/sfraktur": "\U0001D530",
+    "/tfraktur": "\U0001D531",
+    "/ufraktur": "\U0001D532",
+    "/vfraktur": "\U0001D533",
+    "/wfraktur": "\U0001D534",
+    "/xfraktur": "\U0001D535",
+    "/yfraktur": "\U0001D536",
+    "/zfraktur": "\U0001D537",
+    "/Adblstruck": "\U0001D538",
+    "/Bdblstruck": "\U0001D539",
+    "/Ddblstruck": "\U0001D53B",
+    "/Edblstruck": "\U0001D53C",
+    "/Fdblstruck": "\U0001D53D",
+    "/Gdblstruck": "\U0001D53E",
+    "/Idblstruck": "\U0001D540",
+    "/Jdblstruck": "\U0001D541",
+    "/Kdblstruck": "\U0001D542",
+    "/Ldblstruck": "\U0001D543",
+    "/Mdblstruck": "\U0001D544",
+    "/Odblstruck": "\U0001D546",
+    "/Sdblstruck": "\U0001D54A",
+    "/Tdblstruck": "\U0001D54B",
+    "/Udblstruck": "\U0001D54C",
+    "/Vdblstruck": "\U0001D54D",
+    "/Wdblstruck": "\U0001D54E",
+    "/Xdblstruck": "\U0001D54F",
+    "/Ydblstruck": "\U0001D550",
+    "/adblstruck": "\U0001D552",
+    "/bdblstruck": "\U0001D553",
+    "/cdblstruck": "\U0001D554",
+    "/ddblstruck": "\U0001D555",
+    "/edblstruck": "\U0001D556",
+    "/fdblstruck": "\U0001D557",
+    "/gdblstruck": "\U0001D558",
+    "/hdblstruck": "\U0001D559",
+    "/idblstruck": "\U0001D55A",
+    "/jdblstruck": "\U0001D55B",
+    "/kdblstruck": "\U0001D55C",
+    "/ldblstruck": "\U0001D55D",
+    "/mdblstruck": "\U0001D55E",
+    "/ndblstruck": "\U0001D55F",
+    "/odblstruck": "\U0001D560",
+    "/pdblstruck": "\U0001D561",
+    "/qdblstruck": "\U0001D562",
+    "/rdblstruck": "\U0001D563",
+    "/sdblstruck": "\U0001D564",
+    "/tdblstruck": "\U0001D565",
+    "/udblstruck": "\U0001D566",
+    "/vdblstruck": "\U0001D567",
+    "/wdblstruck": "\U0001D568",
+    "/xdblstruck": "\U0001D569",
+    "/ydblstruck": "\U0001D56A",
+    "/zdblstruck": "\U0001D56B",
+    "/Aboldfraktur": "\U0001D56C",
+    "/Bboldfraktur": "\U0001D56D",
+    "/Cboldfraktur": "\U0001D56E",
+    "/Dboldfraktur": "\U0001D56F",
+    "/Eboldfraktur": "\U0001D570",
+    "/Fboldfraktur": "\U0001D571",
+    "/Gboldfraktur": "\U0001D572",
+    "/Hboldfraktur": "\U0001D573",
+    "/Iboldfraktur": "\U0001D574",
+    "/Jboldfraktur": "\U0001D575",
+    "/Kboldfraktur": "\U0001D576",
+    "/Lboldfraktur": "\U0001D577",
+    "/Mboldfraktur": "\U0001D578",
+    "/Nboldfraktur": "\U0001D579",
+    "/Oboldfraktur": "\U0001D57A",
+    "/Pboldfraktur": "\U0001D57B",
+    "/Qboldfraktur": "\U0001D57C",
+    "/Rboldfraktur": "\U0001D57D",
+    "/Sboldfraktur": "\U0001D57E",
+    "/Tboldfraktur": "\U0001D57F",
+    "/Uboldfraktur": "\U0001D580",
+    "/Vboldfraktur": "\U0001D581",
+    "/Wboldfraktur": "\U0001D582",
+    "/Xboldfraktur": "\U0001D583",
+    "/Yboldfraktur": "\U0001D584",
+    "/Zboldfraktur": "\U0001D585",
+    "/aboldfraktur": "\U0001D586",
+    "/bboldfraktur": "\U0001D587",
+    "/cboldfraktur": "\U0001D588",
+    "/dboldfraktur": "\U0001D589",
+    "/eboldfraktur": "\U0001D58A",
+    "/fboldfraktur": "\U0001D58B",
+    "/gboldfraktur": "\U0001D58C",
+    "/hboldfraktur": "\U0001D58D",
+    "/iboldfraktur": "\U0001D58E",
+    "/jboldfraktur": "\U0001D58F",
+    "/kboldfraktur": "\U0001D590",
+    "/lboldfraktur": "\U0001D591",
+    "/mboldfraktur": "\U0001D592",
+    "/nboldfraktur": "\U0001D593",
+    "/oboldfraktur": "\U0001D594",
+    "/pboldfraktur": "\U0001D595",
+    "/qboldfraktur": "\U0001D596",
+    "/rboldfraktur": "\U0001D597",
+    "/sboldfraktur": "\U0001D598",
+    "/tboldfraktur": "\U0001D599",
+    "/uboldfraktur": "\U0001D59A",
+    "/vboldfraktur": "\U0001D59B",
+    "/wboldfraktur": "\U0001D59C",
+    "/xboldfraktur": "\U0001D59D",
+    "/yboldfraktur": "\U0001D59E",
+    "/zboldfraktur": "\U0001D59F",
+    "/Asans": "\U0001D5A0",
+    "/Bsans": "\U0001D5A1",
+    "/Csans": "\U0001D5A2",
+    "/Dsans": "\U0001D5A3",
+    "/Esans": "\U0001D5A4",
+    "/Fsans": "\U0001D5A5",
+    "/Gsans": "\U0001D5A6",
+    "/Hsans": "\U0001D5A7",
+    "/Isans": "\U0001D5A8",
+    "/Jsans": "\U0001D5A9",
+    "/Ksans": "\U0001D5AA",
+    "/Lsans": "\U0001D5AB",
+    "/Msans": "\U0001D5AC",
+    "/Nsans": "\U0001D5AD",
+    "/Osans": "\U0001D5AE",
+    "/Psans": "\U0001D5AF",
+    "/Qsans": "\U0001D5B0",
+    "/Rsans": "\U0001D5B1",
+    "/Ssans": "\U0001D5B2",
+    "/Tsans": "\U0001D5B3",
+    "/Usans": "\U0001D5B4",
+    "/Vsans": "\U0001D5B5",
+    "/Wsans": "\U0001D5B6",
+    "/Xsans": "\U0001D5B7",
+    "/Ysans": "\U0001D5B8",
+    "/Zsans": "\U0001D5B9",
+    "/asans": "\U0001D5BA",
+    "/bsans": "\U0001D5BB",
+    "/csans": "\U0001D5BC",
+    "/dsans": "\U0001D5BD",
+    "/esans": "\U0001D5BE",
+    "/fsans": "\U0001D5BF",
+    "/gsans": "\U0001D5C0",
+    "/hsans": "\U0001D5C1",
+    "/isans": "\U0001D5C2",
+    "/jsans": "\U0001D5C3",
+    "/ksans": "\U0001D5C4",
+    "/lsans": "\U0001D5C5",
+    "/msans": "\U0001D5C6",
+    "/nsans": "\U0001D5C7",
+    "/osans": "\U0001D5C8",
+    "/psans": "\U0001D5C9",
+    "/qsans": "\U0001D5CA",
+    "/rsans": "\U0001D5CB",
+    "/ssans": "\U0001D5CC",
+    "/tsans": "\U0001D5CD",
+    "/usans": "\U0001D5CE",
+    "/vsans": "\U0001D5CF",
+    "/wsans": "\U0001D5D0",
+    "/xsans": "\U0001D5D1",
+    "/ysans": "\U0001D5D2",
+    "/zsans": "\U0001D5D3",
+    "/Aboldsans": "\U0001D5D4",
+    "/Bboldsans": "\U0001D5D5",
+    "/Cboldsans": "\U0001D5D6",
+    "/Dboldsans": "\U0001D5D7",
+    "/Eboldsans": "\U0001D5D8",
+    "/Fboldsans": "\U0001D5D9",
+    "/Gboldsans": "\U0001D5DA",
+    "/Hboldsans": "\U0001D5DB",
+    "/Iboldsans": "\U0001D5DC",
+    "/Jboldsans": "\U0001D5DD",
+    "/Kboldsans": "\U0001D5DE",
+    "/Lboldsans": "\U0001D5DF",
+    "/Mboldsans": "\U0001D5E0",
+    "/Nboldsans": "\U0001D5E1",
+    "/Oboldsans": "\U0001D5E2",
+    "/Pboldsans": "\U0001D5E3",
+    "/Qboldsans": "\U0001D5E4",
+    "/Rboldsans": "\U0001D5E5",
+    "/Sboldsans": "\U0001D5E6",
+    "/Tboldsans": "\U0001D5E7",
+    "/Uboldsans": "\U0001D5E8",
+    "/Vboldsans": "\U0001D5E9",
+    "/Wboldsans": "\U0001D5EA",
+    "/Xboldsans": "\U0001D5EB",
+    "/Yboldsans": "\U0001D5EC",
+    "/Zboldsans": "\U0001D5ED",
+    "/aboldsans": "\U0001D5EE",
+    "/bboldsans": "\U0001D5EF",
+    "/cboldsans": "\U0001D5F0",
+    "/dboldsans": "\U0001D5F1",
+    "/eboldsans": "\U0001D5F2",
+    "/fboldsans": "\U0001D5F3",
+    "/gboldsans": "\U0001D5F4",
+    "/hboldsans": "\U0001D5F5",
+    "/iboldsans": "\U0001D5F6",
+    "/jboldsans": "\U0001D5F7",
+    "/kboldsans": "\U0001D5F8",
+    "/lboldsans": "\U0001D5F9",
+    "/mboldsans": "\U0001D5FA",
+    "/nboldsans": "\U0001D5FB",
+    "/oboldsans": "\U0001D5FC",
+    "/pboldsans": "\U0001D5FD",
+    "/qboldsans": "\U0001D5FE",
+    "/rboldsans": "\U0001D5FF",
+    "/sboldsans": "\U0001D600",
+    "/tboldsans": "\U0001D601",
+    "/uboldsans": "\U0001D602",
+    "/vboldsans": "\U0001D603",
+    "/wboldsans": "\U0001D604",
+    "/xboldsans": "\U0001D605",
+    "/yboldsans": "\U0001D606",
+    "/zboldsans": "\U0001D607",
+    "/Aitalicsans": "\U0001D608",
+    "/Bitalicsans": "\U0001D609",
+    "/Citalicsans": "\U0001D60A",
+    "/Ditalicsans": "\U0001D60B",
+    "/Eitalicsans": "\U0001D60C",
+    "/Fitalicsans": "\U0001D60D",
+    "/Gitalicsans": "\U0001D60E",
+    "/Hitalicsans": "\U0001D60F",
+    "/Iitalicsans": "\U0001D610",
+    "/Jitalicsans": "\U0001D611",
+    "/Kitalicsans": "\U0001D612",
+    "/Litalicsans": "\U0001D613",
+    "/Mitalicsans": "\U0001D614",
+    "/Nitalicsans": "\U0001D615",
+    "/Oitalicsans": "\U0001D616",
+    "/Pitalicsans": "\U0001D617",
+    "/Qitalicsans": "\U0001D618",
+    "/Ritalicsans": "\U0001D619",
+    "/Sitalicsans": "\U0001D61A",
+    "/Titalicsans": "\U0001D61B",
+    "/Uitalicsans": "\U0001D61C",
+    "/Vitalicsans": "\U0001D61D",
+    "/Witalicsans": "\U0001D61E",
+    "/Xitalicsans": "\U0001D61F",
+    "/Yitalicsans": "\U0001D620",
+    "/Zitalicsans": "\U0001D621",
+    "/aitalicsans": "\U0001D622",
+    "/bitalicsans": "\U0001D623",
+    "/citalicsans": "\U0001D624",
+    "/ditalicsans": "\U0001D625",
+    "/eitalicsans": "\U0001D626",
+    "/fitalicsans": "\U0001D627",
+    "/gitalicsans": "\U0001D628",
+    "/hitalicsans": "\U0001D629",
+    "/iitalicsans": "\U0001D62A",
+    "/jitalicsans": "\U0001D62B",
+    "/kitalicsans": "\U0001D62C",
+    "/litalicsans": "\U0001D62D",
+    "/mitalicsans": "\U0001D62E",
+    "/nitalicsans": "\U0001D62F",
+    "/oitalicsans": "\U0001D630",
+    "/pitalicsans": "\U0001D631",
+    "/qitalicsans": "\U0001D632",
+    "/ritalicsans": "\U0001D633",
+    "/sitalicsans": "\U0001D634",
+    "/titalicsans": "\U0001D635",
+    "/uitalicsans": "\U0001D636",
+    "/vitalicsans": "\U0001D637",
+    "/witalicsans": "\U0001D638",
+    "/xitalicsans": "\U0001D639",
+    "/yitalicsans": "\U0001D63A",
+    "/zitalicsans": "\U0001D63B",
+    "/Abolditalicsans": "\U0001D63C",
+    "/Bbolditalicsans": "\U0001D63D",
+    "/Cbolditalicsans": "\U0001D63E",
+    "/Dbolditalicsans": "\U0001D63F",
+    "/Ebolditalicsans": "\U0001D640",
+    "/Fbolditalicsans": "\U0001D641",
+    "/Gbolditalicsans": "\U0001D642",
+    "/Hbolditalicsans": "\U0001D643",
+    "/Ibolditalicsans": "\U0001D644",
+    "/Jbolditalicsans": "\U0001D645",
+    "/Kbolditalicsans": "\U0001D646",
+    "/Lbolditalicsans": "\U0001D647",
+    "/Mbolditalicsans": "\U0001D648",
+    "/Nbolditalicsans": "\U0001D649",
+    "/Obolditalicsans": "\U0001D64A",
+    "/Pbolditalicsans": "\U0001D64B",
+    "/Qbolditalicsans": "\U0001D64C",
+    "/Rbolditalicsans": "\U0001D64D",
+    "/Sbolditalicsans": "\U0001D64E",
+    "/Tbolditalicsans": "\U0001D64F",
+    "/Ubolditalicsans": "\U0001D650",
+    "/Vbolditalicsans": "\U0001D651",
+    "/Wbolditalicsans": "\U0001D652",
+    "/Xbolditalicsans": "\U0001D653",
+    "/Ybolditalicsans": "\U0001D654",
+    "/Zbolditalicsans": "\U0001D655",
+    "/abolditalicsans": "\U0001D656",
+    "/bbolditalicsans": "\U0001D657",
+    "/cbolditalicsans": "\U0001D658",
+    "/dbolditalicsans": "\U0001D659",
+    "/ebolditalicsans": "\U0001D65A",
+    "/fbolditalicsans": "\U0001D65B",
+    "/gbolditalicsans": "\U0001D65C",
+    "/hbolditalicsans": "\U0001D65D",
+    "/ibolditalicsans": "\U0001D65E",
+    "/jbolditalicsans": "\U0001D65F",
+    "/kbolditalicsans": "\U0001D660",
+    "/lbolditalicsans": "\U0001D661",
+    "/mbolditalicsans": "\U0001D662",
+    "/nbolditalicsans": "\U0001D663",
+    "/obolditalicsans": "\U0001D664",
+    "/pbolditalicsans": "\U0001D665",
+    "/qbolditalicsans": "\U0001D666",
+    "/rbolditalicsans": "\U0001D667",
+    "/sbolditalicsans": "\U0001D668",
+    "/tbolditalicsans": "\U0001D669",
+    "/ubolditalicsans": "\U0001D66A",
+    "/vbolditalicsans": "\U0001D66B",
+    "/wbolditalicsans": "\U0001D66C",
+    "/xbolditalicsans": "\U0001D66D",
+    "/ybolditalicsans": "\U0001D66E",
+    "/zbolditalicsans": "\U0001D66F",
+    "/Amono": "\U0001D670",
+    "/Bmono": "\U0001D671",
+    "/Cmono": "\U0001D672",
+    "/Dmono": "\U0001D673",
+    "/Emono": "\U0001D674",
+    "/Fmono": "\U0001D675",
+    "/Gmono": "\U0001D676",
+    "/Hmono": "\U0001D677",
+    "/Imono": "\U0001D678",
+    "/Jmono": "\U0001D679",
+    "/Kmono": "\U0001D67A",
+    "/Lmono": "\U0001D67B",
+    "/Mmono": "\U0001D67C",
+    "/Nmono": "\U0001D67D",
+    "/Omono": "\U0001D67E",
+    "/Pmono": "\U0001D67F",
+    "/Qmono": "\U0001D680",
+    "/Rmono": "\U0001D681",
+    "/Smono": "\U0001D682",
+    "/Tmono": "\U0001D683",
+    "/Umono": "\U0001D684",
+    "/Vmono": "\U0001D685",
+    "/Wmono": "\U0001D686",
+    "/Xmono": "\U0001D687",
+    "/Ymono": "\U0001D688",
+    "/Zmono": "\U0001D689",
+    "/amono": "\U0001D68A",
+    "/bmono": "\U0001D68B",
+    "/cmono": "\U0001D68C",
+    "/dmono": "\U0001D68D",
+    "/emono": "\U0001D68E",
+    "/fmono": "\U0001D68F",
+    "/gmono": "\U0001D690",
+    "/hmono": "\U0001D691",
+    "/imono": "\U0001D692",
+    "/jmono": "\U0001D693",
+    "/kmono": "\U0001D694",
+    "/lmono": "\U0001D695",
+    "/mmono": "\U0001D696",
+    "/nmono": "\U0001D697",
+    "/omono": "\U0001D698",
+    "/pmono": "\U0001D699",
+    "/qmono": "\U0001D69A",
+    "/rmono": "\U0001D69B",
+    "/smono": "\U0001D69C",
+    "/tmono": "\U0001D69D",
+    "/umono": "\U0001D69E",
+    "/vmono": "\U0001D69F",
+    "/wmono": "\U0001D6A0",
+    "/xmono": "\U0001D6A1",
+    "/ymono": "\U0001D6A2",
+    "/zmono": "\U0001D6A3",
+    "/dotlessiitalic": "\U0001D6A4",
+    "/dotlessjitalic": "\U0001D6A5",
+    "/Alphabold": "\U0001D6A8",
+    "/Betabold": "\U0001D6A9",
+    "/Gammabold": "\U0001D6AA",
+    "/Deltabold": "\U0001D6AB",
+    "/Epsilonbold": "\U0001D6AC",
+    "/Zetabold": "\U0001D6AD",
+    "/Etabold": "\U0001D6AE",
+    "/Thetabold": "\U0001D6AF",
+    "/Iotabold": "\U0001D6B0",
+    "/Kappabold": "\U0001D6B1",
+    "/Lamdabold": "\U0001D6B2",
+    "/Mubold": "\U0001D6B3",
+    "/Nubold": "\U0001D6B4",
+    "/Xibold": "\U0001D6B5",
+    "/Omicronbold": "\U0001D6B6",
+    "/Pibold": "\U0001D6B7",
+    "/Rhobold": "\U0001D6B8",
+    "/Thetasymbolbold": "\U0001D6B9",
+    "/Sigmabold": "\U0001D6BA",
+    "/Taubold": "\U0001D6BB",
+    "/Upsilonbold": "\U0001D6BC",
+    "/Phibold": "\U0001D6BD",
+    "/Chibold": "\U0001D6BE",
+    "/Psibold": "\U0001D6BF",
+    "/Omegabold": "\U0001D6C0",
+    "/boldnabla": "\U0001D6C1",
+    "/alphabold": "\U0001D6C2",
+    "/betabold": "\U0001D6C3",
+    "/gammabold": "\U0001D6C4",
+    "/deltabold": "\U0001D6C5",
+    "/epsilonbold": "\U0001D6C6",
+    "/zetabold": "\U0001D6C7",
+    "/etabold": "\U0001D6C8",
+    "/thetabold": "\U0001D6C9",
+    "/iotabold": "\U0001D6CA",
+    "/kappabold": "\U0001D6CB",
+    "/lamdabold": "\U0001D6CC",
+    "/mubold": "\U0001D6CD",
+    "/nubold": "\U0001D6CE",
+    "/xibold": "\U0001D6CF",
+    "/omicronbold": "\U0001D6D0",
+    "/pibold": "\U0001D6D1",
+    "/rhobold": "\U0001D6D2",
+    "/finalsigmabold": "\U0001D6D3",
+    "/sigmabold": "\U0001D6D4",
+    "/taubold": "\U0001D6D5",
+    "/upsilonbold": "\U0001D6D6",
+    "/phibold": "\U0001D6D7",
+    "/chibold": "\U0001D6D8",
+    "/psibold": "\U0001D6D9",
+    "/omegabold": "\U0001D6DA",
+    "/boldpartialdiff": "\U0001D6DB",
+    "/epsilonsymbolbold": "\U0001D6DC",
+    "/thetasymbolbold": "\U0001D6DD",
+    "/kappasymbolbold": "\U0001D6DE",
+    "/phisymbolbold": "\U0001D6DF",
+    "/rhosymbolbold": "\U0001D6E0",
+    "/pisymbolbold": "\U0001D6E1",
+    "/Alphaitalic": "\U0001D6E2",
+    "/Betaitalic": "\U0001D6E3",
+    "/Gammaitalic": "\U0001D6E4",
+    "/Deltaitalic": "\U0001D6E5",
+    "/Epsilonitalic": "\U0001D6E6",
+    "/Zetaitalic": "\U0001D6E7",
+    "/Etaitalic": "\U0001D6E8",
+    "/Thetaitalic": "\U0001D6E9",
+    "/Iotaitalic": "\U0001D6EA",
+    "/Kappaitalic": "\U0001D6EB",
+    "/Lamdaitalic": "\U0001D6EC",
+    "/Muitalic": "\U0001D6ED",
+    "/Nuitalic": "\U0001D6EE",
+    "/Xiitalic": "\U0001D6EF",
+    "/Omicronitalic": "\U0001D6F0",
+    "/Piitalic": "\U0001D6F1",
+    "/Rhoitalic": "\U0001D6F2",
+    "/Thetasymbolitalic": "\U0001D6F3",
+    "/Sigmaitalic": "\U0001D6F4",
+    "/Tauitalic": "\U0001D6F5",
+    "/Upsilonitalic": "\U0001D6F6",
+    "/Phiitalic": "\U0001D6F7",
+    "/Chiitalic": "\U0001D6F8",
+    "/Psiitalic": "\U0001D6F9",
+    "/Omegaitalic": "\U0001D6FA",
+    "/italicnabla": "\U0001D6FB",
+    "/alphaitalic": "\U0001D6FC",
+    "/betaitalic": "\U0001D6FD",
+    "/gammaitalic": "\U0001D6FE",
+    "/deltaitalic": "\U0001D6FF",
+    "/epsilonitalic": "\U0001D700",
+    "/zetaitalic": "\U0001D701",
+    "/etaitalic": "\U0001D702",
+    "/thetaitalic": "\U0001D703",
+    "/iotaitalic": "\U0001D704",
+    "/kappaitalic": "\U0001D705",
+    "/lamdaitalic": "\U0001D706",
+    "/muitalic": "\U0001D707",
+    "/nuitalic": "\U0001D708",
+    "/xiitalic": "\U0001D709",
+    "/omicronitalic": "\U0001D70A",
+    "/piitalic": "\U0001D70B",
+    "/rhoitalic": "\U0001D70C",
+    "/finalsigmaitalic": "\U0001D70D",
+    "/sigmaitalic": "\U0001D70E",
+    "/tauitalic": "\U0001D70F",
+    "/upsilonitalic": "\U0001D710",
+    "/phiitalic": "\U0001D711",
+    "/chiitalic": "\U0001D712",
+    "/psiitalic": "\U0001D713",
+    "/omegaitalic": "\U0001D714",
+    "/italicpartialdiff": "\U0001D715",
+    "/epsilonsymbolitalic": "\U0001D716",
+    "/thetasymbolitalic": "\U0001D717",
+    "/kappasymbolitalic": "\U0001D718",
+    "/phisymbolitalic": "\U0001D719",
+    "/rhosymbolitalic": "\U0001D71A",
+    "/pisymbolitalic": "\U0001D71B",
+    "/Alphabolditalic": "\U0001D71C",
+    "/Betabolditalic": "\U0001D71D",
+    "/Gammabolditalic": "\U0001D71E",
+    "/Deltabolditalic": "\U0001D71F",
+    "/Epsilonbolditalic": "\U0001D720",
+    "/Zetabolditalic": "\U0001D721",
+    "/Etabolditalic": "\U0001D722",
+    "/Thetabolditalic": "\U0001D723",
+    "/Iotabolditalic": "\U0001D724",
+    "/Kappabolditalic": "\U0001D725",
+    "/Lamdabolditalic": "\U0001D726",
+    "/Mubolditalic": "\U0001D727",
+    "/Nubolditalic": "\U0001D728",
+    "/Xibolditalic": "\U0001D729",
+    "/Omicronbolditalic": "\U0001D72A",
+    "/Pibolditalic": "\U0001D72B",
+    "/Rhobolditalic": "\U0001D72C",
+    "/Thetasymbolbolditalic": "\U0001D72D",
+    "/Sigmabolditalic": "\U0001D72E",
+    "/Taubolditalic": "\U0001D72F",
+    "/Upsilonbolditalic": "\U0001D730",
+    "/Phibolditalic": "\U0001D731",
+    "/Chibolditalic": "\U0001D732",
+    "/Psibolditalic": "\U0001D733",
+    "/Omegabolditalic": "\U0001D734",
+    "/bolditalicnabla": "\U0001D735",
+    "/alphabolditalic": "\U0001D736",
+    "/betabolditalic": "\U0001D737",
+    "/gammabolditalic": "\U0001D738",
+    "/deltabolditalic": "\U0001D739",
+    "/epsilonbolditalic": "\U0001D73A",
+    "/zetabolditalic": "\U0001D73B",
+    "/etabolditalic": "\U0001D73C",
+    "/thetabolditalic": "\U0001D73D",
+    "/iotabolditalic": "\U0001D73E",
+    "/kappabolditalic": "\U0001D73F",
+    "/lamdabolditalic": "\U0001D740",
+    "/mubolditalic": "\U0001D741",
+    "/nubolditalic": "\U0001D742",
+    "/xibolditalic": "\U0001D743",
+    "/omicronbolditalic": "\U0001D744",
+    "/pibolditalic": "\U0001D745",
+    "/rhobolditalic": "\U0001D746",
+    "/finalsigmabolditalic": "\U0001D747",
+    "/sigmabolditalic": "\U0001D748",
+    "/taubolditalic": "\U0001D749",
+    "/upsilonbolditalic": "\U0001D74A",
+    "/phibolditalic": "\U0001D74B",
+    "/chibolditalic": "\U0001D74C",
+    "/psibolditalic": "\U0001D74D",
+    "/omegabolditalic": "\U0001D74E",
+    "/bolditalicpartialdiff": "\U0001D74F",
+    "/epsilonsymbolbolditalic": "\U0001D750",
+    "/thetasymbolbolditalic": "\U0001D751",
+    "/kappasymbolbolditalic": "\U0001D752",
+    "/phisymbolbolditalic": "\U0001D753",
+    "/rhosymbolbolditalic": "\U0001D754",
+    "/pisymbolbolditalic": "\U0001D755",
+    "/Alphaboldsans": "\U0001D756",
+    "/Betaboldsans": "\U0001D757",
+    "/Gammaboldsans": "\U0001D758",
+    "/Deltaboldsans": "\U0001D759",
+    "/Epsilonboldsans": "\U0001D75A",
+    "/Zetaboldsans": "\U0001D75B",
+    "/Etaboldsans": "\U0001D75C",
+    "/Thetaboldsans": "\U0001D75D",
+    "/Iotaboldsans": "\U0001D75E",
+    "/Kappaboldsans": "\U0001D75F",
+    "/Lamdaboldsans": "\U0001D760",
+    "/Muboldsans": "\U0001D761",
+    "/Nuboldsans": "\U0001D762",
+    "/Xiboldsans": "\U0001D763",
+    "/Omicronboldsans": "\U0001D764",
+    "/Piboldsans": "\U0001D765",
+    "/Rhoboldsans": "\U0001D766",
+    "/Thetasymbolboldsans": "\U0001D767",
+    "/Sigmaboldsans": "\U0001D768",
+    "/Tauboldsans": "\U0001D769",
+    "/Upsilonboldsans": "\U0001D76A",
+    "/Phiboldsans": "\U0001D76B",
+    "/Chiboldsans": "\U0001D76C",
+    "/Psiboldsans": "\U0001D76D",
+    "/Omegaboldsans": "\U0001D76E",
+    "/boldsansnabla": "\U0001D76F",
+    "/alphaboldsans": "\U0001D770",
+    "/betaboldsans": "\U0001D771",
+    "/gammaboldsans": "\U0001D772",
+    "/deltaboldsans": "\U0001D773",
+    "/epsilonboldsans": "\U0001D774",
+    "/zetaboldsans": "\U0001D775",
+    "/etaboldsans": "\U0001D776",
+    "/thetaboldsans": "\U0001D777",
+    "/iotaboldsans": "\U0001D778",
+    "/kappaboldsans": "\U0001D779",
+    "/lamdaboldsans": "\U0001D77A",
+    "/muboldsans": "\U0001D77B",
+    "/nuboldsans": "\U0001D77C",
+    "/xiboldsans": "\U0001D77D",
+    "/omicronboldsans": "\U0001D77E",
+    "/piboldsans": "\U0001D77F",
+    "/rhoboldsans": "\U0001D780",
+    "/finalsigmaboldsans": "\U0001D781",
+    "/sigmaboldsans": "\U0001D782",
+    "/tauboldsans": "\U0001D783",
+    "/upsilonboldsans": "\U0001D784",
+    "/phiboldsans": "\U0001D785",
+    "/chiboldsans": "\U0001D786",
+    "/psiboldsans": "\U0001D787",
+    "/omegaboldsans": "\U0001D788",
+    "/boldsanspartialdiff": "\U0001D789",
+    "/epsilonsymbolboldsans": "\U0001D78A",
+    "/thetasymbolboldsans": "\U0001D78B",
+    "/kappasymbolboldsans": "\U0001D78C",
+    "/phisymbolboldsans": "\U0001D78D",
+    "/rhosymbolboldsans": "\U0001D78E",
+    "/pisymbolboldsans": "\U0001D78F",
+    "/Alphabolditalicsans": "\U0001D790",
+    "/Betabolditalicsans": "\U0001D791",
+    "/Gammabolditalicsans": "\U0001D792",
+    "/Deltabolditalicsans": "\U0001D793",
+    "/Epsilonbolditalicsans": "\U0001D794",
+    "/Zetabolditalicsans": "\U0001D795",
+    "/Etabolditalicsans": "\U0001D796",
+    "/Thetabolditalicsans": "\U0001D797",
+    "/Iotabolditalicsans": "\U0001D798",
+    "/Kappabolditalicsans": "\U0001D799",
+    "/Lamdabolditalicsans": "\U0001D79A",
+    "/Mubolditalicsans": "\U0001D79B",
+    "/Nubolditalicsans": "\U0001D79C",
+    "/Xibolditalicsans": "\U0001D79D",
+    "/Omicronbolditalicsans": "\U0001D79E",
+    "/Pibolditalicsans": "\U0001D79F",
+    "/Rhobolditalicsans": "\U0001D7A0",
+    "/Thetasymbolbolditalicsans": "\U0001D7A1",
+    "/Sigmabolditalicsans": "\U0001D7A2",
+    "/Taubolditalicsans": "\U0001D7A3",
+    "/Upsilonbolditalicsans": "\U0001D7A4",
+    "/Phibolditalicsans": "\U0001D7A5",
+    "/Chibolditalicsans": "\U0001D7A6",
+    "/Psibolditalicsans": "\U0001D7A7",
+    "/Omegabolditalicsans": "\U0001D7A8",
+    "/bolditalicsansnabla": "\U0001D7A9",
+    "/alphabolditalicsans": "\U0001D7AA",
+    "/betabolditalicsans": "\U0001D7AB",
+    "/gammabolditalicsans": "\U0001D7AC",
+    "/deltabolditalicsans": "\U0001D7AD",
+    "/epsilonbolditalicsans": "\U0001D7AE",
+    "/zetabolditalicsans": "\U0001D7AF",
+    "/etabolditalicsans": "\U0001D7B0",
+    "/thetabolditalicsans": "\U0001D7B1",
+    "/iotabolditalicsans": "\U0001D7B2",
+    "/kappabolditalicsans": "\U0001D7B3",
+    "/lamdabolditalicsans": "\U0001D7B4",
+    "/mubolditalicsans": "\U0001D7B5",
+    "/nubolditalicsans": "\U0001D7B6",
+    "/xibolditalicsans": "\U0001D7B7",
+    "/omicronbolditalicsans": "\U0001D7B8",
+    "/pibolditalicsans": "\U0001D7B9",
+    "/rhobolditalicsans": "\U0001D7BA",
+    "/finalsigmabolditalicsans": "\U0001D7BB",
+    "/sigmabolditalicsans": "\U0001D7BC",
+    "/taubolditalicsans": "\U0001D7BD",
+    "/upsilonbolditalicsans": "\U0001D7BE",
+    "/phibolditalicsans": "\U0001D7BF",
+    "/chibolditalicsans": "\U0001D7C0",
+    "/psibolditalicsans": "\U0001D7C1",
+    "/omegabolditalicsans": "\U0001D7C2",
+    "/bolditalicsanspartialdiff": "\U0001D7C3",
+    "/epsilonsymbolbolditalicsans": "\U0001D7C4",
+    "/thetasymbolbolditalicsans": "\U0001D7C5",
+    "/kappasymbolbolditalicsans": "\U0001D7C6",
+    "/phisymbolbolditalicsans": "\U0001D7C7",
+    "/rhosymbolbolditalicsans": "\U0001D7C8",
+    "/pisymbolbolditalicsans": "\U0001D7C9",
+    "/Digammabold": "\U0001D7CA",
+    "/digammabold": "\U0001D7CB",
+    "/zerobold": "\U0001D7CE",
+    "/onebold": "\U0001D7CF",
+    "/twobold": "\U0001D7D0",
+    "/threebold": "\U0001D7D1",
+    "/fourbold": "\U0001D7D2",
+    "/fivebold": "\U0001D7D3",
+    "/sixbold": "\U0001D7D4",
+    "/sevenbold": "\U0001D7D5",
+    "/eightbold": "\U0001D7D6",
+    "/ninebold": "\U0001D7D7",
+    "/zerodblstruck": "\U0001D7D8",
+    "/onedblstruck": "\U0001D7D9",
+    "/twodblstruck": "\U0001D7DA",
+    "/threedblstruck": "\U0001D7DB",
+    "/fourdblstruck": "\U0001D7DC",
+    "/fivedblstruck": "\U0001D7DD",
+    "/sixdblstruck": "\U0001D7DE",
+    "/sevendblstruck": "\U0001D7DF",
+    "/eightdblstruck": "\U0001D7E0",
+    "/ninedblstruck": "\U0001D7E1",
+    "/zerosans": "\U0001D7E2",
+    "/onesans": "\U0001D7E3",
+    "/twosans": "\U0001D7E4",
+    "/threesans": "\U0001D7E5",
+    "/foursans": "\U0001D7E6",
+    "/fivesans": "\U0001D7E7",
+    "/sixsans": "\U0001D7E8",
+    "/sevensans": "\U0001D7E9",
+    "/eightsans": "\U0001D7EA",
+    "/ninesans": "\U0001D7EB",
+    "/zeroboldsans": "\U0001D7EC",
+    "/oneboldsans": "\U0001D7ED",
+    "/twoboldsans": "\U0001D7EE",
+    "/threeboldsans": "\U0001D7EF",
+    "/fourboldsans": "\U0001D7F0",
+    "/fiveboldsans": "\U0001D7F1",
+    "/sixboldsans": "\U0001D7F2",
+    "/sevenboldsans": "\U0001D7F3",
+    "/eightboldsans": "\U0001D7F4",
+    "/nineboldsans": "\U0001D7F5",
+    "/zeromono": "\U0001D7F6",
+    "/onemono": "\U0001D7F7",
+    "/twomono": "\U0001D7F8",
+    "/threemono": "\U0001D7F9",
+    "/fourmono": "\U0001D7FA",
+    "/fivemono": "\U0001D7FB",
+    "/sixmono": "\U0001D7FC",
+    "/sevenmono": "\U0001D7FD",
+    "/eightmono": "\U0001D7FE",
+    "/ninemono": "\U0001D7FF",
+    "/ethi:hhya": "\U0001E7E0",
+    "/ethi:hhyu": "\U0001E7E1",
+    "/ethi:hhyi": "\U0001E7E2",
+    "/ethi:hhyaa": "\U0001E7E3",
+    "/ethi:hhyee": "\U0001E7E4",
+    "/ethi:hhye": "\U0001E7E5",
+    "/ethi:hhyo": "\U0001E7E6",
+    "/ethi:hhwagurage": "\U0001E7E8",
+    "/ethi:hhwi": "\U0001E7E9",
+    "/ethi:hhwee": "\U0001E7EA",
+    "/ethi:hhwe": "\U0001E7EB",
+    "/ethi:mwigurage": "\U0001E7ED",
+    "/ethi:mweegurage": "\U0001E7EE",
+    "/ethi:qwigurage": "\U0001E7F0",
+    "/ethi:qweegurage": "\U0001E7F1",
+    "/ethi:qwegurage": "\U0001E7F2",
+    "/ethi:bwigurage": "\U0001E7F3",
+    "/ethi:bweegurage": "\U0001E7F4",
+    "/ethi:kwigurage": "\U0001E7F5",
+    "/ethi:kweegurage": "\U0001E7F6",
+    "/ethi:kwegurage": "\U0001E7F7",
+    "/ethi:gwigurage": "\U0001E7F8",
+    "/ethi:gweegurage": "\U0001E7F9",
+    "/ethi:gwegurage": "\U0001E7FA",
+    "/ethi:fwigurage": "\U0001E7FB",
+    "/ethi:fweegurage": "\U0001E7FC",
+    "/ethi:pwigurage": "\U0001E7FD",
+    "/ethi:pweegurage": "\U0001E7FE",
+    "/eastWindMahjong": "\U0001F000",
+    "/southWindMahjong": "\U0001F001",
+    "/westWindMahjong": "\U0001F002",
+    "/northWindMahjong": "\U0001F003",
+    "/redDragonMahjong": "\U0001F004",
+    "/greenDragonMahjong": "\U0001F005",
+    "/whiteDragonMahjong": "\U0001F006",
+    "/oneOfCharactersMahjong": "\U0001F007",
+    "/twoOfCharactersMahjong": "\U0001F008",
+    "/threeOfCharactersMahjong": "\U0001F009",
+    "/fourOfCharactersMahjong": "\U0001F00A",
+    "/fiveOfCharactersMahjong": "\U0001F00B",
+    "/sixOfCharactersMahjong": "\U0001F00C",
+    "/sevenOfCharactersMahjong": "\U0001F00D",
+    "/eightOfCharactersMahjong": "\U0001F00E",
+    "/nineOfCharactersMahjong": "\U0001F00F",
+    "/oneOfBamboosMahjong": "\U0001F010",
+    "/twoOfBamboosMahjong": "\U0001F011",
+    "/threeOfBamboosMahjong": "\U0001F012",
+    "/fourOfBamboosMahjong": "\U0001F013",
+    "/fiveOfBamboosMahjong": "\U0001F014",
+    "/sixOfBamboosMahjong": "\U0001F015",
+    "/sevenOfBamboosMahjong": "\U0001F016",
+    "/eightOfBamboosMahjong": "\U0001F017",
+    "/nineOfBamboosMahjong": "\U0001F018",
+    "/oneOfCirclesMahjong": "\U0001F019",
+    "/twoOfCirclesMahjong": "\U0001F01A",
+    "/threeOfCirclesMahjong": "\U0001F01B",
+    "/fourOfCirclesMahjong": "\U0001F01C",
+    "/fiveOfCirclesMahjong": "\U0001F01D",
+    "/sixOfCirclesMahjong": "\U0001F01E",
+    "/sevenOfCirclesMahjong": "\U0001F01F",
+    "/eightOfCirclesMahjong": "\U0001F020",
+    "/nineOfCirclesMahjong": "\U0001F021",
+    "/plumMahjong": "\U0001F022",
+    "/orchidMahjong": "\U0001F023",
+    "/bambooMahjong": "\U0001F024",
+    "/chrysanthemumMahjong": "\U0001F025",
+    "/springMahjong": "\U0001F026",
+    "/summerMahjong": "\U0001F027",
+    "/autumnMahjong": "\U0001F028",
+    "/winterMahjong": "\U0001F029",
+    "/jokerMahjong": "\U0001F02A",
+    "/backMahjong": "\U0001F02B",
+    "/dominohorizontalback": "\U0001F030",
+    "/dominohorizontal_00_00": "\U0001F031",
+    "/dominohorizontal_00_01": "\U0001F032",
+    "/dominohorizontal_00_02": "\U0001F033",
+    "/dominohorizontal_00_03": "\U0001F034",
+    "/dominohorizontal_00_04": "\U0001F035",
+    "/dominohorizontal_00_05": "\U0001F036",
+    "/dominohorizontal_00_06": "\U0001F037",
+    "/dominohorizontal_01_00": "\U0001F038",
+    "/dominohorizontal_01_01": "\U0001F039",
+    "/dominohorizontal_01_02": "\U0001F03A",
+    "/dominohorizontal_01_03": "\U0001F03B",
+    "/dominohorizontal_01_04": "\U0001F03C",
+    "/dominohorizontal_01_05": "\U0001F03D",
+    "/dominohorizontal_01_06": "\U0001F03E",
+    "/dominohorizontal_02_00": "\U0001F03F",
+    "/dominohorizontal_02_01": "\U0001F040",
+    "/dominohorizontal_02_02": "\U0001F041",
+    "/dominohorizontal_02_03": "\U0001F042",
+    "/dominohorizontal_02_04": "\U0001F043",
+    "/dominohorizontal_02_05": "\U0001F044",
+    "/dominohorizontal_02_06": "\U0001F045",
+    "/dominohorizontal_03_00": "\U0001F046",
+    "/dominohorizontal_03_01": "\U0001F047",
+    "/dominohorizontal_03_02": "\U0001F048",
+    "/dominohorizontal_03_03": "\U0001F049",
+    "/dominohorizontal_03_04": "\U0001F04A",
+    "/dominohorizontal_03_05": "\U0001F04B",
+    "/dominohorizontal_03_06": "\U0001F04C",
+    "/dominohorizontal_04_00": "\U0001F04D",
+    "/dominohorizontal_04_01": "\U0001F04E",
+    "/dominohorizontal_04_02": "\U0001F04F",
+    "/dominohorizontal_04_03": "\U0001F050",
+    "/dominohorizontal_04_04": "\U0001F051",
+    "/dominohorizontal_04_05": "\U0001F052",
+    "/dominohorizontal_04_06": "\U0001F053",
+    "/dominohorizontal_05_00": "\U0001F054",
+    "/dominohorizontal_05_01": "\U0001F055",
+    "/dominohorizontal_05_02": "\U0001F056",
+    "/dominohorizontal_05_03": "\U0001F057",
+    "/dominohorizontal_05_04": "\U0001F058",
+    "/dominohorizontal_05_05": "\U0001F059",
+    "/dominohorizontal_05_06": "\U0001F05A",
+    "/dominohorizontal_06_00": "\U0001F05B",
+    "/dominohorizontal_06_01": "\U0001F05C",
+    "/dominohorizontal_06_02": "\U0001F05D",
+    "/dominohorizontal_06_03": "\U0001F05E",
+    "/dominohorizontal_06_04": "\U0001F05F",
+    "/dominohorizontal_06_05": "\U0001F060",
+    "/dominohorizontal_06_06": "\U0001F061",
+    "/dominoverticalback": "\U0001F062",
+    "/dominovertical_00_00": "\U0001F063",
+    "/dominovertical_00_01": "\U0001F064",
+    "/dominovertical_00_02": "\U0001F065",
+    "/dominovertical_00_03": "\U0001F066",
+    "/dominovertical_00_04": "\U0001F067",
+    "/dominovertical_00_05": "\U0001F068",
+    "/dominovertical_00_06": "\U0001F069",
+    "/dominovertical_01_00": "\U0001F06A",
+    "/dominovertical_01_01": "\U0001F06B",
+    "/dominovertical_01_02": "\U0001F06C",
+    "/dominovertical_01_03": "\U0001F06D",
+    "/dominovertical_01_04": "\U0001F06E",
+    "/dominovertical_01_05": "\U0001F06F",
+    "/dominovertical_01_06": "\U0001F070",
+    "/dominovertical_02_00": "\U0001F071",
+    "/dominovertical_02_01": "\U0001F072",
+    "/dominovertical_02_02": "\U0001F073",
+    "/dominovertical_02_03": "\U0001F074",
+    "/dominovertical_02_04": "\U0001F075",
+    "/dominovertical_02_05": "\U0001F076",
+    "/dominovertical_02_06": "\U0001F077",
+    "/dominovertical_03_00": "\U0001F078",
+    "/dominovertical_03_01": "\U0001F079",
+    "/dominovertical_03_02": "\U0001F07A",
+    "/dominovertical_03_03": "\U0001F07B",
+    "/dominovertical_03_04": "\U0001F07C",
+    "/dominovertical_03_05": "\U0001F07D",
+    "/dominovertical_03_06": "\U0001F07E",
+    "/dominovertical_04_00": "\U0001F07F",
+    "/dominovertical_04_01": "\U0001F080",
+    "/dominovertical_04_02": "\U0001F081",
+    "/dominovertical_04_03": "\U0001F082",
+    "/dominovertical_04_04": "\U0001F083",
+    "/dominovertical_04_05": "\U0001F084",
+    "/dominovertical_04_06": "\U0001F085",
+    "/dominovertical_05_00": "\U0001F086",
+    "/dominovertical_05_01": "\U0001F087",
+    "/dominovertical_05_02": "\U0001F088",
+    "/dominovertical_05_03": "\U0001F089",
+    "/dominovertical_05_04": "\U0001F08A",
+    "/dominovertical_05_05": "\U0001F08B",
+    "/dominovertical_05_06": "\U0001F08C",
+    "/dominovertical_06_00": "\U0001F08D",
+    "/dominovertical_06_01": "\U0001F08E",
+    "/dominovertical_06_02": "\U0001F08F",
+    "/dominovertical_06_03": "\U0001F090",
+    "/dominovertical_06_04": "\U0001F091",
+    "/dominovertical_06_05": "\U0001F092",
+    "/dominovertical_06_06": "\U0001F093",
+    "/cards:back": "\U0001F0A0",
+    "/cards:aceofspades": "\U0001F0A1",
+    "/cards:twoofspades": "\U0001F0A2",
+    "/cards:threeofspades": "\U0001F0A3",
+    "/cards:fourofspades": "\U0001F0A4",
+    "/cards:fiveofspades": "\U0001F0A5",
+    "/cards:sixofspades": "\U0001F0A6",
+    "/cards:sevenofspades": "\U0001F0A7",
+    "/cards:eightofspades": "\U0001F0A8",
+    "/cards:nineofspades": "\U0001F0A9",
+    "/cards:tenofspades": "\U0001F0AA",
+    "/cards:jackofspades": "\U0001F0AB",
+    "/cards:knightofspades": "\U0001F0AC",
+    "/cards:queenofspades": "\U0001F0AD",
+    "/cards:kingofspades": "\U0001F0AE",
+    "/cards:aceofhearts": "\U0001F0B1",
+    "/cards:twoofhearts": "\U0001F0B2",
+    "/cards:threeofhearts": "\U0001F0B3",
+    "/cards:fourofhearts": "\U0001F0B4",
+    "/cards:fiveofhearts": "\U0001F0B5",
+    "/cards:sixofhearts": "\U0001F0B6",
+    "/cards:sevenofhearts": "\U0001F0B7",
+    "/cards:eightofhearts": "\U0001F0B8",
+    "/cards:nineofhearts": "\U0001F0B9",
+    "/cards:tenofhearts": "\U0001F0BA",
+    "/cards:jackofhearts": "\U0001F0BB",
+    "/cards:knightofhearts": "\U0001F0BC",
+    "/cards:queenofhearts": "\U0001F0BD",
+    "/cards:kingofhearts": "\U0001F0BE",
+    "/cards:redjoker": "\U0001F0BF",
+    "/cards:aceofdiamonds": "\U0001F0C1",
+    "/cards:twoofdiamonds": "\U0001F0C2",
+    "/cards:threeofdiamonds": "\U0001F0C3",
+    "/cards:fourofdiamonds": "\U0001F0C4",
+    "/cards:fiveofdiamonds": "\U0001F0C5",
+    "/cards:sixofdiamonds": "\U0001F0C6",
+    "/cards:sevenofdiamonds": "\U0001F0C7",
+    "/cards:eightofdiamonds": "\U0001F0C8",
+    "/cards:nineofdiamonds": "\U0001F0C9",
+    "/cards:tenofdiamonds": "\U0001F0CA",
+    "/cards:jackofdiamonds": "\U0001F0CB",
+    "/cards:knightofdiamonds": "\U0001F0CC",
+    "/cards:queenofdiamonds": "\U0001F0CD",
+    "/cards:kingofdiamonds": "\U0001F0CE",
+    "/cards:blackjoker": "\U0001F0CF",
+    "/cards:aceofclubs": "\U0001F0D1",
+    "/cards:twoofclubs": "\U0001F0D2",
+    "/cards:threeofclubs": "\U0001F0D3",
+    "/cards:fourofclubs": "\U0001F0D4",
+    "/cards:fiveofclubs": "\U0001F0D5",
+    "/cards:sixofclubs": "\U0001F0D6",
+    "/cards:sevenofclubs": "\U0001F0D7",
+    "/cards:eightofclubs": "\U0001F0D8",
+    "/cards:nineofclubs": "\U0001F0D9",
+    "/cards:tenofclubs": "\U0001F0DA",
+    "/cards:jackofclubs": "\U0001F0DB",
+    "/cards:knightofclubs": "\U0001F0DC",
+    "/cards:queenofclubs": "\U0001F0DD",
+    "/cards:kingofclubs": "\U0001F0DE",
+    "/cards:whitejoker": "\U0001F0DF",
+    "/cards:fool": "\U0001F0E0",
+    "/cards:trump1": "\U0001F0E1",
+    "/cards:trump2": "\U0001F0E2",
+    "/cards:trump3": "\U0001F0E3",
+    "/cards:trump4": "\U0001F0E4",
+    "/cards:trump5": "\U0001F0E5",
+    "/cards:trump6": "\U0001F0E6",
+    "/cards:trump7": "\U0001F0E7",
+    "/cards:trump8": "\U0001F0E8",
+    "/cards:trump9": "\U0001F0E9",
+    "/cards:trump10": "\U0001F0EA",
+    "/cards:trump11": "\U0001F0EB",
+    "/cards:trump12": "\U0001F0EC",
+    "/cards:trump13": "\U0001F0ED",
+    "/cards:trump14": "\U0001F0EE",
+    "/cards:trump15": "\U0001F0EF",
+    "/cards:trump16": "\U0001F0F0",
+    "/cards:trump17": "\U0001F0F1",
+    "/cards:trump18": "\U0001F0F2",
+    "/cards:trump19": "\U0001F0F3",
+    "/cards:trump20": "\U0001F0F4",
+    "/cards:trump21": "\U0001F0F5",
+    "/zerofullstop": "\U0001F100",
+    "/zerocomma": "\U0001F101",
+    "/onecomma": "\U0001F102",
+    "/twocomma": "\U0001F103",
+    "/threecomma": "\U0001F104",
+    "/fourcomma": "\U0001F105",
+    "/fivecomma": "\U0001F106",
+    "/sixcomma": "\U0001F107",
+    "/sevencomma": "\U0001F108",
+    "/eightcomma": "\U0001F109",
+    "/ninecomma": "\U0001F10A",
+    "/dingbatSAns-serifzerocircle": "\U0001F10B",
+    "/dingbatSAns-serifzerocircleblack": "\U0001F10C",
+    "/zerowithslashcircle": "\U0001F10D",
+    "/anticlockwisearrowcircle": "\U0001F10E",
+    "/dollarsignwithoverlaidbackslashcircle": "\U0001F10F",
+    "/Aparens": "\U0001F110",
+    "/Bparens": "\U0001F111",
+    "/Cparens": "\U0001F112",
+    "/Dparens": "\U0001F113",
+    "/Eparens": "\U0001F114",
+    "/Fparens": "\U0001F115",
+    "/Gparens": "\U0001F116",
+    "/Hparens": "\U0001F117",
+    "/Iparens": "\U0001F118",
+    "/Jparens": "\U0001F119",
+    "/Kparens": "\U0001F11A",
+    "/Lparens": "\U0001F11B",
+    "/Mparens": "\U0001F11C",
+    "/Nparens": "\U0001F11D",
+    "/Oparens": "\U0001F11E",
+    "/Pparens": "\U0001F11F",
+    "/Qparens": "\U0001F120",
+    "/Rparens": "\U0001F121",
+    "/Sparens": "\U0001F122",
+    "/Tparens": "\U0001F123",
+    "/Uparens": "\U0001F124",
+    "/Vparens": "\U0001F125",
+    "/Wparens": "\U0001F126",
+    "/Xparens": "\U0001F127",
+    "/Yparens": "\U0001F128",
+    "/Zparens": "\U0001F129",
+    "/Sshell": "\U0001F12A",
+    "/Citaliccircle": "\U0001F12B",
+    "/Ritaliccircle": "\U0001F12C",
+    "/CDcircle": "\U0001F12D",
+    "/WZcircle": "\U0001F12E",
+    "/copyleftsymbol": "\U0001F12F",
+    "/Asquare": "\U0001F130",
+    "/Bsquare": "\U0001F131",
+    "/Csquare": "\U0001F132",
+    "/Dsquare": "\U0001F133",
+    "/Esquare": "\U0001F134",
+    "/Fsquare": "\U0001F135",
+    "/Gsquare": "\U0001F136",
+    "/Hsquare": "\U0001F137",
+    "/Isquare": "\U0001F138",
+    "/Jsquare": "\U0001F139",
+    "/Ksquare": "\U0001F13A",
+    "/Lsquare": "\U0001F13B",
+    "/Msquare": "\U0001F13C",
+    "/Nsquare": "\U0001F13D",
+    "/Osquare": "\U0001F13E",
+    "/Psquare": "\U0001F13F",
+    "/Qsquare": "\U0001F140",
+    "/Rsquare": "\U0001F141",
+    "/Ssquare": "\U0001F142",
+    "/Tsquare": "\U0001F143",
+    "/Usquare": "\U0001F144",
+    "/Vsquare": "\U0001F145",
+    "/Wsquare": "\U0001F146",
+    "/Xsquare": "\U0001F147",
+    "/Ysquare": "\U0001F148",
+    "/Zsquare": "\U0001F149",
+    "/HVsquare": "\U0001F14A",
+    "/MVsquare": "\U0001F14B",
+    "/SDsquare": "\U0001F14C",
+    "/SSsquare": "\U0001F14D",
+    "/PPVsquare": "\U0001F14E",
+    "/wcsquare": "\U0001F14F",
+    "/Acircleblack": "\U0001F150",
+    "/Bcircleblack": "\U0001F151",
+    "/Ccircleblack": "\U0001F152",
+    "/Dcircleblack": "\U0001F153",
+    "/Ecircleblack": "\U0001F154",
+    "/Fcircleblack": "\U0001F155",
+    "/Gcircleblack": "\U0001F156",
+    "/Hcircleblack": "\U0001F157",
+    "/Icircleblack": "\U0001F158",
+    "/Jcircleblack": "\U0001F159",
+    "/Kcircleblack": "\U0001F15A",
+    "/Lcircleblack": "\U0001F15B",
+    "/Mcircleblack": "\U0001F15C",
+    "/Ncircleblack": "\U0001F15D",
+    "/Ocircleblack": "\U0001F15E",
+    "/Pcircleblack": "\U0001F15F",
+    "/Qcircleblack": "\U0001F160",
+    "/Rcircleblack": "\U0001F161",
+    "/Scircleblack": "\U0001F162",
+    "/Tcircleblack": "\U0001F163",
+    "/Ucircleblack": "\U0001F164",
+    "/Vcircleblack": "\U0001F165",
+    "/Wcircleblack": "\U0001F166",
+    "/Xcircleblack": "\U0001F167",
+    "/Ycircleblack": "\U0001F168",
+    "/Zcircleblack": "\U0001F169",
+    "/raisedmcsign": "\U0001F16A",
+    "/raisedmdsign": "\U0001F16B",
+    "/raisedmrsign": "\U0001F16C",
+    "/cccircle": "\U0001F16D",
+    "/cwithoverlaidbackslashcircle": "\U0001F16E",
+    "/humanfigurecircle": "\U0001F16F",
+    "/Asquareblack": "\U0001F170",
+    "/Bsquareblack": "\U0001F171",
+    "/Csquareblack": "\U0001F172",
+    "/Dsquareblack": "\U0001F173",
+    "/Esquareblack": "\U0001F174",
+    "/Fsquareblack": "\U0001F175",
+    "/Gsquareblack": "\U0001F176",
+    "/Hsquareblack": "\U0001F177",
+    "/Isquareblack": "\U0001F178",
+    "/Jsquareblack": "\U0001F179",
+    "/Ksquareblack": "\U0001F17A",
+    "/Lsquareblack": "\U0001F17B",
+    "/Msquareblack": "\U0001F17C",
+    "/Nsquareblack": "\U0001F17D",
+    "/Osquareblack": "\U0001F17E",
+    "/Psquareblack": "\U0001F17F",
+    "/Qsquareblack": "\U0001F180",
+    "/Rsquareblack": "\U0001F181",
+    "/Ssquareblack": "\U0001F182",
+    "/Tsquareblack": "\U0001F183",
+    "/Usquareblack": "\U0001F184",
+    "/Vsquareblack": "\U0001F185",
+    "/Wsquareblack": "\U0001F186",
+    "/Xsquareblack": "\U0001F187",
+    "/Ysquareblack": "\U0001F188",
+    "/Zsquareblack": "\U0001F189",
+    "/Pcrosssquareblack": "\U0001F18A",
+    "/ICsquareblack": "\U0001F18B",
+    "/PAsquareblack": "\U0001F18C",
+    "/SAsquareblack": "\U0001F18D",
+    "/absquareblack": "\U0001F18E",
+    "/wcsquareblack": "\U0001F18F",
+    "/squaredj": "\U0001F190",
+    "/clsquare": "\U0001F191",
+    "/coolsquare": "\U0001F192",
+    "/freesquare": "\U0001F193",
+    "/idsquare": "\U0001F194",
+    "/newsquare": "\U0001F195",
+    "/ngsquare": "\U0001F196",
+    "/oksquare": "\U0001F197",
+    "/sossquare": "\U0001F198",
+    "/upwithexclamationmarksquare": "\U0001F199",
+    "/vssquare": "\U0001F19A",
+    "/threedsquare": "\U0001F19B",
+    "/secondscreensquare": "\U0001F19C",
+    "/twoksquare": "\U0001F19D",
+    "/fourksquare": "\U0001F19E",
+    "/eightksquare": "\U0001F19F",
+    "/fivepointonesquare": "\U0001F1A0",
+    "/sevenpointonesquare": "\U0001F1A1",
+    "/twenty-twopointtwosquare": "\U0001F1A2",
+    "/sixtypsquare": "\U0001F1A3",
+    "/onehundredtwentypsquare": "\U0001F1A4",
+    "/dsquare": "\U0001F1A5",
+    "/hcsquare": "\U0001F1A6",
+    "/hdrsquare": "\U0001F1A7",
+    "/hi-ressquare": "\U0001F1A8",
+    "/losslesssquare": "\U0001F1A9",
+    "/shvsquare": "\U0001F1AA",
+    "/uhdsquare": "\U0001F1AB",
+    "/vodsquare": "\U0001F1AC",
+    "/maskworksymbol": "\U0001F1AD",
+    "/regionalindicatorsymbollettera": "\U0001F1E6",
+    "/regionalindicatorsymbolletterb": "\U0001F1E7",
+    "/regionalindicatorsymbolletterc": "\U0001F1E8",
+    "/regionalindicatorsymbolletterd": "\U0001F1E9",
+    "/regionalindicatorsymbollettere": "\U0001F1EA",
+    "/regionalindicatorsymbolletterf": "\U0001F1EB",
+    "/regionalindicatorsymbolletterg": "\U0001F1EC",
+    "/regionalindicatorsymbolletterh": "\U0001F1ED",
+    "/regionalindicatorsymbolletteri": "\U0001F1EE",
+    "/regionalindicatorsymbolletterj": "\U0001F1EF",
+    "/regionalindicatorsymbolletterk": "\U0001F1F0",
+    "/regionalindicatorsymbolletterl": "\U0001F1F1",
+    "/regionalindicatorsymbolletterm": "\U0001F1F2",
+    "/regionalindicatorsymbollettern": "\U0001F1F3",
+    "/regionalindicatorsymbollettero": "\U0001F1F4",
+    "/regionalindicatorsymbolletterp": "\U0001F1F5",
+    "/regionalindicatorsymbolletterq": "\U0001F1F6",
+    "/regionalindicatorsymbolletterr": "\U0001F1F7",
+    "/regionalindicatorsymbolletters": "\U0001F1F8",
+    "/regionalindicatorsymbollettert": "\U0001F1F9",
+    "/regionalindicatorsymbolletteru": "\U0001F1FA",
+    "/regionalindicatorsymbolletterv": "\U0001F1FB",
+    "/regionalindicatorsymbolletterw": "\U0001F1FC",
+    "/regionalindicatorsymbolletterx": "\U0001F1FD",
+    "/regionalindicatorsymbollettery": "\U0001F1FE",
+    "/regionalindicatorsymbolletterz": "\U0001F1FF",
+    "/cyclone": "\U0001F300",
+    "/foggy": "\U0001F301",
+    "/closedUmbrella": "\U0001F302",
+    "/nightStars": "\U0001F303",
+    "/sunriseOverMountains": "\U0001F304",
+    "/sunrise": "\U0001F305",
+    "/cityscapeAtDusk": "\U0001F306",
+    "/sunsetOverBuildings": "\U0001F307",
+    "/rainbow": "\U0001F308",
+    "/bridgeAtNight": "\U0001F309",
+    "/waterWave": "\U0001F30A",
+    "/volcano": "\U0001F30B",
+    "/milkyWay": "\U0001F30C",
+    "/earthGlobeEuropeAfrica": "\U0001F30D",
+    "/earthGlobeAmericas": "\U0001F30E",
+    "/earthGlobeAsiaAustralia": "\U0001F30F",
+    "/globeMeridians": "\U0001F310",
+    "/newMoon": "\U0001F311",
+    "/waxingCrescentMoon": "\U0001F312",
+    "/firstQuarterMoon": "\U0001F313",
+    "/waxingGibbousMoon": "\U0001F314",
+    "/fullMoon": "\U0001F315",
+    "/waningGibbousMoon": "\U0001F316",
+    "/lastQuarterMoon": "\U0001F317",
+    "/waningCrescentMoon": "\U0001F318",
+    "/crescentMoon": "\U0001F319",
+    "/newMoonFace": "\U0001F31A",
+    "/firstQuarterMoonFace": "\U0001F31B",
+    "/lastQuarterMoonFace": "\U0001F31C",
+    "/fullMoonFace": "\U0001F31D",
+    "/sunFace": "\U0001F31E",
+    "/glowingStar": "\U0001F31F",
+    "/shootingStar": "\U0001F320",
+    "/thermometer": "\U0001F321",
+    "/blackDroplet": "\U0001F322",
+    "/whiteSun": "\U0001F323",
+    "/whiteSunSmallCloud": "\U0001F324",
+    "/whiteSunBehindCloud": "\U0001F325",
+    "/whiteSunBehindCloudRain": "\U0001F326",
+    "/cloudRain": "\U0001F327",
+    "/cloudSnow": "\U0001F328",
+    "/cloudLightning": "\U0001F329",
+    "/cloudTornado": "\U0001F32A",
+    "/fog": "\U0001F32B",
+    "/windBlowingFace": "\U0001F32C",
+    "/hotDog": "\U0001F32D",
+    "/taco": "\U0001F32E",
+    "/burrito": "\U0001F32F",
+    "/chestnut": "\U0001F330",
+    "/seedling": "\U0001F331",
+    "/evergreenTree": "\U0001F332",
+    "/deciduousTree": "\U0001F333",
+    "/palmTree": "\U0001F334",
+    "/cactus": "\U0001F335",
+    "/hotPepper": "\U0001F336",
+    "/tulip": "\U0001F337",
+    "/cherryBlossom": "\U0001F338",
+    "/rose": "\U0001F339",
+    "/hibiscus": "\U0001F33A",
+    "/sunflower": "\U0001F33B",
+    "/blossom": "\U0001F33C",
+    "/earOfMaize": "\U0001F33D",
+    "/earOfRice": "\U0001F33E",
+    "/herb": "\U0001F33F",
+    "/fourLeafClover": "\U0001F340",
+    "/mapleLeaf": "\U0001F341",
+    "/fallenLeaf": "\U0001F342",
+    "/leafFlutteringInWind": "\U0001F343",
+    "/mushroom": "\U0001F344",
+    "/tomato": "\U0001F345",
+    "/aubergine": "\U0001F346",
+    "/grapes": "\U0001F347",
+    "/melon": "\U0001F348",
+    "/watermelon": "\U0001F349",
+    "/tangerine": "\U0001F34A",
+    "/lemon": "\U0001F34B",
+    "/banana": "\U0001F34C",
+    "/pineapple": "\U0001F34D",
+    "/redApple": "\U0001F34E",
+    "/greenApple": "\U0001F34F",
+    "/pear": "\U0001F350",
+    "/peach": "\U0001F351",
+    "/cherries": "\U0001F352",
+    "/strawberry": "\U0001F353",
+    "/hamburger": "\U0001F354",
+    "/sliceOfPizza": "\U0001F355",
+    "/meatOnBone": "\U0001F356",
+    "/poultryLeg": "\U0001F357",
+    "/riceCracker": "\U0001F358",
+    "/riceBall": "\U0001F359",
+    "/cookedRice": "\U0001F35A",
+    "/curryAndRice": "\U0001F35B",
+    "/steamingBowl": "\U0001F35C",
+    "/spaghetti": "\U0001F35D",
+    "/bread": "\U0001F35E",
+    "/frenchFries": "\U0001F35F",
+    "/roastedSweetPotato": "\U0001F360",
+    "/dango": "\U0001F361",
+    "/oden": "\U0001F362",
+    "/sushi": "\U0001F363",
+    "/friedShrimp": "\U0001F364",
+    "/fishCakeSwirlDesign": "\U0001F365",
+    "/softIceCream": "\U0001F366",
+    "/shavedIce": "\U0001F367",
+    "/iceCream": "\U0001F368",
+    "/doughnut": "\U0001F369",
+    "/cookie": "\U0001F36A",
+    "/chocolateBar": "\U0001F36B",
+    "/candy": "\U0001F36C",
+    "/lollipop": "\U0001F36D",
+    "/custard": "\U0001F36E",
+    "/honeyPot": "\U0001F36F",
+    "/shortcake": "\U0001F370",
+    "/bentoBox": "\U0001F371",
+    "/potOfFood": "\U0001F372",
+    "/cooking": "\U0001F373",
+    "/forkKnife": "\U0001F374",
+    "/teacupOutHandle": "\U0001F375",
+    "/sakeBottleAndCup": "\U0001F376",
+    "/wineGlass": "\U0001F377",
+    "/cocktailGlass": "\U0001F378",
+    "/tropicalDrink": "\U0001F379",
+    "/beerMug": "\U0001F37A",
+    "/clinkingBeerMugs": "\U0001F37B",
+    "/babyBottle": "\U0001F37C",
+    "/forkKnifePlate": "\U0001F37D",
+    "/bottlePoppingCork": "\U0001F37E",
+    "/popcorn": "\U0001F37F",
+    "/ribbon": "\U0001F380",
+    "/wrappedPresent": "\U0001F381",
+    "/birthdayCake": "\U0001F382",
+    "/jackOLantern": "\U0001F383",
+    "/christmasTree": "\U0001F384",
+    "/fatherChristmas": "\U0001F385",
+    "/fireworks": "\U0001F386",
+    "/fireworkSparkler": "\U0001F387",
+    "/balloon": "\U0001F388",
+    "/partyPopper": "\U0001F389",
+    "/confettiBall": "\U0001F38A",
+    "/tanabataTree": "\U0001F38B",
+    "/crossedFlags": "\U0001F38C",
+    "/pineDecoration": "\U0001F38D",
+    "/japaneseDolls": "\U0001F38E",
+    "/carpStreamer": "\U0001F38F",
+    "/windChime": "\U0001F390",
+    "/moonViewingCeremony": "\U0001F391",
+    "/schoolSatchel": "\U0001F392",
+    "/graduationCap": "\U0001F393",
+    "/heartTipOnTheLeft": "\U0001F394",
+    "/bouquetOfFlowers": "\U0001F395",
+    "/militaryMedal": "\U0001F396",
+    "/reminderRibbon": "\U0001F397",
+    "/musicalKeyboardJacks": "\U0001F398",
+    "/studioMicrophone": "\U0001F399",
+    "/levelSlider": "\U0001F39A",
+    "/controlKnobs": "\U0001F39B",
+    "/beamedAscendingMusicalNotes": "\U0001F39C",
+    "/beamedDescendingMusicalNotes": "\U0001F39D",
+    "/filmFrames": "\U0001F39E",
+    "/admissionTickets": "\U0001F39F",
+    "/carouselHorse": "\U0001F3A0",
+    "/ferrisWheel": "\U0001F3A1",
+    "/rollerCoaster": "\U0001F3A2",
+    "/fishingPoleAndFish": "\U0001F3A3",
+    "/microphone": "\U0001F3A4",
+    "/movieCamera": "\U0001F3A5",
+    "/cinema": "\U0001F3A6",
+    "/headphone": "\U0001F3A7",
+    "/artistPalette": "\U0001F3A8",
+    "/topHat": "\U0001F3A9",
+    "/circusTent": "\U0001F3AA",
+    "/ticket": "\U0001F3AB",
+    "/clapperBoard": "\U0001F3AC",
+    "/performingArts": "\U0001F3AD",
+    "/videoGame": "\U0001F3AE",
+    "/directHit": "\U0001F3AF",
+    "/slotMachine": "\U0001F3B0",
+    "/billiards": "\U0001F3B1",
+    "/gameDie": "\U0001F3B2",
+    "/bowling": "\U0001F3B3",
+    "/flowerPlayingCards": "\U0001F3B4",
+    "/musicalNote": "\U0001F3B5",
+    "/multipleMusicalNotes": "\U0001F3B6",
+    "/saxophone": "\U0001F3B7",
+    "/guitar": "\U0001F3B8",
+    "/musicalKeyboard": "\U0001F3B9",
+    "/trumpet": "\U0001F3BA",
+    "/violin": "\U0001F3BB",
+    "/musicalScore": "\U0001F3BC",
+    "/runningShirtSash": "\U0001F3BD",
+    "/tennisRacquetAndBall": "\U0001F3BE",
+    "/skiAndSkiBoot": "\U0001F3BF",
+    "/basketballAndHoop": "\U0001F3C0",
+    "/chequeredFlag": "\U0001F3C1",
+    "/snowboarder": "\U0001F3C2",
+    "/runner": "\U0001F3C3",
+    "/surfer": "\U0001F3C4",
+    "/sportsMedal": "\U0001F3C5",
+    "/trophy": "\U0001F3C6",
+    "/horseRacing": "\U0001F3C7",
+    "/americanFootball": "\U0001F3C8",
+    "/rugbyFootball": "\U0001F3C9",
+    "/swimmer": "\U0001F3CA",
+    "/weightLifter": "\U0001F3CB",
+    "/golfer": "\U0001F3CC",
+    "/racingMotorcycle": "\U0001F3CD",
+    "/racingCar": "\U0001F3CE",
+    "/cricketBatAndBall": "\U0001F3CF",
+    "/volleyball": "\U0001F3D0",
+    "/fieldHockeyStickAndBall": "\U0001F3D1",
+    "/iceHockeyStickAndPuck": "\U0001F3D2",
+    "/tableTennisPaddleAndBall": "\U0001F3D3",
+    "/snowcappedMountain": "\U0001F3D4",
+    "/camping": "\U0001F3D5",
+    "/beachUmbrella": "\U0001F3D6",
+    "/buildingConstruction": "\U0001F3D7",
+    "/houseBuildings": "\U0001F3D8",
+    "/cityscape": "\U0001F3D9",
+    "/derelictHouseBuilding": "\U0001F3DA",
+    "/classicalBuilding": "\U0001F3DB",
+    "/desert": "\U0001F3DC",
+    "/desertIsland": "\U0001F3DD",
+    "/nationalPark": "\U0001F3DE",
+    "/stadium": "\U0001F3DF",
+    "/houseBuilding": "\U0001F3E0",
+    "/houseGarden": "\U0001F3E1",
+    "/officeBuilding": "\U0001F3E2",
+    "/japanesePostOffice": "\U0001F3E3",
+    "/europeanPostOffice": "\U0001F3E4",
+    "/hospital": "\U0001F3E5",
+    "/bank": "\U0001F3E6",
+    "/automatedTellerMachine": "\U0001F3E7",
+    "/hotel": "\U0001F3E8",
+    "/loveHotel": "\U0001F3E9",
+    "/convenienceStore": "\U0001F3EA",
+    "/school": "\U0001F3EB",
+    "/departmentStore": "\U0001F3EC",
+    "/factory": "\U0001F3ED",
+    "/izakayaLantern": "\U0001F3EE",
+    "/japaneseCastle": "\U0001F3EF",
+    "/europeanCastle": "\U0001F3F0",
+    "/whitePennant": "\U0001F3F1",
+    "/blackPennant": "\U0001F3F2",
+    "/wavingWhiteFlag": "\U0001F3F3",
+    "/wavingBlackFlag": "\U0001F3F4",
+    "/rosette": "\U0001F3F5",
+    "/blackRosette": "\U0001F3F6",
+    "/label": "\U0001F3F7",
+    "/badmintonRacquetAndShuttlecock": "\U0001F3F8",
+    "/bowAndArrow": "\U0001F3F9",
+    "/amphora": "\U0001F3FA",
+    "/fitzPatrickType12": "\U0001F3FB",
+    "/fitzPatrickType3": "\U0001F3FC",
+    "/fitzPatrickType4": "\U0001F3FD",
+    "/fitzPatrickType5": "\U0001F3FE",
+    "/fitzPatrickType6": "\U0001F3FF",
+    "/rat": "\U0001F400",
+    "/mouse": "\U0001F401",
+    "/ox": "\U0001F402",
+    "/waterBuffalo": "\U0001F403",
+    "/cow": "\U0001F404",
+    "/tiger": "\U0001F405",
+    "/leopard": "\U0001F406",
+    "/rabbit": "\U0001F407",
+    "/cat": "\U0001F408",
+    "/dragon": "\U0001F409",
+    "/crocodile": "\U0001F40A",
+    "/whale": "\U0001F40B",
+    "/snail": "\U0001F40C",
+    "/snake": "\U0001F40D",
+    "/horse": "\U0001F40E",
+    "/ram": "\U0001F40F",
+    "/goat": "\U0001F410",
+    "/sheep": "\U0001F411",
+    "/monkey": "\U0001F412",
+    "/rooster": "\U0001F413",
+    "/chicken": "\U0001F414",
+    "/dog": "\U0001F415",
+    "/pig": "\U0001F416",
+    "/boar": "\U0001F417",
+    "/elephant": "\U0001F418",
+    "/octopus": "\U0001F419",
+    "/spiralShell": "\U0001F41A",
+    "/bug": "\U0001F41B",
+    "/ant": "\U0001F41C",
+    "/honeybee": "\U0001F41D",
+    "/ladyBeetle": "\U0001F41E",
+    "/fish": "\U0001F41F",
+    "/tropicalFish": "\U0001F420",
+    "/blowfish": "\U0001F421",
+    "/turtle": "\U0001F422",
+    "/hatchingChick": "\U0001F423",
+    "/babyChick": "\U0001F424",
+    "/frontFacingBabyChick": "\U0001F425",
+    "/bird": "\U0001F426",
+    "/penguin": "\U0001F427",
+    "/koala": "\U0001F428",
+    "/poodle": "\U0001F429",
+    "/dromedaryCamel": "\U0001F42A",
+    "/bactrianCamel": "\U0001F42B",
+    "/dolphin": "\U0001F42C",
+    "/mouseFace": "\U0001F42D",
+    "/cowFace": "\U0001F42E",
+    "/tigerFace": "\U0001F42F",
+    "/rabbitFace": "\U0001F430",
+    "/catFace": "\U0001F431",
+    "/dragonFace": "\U0001F432",
+    "/spoutingWhale": "\U0001F433",
+    "/horseFace": "\U0001F434",
+    "/monkeyFace": "\U0001F435",
+    "/dogFace": "\U0001F436",
+    "/pigFace": "\U0001F437",
+    "/frogFace": "\U0001F438",
+    "/hamsterFace": "\U0001F439",
+    "/wolfFace": "\U0001F43A",
+    "/bearFace": "\U0001F43B",
+    "/pandaFace": "\U0001F43C",
+    "/pigNose": "\U0001F43D",
+    "/pawPrints": "\U0001F43E",
+    "/chipmunk": "\U0001F43F",
+    "/eyes": "\U0001F440",
+    "/eye": "\U0001F441",
+    "/ear": "\U0001F442",
+    "/nose": "\U0001F443",
+    "/mouth": "\U0001F444",
+    "/tongue": "\U0001F445",
+    "/whiteUpPointingBackhandIndex": "\U0001F446",
+    "/whiteDownPointingBackhandIndex": "\U0001F447",
+    "/whiteLeftPointingBackhandIndex": "\U0001F448",
+    "/whiteRightPointingBackhandIndex": "\U0001F449",
+    "/fistedHandSign": "\U0001F44A",
+    "/wavingHandSign": "\U0001F44B",
+    "/okHandSign": "\U0001F44C",
+    "/thumbsUpSign": "\U0001F44D",
+    "/thumbsDownSign": "\U0001F44E",
+    "/clappingHandsSign": "\U0001F44F",
+    "/openHandsSign": "\U0001F450",
+    "/crown": "\U0001F451",
+    "/womansHat": "\U0001F452",
+    "/eyeglasses": "\U0001F453",
+    "/necktie": "\U0001F454",
+    "/tShirt": "\U0001F455",
+    "/jeans": "\U0001F456",
+    "/dress": "\U0001F457",
+    "/kimono": "\U0001F458",
+    "/bikini": "\U0001F459",
+    "/womansClothes": "\U0001F45A",
+    "/purse": "\U0001F45B",
+    "/handbag": "\U0001F45C",
+    "/pouch": "\U0001F45D",
+    "/mansShoe": "\U0001F45E",
+    "/athleticShoe": "\U0001F45F",
+    "/highHeeledShoe": "\U0001F460",
+    "/womansSandal": "\U0001F461",
+    "/womansBoots": "\U0001F462",
+    "/footprints": "\U0001F463",
+    "/bustInSilhouette": "\U0001F464",
+    "/bustsInSilhouette": "\U0001F465",
+    "/boy": "\U0001F466",
+    "/girl": "\U0001F467",
+    "/man": "\U0001F468",
+    "/woman": "\U0001F469",
+    "/family": "\U0001F46A",
+    "/manAndWomanHoldingHands": "\U0001F46B",
+    "/twoMenHoldingHands": "\U0001F46C",
+    "/twoWomenHoldingHands": "\U0001F46D",
+    "/policeOfficer": "\U0001F46E",
+    "/womanBunnyEars": "\U0001F46F",
+    "/brideVeil": "\U0001F470",
+    "/personBlondHair": "\U0001F471",
+    "/manGuaPiMao": "\U0001F472",
+    "/manTurban": "\U0001F473",
+    "/olderMan": "\U0001F474",
+    "/olderWoman": "\U0001F475",
+    "/misc:baby": "\U0001F476",
+    "/constructionWorker": "\U0001F477",
+    "/princess": "\U0001F478",
+    "/japaneseOgre": "\U0001F479",
+    "/japaneseGoblin": "\U0001F47A",
+    "/ghost": "\U0001F47B",
+    "/babyAngel": "\U0001F47C",
+    "/extraterrestrialAlien": "\U0001F47D",
+    "/alienMonster": "\U0001F47E",
+    "/imp": "\U0001F47F",
+    "/skull": "\U0001F480",
+    "/inmationDeskPerson": "\U0001F481",
+    "/guardsman": "\U0001F482",
+    "/dancer": "\U0001F483",
+    "/lipstick": "\U0001F484",
+    "/nailPolish": "\U0001F485",
+    "/faceMassage": "\U0001F486",
+    "/haircut": "\U0001F487",
+    "/barberPole": "\U0001F488",
+    "/syringe": "\U0001F489",
+    "/pill": "\U0001F48A",
+    "/kissMark": "\U0001F48B",
+    "/loveLetter": "\U0001F48C",
+    "/misc:ring": "\U0001F48D",
+    "/gemStone": "\U0001F48E",
+    "/kiss": "\U0001F48F",
+    "/bouquet": "\U0001F490",
+    "/coupleHeart": "\U0001F491",
+    "/wedding": "\U0001F492",
+    "/beatingHeart": "\U0001F493",
+    "/brokenHeart": "\U0001F494",
+    "/twoHearts": "\U0001F495",
+    "/sparklingHeart": "\U0001F496",
+    "/growingHeart": "\U0001F497",
+    "/heartArrow": "\U0001F498",
+    "/blueHeart": "\U0001F499",
+    "/greenHeart": "\U0001F49A",
+    "/yellowHeart": "\U0001F49B",
+    "/purpleHeart": "\U0001F49C",
+    "/heartRibbon": "\U0001F49D",
+    "/revolvingHearts": "\U0001F49E",
+    "/heartDecoration": "\U0001F49F",
+    "/diamondShapeADotInside": "\U0001F4A0",
+    "/electricLightBulb": "\U0001F4A1",
+    "/anger": "\U0001F4A2",
+    "/bomb": "\U0001F4A3",
+    "/sleeping": "\U0001F4A4",
+    "/collision": "\U0001F4A5",
+    "/splashingSweat": "\U0001F4A6",
+    "/droplet": "\U0001F4A7",
+    "/misc:dash": "\U0001F4A8",
+    "/pileOfPoo": "\U0001F4A9",
+    "/flexedBiceps": "\U0001F4AA",
+    "/dizzy": "\U0001F4AB",
+    "/speechBalloon": "\U0001F4AC",
+    "/thoughtBalloon": "\U0001F4AD",
+    "/whiteFlower": "\U0001F4AE",
+    "/hundredPoints": "\U0001F4AF",
+    "/moneyBag": "\U0001F4B0",
+    "/currencyExchange": "\U0001F4B1",
+    "/heavyDollarSign": "\U0001F4B2",
+    "/creditCard": "\U0001F4B3",
+    "/banknoteYenSign": "\U0001F4B4",
+    "/banknoteDollarSign": "\U0001F4B5",
+    "/banknoteEuroSign": "\U0001F4B6",
+    "/banknotePoundSign": "\U0001F4B7",
+    "/moneyWings": "\U0001F4B8",
+    "/chartUpTrendAndYenSign": "\U0001F4B9",
+    "/seat": "\U0001F4BA",
+    "/personalComputer": "\U0001F4BB",
+    "/briefcase": "\U0001F4BC",
+    "/minidisc": "\U0001F4BD",
+    "/floppyDisk": "\U0001F4BE",
+    "/opticalDisc": "\U0001F4BF",
+    "/dvd": "\U0001F4C0",
+    "/fileFolder": "\U0001F4C1",
+    "/openFileFolder": "\U0001F4C2",
+    "/pageCurl": "\U0001F4C3",
+    "/pageFacingUp": "\U0001F4C4",
+    "/calendar": "\U0001F4C5",
+    "/tearOffCalendar": "\U0001F4C6",
+    "/cardIndex": "\U0001F4C7",
+    "/chartUpTrend": "\U0001F4C8",
+    "/chartDownTrend": "\U0001F4C9",
+    "/barChart": "\U0001F4CA",
+    "/clipboard": "\U0001F4CB",
+    "/pushpin": "\U0001F4CC",
+    "/roundPushpin": "\U0001F4CD",
+    "/paperclip": "\U0001F4CE",
+    "/straightRuler": "\U0001F4CF",
+    "/triangularRuler": "\U0001F4D0",
+    "/bookmarkTabs": "\U0001F4D1",
+    "/ledger": "\U0001F4D2",
+    "/notebook": "\U0001F4D3",
+    "/notebookDecorativeCover": "\U0001F4D4",
+    "/closedBook": "\U0001F4D5",
+    "/openBook": "\U0001F4D6",
+    "/greenBook": "\U0001F4D7",
+    "/blueBook": "\U0001F4D8",
+    "/orangeBook": "\U0001F4D9",
+    "/books": "\U0001F4DA",
+    "/nameBadge": "\U0001F4DB",
+    "/scroll": "\U0001F4DC",
+    "/memo": "\U0001F4DD",
+    "/telephoneReceiver": "\U0001F4DE",
+    "/pager": "\U0001F4DF",
+    "/faxMachine": "\U0001F4E0",
+    "/satelliteAntenna": "\U0001F4E1",
+    "/publicAddressLoudspeaker": "\U0001F4E2",
+    "/cheeringMegaphone": "\U0001F4E3",
+    "/outboxTray": "\U0001F4E4",
+    "/inboxTray": "\U0001F4E5",
+    "/package": "\U0001F4E6",
+    "/eMail": "\U0001F4E7",
+    "/incomingEnvelope": "\U0001F4E8",
+    "/envelopeDownArrowAbove": "\U0001F4E9",
+    "/closedMailboxLoweredFlag": "\U0001F4EA",
+    "/closedMailboxRaisedFlag": "\U0001F4EB",
+    "/openMailboxRaisedFlag": "\U0001F4EC",
+    "/openMailboxLoweredFlag": "\U0001F4ED",
+    "/postbox": "\U0001F4EE",
+    "/postalHorn": "\U0001F4EF",
+    "/newspaper": "\U0001F4F0",
+    "/mobilePhone": "\U0001F4F1",
+    "/mobilePhoneRightwardsArrowAtLeft": "\U0001F4F2",
+    "/vibrationMode": "\U0001F4F3",
+    "/mobilePhoneOff": "\U0001F4F4",
+    "/noMobilePhones": "\U0001F4F5",
+    "/antennaBars": "\U0001F4F6",
+    "/camera": "\U0001F4F7",
+    "/cameraFlash": "\U0001F4F8",
+    "/videoCamera": "\U0001F4F9",
+    "/television": "\U0001F4FA",
+    "/radio": "\U0001F4FB",
+    "/videocassette": "\U0001F4FC",
+    "/filmProjector": "\U0001F4FD",
+    "/portableStereo": "\U0001F4FE",
+    "/prayerBeads": "\U0001F4FF",
+    "/twistedRightwardsArrows": "\U0001F500",
+    "/clockwiseRightwardsAndLeftwardsOpenCircleArrows": "\U0001F501",
+    "/clockwiseRightwardsAndLeftwardsOpenCircleArrowsCircledOneOverlay": "\U0001F502",
+    "/clockwiseDownAndUpOpenCircleArrows": "\U0001F503",
+    "/anticlockwiseDownAndUpOpenCircleArrows": "\U0001F504",
+    "/lowBrightness": "\U0001F505",
+    "/highBrightness": "\U0001F506",
+    "/speakerCancellationStroke": "\U0001F507",
+    "/speaker": "\U0001F508",
+    "/speakerOneSoundWave": "\U0001F509",
+    "/speakerThreeSoundWaves": "\U0001F50A",
+    "/battery": "\U0001F50B",
+    "/electricPlug": "\U0001F50C",
+    "/leftPointingMagnifyingGlass": "\U0001F50D",
+    "/rightPointingMagnifyingGlass": "\U0001F50E",
+    "/lockInkPen": "\U0001F50F",
+    "/closedLockKey": "\U0001F510",
+    "/key": "\U0001F511",
+    "/lock": "\U0001F512",
+    "/openLock": "\U0001F513",
+    "/bellsymbol": "\U0001F514",
+    "/bellsymbolCancellationStroke": "\U0001F515",
+    "/bookmark": "\U0001F516",
+    "/link": "\U0001F517",
+    "/radioButton": "\U0001F518",
+    "/backLeftwardsArrowAbove": "\U0001F519",
+    "/endLeftwardsArrowAbove": "\U0001F51A",
+    "/onExclamationMarkLeftRightArrowAbove": "\U0001F51B",
+    "/soonRightwardsArrowAbove": "\U0001F51C",
+    "/topUpArrowAbove": "\U0001F51D",
+    "/noOneUnderEighteen": "\U0001F51E",
+    "/keycapTen": "\U0001F51F",
+    "/inputCapLatin": "\U0001F520",
+    "/inputSmallLatin": "\U0001F521",
+    "/inputNumbers": "\U0001F522",
+    "/inputSymbols": "\U0001F523",
+    "/inputLatin": "\U0001F524",
+    "/fire": "\U0001F525",
+    "/electricTorch": "\U0001F526",
+    "/wrench": "\U0001F527",
+    "/hammer": "\U0001F528",
+    "/nutAndBolt": "\U0001F529",
+    "/hocho": "\U0001F52A",
+    "/pistol": "\U0001F52B",
+    "/microscope": "\U0001F52C",
+    "/telescope": "\U0001F52D",
+    "/crystalBall": "\U0001F52E",
+    "/sixPointedStarMiddleDot": "\U0001F52F",
+    "/japaneseBeginner": "\U0001F530",
+    "/tridentEmblem": "\U0001F531",
+    "/blackSquareButton": "\U0001F532",
+    "/whiteSquareButton": "\U0001F533",
+    "/largeRedCircle": "\U0001F534",
+    "/largeBlueCircle": "\U0001F535",
+    "/largeOrangeDiamond": "\U0001F536",
+    "/largeBlueDiamond": "\U0001F537",
+    "/smallOrangeDiamond": "\U0001F538",
+    "/smallBlueDiamond": "\U0001F539",
+    "/upPointingRedTriangle": "\U0001F53A",
+    "/downPointingRedTriangle": "\U0001F53B",
+    "/upPointingSmallRedTriangle": "\U0001F53C",
+    "/downPointingSmallRedTriangle": "\U0001F53D",
+    "/lowerRightShadowedWhiteCircle": "\U0001F53E",
+    "/upperRightShadowedWhiteCircle": "\U0001F53F",
+    "/circledCrossPommee": "\U0001F540",
+    "/crossPommeeHalfCircleBelow": "\U0001F541",
+    "/crossPommee": "\U0001F542",
+    "/notchedLeftSemicircleThreeDots": "\U0001F543",
+    "/notchedRightSemicircleThreeDots": "\U0001F544",
+    "/marksChapter": "\U0001F545",
+    "/whiteLatinCross": "\U0001F546",
+    "/heavyLatinCross": "\U0001F547",
+    "/celticCross": "\U0001F548",
+    "/om": "\U0001F549",
+    "/doveOfPeace": "\U0001F54A",
+    "/kaaba": "\U0001F54B",
+    "/mosque": "\U0001F54C",
+    "/synagogue": "\U0001F54D",
+    "/menorahNineBranches": "\U0001F54E",
+    "/bowlOfHygieia": "\U0001F54F",
+    "/clockOne": "\U0001F550",
+    "/clockTwo": "\U0001F551",
+    "/clockThree": "\U0001F552",
+    "/clockFour": "\U0001F553",
+    "/clockFive": "\U0001F554",
+    "/clockSix": "\U0001F555",
+    "/clockSeven": "\U0001F556",
+    "/clockEight": "\U0001F557",
+    "/clockNine": "\U0001F558",
+    "/clockTen": "\U0001F559",
+    "/clockEleven": "\U0001F55A",
+    "/clockTwelve": "\U0001F55B",
+    "/clockOneThirty": "\U0001F55C",
+    "/clockTwoThirty": "\U0001F55D",
+    "/clockThreeThirty": "\U0001F55E",
+    "/clockFourThirty": "\U0001F55F",
+    "/clockFiveThirty": "\U0001F560",
+    "/clockSixThirty": "\U0001F561",
+    "/clockSevenThirty": "\U0001F562",
+    "/clockEightThirty": "\U0001F563",
+    "/clockNineThirty": "\U0001F564",
+    "/clockTenThirty": "\U0001F565",
+    "/clockElevenThirty": "\U0001F566",
+    "/clockTwelveThirty": "\U0001F567",
+    "/rightSpeaker": "\U0001F568",
+    "/rightSpeakerOneSoundWave": "\U0001F569",
+    "/rightSpeakerThreeSoundWaves": "\U0001F56A",
+    "/bullhorn": "\U0001F56B",
+    "/bullhornSoundWaves": "\U0001F56C",
+    "/ringingBellsymbol": "\U0001F56D",
+    "/book": "\U0001F56E",
+    "/candle": "\U0001F56F",
+    "/mantelpieceClock": "\U0001F570",
+    "/blackSkullAndCrossbones": "\U0001F571",
+    "/noPiracy": "\U0001F572",
+    "/hole": "\U0001F573",
+    "/manInBusinessSuitLevitating": "\U0001F574",
+    "/sleuthOrSpy": "\U0001F575",
+    "/darkSunglasses": "\U0001F576",
+    "/spider": "\U0001F577",
+    "/spiderWeb": "\U0001F578",
+    "/joystick": "\U0001F579",
+    "/manDancing": "\U0001F57A",
+    "/leftHandTelephoneReceiver": "\U0001F57B",
+    "/telephoneReceiverPage": "\U0001F57C",
+    "/rightHandTelephoneReceiver": "\U0001F57D",
+    "/whiteTouchtoneTelephone": "\U0001F57E",
+    "/blackTouchtoneTelephone": "\U0001F57F",
+    "/telephoneOnTopOfModem": "\U0001F580",
+    "/clamshellMobilePhone": "\U0001F581",
+    "/backOfEnvelope": "\U0001F582",
+    "/stampedEnvelope": "\U0001F583",
+    "/envelopeLightning": "\U0001F584",
+    "/flyingEnvelope": "\U0001F585",
+    "/penOverStampedEnvelope": "\U0001F586",
+    "/linkedPaperclips": "\U0001F587",
+    "/blackPushpin": "\U0001F588",
+    "/lowerLeftPencil": "\U0001F589",
+    "/lowerLeftBallpointPen": "\U0001F58A",
+    "/lowerLeftFountainPen": "\U0001F58B",
+    "/lowerLeftPaintbrush": "\U0001F58C",
+    "/lowerLeftCrayon": "\U0001F58D",
+    "/leftWritingHand": "\U0001F58E",
+    "/turnedOkHandSign": "\U0001F58F",
+    "/raisedHandFingersSplayed": "\U0001F590",
+    "/reversedRaisedHandFingersSplayed": "\U0001F591",
+    "/reversedThumbsUpSign": "\U0001F592",
+    "/reversedThumbsDownSign": "\U0001F593",
+    "/reversedVictoryHand": "\U0001F594",
+    "/reversedHandMiddleFingerExtended": "\U0001F595",
+    "/raisedHandPartBetweenMiddleAndRingFingers": "\U0001F596",
+    "/whiteDownPointingLeftHandIndex": "\U0001F597",
+    "/sidewaysWhiteLeftPointingIndex": "\U0001F598",
+    "/sidewaysWhiteRightPointingIndex": "\U0001F599",
+    "/sidewaysBlackLeftPointingIndex": "\U0001F59A",
+    "/sidewaysBlackRightPointingIndex": "\U0001F59B",
+    "/blackLeftPointingBackhandIndex": "\U0001F59C",
+    "/blackRightPointingBackhandIndex": "\U0001F59D",
+    "/sidewaysWhiteUpPointingIndex": "\U0001F59E",
+    "/sidewaysWhiteDownPointingIndex": "\U0001F59F",
+    "/sidewaysBlackUpPointingIndex": "\U0001F5A0",
+    "/sidewaysBlackDownPointingIndex": "\U0001F5A1",
+    "/blackUpPointingBackhandIndex": "\U0001F5A2",
+    "/blackDownPointingBackhandIndex": "\U0001F5A3",
+    "/blackHeart": "\U0001F5A4",
+    "/desktopComputer": "\U0001F5A5",
+    "/keyboardAndMouse": "\U0001F5A6",
+    "/threeNetworkedComputers": "\U0001F5A7",
+    "/printer": "\U0001F5A8",
+    "/pocketCalculator": "\U0001F5A9",
+    "/blackHardShellFloppyDisk": "\U0001F5AA",
+    "/whiteHardShellFloppyDisk": "\U0001F5AB",
+    "/softShellFloppyDisk": "\U0001F5AC",
+    "/tapeCartridge": "\U0001F5AD",
+    "/wiredKeyboard": "\U0001F5AE",
+    "/oneButtonMouse": "\U0001F5AF",
+    "/twoButtonMouse": "\U0001F5B0",
+    "/threeButtonMouse": "\U0001F5B1",
+    "/trackball": "\U0001F5B2",
+    "/oldPersonalComputer": "\U0001F5B3",
+    "/hardDisk": "\U0001F5B4",
+    "/screen": "\U0001F5B5",
+    "/printerIcon": "\U0001F5B6",
+    "/faxIcon": "\U0001F5B7",
+    "/opticalDiscIcon": "\U0001F5B8",
+    "/documentText": "\U0001F5B9",
+    "/documentTextAndPicture": "\U0001F5BA",
+    "/documentPicture": "\U0001F5BB",
+    "/framePicture": "\U0001F5BC",
+    "/frameTiles": "\U0001F5BD",
+    "/frameAnX": "\U0001F5BE",
+    "/blackFolder": "\U0001F5BF",
+    "/folder": "\U0001F5C0",
+    "/openFolder": "\U0001F5C1",
+    "/cardIndexDividers": "\U0001F5C2",
+    "/cardFileBox": "\U0001F5C3",
+    "/fileCabinet": "\U0001F5C4",
+    "/emptyNote": "\U0001F5C5",
+    "/emptyNotePage": "\U0001F5C6",
+    "/emptyNotePad": "\U0001F5C7",
+    "/note": "\U0001F5C8",
+    "/notePage": "\U0001F5C9",
+    "/notePad": "\U0001F5CA",
+    "/emptyDocument": "\U0001F5CB",
+    "/emptyPage": "\U0001F5CC",
+    "/emptyPages": "\U0001F5CD",
+    "/document": "\U0001F5CE",
+    "/page": "\U0001F5CF",
+    "/pages": "\U0001F5D0",
+    "/wastebasket": "\U0001F5D1",
+    "/spiralNotePad": "\U0001F5D2",
+    "/spiralCalendarPad": "\U0001F5D3",
+    "/desktopWindow": "\U0001F5D4",
+    "/minimize": "\U0001F5D5",
+    "/maximize": "\U0001F5D6",
+    "/overlap": "\U0001F5D7",
+    "/clockwiseRightAndLeftSemicircleArrows": "\U0001F5D8",
+    "/cancellationX": "\U0001F5D9",
+    "/increaseFontSize": "\U0001F5DA",
+    "/decreaseFontSize": "\U0001F5DB",
+    "/compression": "\U0001F5DC",
+    "/oldKey": "\U0001F5DD",
+    "/rolledUpNewspaper": "\U0001F5DE",
+    "/pageCircledText": "\U0001F5DF",
+    "/stockChart": "\U0001F5E0",
+    "/daggerKnife": "\U0001F5E1",
+    "/lips": "\U0001F5E2",
+    "/speakingHeadInSilhouette": "\U0001F5E3",
+    "/threeRaysAbove": "\U0001F5E4",
+    "/threeRaysBelow": "\U0001F5E5",
+    "/threeRaysLeft": "\U0001F5E6",
+    "/threeRaysRight": "\U0001F5E7",
+    "/leftSpeechBubble": "\U0001F5E8",
+    "/rightSpeechBubble": "\U0001F5E9",
+    "/twoSpeechBubbles": "\U0001F5EA",
+    "/threeSpeechBubbles": "\U0001F5EB",
+    "/leftThoughtBubble": "\U0001F5EC",
+    "/rightThoughtBubble": "\U0001F5ED",
+    "/leftAngerBubble": "\U0001F5EE",
+    "/rightAngerBubble": "\U0001F5EF",
+    "/moodBubble": "\U0001F5F0",
+    "/lightningMoodBubble": "\U0001F5F1",
+    "/lightningMood": "\U0001F5F2",
+    "/ballotBoxBallot": "\U0001F5F3",
+    "/ballotScriptX": "\U0001F5F4",
+    "/ballotBoxScriptX": "\U0001F5F5",
+    "/ballotBoldScriptX": "\U0001F5F6",
+    "/ballotBoxBoldScriptX": "\U0001F5F7",
+    "/lightCheckMark": "\U0001F5F8",
+    "/ballotBoxBoldCheck": "\U0001F5F9",
+    "/worldMap": "\U0001F5FA",
+    "/mountFuji": "\U0001F5FB",
+    "/tokyoTower": "\U0001F5FC",
+    "/statueOfLiberty": "\U0001F5FD",
+    "/silhouetteOfJapan": "\U0001F5FE",
+    "/moyai": "\U0001F5FF",
+    "/grinningFace": "\U0001F600",
+    "/grinningFaceWithSmilingEyes": "\U0001F601",
+    "/faceWithTearsOfJoy": "\U0001F602",
+    "/smilingFaceWithOpenMouth": "\U0001F603",
+    "/smilingFaceWithOpenMouthAndSmilingEyes": "\U0001F604",
+    "/smilingFaceWithOpenMouthAndColdSweat": "\U0001F605",
+    "/smilingFaceWithOpenMouthAndTightlyClosedEyes": "\U0001F606",
+    "/smilingFaceWithHalo": "\U0001F607",
+    "/smilingFaceWithHorns": "\U0001F608",
+    "/winkingFace": "\U0001F609",
+    "/smilingFaceWithSmilingEyes": "\U0001F60A",
+    "/faceSavouringDeliciousFood": "\U0001F60B",
+    "/relievedFace": "\U0001F60C",
+    "/smilingFaceWithHeartShapedEyes": "\U0001F60D",
+    "/smilingFaceWithSunglasses": "\U0001F60E",
+    "/smirkingFace": "\U0001F60F",
+    "/neutralFace": "\U0001F610",
+    "/expressionlessFace": "\U0001F611",
+    "/unamusedFace": "\U0001F612",
+    "/faceWithColdSweat": "\U0001F613",
+    "/pensiveFace": "\U0001F614",
+    "/confusedFace": "\U0001F615",
+    "/confoundedFace": "\U0001F616",
+    "/kissingFace": "\U0001F617",
+    "/faceThrowingAKiss": "\U0001F618",
+    "/kissingFaceWithSmilingEyes": "\U0001F619",
+    "/kissingFaceWithClosedEyes": "\U0001F61A",
+    "/faceWithStuckOutTongue": "\U0001F61B",
+    "/faceWithStuckOutTongueAndWinkingEye": "\U0001F61C",
+    "/faceWithStuckOutTongueAndTightlyClosedEyes": "\U0001F61D",
+    "/disappointedFace": "\U0001F61E",
+    "/worriedFace": "\U0001F61F",
+    "/angryFace": "\U0001F620",
+    "/poutingFace": "\U0001F621",
+    "/cryingFace": "\U0001F622",
+    "/perseveringFace": "\U0001F623",
+    "/faceWithLookOfTriumph": "\U0001F624",
+    "/disappointedButRelievedFace": "\U0001F625",
+    "/frowningFaceWithOpenMouth": "\U0001F626",
+    "/anguishedFace": "\U0001F627",
+    "/fearfulFace": "\U0001F628",
+    "/wearyFace": "\U0001F629",
+    "/sleepyFace": "\U0001F62A",
+    "/tiredFace": "\U0001F62B",
+    "/grimacingFace": "\U0001F62C",
+    "/loudlyCryingFace": "\U0001F62D",
+    "/faceWithOpenMouth": "\U0001F62E",
+    "/hushedFace": "\U0001F62F",
+    "/faceWithOpenMouthAndColdSweat": "\U0001F630",
+    "/faceScreamingInFear": "\U0001F631",
+    "/astonishedFace": "\U0001F632",
+    "/flushedFace": "\U0001F633",
+    "/sleepingFace": "\U0001F634",
+    "/dizzyFace": "\U0001F635",
+    "/faceWithoutMouth": "\U0001F636",
+    "/faceWithMedicalMask": "\U0001F637",
+    "/grinningCatFaceWithSmilingEyes": "\U0001F638",
+    "/catFaceWithTearsOfJoy": "\U0001F639",
+    "/smilingCatFaceWithOpenMouth": "\U0001F63A",
+    "/smilingCatFaceWithHeartShapedEyes": "\U0001F63B",
+    "/catFaceWithWrySmile": "\U0001F63C",
+    "/kissingCatFaceWithClosedEyes": "\U0001F63D",
+    "/poutingCatFace": "\U0001F63E",
+    "/cryingCatFace": "\U0001F63F",
+    "/wearyCatFace": "\U0001F640",
+    "/slightlyFrowningFace": "\U0001F641",
+    "/slightlySmilingFace": "\U0001F642",
+    "/upsideDownFace": "\U0001F643",
+    "/faceWithRollingEyes": "\U0001F644",
+    "/faceWithNoGoodGesture": "\U0001F645",
+    "/faceWithOkGesture": "\U0001F646",
+    "/personBowingDeeply": "\U0001F647",
+    "/seeNoEvilMonkey": "\U0001F648",
+    "/hearNoEvilMonkey": "\U0001F649",
+    "/speakNoEvilMonkey": "\U0001F64A",
+    "/happyPersonRaisingOneHand": "\U0001F64B",
+    "/personRaisingBothHandsInCelebration": "\U0001F64C",
+    "/personFrowning": "\U0001F64D",
+    "/personWithPoutingFace": "\U0001F64E",
+    "/personWithFoldedHands": "\U0001F64F",
+    "/rocket": "\U0001F680",
+    "/helicopter": "\U0001F681",
+    "/steamLocomotive": "\U0001F682",
+    "/railwayCar": "\U0001F683",
+    "/highSpeedTrain": "\U0001F684",
+    "/highSpeedTrainWithBulletNose": "\U0001F685",
+    "/train": "\U0001F686",
+    "/metro": "\U0001F687",
+    "/lightRail": "\U0001F688",
+    "/station": "\U0001F689",
+    "/tram": "\U0001F68A",
+    "/tramCar": "\U0001F68B",
+    "/bus": "\U0001F68C",
+    "/oncomingBus": "\U0001F68D",
+    "/trolleybus": "\U0001F68E",
+    "/busStop": "\U0001F68F",
+    "/minibus": "\U0001F690",
+    "/ambulance": "\U0001F691",
+    "/fireEngine": "\U0001F692",
+    "/policeCar": "\U0001F693",
+    "/oncomingPoliceCar": "\U0001F694",
+    "/taxi": "\U0001F695",
+    "/oncomingTaxi": "\U0001F696",
+    "/automobile": "\U0001F697",
+    "/oncomingAutomobile": "\U0001F698",
+    "/recreationalVehicle": "\U0001F699",
+    "/deliveryTruck": "\U0001F69A",
+    "/articulatedLorry": "\U0001F69B",
+    "/tractor": "\U0001F69C",
+    "/monorail": "\U0001F69D",
+    "/mountainRailway": "\U0001F69E",
+    "/suspensionRailway": "\U0001F69F",
+    "/mountainCableway": "\U0001F6A0",
+    "/aerialTramway": "\U0001F6A1",
+    "/ship": "\U0001F6A2",
+    "/rowboat": "\U0001F6A3",
+    "/speedboat": "\U0001F6A4",
+    "/horizontalTrafficLight": "\U0001F6A5",
+    "/verticalTrafficLight": "\U0001F6A6",
+    "/constructionSign": "\U0001F6A7",
+    "/policeCarsRevolvingLight": "\U0001F6A8",
+    "/triangularFlagOnPost": "\U0001F6A9",
+    "/door": "\U0001F6AA",
+    "/noEntrySign": "\U0001F6AB",
+    "/smoking": "\U0001F6AC",
+    "/noSmoking": "\U0001F6AD",
+    "/putLitterInItsPlace": "\U0001F6AE",
+    "/doNotLitter": "\U0001F6AF",
+    "/potableWater": "\U0001F6B0",
+    "/nonPotableWater": "\U0001F6B1",
+    "/bicycle": "\U0001F6B2",
+    "/noBicycles": "\U0001F6B3",
+    "/bicyclist": "\U0001F6B4",
+    "/mountainBicyclist": "\U0001F6B5",
+    "/pedestrian": "\U0001F6B6",
+    "/noPedestrians": "\U0001F6B7",
+    "/childrenCrossing": "\U0001F6B8",
+    "/mens": "\U0001F6B9",
+    "/womens": "\U0001F6BA",
+    "/restroom": "\U0001F6BB",
+    "/trns:baby": "\U0001F6BC",
+    "/toilet": "\U0001F6BD",
+    "/waterCloset": "\U0001F6BE",
+    "/shower": "\U0001F6BF",
+    "/bath": "\U0001F6C0",
+    "/bathtub": "\U0001F6C1",
+    "/passportControl": "\U0001F6C2",
+    "/customs": "\U0001F6C3",
+    "/baggageClaim": "\U0001F6C4",
+    "/leftLuggage": "\U0001F6C5",
+    "/triangleWithRoundedCorners": "\U0001F6C6",
+    "/prohibitedSign": "\U0001F6C7",
+    "/circledInformationSource": "\U0001F6C8",
+    "/boys": "\U0001F6C9",
+    "/girls": "\U0001F6CA",
+    "/couchAndLamp": "\U0001F6CB",
+    "/sleepingAccommodation": "\U0001F6CC",
+    "/shoppingBags": "\U0001F6CD",
+    "/bellhopBell": "\U0001F6CE",
+    "/bed": "\U0001F6CF",
+    "/placeOfWorship": "\U0001F6D0",
+    "/octagonalSign": "\U0001F6D1",
+    "/shoppingTrolley": "\U0001F6D2",
+    "/stupa": "\U0001F6D3",
+    "/pagoda": "\U0001F6D4",
+    "/hinduTemple": "\U0001F6D5",
+    "/hut": "\U0001F6D6",
+    "/elevator": "\U0001F6D7",
+    "/wireless": "\U0001F6DC",
+    "/playgroundSlide": "\U0001F6DD",
+    "/wheel": "\U0001F6DE",
+    "/ringBuoy": "\U0001F6DF",
+    "/hammerAndWrench": "\U0001F6E0",
+    "/shield": "\U0001F6E1",
+    "/oilDrum": "\U0001F6E2",
+    "/motorway": "\U0001F6E3",
+    "/railwayTrack": "\U0001F6E4",
+    "/motorBoat": "\U0001F6E5",
+    "/upPointingMilitaryAirplane": "\U0001F6E6",
+    "/upPointingAirplane": "\U0001F6E7",
+    "/upPointingSmallAirplane": "\U0001F6E8",
+    "/smallAirplane": "\U0001F6E9",
+    "/northeastPointingAirplane": "\U0001F6EA",
+    "/airplaneDeparture": "\U0001F6EB",
+    "/airplaneArriving": "\U0001F6EC",
+    "/satellite": "\U0001F6F0",
+    "/oncomingFireEngine": "\U0001F6F1",
+    "/dieselLocomotive": "\U0001F6F2",
+    "/passengerShip": "\U0001F6F3",
+    "/scooter": "\U0001F6F4",
+    "/motorScooter": "\U0001F6F5",
+    "/canoe": "\U0001F6F6",
+    "/sled": "\U0001F6F7",
+    "/flyingSaucer": "\U0001F6F8",
+    "/skateboard": "\U0001F6F9",
+    "/autoRickshaw": "\U0001F6FA",
+    "/pickupTruck": "\U0001F6FB",
+    "/rollerSkate": "\U0001F6FC",
+    "/blackLeftpointingIsoscelesRightTriangle": "\U0001F780",
+    "/blackUppointingIsoscelesRightTriangle": "\U0001F781",
+    "/blackRightpointingIsoscelesRightTriangle": "\U0001F782",
+    "/blackDownpointingIsoscelesRightTriangle": "\U0001F783",
+    "/blackSlightlySmallCircle": "\U0001F784",
+    "/mediumBoldWhiteCircle": "\U0001F785",
+    "/boldWhiteCircle": "\U0001F786",
+    "/heavyWhiteCircle": "\U0001F787",
+    "/veryHeavyWhiteCircle": "\U0001F788",
+    "/extremelyHeavyWhiteCircle": "\U0001F789",
+    "/whiteCircleContainingBlackSmallCircle": "\U0001F78A",
+    "/roundTarget": "\U0001F78B",
+    "/blackTinySquare": "\U0001F78C",
+    "/blackSlightlySmallSquare": "\U0001F78D",
+    "/lightWhiteSquare": "\U0001F78E",
+    "/mediumWhiteSquare": "\U0001F78F",
+    "/boldWhiteSquare": "\U0001F790",
+    "/heavyWhiteSquare": "\U0001F791",
+    "/veryHeavyWhiteSquare": "\U0001F792",
+    "/extremelyHeavyWhiteSquare": "\U0001F793",
+    "/whiteSquareContainingBlackVerySmallSquare": "\U0001F794",
+    "/whiteSquareContainingBlackMediumSquare": "\U0001F795",
+    "/squareTarget": "\U0001F796",
+    "/blackTinyDiamond": "\U0001F797",
+    "/blackVerySmallDiamond": "\U0001F798",
+    "/blackMediumSmallDiamond": "\U0001F799",
+    "/whiteDiamondContainingBlackVerySmallDiamond": "\U0001F79A",
+    "/whiteDiamondContainingBlackMediumDiamond": "\U0001F79B",
+    "/diamondTarget": "\U0001F79C",
+    "/blackTinyLozenge": "\U0001F79D",
+    "/blackVerySmallLozenge": "\U0001F79E",
+    "/blackMediumSmallLozenge": "\U0001F79F",
+    "/whiteLozengeContainingBlackSmallLozenge": "\U0001F7A0",
+    "/thinGreekCross": "\U0001F7A1",
+    "/lightGreekCross": "\U0001F7A2",
+    "/mediumGreekCross": "\U0001F7A3",
+    "/boldGreekCross": "\U0001F7A4",
+    "/veryBoldGreekCross": "\U0001F7A5",
+    "/veryHeavyGreekCross": "\U0001F7A6",
+    "/extremelyHeavyGreekCross": "\U0001F7A7",
+    "/thinSaltire": "\U0001F7A8",
+    "/lightSaltire": "\U0001F7A9",
+    "/mediumSaltire": "\U0001F7AA",
+    "/boldSaltire": "\U0001F7AB",
+    "/heavySaltire": "\U0001F7AC",
+    "/veryHeavySaltire": "\U0001F7AD",
+    "/extremelyHeavySaltire": "\U0001F7AE",
+    "/lightFiveSpokedAsterisk": "\U0001F7AF",
+    "/mediumFiveSpokedAsterisk": "\U0001F7B0",
+    "/boldFiveSpokedAsterisk": "\U0001F7B1",
+    "/heavyFiveSpokedAsterisk": "\U0001F7B2",
+    "/veryHeavyFiveSpokedAsterisk": "\U0001F7B3",
+    "/extremelyHeavyFiveSpokedAsterisk": "\U0001F7B4",
+    "/lightSixSpokedAsterisk": "\U0001F7B5",
+    "/mediumSixSpokedAsterisk": "\U0001F7B6",
+    "/boldSixSpokedAsterisk": "\U0001F7B7",
+    "/heavySixSpokedAsterisk": "\U0001F7B8",
+    "/veryHeavySixSpokedAsterisk": "\U0001F7B9",
+    "/extremelyHeavySixSpokedAsterisk": "\U0001F7BA",
+    "/lightEightSpokedAsterisk": "\U0001F7BB",
+    "/mediumEightSpokedAsterisk": "\U0001F7BC",
+    "/boldEightSpokedAsterisk": "\U0001F7BD",
+    "/heavyEightSpokedAsterisk": "\U0001F7BE",
+    "/veryHeavyEightSpokedAsterisk": "\U0001F7BF",
+    "/lightThreePointedBlackStar": "\U0001F7C0",
+    "/mediumThreePointedBlackStar": "\U0001F7C1",
+    "/threePointedBlackStar": "\U0001F7C2",
+    "/mediumThreePointedPinwheelStar": "\U0001F7C3",
+    "/lightFourPointedBlackStar": "\U0001F7C4",
+    "/mediumFourPointedBlackStar": "\U0001F7C5",
+    "/fourPointedBlackStar": "\U0001F7C6",
+    "/mediumFourPointedPinwheelStar": "\U0001F7C7",
+    "/reverseLightFourPointedPinwheelStar": "\U0001F7C8",
+    "/lightFivePointedBlackStar": "\U0001F7C9",
+    "/heavyFivePointedBlackStar": "\U0001F7CA",
+    "/mediumSixPointedBlackStar": "\U0001F7CB",
+    "/heavySixPointedBlackStar": "\U0001F7CC",
+    "/sixPointedPinwheelStar": "\U0001F7CD",
+    "/mediumEightPointedBlackStar": "\U0001F7CE",
+    "/heavyEightPointedBlackStar": "\U0001F7CF",
+    "/veryHeavyEightPointedBlackStar": "\U0001F7D0",
+    "/heavyEightPointedPinwheelStar": "\U0001F7D1",
+    "/lightTwelvePointedBlackStar": "\U0001F7D2",
+    "/heavyTwelvePointedBlackStar": "\U0001F7D3",
+    "/heavyTwelvePointedPinwheelStar": "\U0001F7D4",
+    "/circledTriangle": "\U0001F7D5",
+    "/negativeCircledTriangle": "\U0001F7D6",
+    "/circledSquare": "\U0001F7D7",
+    "/negativeCircledSquare": "\U0001F7D8",
+    "/ninePointedWhiteStar": "\U0001F7D9",
+    "/largeOrangeCircle": "\U0001F7E0",
+    "/largeYellowCircle": "\U0001F7E1",
+    "/largeGreenCircle": "\U0001F7E2",
+    "/largePurpleCircle": "\U0001F7E3",
+    "/largeBrownCircle": "\U0001F7E4",
+    "/largeRedSquare": "\U0001F7E5",
+    "/largeBlueSquare": "\U0001F7E6",
+    "/largeOrangeSquare": "\U0001F7E7",
+    "/largeYellowSquare": "\U0001F7E8",
+    "/largeGreenSquare": "\U0001F7E9",
+    "/largePurpleSquare": "\U0001F7EA",
+    "/largeBrownSquare": "\U0001F7EB",
+    "/heavyEqualsSign": "\U0001F7F0",
+    "/leftwardsArrowWithSmallTriangleArrowhead": "\U0001F800",
+    "/upwardsArrowWithSmallTriangleArrowhead": "\U0001F801",
+    "/rightwardsArrowWithSmallTriangleArrowhead": "\U0001F802",
+    "/downwardsArrowWithSmallTriangleArrowhead": "\U0001F803",
+    "/leftwardsArrowWithMediumTriangleArrowhead": "\U0001F804",
+    "/upwardsArrowWithMediumTriangleArrowhead": "\U0001F805",
+    "/rightwardsArrowWithMediumTriangleArrowhead": "\U0001F806",
+    "/downwardsArrowWithMediumTriangleArrowhead": "\U0001F807",
+    "/leftwardsArrowWithLargeTriangleArrowhead": "\U0001F808",
+    "/upwardsArrowWithLargeTriangleArrowhead": "\U0001F809",
+    "/rightwardsArrowWithLargeTriangleArrowhead": "\U0001F80A",
+    "/downwardsArrowWithLargeTriangleArrowhead": "\U0001F80B",
+    "/leftwardsArrowWithSmallEquilateralArrowhead": "\U0001F810",
+    "/upwardsArrowWithSmallEquilateralArrowhead": "\U0001F811",
+    "/rightwardsArrowWithSmallEquilateralArrowhead": "\U0001F812",
+    "/downwardsArrowWithSmallEquilateralArrowhead": "\U0001F813",
+    "/leftwardsArrowWithEquilateralArrowhead": "\U0001F814",
+    "/upwardsArrowWithEquilateralArrowhead": "\U0001F815",
+    "/rightwardsArrowWithEquilateralArrowhead": "\U0001F816",
+    "/downwardsArrowWithEquilateralArrowhead": "\U0001F817",
+    "/heavyLeftwardsArrowWithEquilateralArrowhead": "\U0001F818",
+    "/heavyUpwardsArrowWithEquilateralArrowhead": "\U0001F819",
+    "/heavyRightwardsArrowWithEquilateralArrowhead": "\U0001F81A",
+    "/heavyDownwardsArrowWithEquilateralArrowhead": "\U0001F81B",
+    "/heavyLeftwardsArrowWithLargeEquilateralArrowhead": "\U0001F81C",
+    "/heavyUpwardsArrowWithLargeEquilateralArrowhead": "\U0001F81D",
+    "/heavyRightwardsArrowWithLargeEquilateralArrowhead": "\U0001F81E",
+    "/heavyDownwardsArrowWithLargeEquilateralArrowhead": "\U0001F81F",
+    "/leftwardsTriangleheadedArrowWithNarrowShaft": "\U0001F820",
+    "/upwardsTriangleheadedArrowWithNarrowShaft": "\U0001F821",
+    "/rightwardsTriangleheadedArrowWithNarrowShaft": "\U0001F822",
+    "/downwardsTriangleheadedArrowWithNarrowShaft": "\U0001F823",
+    "/leftwardsTriangleheadedArrowWithMediumShaft": "\U0001F824",
+    "/upwardsTriangleheadedArrowWithMediumShaft": "\U0001F825",
+    "/rightwardsTriangleheadedArrowWithMediumShaft": "\U0001F826",
+    "/downwardsTriangleheadedArrowWithMediumShaft": "\U0001F827",
+    "/leftwardsTriangleheadedArrowWithBoldShaft": "\U0001F828",
+    "/upwardsTriangleheadedArrowWithBoldShaft": "\U0001F829",
+    "/rightwardsTriangleheadedArrowWithBoldShaft": "\U0001F82A",
+    "/downwardsTriangleheadedArrowWithBoldShaft": "\U0001F82B",
+    "/leftwardsTriangleheadedArrowWithHeavyShaft": "\U0001F82C",
+    "/upwardsTriangleheadedArrowWithHeavyShaft": "\U0001F82D",
+    "/rightwardsTriangleheadedArrowWithHeavyShaft": "\U0001F82E",
+    "/downwardsTriangleheadedArrowWithHeavyShaft": "\U0001F82F",
+    "/leftwardsTriangleheadedArrowWithVeryHeavyShaft": "\U0001F830",
+    "/upwardsTriangleheadedArrowWithVeryHeavyShaft": "\U0001F831",
+    "/rightwardsTriangleheadedArrowWithVeryHeavyShaft": "\U0001F832",
+    "/downwardsTriangleheadedArrowWithVeryHeavyShaft": "\U0001F833",
+    "/leftwardsFingerpostArrow": "\U0001F834",
+    "/upwardsFingerpostArrow": "\U0001F835",
+    "/rightwardsFingerpostArrow": "\U0001F836",
+    "/downwardsFingerpostArrow": "\U0001F837",
+    "/leftwardsSquaredArrow": "\U0001F838",
+    "/upwardsSquaredArrow": "\U0001F839",
+    "/rightwardsSquaredArrow": "\U0001F83A",
+    "/downwardsSquaredArrow": "\U0001F83B",
+    "/leftwardsCompressedArrow": "\U0001F83C",
+    "/upwardsCompressedArrow": "\U0001F83D",
+    "/rightwardsCompressedArrow": "\U0001F83E",
+    "/downwardsCompressedArrow": "\U0001F83F",
+    "/leftwardsHeavyCompressedArrow": "\U0001F840",
+    "/upwardsHeavyCompressedArrow": "\U0001F841",
+    "/rightwardsHeavyCompressedArrow": "\U0001F842",
+    "/downwardsHeavyCompressedArrow": "\U0001F843",
+    "/leftwardsHeavyArrow": "\U0001F844",
+    "/upwardsHeavyArrow": "\U0001F845",
+    "/rightwardsHeavyArrow": "\U0001F846",
+    "/downwardsHeavyArrow": "\U0001F847",
+    "/leftwardsSansserifArrow": "\U0001F850",
+    "/upwardsSansserifArrow": "\U0001F851",
+    "/rightwardsSansserifArrow": "\U0001F852",
+    "/downwardsSansserifArrow": "\U0001F853",
+    "/northWestSansserifArrow": "\U0001F854",
+    "/northEastSansserifArrow": "\U0001F855",
+    "/southEastSansserifArrow": "\U0001F856",
+    "/southWestSansserifArrow": "\U0001F857",
+    "/leftRightSansserifArrow": "\U0001F858",
+    "/upDownSansserifArrow": "\U0001F859",
+    "/wideheadedLeftwardsLightBarbArrow": "\U0001F860",
+    "/wideheadedUpwardsLightBarbArrow": "\U0001F861",
+    "/wideheadedRightwardsLightBarbArrow": "\U0001F862",
+    "/wideheadedDownwardsLightBarbArrow": "\U0001F863",
+    "/wideheadedNorthWestLightBarbArrow": "\U0001F864",
+    "/wideheadedNorthEastLightBarbArrow": "\U0001F865",
+    "/wideheadedSouthEastLightBarbArrow": "\U0001F866",
+    "/wideheadedSouthWestLightBarbArrow": "\U0001F867",
+    "/wideheadedLeftwardsBarbArrow": "\U0001F868",
+    "/wideheadedUpwardsBarbArrow": "\U0001F869",
+    "/wideheadedRightwardsBarbArrow": "\U0001F86A",
+    "/wideheadedDownwardsBarbArrow": "\U0001F86B",
+    "/wideheadedNorthWestBarbArrow": "\U0001F86C",
+    "/wideheadedNorthEastBarbArrow": "\U0001F86D",
+    "/wideheadedSouthEastBarbArrow": "\U0001F86E",
+    "/wideheadedSouthWestBarbArrow": "\U0001F86F",
+    "/wideheadedLeftwardsMediumBarbArrow": "\U0001F870",
+    "/wideheadedUpwardsMediumBarbArrow": "\U0001F871",
+    "/wideheadedRightwardsMediumBarbArrow": "\U0001F872",
+    "/wideheadedDownwardsMediumBarbArrow": "\U0001F873",
+    "/wideheadedNorthWestMediumBarbArrow": "\U0001F874",
+    "/wideheadedNorthEastMediumBarbArrow": "\U0001F875",
+    "/wideheadedSouthEastMediumBarbArrow": "\U0001F876",
+    "/wideheadedSouthWestMediumBarbArrow": "\U0001F877",
+    "/wideheadedLeftwardsHeavyBarbArrow": "\U0001F878",
+    "/wideheadedUpwardsHeavyBarbArrow": "\U0001F879",
+    "/wideheadedRightwardsHeavyBarbArrow": "\U0001F87A",
+    "/wideheadedDownwardsHeavyBarbArrow": "\U0001F87B",
+    "/wideheadedNorthWestHeavyBarbArrow": "\U0001F87C",
+    "/wideheadedNorthEastHeavyBarbArrow": "\U0001F87D",
+    "/wideheadedSouthEastHeavyBarbArrow": "\U0001F87E",
+    "/wideheadedSouthWestHeavyBarbArrow": "\U0001F87F",
+    "/wideheadedLeftwardsVeryHeavyBarbArrow": "\U0001F880",
+    "/wideheadedUpwardsVeryHeavyBarbArrow": "\U0001F881",
+    "/wideheadedRightwardsVeryHeavyBarbArrow": "\U0001F882",
+    "/wideheadedDownwardsVeryHeavyBarbArrow": "\U0001F883",
+    "/wideheadedNorthWestVeryHeavyBarbArrow": "\U0001F884",
+    "/wideheadedNorthEastVeryHeavyBarbArrow": "\U0001F885",
+    "/wideheadedSouthEastVeryHeavyBarbArrow": "\U0001F886",
+    "/wideheadedSouthWestVeryHeavyBarbArrow": "\U0001F887",
+    "/leftwardsTriangleArrowhead": "\U0001F890",
+    "/upwardsTriangleArrowhead": "\U0001F891",
+    "/rightwardsTriangleArrowhead": "\U0001F892",
+    "/downwardsTriangleArrowhead": "\U0001F893",
+    "/leftwardsWhiteArrowWithinTriangleArrowhead": "\U0001F894",
+    "/upwardsWhiteArrowWithinTriangleArrowhead": "\U0001F895",
+    "/rightwardsWhiteArrowWithinTriangleArrowhead": "\U0001F896",
+    "/downwardsWhiteArrowWithinTriangleArrowhead": "\U0001F897",
+    "/leftwardsArrowWithNotchedTail": "\U0001F898",
+    "/upwardsArrowWithNotchedTail": "\U0001F899",
+    "/rightwardsArrowWithNotchedTail": "\U0001F89A",
+    "/downwardsArrowWithNotchedTail": "\U0001F89B",
+    "/heavyArrowShaftWidthOne": "\U0001F89C",
+    "/heavyArrowShaftWidthTwoThirds": "\U0001F89D",
+    "/heavyArrowShaftWidthOneHalf": "\U0001F89E",
+    "/heavyArrowShaftWidthOneThird": "\U0001F89F",
+    "/leftwardsBottomshadedWhiteArrow": "\U0001F8A0",
+    "/rightwardsBottomShadedWhiteArrow": "\U0001F8A1",
+    "/leftwardsTopShadedWhiteArrow": "\U0001F8A2",
+    "/rightwardsTopShadedWhiteArrow": "\U0001F8A3",
+    "/leftwardsLeftshadedWhiteArrow": "\U0001F8A4",
+    "/rightwardsRightshadedWhiteArrow": "\U0001F8A5",
+    "/leftwardsRightshadedWhiteArrow": "\U0001F8A6",
+    "/rightwardsLeftshadedWhiteArrow": "\U0001F8A7",
+    "/leftwardsBacktiltedShadowedWhiteArrow": "\U0001F8A8",
+    "/rightwardsBacktiltedShadowedWhiteArrow": "\U0001F8A9",
+    "/leftwardsFronttiltedShadowedWhiteArrow": "\U0001F8AA",
+    "/rightwardsFronttiltedShadowedWhiteArrow": "\U0001F8AB",
+    "/whiteArrowShaftWidthOne": "\U0001F8AC",
+    "/whiteArrowShaftWidthTwoThirds": "\U0001F8AD",
+    "/arrowPointingUpwardsThenNorthWest": "\U0001F8B0",
+    "/arrowPointingRightwardsThenCurvingSouthWest": "\U0001F8B1",
+    "/rightwardsArrowWithLowerHook": "\U0001F8B2",
+    "/downwardsBlackArrowToBar": "\U0001F8B3",
+    "/negativeSquaredLeftwardsArrow": "\U0001F8B4",
+    "/negativeSquaredUpwardsArrow": "\U0001F8B5",
+    "/negativeSquaredRightwardsArrow": "\U0001F8B6",
+    "/negativeSquaredDownwardsArrow": "\U0001F8B7",
+    "/northWestArrowFromBar": "\U0001F8B8",
+    "/northEastArrowFromBar": "\U0001F8B9",
+    "/southEastArrowFromBar": "\U0001F8BA",
+    "/southWestArrowFromBar": "\U0001F8BB",
+    "/leftwardsArrowFromDownwardsArrow": "\U0001F8C0",
+    "/rightwardsArrowFromDownwardsArrow": "\U0001F8C1",
+    "/neutralKing": "\U0001FA00",
+    "/neutralQueen": "\U0001FA01",
+    "/neutralRook": "\U0001FA02",
+    "/neutralBishop": "\U0001FA03",
+    "/neutralKnight": "\U0001FA04",
+    "/neutralPawn": "\U0001FA05",
+    "/whiteKnight45": "\U0001FA06",
+    "/blackKnight45": "\U0001FA07",
+    "/neutralKnight45": "\U0001FA08",
+    "/whiteKing90": "\U0001FA09",
+    "/whiteQueen90": "\U0001FA0A",
+    "/whiteRook90": "\U0001FA0B",
+    "/whiteBishop90": "\U0001FA0C",
+    "/whiteKnight90": "\U0001FA0D",
+    "/whitePawn90": "\U0001FA0E",
+    "/blackKing90": "\U0001FA0F",
+    "/blackQueen90": "\U0001FA10",
+    "/blackRook90": "\U0001FA11",
+    "/blackBishop90": "\U0001FA12",
+    "/blackKnight90": "\U0001FA13",
+    "/blackPawn90": "\U0001FA14",
+    "/neutralKing90": "\U0001FA15",
+    "/neutralQueen90": "\U0001FA16",
+    "/neutralRook90": "\U0001FA17",
+    "/neutralBishop90": "\U0001FA18",
+    "/neutralKnight90": "\U0001FA19",
+    "/neutralPawn90": "\U0001FA1A",
+    "/whiteKnight135": "\U0001FA1B",
+    "/blackKnight135": "\U0001FA1C",
+    "/neutralKnight135": "\U0001FA1D",
+    "/whiteKingTurned": "\U0001FA1E",
+    "/whiteQueenTurned": "\U0001FA1F",
+    "/whiteRookTurned": "\U0001FA20",
+    "/whiteBishopTurned": "\U0001FA21",
+    "/whiteKnightTurned": "\U0001FA22",
+    "/whitePawnTurned": "\U0001FA23",
+    "/blackKingTurned": "\U0001FA24",
+    "/blackQueenTurned": "\U0001FA25",
+    "/blackRookTurned": "\U0001FA26",
+    "/blackBishopTurned": "\U0001FA27",
+    "/blackKnightTurned": "\U0001FA28",
+    "/blackPawnTurned": "\U0001FA29",
+    "/neutralKingTurned": "\U0001FA2A",
+    "/neutralQueenTurned": "\U0001FA2B",
+    "/neutralRookTurned": "\U0001FA2C",
+    "/neutralBishopTurned": "\U0001FA2D",
+    "/neutralKnightTurned": "\U0001FA2E",
+    "/neutralPawnTurned": "\U0001FA2F",
+    "/whiteKnight225": "\U0001FA30",
+    "/blackKnight225": "\U0001FA31",
+    "/neutralKnight225": "\U0001FA32",
+    "/whiteKing270": "\U0001FA33",
+    "/whiteQueen270": "\U0001FA34",
+    "/whiteRook270": "\U0001FA35",
+    "/whiteBishop270": "\U0001FA36",
+    "/whiteKnight270": "\U0001FA37",
+    "/whitePawn270": "\U0001FA38",
+    "/blackKing270": "\U0001FA39",
+    "/blackQueen270": "\U0001FA3A",
+    "/blackRook270": "\U0001FA3B",
+    "/blackBishop270": "\U0001FA3C",
+    "/blackKnight270": "\U0001FA3D",
+    "/blackPawn270": "\U0001FA3E",
+    "/neutralKing270": "\U0001FA3F",
+    "/neutralQueen270": "\U0001FA40",
+    "/neutralRook270": "\U0001FA41",
+    "/neutralBishop270": "\U0001FA42",
+    "/neutralKnight270": "\U0001FA43",
+    "/neutralPawn270": "\U0001FA44",
+    "/whiteKnight315": "\U0001FA45",
+    "/blackKnight315": "\U0001FA46",
+    "/neutralKnight315": "\U0001FA47",
+    "/whiteEquihopper": "\U0001FA48",
+    "/blackEquihopper": "\U0001FA49",
+    "/neutralEquihopper": "\U0001FA4A",
+    "/whiteEquihopper90": "\U0001FA4B",
+    "/blackEquihopper90": "\U0001FA4C",
+    "/neutralEquihopper90": "\U0001FA4D",
+    "/whiteKnight-queen": "\U0001FA4E",
+    "/whiteKnightRook": "\U0001FA4F",
+    "/whiteKnightBishop": "\U0001FA50",
+    "/blackKnightQueen": "\U0001FA51",
+    "/blackKnightRook": "\U0001FA52",
+    "/blackKnightBishop": "\U0001FA53",
+    "/redGeneralXq": "\U0001FA60",
+    "/redMandarinXq": "\U0001FA61",
+    "/redElephantXq": "\U0001FA62",
+    "/redHorseXq": "\U0001FA63",
+    "/redChariotXq": "\U0001FA64",
+    "/redCannonXq": "\U0001FA65",
+    "/redSoldierXq": "\U0001FA66",
+    "/blackGeneralXq": "\U0001FA67",
+    "/blackMandarinXq": "\U0001FA68",
+    "/blackElephantXq": "\U0001FA69",
+    "/blackHorseXq": "\U0001FA6A",
+    "/blackChariotXq": "\U0001FA6B",
+    "/blackCannonXq": "\U0001FA6C",
+    "/blackSoldierXq": "\U0001FA6D",
+    "/balletShoes": "\U0001FA70",
+    "/onepieceSwimsuit": "\U0001FA71",
+    "/briefs": "\U0001FA72",
+    "/shorts": "\U0001FA73",
+    "/thongSandal": "\U0001FA74",
+    "/lightBlueHeart": "\U0001FA75",
+    "/greyHeart": "\U0001FA76",
+    "/pinkHeart": "\U0001FA77",
+    "/dropOfBlood": "\U0001FA78",
+    "/adhesiveBandage": "\U0001FA79",
+    "/stethoscope": "\U0001FA7A",
+    "/xray": "\U0001FA7B",
+    "/crutch": "\U0001FA7C",
+    "/yoyo": "\U0001FA80",
+    "/kite": "\U0001FA81",
+    "/parachute": "\U0001FA82",
+    "/boomerang": "\U0001FA83",
+    "/magicWand": "\U0001FA84",
+    "/pinata": "\U0001FA85",
+    "/nestingDolls": "\U0001FA86",
+    "/maracas": "\U0001FA87",
+    "/flute": "\U0001FA88",
+    "/harp": "\U0001FA89",
+    "/shovel": "\U0001FA8F",
+    "/ringedPlanet": "\U0001FA90",
+    "/symb:chair": "\U0001FA91",
+    "/razor": "\U0001FA92",
+    "/axe": "\U0001FA93",
+    "/diyaLamp": "\U0001FA94",
+    "/banjo": "\U0001FA95",
+    "/militaryHelmet": "\U0001FA96",
+    "/accordion": "\U0001FA97",
+    "/longDrum": "\U0001FA98",
+    "/coin": "\U0001FA99",
+    "/carpentrySaw": "\U0001FA9A",
+    "/screwdriver": "\U0001FA9B",
+    "/ladder": "\U0001FA9C",
+    "/symb:hook": "\U0001FA9D",
+    "/mirror": "\U0001FA9E",
+    "/window": "\U0001FA9F",
+    "/plunger": "\U0001FAA0",
+    "/sewingNeedle": "\U0001FAA1",
+    "/knot": "\U0001FAA2",
+    "/bucket": "\U0001FAA3",
+    "/mouseTrap": "\U0001FAA4",
+    "/toothbrush": "\U0001FAA5",
+    "/headstone": "\U0001FAA6",
+    "/placard": "\U0001FAA7",
+    "/rock": "\U0001FAA8",
+    "/mirrorBall": "\U0001FAA9",
+    "/identificationCard": "\U0001FAAA",
+    "/lowBattery": "\U0001FAAB",
+    "/hamsa": "\U0001FAAC",
+    "/foldingHandFan": "\U0001FAAD",
+    "/hairPick": "\U0001FAAE",
+    "/khanda": "\U0001FAAF",
+    "/fly": "\U0001FAB0",
+    "/worm": "\U0001FAB1",
+    "/beetle": "\U0001FAB2",
+    "/cockroach": "\U0001FAB3",
+    "/pottedPlant": "\U0001FAB4",
+    "/wood": "\U0001FAB5",
+    "/feather": "\U0001FAB6",
+    "/lotus": "\U0001FAB7",
+    "/coral": "\U0001FAB8",
+    "/emptyNest": "\U0001FAB9",
+    "/nestWithEggs": "\U0001FABA",
+    "/hyacinth": "\U0001FABB",
+    "/jellyfish": "\U0001FABC",
+    "/wing": "\U0001FABD",
+    "/leaflessTree": "\U0001FABE",
+    "/goose": "\U0001FABF",
+    "/anatomicalHeart": "\U0001FAC0",
+    "/lungs": "\U0001FAC1",
+    "/peopleHugging": "\U0001FAC2",
+    "/pregnantMan": "\U0001FAC3",
+    "/pregnantPerson": "\U0001FAC4",
+    "/personWithCrown": "\U0001FAC5",
+    "/fingerprint": "\U0001FAC6",
+    "/moose": "\U0001FACE",
+    "/donkey": "\U0001FACF",
+    "/blueberries": "\U0001FAD0",
+    "/bellPepper": "\U0001FAD1",
+    "/olive": "\U0001FAD2",
+    "/flatbread": "\U0001FAD3",
+    "/tamale": "\U0001FAD4",
+    "/fondue": "\U0001FAD5",
+    "/teapot": "\U0001FAD6",
+    "/pouringLiquid": "\U0001FAD7",
+    "/beans": "\U0001FAD8",
+    "/jar": "\U0001FAD9",
+    "/gingerRoot": "\U0001FADA",
+    "/peaPod": "\U0001FADB",
+    "/rootVegetable": "\U0001FADC",
+    "/splatter": "\U0001FADF",
+    "/meltingFace": "\U0001FAE0",
+    "/salutingFace": "\U0001FAE1",
+    "/faceWithOpenEyesAndHandOverMouth": "\U0001FAE2",
+    "/faceWithPeekingEye": "\U0001FAE3",
+    "/faceWithDiagonalMouth": "\U0001FAE4",
+    "/dottedLineFace": "\U0001FAE5",
+    "/bitingLip": "\U0001FAE6",
+    "/bubbles": "\U0001FAE7",
+    "/shakingFace": "\U0001FAE8",
+    "/faceWithBagsUnderEyes": "\U0001FAE9",
+    "/handWithIndexFingerAndThumbCrossed": "\U0001FAF0",
+    "/rightwardsHand": "\U0001FAF1",
+    "/leftwardsHand": "\U0001FAF2",
+    "/palmDownHand": "\U0001FAF3",
+    "/palmUpHand": "\U0001FAF4",
+    "/indexPointingAtTheViewer": "\U0001FAF5",
+    "/heartHands": "\U0001FAF6",
+    "/leftwardsPushingHand": "\U0001FAF7",
+    "/rightwardsPushingHand": "\U0001FAF8",
+    # cmex10.afm from https://ctan.org/texarchive/fonts/cm/afm
+    "/angleleftBig": "\u2329",
+    "/angleleftBigg": "\u2329",
+    "/angleleftbig": "\u2329",
+    "/angleleftbigg": "\u2329",
+    "/anglerightBig": "\u232A",
+    "/anglerightBigg": "\u232A",
+    "/anglerightbig": "\u232A",
+    "/anglerightbigg": "\u232A",
+    "/arrowdbldownbt": "\u21D3",
+    "/arrowdbluptop": "\u21D1",
+    # "/arrowdblvertex": "",  # Not mappable?
+    "/arrowdownbt": "\u2193",
+    "/arrowuptp": "\u2191",
+    "/backslashBig": "\u005C",
+    "/backslashBigg": "\u005C",
+    "/backslashbig": "\u005C",
+    "/backslashbigg": "\u005C",
+    # "/bracehoriztipdownleft": "",  # Not mappable?
+    # "/bracehoriztipdownright": "",  # Not mappable?
+    # "/bracehoriztipupleft": "",  # Not mappable?
+    # "/bracehoriztipupright": "",  # Not mappable?
+    "/braceleftBig": "\u007B",
+    "/braceleftBigg": "\u007B",
+    "/braceleftbig": "\u007B",
+    "/braceleftbigg": "\u007B",
+    "/bracerightBig": "\u007D",
+    "/bracerightBigg": "\u007D",
+    "/bracerightbig": "\u007D",
+    "/bracerightbigg": "\u007D",
+    "/bracketleftBig": "\u005B",
+    "/bracketleftBigg": "\u005B",
+    "/bracketleftbig": "\u005B",
+    "/bracketleftbigg": "\u005B",
+    "/bracketleftmid": "\u005B",
+    "/bracketrightBig": "\u005D",
+    "/bracketrightBigg": "\u005D",
+    "/bracketrightbig": "\u005D",
+    "/bracketrightbigg": "\u005D",
+    "/bracketrightmid": "\u005D",
+    "/ceilingleftBig": "\u2308",
+    "/ceilingleftBigg": "\u2308",
+    "/ceilingleftbig": "\u2308",
+    "/ceilingleftbigg": "\u2308",
+    "/ceilingrightBig": "\u2309",
+    "/ceilingrightBigg": "\u2309",
+    "/ceilingrightbig": "\u2309",
+    "/ceilingrightbigg": "\u2309",
+    "/circledotdisplaystyle": "\u2A00",
+    "/circledottextstyle": "\u2A00",
+    "/circleintegraldisplaystyle": "\u222E",
+    "/circleintegraltextstyle": "\u222E",
+    "/circlemultiplydisplaystyle": "\u2A02",
+    "/circlemultiplytextstyle": "\u2A02",
+    "/circleplusdisplaystyle": "\u2A01",
+    "/circleplustextstyle": "\u2A01",
+    "/circumflexWide": "\u005E",
+    "/circumflexWider": "\u005E",
+    "/circumflexWidest": "\u005E",
+    "/coproductdisplaystyle": "\u2210",
+    "/coproducttextstyle": "\u2210",
+    "/floorleftBig": "\u230A",
+    "/floorleftBigg": "\u230A",
+    "/floorleftbig": "\u230A",
+    "/floorleftbigg": "\u230A",
+    "/floorrightBig": "\u230B",
+    "/floorrightBigg": "\u230B",
+    "/floorrightbig": "\u230B",
+    "/floorrightbigg": "\u230B",
+    "/integraldisplaystyle": "\u222B",
+    "/integraltextstyle": "\u222B",
+    "/intersectiondisplaystyle": "\u22C2",
+    "/intersectiontextstyle": "\u22C2",
+    # "/linedblvertex": "",  # Not mappable?
+    # "/linevertex": "",  # Not mappable?
+    "/logicalanddisplaystyle": "\u22C0",
+    "/logicalandtextstyle": "\u22C0",
+    "/logicalordisplaystyle": "\u22C1",
+    "/logicalortextstyle": "\u22C1",
+    "/parenleftBig": "\u0028",
+    "/parenleftBigg": "\u0028",
+    "/parenleftbig": "\u0028",
+    "/parenleftbigg": "\u0028",
+    "/parenleftmid": "\u0028",
+    "/parenrightBig": "\u0029",
+    "/parenrightBigg": "\u0029",
+    "/parenrightbig": "\u0029",
+    "/parenrightbigg": "\u0029",
+    "/parenrightmid": "\u0029",
+    "/productdisplaystyle": "\u220F",
+    "/producttextstyle": "\u220F",
+    "/radicalBig": "\u221A",
+    "/radicalBigg": "\u221A",
+    # "/radicalExtbt": "",  # Not mappable?
+    # "/radicalExtmid": "",  # Not mappable?
+    # "/radicalExttp": "",  # Not mappable?
+    "/radicalbig": "\u221A",
+    "/radicalbigg": "\u221A",
+    "/slashBig": "\u002F",
+    "/slashBigg": "\u002F",
+    "/slashbig": "\u002F",
+    "/slashbigg": "\u002F",
+    "/squareuniondisplaystyle": "\u2A06",
+    "/squareuniontextstyle": "\u2A06",
+    "/summationdisplaystyle": "\u2211",
+    "/summationtextstyle": "\u2211",
+    "/tildeWide": "\u02DC",
+    "/tildeWider": "\u02DC",
+    "/tildeWidest": "\u02DC",
+    "/uniondisplaystyle": "\u22C3",
+    "/unionplusdisplaystyle": "\u2A04",
+    "/unionplustextstyle": "\u2A04",
+    "/uniontextstyle": "\u22C3",
+    # TeX fonts: https://ctan.math.utah.edu/ctan/tex-archive/info/fontname/fontname.html#Encodings-1
+    "/cwm": "\u200B",
+    # "/perthousandzero": "",  # Not mappable?
+    "/visiblespace": "\u2423",
+    "/S_S": "\u1E9E",
+    "/ell": "\u2113",
+    "/anglearc": "\u22BE",
+    "/diameter": "\u2300",
+    "/angbracketleftbig": "\u27E8",
+    "/angbracketrightbig": "\u27E9",
+    "/vextendsingle": "\u23D0",
+    "/vextenddouble": "\u2016",
+    "/angbracketleftbigg": "\u27E8",
+    "/angbracketrightbigg": "\u27E9",
+    "/angbracketleftBigg": "\u27E8",
+    "/angbracketrightBigg": "\u27E9",
+    "/angbracketleftBig": "\u27E8",
+    "/angbracketrightBig": "\u27E9",
+    "/unionsqtext": "\u2A06",
+    "/unionsqdisplay": "\u2A06",
+    "/contintegraltext": "\u222E",
+    "/contintegraldisplay": "\u222E",
+    "/circledottext": "\u2A00",
+    "/circledotdisplay": "\u2A00",
+    "/circleplustext": "\u2A01",
+    "/circleplusdisplay": "\u2A01",
+    "/circlemultiplytext": "\u2A02",
+    "/circlemultiplydisplay": "\u2A02",
+    "/summationtext": "\u2211",
+    "/producttext": "\u220F",
+    "/integraltext": "\u222B",
+    "/uniontext": "\u22C3",
+    "/intersectiontext": "\u22C2",
+    "/unionmultitext": "\u2A04",
+    "/logicalandtext": "\u22C0",
+    "/logicalortext": "\u22C1",
+    "/summationdisplay": "\u2211",
+    "/productdisplay": "\u220F",
+    "/integraldisplay": "\u222B",
+    "/uniondisplay": "\u22C3",
+    "/intersectiondisplay": "\u22C2",
+    "/unionmultidisplay": "\u2A04",
+    "/logicalanddisplay": "\u22C0",
+    "/logicalordisplay": "\u22C1",
+    "/coproducttext": "\u2210",
+    "/coproductdisplay": "\u2210",
+    "/hatwide": "\u02C6",
+    "/hatwider": "\u02C6",
+    "/hatwidest": "\u02C6",
+    "/tildewide": "\u007E",
+    "/tildewider": "\u007E",
+    "/tildewidest": "\u007E",
+    "/radicalbt": "\u221A",
+    # "/radicalvertex": "",  # Not mappable?
+    # "/radicaltp": "",  # Not mappable?
+    # "/arrowvertexdbl": "",  # Not mappable?
+    "/arrowtp": "\u2191",
+    "/arrowbt": "\u2193",
+    # "/bracehtipdownleft": "",  # Not mappable?
+    # "/bracehtipdownright": "",  # Not mappable?
+    # "/bracehtipupleft": "",  # Not mappable?
+    # "/bracehtipupright": "",  # Not mappable?
+    "/arrowdbltp": "\u21D1",
+    "/arrowdblbt": "\u21D3",
+    "/diamondmath": "\u22C4",
+    "/circleminus": "\u2296",
+    "/circledivide": "\u2298",
+    "/circledot": "\u2299",
+    "/circlecopyrt": "\u00A9",
+    "/equivasymptotic": "\u224D",
+    "/precedesequal": "\u227C",
+    "/followsequal": "\u227D",
+    "/lessmuch": "\u226A",
+    "/greatermuch": "\u226B",
+    "/follows": "\u227B",
+    "/arrownortheast": "\u2197",
+    "/arrowsoutheast": "\u2198",
+    "/similarequal": "\u2243",
+    "/arrownorthwest": "\u2196",
+    "/arrowsouthwest": "\u2199",
+    "/prime": "\u2032",
+    "/owner": "\u220B",
+    "/triangle": "\u2206",
+    "/triangleinv": "\u25BD",
+    "/negationslash": "\u2044",
+    "/mapsto": "\u21A6",
+    "/Rfractur": "\u211C",
+    "/Ifractur": "\u2111",
+    "/latticetop": "\u22A4",
+    "/unionmulti": "\u2A04",
+    "/turnstileleft": "\u22A3",
+    "/turnstileright": "\u22A2",
+    "/angbracketleft": "\u27E8",
+    "/angbracketright": "\u27E9",
+    "/bardbl": "\u2016",
+    "/arrowbothv": "\u2195",
+    "/arrowdblbothv": "\u21D5",
+    "/coproduct": "\u2210",
+    "/unionsq": "\u2294",
+    "/intersectionsq": "\u2293",
+    "/subsetsqequal": "\u2291",
+    "/supersetsqequal": "\u2292",
+    "/epsilon1": "\u03F5",
+    "/pi1": "\u03D6",
+    "/rho1": "\u03F1",
+    "/arrowlefttophalf": "\u21BC",
+    "/arrowleftbothalf": "\u21BD",
+    "/arrowrighttophalf": "\u21C0",
+    "/arrowrightbothalf": "\u21C1",
+    "/arrowhookleft": "\u21AA",
+    "/arrowhookright": "\u21A9",
+    "/triangleleft": "\u25C1",
+    "/star": "\u22C6",
+    "/flat": "\u266D",
+    "/natural": "\u266E",
+    "/sharp": "\u266F",
+    "/slurbelow": "\u2323",
+    "/slurabove": "\u2322",
+    "/vector": "\u20D7",
+    "/tie": "\u2040",
+    # "/suppress": "",  # Not mapped?
+    "/Togonek": "\u0162",
+    # Missing old names. Non-mappable characters have been left out.
+    "/Dbar": "\u0110",
+    "/FFIsmall": "\u0066\u0066\u0069",  # As ligature: U+FB03
+    "/FFLsmall": "\u0066\u0066\u006C",  # As ligature: U+FB04
+    "/FFsmall": "\u0066\u0066",  # As ligature: U+FB00
+    "/FIsmall": "\u0066\u0069",  # As ligature: U+FB01
+    "/FLsmall": "\u0066\u006C",  # As ligature: U+FB02
+    "/Finv": "\u2132",
+    "/Germandblssmall": "\u00DF",
+    "/Gmir": "\u2141",
+    "/Omegainv": "\u2127",
+    "/SS": "\u1E9E",
+    "/SSsmall": "\u00DF",
+    "/Yen": "\u00A5",
+    "/anticlockwise": "\u27F2",
+    "/approxorequal": "\u224A",
+    "/archleftdown": "\u21B6",
+    "/archrightdown": "\u21B7",
+    "/arrowparrleftright": "\u21C6",
+    "/arrowparrrightleft": "\u21C4",
+    "/arrowtailleft": "\u21A2",
+    "/arrowtailright": "\u21A3",
+    "/arrowtripleleft": "\u21DA",
+    "/arrowtripleright": "\u21DB",
+    "/asteriskcentered": "\u2217",
+    "/beth": "\u2136",
+    "/circleR": "\u24C7",
+    "/circleS": "\u24C8",
+    "/circleasterisk": "\u229B",
+    "/circleequal": "\u229C",
+    "/circlering": "\u229A",
+    "/clockFaceEightOclock": "\U0001F557",
+    "/clockFaceElevenOclock": "\U0001F55A",
+    "/clockFaceFiveOclock": "\U0001F554",
+    "/clockFaceFourOclock": "\U0001F553",
+    "/clockFaceNineOclock": "\U0001F558",
+    "/clockFaceOneOclock": "\U0001F550",
+    "/clockFaceSevenOclock": "\U0001F556",
+    "/clockFaceSixOclock": "\U0001F555",
+    "/clockFaceTenOclock": "\U0001F559",
+    "/clockFaceThreeOclock": "\U0001F552",
+    "/clockFaceTwelveOclock": "\U0001F55B",
+    "/clockFaceTwoOclock": "\U0001F551",
+    "/clockwise": "\u27F3",
+    "/clockwiseDownwardsAndUpwardsOpenCircleArrows": "\U0001F503",
+    "/ct": "\u0063\u0074",
+    "/curlyleft": "\u21AB",
+    "/curlyright": "\u21AC",
+    "/daleth": "\u2138",
+    "/dbar": "\u0111",
+    "/dblarrowdwn": "\u21CA",
+    "/dblarrowheadleft": "\u219E",
+    "/dblarrowheadright": "\u21A0",
+    "/dblbracketleft": "\u27E6",
+    "/dblbracketright": "\u27E7",
+    "/defines": "\u225C",
+    "/diamondsolid": "\u25C6",
+    "/difference": "\u224F",
+    "/dividemultiply": "\u22C7",
+    "/downfall": "\u22CE",
+    "/epsiloninv": "\u03F6",
+    "/equaldotleftright": "\u2252",
+    "/equaldotrightleft": "\u2253",
+    "/equalorfollows": "\u22DF",
+    "/equalorsimilar": "\u2242",
+    "/equalsdots": "\u2251",
+    "/follownotdbleqv": "\u2ABA",
+    "/follownotslnteql": "\u2AB6",
+    "/followornoteqvlnt": "\u22E9",
+    "/followsorcurly": "\u227D",
+    "/followsorequal": "\u227F",
+    "/forcesbar": "\u22AA",
+    "/geomequivalent": "\u224E",
+    "/harpoondownleft": "\u21C3",
+    "/harpoondownright": "\u21C2",
+    "/harpoonleftright": "\u21CB",
+    "/harpoonrightleft": "\u21CC",
+    "/harpoonupleft": "\u21BF",
+    "/harpoonupright": "\u21BE",
+    "/hyphenchar": "\u002D",
+    "/hyphenminus": "\u002D",
+    "/intercal": "\u22BA",
+    "/interrobangdown": "\u2E18",
+    "/lessdbleqlgreater": "\u2A8B",
+    "/lessdblequal": "\u2266",
+    "/lessequalgreater": "\u22DA",
+    "/lessnotdblequal": "\u2268",
+    "/lessorapproxeql": "\u2A85",
+    "/lessorequalslant": "\u2A7D",
+    "/lessornotdbleql": "\u2268",
+    "/lessornotequal": "\u2268",
+    "/lessorsimilar": "\u2272",
+    "/longdbls": "\u017F\u017F",
+    "/longsh": "\u017F\u0068",
+    "/longsi": "\u017F\u0069",
+    "/longsl": "\u017F\u006C",
+    "/longst": "\u017F\u0074",
+    "/multicloseleft": "\u22C9",
+    "/multicloseright": "\u22CA",
+    "/multiopenleft": "\u22CB",
+    "/multiopenright": "\u22CC",
+    "/notapproxequal": "\u2247",
+    "/notarrowboth": "\u21AE",
+    "/notarrowleft": "\u219A",
+    "/notarrowright": "\u219B",
+    "/notbar": "\u2224",
+    "/notdblarrowboth": "\u21CE",
+    "/notdblarrowleft": "\u21CD",
+    "/notdblarrowright": "\u21CF",
+    "/notfollows": "\u2281",
+    "/notfollowsoreql": "\u22E1",
+    "/notforces": "\u22AE",
+    "/notforcesextra": "\u22AF",
+    "/notgreaterequal": "\u2271",
+    "/notlessequal": "\u2270",
+    "/notsatisfies": "\u22AD",
+    "/notsimilar": "\u2241",
+    "/notsubseteql": "\u2288",
+    "/notsubsetoreql": "\u228A",
+    "/notsuperseteql": "\u2289",
+    "/notsupersetoreql": "\u228B",
+    "/nottriangeqlleft": "\u22EC",
+    "/nottriangeqlright": "\u22ED",
+    "/nottriangleleft": "\u22EA",
+    "/nottriangleright": "\u22EB",
+    "/notturnstile": "\u22AC",
+    "/orunderscore": "\u22BB",
+    "/planckover2pi": "\u210F",
+    "/planckover2pi1": "\u210F",
+    "/precedenotdbleqv": "\u2AB9",
+    "/precedenotslnteql": "\u2AB5",
+    "/precedeornoteqvlnt": "\u22E8",
+    "/precedesorcurly": "\u227C",
+    "/primereverse": "\u2035",
+    "/punctdash": "\u2014",
+    "/rangedash": "\u2013",
+    "/revasymptequal": "\u22CD",
+    "/revsimilar": "\u223D",
+    "/rightanglene": "\u231D",
+    "/rightanglenw": "\u231C",
+    "/rightanglese": "\u231F",
+    "/rightanglesw": "\u231E",
+    "/ringingBell": "\U0001F56D",
+    "/satisfies": "\u22A8",
+    "/square": "\u25A1",
+    "/squaredot": "\u22A1",
+    "/squareminus": "\u229F",
+    "/squaremultiply": "\u22A0",
+    "/squareplus": "\u229E",
+    "/squaresolid": "\u25A0",
+    "/squiggleleftright": "\u21AD",
+    "/squiggleright": "\u219D",
+    "/st": "\u0073\u0074",
+    "/subsetdblequal": "\u2AC5",
+    "/subsetnoteql": "\u228A",
+    "/subsetornotdbleql": "\u2ACB",
+    "/supersetdbl": "\u22D1",
+    "/supersetdblequal": "\u2AC6",
+    "/supersetnoteql": "\u228B",
+    "/supersetornotdbleql": "\u2ACC",
+    "/triangledownsld": "\u25BC",
+    "/triangleleftequal": "\u22B4",
+    "/triangleleftsld": "\u25C0",
+    "/trianglerightequal": "\u22B5",
+    "/trianglerightsld": "\u25B6",
+    "/trianglesolid": "\u25B2",
+    "/uprise": "\u22CF",
+    "/visualspace": "\u2423",
+}
+
+
+def _complete() -> None:
+    for i in range(256):
+        adobe_glyphs[f"/a{i}"] = chr(i)
+    adobe_glyphs["/.notdef"] = "□"
+
+
+_complete()
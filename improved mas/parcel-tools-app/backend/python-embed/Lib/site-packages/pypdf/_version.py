@@ -0,0 +1 @@
+__version__ = "6.20.1"
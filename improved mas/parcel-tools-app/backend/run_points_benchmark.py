@@ -0,0 +1,88 @@
+import sys
+import os
+import time
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from points_parser import parse_points_file, parse_points_text
+
+
+def legacy_parse(text_data):
+    """The per-line loop every entry point used before points_parser."""
+    points = []
+    seen_point_ids = set()
+    for line in text_data.strip().split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#') or line.startswith('//'):
+            continue
+        line = line.replace(';', ',')
+        parts = [p.strip() for p in (line.split(',') if ',' in line else line.split()) if p.strip()]
+        if len(parts) >= 3:
+            try:
+                point_id = parts[0].strip()
+                if not point_id or point_id in seen_point_ids:
+                    continue
+                x = float(parts[1])
+                y = float(parts[2])
+                seen_point_ids.add(point_id)
+                points.append({'id': point_id, 'x': x, 'y': y})
+            except ValueError:
+                continue
+    return points
+
+
+def make_points(n, fmt):
+    rng = random.Random(1)
+    rows = []
+    for i in range(1, n + 1):
+        x = 170000 + rng.uniform(0, 5000)
+        y = 640000 + rng.uniform(0, 5000)
+        if fmt == 'csv':
+            rows.append(f'{i},{x:.3f},{y:.3f}')
+        elif fmt == 'csv+z+code':
+            rows.append(f'{i},{x:.3f},{y:.3f},{rng.uniform(0, 900):.3f},PT')
+        else:
+            rows.append(f'{i} {x:.3f} {y:.3f}')
+    return '\n'.join(rows) + '\n'
+
+
+def main():
+    print("==================================================================")
+    print("PARCEL TOOLS POINTS PARSER BENCHMARK")
+    print("==================================================================")
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for fmt in ('csv', 'whitespace', 'csv+z+code'):
+        text = make_points(n, fmt)
+
+        start = time.perf_counter()
+        legacy = legacy_parse(text)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table = parse_points_text(text, with_extra=True)
+        columns_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        as_dicts = parse_points_text(text).to_list()
+        dicts_time = time.perf_counter() - start
+
+        path = os.path.join(tempfile.mkdtemp(), 'bench.pnt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        start = time.perf_counter()
+        parse_points_file(path)
+        file_time = time.perf_counter() - start
+        os.remove(path)
+
+        assert as_dicts == legacy and len(table) == n
+        print(f"\n[{fmt}] {n:,} lines ({len(text) / 1e6:.1f} MB)")
+        print(f"  legacy loop        : {legacy_time:.3f}s  ({n / legacy_time / 1e6:.2f} M lines/s)")
+        print(f"  columns            : {columns_time:.3f}s  ({n / columns_time / 1e6:.2f} M lines/s)")
+        print(f"  columns + dicts    : {dicts_time:.3f}s  ({n / dicts_time / 1e6:.2f} M lines/s)")
+        print(f"  streamed from disk : {file_time:.3f}s  ({n / file_time / 1e6:.2f} M lines/s)")
+
+
+if __name__ == '__main__':
+    main()
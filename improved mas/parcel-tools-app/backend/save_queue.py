@@ -0,0 +1,214 @@
+"""
+Project Save Queue for Parcel Tools
+Per-path write-behind queue: bursts of autosaves to the same .prcl are merged and
+only the newest snapshot is written, atomically (temp file + fsync + os.replace).
+Callers get an immediate acknowledgement and can flush() when they need durability.
+"""
+
+import json
+import os
+import threading
+import time
+
+
+def write_json_atomic(path, data, retries=5):
+    """Write JSON next to `path` and swap it in, so readers never see a half-written file."""
+    tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(tmp, 'w', encoding='utf-8', newline='') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        for attempt in range(retries):
+            try:
+                os.replace(tmp, path)
+                return
+            except PermissionError:
+                # Windows: target briefly held open by a reader / sync client
+                if attempt == retries - 1:
+                    raise
+                time.sleep(0.05 * (attempt + 1))
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class _Pending:
+    __slots__ = ('path', 'data', 'seq', 'due', 'on_written')
+
+    def __init__(self, path, data, seq, due, on_written):
+        self.path = path
+        self.data = data
+        self.seq = seq
+        self.due = due
+        self.on_written = on_written
+
+
+class SaveQueue:
+    """
+    Coalescing write-behind queue. A path's first pending save is written `delay`
+    seconds after it was submitted; saves arriving meanwhile replace its snapshot.
+    on_written(path) runs on the writer thread after each successful write.
+    """
+
+    def __init__(self, delay=0.75, writer=write_json_atomic):
+        self.delay = delay
+        self._writer = writer
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._inflight = {}
+        self._written = {}
+        self._errors = {}
+        self._seq = 0
+        self._thread = None
+        self._closed = False
+        self._dir_lock = threading.Lock()
+        self._checked_dirs = set()
+        self.stats = {'submitted': 0, 'coalesced': 0, 'written': 0, 'failed': 0}
+
+    @staticmethod
+    def _key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def submit(self, path, data, on_written=None):
+        """Queue a snapshot for `path`; returns its sequence number immediately."""
+        key = self._key(path)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError('Save queue is closed')
+            self._seq += 1
+            self.stats['submitted'] += 1
+            entry = self._pending.get(key)
+            if entry is None:
+                self._pending[key] = _Pending(path, data, self._seq, time.monotonic() + self.delay, on_written)
+            else:
+                self.stats['coalesced'] += 1
+                entry.path, entry.data, entry.seq, entry.on_written = path, data, self._seq, on_written
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='SaveQueue', daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+            return self._seq
+
+    def pending(self, path=None):
+        with self._cond:
+            if path is None:
+                return len(self._pending) + len(self._inflight)
+            key = self._key(path)
+            return int(key in self._pending) + int(key in self._inflight)
+
+    def flush(self, path=None, timeout=30.0):
+        """
+        Write pending saves for `path` (or every path) now and wait for them.
+        Returns None on success, otherwise the exception from the failed write
+        (including an earlier acknowledged save whose write failed and was not redone).
+        """
+        with self._cond:
+            keys = [self._key(path)] if path is not None else \
+                list(set(self._pending) | set(self._inflight) | set(self._errors))
+            targets = {}
+            for key in keys:
+                entry = self._pending.get(key)
+                if entry is not None:
+                    entry.due = 0.0
+                    targets[key] = entry.seq
+                elif key in self._inflight:
+                    targets[key] = self._inflight[key]
+                elif key in self._errors:
+                    return self._errors[key][1]
+            self._cond.notify_all()
+
+            deadline = time.monotonic() + timeout
+            while True:
+                outstanding = []
+                for key, seq in targets.items():
+                    failed = self._errors.get(key)
+                    if failed and failed[0] >= seq:
+                        return failed[1]
+                    if self._written.get(key, 0) < seq:
+                        outstanding.append(key)
+                if not outstanding:
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return TimeoutError(f'Timed out waiting for {len(outstanding)} pending save(s)')
+                self._cond.wait(remaining)
+
+    def close(self, timeout=30.0):
+        """Flush everything and stop accepting saves (called at interpreter exit)."""
+        error = self.flush(timeout=timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        return error
+
+    def check_directory(self, directory):
+        """
+        Make sure `directory` exists and is writable, probing it once per process.
+        Returns None if usable, otherwise an error message.
+        """
+        key = self._key(directory)
+        with self._dir_lock:
+            if key in self._checked_dirs:
+                return None
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            return f'Cannot create directory: {e}'
+        probe = os.path.join(directory, f'.parcel_tools_test.{os.getpid()}')
+        try:
+            with open(probe, 'w') as f:
+                f.write('test')
+            os.remove(probe)
+        except OSError:
+            return f'No write permission in directory: {directory}'
+        with self._dir_lock:
+            self._checked_dirs.add(key)
+        return None
+
+    # -- writer thread -----------------------------------------------------
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._pending:
+                        key, entry = min(self._pending.items(), key=lambda item: item[1].due)
+                        wait = entry.due - time.monotonic()
+                        if wait <= 0:
+                            del self._pending[key]
+                            self._inflight[key] = entry.seq
+                            break
+                        self._cond.wait(wait)
+                    elif self._closed:
+                        return
+                    else:
+                        self._cond.wait()
+
+            error = None
+            try:
+                self._writer(entry.path, entry.data)
+            except Exception as e:
+                error = e
+                print(f'[Save Queue ERROR] Failed to write {entry.path}: {e}')
+                with self._dir_lock:
+                    self._checked_dirs.discard(self._key(os.path.dirname(entry.path)))
+            if error is None and entry.on_written is not None:
+                try:
+                    entry.on_written(entry.path)
+                except Exception as e:
+                    print(f'[Save Queue WARNING] Post-write hook failed for {entry.path}: {e}')
+
+            with self._cond:
+                self._inflight.pop(key, None)
+                if error is None:
+                    self.stats['written'] += 1
+                    self._written[key] = entry.seq
+                    self._errors.pop(key, None)
+                else:
+                    self.stats['failed'] += 1
+                    self._errors[key] = (entry.seq, error)
+                self._cond.notify_all()
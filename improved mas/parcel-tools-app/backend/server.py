@@ -0,0 +1,14 @@
+"""
+Parcel Tools Backend entry point
+Starts the Flask API in app.py. PDF report workers are spawned processes, and spawn
+re-imports the main script in every worker as __mp_main__; with this file as the main
+script that import is empty, so workers load only pdf_report instead of running all of
+app.py's module-level setup (caches, watchers, job managers, Firebase).
+"""
+
+import multiprocessing
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()  # PDF report workers re-launch this executable when frozen
+    from app import main
+    main()
@@ -0,0 +1,144 @@
+import sys
+import os
+import time
+import zipfile
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+from archive_jobs import ArchiveJobManager
+
+client = app_module.app.test_client()
+
+
+def _files(count, rows=400):
+    return [{'archiveName': f'points/batch_{k}.pnt',
+             'content': '\n'.join(f'{j}, {1000.0 + j * 10.5 + k}, {2000.0 + j * 5.2}' for j in range(rows))}
+            for k in range(count)]
+
+
+def _wait(job_id, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = client.get(f'/api/compress/status?jobId={job_id}').get_json()
+        if status['status'] in ('done', 'failed', 'cancelled'):
+            return status
+        time.sleep(0.02)
+    raise AssertionError(f'job {job_id} did not finish')
+
+
+def test_async_job_progress():
+    out = os.path.join(tempfile.mkdtemp(), 'async.zip')
+    files = _files(40) + [{'sourcePath': os.path.join(tempfile.gettempdir(), 'no_such_file.pnt')}]
+    res = client.post('/api/compress-files', json={'files': files, 'outputPath': out})
+    assert res.status_code == 202
+    job_id = res.get_json()['jobId']
+
+    status = _wait(job_id)
+    result = status['result']
+    assert status['status'] == 'done' and status['filesTotal'] == 41 and status['filesDone'] == 40
+    assert len(status['errors']) == 1 and result['skippedCount'] == 1
+    assert status['bytesIn'] == result['originalSizeBytes']
+    assert 0 < status['bytesOut'] < result['compressedSizeBytes'] == os.path.getsize(out)
+    with zipfile.ZipFile(out) as z:
+        assert z.testzip() is None and len(z.namelist()) == 40
+
+    export = client.post('/api/project/export-archive', json={
+        'projectName': 'Async', 'projectData': {'points': {'1': {'x': 1, 'y': 2}}},
+        'outputPath': os.path.join(tempfile.mkdtemp(), 'project.zip')}).get_json()
+    done = _wait(export['jobId'])
+    assert done['status'] == 'done' and done['result']['filesCount'] == 3 and done['result']['manifest']
+
+    assert client.get('/api/compress/status?jobId=nope').status_code == 404
+    assert client.post('/api/compress/cancel', json={}).status_code == 400
+    assert client.post('/api/compress/cancel', json={'jobId': 'nope'}).status_code == 404
+    health = client.get('/api/compress/status').get_json()
+    assert health['status'] == 'healthy' and isinstance(health['activeJobs'], list)
+    print(f"✅ Async archive job: {status['filesDone']} files, {status['bytesIn']}B in, {status['bytesOut']}B out")
+
+
+def test_per_output_locking():
+    manager = ArchiveJobManager(max_running=6)
+    running, peak, lock = {}, {}, threading.Lock()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def work(path, meet):
+        def run(job):
+            with lock:
+                running[path] = running.get(path, 0) + 1
+                peak[path] = max(peak.get(path, 0), running[path])
+            if meet:
+                barrier.wait()  # only passes if three different outputs are built at the same time
+            time.sleep(0.05)
+            with lock:
+                running[path] -= 1
+            return {'path': path}
+        return run
+
+    jobs = [manager.submit('test', f'/tmp/out_{k}.zip', 1, work(f'/tmp/out_{k}.zip', True)) for k in range(3)]
+    jobs += [manager.submit('test', '/tmp/same.zip', 1, work('/tmp/same.zip', False)) for _ in range(4)]
+    for job in jobs:
+        assert job.wait(10)
+    assert all(j.status == 'done' for j in jobs)
+    assert peak['/tmp/same.zip'] == 1 and not manager._chains
+    manager.shutdown()
+
+    # Jobs queued behind one busy output don't take runner threads from other outputs
+    manager = ArchiveJobManager(max_running=2)
+    release = threading.Event()
+    busy = [manager.submit('test', '/tmp/busy.zip', 1, lambda job: release.wait(10) and {}) for _ in range(5)]
+    other = manager.submit('test', '/tmp/other.zip', 1, lambda job: {'ok': True})
+    assert other.wait(5) and other.status == 'done'
+    assert [j.status for j in busy[1:]] == ['waiting'] * 4
+    release.set()
+    assert all(j.wait(10) for j in busy) and all(j.status == 'done' for j in busy)
+    manager.shutdown()
+
+    # Twenty simultaneous requests (run_stress_test.py) all complete with their own archives
+    body = {'files': _files(51, rows=100), 'compressionLevel': 6, 'wait': True}
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        results = list(pool.map(lambda k: client.post('/api/compress-files', json=dict(body, comment=f'batch {k}')),
+                                range(20)))
+    paths = set()
+    for res in results:
+        data = res.get_json()
+        assert res.status_code == 200 and data['filesCount'] == 51
+        paths.add(data['outputPath'])
+    assert len(paths) == 20
+    print("✅ Different outputs build side by side; the same output is written by one job at a time")
+
+
+def test_cancel_waiting_job():
+    out = os.path.join(tempfile.mkdtemp(), 'contended.zip')
+    release = threading.Event()
+    blocker = app_module.archive_jobs.submit('test', out, 0, lambda job: release.wait(10) and {})
+    queued = client.post('/api/compress-files', json={'files': _files(5), 'outputPath': out})
+    job_id = queued.get_json()['jobId']
+    time.sleep(0.1)
+    assert client.get(f'/api/compress/status?jobId={job_id}').get_json()['status'] == 'waiting'
+    cancel = client.post('/api/compress/cancel', json={'jobId': job_id}).get_json()
+    assert cancel['cancelRequested']
+    release.set()
+    assert blocker.wait(5)
+    assert _wait(job_id)['status'] == 'cancelled'
+    assert not os.path.exists(out) and not os.path.exists(out + '.part')
+
+    # Cancelling mid-build removes the partial archive
+    big = os.path.join(tempfile.mkdtemp(), 'big.zip')
+    res = client.post('/api/compress-files', json={'files': _files(400, rows=3000), 'outputPath': big,
+                                                   'async': True}).get_json()
+    time.sleep(0.2)
+    client.post('/api/compress/cancel', json={'jobId': res['jobId']})
+    final = _wait(res['jobId'])
+    if final['status'] == 'cancelled':
+        assert final['filesDone'] < 400 and not os.path.exists(big) and not os.path.exists(big + '.part')
+    print(f"✅ Cancelled jobs leave no archive behind (mid-build job ended {final['status']} "
+          f"after {final['filesDone']} files)")
+
+
+if __name__ == '__main__':
+    test_async_job_progress()
+    test_per_output_locking()
+    test_cancel_waiting_job()
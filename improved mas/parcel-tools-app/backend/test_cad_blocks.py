@@ -0,0 +1,114 @@
+import sys
+import os
+import math
+import tempfile
+
+import ezdxf
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+import cad_blocks
+
+
+def _close(a, b):
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_close(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_close(x, y) for x, y in zip(a, b))
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)) and not isinstance(a, bool):
+        return abs(a - b) < 2e-4
+    return a == b
+
+
+def _parse_exploded(path):
+    """Parse with every INSERT going through virtual_entities() (the pre-template path)."""
+    original = app_module.MAX_TEMPLATE_SCALE
+    app_module.MAX_TEMPLATE_SCALE = 0
+    try:
+        return app_module._parse_dxf_file(path)
+    finally:
+        app_module.MAX_TEMPLATE_SCALE = original
+
+
+def test_templates_match_virtual_entities():
+    doc = ezdxf.new()
+    doc.layers.add('GIS', color=3)
+    doc.layers.add('MARKS', color=1)
+    doc.layers.add('RED', color=1)
+    msp = doc.modelspace()
+    mark = doc.blocks.new('MARK', base_point=(0.5, 0))
+    mark.add_line((-1, 0), (1, 0))
+    mark.add_arc((0, 0), 0.8, 0, 90, dxfattribs={'layer': 'RED'})
+    mark.add_lwpolyline([(0, 0, 0), (1, 0, 0.5), (1, 1, 0)], format='xyb')
+    mark.add_text('X', dxfattribs={'insert': (0.2, 0.2), 'height': 0.3, 'rotation': 10})
+    mark.add_point((0.1, 0.1))
+    mark.add_attdef('PNT', (0.6, 0.6), dxfattribs={'height': 0.3})
+    group = doc.blocks.new('GROUP')
+    group.add_blockref('MARK', (2, 2))
+    group.add_blockref('MARK', (5, 2), dxfattribs={'layer': 'RED'})
+    for i in range(50):
+        ref = msp.add_blockref('MARK', (i * 3.0, 5.0), dxfattribs={'layer': 'GIS' if i % 2 else 'MARKS',
+                                                                    'rotation': 90 * (i % 4)})
+        ref.add_auto_attribs({'PNT': str(i + 1)})
+    msp.add_blockref('GROUP', (0, -20), dxfattribs={'layer': 'MARKS'})
+    path = os.path.join(tempfile.mkdtemp(), 'blocks.dxf')
+    doc.saveas(path)
+
+    built = []
+    original = app_module.BlockTemplate
+
+    class CountingTemplate(original):
+        def __init__(self, *args):
+            built.append(1)
+            super().__init__(*args)
+
+    app_module.BlockTemplate = CountingTemplate
+    try:
+        fast = app_module._parse_dxf_file(path)
+    finally:
+        app_module.BlockTemplate = original
+    slow = _parse_exploded(path)
+    assert 1 <= len(built) <= 5  # MARK on a parcel / non-parcel layer, MARK inside GROUP, GROUP
+    assert len(fast['entities']) == len(slow['entities'])
+    for a, b in zip(fast['entities'], slow['entities']):
+        if a.get('type') == 'TEXT_LABEL':
+            assert abs((a['rotation'] - b['rotation'] + 180) % 360 - 180) < 0.02
+            a, b = dict(a, rotation=0), dict(b, rotation=0)
+        assert _close(a, b), (a, b)
+    assert fast['raw_points'] == slow['raw_points']
+    # Layer-0 polylines follow the INSERT's layer, including staying whole on the parcel layer
+    assert any(e['type'] == 'LWPOLYLINE' and e['layer'] == 'GIS' for e in fast['entities'])
+    print("✅ Block templates reproduce virtual_entities() output, one template per block")
+
+
+def test_byblock_colour_and_mirrored_arcs():
+    doc = ezdxf.new()
+    doc.layers.add('GIS', color=3)
+    msp = doc.modelspace()
+    block = doc.blocks.new('SYM')
+    block.add_circle((0, 0), 2.0, dxfattribs={'color': 0})          # ByBlock
+    block.add_line((0, 0), (3, 0))                                  # layer 0, ByLayer
+    block.add_point((1, 1))
+    msp.add_blockref('SYM', (10, 10), dxfattribs={'layer': 'GIS', 'color': 5, 'xscale': -2, 'yscale': 2})
+    path = os.path.join(tempfile.mkdtemp(), 'sym.dxf')
+    doc.saveas(path)
+
+    ents = app_module._parse_dxf_file(path)['entities']
+    circle = next(e for e in ents if e['type'] == 'CIRCLE' and e['segments'][0]['r'] == 4.0)
+    assert circle['color'] == '#0000ff' and circle['layer'] == 'GIS'
+    seg = circle['segments'][0]
+    assert (seg['cx'], seg['cy']) == (10.0, 10.0)
+    assert all(abs(math.hypot(p['x'] - 10, p['y'] - 10) - 4.0) < 1e-3 for p in circle['points'])
+    line = next(e for e in ents if e['type'] == 'LINE')
+    assert line['layer'] == 'GIS' and line['color'] == '#00ff00'
+    assert line['points'] == [{'x': 10.0, 'y': 10.0}, {'x': 4.0, 'y': 10.0}]
+    # The point marker moves with the INSERT but keeps its size
+    marker = next(e for e in ents if e['type'] == 'CIRCLE' and e is not circle)
+    assert cad_blocks.POINT_MARKER not in marker
+    assert all(abs(math.hypot(p['x'] - 8, p['y'] - 12) - 0.05) < 1e-3 for p in marker['points'])
+    print("✅ ByBlock / layer 0 inheritance and mirrored arcs are transformed correctly")
+
+
+if __name__ == '__main__':
+    test_templates_match_virtual_entities()
+    test_byblock_colour_and_mirrored_arcs()
@@ -0,0 +1,76 @@
+import sys
+import os
+import tempfile
+
+import ezdxf
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+from cad_cache import CadParseCache
+
+app = app_module.app
+client = app.test_client()
+
+
+def _make_dxf(path, size=10):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    doc.layers.add('GIS')
+    msp.add_lwpolyline([(0, 0), (size, 0), (size, size), (0, size)], close=True, dxfattribs={'layer': 'GIS'})
+    msp.add_text('12', dxfattribs={'insert': (0, 0), 'layer': 'NUM'})
+    msp.add_point((5, 5))
+    doc.saveas(path)
+
+
+def test_cache_memory_disk_and_invalidation():
+    tmp = tempfile.mkdtemp()
+    dxf = os.path.join(tmp, 'sheet.dxf')
+    _make_dxf(dxf)
+    cache = CadParseCache(os.path.join(tmp, 'cache'), memory_bytes=10_000)
+
+    key = cache.key(dxf, 1)
+    assert cache.get(key) is None
+    cache.put(key, {'entities': [{'type': 'LINE'}], 'raw_points': [], 'layers': []})
+    assert cache.get_result(key)['entities'][0]['type'] == 'LINE'
+    assert cache.stats['memory_hits'] == 1
+
+    # A fresh instance (restart) reads the compressed entry from disk
+    reopened = CadParseCache(cache.cache_dir)
+    assert reopened.get_result(key)['entities'] == [{'type': 'LINE'}] and reopened.stats['disk_hits'] == 1
+
+    # New parser version or options, or new file contents, mean a new key
+    assert cache.key(dxf, 2) != key and cache.key(dxf, 1, {'layers': ['GIS']}) != key
+    _make_dxf(dxf, size=20)
+    os.utime(dxf, ns=(os.stat(dxf).st_atime_ns, os.stat(dxf).st_mtime_ns + 2_000_000_000))
+    assert cache.key(dxf, 1) != key
+
+    # Memory LRU stays within its byte budget
+    for i in range(50):
+        cache.put(f'k{i}', b'{"pad":"' + b'x' * 900 + b'"}')
+    assert cache._memory_size <= cache.memory_bytes
+    print("✅ CAD cache: memory LRU, compressed disk entries, content-addressed keys")
+
+
+def test_parse_cad_served_from_cache():
+    tmp = tempfile.mkdtemp()
+    dxf = os.path.join(tmp, 'block 7.dxf')
+    _make_dxf(dxf)
+    original = app_module.cad_cache
+    app_module.cad_cache = CadParseCache(os.path.join(tmp, 'cache'))
+    try:
+        first = client.post('/api/parse-cad', json={'filePath': dxf})
+        assert first.status_code == 200
+        second = client.post('/api/parse-cad', json={'filePath': dxf})
+        assert second.status_code == 200 and app_module.cad_cache.stats['memory_hits'] == 1
+        a, b = first.get_json(), second.get_json()
+        assert a == b and a['fileName'] == 'block 7.dxf' and a['fileType'] == 'dxf'
+        assert any(e['type'] == 'LWPOLYLINE' and e['layer'] == 'GIS' for e in a['entities'])
+        assert a['raw_points'] == [{'id': 'DXF_1', 'x': 5.0, 'y': 5.0}]
+    finally:
+        app_module.cad_cache = original
+    print("✅ /api/parse-cad re-opens unchanged drawings from the cache")
+
+
+if __name__ == '__main__':
+    test_cache_memory_disk_and_invalidation()
+    test_parse_cad_served_from_cache()
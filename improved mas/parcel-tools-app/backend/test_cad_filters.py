@@ -0,0 +1,80 @@
+import sys
+import os
+import tempfile
+import time
+
+import ezdxf
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+from cad_cache import CadParseCache
+
+app = app_module.app
+client = app.test_client()
+
+
+def _sheet(path, dims=40):
+    doc = ezdxf.new(setup=True)
+    doc.layers.add('GIS', color=3)
+    doc.layers.add('NUM', color=1)
+    doc.layers.add('MARKS', color=2)
+    msp = doc.modelspace()
+    block = doc.blocks.new('MARK')
+    block.add_circle((0, 0), 0.5)
+    block.add_text('M', dxfattribs={'insert': (0.5, 0.5), 'layer': 'NUM'})
+    for i in range(10):
+        msp.add_lwpolyline([(i * 10, 0), (i * 10 + 8, 0), (i * 10 + 8, 8)], close=True, dxfattribs={'layer': 'GIS'})
+        msp.add_text(str(i + 1), dxfattribs={'insert': (i * 10 + 4, 4), 'layer': 'NUM'})
+        msp.add_blockref('MARK', (i * 10, -5), dxfattribs={'layer': 'MARKS'})
+    for i in range(dims):
+        msp.add_linear_dim(base=(i * 2, -20), p1=(i * 2, -10), p2=(i * 2 + 1, -10)).render()
+    msp.add_spline([(0, 30), (10, 40), (20, 30)])
+    doc.saveas(path)
+
+
+def test_layer_and_type_allow_lists():
+    path = os.path.join(tempfile.mkdtemp(), 'filters.dxf')
+    _sheet(path)
+    full = app_module._parse_dxf_file(path)['entities']
+    only = app_module._parse_dxf_file(path, layers=['gis', 'NUM'])['entities']
+    assert only and {e['layer'] for e in only} == {'GIS', 'NUM'}
+    assert [e for e in full if e['layer'] in ('GIS', 'NUM')] == only  # block text on NUM included
+
+    texts = app_module._parse_dxf_file(path, types=['TEXT'])['entities']
+    assert len(texts) == 10 and all(e['type'] == 'TEXT_LABEL' for e in texts)
+    with_blocks = app_module._parse_dxf_file(path, types=['text', 'insert'])['entities']
+    assert len(with_blocks) == 20  # + the TEXT inside each MARK, but not its CIRCLE
+    print("✅ Layer and entity-type allow-lists filter the parse")
+
+
+def test_layers_only_endpoint():
+    path = os.path.join(tempfile.mkdtemp(), 'filters.dxf')
+    _sheet(path, dims=150)
+    original = app_module.cad_cache
+    app_module.cad_cache = CadParseCache(None)
+    try:
+        started = time.time()
+        summary = client.post('/api/parse-cad', json={'filePath': path, 'layersOnly': True}).get_json()
+        scan_time = time.time() - started
+        started = time.time()
+        client.post('/api/parse-cad', json={'filePath': path})
+        parse_time = time.time() - started
+
+        layers = {l['name']: l for l in summary['layers']}
+        assert summary['layersOnly'] and summary['fileName'] == 'filters.dxf'
+        assert layers['GIS']['entityCount'] == 10 and layers['GIS']['types'] == {'LWPOLYLINE': 10}
+        assert layers['GIS']['extents'] == [0.0, 0.0, 98.0, 8.0]
+        assert layers['MARKS']['extents'][1] == -5.5  # block extents placed by the INSERT
+        assert layers['0']['types']['DIMENSION'] == 150
+
+        res = client.post('/api/parse-cad', json={'filePath': path, 'layers': ['GIS'], 'format': 'columnar'})
+        assert res.status_code == 200
+        assert client.post('/api/parse-cad', json={'filePath': path, 'layers': 'GIS'}).status_code == 400
+    finally:
+        app_module.cad_cache = original
+    print(f"✅ layersOnly summary in {scan_time:.2f}s vs full parse {parse_time:.2f}s")
+
+
+if __name__ == '__main__':
+    test_layer_and_type_allow_lists()
+    test_layers_only_endpoint()
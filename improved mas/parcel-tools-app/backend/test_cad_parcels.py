@@ -0,0 +1,145 @@
+import sys
+import os
+import math
+import tempfile
+
+import ezdxf
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+from cad_cache import CadParseCache
+from cad_parcels import ParcelDetector, PointKDTree, _NOISE_LAYER, _NUMERIC, _POINT_LAYER
+
+app = app_module.app
+client = app.test_client()
+
+
+def _brute_force_corners(corners, labels):
+    """The O(V*L) all-pairs matching from DxfImport.jsx, kept as the reference."""
+    diag = math.hypot(max(c[0] for c in corners) - min(c[0] for c in corners),
+                      max(c[1] for c in corners) - min(c[1] for c in corners))
+    threshold = max(15, min(500, diag * 0.25))
+    pairs = []
+    for v, (x, y) in enumerate(corners):
+        for l, lbl in enumerate(labels):
+            if not 0 < len(lbl['text'].strip()) <= 15:
+                continue
+            d = math.hypot(lbl['x'] - x, lbl['y'] - y)
+            if d < threshold:
+                score = d
+                if _POINT_LAYER.search(lbl['layer']):
+                    score -= threshold * 3
+                if _NUMERIC.match(lbl['text']):
+                    score -= threshold
+                if _NOISE_LAYER.search(lbl['layer']):
+                    score += threshold * 3
+                pairs.append((score, v, l))
+    pairs.sort(key=lambda p: p[0])
+    assigned, used = [None] * len(corners), set()
+    for _, v, l in pairs:
+        if assigned[v] is None and l not in used:
+            assigned[v] = labels[l]['text'].strip()
+            used.add(l)
+    return assigned
+
+
+def _sheet(rows=12, cols=12, seed=3):
+    rng = np.random.default_rng(seed)
+    entities, labels = [], []
+    for r in range(rows):
+        for c in range(cols):
+            x, y = c * 40.0, r * 30.0
+            entities.append({'type': 'LWPOLYLINE', 'closed': True, 'layer': 'GIS', 'color': None,
+                             'points': [{'x': x, 'y': y}, {'x': x + 40, 'y': y}, {'x': x + 40, 'y': y + 30},
+                                        {'x': x, 'y': y + 30}, {'x': x, 'y': y}]})
+            labels.append({'type': 'TEXT_LABEL', 'text': f'{r * cols + c + 1}', 'layer': 'DESCRIPTION',
+                           'x': x + 20, 'y': y + 15})
+    for r in range(rows + 1):
+        for c in range(cols + 1):
+            dx, dy = rng.normal(0, 1.5, 2)
+            labels.append({'type': 'TEXT_LABEL', 'text': str(1000 + r * (cols + 1) + c), 'layer': 'POINT_NUM',
+                           'x': c * 40.0 + dx, 'y': r * 30.0 + dy})
+    labels.append({'type': 'TEXT_LABEL', 'text': '12.50', 'layer': 'DIM', 'x': 1.0, 'y': 1.0})
+    entities.append({'type': 'LWPOLYLINE', 'closed': True, 'layer': 'BUILDINGS', 'color': None,
+                     'points': [{'x': 5, 'y': 5}, {'x': 10, 'y': 5}, {'x': 10, 'y': 10}]})
+    return {'entities': entities + labels, 'layers': [{'name': 'GIS'}, {'name': 'POINT_NUM'}]}
+
+
+def test_kdtree_radius_query():
+    rng = np.random.default_rng(11)
+    xy = rng.uniform(0, 100, size=(3000, 2))
+    tree = PointKDTree(xy)
+    for x, y, r in rng.uniform(0, 100, size=(100, 3)) / (1, 1, 5):
+        ids, d = tree.query_radius(x, y, r)
+        expected = np.flatnonzero(np.hypot(xy[:, 0] - x, xy[:, 1] - y) < r)
+        assert sorted(ids.tolist()) == expected.tolist()
+        assert np.allclose(d, np.hypot(xy[ids, 0] - x, xy[ids, 1] - y))
+    assert len(PointKDTree(np.empty((0, 2))).query_radius(0, 0, 10)[0]) == 0
+    print("✅ KD-tree radius queries agree with a brute-force scan")
+
+
+def test_detect_matches_brute_force():
+    result = _sheet()
+    labels = [e for e in result['entities'] if e['type'] == 'TEXT_LABEL']
+    parcels = ParcelDetector(result).detect(known_ids=['1000', '1001'])
+    assert len(parcels) == 144  # the BUILDINGS triangle is not on a parcel layer
+    for parcel in parcels:
+        ent = result['entities'][parcel['entityIndex']]
+        corners = [(p['x'], p['y']) for p in ent['points'][:-1]]
+        assert [p['label'] for p in parcel['points']] == _brute_force_corners(corners, labels)
+        assert parcel['number'] == str(parcel['entityIndex'] + 1)
+        assert parcel['area'] == 1200.0 and parcel['perimeter'] == 140.0
+    first = parcels[0]['points']
+    assert [p['pointId'] for p in first] == ['1000', '1001', '1014', '1013']
+    assert [p['status'] for p in first] == ['matched', 'matched', 'missing', 'missing']
+    print("✅ Batch parcel detection matches the all-pairs label matching")
+
+
+def test_parcels_endpoint():
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, 'sheet.dxf')
+    doc = ezdxf.new()
+    doc.layers.add('GIS')
+    msp = doc.modelspace()
+    for k in range(3):
+        x = k * 50.0
+        msp.add_lwpolyline([(x, 0), (x + 50, 0), (x + 50, 40), (x, 40)], close=True, dxfattribs={'layer': 'GIS'})
+        msp.add_text(f'Parcel {k + 1}', dxfattribs={'insert': (x + 25, 20), 'layer': 'DESC'})
+    for k, (x, y) in enumerate([(0, 0), (50, 0), (100, 0), (150, 0), (0, 40), (50, 40)]):
+        msp.add_text(str(k + 1), dxfattribs={'insert': (x + 1, y + 1), 'layer': 'PT'})
+    doc.saveas(path)
+
+    original = app_module.cad_cache
+    app_module.cad_cache = CadParseCache(None)
+    try:
+        res = client.post('/api/cad/parcels', json={'filePath': path, 'pointIds': ['1', '2']}).get_json()
+        assert res['count'] == 3 and [p['number'] for p in res['parcels']] == ['1', '2', '3']
+        first, second, third = (p['points'] for p in res['parcels'])
+        assert [p['pointId'] for p in first] == ['1', '2', '6', '5']
+        assert [p['status'] for p in first] == ['matched', 'matched', 'missing', 'missing']
+        # Unlabelled corners shared by the 2nd and 3rd parcel get one generated ID
+        generated = {(p['x'], p['y']): p['pointId'] for parcel in res['parcels'] for p in parcel['points']
+                     if p['status'] == 'generated'}
+        shared = generated[(100.0, 40.0)]
+        assert shared in [p['pointId'] for p in second] and shared in [p['pointId'] for p in third]
+        assert len(set(generated.values())) == len(generated)
+
+        # One selected entity (the Create Parcel dialog); a non-boundary index finds nothing
+        index = res['parcels'][1]['entityIndex']
+        one = client.post('/api/cad/parcels', json={'filePath': path, 'pointIds': ['1', '2'],
+                                                    'entityIndex': index}).get_json()
+        assert one['count'] == 1 and one['parcels'][0]['number'] == '2'
+        assert client.post('/api/cad/parcels', json={'filePath': path, 'entityIndex': index + 1}).get_json()['count'] == 0
+        assert client.post('/api/cad/parcels', json={'filePath': path, 'entityIndex': '3'}).status_code == 400
+        assert client.post('/api/cad/parcels', json={'filePath': path, 'pointIds': '1'}).status_code == 400
+        assert client.post('/api/cad/parcels', json={}).status_code == 400
+    finally:
+        app_module.cad_cache = original
+    print("✅ /api/cad/parcels returns every parcel with matched point IDs")
+
+
+if __name__ == '__main__':
+    test_kdtree_radius_query()
+    test_detect_matches_brute_force()
+    test_parcels_endpoint()
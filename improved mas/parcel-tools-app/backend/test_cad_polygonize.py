@@ -0,0 +1,102 @@
+import sys
+import os
+import time
+import tempfile
+
+import ezdxf
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+from cad_cache import CadParseCache
+from cad_polygonize import polygonize, snap_points
+
+app = app_module.app
+client = app.test_client()
+
+
+def _jittered_grid(n, rng, jitter=2e-4):
+    """Unit cells drawn as separate LINE segments whose shared endpoints are slightly off."""
+    i, j = (a.ravel() for a in np.meshgrid(np.arange(n + 1), np.arange(n), indexing='ij'))
+    across = np.stack([j + rng.normal(0, jitter, len(j)), i, j + 1, i], axis=1)
+    up = np.stack([i, j, i, j + 1 + rng.normal(0, jitter, len(j))], axis=1)
+    return np.vstack([across, up])
+
+
+def test_faces_from_loose_lines():
+    segments = []
+    for k in range(4):
+        segments.append((k, -0.5, k, 3.5))          # long lines crossing each other, with overshoots
+        segments.append((-0.5, k, 3.5, k))
+    segments.append((1.5, 0, 1.5, 1))               # T-junctions at both ends: splits cell (0..1, 1..2)
+    segments.append((3, 3, 5, 5))                   # dangling line
+    segments.append((10, 10, 11, 10.0004))          # stray segment, no face
+    faces = polygonize(segments)
+    areas = sorted(round(f['area'], 6) for f in faces)
+    assert areas == [0.5, 0.5] + [1.0] * 8
+    for face in faces:
+        ring = face['coords']
+        signed = np.sum(ring[:, 0] * np.roll(ring[:, 1], -1) - np.roll(ring[:, 0], -1) * ring[:, 1]) / 2
+        assert signed > 0 and len(ring) in (4, 5)
+
+    node_of, nodes = snap_points(np.array([[0, 0], [0.0004, 0.0004], [0.0009, 0], [5, 5]]), 0.001)
+    assert node_of.tolist() == [0, 0, 0, 1] and len(nodes) == 2
+    print("✅ Loose lines are snapped, noded and traced into minimal faces")
+
+
+def test_polygonize_scales_linearly():
+    rng = np.random.default_rng(5)
+    small, large = _jittered_grid(50, rng), _jittered_grid(200, rng)
+    timings = []
+    for segments, cells in ((small, 2500), (large, 40000)):
+        started = time.time()
+        faces = polygonize(segments)
+        timings.append(time.time() - started)
+        assert len(faces) == cells
+        assert abs(sum(f['area'] for f in faces) - cells) < 0.01
+    # 16x the segments should cost nowhere near 256x (quadratic)
+    assert timings[1] < max(timings[0], 0.05) * 64
+    print(f"✅ Polygonized {len(small)} segments in {timings[0]:.2f}s, {len(large)} in {timings[1]:.2f}s")
+
+
+def test_parse_cad_polygonize_option():
+    path = os.path.join(tempfile.mkdtemp(), 'lines.dxf')
+    doc = ezdxf.new()
+    doc.layers.add('PARCELS')
+    doc.layers.add('ROADS')
+    msp = doc.modelspace()
+    for x0, y0, x1, y1 in [(0, 0, 60, 0), (60, 0, 60, 40), (60, 40, 0, 40), (0, 40, 0, 0), (30, 0, 30, 40)]:
+        msp.add_line((x0, y0), (x1, y1), dxfattribs={'layer': 'PARCELS'})
+    msp.add_lwpolyline([(100, 0), (120, 0), (120, 20), (100, 20), (100, 0)], dxfattribs={'layer': 'ROADS'})
+    msp.add_text('1', dxfattribs={'insert': (15, 20), 'layer': 'DESC'})
+    msp.add_text('2', dxfattribs={'insert': (45, 20), 'layer': 'DESC'})
+    doc.saveas(path)
+
+    original = app_module.cad_cache
+    app_module.cad_cache = CadParseCache(None)
+    try:
+        plain = client.post('/api/parse-cad', json={'filePath': path}).get_json()['entities']
+        assert not any(e.get('polygonized') for e in plain)
+        ents = client.post('/api/parse-cad', json={'filePath': path, 'polygonize': True}).get_json()['entities']
+        faces = [e for e in ents if e.get('polygonized')]
+        assert len(faces) == 2 and all(e['closed'] and e['layer'] == 'PARCELS' for e in faces)
+        assert len(ents) == len(plain) + 2
+
+        roads = client.post('/api/parse-cad', json={'filePath': path, 'polygonize': True,
+                                                    'polygonizeLayers': ['roads']}).get_json()['entities']
+        assert [e['layer'] for e in roads if e.get('polygonized')] == ['ROADS']
+
+        parcels = client.post('/api/cad/parcels', json={'filePath': path, 'polygonize': True}).get_json()
+        assert sorted(p['number'] for p in parcels['parcels']) == ['1', '2']
+        assert all(p['area'] == 1200.0 for p in parcels['parcels'])
+        assert client.post('/api/parse-cad', json={'filePath': path, 'polygonize': True,
+                                                   'snapTolerance': 0}).status_code == 400
+    finally:
+        app_module.cad_cache = original
+    print("✅ parse-cad polygonize option adds the faces of loose parcel lines")
+
+
+if __name__ == '__main__':
+    test_faces_from_loose_lines()
+    test_polygonize_scales_linearly()
+    test_parse_cad_polygonize_option()
@@ -0,0 +1,89 @@
+import sys
+import os
+import math
+import tempfile
+
+import ezdxf
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+from cad_cache import CadParseCache
+
+app = app_module.app
+client = app.test_client()
+
+
+def _max_sagitta(points, cx, cy, r):
+    """Largest distance between a chord midpoint and the circle it approximates."""
+    worst = 0.0
+    for a, b in zip(points, points[1:]):
+        mx, my = (a['x'] + b['x']) / 2, (a['y'] + b['y']) / 2
+        worst = max(worst, abs(r - math.hypot(mx - cx, my - cy)))
+    return worst
+
+
+def _sheet(path):
+    doc = ezdxf.new()
+    doc.layers.add('GIS')
+    msp = doc.modelspace()
+    msp.add_arc((0, 0), 800.0, 10, 40)                     # large-radius road curve
+    msp.add_circle((50, 50), 0.3)                          # small survey-mark circle
+    msp.add_lwpolyline([(0, 0, 0), (100, 0, 0.25), (100, 60, 0), (0, 60, 0)], format='xyb', close=True,
+                       dxfattribs={'layer': 'GIS'})
+    msp.add_ellipse((200, 0), (40, 0), 0.5, dxfattribs={'layer': 'GIS'})
+    msp.add_spline([(0, 0), (10, 20), (30, -10), (50, 5)], dxfattribs={'layer': 'GIS'})
+    doc.saveas(path)
+
+
+def test_chord_tolerance_bounds_error_and_counts():
+    path = os.path.join(tempfile.mkdtemp(), 'curves.dxf')
+    _sheet(path)
+    tol = 0.01
+    ents = app_module._parse_dxf_file(path, tolerance=tol)['entities']
+
+    arc = next(e for e in ents if e['type'] == 'ARC')
+    seg = arc['segments'][0]
+    assert seg['type'] == 'arc' and seg['r'] == 800.0
+    assert _max_sagitta(arc['points'], 0, 0, 800.0) <= tol + 1e-4
+    assert len(arc['points']) > 17  # the old fixed 16 chords were ~0.37 units off on this curve
+
+    circle = next(e for e in ents if e['type'] == 'CIRCLE')
+    assert len(circle['points']) < 33 and circle['segments'][0]['r'] == 0.3
+
+    parcel = next(e for e in ents if e['type'] == 'LWPOLYLINE' and e['layer'] == 'GIS')
+    bulge = next(s for s in parcel['segments'] if s['type'] == 'arc')
+    on_arc = [p for p in parcel['points']
+              if abs(math.hypot(p['x'] - bulge['cx'], p['y'] - bulge['cy']) - bulge['r']) < 1e-3]
+    assert _max_sagitta(on_arc, bulge['cx'], bulge['cy'], bulge['r']) <= tol + 1e-4
+
+    ellipse = next(e for e in ents if e['type'] == 'LWPOLYLINE' and e['points'][0]['x'] > 150)
+    assert ellipse['closed']
+    for a, b in zip(ellipse['points'], ellipse['points'][1:]):
+        mx, my = (a['x'] + b['x']) / 2 - 200, (a['y'] + b['y']) / 2
+        assert (1 - math.hypot(mx / 40, my / 20)) * 20 <= tol + 1e-4
+
+    coarse = app_module._parse_dxf_file(path, tolerance=0.5)['entities']
+    assert sum(len(e['points']) for e in coarse) < sum(len(e['points']) for e in ents)
+    print("✅ Curves are flattened to the chord tolerance, arc parameters kept")
+
+
+def test_tolerance_option_keys_the_cache():
+    path = os.path.join(tempfile.mkdtemp(), 'curves.dxf')
+    _sheet(path)
+    original = app_module.cad_cache
+    app_module.cad_cache = CadParseCache(None)
+    try:
+        fine = client.post('/api/parse-cad', json={'filePath': path}).get_json()
+        coarse = client.post('/api/parse-cad', json={'filePath': path, 'chordTolerance': 0.5}).get_json()
+        default = client.post('/api/parse-cad', json={'filePath': path, 'chordTolerance': 0.01}).get_json()
+        assert default == fine and coarse != fine
+        assert app_module.cad_cache.stats['misses'] == 2
+        assert client.post('/api/parse-cad', json={'filePath': path, 'chordTolerance': -1}).status_code == 400
+    finally:
+        app_module.cad_cache = original
+    print("✅ chordTolerance is a cached parse-cad option")
+
+
+if __name__ == '__main__':
+    test_chord_tolerance_bounds_error_and_counts()
+    test_tolerance_option_keys_the_cache()
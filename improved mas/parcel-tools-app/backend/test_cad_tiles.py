@@ -0,0 +1,137 @@
+import sys
+import os
+import json
+import math
+import tempfile
+
+import ezdxf
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+from cad_cache import CadParseCache
+from cad_tiles import CadTilePyramid, simplify
+
+app = app_module.app
+client = app.test_client()
+
+
+def _survey_result(rows=40, cols=40):
+    entities = []
+    for r in range(rows):
+        for c in range(cols):
+            x, y = c * 10.0, r * 10.0
+            entities.append({'type': 'LWPOLYLINE', 'closed': True, 'layer': 'GIS', 'color': None,
+                             'points': [{'x': x, 'y': y}, {'x': x + 8, 'y': y}, {'x': x + 8, 'y': y + 8},
+                                        {'x': x, 'y': y + 8}]})
+    # A long wiggly road: 2000 vertices that collapse at low zoom
+    road = [{'x': i * 0.2, 'y': 200 + math.sin(i) * 0.01} for i in range(2000)]
+    entities.append({'type': 'LWPOLYLINE', 'closed': False, 'layer': 'ROADS', 'color': '#ff0000', 'points': road})
+    entities.append({'type': 'TEXT_LABEL', 'text': '12', 'x': 5.0, 'y': 5.0, 'height': 0.5, 'layer': 'NUM',
+                     'color': None, 'points': [{'x': 5.0, 'y': 5.0}]})
+    return {'entities': entities, 'raw_points': [], 'layers': []}
+
+
+def test_simplify_and_tiles():
+    line = np.array([[0, 0], [1, 0.001], [2, -0.001], [3, 5], [4, 0]], dtype=float)
+    assert simplify(line, 0.1).tolist() == [[0, 0], [2, -0.001], [3, 5], [4, 0]]
+    assert len(simplify(line, 0.0)) == 5
+
+    result = _survey_result()
+    pyramid = CadTilePyramid(result)
+    assert pyramid.max_zoom >= 4
+    road = len(result['entities']) - 2
+
+    top = pyramid.tile(0, 0, 0)
+    by_index = {e['i']: e for e in top['entities']}
+    assert len(by_index[road]['coords']) < 20  # 2000 vertices -> a straight-ish line at zoom 0
+    assert len(result['entities']) - 1 not in by_index  # text far below a pixel
+
+    deepest = pyramid.max_zoom
+    n = 1 << deepest
+    visible = set()
+    for x in range(n):
+        for y in range(n):
+            visible.update(e['i'] for e in pyramid.tile(deepest, x, y)['entities'])
+            if len(visible) == len(result['entities']):
+                break
+    assert len(visible) == len(result['entities'])  # full detail keeps everything
+
+    # A deep tile only carries what touches it
+    box = pyramid.tile_bounds(deepest, 0, n - 1)  # south-west corner
+    corner = pyramid.tile(deepest, 0, n - 1)
+    assert 0 < len(corner['entities']) < 20
+    for e in corner['entities']:
+        xs, ys = e['coords'][0::2], e['coords'][1::2]
+        assert min(xs) <= box[2] and max(xs) >= box[0] and min(ys) <= box[3] and max(ys) >= box[1]
+    assert pyramid.tile(deepest, 0, n - 1) is corner and pyramid.stats['hits'] >= 1
+    print("✅ Tile pyramid simplifies per zoom and returns only visible entities")
+
+
+def test_nearest_matches_brute_force():
+    result = _survey_result()
+    pyramid = CadTilePyramid(result)
+    rng = np.random.default_rng(7)
+    for x, y in rng.uniform(-5, 405, size=(200, 2)):
+        best = None
+        for i, ent in enumerate(result['entities']):
+            pts = np.array([[p['x'], p['y']] for p in ent['points']])
+            if len(pts) == 1:
+                d = math.hypot(pts[0, 0] - x, pts[0, 1] - y)
+            else:
+                ring = np.vstack([pts, pts[:1]]) if ent.get('closed') else pts
+                d = min(_seg(x, y, *ring[k], *ring[k + 1]) for k in range(len(ring) - 1))
+            if d <= 1.0 and (best is None or d < best[1]):
+                best = (i, d)
+        hits = [h for h in pyramid.nearest(x, y, 1.0) if h['distance'] <= 1.0]
+        if best is None:
+            assert not hits
+        else:
+            assert abs(hits[0]['distance'] - best[1]) < 1e-9
+    inside = pyramid.nearest(4.0, 4.0, 0.5)
+    assert inside and inside[0]['i'] == 0 and inside[0]['inside'] and inside[0]['distance'] == 4.0
+    print("✅ Nearest-entity query agrees with a brute-force scan")
+
+
+def _seg(px, py, ax, ay, bx, by):
+    dx, dy = bx - ax, by - ay
+    t = 0.0 if dx == dy == 0 else max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / (dx * dx + dy * dy)))
+    return math.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+def test_tile_endpoints():
+    tmp = tempfile.mkdtemp()
+    dxf = os.path.join(tmp, 'tiles.dxf')
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for i in range(100):
+        msp.add_line((i * 5, 0), (i * 5 + 4, 0), dxfattribs={'layer': 'GIS'})
+    doc.saveas(dxf)
+
+    original = app_module.cad_cache
+    app_module.cad_cache = CadParseCache(None)
+    try:
+        info = client.post('/api/cad/tiles/build', json={'filePath': dxf}).get_json()
+        assert info['entityCount'] == 100 and info['drawingId']
+        tile = client.get(f"/api/cad/tiles?id={info['drawingId']}&z=0&x=0&y=0").get_json()
+        assert {e['i'] for e in tile['entities']} == set(range(100))
+        assert client.get(f"/api/cad/tiles?id={info['drawingId']}&z=40&x=0&y=0").status_code == 400
+        assert client.get('/api/cad/tiles?id=nope&z=0&x=0&y=0').status_code == 404
+
+        hits = client.get(f"/api/cad/hit?id={info['drawingId']}&x=12&y=0.1&radius=0.5").get_json()['hits']
+        assert hits[0]['i'] == 2
+
+        # Evicted pyramids are rebuilt from the parse cache
+        app_module.cad_tiles._pyramids.clear()
+        res = client.get(f"/api/cad/hit?id={info['drawingId']}&x=12&y=0.1&radius=0.5")
+        assert res.status_code == 200 and json.loads(res.data)['hits'][0]['i'] == 2
+        assert app_module.cad_cache.stats['misses'] == 1
+    finally:
+        app_module.cad_cache = original
+    print("✅ /api/cad/tiles and /api/cad/hit serve a built pyramid")
+
+
+if __name__ == '__main__':
+    test_simplify_and_tiles()
+    test_nearest_matches_brute_force()
+    test_tile_endpoints()
@@ -0,0 +1,93 @@
+import sys
+import os
+import json
+import tempfile
+
+import ezdxf
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+import cad_wire
+from cad_cache import CadParseCache
+
+app = app_module.app
+client = app.test_client()
+
+
+def _sample_result():
+    return {
+        'entities': [
+            {'type': 'LWPOLYLINE', 'closed': True, 'points': [{'x': 0, 'y': 0}, {'x': 10.5, 'y': 0}, {'x': 10.5, 'y': 8}],
+             'layer': 'GIS', 'color': '#00ff00',
+             'segments': [{'type': 'line', 'x': 0, 'y': 0}, {'type': 'arc', 'cx': 1.0, 'cy': 2.0, 'r': 3.0,
+                                                            'startAngle': 0.1, 'endAngle': 0.2, 'ccw': True}]},
+            {'type': 'LINE', 'x1': 1.0, 'y1': 2.0, 'x2': 3.0, 'y2': 4.0,
+             'points': [{'x': 1.0, 'y': 2.0}, {'x': 3.0, 'y': 4.0}], 'layer': 'ROADS', 'color': None, 'closed': False},
+            {'type': 'TEXT_LABEL', 'text': 'נקודה 12', 'x': 5.0, 'y': 6.0, 'halign': 'center', 'valign': 'middle',
+             'rotation': 90.0, 'points': [{'x': 5.0, 'y': 6.0}], 'layer': 'NUM', 'color': '#ff0000', 'height': 2.5},
+            {'type': 'TEXT_LABEL', 'text': 'DIM', 'x': 1.0, 'y': 1.0, 'halign': 'center', 'valign': 'middle',
+             'points': [{'x': 1.0, 'y': 1.0}], 'layer': 'DIM', 'color': None, 'height': 2},
+            {'type': 'POLYLINE', 'closed': True, 'filled': True, 'points': [{'x': 0, 'y': 0}, {'x': 1, 'y': 0}, {'x': 1, 'y': 1}],
+             'layer': 'GIS', 'color': '#00ff00'},
+            {'type': 'LINE', 'closed': False, 'points': [{'x': 7.0, 'y': 7.0}, {'x': 8.0, 'y': 9.0}],
+             'layer': 'ROADS', 'color': None},
+        ],
+        'raw_points': [{'id': 'DXF_1', 'x': 1.5, 'y': 2.5}],
+        'layers': [{'name': 'GIS', 'color': 3, 'is_off': False, 'is_frozen': False, 'visible': True}],
+    }
+
+
+def test_round_trip_and_zero_copy_layout():
+    result = _sample_result()
+    buf = cad_wire.frame(cad_wire.encode_result(result), {'fileName': 'a.dxf', 'fileType': 'dxf'})
+    decoded = cad_wire.decode(buf)
+    assert decoded['fileName'] == 'a.dxf'
+    assert decoded['entities'] == result['entities']
+    assert decoded['raw_points'] == result['raw_points'] and decoded['layers'] == result['layers']
+
+    # Every typed-array section starts on an 8-byte boundary of the whole buffer
+    meta_len = int.from_bytes(buf[4:8], 'little')
+    body = 8 + meta_len + (-(8 + meta_len)) % 8
+    manifest_len = int.from_bytes(buf[body:body + 4], 'little')
+    manifest = json.loads(buf[body + 8:body + 8 + manifest_len])
+    data = body + 8 + manifest_len + (-(8 + manifest_len)) % 8
+    assert data % 8 == 0
+    for group in manifest['groups']:
+        for key in ('index', 'offsets', 'coords', 'layer', 'color', 'flags'):
+            assert (data + group[key][0]) % 8 == 0
+    lines = next(g for g in manifest['groups'] if g['type'] == 'LINE')
+    coords = np.frombuffer(buf, dtype='<f8', count=lines['coords'][1], offset=data + lines['coords'][0])
+    assert coords.tolist() == [1.0, 2.0, 3.0, 4.0, 7.0, 7.0, 8.0, 9.0]
+    print("✅ Columnar wire format round-trips entities with aligned typed arrays")
+
+
+def test_parse_cad_columnar_response():
+    tmp = tempfile.mkdtemp()
+    dxf = os.path.join(tmp, 'wire.dxf')
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for i in range(300):
+        msp.add_lwpolyline([(i, 0), (i + 1, 0), (i + 1, 1)], dxfattribs={'layer': f'L{i % 4}'})
+    msp.add_text('77', dxfattribs={'insert': (3, 3)})
+    doc.saveas(dxf)
+
+    original = app_module.cad_cache
+    app_module.cad_cache = CadParseCache(None)
+    try:
+        as_json = client.post('/api/parse-cad', json={'filePath': dxf}).get_json()
+        res = client.post('/api/parse-cad', json={'filePath': dxf, 'format': 'columnar'})
+        assert res.status_code == 200 and res.mimetype == cad_wire.MIME_TYPE
+        assert len(res.data) < len(json.dumps(as_json)) / 2
+        assert cad_wire.decode(res.data) == as_json
+        # The encoded body is cached too
+        client.post('/api/parse-cad', json={'filePath': dxf, 'format': 'columnar'})
+        assert app_module.cad_cache.stats['memory_hits'] == 2
+    finally:
+        app_module.cad_cache = original
+    print("✅ /api/parse-cad serves the columnar buffer, JSON stays the default")
+
+
+if __name__ == '__main__':
+    test_round_trip_and_zero_copy_layout()
+    test_parse_cad_columnar_response()
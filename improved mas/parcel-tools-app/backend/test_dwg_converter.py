@@ -0,0 +1,151 @@
+import sys
+import os
+import stat
+import tempfile
+import threading
+
+import ezdxf
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+import dwg_converter
+from dwg_converter import DwgConverter
+
+app = app_module.app
+client = app.test_client()
+
+# Stand-in for ODAFileConverter: same CLI (in_dir out_dir version type recurse audit filter),
+# "converts" by copying each .dwg (really DXF text here) to <name>.dxf and logs each run
+_STUB = '''#!{python}
+import fnmatch, os, shutil, sys
+in_dir, out_dir, pattern = sys.argv[1], sys.argv[2], sys.argv[7]
+names = sorted(n for n in os.listdir(in_dir) if fnmatch.fnmatch(n, pattern))
+with open(os.environ['ODA_STUB_LOG'], 'a') as log:
+    log.write(' '.join(names) + '\\n')
+for n in names:
+    shutil.copy(os.path.join(in_dir, n), os.path.join(out_dir, os.path.splitext(n)[0] + '.dxf'))
+'''
+
+
+def _setup(tmp):
+    stub = os.path.join(tmp, 'ODAFileConverter')
+    with open(stub, 'w') as f:
+        f.write(_STUB.format(python=sys.executable))
+    os.chmod(stub, os.stat(stub).st_mode | stat.S_IXUSR)
+    log = os.path.join(tmp, 'oda.log')
+    os.environ['ODA_STUB_LOG'] = log
+    return stub, log
+
+
+def _fake_dwg(path, label):
+    doc = ezdxf.new()
+    doc.modelspace().add_text(label, dxfattribs={'insert': (1, 2)})
+    doc.saveas(path)
+
+
+def _runs(log):
+    with open(log) as f:
+        return f.read().splitlines()
+
+
+def test_conversion_cached_by_content():
+    tmp = tempfile.mkdtemp()
+    stub, log = _setup(tmp)
+    converter = DwgConverter(os.path.join(tmp, 'cache'), oda_path=stub)
+    dwg = os.path.join(tmp, 'גוש 30.dwg')
+    _fake_dwg(dwg, 'A')
+
+    first = converter.convert(dwg)
+    assert os.path.isfile(first) and len(_runs(log)) == 1
+    copy = os.path.join(tmp, 'copy.dwg')
+    with open(dwg, 'rb') as src, open(copy, 'wb') as dst:
+        dst.write(src.read())
+    assert converter.convert(copy) == first and converter.convert(dwg) == first
+    assert len(_runs(log)) == 1 and converter.stats['hits'] == 2
+    assert [n for n in os.listdir(converter.cache_dir) if '.partial-' in n] == []
+
+    # Size bound: older conversions are evicted, unless used recently or still being read
+    converter.max_bytes = os.path.getsize(first) + 1
+    other = os.path.join(tmp, 'other.dwg')
+    _fake_dwg(other, 'B')
+    converter.convert(other)
+    assert os.path.exists(first)  # within keep_recent
+    converter.keep_recent = 0
+    with converter.converted(dwg) as leased:
+        third = os.path.join(tmp, 'third.dwg')
+        _fake_dwg(third, 'C')
+        converter.convert(third)
+        assert leased == first and os.path.exists(first) and not os.path.exists(converter.convert(other))
+    assert converter._leases == {}
+    fourth = os.path.join(tmp, 'fourth.dwg')
+    _fake_dwg(fourth, 'D')
+    converter.convert(fourth)
+    assert not os.path.exists(first)
+    print("✅ DWG conversions cached by content hash with LRU eviction")
+
+
+def test_oda_timeout_falls_through():
+    tmp = tempfile.mkdtemp()
+    stub = os.path.join(tmp, 'ODAFileConverter')
+    with open(stub, 'w') as f:
+        f.write(f'#!{sys.executable}\nimport time\ntime.sleep(5)\n')
+    os.chmod(stub, os.stat(stub).st_mode | stat.S_IXUSR)
+    converter = DwgConverter(os.path.join(tmp, 'cache'), oda_path=stub, timeout=0.2)
+    dwg = os.path.join(tmp, 'slow.dwg')
+    _fake_dwg(dwg, 'A')
+    com_tried = []
+    converter._try_com = lambda session, job, errors: com_tried.append(job.digest) or False
+    dwg_converter.sys = type('sys', (), {'platform': 'win32'})  # COM is only tried on Windows
+    try:
+        converter.convert(dwg)
+        assert False, 'conversion should fail'
+    except RuntimeError as e:
+        assert 'timed out' in str(e)
+    finally:
+        dwg_converter.sys = sys
+    assert len(com_tried) == 1
+    print("✅ An ODA timeout still falls through to the AutoCAD COM fallback")
+
+
+def test_warm_worker_batches_queued_conversions():
+    tmp = tempfile.mkdtemp()
+    stub, log = _setup(tmp)
+    converter = DwgConverter(os.path.join(tmp, 'cache'), oda_path=stub, warm=True, batch_window=0.5)
+    paths = []
+    for i in range(4):
+        paths.append(os.path.join(tmp, f'sheet{i}.dwg'))
+        _fake_dwg(paths[-1], f'S{i}')
+    results = {}
+    threads = [threading.Thread(target=lambda p=p: results.__setitem__(p, converter.convert(p))) for p in paths]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(30)
+    assert len(results) == 4 and all(os.path.isfile(r) for r in results.values())
+    assert converter.stats['oda_runs'] == 1 and len(_runs(log)[0].split()) == 4
+    converter.close()
+    print("✅ Warm converter runs queued conversions as one ODA batch")
+
+
+def test_parse_cad_dwg_through_converter():
+    tmp = tempfile.mkdtemp()
+    stub, log = _setup(tmp)
+    original = app_module.dwg_converter
+    app_module.dwg_converter = DwgConverter(os.path.join(tmp, 'cache'), oda_path=stub)
+    try:
+        dwg = os.path.join(tmp, 'plan.dwg')
+        _fake_dwg(dwg, 'PLAN')
+        res = client.post('/api/parse-cad', json={'filePath': dwg})
+        assert res.status_code == 200
+        body = res.get_json()
+        assert body['fileType'] == 'dwg' and body['entities'][0]['text'] == 'PLAN'
+    finally:
+        app_module.dwg_converter = original
+    print("✅ /api/parse-cad converts DWG through the cached converter")
+
+
+if __name__ == '__main__':
+    test_conversion_cached_by_content()
+    test_oda_timeout_falls_through()
+    test_warm_worker_batches_queued_conversions()
+    test_parse_cad_dwg_through_converter()
@@ -92,7 +92,8 @@ def run_end_to_end_verification():
             {'archiveName': 'coordinates.pnt', 'content': raw_pnt}
         ],
         'compressionLevel': 6,
-        'comment': 'End-to-end verification archive'
+        'comment': 'End-to-end verification archive',
+        'wait': True
     })
     assert comp_res.status_code == 200
     c_info = comp_res.get_json()
@@ -102,7 +103,8 @@ def run_end_to_end_verification():
     # 10. One-click Comprehensive Project Archive Exporter
     arch_res = client.post('/api/project/export-archive', json={
         'projectName': 'E2E_Complete_Archive',
-        'projectData': proj_data
+        'projectData': proj_data,
+        'wait': True
     })
     assert arch_res.status_code == 200
     arch_info = arch_res.get_json()
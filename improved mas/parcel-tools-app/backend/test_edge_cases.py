@@ -96,7 +96,8 @@ def test_all_edge_cases():
             {'archiveName': 'nested/folder/data.pnt', 'content': '1, 100.5, 200.5\n2, 300.5, 400.5'}
         ],
         'compressionLevel': 9,
-        'comment': 'Unicode & Edge Case Archive'
+        'comment': 'Unicode & Edge Case Archive',
+        'wait': True
     })
     assert res6.status_code == 200
     data6 = res6.get_json()
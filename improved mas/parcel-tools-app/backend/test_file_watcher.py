@@ -0,0 +1,82 @@
+import sys
+import os
+import json
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+from file_watcher import FileWatcher
+
+app = app_module.app
+client = app.test_client()
+
+
+def _write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _next_event(stream):
+    for chunk in stream:
+        chunk = chunk.decode('utf-8') if isinstance(chunk, bytes) else chunk
+        if chunk.startswith('data: '):
+            return json.loads(chunk[len('data: '):])
+
+
+def test_watcher_backends_fire_once_per_change():
+    for use_inotify in (True, False):
+        tmp = tempfile.mkdtemp()
+        a, b = os.path.join(tmp, 'a.pnt'), os.path.join(tmp, 'b.pnt')
+        _write(a, "1,0,0\n")
+        _write(b, "1,0,0\n")
+        watcher = FileWatcher(poll_interval=0.05, settle=0.05, use_inotify=use_inotify)
+        fired = []
+        done = threading.Event()
+
+        def on_change(path):
+            fired.append(os.path.basename(path))
+            done.set()
+
+        ha = watcher.add(a, on_change)
+        watcher.add(b, on_change)
+        _write(a, "1,0,0\n2,5,5\n")
+        assert done.wait(3), watcher.backend
+        watcher.remove(ha)
+        assert fired == ['a.pnt'], (watcher.backend, fired)
+        assert watcher.watched_paths() == [os.path.abspath(b)]
+        print(f"✅ {watcher.backend} watcher fired once for the changed file only")
+        watcher.close()
+
+
+def test_stream_pushes_point_delta():
+    tmp = tempfile.mkdtemp()
+    pnt_path = os.path.join(tmp, 'survey.pnt')
+    proj_path = os.path.join(tmp, 'survey.prcl')
+    _write(pnt_path, "1,0,0\n2,100,0\n3,100,100\n4,0,100\n")
+    points = {'1': {'x': 0, 'y': 0}, '2': {'x': 100, 'y': 0}, '3': {'x': 100, 'y': 100}, '4': {'x': 0, 'y': 100}}
+    app_module.parcel_indexes.register(proj_path, [{'id': 1, 'ids': ['1', '2', '3', '4']}], points, pnt_path)
+
+    res = client.get('/api/watch/stream', query_string={'points': pnt_path}, buffered=False)
+    assert res.status_code == 200 and res.mimetype == 'text/event-stream'
+    stream = iter(res.response)
+    hello = _next_event(stream)
+    assert hello['type'] == 'hello' and hello['tokens'][pnt_path]
+
+    _write(pnt_path, "1,0,0\n2,100,0\n3,100,200\n4,0,100\n5,50,50\n")
+    event = _next_event(stream)
+    assert event['type'] == 'points' and event['path'] == pnt_path
+    assert event['baseToken'] == hello['tokens'][pnt_path]
+    assert event['moved'] == [{'id': '3', 'x': 100.0, 'y': 200.0}]
+    assert event['added'] == [{'id': '5', 'x': 50.0, 'y': 50.0}]
+    assert event['projects'][0]['projectPath'] == proj_path
+    assert event['projects'][0]['changedParcels'][0]['area'] == 15000.0
+
+    res.close()
+    assert os.path.normcase(os.path.abspath(pnt_path)) not in app_module.watched_files
+    print("✅ Watch stream pushes the point delta and changed parcels")
+
+
+if __name__ == '__main__':
+    test_watcher_backends_fire_once_per_change()
+    test_stream_pushes_point_delta()
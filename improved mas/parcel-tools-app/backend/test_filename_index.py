@@ -0,0 +1,87 @@
+import sys
+import os
+import json
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+from filename_index import FilenameIndex
+
+app = app_module.app
+client = app.test_client()
+
+
+def _touch(path, text='x'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+
+
+def test_incremental_rescan_and_persistence():
+    tmp = tempfile.mkdtemp()
+    docs, dwg = os.path.join(tmp, 'Documents'), os.path.join(tmp, 'OneDrive', 'share', 'dwg')
+    _touch(os.path.join(docs, 'jobs', '2026', 'Lot7.prcl'))
+    _touch(os.path.join(docs, 'jobs', 'field.pnt'))
+    _touch(os.path.join(docs, 'jobs', 'notes.docx'))
+    _touch(os.path.join(dwg, 'Lot7.prcl'))
+    store = os.path.join(tmp, 'index.json')
+    index = FilenameIndex(store, [dwg, os.path.join(tmp, 'OneDrive'), docs])
+
+    assert not index.ready
+    assert index.rescan() == 3 and index.ready
+    listed = index.stats['listed']
+    assert index.lookup('Lot7.prcl')[0] == os.path.join(dwg, 'Lot7.prcl')  # priority root first
+    assert len(index.lookup('Lot7.prcl')) == 2
+    assert index.lookup('notes.docx') == []
+
+    # Nothing changed: no directory is listed again
+    index.rescan()
+    assert index.stats['listed'] == listed
+
+    # New file in one folder: only that folder is re-listed
+    _touch(os.path.join(docs, 'jobs', '2026', 'site.dxf'))
+    _bump_mtime(os.path.join(docs, 'jobs', '2026'))
+    index.rescan()
+    assert index.stats['listed'] == listed + 1
+    assert index.find('site.dxf') == os.path.join(docs, 'jobs', '2026', 'site.dxf')
+
+    # A restart is ready from the persisted tree before any scan
+    reopened = FilenameIndex(store, index.roots)
+    assert reopened.ready and reopened.stats['scans'] == 0
+    assert sorted(reopened._names) == sorted(index._names)
+    print("✅ Filename index re-lists only changed folders and survives restarts")
+
+
+def test_path_recovery_uses_index():
+    tmp = tempfile.mkdtemp()
+    moved = os.path.join(tmp, 'Desktop', 'archive', 'Recovered Lot.prcl')
+    _touch(moved, json.dumps({'projectName': 'Recovered Lot', 'savedParcels': []}))
+    original = app_module.filename_index
+    app_module.filename_index = FilenameIndex(os.path.join(tmp, 'index.json'), [os.path.join(tmp, 'Desktop')])
+    try:
+        app_module.filename_index.rescan()
+        res = client.post('/api/project/load', json={'filePath': os.path.join(tmp, 'old', 'Recovered Lot.prcl'),
+                                                     'fileName': 'Recovered Lot.prcl'})
+        assert res.status_code == 200
+        assert res.get_json()['projectData']['projectName'] == 'Recovered Lot'
+
+        recent = app_module.load_recent_files()
+        recent['projects'].insert(0, {'name': 'Recovered Lot.prcl', 'path': os.path.join(tmp, 'gone', 'Recovered Lot.prcl')})
+        app_module.save_recent_files(recent)
+        res = client.get('/api/projects')
+        assert res.status_code == 200
+        assert moved in [p['filePath'] for p in res.get_json()]
+        assert any(e['path'] == moved for e in app_module.load_recent_files()['projects'])
+    finally:
+        app_module.filename_index = original
+    print("✅ Load and project listing recover moved files through the index")
+
+
+if __name__ == '__main__':
+    test_incremental_rescan_and_persistence()
+    test_path_recovery_uses_index()
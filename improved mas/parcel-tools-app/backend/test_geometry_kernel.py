@@ -0,0 +1,88 @@
+import sys
+import os
+import math
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from geometry_kernel import compute_id_parcels, polygon_metrics, pack_point_ring
+
+
+def _legacy_parcel_metrics(parcel, points_map):
+    """Reference copy of the original per-vertex batch implementation."""
+    parcel_points = [points_map.get(str(pid), {'x': 0, 'y': 0}) for pid in parcel.get('ids', [])]
+    area = 0.0
+    perimeter = 0.0
+    if len(parcel_points) >= 3:
+        pts = parcel_points
+        if len(pts) > 3 and pts[0]['x'] == pts[-1]['x'] and pts[0]['y'] == pts[-1]['y']:
+            pts = pts[:-1]
+        n = len(pts)
+        sum1 = sum(pts[i]['x'] * pts[(i + 1) % n]['y'] for i in range(n))
+        sum2 = sum(pts[(i + 1) % n]['x'] * pts[i]['y'] for i in range(n))
+        area = 0.5 * abs(sum1 - sum2)
+        for i in range(n):
+            j = (i + 1) % n
+            perimeter += math.hypot(pts[j]['x'] - pts[i]['x'], pts[j]['y'] - pts[i]['y'])
+    for curve in parcel.get('curves', []):
+        m = float(curve.get('M', 0))
+        sign = 1 if curve.get('sign', 1) == 1 else -1
+        p1 = points_map.get(str(curve.get('from')))
+        p2 = points_map.get(str(curve.get('to')))
+        if p1 and p2:
+            chord = math.hypot(p2['x'] - p1['x'], p2['y'] - p1['y'])
+            if m > 0 and chord > 0:
+                r = chord ** 2 / (8 * m) + m / 2
+                theta = 2 * math.asin(min(1.0, chord / (2 * r)))
+                area += sign * 0.5 * r ** 2 * (theta - math.sin(theta))
+    return area, perimeter
+
+
+def test_batch_kernel_matches_legacy():
+    rng = random.Random(7)
+    points_map = {str(i): {'x': 170000 + rng.uniform(0, 500), 'y': 640000 + rng.uniform(0, 500)} for i in range(1, 400)}
+    parcels = []
+    for k in range(300):
+        ids = [str(rng.randint(1, 399)) for _ in range(rng.randint(2, 12))]
+        if k % 3 == 0 and ids:
+            ids.append(ids[0])  # closed traverse notation
+        if k % 11 == 0:
+            ids.append('MISSING')
+        curves = []
+        if len(ids) >= 2 and k % 4 == 0:
+            curves.append({'from': ids[0], 'to': ids[1], 'M': rng.uniform(0.1, 5), 'sign': rng.choice([1, -1])})
+        parcels.append({'id': k, 'ids': ids, 'curves': curves})
+
+    fast = compute_id_parcels(parcels, points_map)
+    for parcel, (area, perimeter) in zip(parcels, fast):
+        ref_area, ref_perimeter = _legacy_parcel_metrics(parcel, points_map)
+        assert abs(area - ref_area) <= 1e-6 * max(1.0, abs(ref_area)), (parcel, area, ref_area)
+        assert abs(perimeter - ref_perimeter) <= 1e-9 * max(1.0, ref_perimeter)
+    print(f"✅ Batch kernel matches legacy loop on {len(parcels)} parcels")
+
+
+def test_empty_and_degenerate_rings():
+    metrics = polygon_metrics([0, 10, 0, 5], [0, 0, 10, 5], [0, 0, 3, 3, 4])
+    assert metrics['area'].tolist() == [0.0, 50.0, 0.0, 0.0]
+    assert metrics['perimeter'][0] == 0.0 and metrics['perimeter'][3] == 0.0
+    assert compute_id_parcels([], {}) == []
+    print("✅ Empty / degenerate rings yield zero area")
+
+
+def test_point_ring_curves():
+    pts = [{'x': 0.0, 'y': 0.0}, {'x': 100.0, 'y': 0.0}, {'x': 100.0, 'y': 100.0}, {'x': 0.0, 'y': 100.0}]
+    xs, ys, offsets, curves = pack_point_ring(pts, [
+        {'fromIndex': 0, 'toIndex': 1, 'M': 10.0, 'sign': 1},
+        {'fromIndex': 2, 'toIndex': 9, 'M': 10.0, 'sign': 1},  # out of range: dropped
+    ])
+    metrics = polygon_metrics(xs, ys, offsets, curves)
+    assert len(curves['m']) == 1
+    assert metrics['base_area'][0] == 10000.0
+    assert metrics['cx'][0] == 50.0 and metrics['cy'][0] == 50.0
+    assert abs(metrics['curve_radius'][0] - 130.0) < 1e-9
+    print(f"✅ Index-based curves applied (Area: {metrics['area'][0]:.4f})")
+
+
+if __name__ == '__main__':
+    test_batch_kernel_matches_legacy()
+    test_empty_and_degenerate_rings()
+    test_point_ring_curves()
@@ -0,0 +1,122 @@
+import sys
+import os
+import io
+import time
+import base64
+import zipfile
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+import parallel_zip
+from parallel_zip import ZipStitcher, compress_member, map_in_order
+
+client = app_module.app.test_client()
+
+
+def _survey_file(k, rows=2000):
+    return '\n'.join(f'{k * rows + j}, {170000.0 + j * 1.37:.3f}, {650000.0 + (j * 7919 % 1000) / 3:.3f}'
+                     for j in range(rows))
+
+
+def test_compress_files_roundtrip():
+    tmp = tempfile.mkdtemp()
+    files, expected = [], {}
+    for k in range(60):
+        name = f'points/batch_{k}.pnt'
+        if k % 3 == 0:
+            path = os.path.join(tmp, f'disk_{k}.pnt')
+            with open(path, 'w') as f:
+                f.write(_survey_file(k))
+            files.append({'sourcePath': path, 'archiveName': name})
+        elif k % 3 == 1:
+            files.append({'archiveName': name, 'base64Content': base64.b64encode(_survey_file(k).encode()).decode()})
+        else:
+            files.append({'archiveName': name, 'content': _survey_file(k)})
+        expected[name] = _survey_file(k).encode()
+    files.append({'archiveName': 'empty.txt', 'content': ''})
+    files.append({'archiveName': 'عربي/نقاط.pnt', 'content': 'إحداثيات'})
+    files.append({'sourcePath': os.path.join(tmp, 'missing.pnt')})
+    expected['empty.txt'] = b''
+    expected['عربي/نقاط.pnt'] = 'إحداثيات'.encode()
+
+    out = os.path.join(tmp, 'out', 'batch.zip')
+    res = client.post('/api/compress-files', json={'files': files, 'outputPath': out, 'compressionLevel': 6,
+                                                   'comment': 'Block 30123', 'wait': True}).get_json()
+    assert res['success'] and res['filesCount'] == 62 and res['skippedCount'] == 1
+    assert res['originalSizeBytes'] == sum(len(v) for v in expected.values())
+    assert res['compressedSizeBytes'] == os.path.getsize(out) and not os.path.exists(out + '.part')
+    with zipfile.ZipFile(out) as z:
+        assert z.testzip() is None and z.comment == b'Block 30123'
+        assert z.namelist() == [f.get('archiveName') for f in files[:-1]]
+        for name, data in expected.items():
+            assert z.read(name) == data
+    print(f"✅ compress-files: 62 members stitched in request order ({res['compressedSizeBytes']}B)")
+
+
+def test_zip64_records():
+    """Force the zip64 paths with tiny limits; zipfile must still read the archive."""
+    limits = parallel_zip.ZIP64_LIMIT, parallel_zip.ZIP_FILECOUNT_LIMIT
+    parallel_zip.ZIP64_LIMIT, parallel_zip.ZIP_FILECOUNT_LIMIT = 1000, 5
+    try:
+        buf = io.BytesIO()
+        stitcher = ZipStitcher(buf)
+        payloads = [os.urandom(1500), b'small', _survey_file(1, 50).encode()] + [b'x' * k for k in range(7)]
+        for k, data in enumerate(payloads):
+            stitcher.add(compress_member(f'm{k}.bin', data=data, level=1))
+        stitcher.close(b'zip64')
+    finally:
+        parallel_zip.ZIP64_LIMIT, parallel_zip.ZIP_FILECOUNT_LIMIT = limits
+    with zipfile.ZipFile(io.BytesIO(buf.getvalue())) as z:
+        assert z.testzip() is None and len(z.infolist()) == len(payloads)
+        assert [z.read(f'm{k}.bin') for k in range(len(payloads))] == payloads
+        assert z.comment == b'zip64'
+    assert b'PK\x06\x06' in buf.getvalue() and b'PK\x06\x07' in buf.getvalue()
+    print("✅ zip64 extra fields, end record and locator are readable by zipfile")
+
+
+def test_parallel_compression_throughput():
+    payloads = [_survey_file(k, 1500).encode() for k in range(500)]
+    timings = {}
+    for workers in (1, 4):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            buf = io.BytesIO()
+            stitcher = ZipStitcher(buf)
+            started = time.time()
+            for member in map_in_order(pool, lambda item: compress_member(item[0], data=item[1], level=6),
+                                       [(f'f{k}.pnt', p) for k, p in enumerate(payloads)], workers * 2):
+                stitcher.add(member)
+            stitcher.close()
+            timings[workers] = time.time() - started
+        with zipfile.ZipFile(io.BytesIO(buf.getvalue())) as z:
+            assert z.testzip() is None and z.read('f499.pnt') == payloads[499]
+    mb = sum(map(len, payloads)) / 1e6
+    print(f"✅ 500 files ({mb:.0f} MB): 1 thread {timings[1]:.2f}s, 4 threads {timings[4]:.2f}s "
+          f"on {os.cpu_count()} CPU(s)")
+
+
+def test_abandoned_map_closes_running_members():
+    members = []
+
+    def slow_member(k):
+        time.sleep(0.2)
+        member = compress_member(f'f{k}.pnt', data=_survey_file(k, 50).encode())
+        members.append(member)
+        return member
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = map_in_order(pool, slow_member, range(40), 8)
+        first = next(results)
+        results.close()  # the writer failed: members still being compressed must not leak
+    assert not first.data.closed and 4 <= len(members) < 40
+    assert all(member.data.closed for member in members if member is not first)
+    first.close()
+    print(f"✅ Aborted archive closed {len(members) - 1} in-flight members, cancelled the rest")
+
+
+if __name__ == '__main__':
+    test_compress_files_roundtrip()
+    test_zip64_records()
+    test_parallel_compression_throughput()
+    test_abandoned_map_closes_running_members()
@@ -0,0 +1,81 @@
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+from parcel_index import ParcelDependencyIndex, diff_point_maps
+
+app = app_module.app
+client = app.test_client()
+
+
+def test_diff_and_affected_parcels():
+    old = {'1': {'x': 0, 'y': 0}, '2': {'x': 10, 'y': 0}, '3': {'x': 10, 'y': 10}, '4': {'x': 0, 'y': 10}}
+    new = dict(old, **{'3': {'x': 12, 'y': 10}, '5': {'x': 5, 'y': 5}})
+    del new['4']
+    diff = diff_point_maps(old, new)
+    assert diff == {'added': ['5'], 'removed': ['4'], 'moved': ['3']}
+
+    parcels = [
+        {'id': 'A', 'ids': ['1', '2', '3'], 'curves': [], 'area': 1.0},
+        {'id': 'B', 'ids': ['1', '2', '6'], 'curves': [{'from': '1', 'to': '4', 'M': 1, 'sign': 1}]},
+        {'id': 'C', 'ids': ['7', '8', '9'], 'curves': []},
+    ]
+    index = ParcelDependencyIndex(parcels, old)
+    _, changed = index.apply_points(new)
+    assert sorted(c['id'] for c in changed) == ['A', 'B']
+    area_a = next(c['area'] for c in changed if c['id'] == 'A')
+    assert area_a == 50.0
+    # The caller's parcels (e.g. a queued save snapshot) are left as they were
+    assert parcels[0]['area'] == 1.0 and 'area' not in parcels[1] and 'perimeter' not in parcels[0]
+    print("✅ Dependency index recomputes only parcels touching changed points")
+
+
+def test_reload_returns_only_changed_parcels():
+    tmp = tempfile.mkdtemp()
+    pnt_path = os.path.join(tmp, 'block.pnt')
+    proj_path = os.path.join(tmp, 'block.prcl')
+    with open(pnt_path, 'w') as f:
+        f.write("1,0,0\n2,100,0\n3,100,100\n4,0,100\n5,200,0\n6,200,100\n")
+    points = {'1': {'x': 0, 'y': 0}, '2': {'x': 100, 'y': 0}, '3': {'x': 100, 'y': 100},
+              '4': {'x': 0, 'y': 100}, '5': {'x': 200, 'y': 0}, '6': {'x': 200, 'y': 100}}
+    app_module.parcel_indexes.register(proj_path, [
+        {'id': 11, 'ids': ['1', '2', '3', '4']},
+        {'id': 12, 'ids': ['2', '5', '6', '3']},
+        {'id': 13, 'ids': ['5', '6', '7']},
+    ], points, pnt_path)
+
+    with open(pnt_path, 'w') as f:
+        f.write("1,0,0\n2,100,0\n3,100,100\n4,0,150\n5,200,0\n6,200,100\n")
+    res = client.post('/api/reload-points-file', json={'filePath': pnt_path, 'projectPath': proj_path})
+    assert res.status_code == 200
+    data = res.get_json()
+    assert data['diff']['moved'] == ['4']
+    assert [c['id'] for c in data['changedParcels']] == [11]
+    assert data['changedParcels'][0]['area'] == 12500.0
+
+    assert data['parcelsVersion'] is None  # registered on load: the frontend can't trust it yet
+
+    # A full batch recompute rebuilds the index from the frontend's parcels and version
+    res = client.post('/api/calculate-batch-areas', json={
+        'parcels': [{'id': 11, 'ids': ['1', '2', '3', '4']}, {'id': 14, 'ids': ['1', '5', '6', '4']}],
+        'points': {'1': {'x': 0, 'y': 0}, '3': {'x': 100, 'y': 100}, '4': {'x': 0, 'y': 150},
+                   '5': {'x': 200, 'y': 0}, '6': {'x': 200, 'y': 100}},
+        'projectPath': proj_path, 'pointsFilePath': pnt_path, 'parcelsVersion': '2-abc'})
+    assert len(res.get_json()['results']) == 2
+    with open(pnt_path, 'w') as f:
+        f.write("1,0,0\n2,100,0\n3,100,100\n4,0,150\n5,200,0\n6,250,100\n")
+    data = client.post('/api/reload-points-file', json={'filePath': pnt_path, 'projectPath': proj_path}).get_json()
+    assert data['parcelsVersion'] == '2-abc'
+    assert sorted(c['id'] for c in data['changedParcels']) == [11, 14]  # 2 was missing from the batch points
+
+    # Unregistered project: plain full reload, no incremental fields
+    res = client.post('/api/reload-points-file', json={'filePath': pnt_path})
+    assert 'changedParcels' not in res.get_json()
+    print("✅ Points reload returns only the changed parcel areas, tagged with the parcel-set version")
+
+
+if __name__ == '__main__':
+    test_diff_and_affected_parcels()
+    test_reload_returns_only_changed_parcels()
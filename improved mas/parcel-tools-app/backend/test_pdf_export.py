@@ -0,0 +1,85 @@
+import sys
+import os
+import base64
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+
+app = app_module.app
+client = app.test_client()
+
+
+def _block_report(parcel_count):
+    """A block of square parcels on a shared point grid, like a full block export."""
+    points, parcels = {}, []
+    cols = 60
+    for k in range((cols + 1) * (parcel_count // cols + 2)):
+        points[str(k + 1)] = {'x': 1000 + (k % (cols + 1)) * 20.0, 'y': 2000 + (k // (cols + 1)) * 20.0}
+    for p in range(parcel_count):
+        row, col = divmod(p, cols)
+        a = row * (cols + 1) + col + 1
+        ids = [str(a), str(a + 1), str(a + cols + 2), str(a + cols + 1)]
+        parcels.append({'number': str(p + 1), 'ids': ids + ids[:1], 'area': 400.0, 'curves': []})
+    return {'parcels': parcels, 'points': points, 'fileHeading': {'block': '30123', 'place': 'Test'}}
+
+
+def test_output_path_and_raw_stream_match_legacy():
+    body = _block_report(12)
+    # A repeat export of the same report is merged from cached segments; compare first exports
+    app_module.pdf_fragments.clear()
+    legacy = client.post('/api/export-pdf', json=body).get_json()
+    legacy_pdf = base64.b64decode(legacy['pdfData'])
+    assert legacy_pdf.startswith(b'%PDF')
+
+    out = os.path.join(tempfile.mkdtemp(), 'block.pdf')
+    app_module.pdf_fragments.clear()
+    res = client.post('/api/export-pdf', json=dict(body, outputPath=out)).get_json()
+    assert res['filePath'] == out and res['pages'] >= 1 and res['size'] == os.path.getsize(out)
+    with open(out, 'rb') as f:
+        written = f.read()
+    assert not os.path.exists(out + '.part')
+
+    app_module.pdf_fragments.clear()
+    raw = client.post('/api/export-pdf', json=dict(body, format='raw', fileName='block.pdf'))
+    assert raw.status_code == 200 and raw.mimetype == 'application/pdf'
+    assert 'block.pdf' in raw.headers['Content-Disposition']
+    streamed = raw.get_data()
+    assert int(raw.headers['Content-Length']) == len(streamed)
+    # ReportLab stamps creation time and a document ID; the page content is identical
+    for pdf in (written, streamed):
+        assert pdf.startswith(b'%PDF') and abs(len(pdf) - len(legacy_pdf)) < 64
+
+    # Quotes, CR/LF and Arabic in the name can't break out of the header
+    for name in ('a"b.pdf', 'x.pdf\r\nSet-Cookie: y=1', 'تقرير القطع.pdf'):
+        raw = client.post('/api/export-pdf', json=dict(_block_report(2), format='raw', fileName=name))
+        disposition = raw.headers['Content-Disposition']
+        assert raw.status_code == 200 and 'Set-Cookie' not in raw.headers and '\n' not in disposition
+        assert raw.get_data().startswith(b'%PDF') and disposition.startswith('attachment;')
+    assert "filename*=UTF-8''%D8%AA%D9%82%D8%B1%D9%8A%D8%B1" in disposition
+    print("✅ export-pdf writes to outputPath and streams raw application/pdf with a safe file name")
+
+
+def test_output_path_validation():
+    body = _block_report(1)
+    assert client.post('/api/export-pdf', json=dict(body, outputPath='relative.pdf')).status_code == 400
+    missing = os.path.join(tempfile.mkdtemp(), 'nope', 'x.pdf')
+    assert client.post('/api/export-pdf', json=dict(body, outputPath=missing)).status_code == 400
+    print("✅ export-pdf rejects unusable output paths")
+
+
+def test_large_block_report_to_disk():
+    body = _block_report(3000)
+    out = os.path.join(tempfile.mkdtemp(), 'large.pdf')
+    started = time.time()
+    res = client.post('/api/export-pdf', json=dict(body, outputPath=out)).get_json()
+    elapsed = time.time() - started
+    assert res['pages'] > 100 and res['size'] == os.path.getsize(out)
+    print(f"✅ 3,000-parcel report: {res['pages']} pages, {res['size'] // 1024} KB in {elapsed:.1f}s")
+
+
+if __name__ == '__main__':
+    test_output_path_and_raw_stream_match_legacy()
+    test_output_path_validation()
+    test_large_block_report_to_disk()
@@ -0,0 +1,124 @@
+import sys
+import os
+import io
+import copy
+import tempfile
+import time
+
+from pypdf import PdfReader
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+import pdf_report
+from pdf_report import render_report, ReportFragmentCache
+from test_pdf_parallel import _report, _pages
+
+client = app_module.app.test_client()
+
+
+def _export(data, cache):
+    out = io.BytesIO()
+    pages = render_report(data, out, workers=1, cache=cache)
+    return pages, out.getvalue()
+
+
+def test_repeat_export_reuses_segments():
+    data = _report(600)
+    cache = ReportFragmentCache()
+    # A first export is drawn as one document: nothing is cut or cached yet
+    started = time.time()
+    pages, first = _export(data, cache)
+    cold = time.time() - started
+    assert cache.stats == {'hits': 0, 'misses': 0} and not cache._entries
+
+    # Exported again: cut into at most CACHE_SEGMENTS segments, kept as files
+    _, second = _export(data, cache)
+    segments = cache.stats['misses']
+    assert 20 < segments <= pdf_report.CACHE_SEGMENTS and cache.stats['hits'] == 0
+    assert all(os.path.isfile(cache._path(key)) for key in cache._entries)
+
+    started = time.time()
+    again_pages, again = _export(data, cache)
+    warm = time.time() - started
+    assert again_pages == pages and cache.stats['hits'] == segments
+    assert _pages(first) == _pages(second) == _pages(again)
+    assert len(PdfReader(io.BytesIO(again), strict=True).pages) == pages
+
+    # A segment file removed behind the cache's back is drawn again, not merged from nothing
+    lost = next(iter(cache._entries))
+    os.remove(cache._path(lost))
+    misses = cache.stats['misses']
+    _, healed = _export(data, cache)
+    assert cache.stats['misses'] == misses + 1 and os.path.isfile(cache._path(lost))
+    assert _pages(healed) == _pages(first)
+    # Fonts and resource dictionaries of the segments are written once
+    assert again.count(b'/BaseFont /Helvetica-Bold') == first.count(b'/BaseFont /Helvetica-Bold') == 1
+    print(f"✅ Repeat export of {pages} pages from {segments} cached segments: {cold:.2f}s -> {warm:.2f}s")
+
+
+def test_edits_redraw_only_their_segments():
+    data = _report(600)
+    cache = ReportFragmentCache()
+    _export(data, cache)
+    _export(data, cache)
+
+    # Moving one point touches the parcels around it; a new area touches one parcel
+    edited = copy.deepcopy(data)
+    edited['points']['900'] = {'x': 5.0, 'y': 7.0}
+    edited['parcels'][400]['area'] = 123.456
+    misses = cache.stats['misses']
+    _, pdf = _export(edited, cache)
+    assert 1 <= cache.stats['misses'] - misses <= 6
+    assert _pages(pdf) == _pages(_export(edited, None)[1])
+
+    # A longer parcel early on shifts the page numbers of everything after it
+    longer = copy.deepcopy(edited)
+    longer['parcels'][3]['ids'] = longer['parcels'][3]['ids'] * 40
+    hits = cache.stats['hits']
+    pages, pdf = _export(longer, cache)
+    assert cache.stats['hits'] - hits < 3
+    assert pages > _export(edited, None)[0] and _pages(pdf) == _pages(_export(longer, None)[1])
+
+    # The heading only affects the first segment, the error section only the last
+    retitled = copy.deepcopy(edited)
+    retitled['fileHeading']['place'] = 'Elsewhere'
+    retitled['savedErrorCalculations'][0]['name'] = 'Recheck'
+    misses = cache.stats['misses']
+    _, pdf = _export(retitled, cache)
+    assert cache.stats['misses'] - misses == 2
+    assert _pages(pdf) == _pages(_export(retitled, None)[1])
+    print("✅ Edited parcels, page shifts, heading and error section invalidate only what they touch")
+
+
+def test_cache_bounds_and_endpoint():
+    tmp = tempfile.mkdtemp()
+
+    def segment(size):
+        fd, path = tempfile.mkstemp(dir=tmp)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b'x' * size)
+        return path
+
+    cache = ReportFragmentCache(os.path.join(tmp, 'cache'), max_bytes=10_000)
+    with cache.lease(['k0']):
+        for k in range(10):
+            cache.put(f'k{k}', segment(3000))
+    assert cache._size <= 10_000 and list(cache._entries) == ['k0', 'k8', 'k9']  # k0 was in use
+    assert sorted(os.listdir(cache.directory)) == ['k0.pdf', 'k8.pdf', 'k9.pdf']
+    assert cache.put('huge', segment(20_000)) is None
+    assert cache.get('huge') is None and cache.get('k9') == os.path.join(cache.directory, 'k9.pdf')
+
+    body = _report(40)
+    app_module.pdf_fragments.clear()
+    hits = app_module.pdf_fragments.stats['hits']
+    first, second, third = (client.post('/api/export-pdf', json=dict(body, format='raw')).get_data()
+                            for _ in range(3))
+    assert app_module.pdf_fragments.stats['hits'] > hits
+    assert _pages(first) == _pages(second) == _pages(third)
+    print("✅ Fragment cache stays within its disk budget and serves export-pdf")
+
+
+if __name__ == '__main__':
+    test_repeat_export_reuses_segments()
+    test_edits_redraw_only_their_segments()
+    test_cache_bounds_and_endpoint()
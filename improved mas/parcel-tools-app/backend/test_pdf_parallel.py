@@ -0,0 +1,132 @@
+import sys
+import os
+import io
+import re
+import subprocess
+
+from pypdf import PdfReader, PdfWriter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import pdf_report
+from pdf_report import render_report, layout, _chunk_starts, merge_pdfs
+from test_pdf_export import _block_report
+
+
+def _report(parcel_count):
+    """Block report with a heading, curves, odd parcels and an error section, like a real export."""
+    data = _block_report(parcel_count)
+    for k, parcel in enumerate(data['parcels']):
+        if k % 7 == 0:
+            parcel['curves'] = [{'from': parcel['ids'][0], 'to': parcel['ids'][1], 'M': 1.5, 'sign': -1}]
+        if k % 11 == 0:
+            parcel['ids'] = parcel['ids'] * 9  # long enough to break the page mid-table
+    data['isBuggy'] = True
+    results = [{'parcelNumber': k, 'calculatedArea': 400.0, 'adjustedArea': 400.1, 'roundedArea': 400,
+                'pointCount': 4} for k in range(150)]
+    data['savedErrorCalculations'] = [{'name': 'Block check', 'timestamp': '2024-05-01T10:20:30Z',
+                                       'totalRegisteredArea': 60000.0, 'totalCalculatedArea': 60012.0,
+                                       'absoluteDifference': 12.0, 'permissibleError': 316.0,
+                                       'exceedsLimit': False, 'parcelResults': results}]
+    return data
+
+
+def _pages(pdf):
+    """Decoded content stream of every page in order, with font resource names replaced by base fonts."""
+    decoded = []
+    for page in PdfReader(io.BytesIO(pdf)).pages:
+        fonts = page.get('/Resources', {}).get('/Font', {})
+        names = {name[1:].encode(): fonts[name].get_object()['/BaseFont'][1:].encode() for name in fonts}
+        content = page.get_contents()
+        content = b'' if content is None else content.get_data()
+        decoded.append(re.sub(rb'/(F\d+) ', lambda m: b'/' + names[m.group(1)] + b' ', content))
+    return decoded
+
+
+def test_parallel_matches_serial():
+    data = _report(400)
+    serial, parallel = io.BytesIO(), io.BytesIO()
+    serial_pages = render_report(data, serial, workers=1)
+    parallel_pages = render_report(data, parallel, workers=2)
+    assert serial_pages == parallel_pages > 100
+    expected, merged = _pages(serial.getvalue()), _pages(parallel.getvalue())
+    assert len(merged) == parallel_pages and merged == expected
+    assert b'(Page %d)' % parallel_pages in merged[-1] and b'ERROR CALCULATIONS REPORT' in b''.join(merged[-5:])
+    print(f"✅ {parallel_pages}-page report rendered in chunks matches the single-process report")
+
+
+def test_merged_structure():
+    data = _report(320)
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'parallel_test.pdf')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        pages = render_report(data, path, workers=3)
+        with open(path, 'rb') as f:
+            pdf = f.read()
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+    # strict: a broken xref table or dangling reference fails the read
+    reader = PdfReader(io.BytesIO(pdf), strict=True)
+    assert pdf.startswith(b'%PDF-') and pdf.rstrip().endswith(b'%%EOF')
+    assert len(reader.pages) == reader.trailer['/Root']['/Pages']['/Count'] == pages
+    # Font dictionaries that came out identical in every chunk are written once
+    fonts = {}
+    for page in reader.pages:
+        for ref in page['/Resources']['/Font'].values():
+            fonts.setdefault(ref.get_object()['/BaseFont'], set()).add(ref.idnum)
+    assert len(fonts['/Helvetica']) == len(fonts['/Helvetica-Bold']) == 1
+    print(f"✅ Merged PDF reads strictly, has {pages} pages and shares identical fonts")
+
+
+def test_layout_and_small_reports():
+    data = _report(60)
+    starts, total = layout(data['parcels'], data)
+    assert total == render_report(data, io.BytesIO(), workers=1)
+    splits = _chunk_starts(starts, 4)
+    assert splits[0] == 0 and splits == sorted(set(splits)) and all(starts[s][1] for s in splits[1:])
+    assert _chunk_starts([(1, False), (1, False)], 4) == [0]
+
+    # Below the threshold the report is drawn in one process
+    small = io.BytesIO()
+    assert render_report(data, small, workers=4) == total
+    assert _pages(small.getvalue()) == _pages(_single(data))
+    assert len(data['parcels']) < pdf_report.PARALLEL_MIN_PARCELS
+    print("✅ Layout pass predicts the page count; small reports skip the worker pool")
+
+
+def test_merge_incremental_update():
+    # A chunk saved with an incremental update (second xref section) merges like any other
+    first = _single(_report(5))
+    writer = PdfWriter(io.BytesIO(first), incremental=True)
+    writer.add_blank_page()
+    updated = io.BytesIO()
+    writer.write(updated)
+    assert updated.getvalue().startswith(first) and updated.getvalue().count(b'startxref') == 2
+    out = io.BytesIO()
+    count = len(PdfReader(io.BytesIO(first)).pages)
+    assert merge_pdfs([first, updated.getvalue()], out) == 2 * count + 1
+    assert _pages(out.getvalue()) == _pages(first) * 2 + [b'']
+    print("✅ Chunks with incremental updates merge page for page")
+
+
+def _single(data):
+    out = io.BytesIO()
+    render_report(data, out, workers=1)
+    return out.getvalue()
+
+
+def test_worker_entry_skips_app():
+    # Spawned workers import the main script (server.py) as __mp_main__: that must not load app.py
+    here = os.path.dirname(os.path.abspath(__file__))
+    out = subprocess.run([sys.executable, '-c', "import sys, server, pdf_report; print('app' in sys.modules)"],
+                         cwd=here, capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0 and out.stdout.strip() == 'False', out.stderr
+    print("✅ Worker entry script imports without app.py")
+
+
+if __name__ == '__main__':
+    test_parallel_matches_serial()
+    test_merged_structure()
+    test_layout_and_small_reports()
+    test_merge_incremental_update()
+    test_worker_entry_skips_app()
@@ -0,0 +1,164 @@
+import sys
+import os
+import json
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+import points_cache
+from points_cache import PointsFileCache
+
+app = app_module.app
+client = app.test_client()
+
+
+def _write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def test_sidecar_parse_once_and_revalidate():
+    tmp = tempfile.mkdtemp()
+    cache = PointsFileCache(os.path.join(tmp, 'cache'))
+    pnt_path = os.path.join(tmp, 'job.pnt')
+    _write(pnt_path, ''.join(f'{i},{1000 + i}.5,{2000 + i}.25\n' for i in range(500)))
+
+    table, token = cache.load(pnt_path)
+    assert len(table) == 500 and cache.stats['parsed'] == 1
+    assert os.path.exists(cache.sidecar_path(pnt_path))
+
+    again, token2 = cache.load(pnt_path)
+    assert token2 == token and cache.stats == {'hits': 1, 'revalidated': 0, 'appended': 0, 'parsed': 1}
+    assert isinstance(again.x, np.memmap)
+    assert again.ids[-1] == '499' and again.to_map()['499'] == {'x': 1499.5, 'y': 2499.25}
+
+    # Touch without changing bytes: content token revalidates the sidecar
+    st = os.stat(pnt_path)
+    os.utime(pnt_path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    _, token3 = cache.load(pnt_path)
+    assert token3 == token and cache.stats['revalidated'] == 1 and cache.stats['parsed'] == 1
+
+    # Real edit: re-parse; an unterminated last line is re-read on every hit
+    _write(pnt_path, '1,5,5\n2,6,6')
+    edited, token4 = cache.load(pnt_path)
+    assert token4 != token and cache.stats['parsed'] == 2
+    assert cache.load(pnt_path)[0].to_list() == edited.to_list() == [{'id': '1', 'x': 5.0, 'y': 5.0},
+                                                                      {'id': '2', 'x': 6.0, 'y': 6.0}]
+    assert cache.stats['hits'] == 2
+
+    # Corrupt sidecar falls back to parsing
+    with open(cache.sidecar_path(pnt_path), 'r+b') as f:
+        f.truncate(140)
+    os.utime(pnt_path, ns=(st.st_atime_ns, st.st_mtime_ns + 9_000_000_000))
+    assert cache.load(pnt_path)[0].to_list() == edited.to_list()
+    print("✅ Points sidecar parses once, revalidates on touch, re-parses on edit")
+
+
+def test_appended_tail_only_parses_new_lines():
+    for cache_dir, keep in (('disk', 'first'), (None, 'last')):
+        tmp = tempfile.mkdtemp()
+        cache = PointsFileCache(cache_dir and os.path.join(tmp, cache_dir), keep=keep)
+        pnt_path = os.path.join(tmp, 'logger.pnt')
+        _write(pnt_path, '1,0,0\n2,10,0\n3,10,1')  # logger is mid-way through line 3
+        first, _ = cache.load(pnt_path)
+        assert first.to_map()['3'] == {'x': 10.0, 'y': 1.0}
+
+        with open(pnt_path, 'a', encoding='utf-8') as f:
+            f.write('0\n4,0,10\n1,99,99\n')
+        grown, token = cache.load(pnt_path)
+        assert cache.stats['appended'] == 1 and cache.stats['parsed'] == 1
+        points = grown.to_tuple_map()
+        assert points['3'] == (10.0, 10.0) and points['4'] == (0.0, 10.0)
+        assert points['1'] == ((0.0, 0.0) if keep == 'first' else (99.0, 99.0))
+
+        # Tail result must equal a from-scratch parse of the whole file
+        fresh = PointsFileCache(None, keep=keep).load(pnt_path)
+        assert fresh[1] == token and fresh[0].to_tuple_map() == points
+
+        # Rewriting the prefix forces a full re-parse
+        _write(pnt_path, '1,5,5\n2,10,0\n3,10,10\n4,0,10\n5,1,1\n')
+        rewritten, _ = cache.load(pnt_path)
+        assert cache.stats['parsed'] == 2 and rewritten.to_tuple_map()['1'] == (5.0, 5.0)
+        print(f"✅ Appended tail merged without re-parsing ({cache_dir or 'memory'}, keep={keep})")
+
+
+def test_grown_file_parses_only_new_tail():
+    blocks = points_cache.DIGEST_BLOCK
+    points_cache.DIGEST_BLOCK = 256
+    try:
+        tmp = tempfile.mkdtemp()
+        cache = PointsFileCache(os.path.join(tmp, 'cache'))
+        pnt_path = os.path.join(tmp, 'logger.pnt')
+        _write(pnt_path, ''.join(f'{i},{1000 + i}.5,{2000 + i}.25\n' for i in range(400)))
+        cache.load(pnt_path)
+
+        parsed = []
+        real_parse = points_cache.parse_points_bytes
+
+        def counting_parse(data, *args, **kwargs):
+            parsed.append(len(data))
+            return real_parse(data, *args, **kwargs)
+
+        with open(pnt_path, 'a', encoding='utf-8') as f:
+            f.write('400,1,1\n401,2,2\n402,3,3')
+        points_cache.parse_points_bytes = counting_parse
+        try:
+            grown, token = cache.load(pnt_path)
+        finally:
+            points_cache.parse_points_bytes = real_parse
+        size = os.path.getsize(pnt_path)
+        assert cache.stats['appended'] == 1 and sum(parsed) < 300 < size
+        fresh = PointsFileCache(None).load(pnt_path)
+        assert fresh[1] == token and fresh[0].to_list() == grown.to_list() and len(grown) == 403
+
+        # An edit in the middle of the file plus an append is caught and forces a full re-parse
+        with open(pnt_path, 'r+b') as f:
+            f.seek(size // 2)
+            line_start = f.read(200).index(b'\n') + size // 2 + 1
+            f.seek(line_start)
+            f.write(b'9')
+        with open(pnt_path, 'a', encoding='utf-8') as f:
+            f.write('\n404,4,4\n')
+        edited, token = cache.load(pnt_path)
+        assert cache.stats['appended'] == 1 and cache.stats['parsed'] == 2
+        fresh = PointsFileCache(None).load(pnt_path)
+        assert fresh[1] == token and fresh[0].to_list() == edited.to_list()
+    finally:
+        points_cache.DIGEST_BLOCK = blocks
+
+    memory = PointsFileCache(None, max_entries=2)
+    for k in range(3):
+        _write(os.path.join(tmp, f'{k}.pnt'), f'{k},0,0\n')
+        memory.load(os.path.join(tmp, f'{k}.pnt'))
+    assert len(memory._memory) == 2
+    print(f"✅ Grown file parsed {sum(parsed)}B of {size}B; in-memory mode keeps the last 2 files")
+
+
+def test_project_load_reads_through_cache():
+    tmp = tempfile.mkdtemp()
+    pnt_path = os.path.join(tmp, 'lot.pnt')
+    proj_path = os.path.join(tmp, 'lot.prcl')
+    _write(pnt_path, '1,0,0\n2,40,0\n3,40,30\n')
+    with open(proj_path, 'w', encoding='utf-8') as f:
+        json.dump({'projectName': 'Lot', 'pointsFilePath': pnt_path,
+                   'savedParcels': [{'id': 1, 'number': '1', 'ids': ['1', '2', '3']}]}, f)
+
+    before = dict(app_module.points_cache.stats)
+    for _ in range(2):
+        res = client.post('/api/project/load', json={'filePath': proj_path})
+        assert res.status_code == 200
+        project = res.get_json()['projectData']
+        assert project['loadedPoints']['3'] == {'x': 40.0, 'y': 30.0}
+        assert project['savedParcels'][0]['area'] == 600.0
+    assert app_module.points_cache.stats['parsed'] == before['parsed'] + 1
+    assert app_module.points_cache.stats['hits'] == before['hits'] + 1
+    print("✅ Project load resolves its points file through the sidecar cache")
+
+
+if __name__ == '__main__':
+    test_sidecar_parse_once_and_revalidate()
+    test_appended_tail_only_parses_new_lines()
+    test_grown_file_parses_only_new_tail()
+    test_project_load_reads_through_cache()
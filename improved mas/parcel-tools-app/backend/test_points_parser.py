@@ -0,0 +1,104 @@
+import sys
+import os
+import random
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+from points_parser import parse_points_text, parse_points_file, parse_points_bytes
+from run_points_benchmark import legacy_parse, make_points
+
+app = app_module.app
+client = app.test_client()
+
+
+def test_matches_legacy_on_mixed_input():
+    rng = random.Random(3)
+    rows = ['# header', '// exported by total station', '']
+    for i in range(2000):
+        x, y = 170000 + rng.uniform(0, 900), 640000 + rng.uniform(0, 900)
+        style = i % 6
+        if style == 0:
+            rows.append(f'{i},{x},{y}')
+        elif style == 1:
+            rows.append(f'{i}; {x}; {y}; 12.5')
+        elif style == 2:
+            rows.append(f'  {i}   {x}\t{y}  ')
+        elif style == 3:
+            rows.append(f'{i},{x},{y},,CODE')
+        elif style == 4:
+            rows.append(f'{i % 50},{x},{y}')  # duplicate IDs: the legacy loop kept the first
+        else:
+            rows.append(f'{i},not-a-number,{y}')
+    text = '\r\n'.join(rows)
+    assert parse_points_text(text, keep='first').to_list() == legacy_parse(text)
+
+    # By default a repeated ID keeps its place and takes its last row, like a dict of every row
+    every_row = {}
+    for line in text.split('\n'):
+        every_row.update((p['id'], p) for p in legacy_parse(line))
+    assert parse_points_text(text).to_list() == list(every_row.values())
+
+    # Uniform files take the fast path and must agree too
+    uniform = '\n'.join(f'P{i},{i * 1.5},{i * 2.25}' for i in range(5000))
+    assert parse_points_text(uniform).to_list() == legacy_parse(uniform)
+    spaced = '\n'.join(f'{i}  {i * 1.5}\t{i * 2.25}' for i in range(5000))
+    assert parse_points_text(spaced).to_list() == legacy_parse(spaced)
+    print("✅ Unified parser matches the legacy loop on mixed and uniform input")
+
+
+def test_streaming_chunks_extra_columns_and_keep():
+    path = os.path.join(tempfile.mkdtemp(), 'chunks.pnt')
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(3000):
+            f.write(f'{i},{i}.5,{i}.25,{i % 7}.0,BM{i % 3}\n')
+        f.write('5,1,1,1,LAST\n')
+        f.write('6,nan,1\n7,inf,1\n')
+    table = parse_points_file(path, keep='first', with_extra=True, chunk_size=4096)
+    assert len(table) == 3000
+    assert table.ids[5] == '5' and table.x[5] == 5.5 and table.code[5] == 'BM2'
+    assert table.z[10] == 3.0 and table.code[10] == 'BM1'
+    assert table.to_map()['7'] == {'x': 7.5, 'y': 7.25}  # non-finite re-shot dropped, original kept
+
+    last = parse_points_file(path, with_extra=True, chunk_size=4096)
+    assert last.ids[5] == '5' and (last.x[5], last.y[5], last.z[5], last.code[5]) == (1.0, 1.0, 1.0, 'LAST')
+    assert len(last) == 3000 and last.to_map()['7'] == {'x': 7.5, 'y': 7.25}
+
+    arabic = parse_points_bytes('ن1,10,20\n'.encode('cp1256'))
+    assert arabic.ids == ['ن1']
+    print("✅ Streamed chunks, z / code columns, keep last (default) / first and cp1256 IDs")
+
+
+def test_import_endpoint_uses_parser():
+    res = client.post('/api/import-points', json={'data': '1\t10\t20\n2;30;40\n2,99,99\n3,nan,5'})
+    assert res.status_code == 200
+    assert res.get_json()['points'] == [{'id': '1', 'x': 10.0, 'y': 20.0}, {'id': '2', 'x': 99.0, 'y': 99.0}]
+    res = client.post('/api/import-points', json={'data': 'no points here'})
+    assert res.status_code == 400
+    print("✅ /api/import-points backed by the unified parser")
+
+
+def test_parser_throughput_floor():
+    # Measured at about 0.8M lines/s and 2.2x the legacy loop; fail well before a real regression
+    n = 300_000
+    text = make_points(n, 'csv')
+
+    def best_rate(parse):
+        timings = []
+        for _ in range(3):
+            started = time.perf_counter()
+            parse(text)
+            timings.append(time.perf_counter() - started)
+        return n / min(timings)
+
+    rate, legacy_rate = best_rate(parse_points_text), best_rate(legacy_parse)
+    assert rate >= 0.5e6 and rate >= 1.5 * legacy_rate, (rate, legacy_rate)
+    print(f"✅ Parser throughput {rate / 1e6:.2f}M lines/s ({rate / legacy_rate:.1f}x the legacy loop)")
+
+
+if __name__ == '__main__':
+    test_matches_legacy_on_mixed_input()
+    test_streaming_chunks_extra_columns_and_keep()
+    test_import_endpoint_uses_parser()
+    test_parser_throughput_floor()
@@ -0,0 +1,47 @@
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+
+app = app_module.app
+client = app.test_client()
+
+
+def _write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def test_reload_version_tokens():
+    pnt_path = os.path.join(tempfile.mkdtemp(), 'field.pnt')
+    _write(pnt_path, "1,100,200\n2,110,200\n3,110,210\n")
+
+    # First load: no token -> full payload
+    first = client.post('/api/reload-points-file', json={'filePath': pnt_path}).get_json()
+    assert first['full'] is True and len(first['points']) == 3
+    token = first['versionToken']
+
+    # Unchanged file -> same token, empty delta
+    same = client.post('/api/reload-points-file', json={'filePath': pnt_path, 'versionToken': token}).get_json()
+    assert same['full'] is False and same['versionToken'] == token
+    assert same['added'] == [] and same['removed'] == [] and same['moved'] == []
+
+    # Crew appends a shot, corrects one and drops another -> delta only
+    _write(pnt_path, "1,100,200\n2,111.5,200\n4,120,220\n")
+    delta = client.post('/api/reload-points-file', json={'filePath': pnt_path, 'versionToken': token}).get_json()
+    assert delta['full'] is False and 'points' not in delta
+    assert delta['added'] == [{'id': '4', 'x': 120.0, 'y': 220.0}]
+    assert delta['moved'] == [{'id': '2', 'x': 111.5, 'y': 200.0}]
+    assert delta['removed'] == ['3']
+    assert delta['versionToken'] != token and delta['count'] == 3
+
+    # Stale / unknown token -> full payload again
+    stale = client.post('/api/reload-points-file', json={'filePath': pnt_path, 'versionToken': 'bogus'}).get_json()
+    assert stale['full'] is True and len(stale['points']) == 3
+    print("✅ Reload endpoint serves deltas against the client's version token")
+
+
+if __name__ == '__main__':
+    test_reload_version_tokens()
@@ -0,0 +1,87 @@
+import sys
+import os
+import json
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+from project_index import ProjectMetadataIndex
+
+app = app_module.app
+client = app.test_client()
+
+
+def _write_project(path, name, parcels):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'projectName': name, 'pointsFileName': 'field.pnt',
+                   'savedParcels': [{'id': i, 'ids': ['1', '2', '3']} for i in range(parcels)]}, f)
+
+
+def test_index_parses_only_changed_files():
+    tmp = tempfile.mkdtemp()
+    index = ProjectMetadataIndex(os.path.join(tmp, 'index.sqlite3'))
+    a, b, broken = (os.path.join(tmp, n) for n in ('a.prcl', 'b.prcl', 'broken.prcl'))
+    _write_project(a, 'Block A', 3)
+    _write_project(b, 'Block B', 1)
+    with open(broken, 'w') as f:
+        f.write('{not json')
+
+    first = index.describe_many([a, b, broken, os.path.join(tmp, 'gone.prcl')])
+    assert [e['projectName'] for e in first] == ['Block A', 'Block B']
+    assert first[0]['parcelCount'] == 3 and first[0]['pointsFile'] == 'field.pnt'
+    assert index.stats['parsed'] == 3
+
+    index.describe_many([a, b, broken])
+    assert index.stats['parsed'] == 3  # unreadable file is remembered too
+
+    _write_project(b, 'Block B (revised)', 5)
+    os.utime(b, ns=(os.stat(b).st_atime_ns, os.stat(b).st_mtime_ns + 2_000_000_000))
+    again = index.describe_many([a, b])
+    assert index.stats['parsed'] == 4 and again[1]['parcelCount'] == 5
+
+    # Index survives a restart
+    reopened = ProjectMetadataIndex(index.db_path)
+    assert reopened.describe_many([a, b])[1]['projectName'] == 'Block B (revised)'
+    assert reopened.stats['parsed'] == 0
+
+    # Saves update the entry from memory, no re-read needed
+    _write_project(a, 'Block A', 3)
+    reopened.record(a, {'projectName': 'Block A2', 'savedParcels': [1, 2]})
+    assert reopened.describe_many([a])[0]['projectName'] == 'Block A2' and reopened.stats['parsed'] == 0
+    print("✅ Project index parses each .prcl once per change")
+
+
+def test_background_rescan_tracks_directories():
+    tmp = tempfile.mkdtemp()
+    os.makedirs(os.path.join(tmp, 'jobs', '2026'))
+    index = ProjectMetadataIndex(os.path.join(tmp, 'index.sqlite3'))
+    keep = os.path.join(tmp, 'jobs', '2026', 'keep.prcl')
+    drop = os.path.join(tmp, 'jobs', 'drop.prcl')
+    _write_project(keep, 'Keep', 2)
+    _write_project(drop, 'Drop', 2)
+
+    assert index.last_scan() is None
+    assert index.rescan([tmp]) == 2
+    assert sorted(os.path.basename(p) for p in index.scanned_paths()) == ['drop.prcl', 'keep.prcl']
+
+    os.remove(drop)
+    assert index.rescan_async([tmp])
+    index._scan_thread.join(5)
+    assert [os.path.basename(p) for p in index.scanned_paths()] == ['keep.prcl']
+    assert index.last_scan() is not None
+    print("✅ Background rescan indexes new projects and forgets deleted ones")
+
+
+def test_projects_endpoint_uses_index():
+    res = client.get('/api/projects')
+    assert res.status_code == 200 and isinstance(res.get_json(), list)
+    parsed = app_module.project_index.stats['parsed']
+    assert client.get('/api/projects').status_code == 200
+    assert app_module.project_index.stats['parsed'] == parsed
+    print("✅ /api/projects re-uses indexed metadata on repeat calls")
+
+
+if __name__ == '__main__':
+    test_index_parses_only_changed_files()
+    test_background_rescan_tracks_directories()
+    test_projects_endpoint_uses_index()
@@ -0,0 +1,88 @@
+import sys
+import os
+import json
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app as app_module
+from save_queue import SaveQueue, write_json_atomic
+
+app = app_module.app
+client = app.test_client()
+
+
+def test_bursts_coalesce_into_one_atomic_write():
+    tmp = tempfile.mkdtemp()
+    target = os.path.join(tmp, 'burst.prcl')
+    writes = []
+
+    def writer(path, data):
+        writes.append(data['rev'])
+        write_json_atomic(path, data)
+
+    queue = SaveQueue(delay=0.2, writer=writer)
+    written = threading.Event()
+    for rev in range(50):
+        queue.submit(target, {'rev': rev}, on_written=lambda path: written.set())
+    assert queue.pending(target) == 1
+    assert written.wait(5)
+    assert queue.flush(target) is None
+    assert writes == [49] and queue.stats['coalesced'] == 49
+    with open(target, encoding='utf-8') as f:
+        text = f.read()
+    # Same on-disk format as the old direct save: indented, non-ASCII kept as-is
+    assert json.loads(text) == {'rev': 49} and text == json.dumps({'rev': 49}, indent=2, ensure_ascii=False)
+    assert [n for n in os.listdir(tmp) if n.endswith('.tmp')] == []
+
+    # flush() writes immediately instead of waiting out the delay
+    queue.delay = 60
+    queue.submit(target, {'rev': 50})
+    assert queue.flush(target, timeout=5) is None and writes == [49, 50]
+    print("✅ 50 rapid saves became 1 atomic write; flush persists immediately")
+
+
+def test_write_failure_reported_by_flush():
+    tmp = tempfile.mkdtemp()
+    queue = SaveQueue(delay=0)
+    missing = os.path.join(tmp, 'no-such-dir', 'x.prcl')
+    queue.submit(missing, {'a': 1})
+    assert isinstance(queue.flush(missing, timeout=5), OSError)
+    assert queue.stats['failed'] == 1
+    # A flush of everything (app quit) still reports the earlier acknowledged failure
+    assert isinstance(queue.flush(timeout=5), OSError)
+    assert queue.check_directory(os.path.join(tmp, 'made')) is None and os.path.isdir(os.path.join(tmp, 'made'))
+    print("✅ Failed writes surface through flush")
+
+
+def test_deferred_save_endpoint_and_flush():
+    tmp = tempfile.mkdtemp()
+    target = os.path.join(tmp, 'Autosaved.prcl')
+    body = {'projectName': 'Autosaved', 'filePath': target, 'deferred': True}
+    before = dict(app_module.save_queue.stats)
+    for n in range(10):
+        project = {'projectName': 'Autosaved', 'savedParcels': [{'id': i, 'ids': []} for i in range(n + 1)]}
+        res = client.post('/api/project/save', json=dict(body, projectData=project))
+        assert res.status_code == 202 and res.get_json()['queued']
+    saved_path = res.get_json()['filePath']
+
+    res = client.post('/api/project/flush', json={'filePath': saved_path})
+    assert res.status_code == 200 and res.get_json()['success']
+    assert app_module.save_queue.stats['written'] - before['written'] == 1
+    with open(saved_path, encoding='utf-8') as f:
+        assert len(json.load(f)['savedParcels']) == 10
+
+    # Explicit saves still return once the file is on disk
+    res = client.post('/api/project/save', json={'projectName': 'Autosaved', 'filePath': target,
+                                                 'projectData': {'projectName': 'Final', 'savedParcels': []}})
+    assert res.status_code == 200
+    with open(res.get_json()['filePath'], encoding='utf-8') as f:
+        assert json.load(f)['projectName'] == 'Final'
+    os.remove(saved_path)  # the save route normalizes to Windows separators
+    print("✅ Deferred saves ack with 202 and land on disk as one write")
+
+
+if __name__ == '__main__':
+    test_bursts_coalesce_into_one_atomic_write()
+    test_write_failure_reported_by_flush()
+    test_deferred_save_endpoint_and_flush()
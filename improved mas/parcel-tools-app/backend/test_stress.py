@@ -31,7 +31,8 @@ def main():
         res = requests.post(f'{BASE_URL}/compress-files', json={
             'files': test_files,
             'compressionLevel': 6,
-            'comment': f'Stress test batch {batch_id}'
+            'comment': f'Stress test batch {batch_id}',
+            'wait': True
         }, timeout=15)
         return batch_id, res.status_code, res.json()
 
@@ -53,7 +54,8 @@ def main():
         'projectData': {
             'savedParcels': [{'id': 1, 'number': '101', 'area': 5000, 'ids': ['1', '2', '3', '4']}],
             'points': {'1': {'x': 100, 'y': 200}, '2': {'x': 200, 'y': 200}, '3': {'x': 200, 'y': 300}, '4': {'x': 100, 'y': 300}}
-        }
+        },
+        'wait': True
     }, timeout=10)
     print('Project Archive Result:', proj_res.status_code, proj_res.json())
 
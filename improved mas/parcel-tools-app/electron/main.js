@@ -82,7 +82,7 @@ function getPythonExecutionConfig() {
 // Start Python backend
 function startPythonBackend() {
   const backendRoot = getBackendRoot();
-  const pythonScript = path.join(backendRoot, 'app.py');
+  const pythonScript = path.join(backendRoot, 'server.py');
   const { command, env } = getPythonExecutionConfig();
 
   // Set environment variable to tell backend it's running in packaged mode
@@ -125,6 +125,44 @@ function startPythonBackend() {
   });
 }
 
+// Ask the backend to write any queued project autosaves; resolves (never rejects)
+// once they are on disk, the backend answered with an error, or timeoutMs passed
+function flushBackendSaves(timeoutMs = 10000) {
+  return new Promise((resolve) => {
+    if (!pythonProcess) {
+      resolve(false);
+      return;
+    }
+    const request = http.request('http://127.0.0.1:5000/api/project/flush', {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      timeout: timeoutMs
+    }, (res) => {
+      let data = '';
+      res.on('data', (chunk) => { data += chunk; });
+      res.on('end', () => {
+        if (res.statusCode !== 200) {
+          log(`[Backend] Flushing queued saves failed (${res.statusCode}): ${data}`);
+          dialog.showErrorBox('Parcel Tools',
+            'Some recent project changes could not be written to disk.\n\n' + data);
+        }
+        resolve(res.statusCode === 200);
+      });
+    });
+    request.on('error', (err) => {
+      log(`[Backend] Could not flush queued saves: ${err.message}`);
+      resolve(false);
+    });
+    request.on('timeout', () => {
+      log('[Backend] Timed out flushing queued saves');
+      request.destroy();
+    });
+    request.end('{}');
+  });
+}
+
+let backendFlushedForQuit = false;
+
 // Forcefully kill Python backend and all child processes synchronously
 function killPythonBackendSync() {
   if (pythonProcess) {
@@ -492,6 +530,8 @@ ipcMain.handle('start-download-update', async () => {
 ipcMain.handle('quit-and-install-update', async () => {
   try {
     console.log('[Auto-Update] Preparing to quit and install update...');
+    await flushBackendSaves();
+    backendFlushedForQuit = true;
     killPythonBackendSync();
     if (mainWindow && !mainWindow.isDestroyed()) {
       mainWindow.destroy();
@@ -557,7 +597,17 @@ app.whenReady().then(() => {
   });
 });
 
-app.on('before-quit', () => {
+app.on('before-quit', (event) => {
+  // The kill below can't be caught by the backend, so queued autosaves are written first
+  if (!backendFlushedForQuit && pythonProcess) {
+    event.preventDefault();
+    flushBackendSaves().finally(() => {
+      backendFlushedForQuit = true;
+      killPythonBackendSync();
+      app.quit();
+    });
+    return;
+  }
   killPythonBackendSync();
 });
 
@@ -566,9 +616,10 @@ app.on('will-quit', () => {
 });
 
 app.on('window-all-closed', () => {
-  killPythonBackendSync();
   if (process.platform !== 'darwin') {
-    app.quit();
+    app.quit(); // before-quit flushes and stops the backend
+  } else {
+    flushBackendSaves().finally(killPythonBackendSync);
   }
 });
 
@@ -581,6 +632,13 @@ ipcMain.handle('get-app-version', () => {
   return app.getVersion();
 });
 
+// Paths the user picked in a save dialog this session; open-path only opens PDFs among them
+const savedDialogPaths = new Set();
+const dialogPathKey = (filePath) => {
+  const resolved = path.resolve(filePath);
+  return process.platform === 'win32' ? resolved.toLowerCase() : resolved;
+};
+
 // Save file dialog
 ipcMain.handle('show-save-dialog', async (event, options) => {
   console.log('[Main] show-save-dialog called with options:', options);
@@ -615,6 +673,7 @@ ipcMain.handle('show-save-dialog', async (event, options) => {
     }
 
     if (result.filePath) {
+      savedDialogPaths.add(dialogPathKey(result.filePath));
       return {
         canceled: false,
         filePath: result.filePath
@@ -680,6 +739,27 @@ ipcMain.handle('open-external', async (event, url) => {
   await shell.openExternal(url);
 });
 
+// Open a PDF the backend just wrote to a path the user picked in the save dialog.
+// Anything else is refused: the renderer must not be able to launch arbitrary files.
+ipcMain.handle('open-path', async (event, filePath) => {
+  console.log('[Main] Opening path:', filePath);
+  if (typeof filePath !== 'string' || path.extname(filePath).toLowerCase() !== '.pdf') {
+    return { success: false, error: 'Only PDF files can be opened' };
+  }
+  const key = dialogPathKey(filePath);
+  // The renderer appends '.pdf' when the dialog path has no extension
+  if (!savedDialogPaths.has(key) && !savedDialogPaths.has(key.slice(0, -'.pdf'.length))) {
+    console.error('[Main] open-path refused, not a path chosen in a save dialog:', filePath);
+    return { success: false, error: 'Path was not chosen in a save dialog' };
+  }
+  const openError = await shell.openPath(filePath);
+  if (openError) {
+    console.error('[Main] shell.openPath returned error:', openError);
+    return { success: false, error: openError };
+  }
+  return { success: true };
+});
+
 // Save PDF and open it
 ipcMain.handle('save-and-open-pdf', async (event, pdfData, fileName) => {
   try {
@@ -23,6 +23,9 @@ const electronAPI = {
   openExternal: (url) => {
     return ipcRenderer.invoke('open-external', url);
   },
+  openPath: (filePath) => {
+    return ipcRenderer.invoke('open-path', filePath);
+  },
   // Listen for project file to load (when double-clicked)
   onLoadProjectFile: (callback) => {
     console.log('[Preload] Setting up onLoadProjectFile listener');
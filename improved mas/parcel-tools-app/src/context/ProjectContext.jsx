@@ -4,6 +4,25 @@ import { deduplicatePoints, deduplicateParcels, deduplicateDatasets } from '../u
 
 const ProjectContext = createContext();
 
+// Token for the structure of a parcel set (parcel IDs and the point IDs they use), as
+// registered with the backend's dependency index. null when a parcel has no ID, since
+// the backend can't report changes for it in a form we could match.
+const parcelsVersionOf = (parcels) => {
+  let hash = 0x811c9dc5;
+  const feed = (text) => {
+    for (let i = 0; i < text.length; i++) {
+      hash = Math.imul(hash ^ text.charCodeAt(i), 0x01000193);
+    }
+  };
+  for (const parcel of parcels) {
+    if (parcel.id === undefined || parcel.id === null) return null;
+    feed(`${parcel.id}|${(parcel.ids || []).join(',')}|`);
+    (parcel.curves || []).forEach(c => feed(`${c.from}>${c.to};`));
+    feed('\n');
+  }
+  return `${parcels.length}-${(hash >>> 0).toString(16)}`;
+};
+
 export const useProject = () => {
   const context = useContext(ProjectContext);
   if (!context) {
@@ -14,6 +33,7 @@ export const useProject = () => {
 
 export const ProjectProvider = ({ children }) => {
   const toast = useToast();
+  const toastError = toast.error; // stable, unlike the toast object itself
   const [projectName, setProjectName] = useState('');
   const [projectPath, setProjectPath] = useState('');
   const [pointsFileName, setPointsFileName] = useState('');
@@ -73,6 +93,20 @@ export const ProjectProvider = ({ children }) => {
     loadedPointsRef.current = loadedPoints;
   }, [loadedPoints]);
 
+  const projectPathRef = useRef(projectPath);
+  useEffect(() => {
+    projectPathRef.current = projectPath;
+  }, [projectPath]);
+
+  const pointsFilePathRef = useRef(pointsFilePath);
+  useEffect(() => {
+    pointsFilePathRef.current = pointsFilePath;
+  }, [pointsFilePath]);
+
+  // Set when a points reload already applied the backend's incremental results,
+  // so the loadedPoints effect below doesn't re-post every parcel
+  const skipNextRecalcRef = useRef(false);
+
   // Auto-watch points file for changes
   useEffect(() => {
     if (!pointsFilePath) {
@@ -93,6 +127,7 @@ export const ProjectProvider = ({ children }) => {
 
     let watchInterval;
     let lastModified = null;
+    let versionToken = null; // Last points-file version we hold; enables delta reloads
     let isReloading = false; // Prevent concurrent reloads
 
     const checkFileChanges = async () => {
@@ -133,7 +168,7 @@ export const ProjectProvider = ({ children }) => {
       }
     };
 
-    const reloadPointsFile = async () => {
+    const reloadPointsFile = async (useParcelIndex = true) => {
       if (isReloading) return; // Prevent concurrent reloads
       isReloading = true;
 
@@ -141,26 +176,15 @@ export const ProjectProvider = ({ children }) => {
         const response = await fetch('http://localhost:5000/api/reload-points-file', {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({ filePath: pointsFilePath }),
+          body: JSON.stringify({
+            filePath: pointsFilePath,
+            projectPath: (useParcelIndex && projectPathRef.current) || undefined,
+            versionToken: versionToken || undefined
+          }),
         });
 
         if (response.ok) {
-          const result = await response.json();
-
-          if (result.points) {
-            const pointsObj = {};
-            result.points.forEach(p => {
-              pointsObj[p.id] = { x: p.x, y: p.y };
-            });
-
-            const { deduplicated, removedCount } = deduplicatePoints(pointsObj);
-            setLoadedPoints(deduplicated);
-            let msg = `🔄 Points file updated! Reloaded ${Object.keys(deduplicated).length} points.`;
-            if (removedCount > 0) {
-              msg += ` (Cleaned ${removedCount} duplicate/invalid entries)`;
-            }
-            toast.success(msg);
-          }
+          applyPointsResult(await response.json());
         }
       } catch (error) {
         console.error('Error reloading file:', error);
@@ -169,11 +193,130 @@ export const ProjectProvider = ({ children }) => {
       }
     };
 
-    // Start watching
-    watchInterval = setInterval(checkFileChanges, 2000);
+    const applyPointsResult = (result) => {
+      versionToken = result.versionToken || null;
+
+      let pointsObj = null;
+      if (result.full === false) {
+        // Delta reply: apply added / moved / removed points to what we already hold
+        if (!result.added.length && !result.moved.length && !result.removed.length) return;
+        pointsObj = { ...loadedPointsRef.current };
+        result.added.concat(result.moved).forEach(p => {
+          pointsObj[p.id] = { x: p.x, y: p.y };
+        });
+        result.removed.forEach(id => {
+          delete pointsObj[id];
+        });
+      } else if (result.points) {
+        pointsObj = {};
+        result.points.forEach(p => {
+          pointsObj[p.id] = { x: p.x, y: p.y };
+        });
+      }
+
+      if (pointsObj) {
+        const { deduplicated, removedCount } = deduplicatePoints(pointsObj);
+
+        // Backend recomputed only the parcels that use a changed point. Its index only
+        // counts if it was built from the parcels we hold now; otherwise the loadedPoints
+        // effect recomputes everything, which also rebuilds the index from our parcels.
+        const currentVersion = parcelsVersionOf(savedParcelsRef.current);
+        if (result.changedParcels && currentVersion && result.parcelsVersion === currentVersion) {
+          const changedById = new Map(result.changedParcels.map(c => [c.id, c]));
+          skipNextRecalcRef.current = true;
+          if (changedById.size > 0) {
+            setSavedParcels(prev => prev.map(parcel => {
+              const changed = changedById.get(parcel.id);
+              if (!changed) return parcel;
+              return {
+                ...parcel,
+                area: changed.area,
+                perimeter: changed.perimeter,
+                points: parcel.ids ? parcel.ids.map(id => ({
+                  id: String(id),
+                  x: deduplicated[id]?.x || 0,
+                  y: deduplicated[id]?.y || 0
+                })) : []
+              };
+            }));
+            setHasUnsavedChanges(true);
+          }
+        }
+
+        setLoadedPoints(deduplicated);
+        let msg = `🔄 Points file updated! Reloaded ${Object.keys(deduplicated).length} points.`;
+        if (removedCount > 0) {
+          msg += ` (Cleaned ${removedCount} duplicate/invalid entries)`;
+        }
+        toast.success(msg);
+      }
+    };
+
+    const startPolling = () => {
+      if (!watchInterval) {
+        watchInterval = setInterval(checkFileChanges, 2000);
+      }
+    };
+
+    // Start watching: the backend pushes changes (with the point delta) over SSE;
+    // fall back to polling if the stream can't be opened at all
+    let eventSource = null;
+    if (typeof EventSource !== 'undefined') {
+      let streamOpened = false;
+      eventSource = new EventSource(
+        `http://localhost:5000/api/watch/stream?points=${encodeURIComponent(pointsFilePath)}`
+      );
+      eventSource.onopen = () => {
+        streamOpened = true;
+      };
+      eventSource.onmessage = (e) => {
+        let event;
+        try {
+          event = JSON.parse(e.data);
+        } catch {
+          return;
+        }
+
+        if (event.type === 'hello') {
+          const current = event.tokens ? event.tokens[pointsFilePath] : null;
+          if (!versionToken) {
+            versionToken = current || null;
+          } else if (current !== versionToken) {
+            // Reconnected after missing changes: resync against our token
+            reloadPointsFile(false);
+          }
+        } else if (event.type === 'points') {
+          if (event.full || !versionToken || event.baseToken !== versionToken) {
+            reloadPointsFile(false);
+            return;
+          }
+          console.log('Points file changed! Applying pushed delta...');
+          const project = (event.projects || []).find(p => p.projectPath === projectPathRef.current);
+          applyPointsResult({ ...event, changedParcels: project ? project.changedParcels : undefined });
+        } else if (event.type === 'resync') {
+          reloadPointsFile(false);
+        } else if (event.type === 'deleted') {
+          console.log('File no longer exists, stopping watch');
+          eventSource.close();
+          setIsWatchingFile(false);
+        }
+      };
+      eventSource.onerror = () => {
+        // EventSource reconnects on its own once it has been open
+        if (!streamOpened) {
+          eventSource.close();
+          startPolling();
+        }
+      };
+    } else {
+      startPolling();
+    }
     setIsWatchingFile(true);
 
     return () => {
+      if (eventSource) {
+        eventSource.close();
+      }
       if (watchInterval) {
         clearInterval(watchInterval);
       }
@@ -206,7 +349,11 @@ export const ProjectProvider = ({ children }) => {
           headers: { 'Content-Type': 'application/json' },
           body: JSON.stringify({
             parcels: parcels,
-            points: ptsMap
+            points: ptsMap,
+            // Rebuild the backend's dependency index from this exact parcel set
+            projectPath: projectPathRef.current || undefined,
+            pointsFilePath: pointsFilePathRef.current || undefined,
+            parcelsVersion: parcelsVersionOf(parcels)
           }),
         });
 
@@ -246,14 +393,40 @@ export const ProjectProvider = ({ children }) => {
 
   // Automatically recalculate saved parcels when loadedPoints changes (either cleared or replaced)
   useEffect(() => {
+    if (skipNextRecalcRef.current) {
+      skipNextRecalcRef.current = false;
+      return;
+    }
     const currentParcels = savedParcelsRef.current;
     if (currentParcels.length > 0) {
       recalculateAllParcels(loadedPoints, currentParcels);
     }
   }, [loadedPoints, recalculateAllParcels]);
 
-  // Unified save project function accessible globally
-  const saveActiveProject = React.useCallback(async (overridePath = null, overrideParcels = null, overridePoints = null) => {
+  // A deferred autosave was acknowledged before it reached the disk: confirm it shortly
+  // afterwards and tell the user if the write failed, so the project isn't shown as saved
+  const confirmDeferredSave = React.useCallback((path) => {
+    setTimeout(async () => {
+      try {
+        const response = await fetch('http://localhost:5000/api/project/flush', {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({ filePath: path }),
+        });
+        if (!response.ok) {
+          const data = await response.json().catch(() => ({}));
+          setHasUnsavedChanges(true);
+          toastError(`❌ Autosave failed: ${data.error || `HTTP ${response.status}`}`);
+        }
+      } catch (error) {
+        console.error('Could not confirm autosave:', error);
+      }
+    }, 1500);
+  }, [toastError]);
+
+  // Unified save project function accessible globally. Saves are written before this
+  // resolves; only the background autosave passes deferred = true (acked before the write).
+  const saveActiveProject = React.useCallback(async (overridePath = null, overrideParcels = null, overridePoints = null, deferred = false) => {
     const path = overridePath || projectPath;
     if (!path) {
       console.warn('saveActiveProject skipped: no project path set');
@@ -313,32 +486,53 @@ export const ProjectProvider = ({ children }) => {
         body: JSON.stringify({
           projectName: name,
           projectData: projectData,
-          filePath: path
+          filePath: path,
+          parcelsVersion: parcelsVersionOf(projectData.savedParcels),
+          // Write-behind: the backend acks at once and merges bursts into one disk write
+          deferred: deferred
         }),
       });
 
       if (response.ok) {
         setHasUnsavedChanges(false);
-        console.log('✅ Synchronized project file on disk:', path);
+        if (response.status === 202) {
+          confirmDeferredSave(path);
+        } else {
+          console.log('✅ Synchronized project file on disk:', path);
+        }
         return true;
       }
+      const data = await response.json().catch(() => ({}));
+      toastError(`❌ Could not save project: ${data.error || `HTTP ${response.status}`}`);
     } catch (error) {
       console.error('saveActiveProject failed:', error);
+      toastError(`❌ Could not save project: ${error.message}`);
     }
     return false;
-  }, [projectPath, projectName, savedParcels, loadedPoints, pointsFileName, pointsFilePath, fileHeading, savedErrorCalculations, currentParcel, cadFilePath, cadFileName, cadEntities, cadLayers, cadVisibleLayers]);
+  }, [projectPath, projectName, savedParcels, loadedPoints, pointsFileName, pointsFilePath, fileHeading, savedErrorCalculations, currentParcel, cadFilePath, cadFileName, cadEntities, cadLayers, cadVisibleLayers, confirmDeferredSave, toastError]);
 
   // Instant continuous background auto-save watcher
   useEffect(() => {
     if (!hasUnsavedChanges || !projectPath) return;
 
     const autoSaveTimer = setTimeout(() => {
-      saveActiveProject();
+      saveActiveProject(null, null, null, true);
     }, 800);
 
     return () => clearTimeout(autoSaveTimer);
   }, [hasUnsavedChanges, projectPath, saveActiveProject]);
 
+  // Make sure queued autosaves reach the disk before the window goes away
+  useEffect(() => {
+    const flushQueuedSaves = () => {
+      if (navigator.sendBeacon) {
+        navigator.sendBeacon('http://localhost:5000/api/project/flush', new Blob(['{}'], { type: 'text/plain' }));
+      }
+    };
+    window.addEventListener('beforeunload', flushQueuedSaves);
+    return () => window.removeEventListener('beforeunload', flushQueuedSaves);
+  }, []);
+
 
   // Reset all project state to empty defaults — the single source of truth for teardown
   const closeProject = React.useCallback(() => {
@@ -10,6 +10,9 @@ import {
 import { useProject } from '../context/ProjectContext';
 import { useToast } from '../context/ToastContext';
 import { customConfirm } from '../utils/dialogs';
+import { fetchParsedCad, forEachVertex, vertexCount } from '../utils/cadWire';
+import { buildCadTiles, hitTestCad, visibleTiles, CadTileCache } from '../utils/cadTiles';
+import { detectCadParcels } from '../utils/cadParcels';
 
 // ─── Colour palette for layers fallback ──────────────────────────────────────
 const LAYER_COLORS = [
@@ -43,6 +46,9 @@ function isPointInPolygon(px, py, pts) {
     return inside;
 }
 
+// Drawings with at least this many entities are hit-tested on the server (see utils/cadTiles)
+const SERVER_HIT_TEST_MIN_ENTITIES = 5000;
+
 // ─── Polygon & Arc Geometry Math Helpers ────────────────────────────────────
 function isPolygonCCW(pts) {
     if (!pts || pts.length < 3) return true;
@@ -561,6 +567,9 @@ const DxfImport = () => {
     const isDraggingRef = useRef(false);
     const dragStartRef = useRef({ x: 0, y: 0 });
     const entitiesRef = useRef([]);
+    const tiledDrawingRef = useRef(null);
+    const tileCacheRef = useRef(null);
+    const tileViewRef = useRef({ key: null, entities: null, pending: null });
     const selectedIdxRef = useRef(null);
 
     // Refs to avoid stale closures in canvas drawing
@@ -761,19 +770,44 @@ const DxfImport = () => {
         const wx2sx = (wx) => wx * zoomRef.current + panRef.current.x;
         const wy2sy = (wy) => -wy * zoomRef.current + panRef.current.y;
 
-        // ─── Draw a path using the dense tessellated 'points' array ──────────────
+        // Large tiled drawings: draw only the tiles covering the viewport, simplified for this zoom.
+        // Until the first viewport arrives the full entity list is drawn.
+        let drawList = null;
+        const tiled = tiledDrawingRef.current;
+        const tileCache = tileCacheRef.current;
+        if (tiled && tileCache && tiled.entityCount === ents.length) {
+            const tl = s2w(0, 0), br = s2w(W, H);
+            const keys = visibleTiles(tiled, { minX: tl.x, maxX: br.x, minY: br.y, maxY: tl.y }, zoomRef.current);
+            const viewKey = keys.map(t => `${t.z}/${t.x}/${t.y}`).join(',');
+            const view = tileViewRef.current;
+            if (view.key !== viewKey && view.pending !== viewKey) {
+                view.pending = viewKey;
+                tileCache.entities(keys)
+                    .then(list => {
+                        if (tileCacheRef.current !== tileCache || tileViewRef.current.pending !== viewKey) return;
+                        tileViewRef.current = { key: viewKey, entities: list, pending: null };
+                        drawCanvas();
+                    })
+                    .catch(err => {
+                        if (tileViewRef.current.pending === viewKey) tileViewRef.current.pending = null;
+                        console.warn('[CAD Tiles]', err.message);
+                    });
+            }
+            drawList = view.entities;
+        }
+
+        // ─── Draw a path from the dense tessellated vertices (coordinate view or 'points') ──
         const buildPath = (ctx, ent) => {
             ctx.beginPath();
-            if (ent.points && ent.points.length > 0) {
-                ent.points.forEach((p, pi) => {
-                    const sx = wx2sx(p.x), sy = wy2sy(p.y);
-                    if (pi === 0) ctx.moveTo(sx, sy); else ctx.lineTo(sx, sy);
-                });
-            }
-            if (ent.closed && ent.points?.length > 1) ctx.closePath();
+            forEachVertex(ent, (x, y, pi) => {
+                const sx = wx2sx(x), sy = wy2sy(y);
+                if (pi === 0) ctx.moveTo(sx, sy); else ctx.lineTo(sx, sy);
+            });
+            if (ent.closed && vertexCount(ent) > 1) ctx.closePath();
         };
 
-        ents.forEach((ent, i) => {
+        (drawList || ents).forEach((ent, idx) => {
+            const i = drawList ? ent.i : idx;
             // Check layer visibility
             if (visibleLayersRef.current && visibleLayersRef.current[ent.layer] === false) return;
 
@@ -787,7 +821,7 @@ const DxfImport = () => {
             } catch (e) { color = '#ffffff'; }
 
             const isShape = ['LINE', 'LWPOLYLINE', 'POLYLINE', 'ARC', 'CIRCLE'].includes(ent.type);
-            if (isShape && (ent.points || ent.segments) && (ent.points?.length > 0 || ent.segments?.length > 0)) {
+            if (isShape && (vertexCount(ent) > 0 || ent.segments?.length > 0)) {
                 ctx.strokeStyle = color;
                 ctx.lineWidth = isSelected ? 3 : 1.5;
                 buildPath(ctx, ent);
@@ -798,12 +832,13 @@ const DxfImport = () => {
                     buildPath(ctx, ent);
                     ctx.fill();
 
-                    // Draw Live Computed Area Badge near centroid of selected entity
-                    if (ent.points && ent.points.length >= 3) {
-                        const metrics = calculatePolygonMetrics(ent.points);
+                    // Draw Live Computed Area Badge near centroid of selected entity (full detail, not the tile's)
+                    const full = ents[i];
+                    if (full.points && full.points.length >= 3) {
+                        const metrics = calculatePolygonMetrics(full.points);
                         if (metrics) {
-                            const cx = ent.points.reduce((sum, p) => sum + p.x, 0) / ent.points.length;
-                            const cy = ent.points.reduce((sum, p) => sum + p.y, 0) / ent.points.length;
+                            const cx = full.points.reduce((sum, p) => sum + p.x, 0) / full.points.length;
+                            const cy = full.points.reduce((sum, p) => sum + p.y, 0) / full.points.length;
                             const scx = wx2sx(cx), scy = wy2sy(cy);
 
                             ctx.save();
@@ -993,9 +1028,9 @@ const DxfImport = () => {
         const ents = entitiesRef.current;
         if (!canvas || !ents.length) return;
         let minX = Infinity, maxX = -Infinity, minY = Infinity, maxY = -Infinity;
-        ents.forEach(ent => (ent.points || []).forEach(p => {
-            minX = Math.min(minX, p.x); maxX = Math.max(maxX, p.x);
-            minY = Math.min(minY, p.y); maxY = Math.max(maxY, p.y);
+        ents.forEach(ent => forEachVertex(ent, (x, y) => {
+            minX = Math.min(minX, x); maxX = Math.max(maxX, x);
+            minY = Math.min(minY, y); maxY = Math.max(maxY, y);
         }));
         if (minX === Infinity) return;
         const W = canvas.width, H = canvas.height, pad = 40;
@@ -1122,12 +1157,7 @@ const DxfImport = () => {
             setTimeout(fitView, 100);
         } else if (cadFilePath && (!cadEntities || cadEntities.length === 0)) {
             setLoading(true);
-            fetch('http://localhost:5000/api/parse-cad', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ filePath: cadFilePath }),
-            })
-            .then(res => res.json().then(data => ({ ok: res.ok, data })))
+            fetchParsedCad(cadFilePath)
             .then(({ ok, data }) => {
                 if (!ok) throw new Error(data.error || 'Failed to auto-open CAD file');
                 entitiesRef.current = data.entities || [];
@@ -1204,31 +1234,45 @@ const DxfImport = () => {
             drawCanvas();
         };
         const onMouseUp = () => { isDraggingRef.current = false; canvas.style.cursor = 'crosshair'; };
-        const onClick = (e) => {
+        const onClick = async (e) => {
             const rect = canvas.getBoundingClientRect();
             const cx = e.clientX - rect.left, cy = e.clientY - rect.top;
             const clickWorld = s2w(cx, cy);
             
             const THRESH = 10;
             let best = null, bestDist = Infinity;
+
+            // Large drawings: only test the few entities the server's spatial index puts near the click
+            let candidates = null;
+            const tiled = tiledDrawingRef.current;
+            if (tiled && tiled.entityCount === entitiesRef.current.length) {
+                try {
+                    const hits = await hitTestCad(tiled.drawingId, clickWorld.x, clickWorld.y, THRESH / zoomRef.current, 32);
+                    candidates = hits.map(h => h.i).sort((a, b) => a - b);
+                } catch (err) {
+                    console.warn('[CAD Hit Test]', err.message);
+                }
+            }
             
-            entitiesRef.current.forEach((ent, i) => {
+            (candidates || entitiesRef.current.map((_, i) => i)).forEach((i) => {
+                const ent = entitiesRef.current[i];
                 if (visibleLayersRef.current && visibleLayersRef.current[ent.layer] === false) return;
 
-                if (ent.closed && !ent.filled && ent.type !== 'CIRCLE' && ent.points && ent.points.length >= 3 && isParcelLayer(ent.layer, layerListRef.current)) {
+                if (ent.closed && !ent.filled && ent.type !== 'CIRCLE' && vertexCount(ent) >= 3 && (ent.polygonized || isParcelLayer(ent.layer, layerListRef.current))) {
                     if (isPointInPolygon(clickWorld.x, clickWorld.y, ent.points)) {
                         best = i; bestDist = 0;
                     }
                 }
 
-                if (bestDist > 0 && ['LINE', 'LWPOLYLINE', 'POLYLINE', 'ARC', 'CIRCLE'].includes(ent.type) && ent.points) {
-                    if (ent.closed && (ent.filled || ent.type === 'CIRCLE' || !isParcelLayer(ent.layer, layerListRef.current))) {
+                if (bestDist > 0 && ['LINE', 'LWPOLYLINE', 'POLYLINE', 'ARC', 'CIRCLE'].includes(ent.type) && vertexCount(ent) > 0) {
+                    if (ent.closed && (ent.filled || ent.type === 'CIRCLE' || !(ent.polygonized || isParcelLayer(ent.layer, layerListRef.current)))) {
                         return;
                     }
-                    const pts = ent.points;
-                    const len = ent.closed ? pts.length : pts.length - 1;
+                    const screen = [];
+                    forEachVertex(ent, (x, y) => screen.push(w2s(x, y)));
+                    const len = ent.closed ? screen.length : screen.length - 1;
                     for (let j = 0; j < len; j++) {
-                        const a = w2s(pts[j].x, pts[j].y), b = w2s(pts[(j + 1) % pts.length].x, pts[(j + 1) % pts.length].y);
+                        const a = screen[j], b = screen[(j + 1) % screen.length];
                         const d = distPointToSegment(cx, cy, a.x, a.y, b.x, b.y);
                         if (d < THRESH && d < bestDist) { bestDist = d; best = i; }
                     }
@@ -1253,6 +1297,24 @@ const DxfImport = () => {
         };
     }, [drawCanvas]);
 
+    // Build the server-side tile pyramid / spatial index for large drawings
+    useEffect(() => {
+        tiledDrawingRef.current = null;
+        tileCacheRef.current = null;
+        tileViewRef.current = { key: null, entities: null, pending: null };
+        if (!cadFilePath || entities.length < SERVER_HIT_TEST_MIN_ENTITIES) return;
+        let cancelled = false;
+        buildCadTiles(cadFilePath)
+            .then(info => {
+                if (cancelled || info.entityCount !== entities.length) return;
+                tiledDrawingRef.current = info;
+                tileCacheRef.current = new CadTileCache(info.drawingId);
+                drawCanvas();
+            })
+            .catch(err => console.warn('[CAD Tiles]', err.message));
+        return () => { cancelled = true; };
+    }, [cadFilePath, entities, drawCanvas]);
+
     const handleOpenFile = async () => {
         if (loading) return;
         if (!hasProject) {
@@ -1271,13 +1333,8 @@ const DxfImport = () => {
         if (!filePath) return;
         setLoading(true);
         try {
-            const res = await fetch('http://localhost:5000/api/parse-cad', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ filePath }),
-            });
-            const data = await res.json();
-            if (!res.ok) throw new Error(data.error);
+            const { ok, data } = await fetchParsedCad(filePath);
+            if (!ok) throw new Error(data.error);
             entitiesRef.current = data.entities || [];
             setEntities(data.entities || []);
             setFileName(data.fileName);
@@ -1311,13 +1368,8 @@ const DxfImport = () => {
         if (loading || !cadFilePath) return;
         setLoading(true);
         try {
-            const res = await fetch('http://localhost:5000/api/parse-cad', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ filePath: cadFilePath }),
-            });
-            const data = await res.json();
-            if (!res.ok) throw new Error(data.error || 'Failed to reload CAD file');
+            const { ok, data } = await fetchParsedCad(cadFilePath);
+            if (!ok) throw new Error(data.error || 'Failed to reload CAD file');
             entitiesRef.current = data.entities || [];
             setEntities(data.entities || []);
             setFileName(data.fileName);
@@ -1359,10 +1411,25 @@ const DxfImport = () => {
         }
     };
 
+    // The selected boundary as detected by /api/cad/parcels, or null if the backend's parse of
+    // the file doesn't line up with the entities on screen (or the request fails).
+    const detectSelectedParcel = async (entityIndex, corners) => {
+        if (!cadFilePath) return null;
+        try {
+            const [parcel] = await detectCadParcels(cadFilePath, Object.keys(loadedPoints || {}), { entityIndex });
+            const same = parcel && parcel.points.length === corners.length &&
+                parcel.points.every((p, k) => Math.hypot(p.x - corners[k].x, p.y - corners[k].y) <= 1e-3);
+            return same ? parcel : null;
+        } catch (err) {
+            console.warn('[CAD Parcels]', err.message);
+            return null;
+        }
+    };
+
     const handleCreateParcel = async () => {
         if (selectedIdx === null) return;
         const ent = entities[selectedIdx];
-        if (!ent.closed || ent.filled || ent.type === 'CIRCLE' || !isParcelLayer(ent.layer, layerListRef.current)) {
+        if (!ent.closed || ent.filled || ent.type === 'CIRCLE' || !(ent.polygonized || isParcelLayer(ent.layer, layerListRef.current))) {
             toast.error('Please select a valid boundary polygon on the GIS / Parcel layer');
             return;
         }
@@ -1376,36 +1443,6 @@ const DxfImport = () => {
         setCurveM('');
         setCurveSign(1);
 
-        const allLabels = entities.filter(e => e.type === 'TEXT_LABEL');
-        const isNumericLabel = (txt) => /^\s*\d+(\.\d+)?\s*$/.test(txt);
-
-        let parcelNo = '';
-        const labelsInside = allLabels.filter(lbl => isPointInPolygon(lbl.x, lbl.y, ent.points));
-        
-        const descLabelsInside = labelsInside.filter(lbl => /description|desc/i.test(lbl.layer || ''));
-        const numericDescInside = descLabelsInside.filter(lbl => isNumericLabel(lbl.text));
-        const numericInside = labelsInside.filter(lbl => isNumericLabel(lbl.text));
-
-        let searchPool = [];
-        if (numericDescInside.length > 0) searchPool = numericDescInside;
-        else if (descLabelsInside.length > 0) searchPool = descLabelsInside;
-        else if (numericInside.length > 0) searchPool = numericInside;
-        else searchPool = labelsInside;
-
-        if (searchPool.length > 0) {
-            let sx = 0, sy = 0;
-            ent.points.forEach(p => { sx += p.x; sy += p.y; });
-            const centroid = { x: sx / ent.points.length, y: sy / ent.points.length };
-            searchPool.sort((a, b) =>
-                Math.hypot(a.x - centroid.x, a.y - centroid.y) -
-                Math.hypot(b.x - centroid.x, b.y - centroid.y)
-            );
-            parcelNo = searchPool[0].text.trim().replace(/^Parcel\s+|^\#\s*|^No\.\s*/i, '');
-        }
-        if (!parcelNo) {
-            parcelNo = ((savedParcels || []).length + 1).toString();
-        }
-
         const rawPts = ent.points;
         const uniqueVerts = [];
         const MERGE_THRESHOLD = 1e-3;
@@ -1426,89 +1463,140 @@ const DxfImport = () => {
             }
         }
 
-        const xs = uniqueVerts.map(p => p.x);
-        const ys = uniqueVerts.map(p => p.y);
-        const bbW = Math.max(...xs) - Math.min(...xs);
-        const bbH = Math.max(...ys) - Math.min(...ys);
-        const bbDiag = Math.hypot(bbW, bbH);
-        const DYNAMIC_THRESHOLD = Math.max(15, Math.min(500, bbDiag * 0.25));
-
         const detectedPts = [];
         const missingPoints = {};
-        const candidateLabels = allLabels.filter(lbl => lbl.text && lbl.text.trim().length > 0 && lbl.text.trim().length <= 15);
+        let parcelNo = '';
 
-        const scoreCandidate = (lbl, dist) => {
-            const layer = (lbl.layer || '').toLowerCase();
-            let score = dist;
-            if (/corner|number|mark|point|node|boundary|original|pt|num|no|id/i.test(layer)) {
-                score -= DYNAMIC_THRESHOLD * 3;
-            }
-            if (/^\s*\d+(\.\d+)?\s*$/.test(lbl.text)) {
-                score -= DYNAMIC_THRESHOLD;
-            }
-            if (/dimension|dim|table|title|description|desc|road|elevation/i.test(layer)) {
-                score += DYNAMIC_THRESHOLD * 3;
+        // Corner labels and parcel number come from the backend's KD-tree matcher (see cadParcels.js).
+        // The in-page scan below is only the fallback for drawings the backend can't re-read.
+        const serverParcel = await detectSelectedParcel(selectedIdx, uniqueVerts);
+        if (serverParcel) {
+            serverParcel.points.forEach((p, idx) => {
+                if (p.status !== 'matched') missingPoints[p.pointId] = { x: p.x, y: p.y };
+                detectedPts.push({
+                    vertexIdx: idx,
+                    x: p.x,
+                    y: p.y,
+                    label: p.label,
+                    dist: p.dist ?? Infinity,
+                    pointId: p.pointId,
+                    status: p.status
+                });
+            });
+            parcelNo = serverParcel.number || '';
+        }
+
+        if (!serverParcel) {
+            const allLabels = entities.filter(e => e.type === 'TEXT_LABEL');
+            const isNumericLabel = (txt) => /^\s*\d+(\.\d+)?\s*$/.test(txt);
+            const labelsInside = allLabels.filter(lbl => isPointInPolygon(lbl.x, lbl.y, ent.points));
+
+            const descLabelsInside = labelsInside.filter(lbl => /description|desc/i.test(lbl.layer || ''));
+            const numericDescInside = descLabelsInside.filter(lbl => isNumericLabel(lbl.text));
+            const numericInside = labelsInside.filter(lbl => isNumericLabel(lbl.text));
+
+            let searchPool = [];
+            if (numericDescInside.length > 0) searchPool = numericDescInside;
+            else if (descLabelsInside.length > 0) searchPool = descLabelsInside;
+            else if (numericInside.length > 0) searchPool = numericInside;
+            else searchPool = labelsInside;
+
+            if (searchPool.length > 0) {
+                let sx = 0, sy = 0;
+                ent.points.forEach(p => { sx += p.x; sy += p.y; });
+                const centroid = { x: sx / ent.points.length, y: sy / ent.points.length };
+                searchPool.sort((a, b) =>
+                    Math.hypot(a.x - centroid.x, a.y - centroid.y) -
+                    Math.hypot(b.x - centroid.x, b.y - centroid.y)
+                );
+                parcelNo = searchPool[0].text.trim().replace(/^Parcel\s+|^\#\s*|^No\.\s*/i, '');
             }
-            return score;
-        };
 
-        const allPairs = [];
-        uniqueVerts.forEach((p, vIdx) => {
-            candidateLabels.forEach((lbl, lIdx) => {
-                const d = Math.hypot(lbl.x - p.x, lbl.y - p.y);
-                if (d < DYNAMIC_THRESHOLD) {
-                    allPairs.push({ vIdx, lIdx, lbl, d, score: scoreCandidate(lbl, d) });
+            const xs = uniqueVerts.map(p => p.x);
+            const ys = uniqueVerts.map(p => p.y);
+            const bbW = Math.max(...xs) - Math.min(...xs);
+            const bbH = Math.max(...ys) - Math.min(...ys);
+            const bbDiag = Math.hypot(bbW, bbH);
+            const DYNAMIC_THRESHOLD = Math.max(15, Math.min(500, bbDiag * 0.25));
+
+            const candidateLabels = allLabels.filter(lbl => lbl.text && lbl.text.trim().length > 0 && lbl.text.trim().length <= 15);
+
+            const scoreCandidate = (lbl, dist) => {
+                const layer = (lbl.layer || '').toLowerCase();
+                let score = dist;
+                if (/corner|number|mark|point|node|boundary|original|pt|num|no|id/i.test(layer)) {
+                    score -= DYNAMIC_THRESHOLD * 3;
                 }
+                if (/^\s*\d+(\.\d+)?\s*$/.test(lbl.text)) {
+                    score -= DYNAMIC_THRESHOLD;
+                }
+                if (/dimension|dim|table|title|description|desc|road|elevation/i.test(layer)) {
+                    score += DYNAMIC_THRESHOLD * 3;
+                }
+                return score;
+            };
+
+            const allPairs = [];
+            uniqueVerts.forEach((p, vIdx) => {
+                candidateLabels.forEach((lbl, lIdx) => {
+                    const d = Math.hypot(lbl.x - p.x, lbl.y - p.y);
+                    if (d < DYNAMIC_THRESHOLD) {
+                        allPairs.push({ vIdx, lIdx, lbl, d, score: scoreCandidate(lbl, d) });
+                    }
+                });
             });
-        });
 
-        allPairs.sort((a, b) => a.score - b.score);
+            allPairs.sort((a, b) => a.score - b.score);
 
-        const assignedLabels = new Array(uniqueVerts.length).fill(null);
-        const usedLabelIndices = new Set();
-        const usedVertexIndices = new Set();
+            const assignedLabels = new Array(uniqueVerts.length).fill(null);
+            const usedLabelIndices = new Set();
+            const usedVertexIndices = new Set();
 
-        for (const pair of allPairs) {
-            if (!usedVertexIndices.has(pair.vIdx) && !usedLabelIndices.has(pair.lIdx)) {
-                assignedLabels[pair.vIdx] = { label: pair.lbl.text.trim(), dist: pair.d };
-                usedVertexIndices.add(pair.vIdx);
-                usedLabelIndices.add(pair.lIdx);
+            for (const pair of allPairs) {
+                if (!usedVertexIndices.has(pair.vIdx) && !usedLabelIndices.has(pair.lIdx)) {
+                    assignedLabels[pair.vIdx] = { label: pair.lbl.text.trim(), dist: pair.d };
+                    usedVertexIndices.add(pair.vIdx);
+                    usedLabelIndices.add(pair.lIdx);
+                }
             }
-        }
 
-        uniqueVerts.forEach((p, idx) => {
-            const match = assignedLabels[idx];
-            const matchedLabel = match ? match.label : null;
-            const matchedDist  = match ? match.dist : Infinity;
-            let status  = 'missing';
-            let pointId = '';
-
-            if (matchedLabel) {
-                pointId = matchedLabel;
-                if (loadedPoints[pointId]) {
-                    status = 'matched';
+            uniqueVerts.forEach((p, idx) => {
+                const match = assignedLabels[idx];
+                const matchedLabel = match ? match.label : null;
+                const matchedDist  = match ? match.dist : Infinity;
+                let status  = 'missing';
+                let pointId = '';
+
+                if (matchedLabel) {
+                    pointId = matchedLabel;
+                    if (loadedPoints[pointId]) {
+                        status = 'matched';
+                    } else {
+                        status = 'missing';
+                        missingPoints[pointId] = { x: p.x, y: p.y };
+                    }
                 } else {
-                    status = 'missing';
+                    let counter = 1;
+                    const existingIds = new Set([...Object.keys(loadedPoints), ...Object.keys(missingPoints)]);
+                    do { pointId = `CAD_${counter++}`; } while (existingIds.has(pointId));
+                    status = 'generated';
                     missingPoints[pointId] = { x: p.x, y: p.y };
                 }
-            } else {
-                let counter = 1;
-                const existingIds = new Set([...Object.keys(loadedPoints), ...Object.keys(missingPoints)]);
-                do { pointId = `CAD_${counter++}`; } while (existingIds.has(pointId));
-                status = 'generated';
-                missingPoints[pointId] = { x: p.x, y: p.y };
-            }
 
-            detectedPts.push({
-                vertexIdx: idx,
-                x: p.x,
-                y: p.y,
-                label: matchedLabel,
-                dist: matchedDist,
-                pointId,
-                status
+                detectedPts.push({
+                    vertexIdx: idx,
+                    x: p.x,
+                    y: p.y,
+                    label: matchedLabel,
+                    dist: matchedDist,
+                    pointId,
+                    status
+                });
             });
-        });
+        }
+        if (!parcelNo) {
+            parcelNo = ((savedParcels || []).length + 1).toString();
+        }
 
         setDetectedNumber(parcelNo);
         setParcelNumberInput(parcelNo);
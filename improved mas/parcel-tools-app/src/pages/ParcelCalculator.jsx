@@ -5,6 +5,7 @@ import { motion } from 'framer-motion';
 import { ArrowLeft, Upload, Save, FileDown, Plus, Trash2, Edit, RefreshCw, ZoomIn, ZoomOut, RotateCcw, Eye, EyeOff, CheckSquare, Square } from 'lucide-react';
 import { useProject } from '../context/ProjectContext';
 import { customConfirm, customPrompt } from '../utils/dialogs';
+import { exportPdfReport } from '../utils/pdfExport';
 
 const ParcelCalculator = () => {
   const navigate = useNavigate();
@@ -2609,56 +2610,14 @@ const ParcelCalculator = () => {
       if (!userChoice.confirmed) return;
 
       // Export the parcel
-      const response = await fetch('http://localhost:5000/api/export-pdf', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          parcels: [parcel],
-          points: loadedPoints,
-          fileHeading: userChoice.heading,
-          errorResults: null,
-          isBuggy: false
-        }),
-      });
-
-      if (!response.ok) {
-        const errorData = await response.json();
-        if (errorData.error && errorData.error.includes('ReportLab')) {
-          showErrorToast('❌ ReportLab not installed! Install it with: pip install reportlab');
-          return;
-        }
-        throw new Error('Export failed');
-      }
-
-      const result = await response.json();
-
-      if (result.error) {
-        showErrorToast(`❌ ${result.error}`);
-        return;
-      }
-
-      // Use Electron API to save and open PDF
-      if (window.electronAPI && window.electronAPI.saveAndOpenPDF) {
-        const saveResult = await window.electronAPI.saveAndOpenPDF(result.pdfData, `Parcel_${parcel.number}.pdf`);
-        if (saveResult && saveResult.success) {
-          showSuccessToast(`✅ Exported Parcel #${parcel.number} to PDF!`);
-        }
-      } else {
-        // Fallback: Download the PDF via blob (web browser)
-        const pdfData = atob(result.pdfData);
-        const bytes = new Uint8Array(pdfData.length);
-        for (let i = 0; i < pdfData.length; i++) {
-          bytes[i] = pdfData.charCodeAt(i);
-        }
-        const blob = new Blob([bytes], { type: 'application/pdf' });
-        const url = window.URL.createObjectURL(blob);
-        const a = document.createElement('a');
-        a.href = url;
-        a.download = `Parcel_${parcel.number}.pdf`;
-        document.body.appendChild(a);
-        a.click();
-        document.body.removeChild(a);
-        window.URL.revokeObjectURL(url);
+      const result = await exportPdfReport({
+        parcels: [parcel],
+        points: loadedPoints,
+        fileHeading: userChoice.heading,
+        errorResults: null,
+        isBuggy: false
+      }, `Parcel_${parcel.number}.pdf`);
+      if (result.success) {
         showSuccessToast(`✅ Exported Parcel #${parcel.number} to PDF!`);
       }
     } catch (error) {
@@ -2794,81 +2753,19 @@ const ParcelCalculator = () => {
     if (!userChoice.confirmed) return;
 
     try {
-      const response = await fetch('http://localhost:5000/api/export-pdf', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          parcels: listToExport,
-          points: loadedPoints,
-          fileHeading: userChoice.heading,
-          errorResults: errorResults,
-          savedErrorCalculations: savedErrorCalculations,
-          isBuggy: false
-        }),
-      });
-
-      if (!response.ok) {
-        const errorData = await response.json();
-        if (errorData.error && errorData.error.includes('ReportLab')) {
-          showErrorToast('❌ ReportLab not installed! Install it with: pip install reportlab<br/>Then restart the app.');
-          return;
-        }
-        throw new Error('Export failed');
-      }
-
-      const result = await response.json();
-
-      if (result.error) {
-        showErrorToast(`❌ ${result.error}`);
-        return;
-      }
-
       const fileName = listToExport.length === 1
         ? `Parcel_${listToExport[0].number}.pdf`
         : `Parcels_Export_${listToExport.length}_Items.pdf`;
 
-      let electronAPI = null;
-      if (typeof window !== 'undefined' && window.electronAPI && typeof window.electronAPI.saveAndOpenPDF === 'function') {
-        electronAPI = window.electronAPI;
-      } else {
-        for (let i = 0; i < 5; i++) {
-          await new Promise(resolve => setTimeout(resolve, 100));
-          if (typeof window !== 'undefined' && window.electronAPI && typeof window.electronAPI.saveAndOpenPDF === 'function') {
-            electronAPI = window.electronAPI;
-            break;
-          }
-        }
-      }
-
-      if (electronAPI && electronAPI.saveAndOpenPDF) {
-        try {
-          const saveResult = await electronAPI.saveAndOpenPDF(result.pdfData, fileName);
-          if (saveResult && saveResult.canceled) return;
-          if (saveResult && saveResult.success) {
-            showSuccessToast(`✅ Exported ${listToExport.length} parcel(s) to 1 PDF file successfully!`);
-            return;
-          }
-        } catch (error) {
-          console.error('[Renderer] Error using Electron PDF save:', error);
-        }
-      }
-
-      // Fallback download
-      const pdfData = atob(result.pdfData);
-      const bytes = new Uint8Array(pdfData.length);
-      for (let i = 0; i < pdfData.length; i++) {
-        bytes[i] = pdfData.charCodeAt(i);
-      }
-
-      const blob = new Blob([bytes], { type: 'application/pdf' });
-      const url = window.URL.createObjectURL(blob);
-      const a = document.createElement('a');
-      a.href = url;
-      a.download = fileName;
-      document.body.appendChild(a);
-      a.click();
-      document.body.removeChild(a);
-      window.URL.revokeObjectURL(url);
+      const result = await exportPdfReport({
+        parcels: listToExport,
+        points: loadedPoints,
+        fileHeading: userChoice.heading,
+        errorResults: errorResults,
+        savedErrorCalculations: savedErrorCalculations,
+        isBuggy: false
+      }, fileName);
+      if (!result.success) return;
 
       showSuccessToast(`✅ Exported ${listToExport.length} parcel(s) to 1 PDF file successfully!`);
     } catch (error) {
@@ -0,0 +1,25 @@
+/**
+ * CAD parcel detection client for Parcel Tools
+ * Calls /api/cad/parcels (see backend/cad_parcels.py): every closed boundary on the
+ * parcel layers, with corners matched to point-number labels, in one request.
+ */
+
+const API_BASE = 'http://localhost:5000/api';
+
+/**
+ * Detect all parcels in a CAD file.
+ * @param {string} filePath
+ * @param {string[]} pointIds IDs already in the points file (their corners come back 'matched')
+ * @returns {Promise<Array<{entityIndex, layer, number, area, perimeter,
+ *   points: Array<{x, y, label, dist, pointId, status}>}>>}
+ */
+export async function detectCadParcels(filePath, pointIds = [], options = {}) {
+    const res = await fetch(`${API_BASE}/cad/parcels`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ ...options, filePath, pointIds }),
+    });
+    const data = await res.json();
+    if (!res.ok) throw new Error(data.error || 'Failed to detect parcels');
+    return data.parcels;
+}
@@ -0,0 +1,98 @@
+/**
+ * CAD tile pyramid client for Parcel Tools
+ * Talks to /api/cad/tiles/build, /api/cad/tiles and /api/cad/hit (see backend/cad_tiles.py):
+ * a drawing is fetched viewport by viewport at the detail of the current zoom, and
+ * hit tests run as server-side nearest-entity queries instead of scanning every vertex.
+ */
+
+const API_BASE = 'http://localhost:5000/api';
+const TILE_CACHE_LIMIT = 256;
+
+/**
+ * Build (or reuse) the pyramid for a drawing.
+ * @returns {Promise<{drawingId, bounds, origin, side, maxZoom, tileSize, entityCount}>}
+ */
+export async function buildCadTiles(filePath, options = {}) {
+    const res = await fetch(`${API_BASE}/cad/tiles/build`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ ...options, filePath }),
+    });
+    const data = await res.json();
+    if (!res.ok) throw new Error(data.error || 'Failed to build CAD tiles');
+    return data;
+}
+
+/**
+ * Tile keys {z, x, y} covering a world-space viewport at `pixelsPerUnit` screen zoom.
+ * The zoom level is the one whose tiles are closest to 1:1 with the screen (capped at maxZoom).
+ */
+export function visibleTiles(info, view, pixelsPerUnit) {
+    const ideal = Math.log2((pixelsPerUnit * info.side) / info.tileSize);
+    const z = Math.max(0, Math.min(info.maxZoom, Math.ceil(ideal)));
+    const n = 2 ** z;
+    const size = info.side / n;
+    const clamp = (v) => Math.max(0, Math.min(n - 1, v));
+    const x0 = clamp(Math.floor((view.minX - info.origin[0]) / size));
+    const x1 = clamp(Math.floor((view.maxX - info.origin[0]) / size));
+    const y0 = clamp(Math.floor((info.origin[1] - view.maxY) / size));
+    const y1 = clamp(Math.floor((info.origin[1] - view.minY) / size));
+    const tiles = [];
+    for (let y = y0; y <= y1; y++) {
+        for (let x = x0; x <= x1; x++) tiles.push({ z, x, y });
+    }
+    return tiles;
+}
+
+/** Small LRU of fetched tiles per drawing; concurrent requests for a tile share one fetch. */
+export class CadTileCache {
+    constructor(drawingId, limit = TILE_CACHE_LIMIT) {
+        this.drawingId = drawingId;
+        this.limit = limit;
+        this.tiles = new Map();
+    }
+
+    get({ z, x, y }) {
+        const key = `${z}/${x}/${y}`;
+        let pending = this.tiles.get(key);
+        if (pending) {
+            this.tiles.delete(key);
+            this.tiles.set(key, pending);
+            return pending;
+        }
+        pending = fetch(`${API_BASE}/cad/tiles?id=${encodeURIComponent(this.drawingId)}&z=${z}&x=${x}&y=${y}`)
+            .then(async (res) => {
+                const data = await res.json();
+                if (!res.ok) throw new Error(data.error || 'Failed to load CAD tile');
+                return data;
+            })
+            .catch((err) => {
+                this.tiles.delete(key);
+                throw err;
+            });
+        this.tiles.set(key, pending);
+        while (this.tiles.size > this.limit) this.tiles.delete(this.tiles.keys().next().value);
+        return pending;
+    }
+
+    /** Entities of all tiles in a viewport, each once (entities spanning tiles repeat across them). */
+    async entities(tileKeys) {
+        const seen = new Map();
+        for (const tile of await Promise.all(tileKeys.map((t) => this.get(t)))) {
+            for (const ent of tile.entities) if (!seen.has(ent.i)) seen.set(ent.i, ent);
+        }
+        return [...seen.values()].sort((a, b) => a.i - b.i);
+    }
+}
+
+/**
+ * Nearest entities to a world point within `radius` world units.
+ * @returns {Promise<Array<{i: number, distance: number, inside: boolean}>>} nearest first
+ */
+export async function hitTestCad(drawingId, x, y, radius, limit = 8) {
+    const params = new URLSearchParams({ id: drawingId, x, y, radius, limit });
+    const res = await fetch(`${API_BASE}/cad/hit?${params}`);
+    const data = await res.json();
+    if (!res.ok) throw new Error(data.error || 'CAD hit test failed');
+    return data.hits;
+}
@@ -0,0 +1,180 @@
+/**
+ * Columnar CAD wire format decoder for Parcel Tools
+ * Reads the binary /api/parse-cad response (format: 'columnar', see backend/cad_wire.py).
+ * Coordinate, offset, layer/colour-ID and flag columns are typed-array views straight
+ * onto the response buffer (no copies). `entities` keeps the classic JSON shape, but each
+ * entity's `points` is only built from its coordinate view when something reads it.
+ */
+
+const API_BASE = 'http://localhost:5000/api';
+const MAGIC = 'PCW1';
+const MIME_TYPE = 'application/vnd.parceltools.cad';
+
+// Flag bits (must match cad_wire.py)
+const CLOSED = 1;
+const FILLED = 2;
+const LINE_ENDS = 4;
+const ANCHOR = 8;
+const HAS_CLOSED = 16;
+const RAW_POINTS = 32;
+
+const ARRAY_TYPES = { f64: Float64Array, u32: Uint32Array, u16: Uint16Array, u8: Uint8Array };
+
+const pad8 = (n) => (8 - (n % 8)) % 8;
+
+/**
+ * Entity decoded from the columns. `coords` is a zero-copy view of its vertices
+ * (x0, y0, x1, y1, ...); `points` ({x, y} objects) is materialized on first access.
+ * Serializes like a plain entity, so saved projects are unchanged.
+ */
+class WireEntity {
+    #coords;
+    #points;
+
+    constructor(type, coords, points) {
+        this.type = type;
+        this.#coords = coords;
+        this.#points = points;
+    }
+
+    get coords() {
+        return this.#coords;
+    }
+
+    get points() {
+        if (this.#points === undefined && this.#coords) {
+            const c = this.#coords;
+            const pts = new Array(c.length / 2);
+            for (let k = 0; k < pts.length; k++) pts[k] = { x: c[2 * k], y: c[2 * k + 1] };
+            this.#points = pts;
+        }
+        return this.#points;
+    }
+
+    set points(value) {
+        this.#points = value;
+        this.#coords = undefined;
+    }
+
+    toJSON() {
+        const points = this.points;
+        return points === undefined ? { ...this } : { ...this, points };
+    }
+}
+
+/** Number of vertices of a decoded or plain entity, without materializing `points`. */
+export function vertexCount(ent) {
+    if (ent.coords) return ent.coords.length / 2;
+    return ent.points ? ent.points.length : 0;
+}
+
+/** Call fn(x, y, k) for every vertex of a decoded or plain entity. */
+export function forEachVertex(ent, fn) {
+    const c = ent.coords;
+    if (c) {
+        for (let k = 0; k < c.length; k += 2) fn(c[k], c[k + 1], k / 2);
+    } else if (ent.points) {
+        ent.points.forEach((p, k) => fn(p.x, p.y, k));
+    }
+}
+
+/**
+ * Decode a columnar CAD buffer.
+ * @param {ArrayBuffer} buffer
+ * @returns {{fileName: string, fileType: string, layers: Array, raw_points: Array, entities: Array, groups: Array}}
+ *   `groups` holds the zero-copy columns per entity type: { type, count, index, offsets, coords, layer, color, flags };
+ *   each decoded entity also exposes its own slice of `coords` (see forEachVertex / vertexCount).
+ */
+export function decodeCadWire(buffer) {
+    const view = new DataView(buffer);
+    const utf8 = new TextDecoder('utf-8');
+    const magic = String.fromCharCode(view.getUint8(0), view.getUint8(1), view.getUint8(2), view.getUint8(3));
+    if (magic !== MAGIC) throw new Error('Not a columnar CAD buffer');
+
+    const metaLen = view.getUint32(4, true);
+    const meta = JSON.parse(utf8.decode(new Uint8Array(buffer, 8, metaLen)));
+    let body = 8 + metaLen;
+    body += pad8(body);
+    const manifestLen = view.getUint32(body, true);
+    const manifest = JSON.parse(utf8.decode(new Uint8Array(buffer, body + 8, manifestLen)));
+    const data = body + 8 + manifestLen + pad8(8 + manifestLen);
+
+    const section = ([offset, count, dtype]) => new ARRAY_TYPES[dtype](buffer, data + offset, count);
+
+    const layerNames = manifest.dict.layer;
+    const colorNames = manifest.dict.color;
+    const entities = new Array(manifest.entityCount);
+    const groups = manifest.groups.map((g) => {
+        const cols = {
+            type: g.type,
+            count: g.count,
+            index: section(g.index),
+            offsets: section(g.offsets),
+            coords: section(g.coords),
+            layer: section(g.layer),
+            color: section(g.color),
+            flags: section(g.flags),
+        };
+        const attributes = Object.entries(g.attributes).map(([key, a]) => [key, a.strings || section(a.numbers)]);
+
+        for (let j = 0; j < g.count; j++) {
+            const f = cols.flags[j];
+            const extra = g.extras[j] || {};
+            let ent;
+            if (f & RAW_POINTS) {
+                ent = new WireEntity(g.type, undefined, extra.points);
+            } else if ('points' in extra) {
+                ent = new WireEntity(g.type, undefined, undefined);
+            } else {
+                ent = new WireEntity(g.type, cols.coords.subarray(cols.offsets[j] * 2, cols.offsets[j + 1] * 2));
+            }
+            if (f & HAS_CLOSED) ent.closed = Boolean(f & CLOSED);
+            if (f & FILLED) ent.filled = true;
+            ent.layer = layerNames[cols.layer[j]];
+            ent.color = colorNames[cols.color[j]];
+            if (f & (LINE_ENDS | ANCHOR)) {
+                const c = ent.coords;
+                const first = c ? [c[0], c[1]] : [ent.points[0].x, ent.points[0].y];
+                if (f & LINE_ENDS) {
+                    const n = vertexCount(ent) - 1;
+                    ent.x1 = first[0]; ent.y1 = first[1];
+                    ent.x2 = c ? c[2 * n] : ent.points[n].x;
+                    ent.y2 = c ? c[2 * n + 1] : ent.points[n].y;
+                }
+                if (f & ANCHOR) {
+                    ent.x = first[0]; ent.y = first[1];
+                }
+            }
+            for (const [key, column] of attributes) {
+                const value = column[j];
+                if (value !== null && value !== undefined) ent[key] = value;
+            }
+            for (const [key, value] of Object.entries(extra)) {
+                if (key !== 'points') ent[key] = value;
+            }
+            entities[cols.index[j]] = ent;
+        }
+        return cols;
+    });
+
+    const rawCoords = section(manifest.rawPoints.coords);
+    const raw_points = manifest.rawPoints.ids.map((id, k) => ({ id, x: rawCoords[2 * k], y: rawCoords[2 * k + 1] }));
+
+    return { ...meta, layers: manifest.layers, raw_points, entities, groups };
+}
+
+/**
+ * POST /api/parse-cad asking for the columnar format. Errors still come back as JSON.
+ * @returns {Promise<{ok: boolean, data: object}>} same shape callers got from res.json()
+ */
+export async function fetchParsedCad(filePath, options = {}) {
+    const res = await fetch(`${API_BASE}/parse-cad`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ ...options, filePath, format: 'columnar' }),
+    });
+    if (res.ok && (res.headers.get('Content-Type') || '').startsWith(MIME_TYPE)) {
+        return { ok: true, data: decodeCadWire(await res.arrayBuffer()) };
+    }
+    return { ok: res.ok, data: await res.json() };
+}
@@ -1,15 +1,74 @@
 /**
  * Compression and Archive Management Utility for Parcel Tools
  * Communicates with high-concurrency streaming compression backend.
+ * Archives are built as background jobs: requests return a job ID at once and
+ * progress is polled from /compress/status until the archive is done.
  */
 
 const API_BASE = 'http://localhost:5000/api';
+const JOB_POLL_MS = 250;
+
+async function startArchiveJob(endpoint, payload, failure) {
+    const response = await fetch(`${API_BASE}/${endpoint}`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(payload)
+    });
+
+    if (!response.ok) {
+        const errData = await response.json().catch(() => ({}));
+        throw new Error(errData.error || `${failure} with status ${response.status}`);
+    }
+
+    return await response.json();
+}
+
+/**
+ * Waits for an archive job to finish.
+ * @param {string} jobId
+ * @param {(status: object) => void} [onProgress] - Called with { status, filesDone, filesTotal, bytesIn, bytesOut, ... }
+ * @returns {Promise<object>} The job's result (same shape as the synchronous endpoint response)
+ */
+export async function waitForArchiveJob(jobId, onProgress = null) {
+    for (;;) {
+        const response = await fetch(`${API_BASE}/compress/status?jobId=${encodeURIComponent(jobId)}`);
+        const job = await response.json().catch(() => ({}));
+        if (!response.ok) {
+            throw new Error(job.error || `Archive job status failed with status ${response.status}`);
+        }
+        if (onProgress) onProgress(job);
+        if (job.status === 'done') return job.result;
+        if (job.status === 'cancelled') {
+            const err = new Error('Archive job was cancelled');
+            err.cancelled = true;
+            throw err;
+        }
+        if (job.status === 'failed') {
+            throw new Error(job.error || 'Archive job failed');
+        }
+        await new Promise(resolve => setTimeout(resolve, JOB_POLL_MS));
+    }
+}
+
+/**
+ * Cancels a queued or running archive job.
+ * @param {string} jobId
+ * @returns {Promise<object>} { jobId, status, cancelRequested }
+ */
+export async function cancelArchiveJob(jobId) {
+    const response = await fetch(`${API_BASE}/compress/cancel`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ jobId })
+    });
+    return await response.json();
+}
 
 /**
  * Compresses multiple files into an optimized ZIP archive.
  * @param {Array<{sourcePath?: string, content?: string, base64Content?: string, archiveName: string}>} files 
  * @param {string|null} outputPath - Destination .zip path (optional)
- * @param {object} options - { compressionLevel: 1..9, comment: string }
+ * @param {object} options - { compressionLevel: 1..9, comment: string, onJob(jobId), onProgress(status) }
  * @returns {Promise<object>} Compression statistics and result
  */
 export async function compressFiles(files, outputPath = null, options = {}) {
@@ -24,27 +83,19 @@ export async function compressFiles(files, outputPath = null, options = {}) {
         comment: options.comment || 'Parcel Tools Compressed Archive'
     };
 
-    const response = await fetch(`${API_BASE}/compress-files`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify(payload)
-    });
-
-    if (!response.ok) {
-        const errData = await response.json().catch(() => ({}));
-        throw new Error(errData.error || `Compression failed with status ${response.status}`);
-    }
-
-    return await response.json();
+    const { jobId } = await startArchiveJob('compress-files', payload, 'Compression failed');
+    if (options.onJob) options.onJob(jobId);
+    return await waitForArchiveJob(jobId, options.onProgress);
 }
 
 /**
  * Creates a comprehensive project archive (.zip) containing project JSON, active .pnt coordinates,
  * CAD drawing, and manifest.
- * @param {object} params - { projectName, projectData, pointsFilePath, cadFilePath, outputPath }
+ * @param {object} params - { projectName, projectData, pointsFilePath, cadFilePath, outputPath, onJob, onProgress }
  * @returns {Promise<object>}
  */
-export async function exportProjectArchive({ projectName, projectData, pointsFilePath, cadFilePath, outputPath = null }) {
+export async function exportProjectArchive({ projectName, projectData, pointsFilePath, cadFilePath, outputPath = null,
+                                             onJob = null, onProgress = null }) {
     const payload = {
         projectName: projectName || 'ParcelProject',
         projectData: projectData || {},
@@ -53,18 +104,9 @@ export async function exportProjectArchive({ projectName, projectData, pointsFil
         outputPath: outputPath || undefined
     };
 
-    const response = await fetch(`${API_BASE}/project/export-archive`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify(payload)
-    });
-
-    if (!response.ok) {
-        const errData = await response.json().catch(() => ({}));
-        throw new Error(errData.error || `Project archive export failed with status ${response.status}`);
-    }
-
-    return await response.json();
+    const { jobId } = await startArchiveJob('project/export-archive', payload, 'Project archive export failed');
+    if (onJob) onJob(jobId);
+    return await waitForArchiveJob(jobId, onProgress);
 }
 
 /**
@@ -0,0 +1,74 @@
+/**
+ * PDF report export for Parcel Tools
+ * In Electron the backend writes the report straight to the file picked in the save
+ * dialog (/api/export-pdf with outputPath); in a plain browser it comes back as a raw
+ * application/pdf download. Either way the PDF never travels as base64 inside JSON.
+ */
+
+const API_BASE = 'http://localhost:5000/api';
+
+async function postExport(body) {
+    return fetch(`${API_BASE}/export-pdf`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(body),
+    });
+}
+
+// The preload bridge can lag the first render by a moment
+async function electronApi() {
+    for (let attempt = 0; attempt < 6; attempt++) {
+        const api = typeof window !== 'undefined' ? window.electronAPI : null;
+        if (api && typeof api.showSaveDialog === 'function') return api;
+        if (attempt < 5) await new Promise(resolve => setTimeout(resolve, 100));
+    }
+    return null;
+}
+
+async function exportError(res) {
+    const data = await res.json().catch(() => ({}));
+    return new Error(data.error || 'Export failed');
+}
+
+/**
+ * Export a report and open (Electron) or download (browser) it.
+ * @param {object} payload export-pdf body: { parcels, points, fileHeading, errorResults, ... }
+ * @param {string} fileName suggested file name
+ * @returns {Promise<{success?: boolean, canceled?: boolean, filePath?: string}>}
+ */
+export async function exportPdfReport(payload, fileName) {
+    const api = await electronApi();
+    if (api) {
+        const choice = await api.showSaveDialog({
+            title: 'Save PDF As',
+            defaultPath: fileName,
+            filters: [
+                { name: 'PDF Files', extensions: ['pdf'] },
+                { name: 'All Files', extensions: ['*'] },
+            ],
+        });
+        if (!choice || choice.canceled || !choice.filePath) return { canceled: true };
+        const outputPath = /\.pdf$/i.test(choice.filePath) ? choice.filePath : `${choice.filePath}.pdf`;
+
+        const res = await postExport({ ...payload, outputPath });
+        if (!res.ok) throw await exportError(res);
+        const data = await res.json();
+        if (typeof api.openPath === 'function') {
+            const opened = await api.openPath(data.filePath);
+            if (opened && opened.error) console.warn('[PDF Export] Could not open PDF:', opened.error);
+        }
+        return { success: true, filePath: data.filePath };
+    }
+
+    const res = await postExport({ ...payload, format: 'raw', fileName });
+    if (!res.ok) throw await exportError(res);
+    const url = window.URL.createObjectURL(await res.blob());
+    const a = document.createElement('a');
+    a.href = url;
+    a.download = fileName;
+    document.body.appendChild(a);
+    a.click();
+    document.body.removeChild(a);
+    window.URL.revokeObjectURL(url);
+    return { success: true };
+}
@@ -6,7 +6,7 @@ echo ========================================
 echo.
 
 echo [1/2] Starting Python Backend...
-REM start "Python Backend" cmd /k "python backend/app.py"
+REM start "Python Backend" cmd /k "python backend/server.py"
 
 timeout /t 3 /nobreak > nul
 
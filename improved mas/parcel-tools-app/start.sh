@@ -7,7 +7,7 @@ echo "========================================"
 echo ""
 
 echo "[1/2] Starting Python Backend..."
-python3 backend/app.py &
+python3 backend/server.py &
 BACKEND_PID=$!
 
 sleep 3